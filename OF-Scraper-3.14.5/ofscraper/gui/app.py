@@ -192,8 +192,8 @@ def launch_gui(manager=None):
 
     # Apply saved theme preference (falls back to dark if not set)
     try:
-        from ofscraper.gui.utils.gui_settings import load_gui_settings
-        _saved_theme = load_gui_settings().get("theme", "dark")
+        from ofscraper.gui.utils.gui_settings import get_gui_setting
+        _saved_theme = get_gui_setting("theme", "dark")
     except Exception:
         _saved_theme = "dark"
     if _saved_theme == "light":
@@ -16,7 +16,7 @@ from PyQt6.QtWidgets import (
 
 from ofscraper.gui.signals import app_signals
 from ofscraper.gui.styles import c
-from ofscraper.gui.utils.thread_worker import AsyncWorker
+from ofscraper.gui.utils.thread_worker import AsyncDispatcher
 from ofscraper.gui.widgets.styled_button import StyledButton
 
 log = logging.getLogger("shared")
@@ -28,6 +28,9 @@ class MergePage(QWidget):
     def __init__(self, manager=None, parent=None):
         super().__init__(parent)
         self.manager = manager
+        self._merge_dispatcher = AsyncDispatcher(self)
+        self._merge_dispatcher.finished.connect(self._on_merge_finished)
+        self._merge_dispatcher.error.connect(self._on_merge_error)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -150,13 +153,8 @@ class MergePage(QWidget):
         self.merge_btn.setEnabled(False)
         app_signals.status_message.emit("Merge in progress...")
 
-        # Run merge in background thread
-        from PyQt6.QtCore import QThreadPool
-
-        worker = AsyncWorker(self._run_merge, source, dest)
-        worker.signals.finished.connect(self._on_merge_finished)
-        worker.signals.error.connect(self._on_merge_error)
-        QThreadPool.globalInstance().start(worker)
+        # Run merge on the shared background event loop
+        self._merge_dispatcher.submit(self._run_merge, source, dest)
 
     async def _run_merge(self, source, dest):
         from ofscraper.db.merge import MergeDatabase
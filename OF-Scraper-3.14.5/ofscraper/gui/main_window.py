@@ -259,13 +259,8 @@ class MainWindow(QMainWindow):
                         raw = await raw
                     return [_models_cls.Model(m) for m in (raw or [])]
 
-                loop = asyncio.new_event_loop()
-                try:
-                    asyncio.set_event_loop(loop)
-                    data = loop.run_until_complete(_do_fetch())
-                finally:
-                    loop.close()
-                    asyncio.set_event_loop(None)
+                with asyncio.Runner() as runner:
+                    data = runner.run(_do_fetch())
                 # Store on manager so the rest of the auto-start flow works normally
                 self.manager.model_manager.all_subs_dict = data
                 return data
@@ -688,8 +683,10 @@ class MainWindow(QMainWindow):
         app_signals.action_selected.connect(self._on_action_selected)
         app_signals.models_selected.connect(self._on_models_selected)
         app_signals.areas_selected.connect(self._on_areas_selected)
-        app_signals.data_loading_finished.connect(self._on_data_loaded)
-        app_signals.data_replace.connect(self._on_data_replace)
+        # Row batches come from the scraper thread; queue them explicitly
+        queued = Qt.ConnectionType.QueuedConnection
+        app_signals.data_loading_finished.connect(self._on_data_loaded, queued)
+        app_signals.data_replace.connect(self._on_data_replace, queued)
         app_signals.manual_urls_confirmed.connect(self._on_manual_urls_confirmed)
         app_signals.scraping_finished.connect(self._on_scraping_finished_plugins)
 
@@ -770,11 +767,12 @@ class MainWindow(QMainWindow):
         """Areas selected — begin scraping."""
         app_signals.status_message.emit("Loading data...")
 
-    @pyqtSlot(list)
+    @pyqtSlot(object)
     def _on_data_loaded(self, table_data):
         """Data loaded for a user — append to table."""
         self.table_page.append_data(table_data)
 
+    @pyqtSlot(object)
     def _on_data_replace(self, table_data):
         """DB fallback loaded — replace table with authoritative DB rows."""
         self.table_page.load_data(table_data)
@@ -817,9 +817,10 @@ class AreaSelectorPage(QWidget):
 
         # Run the async API call directly with a fresh event loop,
         # bypassing the @run decorator which can leave stale loop state.
-        loop = asyncio.new_event_loop()
-        try:
-            asyncio.set_event_loop(loop)
+        # Runner also finalizes async generators and the default executor,
+        # then clears the thread's loop again on exit.
+        with asyncio.Runner() as runner:
+            runner.get_loop()  # install the loop before get_models() is called
             if _ul_for_fetch:
                 # Bypass get_models() (which always fetches ALL subscriptions) and
                 # call get_otherlist() directly so we only get members of the named
@@ -836,13 +837,10 @@ class AreaSelectorPage(QWidget):
                     log.info(f"[GUI] User list fetch returned {len(raw)} member(s)")
                     return [_models_cls.Model(m) for m in raw]
 
-                data = loop.run_until_complete(_do_fetch_list())
+                data = runner.run(_do_fetch_list())
             else:
-                data = loop.run_until_complete(retriver.get_models())
+                data = runner.run(retriver.get_models())
             self.manager.model_manager.all_subs_dict = data
-        finally:
-            loop.close()
-            asyncio.set_event_loop(None)
 
         return getattr(self.manager.model_manager, "all_subs_obj", None) or []
 
@@ -1028,6 +1026,32 @@ class AreaSelectorPage(QWidget):
     def is_daemon_discord_ping_enabled(self):
         return self.daemon_discord_ping_check.isChecked()
 
+    def scrape_config_snapshot(self) -> dict:
+        """Return every scrape option the table page needs when a scrape starts."""
+        discord_active = (
+            self.discord_updates_check.isEnabled()
+            and self.discord_updates_check.isChecked()
+        )
+        return {
+            "scrape_paid": self.scrape_paid_check.isChecked(),
+            "scrape_labels": self.scrape_labels_check.isChecked(),
+            "discord_level": (
+                self.discord_level_combo.currentText() if discord_active else "OFF"
+            ),
+            "advanced": {
+                "allow_dupe_downloads": self.allow_dupes_check.isChecked(),
+                "rescrape_all": self.rescrape_all_check.isChecked(),
+                "delete_model_db": self.delete_db_check.isChecked(),
+                "delete_downloads": self.delete_downloads_check.isChecked(),
+            },
+            "daemon": {
+                "enabled": self.daemon_check.isChecked(),
+                "interval": self.daemon_interval.value(),
+                "notify": self.notify_check.isChecked(),
+                "sound": self.sound_check.isChecked(),
+            },
+        }
+
     def get_username_filter(self):
         """Return the username entered in the filter, if any."""
         return self.filter_sidebar.username_input.text().strip()
@@ -18,35 +18,18 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QSizePolicy,
     QSplitter,
-    QToolButton,
     QVBoxLayout,
     QWidget,
 )
 
 from ofscraper.gui.signals import app_signals
-from ofscraper.gui.styles import c
+from ofscraper.gui.styles import c, current_theme_key
 from ofscraper.gui.utils.thread_worker import Worker
+from ofscraper.gui.widgets.help_button import HelpButton, help_button_qss
 from ofscraper.gui.widgets.styled_button import StyledButton
 
 log = logging.getLogger("shared")
 
-def _help_btn_qss():
-    return (
-        f"QToolButton {{ border: 1px solid {c('surface1')}; border-radius: 9px;"
-        f" background-color: {c('surface0')}; color: {c('text')}; font-weight: bold; }}"
-        f" QToolButton:hover {{ border-color: {c('blue')}; background-color: {c('surface1')}; }}"
-    )
-
-def _make_help_btn(anchor: str) -> QToolButton:
-    b = QToolButton()
-    b.setText("?")
-    b.setToolTip("Open help for this section")
-    b.setCursor(Qt.CursorShape.PointingHandCursor)
-    b.setAutoRaise(True)
-    b.setFixedSize(18, 18)
-    b.setStyleSheet(_help_btn_qss())
-    b.clicked.connect(lambda: app_signals.help_anchor_requested.emit(anchor))
-    return b
 
 class _AvatarSignals(QObject):
     """Signals for avatar download tasks (must be a QObject for cross-thread emit)."""
@@ -108,7 +91,13 @@ class ModelSelectorPage(QWidget):
         super().__init__(parent)
         self.manager = manager
         self._all_models = {}  # name -> model object
+        self._name_order: list[str] = []  # model names sorted by name, computed once per load
         self._filtered_names = []
+        # Selection state lives on the Python side so counting and
+        # collecting selected names never has to walk the list items.
+        self._listed_names: list[str] = []
+        self._listed_texts: list[str] = []  # lowercased display text per row
+        self._checked_names: set[str] = set()
         self._avatar_cache: dict[str, QIcon] = {}
         self._show_avatars = False
         self._avatar_signals = _AvatarSignals()
@@ -122,6 +111,7 @@ class ModelSelectorPage(QWidget):
         self._avatar_flush_timer.setInterval(150)
         self._avatar_flush_timer.timeout.connect(self._flush_pending_avatars)
         self._setup_ui()
+        self.setStyleSheet(help_button_qss(current_theme_key()))
         self._connect_signals()
 
     def _setup_ui(self):
@@ -211,7 +201,7 @@ class ModelSelectorPage(QWidget):
         # Model list
         self.model_list = QListWidget()
         self.model_list.setAlternatingRowColors(True)
-        self.model_list.itemChanged.connect(self._update_count)
+        self.model_list.itemChanged.connect(self._on_item_changed)
         self.model_list.viewport().installEventFilter(self)
         left_layout.addWidget(self.model_list)
 
@@ -231,7 +221,7 @@ class ModelSelectorPage(QWidget):
         sub_group = QGroupBox("Subscription Type")
         sub_grid = QGridLayout(sub_group)
         sub_grid.addWidget(
-            _make_help_btn("models-filters-subscription"),
+            HelpButton("models-filters-subscription"),
             0,
             2,
             2,
@@ -253,7 +243,7 @@ class ModelSelectorPage(QWidget):
         flags_group = QGroupBox("Flags")
         flags_grid = QGridLayout(flags_group)
         flags_grid.addWidget(
-            _make_help_btn("models-filters-flags"),
+            HelpButton("models-filters-flags"),
             0,
             2,
             3,
@@ -280,7 +270,7 @@ class ModelSelectorPage(QWidget):
         price_group = QGroupBox("Price Range")
         price_grid = QGridLayout(price_group)
         price_grid.addWidget(
-            _make_help_btn("models-filters-price"),
+            HelpButton("models-filters-price"),
             0,
             2,
             2,
@@ -306,7 +296,7 @@ class ModelSelectorPage(QWidget):
         sort_group = QGroupBox("Sort")
         sort_grid = QGridLayout(sort_group)
         sort_grid.addWidget(
-            _make_help_btn("models-filters-sort"),
+            HelpButton("models-filters-sort"),
             0,
             2,
             2,
@@ -391,9 +381,7 @@ class ModelSelectorPage(QWidget):
             f"padding: 8px 16px; border-radius: 4px; font-weight: bold; }}"
             f"QPushButton:hover {{ background-color: {c('lavender')}; }}"
         )
-        for btn in self.findChildren(QToolButton):
-            if btn.text() == "?":
-                btn.setStyleSheet(_help_btn_qss())
+        self.setStyleSheet(help_button_qss(current_theme_key()))
 
     def showEvent(self, event):
         super().showEvent(event)
@@ -403,7 +391,7 @@ class ModelSelectorPage(QWidget):
 
     def populate_from_manager(self):
         """Populate list from already-fetched manager state (no API calls)."""
-        self.model_list.clear()
+        self._clear_list()
         self.loading_label.hide()
         self.next_btn.setEnabled(True)
 
@@ -416,12 +404,12 @@ class ModelSelectorPage(QWidget):
 
         models = getattr(self.manager.model_manager, "all_subs_obj", None) or []
         if models:
-            self._all_models = {m.name: m for m in models}
-            self._populate_list(sorted(self._all_models.keys()))
+            self._set_models(models)
+            self._populate_list(self._name_order)
             self.retry_btn.hide()
             app_signals.status_message.emit(f"Loaded {len(models)} models")
         else:
-            self._all_models = {}
+            self._set_models([])
             self.loading_label.setText(
                 "No models loaded. Check your auth and click Retry."
             )
@@ -431,7 +419,7 @@ class ModelSelectorPage(QWidget):
 
     def _load_models(self):
         """Load models from the manager by triggering the API fetch in a background thread."""
-        self.model_list.clear()
+        self._clear_list()
         self.retry_btn.hide()
         self.loading_label.setText("Loading models from API...")
         self.loading_label.show()
@@ -490,30 +478,40 @@ class ModelSelectorPage(QWidget):
         profile_data.currentData = None
         profile_data.currentProfile = None
 
-        loop = asyncio.new_event_loop()
-        try:
-            asyncio.set_event_loop(loop)
-            data = loop.run_until_complete(retriver.get_models())
+        # Runner also finalizes async generators and the default executor,
+        # then clears the thread's loop again on exit
+        with asyncio.Runner() as runner:
+            runner.get_loop()  # install the loop before get_models() is called
+            data = runner.run(retriver.get_models())
             self.manager.model_manager.all_subs_dict = data
-        finally:
-            loop.close()
-            asyncio.set_event_loop(None)
 
         return self.manager.model_manager.all_subs_obj
 
+    def _set_models(self, models):
+        """Store the fetched models and their name order.
+
+        The API usually hands models back already ordered by name, so the
+        sort is only paid when that is not the case.
+        """
+        self._all_models = {m.name: m for m in models}
+        names = list(self._all_models)
+        if any(a > b for a, b in zip(names, names[1:])):
+            names.sort()
+        self._name_order = names
+
     def _on_models_loaded(self, models):
         """Handle successful model fetch — populate the list."""
         self.loading_label.hide()
         self.retry_btn.hide()
         self.next_btn.setEnabled(True)
         if models:
-            self._all_models = {m.name: m for m in models}
-            self._populate_list(sorted(self._all_models.keys()))
+            self._set_models(models)
+            self._populate_list(self._name_order)
             app_signals.status_message.emit(
                 f"Loaded {len(models)} models"
             )
         else:
-            self._all_models = {}
+            self._set_models([])
             self._show_auth_failure_prompt()
 
     def _on_models_error(self, error_msg):
@@ -544,11 +542,23 @@ class ModelSelectorPage(QWidget):
         elif msg.clickedButton() == auth_btn:
             app_signals.navigate_to_page.emit("auth")
 
+    def _clear_list(self):
+        self.model_list.clear()
+        self._listed_names = []
+        self._listed_texts = []
+        self._checked_names.clear()
+
     def _populate_list(self, names):
         """Populate the list widget with model names and details."""
+        # Apply any active search text (e.g. pre-set by username filter from
+        # area page) while inserting, instead of a second pass over the rows.
+        terms = self._search_terms(self.search_input.text())
         self.model_list.blockSignals(True)
         self.model_list.clear()
-        for name in names:
+        self._listed_names = list(names)
+        self._listed_texts = []
+        self._checked_names.clear()
+        for name in self._listed_names:
             model = self._all_models.get(name)
             if model:
                 sub_date = getattr(model, "subscribed_string", None) or "N/A"
@@ -561,15 +571,15 @@ class ModelSelectorPage(QWidget):
             item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
             item.setCheckState(Qt.CheckState.Unchecked)
             self.model_list.addItem(item)
+            item_text = display.lower()
+            self._listed_texts.append(item_text)
+            if terms and not any(term in item_text for term in terms):
+                item.setHidden(True)
         self.model_list.blockSignals(False)
         self._update_count()
         # Re-apply avatars for any already-cached items
         if self._show_avatars:
             self._apply_avatars_to_list()
-        # Re-apply any active search text (e.g. pre-set by username filter from area page)
-        current_text = self.search_input.text()
-        if current_text:
-            self._filter_list(current_text)
 
     # ------------------------------------------------------------------
     # Avatar loading
@@ -650,79 +660,89 @@ class ModelSelectorPage(QWidget):
 
     # ------------------------------------------------------------------
 
-    def _filter_list(self, text):
-        """Filter visible items based on search text.
+    @staticmethod
+    def _search_terms(text):
+        """Split search text into lowercased terms.
         Supports comma-separated values (e.g. 'user1, user2')."""
         if "," in text:
-            terms = [t.strip().lower() for t in text.split(",") if t.strip()]
-        else:
-            terms = [text.strip().lower()] if text.strip() else []
+            return [t.strip().lower() for t in text.split(",") if t.strip()]
+        return [text.strip().lower()] if text.strip() else []
 
-        for i in range(self.model_list.count()):
+    def _filter_list(self, text):
+        """Filter visible items based on search text."""
+        if not self._listed_texts:
+            return
+        terms = self._search_terms(text)
+        for i, item_text in enumerate(self._listed_texts):
             item = self.model_list.item(i)
             if not terms:
                 item.setHidden(False)
             else:
-                item_text = item.text().lower()
                 item.setHidden(not any(term in item_text for term in terms))
 
-    def _select_all(self):
-        self.model_list.blockSignals(True)
-        for i in range(self.model_list.count()):
-            item = self.model_list.item(i)
-            if not item.isHidden():
-                item.setCheckState(Qt.CheckState.Checked)
-        self.model_list.blockSignals(False)
+    def _visible_names(self):
+        """Return the names of all rows not hidden by the search filter."""
+        return [
+            name
+            for i, name in enumerate(self._listed_names)
+            if not self.model_list.item(i).isHidden()
+        ]
+
+    def _set_checked(self, names, checked: bool):
+        """Set the check state of the given names in one blocked-signal pass.
+
+        Only rows whose state actually changes are touched on the Qt side.
+        """
+        if checked:
+            changed = set(names) - self._checked_names
+            self._checked_names |= changed
+            state = Qt.CheckState.Checked
+        else:
+            changed = set(names) & self._checked_names
+            self._checked_names -= changed
+            state = Qt.CheckState.Unchecked
+        if changed:
+            self.model_list.blockSignals(True)
+            for i, name in enumerate(self._listed_names):
+                if name in changed:
+                    self.model_list.item(i).setCheckState(state)
+            self.model_list.blockSignals(False)
         self._update_count()
 
-    def _deselect_all(self):
-        self.model_list.blockSignals(True)
-        for i in range(self.model_list.count()):
-            item = self.model_list.item(i)
-            if not item.isHidden():
-                item.setCheckState(Qt.CheckState.Unchecked)
-        self.model_list.blockSignals(False)
+    def _on_item_changed(self, item):
+        """Mirror a single user click into the selection set."""
+        name = item.data(Qt.ItemDataRole.UserRole)
+        if item.checkState() == Qt.CheckState.Checked:
+            self._checked_names.add(name)
+        else:
+            self._checked_names.discard(name)
         self._update_count()
 
+    def _select_all(self):
+        self._set_checked(self._visible_names(), True)
+
+    def _deselect_all(self):
+        self._set_checked(self._visible_names(), False)
+
     def _toggle_all(self):
-        self.model_list.blockSignals(True)
-        for i in range(self.model_list.count()):
-            item = self.model_list.item(i)
-            if not item.isHidden():
-                new_state = (
-                    Qt.CheckState.Unchecked
-                    if item.checkState() == Qt.CheckState.Checked
-                    else Qt.CheckState.Checked
-                )
-                item.setCheckState(new_state)
-        self.model_list.blockSignals(False)
-        self._update_count()
+        visible = set(self._visible_names())
+        to_check = visible - self._checked_names
+        self._set_checked(visible & self._checked_names, False)
+        self._set_checked(to_check, True)
 
     def _update_count(self):
-        checked = sum(
-            1
-            for i in range(self.model_list.count())
-            if self.model_list.item(i).checkState() == Qt.CheckState.Checked
-        )
-        total = self.model_list.count()
+        checked = len(self._checked_names)
+        total = len(self._listed_names)
         self.count_label.setText(f"{checked} / {total} selected")
 
     def _get_selected_names(self):
-        """Return list of selected model names (using stored UserRole data)."""
-        return [
-            self.model_list.item(i).data(Qt.ItemDataRole.UserRole)
-            for i in range(self.model_list.count())
-            if self.model_list.item(i).checkState() == Qt.CheckState.Checked
-        ]
+        """Return list of selected model names in list order."""
+        return [name for name in self._listed_names if name in self._checked_names]
 
     def reset_to_defaults(self):
         """Reset model selections and filters to defaults."""
         # Deselect all models
-        self.model_list.blockSignals(True)
-        for i in range(self.model_list.count()):
-            self.model_list.item(i).setCheckState(Qt.CheckState.Unchecked)
-        self.model_list.blockSignals(False)
-        self._update_count()
+        self._set_checked(list(self._checked_names), False)
         # Clear search
         self.search_input.clear()
         # Reset filters
@@ -733,73 +753,53 @@ class ModelSelectorPage(QWidget):
         if not self._all_models:
             return
 
-        models = list(self._all_models.values())
-
-        # Apply sub type filter
         renewal_idx = self.renewal_combo.currentIndex()
-        if renewal_idx == 1:
-            models = [m for m in models if getattr(m, "renewed", False)]
-        elif renewal_idx == 2:
-            models = [m for m in models if not getattr(m, "renewed", False)]
-
         status_idx = self.status_combo.currentIndex()
-        if status_idx == 1:
-            models = [m for m in models if getattr(m, "active", False)]
-        elif status_idx == 2:
-            models = [m for m in models if not getattr(m, "active", False)]
-
-        # Apply promo filter
         promo_idx = self.promo_combo.currentIndex()
-        if promo_idx == 1:
-            models = [
-                m for m in models if getattr(m, "lowest_promo_claim", None) is not None
-            ]
-        elif promo_idx == 2:
-            models = [
-                m for m in models if getattr(m, "lowest_promo_claim", None) is None
-            ]
-
-        # Free trial filter
         ft_idx = self.free_trial_combo.currentIndex()
-        if ft_idx == 1:
-            models = [
-                m
-                for m in models
-                if getattr(m, "final_current_price", None) == 0
-                and getattr(m, "lowest_promo_claim", None) is not None
-            ]
-        elif ft_idx == 2:
-            models = [
-                m
-                for m in models
-                if not (
-                    getattr(m, "final_current_price", None) == 0
-                    and getattr(m, "lowest_promo_claim", None) is not None
-                )
-            ]
-
-        # Last seen visibility filter
         ls_idx = self.last_seen_combo.currentIndex()
-        if ls_idx == 1:
-            models = [m for m in models if getattr(m, "last_seen", None) is not None]
-        elif ls_idx == 2:
-            models = [m for m in models if getattr(m, "last_seen", None) is None]
-
-        # Price range filter
         min_price = self.price_min.value()
         max_price = self.price_max.value()
-        if min_price > 0:
-            models = [
-                m
-                for m in models
-                if getattr(m, "final_current_price", 0) >= min_price
-            ]
-        if max_price > 0:
-            models = [
-                m
-                for m in models
-                if getattr(m, "final_current_price", 0) <= max_price
-            ]
+
+        # Single pass over the models; each attribute is read once per model
+        # and shared by every filter clause that needs it.
+        models = []
+        all_models = self._all_models
+        for m in map(all_models.__getitem__, self._name_order):
+            # Subscription type
+            if renewal_idx and (
+                bool(getattr(m, "renewed", False)) != (renewal_idx == 1)
+            ):
+                continue
+            if status_idx and (
+                bool(getattr(m, "active", False)) != (status_idx == 1)
+            ):
+                continue
+
+            cp = getattr(m, "final_current_price", None)
+            lp = getattr(m, "lowest_promo_claim", None)
+
+            # Promo
+            if promo_idx and (lp is not None) != (promo_idx == 1):
+                continue
+
+            # Free trial
+            if ft_idx and (cp == 0 and lp is not None) != (ft_idx == 1):
+                continue
+
+            # Last seen visibility
+            if ls_idx and (
+                (getattr(m, "last_seen", None) is not None) != (ls_idx == 1)
+            ):
+                continue
+
+            # Price range
+            if min_price > 0 and (cp or 0) < min_price:
+                continue
+            if max_price > 0 and (cp or 0) > max_price:
+                continue
+
+            models.append(m)
 
         # Sort
         sort_idx = self.sort_combo.currentIndex()
@@ -817,12 +817,17 @@ class ModelSelectorPage(QWidget):
             "regular-price": "final_regular_price",
         }
         attr = sort_attr_map.get(sort_key, "name")
-        try:
-            models.sort(
-                key=lambda m: getattr(m, attr, "") or "", reverse=reverse
-            )
-        except TypeError:
-            models.sort(key=lambda m: str(getattr(m, attr, "")), reverse=reverse)
+        if attr == "name":
+            # Models were visited in _name_order, so they are already sorted
+            if reverse:
+                models.reverse()
+        else:
+            try:
+                models.sort(
+                    key=lambda m: getattr(m, attr, "") or "", reverse=reverse
+                )
+            except TypeError:
+                models.sort(key=lambda m: str(getattr(m, attr, "")), reverse=reverse)
 
         # Remember current selections
         selected = set(self._get_selected_names())
@@ -832,13 +837,7 @@ class ModelSelectorPage(QWidget):
         self._populate_list(names)
 
         # Restore selections
-        self.model_list.blockSignals(True)
-        for i in range(self.model_list.count()):
-            item = self.model_list.item(i)
-            if item.data(Qt.ItemDataRole.UserRole) in selected:
-                item.setCheckState(Qt.CheckState.Checked)
-        self.model_list.blockSignals(False)
-        self._update_count()
+        self._set_checked(selected.intersection(names), True)
 
     def _reset_filters(self):
         """Reset all filters to defaults."""
@@ -871,14 +870,10 @@ class ModelSelectorPage(QWidget):
         self.search_input.setText(username_text)
 
         # Auto-select exact matches
-        self.model_list.blockSignals(True)
-        for i in range(self.model_list.count()):
-            item = self.model_list.item(i)
-            model_name = (item.data(Qt.ItemDataRole.UserRole) or "").lower()
-            if model_name in usernames:
-                item.setCheckState(Qt.CheckState.Checked)
-        self.model_list.blockSignals(False)
-        self._update_count()
+        self._set_checked(
+            [n for n in self._listed_names if (n or "").lower() in usernames],
+            True,
+        )
 
     def _on_back(self):
         """Go back to area selector page."""
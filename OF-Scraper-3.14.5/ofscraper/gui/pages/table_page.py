@@ -1,10 +1,12 @@
+import functools
 import logging
+from operator import itemgetter
 
 import os
 import subprocess as _subprocess
 import sys as _sys
 
-from PyQt6.QtCore import Qt, QUrl, pyqtSlot
+from PyQt6.QtCore import Qt, QEvent, QTimer, QUrl, pyqtSlot
 from PyQt6.QtGui import QDesktopServices, QFont
 from PyQt6.QtWidgets import (
     QHBoxLayout,
@@ -12,75 +14,244 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QSplitter,
     QTabWidget,
-    QToolButton,
     QVBoxLayout,
     QWidget,
 )
 
 from ofscraper.gui.signals import app_signals
-from ofscraper.gui.styles import c
+from ofscraper.gui.styles import COLORS, current_theme_key
 from ofscraper.gui.widgets.console_log import ConsoleLogWidget
 from ofscraper.gui.widgets.data_table import MediaDataTable
-from ofscraper.gui.widgets.progress_panel import ProgressSummaryBar
+from ofscraper.gui.widgets.help_button import HelpButton, help_button_qss
 from ofscraper.gui.widgets.sidebar import FilterSidebar
 from ofscraper.gui.widgets.styled_button import StyledButton
 
 log = logging.getLogger("shared")
 
-def _help_btn_qss():
+
+@functools.lru_cache(maxsize=4)
+def _font(family, size, bold=False) -> QFont:
+    """Build a toolbar font once; QFont copies are implicitly shared."""
+    if bold:
+        return QFont(family, size, QFont.Weight.Bold)
+    return QFont(family, size)
+
+
+@functools.lru_cache(maxsize=256)
+def _cart_label_text(count) -> str:
+    return f"Cart: {count} items"
+
+
+@functools.lru_cache(maxsize=8)
+def _build_page_qss(theme_key) -> str:
+    """Build the single stylesheet applied to TablePage for a palette.
+
+    Toolbar buttons are targeted by their ``role`` property (help buttons
+    by ``helpBtn``) so the whole page is parsed and polished once per
+    theme change. Every widget rule is scoped under ``#tablePage`` so it
+    outranks the ``#tableToolbar *`` / ``#tableStatusBar *`` background
+    rule.
+    """
+    p = COLORS[theme_key]
+    base = p["base"]
     return (
-        f"QToolButton {{ border: 1px solid {c('surface1')}; border-radius: 9px;"
-        f" background-color: {c('surface0')}; color: {c('text')}; font-weight: bold; }}"
-        f" QToolButton:hover {{ border-color: {c('blue')}; background-color: {c('surface1')}; }}"
+        # Toolbar / status bar backgrounds (cascade to their children)
+        f"#tableToolbar, #tableToolbar *, #tableStatusBar, #tableStatusBar *"
+        f" {{ background-color: {p['mantle']}; }}"
+        f" #tablePage QPushButton[role=\"filter\"] {{ background-color: {p['blue']}; color: {base};"
+        f" font-weight: bold; border: none; border-radius: 6px; padding: 6px 16px; }}"
+        f" #tablePage QPushButton[role=\"filter\"]:hover {{ background-color: {p['sky']}; }}"
+        f" #tablePage QPushButton[role=\"start\"] {{ background-color: {p['green']}; color: {base};"
+        f" font-weight: bold; border: none; border-radius: 6px; padding: 6px 20px; }}"
+        f" #tablePage QPushButton[role=\"start\"]:hover {{ background-color: {p['teal']}; }}"
+        f" #tablePage QPushButton[role=\"start\"]:disabled"
+        f" {{ background-color: {p['surface1']}; color: {p['muted']}; }}"
+        f" #tablePage QPushButton[role=\"newScrape\"] {{ background-color: {p['mauve']}; color: {base};"
+        f" font-weight: bold; border: none; border-radius: 6px; padding: 6px 16px; }}"
+        f" #tablePage QPushButton[role=\"newScrape\"]:hover {{ background-color: {p['lavender']}; }}"
+        f" #tablePage QPushButton[role=\"openFolder\"] {{ background-color: {p['surface1']}; color: {p['text']};"
+        f" font-weight: bold; border: none; border-radius: 6px; padding: 6px 16px; }}"
+        f" #tablePage QPushButton[role=\"openFolder\"]:hover {{ background-color: {p['surface2']}; }}"
+        f" #tablePage QPushButton[role=\"stopDaemon\"] {{ background-color: {p['red']}; color: {base};"
+        f" font-weight: bold; border: none; border-radius: 6px; padding: 6px 16px; }}"
+        f" #tablePage QPushButton[role=\"stopDaemon\"]:hover {{ background-color: {p['peach']}; }}"
+        f" #tablePage QLabel[role=\"daemonStatus\"] {{ color: {p['yellow']}; }}"
+        f" #tablePage QPushButton[role=\"send\"] {{ background-color: {p['peach']}; color: {base};"
+        f" font-weight: bold; border: none; border-radius: 6px; padding: 6px 16px; }}"
+        f" #tablePage QPushButton[role=\"send\"]:hover {{ background-color: {p['yellow']}; }}"
+        f" {help_button_qss(theme_key, '#tablePage ')}"
     )
 
-def _make_help_btn(anchor: str) -> QToolButton:
-    b = QToolButton()
-    b.setText("?")
-    b.setToolTip("Open help")
-    b.setCursor(Qt.CursorShape.PointingHandCursor)
-    b.setAutoRaise(True)
-    b.setFixedSize(18, 18)
-    b.setStyleSheet(_help_btn_qss())
-    b.clicked.connect(lambda: app_signals.help_anchor_requested.emit(anchor))
-    return b
+
+def _checked(obj, name) -> bool:
+    """True if ``obj.<name>`` exists and is a checked checkbox/button."""
+    widget = getattr(obj, name, None)
+    return bool(widget is not None and widget.isChecked())
+
+
+def _date_text(obj, name):
+    """``obj.<name>``'s date as yyyy-MM-dd, or None if the editor is missing."""
+    widget = getattr(obj, name, None)
+    return widget.date().toString("yyyy-MM-dd") if widget is not None else None
 
 
 class TablePage(QWidget):
     """Main workspace page combining data table, filter sidebar,
     console log, and progress panel. Replaces the Textual InputApp."""
 
+    # (app_signals attribute, TablePage slot) pairs owned by this page,
+    # split by the thread that emits them so the connection type is fixed
+    # up front instead of being resolved by AutoConnection on every emit.
+    # Emitted by the scraper worker thread -> always queued to the GUI.
+    _WORKER_SIGNAL_SLOTS = (
+        ("scraping_finished", "_on_scraping_finished"),
+        ("daemon_next_run", "_on_daemon_countdown"),
+        ("daemon_run_starting", "_on_daemon_run_starting"),
+        ("daemon_stopped", "_on_daemon_stopped"),
+    )
+    # Emitted on the GUI thread -> called directly.
+    _GUI_SIGNAL_SLOTS = (
+        ("theme_changed", "_on_theme_changed"),
+    )
+    _APP_SIGNAL_SLOTS = _WORKER_SIGNAL_SLOTS + _GUI_SIGNAL_SLOTS
+
     def __init__(self, manager=None, parent=None):
         super().__init__(parent)
+        self.setObjectName("tablePage")
         self.manager = manager
         self._scrape_active = False
         self._pending_new_scrape_nav = False
         self._pending_reset = False
+        # The filter sidebar and progress bar are built on first show (or
+        # first access) — see _lazy_populate.
+        self._populated = False
+        self._sidebar = None
+        self._progress_summary = None
+        # Daemon countdown text is coalesced so the label repaints at most
+        # every 200 ms regardless of how often daemon_next_run fires.
+        self._pending_daemon_text = None
+        self._daemon_text_timer = QTimer(self)
+        self._daemon_text_timer.setSingleShot(True)
+        self._daemon_text_timer.setInterval(200)
+        self._daemon_text_timer.timeout.connect(self._flush_daemon_text)
+        self._last_theme_key = None
+        # Incremental rows from the scraper are buffered and flushed into
+        # the table at most every 50 ms (see append_data).
+        self._append_pending: list = []
+        self._append_timer = QTimer(self)
+        self._append_timer.setSingleShot(True)
+        self._append_timer.setInterval(50)
+        self._append_timer.timeout.connect(self._flush_pending_rows)
+        # Right-click "Filter by" requests, merged per column (see
+        # _on_cell_filter_requested)
+        self._pending_cell_filters: dict = {}
+        self._cell_filter_timer = QTimer(self)
+        self._cell_filter_timer.setSingleShot(True)
+        self._cell_filter_timer.setInterval(50)
+        self._cell_filter_timer.timeout.connect(self._flush_pending_cell_filters)
+        self._signals_connected = False
+        # Scrape options last sent to the workflow (see _on_start_scraping)
+        self._last_emitted = {"paid": None, "labels": None, "advanced": None}
+        # (visible, total) last shown in row_count_label
+        self._last_row_counts = None
         self._setup_ui()
         self._connect_signals()
 
+    @property
+    def sidebar(self) -> FilterSidebar:
+        self._lazy_populate()
+        return self._sidebar
+
+    @property
+    def progress_summary(self) -> "ProgressSummaryBar":
+        self._lazy_populate()
+        return self._progress_summary
+
+    # Cached top-level window and the main-window attributes looked up
+    # through it (see _main_attr); both cleared on reparent (changeEvent)
+    _main_window = None
+    _main_refs = None
+
+    @property
+    def _main(self):
+        """The main window, looked up once instead of per handler call."""
+        mw = self._main_window
+        if mw is None:
+            mw = self.window()
+            # Only cache once the page is actually parented into a window
+            if mw is not self:
+                self._main_window = mw
+        return mw
+
+    def _main_attr(self, name):
+        """A main-window attribute such as ``area_page``, cached once found."""
+        refs = self._main_refs
+        if refs is None:
+            refs = self._main_refs = {}
+        obj = refs.get(name)
+        if obj is None:
+            obj = getattr(self._main, name, None)
+            if obj is not None:
+                refs[name] = obj
+        return obj
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.ParentChange:
+            self._main_window = None
+            self._main_refs = None
+        super().changeEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._populated:
+            QTimer.singleShot(0, self._lazy_populate)
+        # Rows that arrived while hidden are already in the table; only
+        # their painting was held off (see _hold_paint_while_hidden)
+        self.data_table.setUpdatesEnabled(True)
+
+    def _lazy_populate(self):
+        """Build the heavy child widgets and swap them in for their placeholders."""
+        if self._populated:
+            return
+        self._populated = True
+
+        self._sidebar = FilterSidebar()
+        # Give the sidebar enough width to show controls by default.
+        # Users can still resize via the splitter handle.
+        self._sidebar.setMinimumWidth(400)
+        self._sidebar.setMaximumWidth(640)
+        self._content_splitter.replaceWidget(0, self._sidebar)
+        self._sidebar_placeholder.deleteLater()
+        self._sidebar_placeholder = None
+
+        # Only this page uses progress_panel; import it on first build
+        from ofscraper.gui.widgets.progress_panel import ProgressSummaryBar
+
+        self._progress_summary = ProgressSummaryBar()
+        self._status_layout.replaceWidget(
+            self._progress_placeholder, self._progress_summary
+        )
+        self._progress_placeholder.deleteLater()
+        self._progress_placeholder = None
+
+    @pyqtSlot()
     def _reset_scrape_controls(self):
         """Reset toolbar state to a ready-to-scrape baseline."""
+        self._scrape_active = False
+        self._drop_pending_daemon_text()
         try:
-            self._scrape_active = False
             self.start_scraping_btn.setEnabled(True)
             self.start_scraping_btn.setText("Start Scraping >>")
-        except Exception:
-            pass
-        try:
             self.stop_daemon_btn.hide()
             self.stop_daemon_btn.setEnabled(True)
             self.stop_daemon_btn.setText("Stop Daemon")
-        except Exception:
-            pass
-        try:
             self.daemon_status_label.hide()
-        except Exception:
+        except RuntimeError:
+            # Widgets already deleted (page torn down mid-signal)
             pass
 
     def _navigate_to_action_page(self):
-        main_window = self.window()
-        scraper_stack = getattr(main_window, "scraper_stack", None)
+        scraper_stack = self._main_attr("scraper_stack")
         if scraper_stack:
             scraper_stack.setCurrentIndex(0)  # action page
 
@@ -91,8 +262,8 @@ class TablePage(QWidget):
 
         # -- Top toolbar --
         self._toolbar = toolbar = QWidget()
+        toolbar.setObjectName("tableToolbar")
         toolbar.setFixedHeight(48)
-        toolbar.setStyleSheet(f"background-color: {c('mantle')};")
         toolbar_layout = QHBoxLayout(toolbar)
         toolbar_layout.setContentsMargins(12, 4, 12, 4)
 
@@ -109,23 +280,27 @@ class TablePage(QWidget):
         toolbar_layout.addWidget(self.reset_btn)
 
         self.filter_btn = StyledButton("Apply Filters", primary=True)
+        self.filter_btn.setProperty("role", "filter")
         self.filter_btn.clicked.connect(self._on_filter)
         toolbar_layout.addWidget(self.filter_btn)
 
         toolbar_layout.addSpacing(12)
 
         self.start_scraping_btn = StyledButton("Start Scraping >>", primary=True)
+        self.start_scraping_btn.setProperty("role", "start")
         self.start_scraping_btn.setFixedHeight(36)
-        self.start_scraping_btn.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        self.start_scraping_btn.setFont(_font("Segoe UI", 12, bold=True))
         self.start_scraping_btn.clicked.connect(self._on_start_scraping)
         toolbar_layout.addWidget(self.start_scraping_btn)
 
         self.new_scrape_btn = StyledButton("New Scrape")
+        self.new_scrape_btn.setProperty("role", "newScrape")
         self.new_scrape_btn.setFixedHeight(36)
         self.new_scrape_btn.clicked.connect(self._on_new_scrape)
         toolbar_layout.addWidget(self.new_scrape_btn)
 
         self.open_folder_btn = StyledButton("Open Downloads Folder")
+        self.open_folder_btn.setProperty("role", "openFolder")
         self.open_folder_btn.setFixedHeight(36)
         self.open_folder_btn.setToolTip("Open the configured download save location in your file manager")
         self.open_folder_btn.clicked.connect(self._on_open_downloads_folder)
@@ -133,6 +308,7 @@ class TablePage(QWidget):
 
         # Stop Daemon button (hidden until daemon is running)
         self.stop_daemon_btn = StyledButton("Stop Daemon")
+        self.stop_daemon_btn.setProperty("role", "stopDaemon")
         self.stop_daemon_btn.setFixedHeight(36)
         self.stop_daemon_btn.clicked.connect(self._on_stop_daemon)
         self.stop_daemon_btn.hide()
@@ -142,7 +318,8 @@ class TablePage(QWidget):
 
         # Daemon countdown label (hidden until daemon is waiting)
         self.daemon_status_label = QLabel("")
-        self.daemon_status_label.setFont(QFont("Segoe UI", 10))
+        self.daemon_status_label.setProperty("role", "daemonStatus")
+        self.daemon_status_label.setFont(_font("Segoe UI", 10))
         self.daemon_status_label.hide()
         toolbar_layout.addWidget(self.daemon_status_label)
 
@@ -165,21 +342,20 @@ class TablePage(QWidget):
         toolbar_layout.addSpacing(12)
 
         self.send_btn = StyledButton(">> Send Downloads", primary=True)
+        self.send_btn.setProperty("role", "send")
         self.send_btn.clicked.connect(self._on_send_downloads)
         toolbar_layout.addWidget(self.send_btn)
 
         layout.addWidget(toolbar)
 
         # -- Main content area: sidebar + table --
-        content_splitter = QSplitter(Qt.Orientation.Horizontal)
+        self._content_splitter = content_splitter = QSplitter(Qt.Orientation.Horizontal)
 
-        # Sidebar
-        self.sidebar = FilterSidebar()
-        # Give the sidebar enough width to show controls by default.
-        # Users can still resize via the splitter handle.
-        self.sidebar.setMinimumWidth(400)
-        self.sidebar.setMaximumWidth(640)
-        content_splitter.addWidget(self.sidebar)
+        # Sidebar placeholder (same width limits, keeps geometry stable)
+        self._sidebar_placeholder = QWidget()
+        self._sidebar_placeholder.setMinimumWidth(400)
+        self._sidebar_placeholder.setMaximumWidth(640)
+        content_splitter.addWidget(self._sidebar_placeholder)
 
         # Right side: table + bottom tabs
         right_widget = QWidget()
@@ -197,18 +373,19 @@ class TablePage(QWidget):
         right_layout.addWidget(self.console_widget, stretch=1)
 
         content_splitter.addWidget(right_widget)
+        # Stretch factors alone size the panes: the sidebar keeps its size
+        # hint (clamped to its 400-640 px limits) and the table takes the
+        # rest, so no second layout pass from explicit setSizes is needed.
         content_splitter.setStretchFactor(0, 0)
         content_splitter.setStretchFactor(1, 1)
-        # Default widths: sidebar fully visible without dragging.
-        content_splitter.setSizes([520, 880])
 
         layout.addWidget(content_splitter)
 
         # -- Status info at bottom --
         self._status_bar_widget = status_bar = QWidget()
+        status_bar.setObjectName("tableStatusBar")
         status_bar.setFixedHeight(34)
-        status_bar.setStyleSheet(f"background-color: {c('mantle')};")
-        status_layout = QHBoxLayout(status_bar)
+        self._status_layout = status_layout = QHBoxLayout(status_bar)
         status_layout.setContentsMargins(12, 2, 12, 2)
         status_layout.setSpacing(10)
 
@@ -217,8 +394,10 @@ class TablePage(QWidget):
         status_layout.addWidget(self.row_count_label)
 
         # Overall progress embedded in the footer to use the empty space.
-        self.progress_summary = ProgressSummaryBar()
-        status_layout.addWidget(self.progress_summary, stretch=1)
+        # A same-height placeholder holds its slot until _lazy_populate.
+        self._progress_placeholder = QWidget()
+        self._progress_placeholder.setFixedHeight(22)
+        status_layout.addWidget(self._progress_placeholder, stretch=1)
 
         hint_label = QLabel(
             "Click Download_Cart cell to toggle  |  Right-click cell to filter  |  Click header to sort"
@@ -227,7 +406,7 @@ class TablePage(QWidget):
         status_layout.addWidget(hint_label)
 
         # Quick link to table column/label documentation
-        status_layout.addWidget(_make_help_btn("table-columns"))
+        status_layout.addWidget(HelpButton("table-columns", tooltip="Open help"))
 
         layout.addWidget(status_bar)
 
@@ -236,78 +415,78 @@ class TablePage(QWidget):
 
     def _apply_toolbar_theme(self):
         """Apply themed colors to toolbar buttons and bars."""
-        base = c('base')
-        self._toolbar.setStyleSheet(f"background-color: {c('mantle')};")
-        self._status_bar_widget.setStyleSheet(f"background-color: {c('mantle')};")
-        self.filter_btn.setStyleSheet(
-            f"QPushButton {{ background-color: {c('blue')}; color: {base};"
-            f" font-weight: bold; border: none; border-radius: 6px; padding: 6px 16px; }}"
-            f" QPushButton:hover {{ background-color: {c('sky')}; }}"
-        )
-        self.start_scraping_btn.setStyleSheet(
-            f"QPushButton {{ background-color: {c('green')}; color: {base};"
-            f" font-weight: bold; border: none; border-radius: 6px; padding: 6px 20px; }}"
-            f" QPushButton:hover {{ background-color: {c('teal')}; }}"
-            f" QPushButton:disabled {{ background-color: {c('surface1')}; color: {c('muted')}; }}"
-        )
-        self.new_scrape_btn.setStyleSheet(
-            f"QPushButton {{ background-color: {c('mauve')}; color: {base};"
-            f" font-weight: bold; border: none; border-radius: 6px; padding: 6px 16px; }}"
-            f" QPushButton:hover {{ background-color: {c('lavender')}; }}"
-        )
-        self.open_folder_btn.setStyleSheet(
-            f"QPushButton {{ background-color: {c('surface1')}; color: {c('text')};"
-            f" font-weight: bold; border: none; border-radius: 6px; padding: 6px 16px; }}"
-            f" QPushButton:hover {{ background-color: {c('surface2')}; }}"
-        )
-        self.stop_daemon_btn.setStyleSheet(
-            f"QPushButton {{ background-color: {c('red')}; color: {base};"
-            f" font-weight: bold; border: none; border-radius: 6px; padding: 6px 16px; }}"
-            f" QPushButton:hover {{ background-color: {c('peach')}; }}"
-        )
-        self.daemon_status_label.setStyleSheet(f"color: {c('yellow')};")
-        self.send_btn.setStyleSheet(
-            f"QPushButton {{ background-color: {c('peach')}; color: {base};"
-            f" font-weight: bold; border: none; border-radius: 6px; padding: 6px 16px; }}"
-            f" QPushButton:hover {{ background-color: {c('yellow')}; }}"
-        )
-        # Update help buttons
-        for btn in self.findChildren(QToolButton):
-            if btn.text() == "?":
-                btn.setStyleSheet(_help_btn_qss())
+        key = current_theme_key()
+        if key == self._last_theme_key:
+            return
+        self._last_theme_key = key
+        self.setStyleSheet(_build_page_qss(key))
 
     def _connect_signals(self):
-        self.data_table.cart_count_changed.connect(self._on_cart_count_changed)
-        self.data_table.cell_filter_requested.connect(
-            self._on_cell_filter_requested
+        if self._signals_connected:
+            return
+        self._signals_connected = True
+        direct = Qt.ConnectionType.DirectConnection
+        queued = Qt.ConnectionType.QueuedConnection
+        connections = [
+            (self.data_table.cart_count_changed, self._on_cart_count_changed, direct),
+            (self.data_table.cell_filter_requested, self._on_cell_filter_requested, direct),
+            (self.data_table.totals_changed, self._on_totals, direct),
+            # Buffered rows must reach the table before any cell update
+            # that may target them is applied
+            (self.data_table.external_update_incoming, self._flush_pending_rows, direct),
+        ]
+        connections.extend(
+            (getattr(app_signals, sig), getattr(self, slot), direct)
+            for sig, slot in self._GUI_SIGNAL_SLOTS
         )
-        app_signals.scraping_finished.connect(self._on_scraping_finished)
-        app_signals.daemon_next_run.connect(self._on_daemon_countdown)
-        app_signals.daemon_run_starting.connect(self._on_daemon_run_starting)
-        app_signals.daemon_stopped.connect(self._on_daemon_stopped)
-        app_signals.theme_changed.connect(lambda _: self._apply_toolbar_theme())
+        connections.extend(
+            (getattr(app_signals, sig), getattr(self, slot), queued)
+            for sig, slot in self._WORKER_SIGNAL_SLOTS
+        )
+        for signal, slot, conn_type in connections:
+            signal.connect(slot, conn_type)
 
+    def _disconnect_signals(self):
+        """Detach this page from the global app_signals hub."""
+        for sig, slot in self._APP_SIGNAL_SLOTS:
+            try:
+                getattr(app_signals, sig).disconnect(getattr(self, slot))
+            except (TypeError, RuntimeError):
+                pass
+
+    def closeEvent(self, event):
+        self._disconnect_signals()
+        super().closeEvent(event)
+
+    @pyqtSlot(bool)
+    def _on_theme_changed(self, _is_dark):
+        self._apply_toolbar_theme()
+
+    @pyqtSlot(bool)
     def _toggle_sidebar(self, checked):
         self.sidebar.setVisible(checked)
 
+    @pyqtSlot()
     def _on_reset(self):
         """Reset all filters and show all data."""
         self.sidebar.reset_all()
         self.data_table.reset_filter()
-        self._update_row_count()
 
+    @pyqtSlot()
     def _on_filter(self):
         """Apply current sidebar filter state to the table."""
         state = self.sidebar.collect_state()
         self.data_table.apply_filter(state)
-        self._update_row_count()
 
+    @pyqtSlot()
     def _on_select_all_cart(self):
         self.data_table.select_all_cart()
 
+    @pyqtSlot()
     def _on_deselect_all_cart(self):
         self.data_table.deselect_all_cart()
 
+    @pyqtSlot()
     def _on_send_downloads(self):
         """Send all [added] items to the download queue."""
         cart_items = self.data_table.get_cart_items()
@@ -318,24 +497,22 @@ class TablePage(QWidget):
             )
             return
 
-        log.info(f"Sending {len(cart_items)} downloads to queue")
+        log.info("Sending %d downloads to queue", len(cart_items))
         app_signals.status_message.emit(
             f"Queued {len(cart_items)} downloads"
         )
 
-        # Put items into the row queue for processing
-        for row_data, row_key in cart_items:
-            self.data_table.row_queue.put((row_data, row_key))
+        # Put items into the row queue for processing (one lock hold)
+        self.data_table.row_queue.put_many(cart_items)
+        payload = list(map(itemgetter(0), cart_items))
 
         # Emit signal for the download processor
-        app_signals.downloads_queued.emit(
-            [item[0] for item in cart_items]
-        )
+        app_signals.downloads_queued.emit(payload)
 
+    @pyqtSlot()
     def _on_start_scraping(self):
         """Read areas from the area page and start scraping."""
-        main_window = self.window()
-        area_page = getattr(main_window, "area_page", None)
+        area_page = self._main_attr("area_page")
 
         if not area_page:
             app_signals.error_occurred.emit(
@@ -344,15 +521,13 @@ class TablePage(QWidget):
             return
 
         selected_areas = area_page.get_selected_areas()
+        snapshot = area_page.scrape_config_snapshot()
         # Check modes that don't require area selection (msg/paid/story check)
         _check_modes_no_area = {"msg_check", "paid_check", "story_check"}
         _current_actions = getattr(area_page, "_current_actions", set()) or set()
         _skip_area_check = bool(_current_actions & _check_modes_no_area)
         # Also skip when scrape_paid is enabled — global paid endpoint needs no areas
-        _scrape_paid_enabled = bool(
-            getattr(area_page, "scrape_paid_check", None)
-            and area_page.scrape_paid_check.isChecked()
-        )
+        _scrape_paid_enabled = snapshot["scrape_paid"]
         if not selected_areas and not _skip_area_check and not _scrape_paid_enabled:
             app_signals.error_occurred.emit(
                 "No Areas Selected",
@@ -362,8 +537,10 @@ class TablePage(QWidget):
 
         # New scrape run: clear table + progress UI immediately so purges/rescrapes
         # don't leave stale rows/progress visible when the DB is deleted.
+        self._discard_pending_rows()
         try:
             self.data_table.clear_all()
+            self.progress_summary.clear_all()
         except Exception:
             # Don't block scraping if the UI reset fails
             pass
@@ -373,74 +550,46 @@ class TablePage(QWidget):
             self.data_table.apply_filter(self.sidebar.collect_state())
         except Exception:
             pass
-        try:
-            self.progress_summary.clear_all()
-        except Exception:
-            pass
-        self._update_row_count()
 
         # Disable the button to prevent double-starts
         self.start_scraping_btn.setEnabled(False)
         self.start_scraping_btn.setText("Scraping...")
         self._scrape_active = True
 
-        # Emit additional options from the area page
-        # Always emit current state (not just when checked) so workflow._scrape_paid
-        # resets to False when the checkbox is unchecked between runs.
-        app_signals.scrape_paid_toggled.emit(area_page.scrape_paid_check.isChecked())
-        if area_page.scrape_labels_check.isChecked():
+        # Emit additional options from the area page. scrape_paid is sent
+        # whenever it differs from the last value (not just when checked) so
+        # workflow._scrape_paid resets to False when the box is unchecked.
+        # Nothing but this page emits these, so an unchanged value means the
+        # receiver already holds it.
+        last = self._last_emitted
+        if last["paid"] != snapshot["scrape_paid"]:
+            last["paid"] = snapshot["scrape_paid"]
+            app_signals.scrape_paid_toggled.emit(snapshot["scrape_paid"])
+        if snapshot["scrape_labels"] and not last["labels"]:
+            last["labels"] = True
             app_signals.scrape_labels_toggled.emit(True)
-        # Discord webhook updates (only if configured + user enabled)
-        try:
-            discord_active = bool(
-                getattr(area_page, "discord_updates_check", None)
-                and area_page.discord_updates_check.isEnabled()
-                and area_page.discord_updates_check.isChecked()
-            )
-            if discord_active:
-                level = getattr(area_page, "discord_level_combo", None)
-                discord_level = level.currentText() if level else "NORMAL"
-            else:
-                discord_level = "OFF"
-            app_signals.discord_configured.emit(discord_level)
-        except Exception:
-            pass
-
+        # Discord webhook updates (only if configured + user enabled).
+        # Always re-emitted: the workflow re-mutes the handler after each run.
+        app_signals.discord_configured.emit(snapshot["discord_level"])
         # Emit advanced scrape options
-        try:
-            advanced = {
-                "allow_dupe_downloads": bool(
-                    getattr(area_page, "allow_dupes_check", None)
-                    and area_page.allow_dupes_check.isChecked()
-                ),
-                "rescrape_all": bool(
-                    getattr(area_page, "rescrape_all_check", None)
-                    and area_page.rescrape_all_check.isChecked()
-                ),
-                "delete_model_db": bool(
-                    getattr(area_page, "delete_db_check", None)
-                    and area_page.delete_db_check.isChecked()
-                ),
-                "delete_downloads": bool(
-                    getattr(area_page, "delete_downloads_check", None)
-                    and area_page.delete_downloads_check.isChecked()
-                ),
-            }
-            app_signals.advanced_scrape_configured.emit(advanced)
-        except Exception:
-            # Don't block scraping if advanced config can't be emitted
-            pass
+        advanced = snapshot["advanced"]
+        if last["advanced"] != advanced:
+            last["advanced"] = advanced
+            app_signals.advanced_scrape_configured.emit(
+                advanced["allow_dupe_downloads"],
+                advanced["rescrape_all"],
+                advanced["delete_model_db"],
+                advanced["delete_downloads"],
+            )
 
         # Emit daemon configuration
-        daemon_enabled = area_page.is_daemon_enabled()
-        if daemon_enabled:
+        daemon = snapshot["daemon"]
+        if daemon["enabled"]:
             app_signals.daemon_configured.emit(
-                True,
-                area_page.get_daemon_interval(),
-                area_page.is_notify_enabled(),
-                area_page.is_sound_enabled(),
+                True, daemon["interval"], daemon["notify"], daemon["sound"]
             )
             self.stop_daemon_btn.show()
+            self._drop_pending_daemon_text()
             self.daemon_status_label.show()
             self.daemon_status_label.setText("Daemon mode active")
         else:
@@ -449,33 +598,18 @@ class TablePage(QWidget):
         # Emit date range from the filter sidebar — but ONLY when the sidebar
         # date filter is explicitly enabled.  If it is disabled, do NOT emit,
         # so any date range already set (e.g. by the LLM assistant) is preserved.
-        try:
-            fs = getattr(area_page, "filter_sidebar", None)
-            if fs is not None:
-                date_enabled = bool(
-                    getattr(fs, "date_enabled", None)
-                    and fs.date_enabled.isChecked()
-                )
-                if date_enabled:
-                    from_date = (
-                        fs.min_date.date().toString("yyyy-MM-dd")
-                        if getattr(fs, "min_date", None)
-                        else None
-                    )
-                    to_date = (
-                        fs.max_date.date().toString("yyyy-MM-dd")
-                        if getattr(fs, "max_date", None)
-                        else None
-                    )
-                    app_signals.date_range_configured.emit(
-                        {"enabled": True, "from_date": from_date, "to_date": to_date}
-                    )
-                # else: sidebar date filter is off — preserve any existing
-                # date range (e.g. set by the LLM assistant via set_date_filter)
-        except Exception:
-            pass
+        fs = getattr(area_page, "filter_sidebar", None)
+        if _checked(fs, "date_enabled"):
+            from_date = _date_text(fs, "min_date")
+            to_date = _date_text(fs, "max_date")
+            app_signals.date_range_configured.emit(
+                {"enabled": True, "from_date": from_date, "to_date": to_date}
+            )
+        # else: sidebar date filter is off — preserve any existing
+        # date range (e.g. set by the LLM assistant via set_date_filter)
 
-        log.info(f"Starting scrape with areas: {selected_areas}")
+        # Lazy %-formatting: the area list is only repr'd if INFO is enabled
+        log.info("Starting scrape with areas: %s", selected_areas)
         app_signals.areas_selected.emit(selected_areas)
 
     @pyqtSlot()
@@ -501,6 +635,7 @@ class TablePage(QWidget):
             return
         self.start_scraping_btn.setEnabled(True)
         self.start_scraping_btn.setText("Start Scraping >>")
+        self._drop_pending_daemon_text()
         self.daemon_status_label.hide()
         # Auto-apply sidebar filters (e.g. date range) so the table reflects
         # the same criteria used for downloading without requiring a manual click.
@@ -509,8 +644,33 @@ class TablePage(QWidget):
     @pyqtSlot(str)
     def _on_daemon_countdown(self, text):
         """Update the daemon countdown label with remaining time."""
-        self.daemon_status_label.setText(text)
-        self.daemon_status_label.show()
+        if not self.daemon_status_label.isVisible():
+            # First update after the label was hidden: show it right away
+            self._pending_daemon_text = text
+            self._flush_daemon_text()
+            return
+        self._pending_daemon_text = text
+        if not self._daemon_text_timer.isActive():
+            self._daemon_text_timer.start()
+
+    @pyqtSlot()
+    def _flush_daemon_text(self):
+        text = self._pending_daemon_text
+        if text is None:
+            return
+        self._pending_daemon_text = None
+        label = self.daemon_status_label
+        # Compared against the label itself (not a cached copy) because the
+        # run/stop handlers also write to it directly.
+        if label.text() != text:
+            label.setText(text)
+        if label.isHidden():
+            label.show()
+
+    def _drop_pending_daemon_text(self):
+        """Discard a queued countdown so it can't overwrite a newer status."""
+        self._daemon_text_timer.stop()
+        self._pending_daemon_text = None
 
     @pyqtSlot(int)
     def _on_daemon_run_starting(self, run_number):
@@ -518,6 +678,7 @@ class TablePage(QWidget):
         # Daemon re-run: treat as a fresh scrape cycle in the UI.
         self._scrape_active = True
         try:
+            self._discard_pending_rows()
             self.data_table.clear_all()
         except Exception:
             pass
@@ -529,8 +690,8 @@ class TablePage(QWidget):
             self.progress_summary.clear_all()
         except Exception:
             pass
-        self._update_row_count()
         self.start_scraping_btn.setText(f"Scraping (run #{run_number})...")
+        self._drop_pending_daemon_text()
         self.daemon_status_label.setText(f"Daemon run #{run_number}")
         self.daemon_status_label.show()
 
@@ -538,38 +699,70 @@ class TablePage(QWidget):
     def _on_daemon_stopped(self):
         """Reset UI when daemon mode is stopped."""
         self.stop_daemon_btn.hide()
+        self._drop_pending_daemon_text()
         self.daemon_status_label.hide()
         self.start_scraping_btn.setEnabled(True)
         self.start_scraping_btn.setText("Start Scraping >>")
         self._scrape_active = False
 
+    @pyqtSlot()
     def _on_stop_daemon(self):
         """Request the daemon loop to stop."""
         app_signals.stop_daemon_requested.emit()
         self.stop_daemon_btn.setEnabled(False)
         self.stop_daemon_btn.setText("Stopping...")
+        self._drop_pending_daemon_text()
         self.daemon_status_label.setText("Stopping daemon...")
 
-    def _ask_reset_options(self):
+    def _ask_yes_no(self, title, text, on_answer):
+        """Show a window-modal Yes/No box without blocking the event loop.
+
+        on_answer(bool) is called with True if the user chose Yes.
+        """
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Icon.Question)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        box.setWindowModality(Qt.WindowModality.WindowModal)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+
+        def _finished(_result):
+            clicked = box.standardButton(box.clickedButton())
+            on_answer(clicked == QMessageBox.StandardButton.Yes)
+
+        box.finished.connect(_finished)
+        box.open()
+
+    def _show_warning(self, title, text):
+        """Window-modal warning that returns immediately (no nested loop)."""
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Icon.Warning)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setWindowModality(Qt.WindowModality.WindowModal)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.open()
+
+    def _ask_reset_options(self, on_answer):
         """Ask whether to reset all scrape options/models to defaults.
-        Returns True if the user chose to reset, False otherwise."""
-        reply = QMessageBox.question(
-            self,
+        on_answer(bool) receives True if the user chose to reset."""
+        self._ask_yes_no(
             "Reset options?",
             "Do you want to reset all scrape options and selected models\n"
             "back to their defaults?\n\n"
             "Yes = start fresh (like opening the GUI for the first time)\n"
             "No = keep your current selections",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            on_answer,
         )
-        return reply == QMessageBox.StandardButton.Yes
 
     def _reset_all_pages(self):
         """Reset action, area, and model pages to their defaults,
         and clear the table/progress panel so the next scrape starts fresh."""
-        main_window = self.window()
         for attr in ("action_page", "area_page", "model_page"):
-            page = getattr(main_window, attr, None)
+            page = self._main_attr(attr)
             if page and hasattr(page, "reset_to_defaults"):
                 try:
                     page.reset_to_defaults()
@@ -577,6 +770,7 @@ class TablePage(QWidget):
                     pass
         # Clear the table and progress panel so old results don't linger
         try:
+            self._discard_pending_rows()
             self.data_table.clear_all()
         except Exception:
             pass
@@ -590,6 +784,7 @@ class TablePage(QWidget):
             pass
         try:
             self.row_count_label.setText("0 rows")
+            self._last_row_counts = (0, 0)
         except Exception:
             pass
         try:
@@ -597,6 +792,7 @@ class TablePage(QWidget):
         except Exception:
             pass
 
+    @pyqtSlot()
     def _on_open_downloads_folder(self):
         """Open the configured save_location in the system file manager."""
         try:
@@ -609,8 +805,7 @@ class TablePage(QWidget):
             folder = ""
 
         if not folder:
-            QMessageBox.warning(
-                self,
+            self._show_warning(
                 "No Download Folder",
                 "No save location is configured.\n"
                 "Set one in Configuration → File Options → Save Location.",
@@ -619,8 +814,7 @@ class TablePage(QWidget):
 
         folder = os.path.expandvars(os.path.expanduser(folder))
         if not os.path.isdir(folder):
-            QMessageBox.warning(
-                self,
+            self._show_warning(
                 "Folder Not Found",
                 f"The configured download folder does not exist:\n{folder}",
             )
@@ -628,40 +822,57 @@ class TablePage(QWidget):
 
         QDesktopServices.openUrl(QUrl.fromLocalFile(folder))
 
+    @pyqtSlot()
     def _on_new_scrape(self):
         """Navigate back to the action page to start a new scrape."""
         # If a scrape is in progress, confirm cancellation.
         if self._scrape_active:
-            reply = QMessageBox.question(
-                self,
+            self._ask_yes_no(
                 "Cancel current scrape?",
                 "Content is currently being scraped.\n\n"
                 "Cancel the current scrape and return to the beginning?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                self._on_cancel_scrape_answered,
             )
-            if reply != QMessageBox.StandardButton.Yes:
-                return
-            # Ask about resetting now, before cancellation begins
-            self._pending_reset = self._ask_reset_options()
-            try:
-                app_signals.cancel_scrape_requested.emit()
-            except Exception:
-                pass
-            # Don't navigate immediately; wait for scraping_finished so the UI
-            # doesn't get stuck disabled while cancellation is still in flight.
-            self._pending_new_scrape_nav = True
-            try:
-                self.start_scraping_btn.setText("Cancelling...")
-                self.start_scraping_btn.setEnabled(False)
-            except Exception:
-                pass
-            try:
-                self.daemon_status_label.setText("Cancelling current scrape...")
-                self.daemon_status_label.show()
-            except Exception:
-                pass
             return
+        self._start_new_scrape_idle()
 
+    def _on_cancel_scrape_answered(self, confirmed):
+        if not confirmed:
+            return
+        if not self._scrape_active:
+            # The scrape finished while the dialog was open.
+            self._start_new_scrape_idle()
+            return
+        # Ask about resetting now, before cancellation begins
+        self._ask_reset_options(self._on_cancel_reset_answered)
+
+    def _on_cancel_reset_answered(self, reset):
+        if not self._scrape_active:
+            # The scrape finished while the dialog was open.
+            self._on_idle_reset_answered(reset)
+            return
+        self._pending_reset = reset
+        try:
+            app_signals.cancel_scrape_requested.emit()
+        except Exception:
+            pass
+        # Don't navigate immediately; wait for scraping_finished so the UI
+        # doesn't get stuck disabled while cancellation is still in flight.
+        self._pending_new_scrape_nav = True
+        try:
+            self.start_scraping_btn.setText("Cancelling...")
+            self.start_scraping_btn.setEnabled(False)
+        except Exception:
+            pass
+        try:
+            self._drop_pending_daemon_text()
+            self.daemon_status_label.setText("Cancelling current scrape...")
+            self.daemon_status_label.show()
+        except Exception:
+            pass
+
+    def _start_new_scrape_idle(self):
+        """New Scrape flow when nothing is running."""
         # If daemon mode is active, stop it when the user starts a new workflow.
         try:
             if self.stop_daemon_btn.isVisible():
@@ -670,49 +881,113 @@ class TablePage(QWidget):
             pass
 
         # Ask about resetting options
-        if self._ask_reset_options():
-            self._reset_all_pages()
+        self._ask_reset_options(self._on_idle_reset_answered)
 
+    def _on_idle_reset_answered(self, reset):
+        """Finish the idle New Scrape flow once the reset question is answered."""
+        if reset:
+            self._reset_all_pages()
         self._reset_scrape_controls()
         self._navigate_to_action_page()
 
     @pyqtSlot(int)
     def _on_cart_count_changed(self, count):
-        self.cart_label.setText(f"Cart: {count} items")
+        self.cart_label.setText(_cart_label_text(count))
+
+    def _emit_status(self, text):
+        """Emit status_message unless the status bar already shows *text*.
+
+        Row loads/appends repeat the same "N total items" while the count
+        plateaus; re-sending it would only re-layout the status bar.
+        """
+        bar = self._main_attr("status_bar")
+        if bar is not None and bar.currentMessage() == text:
+            return
+        app_signals.status_message.emit(text)
 
     @pyqtSlot(str, str)
     def _on_cell_filter_requested(self, col_name, value):
-        """When user right-clicks a cell to filter by that value."""
-        self.sidebar.update_field(col_name, value)
-        self._on_filter()
+        """When user right-clicks a cell to filter by that value.
+
+        Requests arriving within 50 ms are merged (last value per column
+        wins) and applied with a single filter pass.
+        """
+        self._pending_cell_filters[col_name] = value
+        self._cell_filter_timer.start()
 
-    def _update_row_count(self):
-        count = self.data_table.rowCount()
-        total = len(self.data_table._raw_data)
-        if count == total:
-            self.row_count_label.setText(f"{count} rows")
+    def _flush_pending_cell_filters(self):
+        pending = self._pending_cell_filters
+        if not pending:
+            return
+        self._pending_cell_filters = {}
+        sidebar = self.sidebar
+        sidebar.setUpdatesEnabled(False)
+        self.data_table.setUpdatesEnabled(False)
+        try:
+            for col_name, value in pending.items():
+                sidebar.update_field(col_name, value)
+            self._on_filter()
+        finally:
+            self.data_table.setUpdatesEnabled(True)
+            sidebar.setUpdatesEnabled(True)
+
+    @pyqtSlot(int, int)
+    def _on_totals(self, visible, total):
+        counts = (visible, total)
+        if counts == self._last_row_counts:
+            return
+        self._last_row_counts = counts
+        if visible == total:
+            self.row_count_label.setText(f"{visible} rows")
         else:
-            self.row_count_label.setText(f"{count} / {total} rows (filtered)")
+            self.row_count_label.setText(f"{visible} / {total} rows (filtered)")
 
     def load_data(self, table_data):
         """Load table data from the scraper pipeline (replaces existing)."""
         if not table_data:
             return
-        if isinstance(table_data[0], dict):
-            self.data_table.load_data(table_data)
-        else:
-            self.data_table.load_data(table_data[1:])
-        self._update_row_count()
-        app_signals.status_message.emit(
-            f"Loaded {len(self.data_table._raw_data)} items"
-        )
+        # Buffered appends predate this load and would be replaced by it
+        self._discard_pending_rows()
+        rows = table_data if isinstance(table_data[0], dict) else table_data[1:]
+        self._hold_paint_while_hidden()
+        self.data_table.load_data(rows)
+        self._emit_status(f"Loaded {self.data_table.raw_count} items")
 
     def append_data(self, table_data):
-        """Append new rows to the table (for incremental per-user updates)."""
+        """Append new rows to the table (for incremental per-user updates).
+
+        Rows are buffered and applied in one batch when the append timer
+        fires, so back-to-back batches cost a single table update.
+        """
         if not table_data:
             return
-        self.data_table.append_data(table_data)
-        self._update_row_count()
-        app_signals.status_message.emit(
-            f"{len(self.data_table._raw_data)} total items"
-        )
+        self._append_pending.extend(table_data)
+        if not self._append_timer.isActive():
+            self._append_timer.start()
+
+    def _hold_paint_while_hidden(self):
+        """Keep the data table from repainting until showEvent re-enables it.
+
+        Rows always go straight into the table, even while the page is
+        hidden, so cell updates aimed at them are never lost.
+        """
+        if not self.isVisible():
+            self.data_table.setUpdatesEnabled(False)
+
+    @pyqtSlot()
+    def _flush_pending_rows(self):
+        if not self._append_pending:
+            return
+        rows = self._append_pending
+        self._append_pending = []
+        self.data_table.setUpdatesEnabled(False)
+        try:
+            self.data_table.append_data(rows)
+        finally:
+            self.data_table.setUpdatesEnabled(self.isVisible())
+        self._emit_status(f"{self.data_table.raw_count} total items")
+
+    def _discard_pending_rows(self):
+        """Drop buffered rows (the table is about to be cleared/replaced)."""
+        self._append_timer.stop()
+        self._append_pending = []
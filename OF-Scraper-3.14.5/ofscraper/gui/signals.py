@@ -14,18 +14,20 @@ class AppSignals(QObject):
     areas_selected = pyqtSignal(list)  # list of area strings
     scrape_paid_toggled = pyqtSignal(bool)
     scrape_labels_toggled = pyqtSignal(bool)
-    advanced_scrape_configured = pyqtSignal(object)  # dict of advanced options
+    advanced_scrape_configured = pyqtSignal(bool, bool, bool, bool)  # allow_dupe_downloads, rescrape_all, delete_model_db, delete_downloads
     discord_configured = pyqtSignal(str)   # discord level: "OFF", "LOW", or "NORMAL"
     msg_check_include_free_toggled = pyqtSignal(str)  # "paid_only" | "free_only" | "all"
 
-    # Data loading
+    # Data loading. Row lists are declared as object so PyQt hands the
+    # Python list across threads as-is instead of converting every row dict
+    # to and from a QVariantList/QVariantMap.
     data_loading_started = pyqtSignal()
-    data_loading_finished = pyqtSignal(list)  # table data rows (appended)
-    data_replace = pyqtSignal(list)           # table data rows (replaces all existing rows)
+    data_loading_finished = pyqtSignal(object)  # list of table data rows (appended)
+    data_replace = pyqtSignal(object)           # list of table data rows (replaces all existing rows)
     data_loading_error = pyqtSignal(str)  # error message
 
     # Table / Downloads
-    downloads_queued = pyqtSignal(list)  # list of row data to download
+    downloads_queued = pyqtSignal(object)  # list of row data to download
     download_cart_updated = pyqtSignal(int)  # count of items in cart
 
     # Progress
@@ -38,9 +40,11 @@ class AppSignals(QObject):
 
     # Cell updates from download process
     cell_update = pyqtSignal(str, str, str)  # row_key, column_name, new_value
+    cell_updates_batch = pyqtSignal(object)  # list of (row_key, column_name, new_value)
 
     # Log
     log_message = pyqtSignal(str, str)  # level, message
+    log_batch = pyqtSignal(object)  # list of (level, message) tuples
 
     # Scraping lifecycle
     scraping_finished = pyqtSignal()  # emitted when scraper thread completes
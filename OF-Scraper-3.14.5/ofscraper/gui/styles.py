@@ -1,25 +1,63 @@
+import logging
 import os
+import re
+import sys
+from types import MappingProxyType
 
 _ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
+# Forward-slash prefix for QSS url(); asset names are bare filenames
+_ASSETS_DIR_NORM = _ASSETS_DIR.replace("\\", "/") + "/"
 
 
 def _asset_path(filename):
     """Return a forward-slash path to an asset file (required by Qt QSS url())."""
-    return os.path.join(_ASSETS_DIR, filename).replace("\\", "/")
+    return _ASSETS_DIR_NORM + filename
+
+
+# Indicator icon paths never change at runtime; resolve them once.
+_CHECK_SVG = _asset_path("check.svg")
+_RADIO_SVG = _asset_path("radio.svg")
+
+
+def _minify(qss):
+    """Drop comments and insignificant whitespace so Qt parses less text."""
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.S)
+    qss = re.sub(r"\s+", " ", qss)
+    qss = re.sub(r"\s*([{};,])\s*", r"\1", qss)
+    # Only "prop: value" colons carry a space; selector pseudo-states don't
+    qss = re.sub(r":\s+", ":", qss)
+    return qss.strip()
+
+
+def _render(theme):
+    """Fill the shared QSS template for *theme* ("dark" or "light").
+
+    Placeholders are %(name)s keys taken from COLORS[theme], the QSS-only
+    shades in _QSS_COLORS[theme] and the indicator icon paths, so CSS
+    braces need no escaping; a literal percent sign in the template must be
+    written as %%. The template is minified first so the substituted file
+    paths are never touched.
+    """
+    values = dict(COLORS[theme], **_QSS_COLORS[theme])
+    values["check_svg"] = _CHECK_SVG
+    values["radio_svg"] = _RADIO_SVG
+    return _minify(_QSS_TEMPLATE) % values
 
 
 def get_dark_theme_qss():
     """Return the dark-theme QSS with resolved asset paths for indicator icons."""
-    check = _asset_path("check.svg")
-    radio = _asset_path("radio.svg")
-    return _DARK_THEME_TEMPLATE.format(check_svg=check, radio_svg=radio)
+    return _DARK_QSS
 
 
 def get_light_theme_qss():
-    """Return the light-theme QSS (Catppuccin Latte) with resolved asset paths."""
-    check = _asset_path("check.svg")
-    radio = _asset_path("radio.svg")
-    return _LIGHT_THEME_TEMPLATE.format(check_svg=check, radio_svg=radio)
+    """Return the light-theme QSS (Catppuccin Latte) with resolved asset paths.
+
+    Rendered on first use, so dark-only sessions never build it.
+    """
+    global _LIGHT_QSS
+    if _LIGHT_QSS is None:
+        _LIGHT_QSS = _render("light")
+    return _LIGHT_QSS
 
 
 # Sidebar background colors used by main_window.py (kept in sync with QSS)
@@ -39,8 +77,22 @@ def is_dark_theme():
 
 
 def set_theme(dark):
-    global _is_dark
+    """Select the dark or light palette. Return False if it was already active."""
+    global _is_dark, _active_palette
+    dark = bool(dark)
+    if dark == _is_dark:
+        return False
     _is_dark = dark
+    _active_palette = COLORS["dark" if dark else "light"]
+    return True
+
+
+def current_theme_key():
+    """Return a hashable key for the active palette ("dark" or "light").
+
+    Suitable as a cache key for QSS built from COLORS.
+    """
+    return "dark" if _is_dark else "light"
 
 
 def themed(dark_val, light_val):
@@ -95,796 +147,79 @@ COLORS = {
 }
 
 
+# Hex strings contain "#", so CPython never interns them on its own; doing it
+# here makes a repeated color (e.g. surface0/sep) the same object everywhere.
+# The palettes are then frozen: they are shared read-only by every page and
+# by cached stylesheets keyed on the theme name.
+COLORS = MappingProxyType({
+    theme: MappingProxyType(
+        {name: sys.intern(value) for name, value in palette.items()}
+    )
+    for theme, palette in COLORS.items()
+})
+
+# Palette for the current theme; swapped by set_theme() so c() needs no branch
+_active_palette = COLORS["dark"]
+
+
 def c(name):
     """Get a named color for the current theme. E.g. c('blue') -> '#89b4fa' or '#1e66f5'."""
-    palette = COLORS["dark"] if _is_dark else COLORS["light"]
-    return palette.get(name, "#ff00ff")
-
-
-_DARK_THEME_TEMPLATE = """
-/* ==================== Global ==================== */
-QWidget {{
-    background-color: #1e1e2e;
-    color: #cdd6f4;
-    font-family: "Segoe UI", "Consolas", monospace;
-    font-size: 13px;
-}}
-
-/* ==================== Main Window ==================== */
-QMainWindow {{
-    background-color: #1e1e2e;
-}}
-
-QMainWindow::separator {{
-    background-color: #313244;
-    width: 1px;
-    height: 1px;
-}}
-
-/* ==================== Menu / Toolbar ==================== */
-QMenuBar {{
-    background-color: #181825;
-    border-bottom: 1px solid #313244;
-}}
-
-QMenuBar::item:selected {{
-    background-color: #313244;
-}}
-
-QMenu {{
-    background-color: #1e1e2e;
-    border: 1px solid #313244;
-}}
-
-QMenu::item:selected {{
-    background-color: #313244;
-}}
-
-QToolBar {{
-    background-color: #181825;
-    border-bottom: 1px solid #313244;
-    spacing: 4px;
-    padding: 2px;
-}}
-
-/* ==================== Buttons ==================== */
-QPushButton {{
-    background-color: #313244;
-    color: #cdd6f4;
-    border: 1px solid #45475a;
-    border-radius: 6px;
-    padding: 6px 16px;
-    min-height: 24px;
-}}
-
-QPushButton:hover {{
-    background-color: #45475a;
-    border-color: #89b4fa;
-}}
-
-QPushButton:pressed {{
-    background-color: #585b70;
-}}
-
-QPushButton:disabled {{
-    background-color: #1e1e2e;
-    color: #7f849c;
-    border-color: #313244;
-}}
-
-QPushButton#primary_button, QPushButton[primary="true"] {{
-    background-color: #89b4fa;
-    color: #1e1e2e;
-    border: none;
-    font-weight: bold;
-}}
-
-QPushButton#primary_button:hover, QPushButton[primary="true"]:hover {{
-    background-color: #74c7ec;
-}}
-
-QPushButton#danger_button, QPushButton[danger="true"] {{
-    background-color: #f38ba8;
-    color: #1e1e2e;
-    border: none;
-}}
-
-QPushButton#danger_button:hover, QPushButton[danger="true"]:hover {{
-    background-color: #eba0ac;
-}}
-
-/* ==================== Nav Buttons ==================== */
-QPushButton.nav_button {{
-    background-color: transparent;
-    border: none;
-    border-radius: 8px;
-    padding: 10px 16px;
-    text-align: left;
-    font-size: 14px;
-    min-height: 32px;
-}}
-
-QPushButton.nav_button:hover {{
-    background-color: #313244;
-}}
-
-QPushButton.nav_button:checked {{
-    background-color: #313244;
-    color: #89b4fa;
-    border-left: 3px solid #89b4fa;
-}}
-
-/* ==================== Inputs ==================== */
-QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox, QDateEdit, QTimeEdit {{
-    background-color: #313244;
-    color: #cdd6f4;
-    border: 1px solid #45475a;
-    border-radius: 4px;
-    padding: 4px 8px;
-    min-height: 24px;
-    selection-background-color: #89b4fa;
-    selection-color: #1e1e2e;
-}}
-
-QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus,
-QComboBox:focus, QDateEdit:focus, QTimeEdit:focus {{
-    border-color: #89b4fa;
-}}
-
-QLineEdit:disabled, QSpinBox:disabled, QDoubleSpinBox:disabled {{
-    background-color: #1e1e2e;
-    color: #7f849c;
-}}
-
-QComboBox::drop-down {{
-    border: none;
-    width: 24px;
-}}
-
-QComboBox QAbstractItemView {{
-    background-color: #313244;
-    border: 1px solid #45475a;
-    selection-background-color: #89b4fa;
-    selection-color: #1e1e2e;
-}}
-
-/* ==================== Checkboxes & Radio ==================== */
-QCheckBox, QRadioButton {{
-    spacing: 6px;
-    color: #cdd6f4;
-}}
-
-QCheckBox::indicator, QRadioButton::indicator {{
-    width: 18px;
-    height: 18px;
-    border: 2px solid #45475a;
-    background-color: #313244;
-}}
-
-QCheckBox::indicator {{
-    border-radius: 3px;
-}}
-
-QRadioButton::indicator {{
-    border-radius: 9px;
-}}
-
-QCheckBox::indicator:checked {{
-    background-color: #89b4fa;
-    border-color: #89b4fa;
-    image: url({check_svg});
-}}
-
-QRadioButton::indicator:checked {{
-    background-color: #89b4fa;
-    border-color: #89b4fa;
-    image: url({radio_svg});
-}}
-
-QCheckBox::indicator:hover, QRadioButton::indicator:hover {{
-    border-color: #89b4fa;
-}}
-
-/* ==================== Tables ==================== */
-QTableView, QTreeView, QListView, QListWidget {{
-    background-color: #1e1e2e;
-    alternate-background-color: #181825;
-    border: 1px solid #313244;
-    gridline-color: #313244;
-    selection-background-color: #313244;
-    selection-color: #cdd6f4;
-}}
-
-QTableView::item:selected, QTreeView::item:selected,
-QListView::item:selected, QListWidget::item:selected {{
-    background-color: #313244;
-}}
-
-QTableView::item:hover, QListWidget::item:hover {{
-    background-color: #2a2a3e;
-}}
-
-QHeaderView::section {{
-    background-color: #181825;
-    color: #cdd6f4;
-    border: none;
-    border-right: 1px solid #313244;
-    border-bottom: 1px solid #313244;
-    padding: 6px 8px;
-    font-weight: bold;
-}}
-
-QHeaderView::section:hover {{
-    background-color: #313244;
-    color: #89b4fa;
-}}
-
-/* ==================== Scroll Bars ==================== */
-QScrollBar:vertical {{
-    background-color: #1e1e2e;
-    width: 10px;
-    border: none;
-}}
-
-QScrollBar::handle:vertical {{
-    background-color: #45475a;
-    border-radius: 5px;
-    min-height: 30px;
-}}
-
-QScrollBar::handle:vertical:hover {{
-    background-color: #585b70;
-}}
-
-QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-    height: 0px;
-}}
-
-QScrollBar:horizontal {{
-    background-color: #1e1e2e;
-    height: 10px;
-    border: none;
-}}
-
-QScrollBar::handle:horizontal {{
-    background-color: #45475a;
-    border-radius: 5px;
-    min-width: 30px;
-}}
-
-QScrollBar::handle:horizontal:hover {{
-    background-color: #585b70;
-}}
-
-QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-    width: 0px;
-}}
-
-/* ==================== Tab Widget ==================== */
-QTabWidget::pane {{
-    border: 1px solid #313244;
-    background-color: #1e1e2e;
-}}
-
-QTabBar::tab {{
-    background-color: #181825;
-    color: #9399b2;
-    border: 1px solid #313244;
-    border-bottom: none;
-    padding: 8px 16px;
-    margin-right: 2px;
-    border-top-left-radius: 4px;
-    border-top-right-radius: 4px;
-}}
-
-QTabBar::tab:selected {{
-    background-color: #1e1e2e;
-    color: #89b4fa;
-    border-bottom: 2px solid #89b4fa;
-}}
-
-QTabBar::tab:hover:!selected {{
-    background-color: #313244;
-    color: #cdd6f4;
-}}
-
-/* ==================== Group Box ==================== */
-QGroupBox {{
-    border: 1px solid #313244;
-    border-radius: 6px;
-    margin-top: 12px;
-    padding-top: 16px;
-    font-weight: bold;
-}}
-
-QGroupBox::title {{
-    subcontrol-origin: margin;
-    subcontrol-position: top left;
-    padding: 0 6px;
-    color: #cdd6f4;
-}}
-
-/* ==================== Progress Bar ==================== */
-QProgressBar {{
-    background-color: #313244;
-    border: none;
-    border-radius: 4px;
-    text-align: center;
-    min-height: 20px;
-    color: #cdd6f4;
-}}
-
-QProgressBar::chunk {{
-    background-color: #89b4fa;
-    border-radius: 4px;
-}}
-
-/* ==================== Splitter ==================== */
-QSplitter::handle {{
-    background-color: #313244;
-}}
-
-QSplitter::handle:hover {{
-    background-color: #89b4fa;
-}}
-
-/* ==================== Labels ==================== */
-QLabel {{
-    color: #cdd6f4;
-    background-color: transparent;
-}}
-
-QLabel[heading="true"] {{
-    font-size: 18px;
-    font-weight: bold;
-    color: #cdd6f4;
-}}
-
-QLabel[subheading="true"] {{
-    font-size: 14px;
-    color: #bac2de;
-}}
-
-QLabel[muted="true"] {{
-    color: #9399b2;
-    font-size: 11px;
-}}
-
-/* ==================== Status Bar ==================== */
-QStatusBar {{
-    background-color: #181825;
-    border-top: 1px solid #313244;
-    color: #9399b2;
-}}
-
-/* ==================== Dialog ==================== */
-QDialog {{
-    background-color: #1e1e2e;
-}}
-
-/* ==================== Text Edit / Plain Text ==================== */
-QPlainTextEdit, QTextEdit {{
-    background-color: #181825;
-    color: #a6e3a1;
-    border: 1px solid #313244;
-    border-radius: 4px;
-    font-family: "Consolas", "Courier New", monospace;
-    font-size: 12px;
-    selection-background-color: #89b4fa;
-    selection-color: #1e1e2e;
-}}
-
-/* ==================== Tooltips ==================== */
-QToolTip {{
-    background-color: #313244;
-    color: #cdd6f4;
-    border: 1px solid #45475a;
-    padding: 4px;
-    border-radius: 4px;
-}}
-
-/* ==================== Frame ==================== */
-QFrame[frameShape="4"] {{
-    color: #313244;
-    max-height: 1px;
-}}
-
-QFrame[frameShape="5"] {{
-    color: #313244;
-    max-width: 1px;
-}}
-"""
-
-_LIGHT_THEME_TEMPLATE = """
-/* ==================== Global ==================== */
-QWidget {{
-    background-color: #eff1f5;
-    color: #11111b;
-    font-family: "Segoe UI", "Consolas", monospace;
-    font-size: 13px;
-}}
-
-/* ==================== Main Window ==================== */
-QMainWindow {{
-    background-color: #eff1f5;
-}}
-
-QMainWindow::separator {{
-    background-color: #ccd0da;
-    width: 1px;
-    height: 1px;
-}}
-
-/* ==================== Menu / Toolbar ==================== */
-QMenuBar {{
-    background-color: #e6e9ef;
-    border-bottom: 1px solid #ccd0da;
-}}
-
-QMenuBar::item:selected {{
-    background-color: #ccd0da;
-}}
-
-QMenu {{
-    background-color: #eff1f5;
-    border: 1px solid #ccd0da;
-}}
-
-QMenu::item:selected {{
-    background-color: #ccd0da;
-}}
-
-QToolBar {{
-    background-color: #e6e9ef;
-    border-bottom: 1px solid #ccd0da;
-    spacing: 4px;
-    padding: 2px;
-}}
-
-/* ==================== Buttons ==================== */
-QPushButton {{
-    background-color: #ccd0da;
-    color: #11111b;
-    border: 1px solid #bcc0cc;
-    border-radius: 6px;
-    padding: 6px 16px;
-    min-height: 24px;
-}}
-
-QPushButton:hover {{
-    background-color: #bcc0cc;
-    border-color: #1e66f5;
-}}
-
-QPushButton:pressed {{
-    background-color: #acb0be;
-}}
-
-QPushButton:disabled {{
-    background-color: #eff1f5;
-    color: #acb0be;
-    border-color: #ccd0da;
-}}
-
-QPushButton#primary_button, QPushButton[primary="true"] {{
-    background-color: #1e66f5;
-    color: #eff1f5;
-    border: none;
-    font-weight: bold;
-}}
-
-QPushButton#primary_button:hover, QPushButton[primary="true"]:hover {{
-    background-color: #2070ff;
-}}
-
-QPushButton#danger_button, QPushButton[danger="true"] {{
-    background-color: #d20f39;
-    color: #eff1f5;
-    border: none;
-}}
-
-QPushButton#danger_button:hover, QPushButton[danger="true"]:hover {{
-    background-color: #e33e5a;
-}}
-
-/* ==================== Nav Buttons ==================== */
-QPushButton.nav_button {{
-    background-color: transparent;
-    border: none;
-    border-radius: 8px;
-    padding: 10px 16px;
-    text-align: left;
-    font-size: 14px;
-    min-height: 32px;
-}}
-
-QPushButton.nav_button:hover {{
-    background-color: #ccd0da;
-}}
-
-QPushButton.nav_button:checked {{
-    background-color: #ccd0da;
-    color: #1e66f5;
-    border-left: 3px solid #1e66f5;
-}}
-
-/* ==================== Inputs ==================== */
-QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox, QDateEdit, QTimeEdit {{
-    background-color: #dce0e8;
-    color: #11111b;
-    border: 1px solid #bcc0cc;
-    border-radius: 4px;
-    padding: 4px 8px;
-    min-height: 24px;
-    selection-background-color: #1e66f5;
-    selection-color: #eff1f5;
-}}
-
-QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus,
-QComboBox:focus, QDateEdit:focus, QTimeEdit:focus {{
-    border-color: #1e66f5;
-}}
-
-QLineEdit:disabled, QSpinBox:disabled, QDoubleSpinBox:disabled {{
-    background-color: #eff1f5;
-    color: #6c6f85;
-}}
-
-QComboBox::drop-down {{
-    border: none;
-    width: 24px;
-}}
-
-QComboBox QAbstractItemView {{
-    background-color: #dce0e8;
-    border: 1px solid #bcc0cc;
-    selection-background-color: #1e66f5;
-    selection-color: #eff1f5;
-}}
-
-/* ==================== Checkboxes & Radio ==================== */
-QCheckBox, QRadioButton {{
-    spacing: 6px;
-    color: #11111b;
-}}
-
-QCheckBox::indicator, QRadioButton::indicator {{
-    width: 18px;
-    height: 18px;
-    border: 2px solid #bcc0cc;
-    background-color: #dce0e8;
-}}
-
-QCheckBox::indicator {{
-    border-radius: 3px;
-}}
-
-QRadioButton::indicator {{
-    border-radius: 9px;
-}}
-
-QCheckBox::indicator:checked {{
-    background-color: #1e66f5;
-    border-color: #1e66f5;
-    image: url({check_svg});
-}}
-
-QRadioButton::indicator:checked {{
-    background-color: #1e66f5;
-    border-color: #1e66f5;
-    image: url({radio_svg});
-}}
-
-QCheckBox::indicator:hover, QRadioButton::indicator:hover {{
-    border-color: #1e66f5;
-}}
-
-/* ==================== Tables ==================== */
-QTableView, QTreeView, QListView, QListWidget {{
-    background-color: #eff1f5;
-    alternate-background-color: #e6e9ef;
-    border: 1px solid #ccd0da;
-    gridline-color: #ccd0da;
-    selection-background-color: #ccd0da;
-    selection-color: #4c4f69;
-}}
-
-QTableView::item:selected, QTreeView::item:selected,
-QListView::item:selected, QListWidget::item:selected {{
-    background-color: #ccd0da;
-}}
-
-QTableView::item:hover, QListWidget::item:hover {{
-    background-color: #dce0e8;
-}}
-
-QHeaderView::section {{
-    background-color: #e6e9ef;
-    color: #2c2f47;
-    border: none;
-    border-right: 1px solid #ccd0da;
-    border-bottom: 1px solid #ccd0da;
-    padding: 6px 8px;
-    font-weight: bold;
-}}
-
-QHeaderView::section:hover {{
-    background-color: #ccd0da;
-    color: #1e66f5;
-}}
-
-/* ==================== Scroll Bars ==================== */
-QScrollBar:vertical {{
-    background-color: #eff1f5;
-    width: 10px;
-    border: none;
-}}
-
-QScrollBar::handle:vertical {{
-    background-color: #bcc0cc;
-    border-radius: 5px;
-    min-height: 30px;
-}}
-
-QScrollBar::handle:vertical:hover {{
-    background-color: #acb0be;
-}}
-
-QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-    height: 0px;
-}}
-
-QScrollBar:horizontal {{
-    background-color: #eff1f5;
-    height: 10px;
-    border: none;
-}}
-
-QScrollBar::handle:horizontal {{
-    background-color: #bcc0cc;
-    border-radius: 5px;
-    min-width: 30px;
-}}
-
-QScrollBar::handle:horizontal:hover {{
-    background-color: #acb0be;
-}}
-
-QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-    width: 0px;
-}}
-
-/* ==================== Tab Widget ==================== */
-QTabWidget::pane {{
-    border: 1px solid #ccd0da;
-    background-color: #eff1f5;
-}}
-
-QTabBar::tab {{
-    background-color: #e6e9ef;
-    color: #4c4f69;
-    border: 1px solid #ccd0da;
-    border-bottom: none;
-    padding: 8px 16px;
-    margin-right: 2px;
-    border-top-left-radius: 4px;
-    border-top-right-radius: 4px;
-}}
-
-QTabBar::tab:selected {{
-    background-color: #eff1f5;
-    color: #1e66f5;
-    border-bottom: 2px solid #1e66f5;
-}}
-
-QTabBar::tab:hover:!selected {{
-    background-color: #ccd0da;
-    color: #11111b;
-}}
-
-/* ==================== Group Box ==================== */
-QGroupBox {{
-    border: 1px solid #ccd0da;
-    border-radius: 6px;
-    margin-top: 12px;
-    padding-top: 16px;
-    font-weight: bold;
-}}
-
-QGroupBox::title {{
-    subcontrol-origin: margin;
-    subcontrol-position: top left;
-    padding: 0 6px;
-    color: #2c2f47;
-}}
-
-/* ==================== Progress Bar ==================== */
-QProgressBar {{
-    background-color: #ccd0da;
-    border: none;
-    border-radius: 4px;
-    text-align: center;
-    min-height: 20px;
-    color: #11111b;
-}}
-
-QProgressBar::chunk {{
-    background-color: #1e66f5;
-    border-radius: 4px;
-}}
-
-/* ==================== Splitter ==================== */
-QSplitter::handle {{
-    background-color: #ccd0da;
-}}
-
-QSplitter::handle:hover {{
-    background-color: #1e66f5;
-}}
-
-/* ==================== Labels ==================== */
-QLabel {{
-    color: #11111b;
-    background-color: transparent;
-}}
-
-QLabel[heading="true"] {{
-    font-size: 18px;
-    font-weight: bold;
-    color: #11111b;
-}}
-
-QLabel[subheading="true"] {{
-    font-size: 14px;
-    color: #3c3f58;
-}}
-
-QLabel[muted="true"] {{
-    color: #4c4f69;
-    font-size: 11px;
-}}
-
-/* ==================== Status Bar ==================== */
-QStatusBar {{
-    background-color: #e6e9ef;
-    border-top: 1px solid #ccd0da;
-    color: #4c4f69;
-}}
-
-/* ==================== Dialog ==================== */
-QDialog {{
-    background-color: #eff1f5;
-}}
-
-/* ==================== Text Edit / Plain Text ==================== */
-QPlainTextEdit, QTextEdit {{
-    background-color: #ffffff;
-    color: #11111b;
-    border: 1px solid #ccd0da;
-    border-radius: 4px;
-    font-family: "Consolas", "Courier New", monospace;
-    font-size: 12px;
-    selection-background-color: #1e66f5;
-    selection-color: #eff1f5;
-}}
-
-/* ==================== Tooltips ==================== */
-QToolTip {{
-    background-color: #ccd0da;
-    color: #11111b;
-    border: 1px solid #bcc0cc;
-    padding: 4px;
-    border-radius: 4px;
-}}
-
-/* ==================== Frame ==================== */
-QFrame[frameShape="4"] {{
-    color: #ccd0da;
-    max-height: 1px;
-}}
-
-QFrame[frameShape="5"] {{
-    color: #ccd0da;
-    max-width: 1px;
-}}
-"""
+    try:
+        return _active_palette[name]
+    except KeyError:
+        return "#ff00ff"
+
+
+# Shades the stylesheet needs beyond the shared palette. Kept out of COLORS so
+# c() only ever hands out the named palette colors.
+_QSS_COLORS = {
+    "dark": {
+        "primary_hover": "#74c7ec",
+        "danger_hover": "#eba0ac",
+        "button_disabled_text": "#7f849c",
+        "input_bg": "#313244",
+        "input_disabled_text": "#7f849c",
+        "row_hover": "#2a2a3e",
+        "selection_text": "#cdd6f4",
+        "header_text": "#cdd6f4",
+        "subheading": "#bac2de",
+        "dim_text": "#9399b2",
+        "log_bg": "#181825",
+        "log_text": "#a6e3a1",
+    },
+    "light": {
+        "primary_hover": "#2070ff",
+        "danger_hover": "#e33e5a",
+        "button_disabled_text": "#acb0be",
+        "input_bg": "#dce0e8",
+        "input_disabled_text": "#6c6f85",
+        "row_hover": "#dce0e8",
+        "selection_text": "#4c4f69",
+        "header_text": "#2c2f47",
+        "subheading": "#3c3f58",
+        "dim_text": "#4c4f69",
+        "log_bg": "#ffffff",
+        "log_text": "#11111b",
+    },
+}
+
+
+# One structure for both themes, kept in assets/theme.qss; _render() fills in
+# the colors. A missing file (e.g. a partial install) leaves the app unstyled
+# rather than failing at import.
+_QSS_PATH = os.path.join(_ASSETS_DIR, "theme.qss")
+try:
+    with open(_QSS_PATH, encoding="utf-8") as _f:
+        _QSS_TEMPLATE = _f.read()
+    del _f
+except OSError as e:
+    logging.getLogger("shared").error(
+        f"Could not read GUI stylesheet {_QSS_PATH}: {e}; using the default Qt style"
+    )
+    _QSS_TEMPLATE = ""
+
+
+# Final stylesheets: dark (the default) is rendered at import, light lazily
+# by get_light_theme_qss()
+_DARK_QSS = _render("dark")
+_LIGHT_QSS = None
@@ -13,41 +13,99 @@ Currently stored keys:
 
 import json
 import logging
+import os
+import tempfile
+import threading
 from pathlib import Path
 
 log = logging.getLogger("shared")
 
 _SETTINGS_FILE = "gui_settings.json"
 
+# Parsed contents of the file, loaded on first use and kept in step with
+# every successful save, so reads never go back to disk
+_cache = None
+_cache_lock = threading.Lock()
+
+# Resolved location of the file. Only a successful lookup is remembered; the
+# fallback is retried so an early call can't pin the wrong location.
+_resolved_path = None
+
 
 def _settings_path() -> Path:
+    global _resolved_path
+    if _resolved_path is not None:
+        return _resolved_path
     try:
         import ofscraper.utils.paths.common as common_paths
-        return common_paths.get_config_home() / _SETTINGS_FILE
+        _resolved_path = common_paths.get_config_home() / _SETTINGS_FILE
+        return _resolved_path
     except Exception:
         return Path.home() / ".config" / "ofscraper" / _SETTINGS_FILE
 
 
-def load_gui_settings() -> dict:
-    """Load gui_settings.json and return the contents as a dict.
-    Returns an empty dict if the file doesn't exist or can't be parsed."""
-    p = _settings_path()
-    if p.exists():
-        try:
-            with open(p, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            log.warning(f"[GUI] Could not read {_SETTINGS_FILE}: {e}")
+def _read_settings() -> dict:
+    try:
+        # One read and one parse; a missing file is the normal first run
+        return json.loads(_settings_path().read_bytes())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log.warning(f"[GUI] Could not read {_SETTINGS_FILE}: {e}")
     return {}
 
 
+def _cached_settings() -> dict:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = _read_settings()
+        return _cache
+
+
+def load_gui_settings() -> dict:
+    """Return the contents of gui_settings.json as a dict.
+    Returns an empty dict if the file doesn't exist or can't be parsed.
+
+    The file is read once; later calls return a copy of the cached contents,
+    which callers may modify and pass to save_gui_settings()."""
+    return dict(_cached_settings())
+
+
+def get_gui_setting(key, default=None):
+    """Return a single setting without copying the whole dict."""
+    return _cached_settings().get(key, default)
+
+
 def save_gui_settings(settings: dict) -> bool:
-    """Write *settings* dict to gui_settings.json.  Returns True on success."""
+    """Write *settings* dict to gui_settings.json.  Returns True on success.
+
+    Nothing is written when *settings* matches what is already saved."""
+    global _cache
+    if settings == _cached_settings():
+        return True
     p = _settings_path()
     try:
         p.parent.mkdir(parents=True, exist_ok=True)
-        with open(p, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=4)
+        data = json.dumps(settings, indent=4).encode("utf-8")
+        # Write a sibling temp file and swap it in, so a crash mid-write
+        # can never leave a truncated gui_settings.json behind
+        tmp_name = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=p.parent, prefix=f".{_SETTINGS_FILE}.", delete=False
+            ) as tf:
+                tmp_name = tf.name
+                tf.write(data)
+                tf.flush()
+                os.fsync(tf.fileno())
+            os.replace(tmp_name, p)
+        except OSError:
+            if tmp_name and os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        with _cache_lock:
+            _cache = dict(settings)
         log.debug(f"[GUI] Saved {_SETTINGS_FILE} -> {p}")
         return True
     except Exception as e:
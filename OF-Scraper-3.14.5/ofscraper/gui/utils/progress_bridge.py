@@ -1,56 +1,250 @@
+import copy
 import logging
-import time
+import threading
+from collections import deque
+
+from PyQt6.QtCore import QMetaObject, QObject, Qt, QTimer, pyqtSlot
 
 from ofscraper.gui.signals import app_signals
 
 log = logging.getLogger("shared")
 
-_task_start_times = {}
+# Per-chunk progress from download threads is summed here and handed to the
+# GUI at most once per frame (~30 Hz) instead of one signal per callback
+_FLUSH_INTERVAL_MS = 33
+_pending_lock = threading.Lock()
+_pending_advance = {}  # task_id -> advance summed since the last flush
+_pending_cells = {}  # (row_key, column_name) -> latest value
+_pending_overall = None  # latest (completed, total)
+_pending_bytes = None  # latest total bytes
+_flush_scheduled = False
+
+# GUILogHandler buffering: lines kept while the GUI catches up, how often the
+# buffer is drained, and how many lines one drain may hand over
+_LOG_BUFFER_MAX = 5000
+_LOG_DRAIN_INTERVAL_MS = 100
+_LOG_DRAIN_MAX = 500
+
+
+class _Coalescer(QObject):
+    """Runs *callback* on this object's thread once per burst of requests.
+
+    request() may be called from any thread; it queues a call to _schedule
+    here, which starts a single-shot timer, so the callback fires
+    *interval_ms* after the first request rather than once per request.
+    """
+
+    def __init__(self, interval_ms, callback):
+        super().__init__()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(callback)
+
+    def request(self):
+        # Posted straight to this object's event queue; no signal or
+        # connection list is involved
+        QMetaObject.invokeMethod(
+            self, "_schedule", Qt.ConnectionType.QueuedConnection
+        )
+
+    @pyqtSlot()
+    def _schedule(self):
+        if not self._timer.isActive():
+            self._timer.start()
+
+
+def _request_flush():
+    """Ask the GUI thread for a flush unless one is already pending.
+
+    Must be called with _pending_lock held; returns True if the caller
+    should call _batcher.request() once the lock is released.
+    """
+    global _flush_scheduled
+    if _flush_scheduled:
+        return False
+    _flush_scheduled = True
+    return True
+
+
+def _flush_pending():
+    """Emit everything buffered since the last flush (runs on the GUI thread)."""
+    global _pending_advance, _pending_cells, _pending_overall, _pending_bytes
+    global _flush_scheduled
+    with _pending_lock:
+        advances, _pending_advance = _pending_advance, {}
+        cells, _pending_cells = _pending_cells, {}
+        overall, _pending_overall = _pending_overall, None
+        total_bytes, _pending_bytes = _pending_bytes, None
+        _flush_scheduled = False
+    for task_id, advance in advances.items():
+        app_signals.progress_task_updated.emit(task_id, advance)
+    if overall is not None:
+        app_signals.overall_progress_updated.emit(*overall)
+    if total_bytes is not None:
+        app_signals.total_bytes_updated.emit(total_bytes)
+    if cells:
+        app_signals.cell_updates_batch.emit(
+            [(row_key, column_name, value) for (row_key, column_name), value in cells.items()]
+        )
+
+
+_batcher = _Coalescer(_FLUSH_INTERVAL_MS, _flush_pending)
 
 
 def add_download_task(task_id, total):
     """Mirror of updater.add_download_task — emits Qt signal."""
-    _task_start_times[task_id] = time.time()
     app_signals.progress_task_added.emit(str(task_id), total)
 
 
 def update_download_task(task_id, advance):
-    """Mirror of updater.increment — emits Qt signal."""
-    app_signals.progress_task_updated.emit(str(task_id), advance)
+    """Mirror of updater.increment — batched into the next progress flush."""
+    task_id = str(task_id)
+    with _pending_lock:
+        _pending_advance[task_id] = _pending_advance.get(task_id, 0) + advance
+        flush = _request_flush()
+    if flush:
+        _batcher.request()
 
 
 def remove_download_task(task_id):
     """Mirror of updater.remove_download_job_task — emits Qt signal."""
-    _task_start_times.pop(str(task_id), None)
-    app_signals.progress_task_removed.emit(str(task_id))
+    task_id = str(task_id)
+    with _pending_lock:
+        # The bar is going away; don't let a later flush advance it
+        _pending_advance.pop(task_id, None)
+    app_signals.progress_task_removed.emit(task_id)
 
 
 def update_overall_progress(completed, total):
-    """Update overall progress counts."""
-    app_signals.overall_progress_updated.emit(completed, total)
+    """Update overall progress counts (latest value wins per flush)."""
+    global _pending_overall
+    with _pending_lock:
+        _pending_overall = (completed, total)
+        flush = _request_flush()
+    if flush:
+        _batcher.request()
 
 
 def update_total_bytes(total_bytes):
-    """Update total bytes downloaded."""
-    app_signals.total_bytes_updated.emit(total_bytes)
+    """Update total bytes downloaded (latest value wins per flush)."""
+    global _pending_bytes
+    with _pending_lock:
+        _pending_bytes = total_bytes
+        flush = _request_flush()
+    if flush:
+        _batcher.request()
 
 
 def update_cell_status(row_key, column_name, value):
-    """Update a cell in the table (e.g., download_cart status)."""
-    app_signals.cell_update.emit(str(row_key), column_name, str(value))
+    """Update a cell in the table (e.g., download_cart status).
+
+    Only the latest value per cell is kept; the next flush hands all pending
+    cells to the table in a single cell_updates_batch.
+    """
+    with _pending_lock:
+        _pending_cells[(str(row_key), column_name)] = str(value)
+        flush = _request_flush()
+    if flush:
+        _batcher.request()
 
 
 def log_to_gui(level, message):
-    """Send a log message to the GUI console."""
-    app_signals.log_message.emit(level, message)
+    """Send a log message to the GUI console.
+
+    The line joins the same buffer as GUILogHandler records, so the console
+    shows direct lines and logged records in the order they happened.
+    """
+    _enqueue_log(None, (level, message))
+
+
+# Console lines, oldest first, as (handler, record) for GUILogHandler records
+# or (None, (level, message)) for lines sent through log_to_gui()
+_log_buf = deque(maxlen=_LOG_BUFFER_MAX)
+_log_lock = threading.Lock()
+_log_drain_scheduled = False
+
+
+def _enqueue_log(handler, item):
+    """Buffer one console line and make sure a drain is on its way."""
+    global _log_drain_scheduled
+    with _log_lock:
+        _log_buf.append((handler, item))
+        if _log_drain_scheduled:
+            return
+        _log_drain_scheduled = True
+    _log_drainer.request()
+
+
+def _drain_logs():
+    """Send up to _LOG_DRAIN_MAX buffered lines to the console (GUI thread)."""
+    global _log_drain_scheduled
+    with _log_lock:
+        n = min(len(_log_buf), _LOG_DRAIN_MAX)
+        batch = [_log_buf.popleft() for _ in range(n)]
+        more = bool(_log_buf)
+        _log_drain_scheduled = more
+    # A run of identical consecutive records (retry / rate-limit storms)
+    # becomes one line with a repeat count instead of one line each
+    runs = []  # [handler, record, count]
+    for handler, rec in batch:
+        if runs:
+            last = runs[-1]
+            if last[0] is handler and (
+                last[1] == rec
+                if handler is None
+                else last[1].levelno == rec.levelno and last[1].msg == rec.msg
+            ):
+                last[1] = rec
+                last[2] += 1
+                continue
+        runs.append([handler, rec, 1])
+    lines = []
+    for handler, rec, count in runs:
+        if handler is None:
+            line = rec
+        else:
+            try:
+                line = handler.display_line(rec)
+            except Exception:
+                handler.handleError(rec)
+                continue
+        if line is None:
+            continue
+        if count > 1:
+            line = (line[0], f"{line[1]} (×{count})")
+        lines.append(line)
+    if lines:
+        app_signals.log_batch.emit(lines)
+    if more:
+        _log_drainer.request()
+
+
+_log_drainer = _Coalescer(_LOG_DRAIN_INTERVAL_MS, _drain_logs)
 
 
 class GUILogHandler(logging.Handler):
-    """Logging handler that forwards records to the GUI console widget."""
+    """Logging handler that forwards records to the GUI console widget.
+
+    Records are buffered and handed over in batches via log_batch, so a log
+    storm costs the GUI a few appends per second instead of one per record.
+    The buffer is bounded; on overflow the oldest lines are dropped.
+    Handlers may be created on any thread; records are formatted on the GUI
+    thread by display_line(), which subclasses override to restyle output.
+    """
 
     def emit(self, record):
         try:
-            msg = self.format(record)
-            app_signals.log_message.emit(record.levelname, msg)
+            # Formatting (timestamps especially) is left to the GUI thread.
+            # The message is resolved now, as its args may change later, on
+            # a copy so other handlers see the record untouched.
+            rec = copy.copy(record)
+            rec.msg = record.getMessage()
+            rec.args = None
+            _enqueue_log(self, rec)
         except Exception:
             self.handleError(record)
+
+    def display_line(self, record):
+        """Return the (level, text) console line for *record*, or None to skip it."""
+        return record.levelname, self.format(record)
@@ -1,11 +1,42 @@
 import asyncio
+import concurrent.futures
 import logging
+import threading
 import traceback
 
 from PyQt6.QtCore import QObject, QRunnable, QThread, pyqtSignal, pyqtSlot
 
 log = logging.getLogger("shared")
 
+# One event loop, started on first use, runs every AsyncWorker coroutine so
+# jobs don't each pay for creating and closing a loop of their own
+_shared_loop = None
+_shared_loop_lock = threading.Lock()
+
+
+def _get_shared_loop():
+    """Return the background asyncio loop, starting its thread if needed."""
+    global _shared_loop
+    with _shared_loop_lock:
+        if _shared_loop is None:
+            loop = asyncio.new_event_loop()
+            # Bounded, named threads for run_in_executor/to_thread instead of
+            # the min(32, cpu_count + 4) default pool
+            loop.set_default_executor(
+                concurrent.futures.ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="ofscraper-aio"
+                )
+            )
+            threading.Thread(
+                target=loop.run_forever, name="ofscraper-asyncio", daemon=True
+            ).start()
+            _shared_loop = loop
+        return _shared_loop
+
+
+def _job_name(prefix, fn):
+    return f"{prefix}:{getattr(fn, '__name__', 'fn')}"
+
 
 class WorkerSignals(QObject):
     """Signals emitted by Worker threads."""
@@ -28,6 +59,8 @@ class Worker(QRunnable):
 
     @pyqtSlot()
     def run(self):
+        # Pool threads are reused, so name the thread for the job it runs now
+        threading.current_thread().name = _job_name("Worker", self.fn)
         self.signals.started.emit()
         try:
             result = self.fn(*self.args, **self.kwargs)
@@ -38,7 +71,7 @@ class Worker(QRunnable):
 
 
 class AsyncWorker(QRunnable):
-    """Worker for running async coroutines in QThreadPool."""
+    """Worker for running async coroutines on the shared background loop."""
 
     def __init__(self, coro_fn, *args, **kwargs):
         super().__init__()
@@ -50,22 +83,51 @@ class AsyncWorker(QRunnable):
 
     @pyqtSlot()
     def run(self):
+        threading.current_thread().name = _job_name("AsyncWorker", self.coro_fn)
         self.signals.started.emit()
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(
-                    self.coro_fn(*self.args, **self.kwargs)
-                )
-                self.signals.finished.emit(result)
-            finally:
-                loop.close()
+            future = asyncio.run_coroutine_threadsafe(
+                self.coro_fn(*self.args, **self.kwargs), _get_shared_loop()
+            )
+            self.signals.finished.emit(future.result())
         except Exception as e:
             log.debug(traceback.format_exc())
             self.signals.error.emit(str(e))
 
 
+class AsyncDispatcher(QObject):
+    """Runs coroutines straight on the shared background loop.
+
+    Unlike AsyncWorker no QThreadPool slot is held while the coroutine
+    awaits. Connect finished/error before calling submit(); they are emitted
+    from the loop thread and queued to the receiver's thread by Qt.
+    """
+
+    finished = pyqtSignal(object)  # result
+    error = pyqtSignal(str)  # error message
+
+    def submit(self, coro_fn, *args, **kwargs):
+        """Schedule coro_fn(*args, **kwargs) and return its concurrent Future."""
+        future = asyncio.run_coroutine_threadsafe(
+            coro_fn(*args, **kwargs), _get_shared_loop()
+        )
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future):
+        if future.cancelled():
+            return
+        try:
+            exc = future.exception()
+            if exc is None:
+                self.finished.emit(future.result())
+            else:
+                log.debug("".join(traceback.format_exception(exc)))
+                self.error.emit(str(exc))
+        except RuntimeError:
+            pass  # owner was destroyed before the coroutine finished
+
+
 class LongRunningWorker(QThread):
     """QThread-based worker for long-running operations that need
     their own persistent thread (e.g., download processing loop)."""
@@ -81,8 +143,10 @@ class LongRunningWorker(QThread):
         self.args = args
         self.kwargs = kwargs
         self._result = None
+        self.setObjectName(_job_name("LongRunningWorker", fn))
 
     def run(self):
+        threading.current_thread().name = self.objectName()
         self.started_signal.emit()
         try:
             self._result = self.fn(*self.args, **self.kwargs)
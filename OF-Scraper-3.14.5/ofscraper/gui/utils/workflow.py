@@ -7,12 +7,16 @@ and then invokes the same scraperManager.runner() that the TUI uses.
 A GUI-specific scraper subclass emits media data to the table as each
 user is processed.
 """
+import datetime
 import logging
 import threading
 import traceback
 import ctypes
+from types import SimpleNamespace
 
 from ofscraper.gui.signals import app_signals
+from ofscraper.gui.utils import progress_bridge
+from ofscraper.gui.utils.progress_bridge import GUILogHandler, update_cell_status
 
 log = logging.getLogger("shared")
 
@@ -87,6 +91,28 @@ _orig_console_quiet = None
 _orig_dki_enter = None
 _orig_dki_exit = None
 
+# Modules patched by the live stubs, resolved once by _live_modules()
+_live_mods = None
+
+
+def _live_modules():
+    """Return the modules _install_gui_live_stubs() patches, importing them
+    on first use."""
+    global _live_mods
+    if _live_mods is None:
+        import ofscraper.utils.console as console_module
+        import ofscraper.utils.context.exit as exit_module
+        import ofscraper.utils.live.live as live_module
+        import ofscraper.utils.live.screens as screens_module
+
+        _live_mods = SimpleNamespace(
+            live=live_module,
+            screens=screens_module,
+            console=console_module,
+            exit=exit_module,
+        )
+    return _live_mods
+
 
 def _install_gui_live_stubs():
     """Replace Rich Live display and patch signal handlers for GUI mode.
@@ -105,9 +131,10 @@ def _install_gui_live_stubs():
     global _orig_console_quiet, _orig_dki_enter, _orig_dki_exit
 
     null_live = _NullLive()
+    mods = _live_modules()
 
     # 1a. Replace Rich Live with no-op in the live module
-    import ofscraper.utils.live.live as live_module
+    live_module = mods.live
 
     _orig_live = live_module.live
     _orig_get_live = live_module.get_live
@@ -119,7 +146,7 @@ def _install_gui_live_stubs():
 
     # 1b. Patch the imported references in screens.py
     #     (``from ... import get_live, stop_live`` binds module-level names)
-    import ofscraper.utils.live.screens as screens_module
+    screens_module = mods.screens
 
     _orig_screens_get_live = screens_module.get_live
     _orig_screens_stop_live = screens_module.stop_live
@@ -128,7 +155,7 @@ def _install_gui_live_stubs():
     screens_module.stop_live = lambda: None
 
     # 2. Make Rich Console quiet to suppress terminal output
-    import ofscraper.utils.console as console_module
+    console_module = mods.console
 
     console = console_module.get_shared_console()
     _orig_console_quiet = console.quiet
@@ -141,7 +168,7 @@ def _install_gui_live_stubs():
     # 3. Patch DelayedKeyboardInterrupt for thread safety
     #    signal.signal() can only be called from the main thread;
     #    the scraper runs in a background thread in GUI mode.
-    import ofscraper.utils.context.exit as exit_module
+    exit_module = mods.exit
 
     _orig_dki_enter = exit_module.DelayedKeyboardInterrupt.__enter__
     _orig_dki_exit = exit_module.DelayedKeyboardInterrupt.__exit__
@@ -160,10 +187,11 @@ def _install_gui_live_stubs():
 
 def _uninstall_gui_live_stubs():
     """Restore original Rich Live, Console, and signal handlers."""
-    import ofscraper.utils.live.live as live_module
-    import ofscraper.utils.live.screens as screens_module
-    import ofscraper.utils.console as console_module
-    import ofscraper.utils.context.exit as exit_module
+    mods = _live_modules()
+    live_module = mods.live
+    screens_module = mods.screens
+    console_module = mods.console
+    exit_module = mods.exit
 
     if _orig_live is not None:
         live_module.live = _orig_live
@@ -191,9 +219,9 @@ import re
 _gui_log_handler = None
 
 
-class _GUILogHandler(logging.Handler):
+class _GUILogHandler(GUILogHandler):
     """Logging handler that forwards Python log records to the GUI console
-    via app_signals.log_message.  Strips Rich markup for clean display."""
+    in batches (see GUILogHandler).  Strips Rich markup for clean display."""
 
     # Match Rich markup tags like [bold], [/bold], [bold yellow], [red],
     # but NOT data in brackets like [Timeline,Messages] or [downloaded]
@@ -206,26 +234,25 @@ class _GUILogHandler(logging.Handler):
         r"\]"
     )
 
-    def emit(self, record):
-        try:
-            msg = self.format(record)
-            # Strip Rich markup tags
+    def display_line(self, record):
+        msg = self.format(record)
+        # Strip Rich markup tags. Most lines carry none, and the format's own
+        # "[LEVEL]" never matches, so only scan when the message has a "[".
+        if "[" in record.msg:
             msg = self._RICH_TAG_RE.sub("", msg)
-            if not msg.strip():
-                return
-            level = record.levelname
-            # Map custom TRACEBACK_ level (DEBUG+1 = 11) to ERROR for display.
-            # These are real exception tracebacks caught by ofscraper's log.traceback_().
-            if record.levelno == logging.DEBUG + 1:
-                level = "ERROR"
-            # Upstream ofscraper uses log.error() for high-visibility informational
-            # output (version notices, download summaries, etc.) — not actual errors.
-            # Downgrade those to WARNING so they don't appear in red.
-            elif record.levelno == logging.ERROR:
-                level = "WARNING"
-            app_signals.log_message.emit(level, msg)
-        except Exception:
-            pass
+        if not msg.strip():
+            return None
+        level = record.levelname
+        # Map custom TRACEBACK_ level (DEBUG+1 = 11) to ERROR for display.
+        # These are real exception tracebacks caught by ofscraper's log.traceback_().
+        if record.levelno == logging.DEBUG + 1:
+            level = "ERROR"
+        # Upstream ofscraper uses log.error() for high-visibility informational
+        # output (version notices, download summaries, etc.) — not actual errors.
+        # Downgrade those to WARNING so they don't appear in red.
+        elif record.levelno == logging.ERROR:
+            level = "WARNING"
+        return level, msg
 
 
 def _install_gui_log_handler():
@@ -271,69 +298,6 @@ class _GUIDownloadState:
         self.total_media = 0
         self.locked_total = 0  # When > 0, gui_add_download_task won't override total_media
         self.check_completed = 0  # Accumulates completed count across process_dicts calls
-        self._poll_stop = None
-        self._poll_thread = None
-
-    def start_polling(self, media, model_id, username):
-        """Start periodic DB polling for download status updates."""
-        self._poll_stop = threading.Event()
-        self._poll_thread = threading.Thread(
-            target=self._poll_loop,
-            args=(media, model_id, username),
-            daemon=True,
-            name="gui-dl-poll",
-        )
-        self._poll_thread.start()
-
-    def stop_polling(self):
-        """Stop the periodic polling."""
-        if self._poll_stop:
-            self._poll_stop.set()
-        if self._poll_thread:
-            self._poll_thread.join(timeout=5)
-            self._poll_thread = None
-
-    def _poll_loop(self, media, model_id, username):
-        """Poll DB every 3 seconds and emit cell_update signals for newly
-        downloaded items."""
-        # Build set of locked media IDs so we don't overwrite their status
-        locked_media_ids = set()
-        for ele in media:
-            mid = getattr(ele, "id", None)
-            if mid is not None and not getattr(ele, "canview", True):
-                locked_media_ids.add(mid)
-
-        already_downloaded = set()
-        while not self._poll_stop.is_set():
-            try:
-                from ofscraper.db.operations_.media import (
-                    get_media_ids_downloaded,
-                )
-
-                downloaded_set = get_media_ids_downloaded(
-                    model_id=model_id, username=username
-                )
-                # Only emit signals for newly downloaded items
-                new_downloads = downloaded_set - already_downloaded
-                for media_id in new_downloads:
-                    if media_id in locked_media_ids:
-                        app_signals.cell_update.emit(
-                            str(media_id), "downloaded", "N/A"
-                        )
-                        app_signals.cell_update.emit(
-                            str(media_id), "unlocked", "Locked"
-                        )
-                    else:
-                        app_signals.cell_update.emit(
-                            str(media_id), "downloaded", "True"
-                        )
-                        app_signals.cell_update.emit(
-                            str(media_id), "download_cart", "[downloaded]"
-                        )
-                already_downloaded = downloaded_set
-            except Exception as e:
-                log.debug(f"Download status poll error: {e}")
-            self._poll_stop.wait(3)
 
 
 _gui_state = _GUIDownloadState()
@@ -345,6 +309,7 @@ _orig_remove_download_task = None
 _orig_add_like_task = None
 _orig_increment_like_task = None
 _orig_remove_like_task = None
+_orig_mark_download_succeeded = None
 
 
 def _install_gui_progress_hooks():
@@ -364,6 +329,7 @@ def _install_gui_progress_hooks():
     global _orig_add_like_task
     global _orig_increment_like_task
     global _orig_remove_like_task
+    global _orig_mark_download_succeeded
     # In ofscraper 3.14.3 these are methods on ProgressManager objects
     _orig_update_download_task = progress_updater.download.update_overall_task
     _orig_add_download_task = progress_updater.download.add_overall_task
@@ -372,8 +338,12 @@ def _install_gui_progress_hooks():
     _orig_increment_like_task = progress_updater.like.update_overall_task
     _orig_remove_like_task = progress_updater.like.remove_overall_task
 
+    # Bound once: the hooks check for cancellation on every media item.
+    # Event.is_set() only reads a flag (no lock), so the Event stays.
+    cancelled = _gui_cancel_event.is_set
+
     def gui_add_download_task(*args, **kwargs):
-        if _gui_cancel_event.is_set():
+        if cancelled():
             raise KeyboardInterrupt()
         total = kwargs.get("total", 0)
         if _gui_state.locked_total <= 0:
@@ -381,7 +351,7 @@ def _install_gui_progress_hooks():
             _gui_state.total_media = total
             result = _orig_add_download_task(*args, **kwargs)
             try:
-                app_signals.overall_progress_updated.emit(0, _gui_state.total_media)
+                progress_bridge.update_overall_progress(0, _gui_state.total_media)
             except Exception:
                 pass
         else:
@@ -391,7 +361,7 @@ def _install_gui_progress_hooks():
         return result
 
     def gui_update_download_task(*args, **kwargs):
-        if _gui_cancel_event.is_set():
+        if cancelled():
             raise KeyboardInterrupt()
         _orig_update_download_task(*args, **kwargs)
         try:
@@ -409,19 +379,21 @@ def _install_gui_progress_hooks():
                     + common_globals.skipped
                     + common_globals.forced_skipped
                 )
-            app_signals.overall_progress_updated.emit(completed, total)
-            app_signals.total_bytes_updated.emit(
+            # Called per media item; the bridge hands the GUI only the
+            # latest counts once per flush
+            progress_bridge.update_overall_progress(completed, total)
+            progress_bridge.update_total_bytes(
                 int(common_globals.total_bytes_downloaded)
             )
         except Exception:
             pass
 
     def gui_remove_download_task(*args, **kwargs):
-        if _gui_cancel_event.is_set():
+        if cancelled():
             raise KeyboardInterrupt()
         _orig_remove_download_task(*args, **kwargs)
         try:
-            app_signals.progress_task_removed.emit("download")
+            progress_bridge.remove_download_task("download")
         except Exception:
             pass
 
@@ -435,7 +407,7 @@ def _install_gui_progress_hooks():
     like_task_counter = {"n": 0}
 
     def gui_add_like_task(*args, **kwargs):
-        if _gui_cancel_event.is_set():
+        if cancelled():
             raise KeyboardInterrupt()
         total = kwargs.get("total", None)
         task = _orig_add_like_task(*args, **kwargs)
@@ -446,31 +418,31 @@ def _install_gui_progress_hooks():
             like_task_counter["n"] += 1
             gui_id = f"like:{like_task_counter['n']}"
             like_task_map[task] = gui_id
-            app_signals.progress_task_added.emit(gui_id, int(total))
+            progress_bridge.add_download_task(gui_id, int(total))
         except Exception:
             pass
         return task
 
     def gui_increment_like_task(*args, advance=1, **kwargs):
-        if _gui_cancel_event.is_set():
+        if cancelled():
             raise KeyboardInterrupt()
         _orig_increment_like_task(*args, advance=advance, **kwargs)
         try:
             task = args[0] if args else None
             gui_id = like_task_map.get(task)
             if gui_id:
-                app_signals.progress_task_updated.emit(gui_id, int(advance))
+                progress_bridge.update_download_task(gui_id, int(advance))
         except Exception:
             pass
 
     def gui_remove_like_task(task):
-        if _gui_cancel_event.is_set():
+        if cancelled():
             raise KeyboardInterrupt()
         _orig_remove_like_task(task)
         try:
             gui_id = like_task_map.pop(task, None)
             if gui_id:
-                app_signals.progress_task_removed.emit(gui_id)
+                progress_bridge.remove_download_task(gui_id)
         except Exception:
             pass
 
@@ -478,6 +450,29 @@ def _install_gui_progress_hooks():
     progress_updater.like.update_overall_task = gui_increment_like_task
     progress_updater.like.remove_overall_task = gui_remove_like_task
 
+    # Per-item Downloaded column updates: the consumer marks each media object
+    # right before it advances the overall task, so flag the row from here
+    # instead of re-reading the whole downloaded set from the DB on a timer.
+    # The post-download sweep in _emit_download_status() still reconciles.
+    from ofscraper.classes.of.media import Media
+
+    _orig_mark_download_succeeded = Media.mark_download_succeeded
+
+    def gui_mark_download_succeeded(self):
+        _orig_mark_download_succeeded(self)
+        try:
+            media_id = str(self.id)
+            if getattr(self, "canview", True):
+                update_cell_status(media_id, "downloaded", "True")
+                update_cell_status(media_id, "download_cart", "[downloaded]")
+            else:
+                update_cell_status(media_id, "downloaded", "N/A")
+                update_cell_status(media_id, "unlocked", "Locked")
+        except Exception:
+            pass
+
+    Media.mark_download_succeeded = gui_mark_download_succeeded
+
 
 def _uninstall_gui_progress_hooks():
     """Restore original progress_updater functions."""
@@ -495,6 +490,10 @@ def _uninstall_gui_progress_hooks():
         progress_updater.like.update_overall_task = _orig_increment_like_task
     if _orig_remove_like_task is not None:
         progress_updater.like.remove_overall_task = _orig_remove_like_task
+    if _orig_mark_download_succeeded is not None:
+        from ofscraper.classes.of.media import Media
+
+        Media.mark_download_succeeded = _orig_mark_download_succeeded
 
 
 # ---------------------------------------------------------------------------
@@ -524,6 +523,7 @@ def _build_media_rows(media, username):
     the table reflects what was actually scraped.
     """
     rows = []
+    append = rows.append
     for count, ele in enumerate(media):
         try:
             post = getattr(ele, "post", None)
@@ -580,11 +580,12 @@ def _build_media_rows(media, username):
             source_url = str(getattr(ele, "url", "") or raw_media.get("source") or raw_media.get("src") or "")
             mimetype = str(raw_media.get("mimetype") or raw_media.get("mimeType") or "").lower()
             if not media_type or media_type_lower == "unknown":
-                if getattr(ele, "mpd", None) or "video" in mimetype or source_url.lower().endswith((".mpd", ".mp4", ".m4v", ".mov")):
+                source_url_lower = source_url.lower()
+                if getattr(ele, "mpd", None) or "video" in mimetype or source_url_lower.endswith((".mpd", ".mp4", ".m4v", ".mov")):
                     media_type = "Videos"
-                elif "audio" in mimetype or source_url.lower().endswith((".mp3", ".m4a", ".wav", ".ogg")):
+                elif "audio" in mimetype or source_url_lower.endswith((".mp3", ".m4a", ".wav", ".ogg")):
                     media_type = "Audios"
-                elif "image" in mimetype or source_url.lower().endswith((".jpg", ".jpeg", ".png", ".gif", ".webp")):
+                elif "image" in mimetype or source_url_lower.endswith((".jpg", ".jpeg", ".png", ".gif", ".webp")):
                     media_type = "Images"
                 else:
                     media_type = "unknown"
@@ -606,7 +607,7 @@ def _build_media_rows(media, username):
 
             downloaded = bool(getattr(ele, "downloaded", False))
             canview = bool(getattr(ele, "canview", True))
-            unlocked = bool(getattr(ele, "unlocked", canview)) if hasattr(ele, 'unlocked') else canview
+            unlocked = bool(getattr(ele, "unlocked", canview))
             preview = bool(getattr(post, "preview", False) if post is not None else raw_post.get("preview", False))
             post_opened = bool(getattr(post, "opened", True) if post is not None else raw_post.get("opened", True))
 
@@ -616,13 +617,13 @@ def _build_media_rows(media, username):
                 ul_display = "Locked"
             else:
                 cart_status = "[downloaded]" if downloaded else "[]"
-                dl_display = str(bool(downloaded))
+                dl_display = str(downloaded)
                 if price > 0 and responsetype.lower() in ("message", "messages") and not post_opened:
                     ul_display = "Preview" if preview else "Included"
                 else:
                     ul_display = "Preview" if (preview and price > 0) else str(True)
 
-            rows.append(
+            append(
                 {
                     "index": count,
                     "number": str(count + 1),
@@ -636,7 +637,7 @@ def _build_media_rows(media, username):
                     "post_date": post_date,
                     "length": duration,
                     "responsetype": responsetype,
-                    "price": "Free" if price == 0 else "{:.2f}".format(price),
+                    "price": "Free" if price == 0 else f"{price:.2f}",
                     "post_id": post_id,
                     "media_id": media_id,
                     "text": text,
@@ -647,54 +648,61 @@ def _build_media_rows(media, username):
     return rows
 
 
-def _build_db_rows(db_records, username, post_info=None):
+def _format_db_date(value):
+    """Format a DB posted_at/created_at value as "YYYY-MM-DD HH:MM:SS".
+
+    The columns hold ISO-8601 strings from the API (epoch numbers in some
+    older rows); both are parsed with the datetime module and anything else
+    goes through arrow, which also raises for unparseable values.
+    """
+    try:
+        if isinstance(value, (int, float)):
+            dt = datetime.datetime.fromtimestamp(value, datetime.timezone.utc)
+        else:
+            dt = datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError, OverflowError, OSError):
+        import arrow
+
+        return arrow.get(value).format("YYYY-MM-DD HH:mm:ss")
+    return f"{dt:%Y-%m-%d %H:%M:%S}"
+
+
+def _build_db_rows(db_records, username):
     """Convert DB media records (from the medias table) into row dicts
     for the GUI data table.  This is the DB-backed equivalent of
     ``_build_media_rows`` which operates on live Media objects.
 
-    ``post_info`` is an optional dict of post_id → {"price": int, "text": str}
-    sourced from the posts/messages/stories tables.
+    ``db_records`` are expected newest first, each carrying the ``price``
+    and ``text`` of its post/message/story; _load_models_from_db() has
+    SQLite join those in and order the rows by _MEDIA_DATE_SORT_KEY.
     """
-    import arrow
-
-    if post_info is None:
-        post_info = {}
-
     # PPV messages can contain a mix of locked and unlocked media.
     # If a priced post still has any locked media, treat the unlocked ones as "Included"
     # (i.e., visible without purchasing the full PPV payload).
-    posts_with_locked_media = set()
     try:
-        for r in db_records:
-            if r.get("post_id") is not None and r.get("unlocked") in (0, False):
-                posts_with_locked_media.add(r.get("post_id"))
+        posts_with_locked_media = {
+            pid
+            for r in db_records
+            if (pid := r.get("post_id")) is not None
+            and r.get("unlocked") in (0, False)
+        }
     except Exception:
         posts_with_locked_media = set()
 
     rows = []
-    try:
-        sorted_records = sorted(
-            db_records,
-            key=lambda x: arrow.get(
-                x.get("posted_at") or x.get("created_at") or 0
-            ).float_timestamp,
-            reverse=True,
-        )
-    except Exception:
-        sorted_records = list(db_records)
-
-    for count, rec in enumerate(sorted_records):
+    append = rows.append
+    for count, rec in enumerate(db_records):
         try:
-            downloaded = bool(rec.get("downloaded"))
-            unlocked_raw = rec.get("unlocked")
+            get = rec.get
+            downloaded = bool(get("downloaded"))
+            unlocked_raw = get("unlocked")
             is_unlocked = bool(unlocked_raw) if unlocked_raw is not None else True
-            preview = bool(rec.get("preview"))
+            preview = bool(get("preview"))
 
-            # Look up price and text from the post/message/story table
-            pid = rec.get("post_id")
-            pinfo = post_info.get(pid, {})
-            price = pinfo.get("price", 0) or 0
-            text = pinfo.get("text", "") or ""
+            # Price and text joined in from the post/message/story table
+            pid = get("post_id")
+            price = get("price") or 0
+            text = get("text") or ""
 
             # Determine cart status from DB state
             # is_unlocked=False means the content is behind a paywall (locked)
@@ -706,22 +714,22 @@ def _build_db_rows(db_records, username, post_info=None):
                 cart_status = "[]"
 
             # Format posted_at for display
-            posted_at = rec.get("posted_at") or rec.get("created_at")
+            posted_at = get("posted_at") or get("created_at")
             if posted_at:
                 try:
-                    post_date = arrow.get(posted_at).format("YYYY-MM-DD HH:mm:ss")
+                    post_date = _format_db_date(posted_at)
                 except Exception:
                     post_date = str(posted_at)
             else:
                 post_date = ""
 
-            duration = rec.get("duration") or "N/A"
+            duration = get("duration") or "N/A"
 
             # Format price display
             if price == 0:
                 price_display = "Free"
             else:
-                price_display = "{:.2f}".format(price)
+                price_display = f"{price:.2f}"
 
             # Downloaded / Unlocked display
             # is_unlocked=False → content is locked behind paywall
@@ -730,7 +738,7 @@ def _build_db_rows(db_records, username, post_info=None):
                 ul_display = "Locked"
             else:
                 dl_display = str(downloaded)
-                api_type = str(rec.get("api_type") or "").lower()
+                api_type = str(get("api_type") or "").lower()
                 # Messages can be priced PPV while still exposing included/preview media.
                 # If it's a priced message and the media is viewable, label as Included/Preview
                 # so it doesn't look like purchased/unlocked PPV.
@@ -741,7 +749,7 @@ def _build_db_rows(db_records, username, post_info=None):
                 else:
                     ul_display = "Preview" if (preview and price > 0) else str(True)
 
-            rows.append(
+            append(
                 {
                     "index": count,
                     "number": str(count + 1),
@@ -751,13 +759,13 @@ def _build_db_rows(db_records, username, post_info=None):
                     "unlocked": ul_display,
                     "other_posts_with_media": [],
                     "post_media_count": 0,
-                    "mediatype": (rec.get("media_type") or "unknown").capitalize(),
+                    "mediatype": (get("media_type") or "unknown").capitalize(),
                     "post_date": post_date,
                     "length": duration,
-                    "responsetype": (rec.get("api_type") or "").capitalize(),
+                    "responsetype": (get("api_type") or "").capitalize(),
                     "price": price_display,
-                    "post_id": rec.get("post_id", ""),
-                    "media_id": rec.get("media_id", ""),
+                    "post_id": get("post_id", ""),
+                    "media_id": get("media_id", ""),
                     "text": text,
                 }
             )
@@ -766,28 +774,61 @@ def _build_db_rows(db_records, username, post_info=None):
     return rows
 
 
-def _query_post_info(cur):
-    """Build a post_id → {price, text} mapping from posts, messages, and stories tables."""
-    post_info = {}  # post_id → {"price": int, "text": str}
+# Epoch-seconds sort key for a media row ``m``: posted_at, else created_at
+# (empty/zero values skipped, as ``x.get(...) or ...`` did in Python). API
+# rows hold ISO-8601 TEXT, transition-written rows REAL epoch timestamps;
+# both are compared as numbers so the two kinds interleave by date.
+# strftime('%s') rather than unixepoch() keeps SQLite < 3.38 working.
+_MEDIA_DATE = (
+    "COALESCE(NULLIF(NULLIF(m.posted_at, ''), 0), "
+    "NULLIF(NULLIF(m.created_at, ''), 0))"
+)
+_MEDIA_DATE_SORT_KEY = (
+    f"CASE WHEN typeof({_MEDIA_DATE}) IN ('integer', 'real') THEN {_MEDIA_DATE} "
+    f"ELSE CAST(strftime('%s', {_MEDIA_DATE}) AS REAL) END"
+)
 
-    for table in ("posts", "messages", "stories"):
-        try:
-            cur.execute(
-                f"SELECT post_id, price, text FROM {table}"
-            )
-            for row in cur.fetchall():
-                r = dict(row)
-                pid = r.get("post_id")
-                if pid is not None and pid not in post_info:
-                    post_info[pid] = {
-                        "price": r.get("price") or 0,
-                        "text": r.get("text") or "",
-                    }
-        except Exception:
-            # Table may not exist in older DBs
-            pass
+# Rows pulled per fetchmany() call when loading a model's media table
+_DB_FETCH_CHUNK = 1000
 
-    return post_info
+# Tables carrying per-post price/text, in lookup priority order
+_POST_INFO_TABLES = ("posts", "messages", "stories")
+
+
+def _post_info_sql(cur):
+    """Return (columns, joins) SQL adding price and text to media rows ``m``.
+
+    Each media row is joined to at most one row of each of the posts,
+    messages and stories tables present in the DB (older DBs may lack some);
+    the first of those tables holding the post supplies both values.
+    """
+    cur.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN (?, ?, ?)",
+        _POST_INFO_TABLES,
+    )
+    present = {row[0] for row in cur}
+    joins = []
+    price_cases = []
+    text_cases = []
+    for table in _POST_INFO_TABLES:
+        if table not in present:
+            continue
+        alias = f"{table}_info"
+        # The (post_id, model_id) unique index serves the lookup; LIMIT 1
+        # keeps DBs holding several models from duplicating media rows
+        joins.append(
+            f"LEFT JOIN {table} AS {alias} ON {alias}.id = "
+            f"(SELECT x.id FROM {table} AS x WHERE x.post_id = m.post_id LIMIT 1)"
+        )
+        price_cases.append(f"WHEN {alias}.id IS NOT NULL THEN {alias}.price")
+        text_cases.append(f"WHEN {alias}.id IS NOT NULL THEN {alias}.text")
+    if not joins:
+        return "0 AS price, '' AS text", ""
+    columns = (
+        f"COALESCE(CASE {' '.join(price_cases)} END, 0) AS price, "
+        f"COALESCE(CASE {' '.join(text_cases)} END, '') AS text"
+    )
+    return columns, " ".join(joins)
 
 
 def _load_models_from_db(selected_models, date_range=None, media_ids=None, stats_only=False):
@@ -837,7 +878,7 @@ def _load_models_from_db(selected_models, date_range=None, media_ids=None, stats
         THEN hash ELSE NULL END AS hash,
     CASE WHEN EXISTS (SELECT 1 FROM pragma_table_info('medias') WHERE name = 'duration')
         THEN duration ELSE NULL END AS duration
-    FROM medias;
+    FROM medias
     """
 
     per_model_stats = {}  # {username: {photos, videos, audios, dl_photos, ...}}
@@ -863,25 +904,46 @@ def _load_models_from_db(selected_models, date_range=None, media_ids=None, stats
             conn = sqlite3.connect(
                 database_path, check_same_thread=False, timeout=30
             )
+            # Same engine settings as db/operations_/wrapper.py (the backend
+            # already keeps these DBs in WAL mode), plus an in-memory temp
+            # store for the ORDER BY sort
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute("PRAGMA mmap_size=268435456;")
+            conn.execute("PRAGMA cache_size=-32768;")
+            conn.execute("PRAGMA temp_store=MEMORY;")
             conn.row_factory = sqlite3.Row
             cur = conn.cursor()
-            cur.execute(media_select_sql)
-            data = [dict(row) for row in cur.fetchall()]
-
-            # Also fetch price and text from post/message/story tables
-            post_info = _query_post_info(cur)
+            # Media rows arrive newest first, already carrying the price and
+            # text of their post/message/story
+            post_columns, post_joins = _post_info_sql(cur)
+            cur.execute(
+                f"SELECT m.*, {post_columns} FROM ({media_select_sql}) AS m "
+                f"{post_joins} ORDER BY {_MEDIA_DATE_SORT_KEY} DESC"
+            )
+            # Read in chunks and filter to specific media IDs while fetching,
+            # so records outside this session's scrape are never copied into
+            # dicts. The media_id filter ensures we only show the items that
+            # were actually scraped in this session, not all historical
+            # records accumulated across previous scrapes.
+            data = []
+            _total = 0
+            while True:
+                _chunk = cur.fetchmany(_DB_FETCH_CHUNK)
+                if not _chunk:
+                    break
+                _total += len(_chunk)
+                if media_ids:
+                    data.extend(
+                        dict(row) for row in _chunk if row["media_id"] in media_ids
+                    )
+                else:
+                    data.extend(map(dict, _chunk))
             cur.close()
 
-            log.warning(f"[DB Load] Found {len(data)} media records in DB for {username}")
-
-            # Filter to specific media IDs when provided — ensures we only show
-            # the items that were actually scraped in this session, not all
-            # historical records accumulated across previous scrapes.
+            log.warning(f"[DB Load] Found {_total} media records in DB for {username}")
             if media_ids:
-                _before = len(data)
-                data = [r for r in data if r.get("media_id") in media_ids]
                 log.warning(
-                    f"[DB Load] media_id filter: kept {len(data)} of {_before} records for {username}"
+                    f"[DB Load] media_id filter: kept {len(data)} of {_total} records for {username}"
                 )
 
             # Apply date range filter if active — keep only rows within the
@@ -940,7 +1002,7 @@ def _load_models_from_db(selected_models, date_range=None, media_ids=None, stats
                 per_model_stats[username] = _st
 
                 if not stats_only:
-                    rows = _build_db_rows(data, username, post_info)
+                    rows = _build_db_rows(data, username)
                     if rows:
                         # Use data_replace so the DB result replaces any rows
                         # emitted by the live scraper pipeline, preventing duplicates.
@@ -976,34 +1038,28 @@ def _emit_download_status(media, model_id, username, extra_table_rows=None):
         downloaded_set = get_media_ids_downloaded(
             model_id=model_id, username=username
         )
+        emit = app_signals.cell_update.emit
         handled_ids = set()
         for ele in media:
-            media_id = getattr(ele, "id", None)
+            try:
+                media_id = ele.id
+            except AttributeError:
+                continue
             if media_id is None:
                 continue
-            handled_ids.add(str(media_id))
-            canview = getattr(ele, "canview", True)
-            is_downloaded = media_id in downloaded_set
+            key = str(media_id)
+            handled_ids.add(key)
 
-            if not canview:
+            if not getattr(ele, "canview", True):
                 # Locked content — don't change status
-                app_signals.cell_update.emit(
-                    str(media_id), "downloaded", "N/A"
-                )
-                app_signals.cell_update.emit(
-                    str(media_id), "unlocked", "Locked"
-                )
-                app_signals.cell_update.emit(
-                    str(media_id), "download_cart", "Locked"
-                )
+                emit(key, "downloaded", "N/A")
+                emit(key, "unlocked", "Locked")
+                emit(key, "download_cart", "Locked")
+            elif media_id in downloaded_set:
+                emit(key, "downloaded", "True")
+                emit(key, "download_cart", "[downloaded]")
             else:
-                app_signals.cell_update.emit(
-                    str(media_id), "downloaded", str(is_downloaded)
-                )
-                if is_downloaded:
-                    app_signals.cell_update.emit(
-                        str(media_id), "download_cart", "[downloaded]"
-                    )
+                emit(key, "downloaded", "False")
 
         # Items filtered from the download queue (already downloaded, profile images
         # cached via separate cache, etc.) never appear in `media` above.
@@ -1077,13 +1133,13 @@ def _make_gui_scraper_manager():
                 f"(posts={len(posts) if posts else 0}, "
                 f"like_posts={len(like_posts) if like_posts else 0})"
             )
-            app_signals.log_message.emit(
+            progress_bridge.log_to_gui(
                 "INFO",
                 f"Processing {username}: {media_count} media items to download",
             )
 
             if media_count == 0:
-                app_signals.log_message.emit(
+                progress_bridge.log_to_gui(
                     "WARNING",
                     f"No downloadable media found for {username} — "
                     f"all items may be already downloaded or filtered out",
@@ -1121,7 +1177,7 @@ def _make_gui_scraper_manager():
             for action in actions:
                 if action == "download":
                     if not media:
-                        app_signals.log_message.emit(
+                        progress_bridge.log_to_gui(
                             "WARNING",
                             f"Skipping download for {username}: no media to download",
                         )
@@ -1130,10 +1186,8 @@ def _make_gui_scraper_manager():
                         # already-downloaded items filtered from the queue).
                         _emit_download_status([], model_id, username, extra_table_rows=table_rows)
                         continue
-                    # Start periodic DB polling for real-time Downloaded updates
-                    _gui_state.start_polling(media, model_id, username)
                     try:
-                        app_signals.log_message.emit(
+                        progress_bridge.log_to_gui(
                             "INFO",
                             f"Starting download of {len(media)} items for {username}...",
                         )
@@ -1144,26 +1198,25 @@ def _make_gui_scraper_manager():
                             username=username,
                         )
                         out.append([])
-                        app_signals.log_message.emit(
+                        progress_bridge.log_to_gui(
                             "INFO",
                             f"Download complete for {username}",
                         )
                     except Exception as e:
                         log.error(f"[GUI] Download error for {username}: {e}")
-                        app_signals.log_message.emit(
+                        progress_bridge.log_to_gui(
                             "ERROR",
                             f"Download failed for {username}: {e}",
                         )
                         out.append([])
                     finally:
-                        # Stop polling and do a final status sweep.
-                        # Pass all table rows so filtered items (profile images,
-                        # already-downloaded items) also get their status updated.
-                        _gui_state.stop_polling()
+                        # Final status sweep. Pass all table rows so filtered
+                        # items (profile images, already-downloaded items) also
+                        # get their status updated.
                         _emit_download_status(media, model_id, username, extra_table_rows=table_rows)
                 elif action == "like":
                     try:
-                        app_signals.log_message.emit(
+                        progress_bridge.log_to_gui(
                             "INFO",
                             f"Starting like action for {username}: {len(like_posts) if like_posts else 0} posts",
                         )
@@ -1183,7 +1236,7 @@ def _make_gui_scraper_manager():
                     )
                 elif action == "unlike":
                     try:
-                        app_signals.log_message.emit(
+                        progress_bridge.log_to_gui(
                             "INFO",
                             f"Starting unlike action for {username}: {len(like_posts) if like_posts else 0} posts",
                         )
@@ -1305,11 +1358,13 @@ class GUIWorkflow:
         except Exception:
             pass
 
-    def _on_advanced(self, config):
-        try:
-            self._advanced = dict(config or {})
-        except Exception:
-            self._advanced = {}
+    def _on_advanced(self, allow_dupe_downloads, rescrape_all, delete_model_db, delete_downloads):
+        self._advanced = {
+            "allow_dupe_downloads": allow_dupe_downloads,
+            "rescrape_all": rescrape_all,
+            "delete_model_db": delete_model_db,
+            "delete_downloads": delete_downloads,
+        }
 
     def _on_date_range_configured(self, config):
         try:
@@ -1355,7 +1410,7 @@ class GUIWorkflow:
             pass
         try:
             app_signals.status_message.emit("Cancelling scrape...")
-            app_signals.log_message.emit("WARNING", "Cancel requested by user")
+            progress_bridge.log_to_gui("WARNING", "Cancel requested by user")
         except Exception:
             pass
 
@@ -1582,7 +1637,7 @@ class GUIWorkflow:
             f"after={getattr(args, 'after', None)}, "
             f"before={getattr(args, 'before', None)}"
         )
-        app_signals.log_message.emit(
+        progress_bridge.log_to_gui(
             "INFO",
             f"Config: actions={args.action}, "
             f"areas={list(getattr(args, 'download_area', set()))}, "
@@ -1611,9 +1666,6 @@ class GUIWorkflow:
     def _daemon_wait(self):
         """Wait for the daemon interval, emitting countdown updates.
         Returns True if the wait completed, False if stop was requested."""
-        import time
-        import math
-
         total_seconds = int(self._daemon_interval * 60)
         for remaining in range(total_seconds, 0, -1):
             if self._daemon_stop.is_set():
@@ -1621,7 +1673,10 @@ class GUIWorkflow:
             mins = remaining // 60
             secs = remaining % 60
             app_signals.daemon_next_run.emit(f"Next scrape in {mins:02d}:{secs:02d}")
-            time.sleep(1)
+            # Block on the stop event itself so a stop request ends the
+            # wait at once instead of after the current one-second sleep
+            if self._daemon_stop.wait(1):
+                return False
         return True
 
     def _run_check_mode(self):
@@ -1635,20 +1690,20 @@ class GUIWorkflow:
 
         check_mode = (self._selected_actions & self._CHECK_MODES).pop()
         app_signals.status_message.emit(f"Running {check_mode}...")
-        app_signals.log_message.emit("INFO", f"Starting check mode: {check_mode}")
+        progress_bridge.log_to_gui("INFO", f"Starting check mode: {check_mode}")
         try:
             check_mod.gui_checker(
                 check_mode,
                 msg_filter=self._msg_check_filter,
             )
-            app_signals.log_message.emit("INFO", f"Check mode {check_mode} complete")
+            progress_bridge.log_to_gui("INFO", f"Check mode {check_mode} complete")
             app_signals.status_message.emit(
                 "Check mode complete — select items in the table and click 'Send Downloads'"
             )
         except Exception as e:
             log.error(f"Check mode error: {e}")
             log.debug(traceback.format_exc())
-            app_signals.log_message.emit("ERROR", f"Check mode failed: {e}")
+            progress_bridge.log_to_gui("ERROR", f"Check mode failed: {e}")
             app_signals.error_occurred.emit("Check Mode Error", str(e))
             app_signals.scraping_finished.emit()
 
@@ -1676,7 +1731,7 @@ class GUIWorkflow:
         import ofscraper.commands.check as check_mod
 
         app_signals.status_message.emit("Downloading selected check items...")
-        app_signals.log_message.emit(
+        progress_bridge.log_to_gui(
             "INFO", f"Processing {len(row_data_list)} check-mode download(s)"
         )
 
@@ -1702,8 +1757,8 @@ class GUIWorkflow:
         except Exception:
             pass
         try:
-            app_signals.overall_progress_updated.emit(0, total_items)
-            app_signals.total_bytes_updated.emit(0)
+            progress_bridge.update_overall_progress(0, total_items)
+            progress_bridge.update_total_bytes(0)
         except Exception:
             pass
 
@@ -1736,7 +1791,7 @@ class GUIWorkflow:
             _uninstall_gui_log_handler()
 
         app_signals.status_message.emit("Check mode downloads complete")
-        app_signals.log_message.emit("INFO", "Check mode download processing complete")
+        progress_bridge.log_to_gui("INFO", "Check mode download processing complete")
 
     def _run_scraper_thread(self):
         """Run the scraper pipeline in a background thread.
@@ -1780,8 +1835,8 @@ class GUIWorkflow:
                 except Exception:
                     pass
                 try:
-                    app_signals.overall_progress_updated.emit(0, 0)
-                    app_signals.total_bytes_updated.emit(0)
+                    progress_bridge.update_overall_progress(0, 0)
+                    progress_bridge.update_total_bytes(0)
                 except Exception:
                     pass
 
@@ -1804,7 +1859,7 @@ class GUIWorkflow:
                     f"Scraping started... (run #{run_count})"
                     if self._daemon_enabled else "Scraping started..."
                 )
-                app_signals.log_message.emit(
+                progress_bridge.log_to_gui(
                     "INFO",
                     f"Starting scraper pipeline (run #{run_count})..."
                     if self._daemon_enabled else "Starting scraper pipeline...",
@@ -1820,17 +1875,17 @@ class GUIWorkflow:
                     scraping_manager = GUIScraperManager()
                     scraping_manager.workflow = self
                     if self._selected_actions == {"manual_url"}:
-                        app_signals.log_message.emit(
+                        progress_bridge.log_to_gui(
                             "INFO",
                             f"Running manual URL scrape: {len(self._manual_urls)} URL(s)",
                         )
                     else:
-                        app_signals.log_message.emit(
+                        progress_bridge.log_to_gui(
                             "INFO",
                             f"Running scraper for {len(self._selected_models)} model(s): "
                             f"{', '.join(m.name for m in self._selected_models)}",
                         )
-                        app_signals.log_message.emit(
+                        progress_bridge.log_to_gui(
                             "INFO",
                             f"Actions: {list(self._selected_actions)}, "
                             f"Areas: {list(self._selected_areas)}",
@@ -1880,7 +1935,7 @@ class GUIWorkflow:
                                 log.warning(
                                     f"[DIAG] Patching process_paid_dict for: {list(_selected_usernames_lower)}"
                                 )
-                                app_signals.log_message.emit(
+                                progress_bridge.log_to_gui(
                                     "INFO",
                                     f"Filtering paid scrape to selected models: {[m.name for m in self._selected_models]}",
                                 )
@@ -1990,30 +2045,27 @@ class GUIWorkflow:
                                 log.warning(f"[DIAG] Could not patch process_paid_dict: {_patch_err}\n{_tb2.format_exc()}")
                                 _orig_process_paid_dict = None
 
-                        # Monkey-patch scrape_paid.process_user to start/stop DB polling
-                        # so the Downloaded column updates in real time while paid content
-                        # is downloading (mirrors what _execute_user_action does for normal scrapes).
+                        # Monkey-patch scrape_paid.process_user to run a final status sweep
+                        # once each user's paid content has downloaded (mirrors what
+                        # _execute_user_action does for normal scrapes).
                         _orig_process_user = None
                         if self._scrape_paid:
                             try:
                                 import ofscraper.data.posts.scrape_paid as _spm_paid
                                 _orig_process_user = _spm_paid.process_user
 
-                                async def _polled_process_user(_pu_value, _pu_length):
+                                async def _swept_process_user(_pu_value, _pu_length):
                                     _pu_medias = _pu_value.get("medias", [])
                                     _pu_mid = _pu_value.get("model_id")
                                     _pu_uname = _pu_value.get("username")
-                                    if _pu_medias:
-                                        _gui_state.start_polling(_pu_medias, _pu_mid, _pu_uname)
                                     try:
                                         return await _orig_process_user(_pu_value, _pu_length)
                                     finally:
                                         if _pu_medias:
-                                            _gui_state.stop_polling()
                                             _emit_download_status(_pu_medias, _pu_mid, _pu_uname)
 
-                                _spm_paid.process_user = _polled_process_user
-                                log.warning("[DIAG] process_user polling patch applied successfully")
+                                _spm_paid.process_user = _swept_process_user
+                                log.warning("[DIAG] process_user status sweep patch applied successfully")
                             except Exception as _pu_err:
                                 log.warning(f"[DIAG] Could not patch process_user: {_pu_err}")
                                 _orig_process_user = None
@@ -2022,7 +2074,7 @@ class GUIWorkflow:
                             app_signals.status_message.emit(
                                 "Fetching paid content from API — this may take several minutes..."
                             )
-                            app_signals.log_message.emit(
+                            progress_bridge.log_to_gui(
                                 "INFO",
                                 "Paid scrape: retrieving metadata for all subscriptions from the API. "
                                 "Progress will appear at 0%% until data fetch completes. Please wait...",
@@ -2064,7 +2116,7 @@ class GUIWorkflow:
                                     _spm.process_paid_dict = _orig_process_paid_dict
                                 except Exception:
                                     pass
-                            # Restore process_user polling patch
+                            # Restore process_user status sweep patch
                             if _orig_process_user is not None:
                                 try:
                                     import ofscraper.data.posts.scrape_paid as _spm_paid2
@@ -2084,7 +2136,7 @@ class GUIWorkflow:
                     # sent AFTER _load_models_from_db completes.
                     self._mute_discord_handler()
 
-                    app_signals.log_message.emit(
+                    progress_bridge.log_to_gui(
                         "INFO", "Scraper pipeline completed successfully"
                     )
                 except Exception as e:
@@ -2092,10 +2144,10 @@ class GUIWorkflow:
                     self._mute_discord_handler()
                     log.error(f"Scraper error on run #{run_count}: {e}")
                     log.debug(traceback.format_exc())
-                    app_signals.log_message.emit(
+                    progress_bridge.log_to_gui(
                         "ERROR", f"Scraper failed on run #{run_count}: {e}"
                     )
-                    app_signals.log_message.emit(
+                    progress_bridge.log_to_gui(
                         "DEBUG", traceback.format_exc()
                     )
 
@@ -2123,7 +2175,7 @@ class GUIWorkflow:
                     and run_count == 1  # daemon re-runs always reload full DB to show complete state
                 )
                 if is_normal_gui_download:
-                    app_signals.log_message.emit(
+                    progress_bridge.log_to_gui(
                         "INFO", "Skipping DB table replacement for normal GUI download scrape; keeping live rows from this run..."
                     )
                     # Still read DB stats so the Discord summary shows correct counts.
@@ -2133,12 +2185,12 @@ class GUIWorkflow:
                         stats_only=True,
                     )
                 elif self._live_rows_emitted and not _used_global_paid and run_count == 1:
-                    app_signals.log_message.emit(
+                    progress_bridge.log_to_gui(
                         "INFO", "Skipping DB table replacement because live rows were already emitted for this run..."
                     )
                 else:
                     log.warning(f"[DIAG] Calling _load_models_from_db for {[m.name for m in self._selected_models]}, date_range={self._date_range}")
-                    app_signals.log_message.emit(
+                    progress_bridge.log_to_gui(
                         "INFO", "Loading content from database..."
                     )
                     _db_stats = _load_models_from_db(
@@ -2181,8 +2233,8 @@ class GUIWorkflow:
                         _daemon_ping = False
                         if self._daemon_enabled and _run_new > 0:
                             try:
-                                from ofscraper.gui.utils.gui_settings import load_gui_settings as _lgs
-                                _daemon_ping = bool(_lgs().get("daemon_discord_ping", False))
+                                from ofscraper.gui.utils.gui_settings import get_gui_setting as _ggs
+                                _daemon_ping = bool(_ggs("daemon_discord_ping", False))
                             except Exception:
                                 pass
                         _lines = ["@here"] if _daemon_ping else []
@@ -2241,8 +2293,8 @@ class GUIWorkflow:
                                 f" {_st.get('dl_photos',0)} photos,"
                                 f" {_st.get('dl_audios',0)} audios)"
                             )
-                        app_signals.log_message.emit("INFO", "\n".join(_summary_lines))
-                    app_signals.log_message.emit(
+                        progress_bridge.log_to_gui("INFO", "\n".join(_summary_lines))
+                    progress_bridge.log_to_gui(
                         "INFO", "Scraping pipeline finished"
                     )
                     break
@@ -2251,7 +2303,7 @@ class GUIWorkflow:
                 app_signals.status_message.emit(
                     f"Run #{run_count} complete. Waiting {self._daemon_interval:.0f} min..."
                 )
-                app_signals.log_message.emit(
+                progress_bridge.log_to_gui(
                     "INFO",
                     f"Daemon run #{run_count} complete. "
                     f"Next run in {self._daemon_interval} minutes.",
@@ -2260,7 +2312,7 @@ class GUIWorkflow:
                 if not self._daemon_wait():
                     # Stop was requested during wait
                     app_signals.status_message.emit("Daemon stopped")
-                    app_signals.log_message.emit(
+                    progress_bridge.log_to_gui(
                         "INFO", "Daemon mode stopped by user"
                     )
                     app_signals.daemon_stopped.emit()
@@ -2275,14 +2327,13 @@ class GUIWorkflow:
 
         except KeyboardInterrupt:
             app_signals.status_message.emit("Scraping cancelled")
-            app_signals.log_message.emit("WARNING", "Scraping was cancelled")
+            progress_bridge.log_to_gui("WARNING", "Scraping was cancelled")
         except Exception as e:
             log.error(f"Scraper error: {e}")
             log.debug(traceback.format_exc())
             app_signals.error_occurred.emit("Scraper Error", str(e))
-            app_signals.log_message.emit("ERROR", f"Scraper failed: {e}")
+            progress_bridge.log_to_gui("ERROR", f"Scraper failed: {e}")
         finally:
-            _gui_state.stop_polling()
             _uninstall_gui_progress_hooks()
             _uninstall_gui_live_stubs()
             _uninstall_gui_log_handler()
@@ -2309,7 +2360,7 @@ class GUIWorkflow:
 
             actions = set(getattr(read_args.retriveArgs(), "action", []) or [])
             if "download" in actions:
-                app_signals.log_message.emit(
+                progress_bridge.log_to_gui(
                     "WARNING",
                     "Purge requested: existing DB/files will be deleted now, "
                     "but the download action may recreate the DB and re-download files immediately.",
@@ -2376,7 +2427,7 @@ class GUIWorkflow:
             except Exception:
                 return False
 
-        app_signals.log_message.emit(
+        progress_bridge.log_to_gui(
             "WARNING",
             "Advanced: purging model DB/files before scraping (requested)",
         )
@@ -2424,7 +2475,7 @@ class GUIWorkflow:
                     del cur, con
                     gc.collect()
                 except Exception as e:
-                    app_signals.log_message.emit(
+                    progress_bridge.log_to_gui(
                         "ERROR",
                         f"Failed to read downloaded file list for {username}: {e}",
                     )
@@ -2459,7 +2510,7 @@ class GUIWorkflow:
                     except Exception:
                         continue
 
-                app_signals.log_message.emit(
+                progress_bridge.log_to_gui(
                     "INFO", f"Deleted {deleted} files for {username}"
                 )
 
@@ -2477,19 +2528,19 @@ class GUIWorkflow:
                         if candidate.exists() and candidate.is_dir():
                             if _safe_rmtree(candidate):
                                 removed_any_dir = True
-                                app_signals.log_message.emit(
+                                progress_bridge.log_to_gui(
                                     "INFO",
                                     f"Deleted download directory for {username}: {candidate}",
                                 )
                             else:
-                                app_signals.log_message.emit(
+                                progress_bridge.log_to_gui(
                                     "WARNING",
                                     f"Failed to delete download directory for {username} (may be locked): {candidate}",
                                 )
                     except Exception:
                         continue
                 if delete_files and not removed_any_dir and deleted == 0:
-                    app_signals.log_message.emit(
+                    progress_bridge.log_to_gui(
                         "WARNING",
                         f"No downloaded files/directories were removed for {username}. "
                         "This can happen if the DB has no saved paths yet or the save_location differs.",
@@ -2509,20 +2560,20 @@ class GUIWorkflow:
                         gc.collect()
 
                 if db_deleted:
-                    app_signals.log_message.emit(
+                    progress_bridge.log_to_gui(
                         "INFO", f"Deleted DB for {username}"
                     )
                     # Verify (best-effort). DB may be recreated later by the scraper.
                     try:
                         if db_path.exists():
-                            app_signals.log_message.emit(
+                            progress_bridge.log_to_gui(
                                 "WARNING",
                                 f"DB file still exists for {username} (may be locked or recreated): {db_path}",
                             )
                     except Exception:
                         pass
                 else:
-                    app_signals.log_message.emit(
+                    progress_bridge.log_to_gui(
                         "ERROR",
                         f"Failed to delete DB for {username}: {db_path} "
                         "(file may be locked — close any other programs accessing it and try again)",
@@ -2544,7 +2595,7 @@ class GUIWorkflow:
                         and actual_model_dir.resolve() == expected_model_dir
                     ):
                         if _safe_rmtree(actual_model_dir):
-                            app_signals.log_message.emit(
+                            progress_bridge.log_to_gui(
                                 "INFO",
                                 f"Deleted model data directory for {username}: {actual_model_dir}",
                             )
@@ -27,9 +27,10 @@ class ConsoleLogWidget(QWidget):
 
     def _connect_signals(self):
         app_signals.log_message.connect(self._append_log)
+        app_signals.log_batch.connect(self._append_log_batch)
 
-    @pyqtSlot(str, str)
-    def _append_log(self, level, message):
+    @staticmethod
+    def _level_format(level):
         level_map = {
             "DEBUG": c('subtext'),
             "INFO": c('green'),
@@ -38,11 +39,41 @@ class ConsoleLogWidget(QWidget):
             "CRITICAL": c('red'),
         }
         color = level_map.get(level.upper(), c('text'))
-        cursor = self.text_edit.textCursor()
         fmt = QTextCharFormat()
         fmt.setForeground(QColor(color))
+        return fmt
+
+    @pyqtSlot(str, str)
+    def _append_log(self, level, message):
+        cursor = self.text_edit.textCursor()
+        cursor.movePosition(cursor.MoveOperation.End)
+        cursor.insertText(message + "\n", self._level_format(level))
+
+        # Auto-scroll to bottom
+        scrollbar = self.text_edit.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+
+    @pyqtSlot(object)
+    def _append_log_batch(self, records):
+        """Append (level, message) lines as one edit: one insert per run of
+        same-level lines, then a single scroll."""
+        cursor = self.text_edit.textCursor()
         cursor.movePosition(cursor.MoveOperation.End)
-        cursor.insertText(message + "\n", fmt)
+        cursor.beginEditBlock()
+        run_level, run_lines = None, []
+        for level, message in records:
+            if level != run_level and run_lines:
+                cursor.insertText(
+                    "\n".join(run_lines) + "\n", self._level_format(run_level)
+                )
+                run_lines = []
+            run_level = level
+            run_lines.append(message)
+        if run_lines:
+            cursor.insertText(
+                "\n".join(run_lines) + "\n", self._level_format(run_level)
+            )
+        cursor.endEditBlock()
 
         # Auto-scroll to bottom
         scrollbar = self.text_edit.verticalScrollBar()
@@ -1,6 +1,8 @@
+import functools
 import logging
-import queue
 import re
+import threading
+from collections import deque
 
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QAction, QColor, QFont
@@ -39,6 +41,9 @@ COLUMNS = [
 
 CART_STATES = ["[]", "[added]", "[downloading]", "[downloaded]", "[failed]"]
 
+# Lower-cased column name -> column index, for cell updates keyed by name
+_COLUMN_INDEX = {name.lower(): i for i, name in enumerate(COLUMNS)}
+
 
 def _cart_color(key):
     """Get cart/status color for the current theme."""
@@ -56,6 +61,47 @@ def _cart_color(key):
     return c(name) if name else c("text")
 
 
+class _RowQueue(deque):
+    """Download row queue: a deque plus a ``ready`` event for consumers.
+
+    deque.extend/popleft are atomic under the GIL, so enqueueing a cart
+    needs no lock; consumers wait on ``ready`` and drain with popleft().
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.ready = threading.Event()
+
+    def put_many(self, items):
+        """Append *items* and wake consumers once."""
+        self.extend(items)
+        if self:
+            self.ready.set()
+
+    def clear(self):
+        super().clear()
+        self.ready.clear()
+
+
+@functools.lru_cache(maxsize=2)
+def _cell_font(bold=False) -> QFont:
+    """Shared cell font; QFont is implicitly shared, so items just copy it."""
+    if bold:
+        return QFont("Consolas", 11, QFont.Weight.Bold)
+    return QFont("Consolas", 11)
+
+
+def _row_identity(r: dict) -> tuple[str, str, str, str]:
+    # Media IDs are NOT unique across posts (creators can repost media).
+    # Use a composite identity so new posts/messages still appear in the GUI.
+    return (
+        str(r.get("username", "")),
+        str(r.get("media_id", "")),
+        str(r.get("post_id", "")),
+        str(r.get("responsetype", "")),
+    )
+
+
 class MediaDataTable(QTableWidget):
     """QTableWidget for displaying media data — replaces the Textual DataTable.
 
@@ -65,13 +111,27 @@ class MediaDataTable(QTableWidget):
 
     cell_filter_requested = pyqtSignal(str, str)  # column_name, cell_value
     cart_count_changed = pyqtSignal(int)  # number of [added] items
+    totals_changed = pyqtSignal(int, int)  # visible rows, total rows
+    # Emitted just before external cell updates are applied, so an owner
+    # buffering rows can hand them over first (connect it directly)
+    external_update_incoming = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._raw_data = []  # list of dicts (original row data)
+        # _row_identity() of every raw row, for append_data dedup
+        # (None = rebuild from _raw_data on next append)
+        self._row_ids = set()
         self._display_data = []  # filtered subset
         self._current_filter = None  # active FilterState (None = show all)
-        self._row_queue = queue.Queue()
+        # Cached row counts, kept in sync by _rebuild_table/clear_all
+        self._raw_count = 0
+        self._visible_count = 0
+        # Visible rows currently marked [added]: display row -> row data.
+        # Rebuilt by _rebuild_table and kept current by every cart toggle,
+        # so counting/collecting the cart never scans the whole table.
+        self._cart: dict[int, dict] = {}
+        self._row_queue = _RowQueue()
         self._sort_column = 0
         self._sort_order = Qt.SortOrder.AscendingOrder
 
@@ -114,55 +174,65 @@ class MediaDataTable(QTableWidget):
         self.cellClicked.connect(self._on_cell_clicked)
         self.customContextMenuRequested.connect(self._on_context_menu)
         app_signals.cell_update.connect(self._on_external_cell_update)
+        app_signals.cell_updates_batch.connect(self._on_external_cell_updates)
         app_signals.posts_liked_updated.connect(self._on_posts_liked_updated)
         app_signals.theme_changed.connect(lambda _: self._rebuild_table())
 
     def load_data(self, table_data):
         """Load raw table data (list of dicts) into the table, replacing existing data."""
         self._raw_data = table_data
+        self._row_ids = None  # rebuilt lazily by append_data
         self._display_data = self._apply_current_filter(table_data)
         self._rebuild_table()
 
     def clear_all(self):
         """Clear all table data and reset internal state for a new scrape run."""
         self._raw_data = []
+        self._row_ids = set()
         self._display_data = []
+        self._cart = {}
 
-        # Clear any queued download rows from a prior run (best-effort).
-        try:
-            while True:
-                self._row_queue.get_nowait()
-        except Exception:
-            pass
+        # Clear any queued download rows from a prior run.
+        self._row_queue.clear()
 
         self.setRowCount(0)
         self.clearSelection()
         self._update_cart_count()
+        self._update_totals()
 
     def append_data(self, new_rows):
         """Append new rows to existing data (for incremental per-user updates).
         Deduplicates by media_id to prevent duplicate entries when loading
-        from both the live scraper pipeline and the DB fallback."""
-        def _row_identity(r: dict) -> tuple[str, str, str, str]:
-            # Media IDs are NOT unique across posts (creators can repost media).
-            # Use a composite identity so new posts/messages still appear in the GUI.
-            return (
-                str(r.get("username", "")),
-                str(r.get("media_id", "")),
-                str(r.get("post_id", "")),
-                str(r.get("responsetype", "")),
-            )
+        from both the live scraper pipeline and the DB fallback.
 
-        existing = {_row_identity(r) for r in self._raw_data}
-        deduped = [r for r in new_rows if _row_identity(r) not in existing]
+        Only the new rows are inserted into the widget; existing items are
+        left untouched so a batch costs O(batch) rather than O(table).
+        """
+        if self._row_ids is None:
+            self._row_ids = {_row_identity(r) for r in self._raw_data}
+        existing = self._row_ids
+        deduped = []
+        for r in new_rows:
+            ident = _row_identity(r)
+            if ident not in existing:
+                existing.add(ident)
+                deduped.append(r)
         if not deduped:
             return
         start_index = len(self._raw_data)
         for i, row in enumerate(deduped):
             row["index"] = start_index + i
         self._raw_data.extend(deduped)
-        self._display_data.extend(self._apply_current_filter(deduped))
-        self._rebuild_table()
+        visible = self._apply_current_filter(deduped)
+        if visible:
+            first_row = len(self._display_data)
+            self._display_data.extend(visible)
+            self.setSortingEnabled(False)
+            self.setRowCount(first_row + len(visible))
+            for row_idx, row_data in enumerate(visible, first_row):
+                self._populate_row(row_idx, row_data)
+            self._update_cart_count()
+        self._update_totals()
 
     def _apply_current_filter(self, rows):
         """Return only the rows that pass self._current_filter (or all if no filter)."""
@@ -199,70 +269,94 @@ class MediaDataTable(QTableWidget):
         """Clear and repopulate the table from _display_data."""
         self.setRowCount(0)
         self.setSortingEnabled(False)
-
+        self._cart = {}
+        self.setRowCount(len(self._display_data))
         for row_idx, row_data in enumerate(self._display_data):
-            self.insertRow(row_idx)
-            for col_idx, col_name in enumerate(COLUMNS):
-                col_lower = col_name.lower()
-                if col_lower == "number":
-                    value = str(row_idx + 1)
-                else:
-                    value = row_data.get(col_lower, row_data.get(col_name, ""))
+            self._populate_row(row_idx, row_data)
 
-                # Format display value
-                if isinstance(value, list):
-                    display = str(len(value))
-                elif isinstance(value, bool):
-                    display = str(value)
-                else:
-                    display = str(value)
+        self._update_cart_count()
+        self._update_totals()
+
+    def _populate_row(self, row_idx, row_data):
+        """Create and style the items for one display row."""
+        for col_idx, col_name in enumerate(COLUMNS):
+            col_lower = col_name.lower()
+            if col_lower == "number":
+                value = str(row_idx + 1)
+            else:
+                value = row_data.get(col_lower, row_data.get(col_name, ""))
 
-                item = QTableWidgetItem(display)
-                item.setFont(QFont("Consolas", 11))
+            # Format display value
+            if isinstance(value, list):
+                display = str(len(value))
+            elif isinstance(value, bool):
+                display = str(value)
+            else:
+                display = str(value)
 
-                # Style the download cart column
-                if col_lower == "download_cart":
-                    item.setForeground(QColor(_cart_color(display)))
-                    item.setFont(QFont("Consolas", 11, QFont.Weight.Bold))
-
-                # Style downloaded/unlocked/price columns
-                if col_lower == "downloaded":
-                    if display == "True":
-                        item.setForeground(QColor(c("green")))
-                    elif display == "N/A":
-                        item.setForeground(QColor(c("surface2")))
-                    else:
-                        item.setForeground(QColor(c("red")))
-                elif col_lower == "unlocked":
-                    if display == "Locked":
-                        item.setForeground(QColor(c("surface2")))
-                    elif display == "Preview":
-                        item.setForeground(QColor(c("sky")))
-                    elif display == "Included":
-                        item.setForeground(QColor(c("teal")))
-                    elif display == "True":
-                        item.setForeground(QColor(c("green")))
-                    else:
-                        item.setForeground(QColor(c("red")))
-                elif col_lower == "price":
-                    if display != "Free" and display != "0":
-                        item.setForeground(QColor(c("peach")))
-                elif col_lower == "liked":
-                    if display == "Liked":
-                        item.setForeground(QColor(c("green")))
-                    elif display == "Unliked":
-                        item.setForeground(QColor(c("peach")))
-                    elif display == "Failed":
-                        item.setForeground(QColor(c("red")))
-
-                # Truncate long text
-                if col_lower == "text" and len(display) > 80:
-                    item.setToolTip(display)
-                    item.setText(display[:80] + "...")
-
-                self.setItem(row_idx, col_idx, item)
+            item = QTableWidgetItem(display)
 
-        self._update_cart_count()
+            # Style the download cart column
+            if col_lower == "download_cart":
+                item.setForeground(QColor(_cart_color(display)))
+                item.setFont(_cell_font(bold=True))
+                if display == "[added]":
+                    self._cart[row_idx] = row_data
+            else:
+                item.setFont(_cell_font())
+
+            # Style downloaded/unlocked/price columns
+            if col_lower == "downloaded":
+                if display == "True":
+                    item.setForeground(QColor(c("green")))
+                elif display == "N/A":
+                    item.setForeground(QColor(c("surface2")))
+                else:
+                    item.setForeground(QColor(c("red")))
+            elif col_lower == "unlocked":
+                if display == "Locked":
+                    item.setForeground(QColor(c("surface2")))
+                elif display == "Preview":
+                    item.setForeground(QColor(c("sky")))
+                elif display == "Included":
+                    item.setForeground(QColor(c("teal")))
+                elif display == "True":
+                    item.setForeground(QColor(c("green")))
+                else:
+                    item.setForeground(QColor(c("red")))
+            elif col_lower == "price":
+                if display != "Free" and display != "0":
+                    item.setForeground(QColor(c("peach")))
+            elif col_lower == "liked":
+                if display == "Liked":
+                    item.setForeground(QColor(c("green")))
+                elif display == "Unliked":
+                    item.setForeground(QColor(c("peach")))
+                elif display == "Failed":
+                    item.setForeground(QColor(c("red")))
+
+            # Truncate long text
+            if col_lower == "text" and len(display) > 80:
+                item.setToolTip(display)
+                item.setText(display[:80] + "...")
+
+            self.setItem(row_idx, col_idx, item)
+
+    def _update_totals(self):
+        """Refresh the cached row counts and emit totals_changed."""
+        self._raw_count = len(self._raw_data)
+        self._visible_count = len(self._display_data)
+        self.totals_changed.emit(self._visible_count, self._raw_count)
+
+    @property
+    def raw_count(self) -> int:
+        """Total number of rows held, regardless of the active filter."""
+        return self._raw_count
+
+    @property
+    def visible_count(self) -> int:
+        """Number of rows currently shown after filtering."""
+        return self._visible_count
 
     def _on_header_clicked(self, logical_index):
         """Sort by clicked column header."""
@@ -338,6 +432,10 @@ class MediaDataTable(QTableWidget):
 
         # Update raw data
         if row < len(self._display_data):
+            if new_val == "[added]":
+                self._cart[row] = self._display_data[row]
+            else:
+                self._cart.pop(row, None)
             self._display_data[row]["download_cart"] = new_val
             # Also update in _raw_data
             idx = self._display_data[row].get("index", row)
@@ -374,28 +472,87 @@ class MediaDataTable(QTableWidget):
         Update all matching rows when keyed by media_id so the table reflects
         completion state consistently.
         """
-        col_lower = column_name.lower()
+        self._on_external_cell_updates([(row_key, column_name, new_value)])
+
+    def _on_external_cell_updates(self, updates):
+        """Apply a batch of (row_key, column_name, new_value) cell updates.
+
+        The row lookups are built once for the whole batch and repainting is
+        held off until every update is applied, so a burst costs one pass
+        over the table rather than one per update.
+        """
+        self.external_update_incoming.emit()
+        keys = {row_key for row_key, _, _ in updates}
+        display_rows = {}  # row_key -> displayed rows matching by media_id or index
+        for row_idx, row_data in enumerate(
+            self._display_data[: self.rowCount()]
+        ):
+            media_id = str(row_data.get("media_id", ""))
+            index = str(row_data.get("index", ""))
+            if media_id in keys:
+                display_rows.setdefault(media_id, []).append(row_idx)
+            if index in keys and index != media_id:
+                display_rows.setdefault(index, []).append(row_idx)
+        # Backing rows are synced by media_id or by the index of any matched row
+        indexes = {
+            str(self._display_data[row_idx].get("index", ""))
+            for rows in display_rows.values()
+            for row_idx in rows
+        }
+        raw_by_media, raw_by_index = {}, {}
+        for row_data in self._raw_data:
+            media_id = str(row_data.get("media_id", ""))
+            if media_id in keys:
+                raw_by_media.setdefault(media_id, []).append(row_data)
+            index = str(row_data.get("index", ""))
+            if index in indexes:
+                raw_by_index.setdefault(index, []).append(row_data)
+
+        cart_changed = False
+        # Re-enabling updates repaints the whole view; only worth it for
+        # bursts, and never when the owner is already holding painting off
+        batched = len(updates) > 1 and self.updatesEnabled()
+        if batched:
+            self.setUpdatesEnabled(False)
         try:
-            col_idx = [c.lower() for c in COLUMNS].index(col_lower)
-        except ValueError:
-            return
+            for row_key, column_name, new_value in updates:
+                col_lower = column_name.lower()
+                col_idx = _COLUMN_INDEX.get(col_lower)
+                if col_idx is None:
+                    continue
+                self._apply_cell_update(
+                    row_key, col_lower, col_idx, new_value,
+                    display_rows.get(row_key, ()), raw_by_media, raw_by_index,
+                )
+                cart_changed = cart_changed or col_lower == "download_cart"
+        finally:
+            if batched:
+                self.setUpdatesEnabled(True)
+
+        if cart_changed:
+            self._update_cart_count()
 
+    def _apply_cell_update(
+        self, row_key, col_lower, col_idx, new_value, row_indexes,
+        raw_by_media, raw_by_index,
+    ):
         matched_indexes = set()
         update_by_index_only = False
 
-        for row_idx in range(self.rowCount()):
-            if row_idx >= len(self._display_data):
-                break
+        for row_idx in row_indexes:
             row_data = self._display_data[row_idx]
             media_match = str(row_data.get("media_id", "")) == row_key
             index_match = str(row_data.get("index", "")) == row_key
-            if not media_match and not index_match:
-                continue
 
             if index_match and not media_match:
                 update_by_index_only = True
 
             item = self.item(row_idx, col_idx)
+            if col_lower == "download_cart":
+                if new_value == "[added]":
+                    self._cart[row_idx] = row_data
+                else:
+                    self._cart.pop(row_idx, None)
             if item:
                 item.setText(new_value)
                 if col_lower == "download_cart":
@@ -427,12 +584,12 @@ class MediaDataTable(QTableWidget):
                 break
 
         # Keep backing _raw_data in sync as well.
-        for row_data in self._raw_data:
-            if str(row_data.get("index", "")) in matched_indexes or (not update_by_index_only and str(row_data.get("media_id", "")) == row_key):
+        for index in matched_indexes:
+            for row_data in raw_by_index.get(index, ()):
+                row_data[col_lower] = new_value
+        if not update_by_index_only:
+            for row_data in raw_by_media.get(row_key, ()):
                 row_data[col_lower] = new_value
-
-        if col_lower == "download_cart":
-            self._update_cart_count()
 
     def _on_posts_liked_updated(self, results: dict):
         """Handle posts_liked_updated signal from a like/unlike action.
@@ -469,57 +626,56 @@ class MediaDataTable(QTableWidget):
                         item.setForeground(QColor(color))
 
     def _update_cart_count(self):
-        """Count and emit the number of [added] items."""
-        cart_col = COLUMNS.index("Download_Cart")
-        count = 0
-        for row_idx in range(self.rowCount()):
-            item = self.item(row_idx, cart_col)
-            if item and item.text() == "[added]":
-                count += 1
+        """Emit the number of [added] items."""
+        count = len(self._cart)
         self.cart_count_changed.emit(count)
         app_signals.download_cart_updated.emit(count)
 
     def get_cart_items(self):
-        """Return list of (row_data, row_key) for all [added] items."""
+        """Return list of (row_data, row_key) for all [added] items.
+
+        O(cart size): reads the tracked cart rather than scanning every row.
+        """
         cart_col = COLUMNS.index("Download_Cart")
+        downloading = QColor(_cart_color("[downloading]"))
         result = []
-        for row_idx in range(self.rowCount()):
+        for row_idx in sorted(self._cart):
+            row_data = self._cart[row_idx]
+            result.append((row_data, str(row_data.get("index", row_idx))))
+            # Mark as downloading
             item = self.item(row_idx, cart_col)
-            if item and item.text() == "[added]":
-                if row_idx < len(self._display_data):
-                    row_data = self._display_data[row_idx]
-                    row_key = str(row_data.get("index", row_idx))
-                    result.append((row_data, row_key))
-                    # Mark as downloading
-                    item.setText("[downloading]")
-                    item.setForeground(
-                        QColor(_cart_color("[downloading]"))
-                    )
+            if item:
+                item.setText("[downloading]")
+                item.setForeground(downloading)
+        self._cart = {}
         self._update_cart_count()
         return result
 
     def select_all_cart(self):
         """Add all visible unlocked items to cart."""
         cart_col = COLUMNS.index("Download_Cart")
+        added = QColor(_cart_color("[added]"))
         for row_idx in range(self.rowCount()):
             item = self.item(row_idx, cart_col)
             if item and item.text() == "[]":
                 item.setText("[added]")
-                item.setForeground(QColor(_cart_color("[added]")))
+                item.setForeground(added)
                 if row_idx < len(self._display_data):
                     self._display_data[row_idx]["download_cart"] = "[added]"
+                    self._cart[row_idx] = self._display_data[row_idx]
         self._update_cart_count()
 
     def deselect_all_cart(self):
         """Remove all items from cart."""
         cart_col = COLUMNS.index("Download_Cart")
-        for row_idx in range(self.rowCount()):
+        empty = QColor(_cart_color("[]"))
+        for row_idx, row_data in self._cart.items():
             item = self.item(row_idx, cart_col)
-            if item and item.text() == "[added]":
+            if item:
                 item.setText("[]")
-                item.setForeground(QColor(_cart_color("[]")))
-                if row_idx < len(self._display_data):
-                    self._display_data[row_idx]["download_cart"] = "[]"
+                item.setForeground(empty)
+            row_data["download_cart"] = "[]"
+        self._cart = {}
         self._update_cart_count()
 
     @property
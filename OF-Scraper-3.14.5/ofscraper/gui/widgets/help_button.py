@@ -0,0 +1,49 @@
+import functools
+
+from PyQt6.QtCore import Qt, pyqtSlot
+from PyQt6.QtWidgets import QToolButton
+
+from ofscraper.gui.signals import app_signals
+from ofscraper.gui.styles import COLORS
+
+
+class HelpButton(QToolButton):
+    """Small "?" button that opens the help page at a fixed anchor.
+
+    clicked is wired to a bound, decorated slot, so no per-button closure
+    is created and PyQt dispatches straight to the registered slot. The
+    button carries no stylesheet of its own; the page sheet styles it
+    through the rules from help_button_qss().
+    """
+
+    def __init__(self, anchor: str, tooltip="Open help for this section", parent=None):
+        super().__init__(parent)
+        self._anchor = anchor
+        self.setText("?")
+        self.setToolTip(tooltip)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setAutoRaise(True)
+        self.setFixedSize(18, 18)
+        self.setProperty("helpBtn", True)
+        self.clicked.connect(self._emit_anchor)
+
+    @pyqtSlot()
+    def _emit_anchor(self):
+        app_signals.help_anchor_requested.emit(self._anchor)
+
+
+@functools.lru_cache(maxsize=8)
+def help_button_qss(theme_key, scope="") -> str:
+    """QSS rules for HelpButton, to be folded into a page-level sheet.
+
+    ``scope`` is prefixed to each selector (e.g. ``"#tablePage "``) when the
+    page has broader rules the help button must outrank.
+    """
+    p = COLORS[theme_key]
+    return (
+        f"{scope}QToolButton[helpBtn=\"true\"] {{ border: 1px solid {p['surface1']};"
+        f" border-radius: 9px; background-color: {p['surface0']}; color: {p['text']};"
+        f" font-weight: bold; }}"
+        f" {scope}QToolButton[helpBtn=\"true\"]:hover"
+        f" {{ border-color: {p['blue']}; background-color: {p['surface1']}; }}"
+    )
@@ -21,7 +21,11 @@ def _progress_bar_qss(radius=4):
 
 
 class ProgressSummaryBar(QWidget):
-    """Compact overall progress bar for embedding in a status/footer area."""
+    """Compact overall progress bar for embedding in a status/footer area.
+
+    The signals it listens to are already coalesced to ~30 Hz by
+    progress_bridge, so updates are applied as they arrive.
+    """
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -16,8 +16,8 @@ import zipfile
 from pathlib import Path
 
 PATCH_ID = "20260331_allow_dupes_repost_per_post_v1"
-FILE_COUNT = 59
-FILES = ['gui/__init__.py', 'gui/app.py', 'gui/main_window.py', 'gui/signals.py', 'gui/styles.py', 'gui/assets/check.svg', 'gui/assets/radio.svg', 'gui/assets/icon.png', 'gui/dialogs/__init__.py', 'gui/dialogs/auth_dialog.py', 'gui/dialogs/binary_dialog.py', 'gui/dialogs/config_dialog.py', 'gui/dialogs/drm_dialog.py', 'gui/dialogs/merge_dialog.py', 'gui/dialogs/missing_deps_dialog.py', 'gui/dialogs/model_selector_dialog.py', 'gui/dialogs/profile_dialog.py', 'gui/help/GUI_HELP.md', 'gui/pages/__init__.py', 'gui/pages/action_page.py', 'gui/pages/url_input_page.py', 'gui/pages/area_selector_page.py', 'gui/pages/help_page.py', 'gui/pages/model_selector_page.py', 'gui/pages/table_page.py', 'gui/utils/__init__.py', 'gui/utils/gui_settings.py', 'gui/utils/progress_bridge.py', 'gui/utils/thread_worker.py', 'gui/utils/workflow.py', 'gui/scripts/__init__.py', 'gui/scripts/drm_keydive.py', 'gui/widgets/__init__.py', 'gui/widgets/console_log.py', 'gui/widgets/data_table.py', 'gui/widgets/progress_panel.py', 'gui/widgets/sidebar.py', 'gui/widgets/styled_button.py', 'utils/args/parse/arguments/program.py', 'utils/args/parse/groups/program.py', 'managers/manager.py', 'managers/model.py', 'managers/postcollection.py', 'data/api/common/after.py', 'data/api/paid.py', 'commands/scraper/actions/like/like.py', 'utils/auth/file.py', 'utils/auth/utils/error.py', 'utils/settings.py', 'utils/checkers.py', 'utils/config/data.py', 'utils/config/config.py', 'commands/check.py', 'plugins/__init__.py', 'plugins/base.py', 'plugins/manager.py', 'main/open/load.py', 'commands/scraper/actions/download/managers/main_download.py', 'commands/scraper/actions/download/managers/alt_download.py']
+FILE_COUNT = 61
+FILES = ['gui/__init__.py', 'gui/app.py', 'gui/main_window.py', 'gui/signals.py', 'gui/styles.py', 'gui/assets/check.svg', 'gui/assets/radio.svg', 'gui/assets/icon.png', 'gui/assets/theme.qss', 'gui/dialogs/__init__.py', 'gui/dialogs/auth_dialog.py', 'gui/dialogs/binary_dialog.py', 'gui/dialogs/config_dialog.py', 'gui/dialogs/drm_dialog.py', 'gui/dialogs/merge_dialog.py', 'gui/dialogs/missing_deps_dialog.py', 'gui/dialogs/model_selector_dialog.py', 'gui/dialogs/profile_dialog.py', 'gui/help/GUI_HELP.md', 'gui/pages/__init__.py', 'gui/pages/action_page.py', 'gui/pages/url_input_page.py', 'gui/pages/area_selector_page.py', 'gui/pages/help_page.py', 'gui/pages/model_selector_page.py', 'gui/pages/table_page.py', 'gui/utils/__init__.py', 'gui/utils/gui_settings.py', 'gui/utils/progress_bridge.py', 'gui/utils/thread_worker.py', 'gui/utils/workflow.py', 'gui/scripts/__init__.py', 'gui/scripts/drm_keydive.py', 'gui/widgets/__init__.py', 'gui/widgets/console_log.py', 'gui/widgets/data_table.py', 'gui/widgets/help_button.py', 'gui/widgets/progress_panel.py', 'gui/widgets/sidebar.py', 'gui/widgets/styled_button.py', 'utils/args/parse/arguments/program.py', 'utils/args/parse/groups/program.py', 'managers/manager.py', 'managers/model.py', 'managers/postcollection.py', 'data/api/common/after.py', 'data/api/paid.py', 'commands/scraper/actions/like/like.py', 'utils/auth/file.py', 'utils/auth/utils/error.py', 'utils/settings.py', 'utils/checkers.py', 'utils/config/data.py', 'utils/config/config.py', 'commands/check.py', 'plugins/__init__.py', 'plugins/base.py', 'plugins/manager.py', 'main/open/load.py', 'commands/scraper/actions/download/managers/main_download.py', 'commands/scraper/actions/download/managers/alt_download.py']
 ZIP_B64 = 'UEsDBBQAAAAIABqXiFwAAAAAAgAAAAAAAAAPAAAAZ3VpL19faW5pdF9fLnB5AwBQSwMEFAAAAAgAGpeIXFDkI7RJDgAAqigAAAoAAABndWkvYXBwLnB5zVptb9s4Ev7uX8FTUlQCHCXt3u2HXF1cLi9tsHlr424XSAMtLdE2G1nyilQcX6///WaGlERZSppb3IcTEEQmh8PhcDjzzFByscwLzdJ8NpPZbCDNz1xVb6qcLIs8FqppWavBYFrkC3a1/qB/Dj/ozzKZCa2YJfhwsFymMuZa5tmQfbheKy0W44KvT+M8a488zAtRD7ucfBWxhhHH9yLTbcJ3pazpiI3pzqcqLvhSFOGslKHS61TUYoBIUcKLu0jPxUJEfyg1pLZUzua6aexjVGqZqhDWPStg4dGkwAVWfN99Oj3LZ+95lqSiGAxAc2xU6S+ECaBzJgrfU3NeiMQLBoNBIqYsUvN8Fa1kluQrFemcK+1rqVOxz5QuhmwBM/GZ+RWwnbdskufp/oDB43neNQxmnGWg1HvBPhsu7NXe7qtXjHixLNdyarXO7iVnV/lKFNdzkabhgNh8UqAcWHc9/GOZabkQbIwMLpzx5zwDUQp2cHXKVnMZzxlfLgUvQLcZsXK5uAPZIewcKJGxMVDAIHbw6fz0iEnFCjGTYAigEmCCDIhRXBYFDNkpFUxnSIo1A0ZTWcCiYp6mTOX1XCsJv3kci6UmGdxF21XCopSzdpyMs7lMEpExo/2/g4oTURQoVcyXurQycZZwschRuELwhLhN84IlYlLOqh0GHnqel5pN0jy+wwaUA2zCjqqkEMAWBBkXJRjOlIiao8RSXmbxHKatuIE4eRFWu03/YRQctXCZcg1SLNhfRsyDBfz02jNWgU9B07ATniqjT9Be07vFxmhgDEy1Mi8GNsmWXCmYG41EZPeyyLMF7AG754XkEzxBOmf8PpeJw4lna1erf5Sg+Wy2KzM8s7jzUqlSqLAeslQRHCkJGzViBa5pC5RiTMAxDGdvjTG7O4xyJ1KBBtY9u70N7K64ngN/7/0vh5/2v1xfnow/H3w8/nKY4grVF3BEYPTFeZ6I9DT5cnmyc21OuTcA7fo7wJD5Y6H0DjGqOAYB+0bruBCrnVNwXqzdz3ZO8iIW7N/sstQ7F2Watqivihym0OvOqAsOh807MivCHx7b+ZWnYCGeIxoMswzG66Vg17pAK+tO+X0w2Ebl3hgHG14LOExSr+uX41Tgvt7u7x8rsHPhb8Nu748vD67H0fh0fHYcDLYXf5bB+fU78Gw3dvPCT6eh6wdU+JhPGbLHhgzZYQ7OI9O07FFFZ53Urbv0etojrnn42yINj/IF/j/K4xJFbmZ5nOLZsw22HxYpkOD+mhj1Q+40JDzLeQKNvveGXPTbN/dSlTx9+2YCw8l1iAUebzH63SN9jcWD3nv9u/f2jYY3JhPoeAU/t/WbXWxx25Fse1G171qW8FZNsmsmxQC0bUIEbPXz9wt2PRMrHxcS/Il9huGH4A+1cAgwKjqGHoQY1XwjXDCo/B4+YGcgba5C65/COF+u/cDtv/EcS/ZugRxCh4movXRgsDWVdYYNHfpl7Ks9dHgFRzDzawJ8blq/yFUv0SMq9IjesNu7Y7R2jbDEG4KXoijUS3mRZ6cYOXmMAb6X5DBfLMAjAqPatbbJbts/Ye0j+Gs3xrgnsEvTlM/UyFnv4cfjg/FxdHEZfT69OLr83B4GAROilEt/dPzrxaezsw4ZBDKX7Or06rihCQZORDnM0xTPUhWMOwEYg8NKQIjOMPiaEKmqiOkwejQSVyQWuJlmRLl1DwEzYB4ZIfxgv7WeVjStnmhoRQZ0qTlYDa4VDHSxKDM8A8JHD4LqerUXdEZD3CF6E7ljiEwY2Pco1jlsu9PiA5KGhEb83m58pt4NnbhbN1qT6phfxKNvG5N/D/aZ9wSzb45MMDUO8c1GjF4WApxXLF4GALzBGv3gez+nthLEA8V2x0bGRl3HD0sJSKy7chL5DnCB38vpmP4hBOEK27oMGrU12rFWhxYBgISWtM++wfDvnmOltcmEY3rzNS8A4o8cmxlaox0h1ENV8EI7glqEhp2DR4VuRO4T9YTLFOAagDIDG52dRZFR4I3ZDB4cDGLEQSw6THMlzsSMx2uCQhiXYE3g4sqlb9OuoE41KPsC/J0iUtNzDigcxyuCgLDTAMZS4sVeWkZsgVwVo0wKcoYwDF+yJXK3aPg6B+CTp6hpsvglwCHFfLBJUBcA1A+QcZIUKqDjrjSiQPJVgFiZWmAaoPPlTiruhQFbBsqTNzBCpnwi0pB9FizJs5earTisQoKhyQxwE/gRRSkUANUslZkATRvZJ9zB3fQyPvj47hgCy/FvY8SWjy/S0v8DFqFlvBDgmAxkJreSAWj3VZPPwf9mn2GyC+jnqfyXwB6YgGA3+A/YYHQkqCfYYblUkKbsMrXkMUpBIN2EXjdggltBMKvaxm/NwaFTNgKqoN0U2sPse1/K13uvf8ZwhSsM0MFuirNpbh7Qfs1l5qvKE4Qpmij8B6gr4TjYI2XdbX6nIAu/E5Gxo4hMxVcinQ7RDjayX6uuj81BwtUCHeZvvDGLyiqrjTUG6CrJHF5cLkwV2g3CV2fHWyHqVcDOaUOstRG6aNhtRgfqbrOH+bgGfYO4Q0rfgA0lZaDglC8mCQf/6wV+wOAweF7bwWHeWCdwRnjjXxSave+lPZbJlxI2rRlAyTaVGTpucdM19U9r1jSy7J7HZdPJtUdh+ulq+XWl5Q9XtuJyJDk4wh20EXOuERg7TrWjeSKKCByPWFvn9XjQOKAs0VEx1hgw7fUbJkF3mfphw3Aa6v7Ns9wf3STamIcehf5vlPpTpVT02vFcpgn7cIYiMxT5cU0+WdgjBoO25icpOhDQdTgF6z7EmQpAzoa2rRIsplBBBgc9R8Xh/6l622EWW9CzCQycJxQ3G2c2NM2ORXVULu3QUEMqCqsFybv4zhRFQ8xWKW3qZgibFOP8imNt7WlKk6IcYNoBwfZp2qs8lWr+HH7k4g7nPJttsOw5WVvsMkvBRiGkSUQIjUNfWfPzyZWr3YTcguo1hDlXzqGXyshhXSFaZ9W0ifEdHsb0HotPGJn6h+KDUxBOcrPUH5tU9WMDuKE5GbAXzUrpL0xOPSL/VQO1M4MGMeuhA0u5D29q73Xs22JjzAKqQhvAjFIBHisLlq8y1iqSUUUOOWqu7gAaEWpSSGs5ARJACKU0Jmi5KWzORCYKGYMUgIAyIgl7S5ijnhJm9zgYZxPjaVCtHtMUYhRN05DS7p9eh9dCH5oq8pVJKCCRABVI3V5Y90h5lye2FBGC5sJX7ezlv9pGasGq5qh1++Hj6iFu3gcVQaiEdgiwCNiuibiEVDjwvZNSAWmVlmwxBKRk1rjXpjLq7LrZId/u39AGcPMK2D0Iu3Viq3FE5amcYEYS2feaJEKu1ApLrHpDLGv6UQS5goiiIFySvwGw6mH5VSsPX8kaltmshVUbdqF4kEqrzVNpNWBMFi98fLr28RG7NoODIOhNqhpeze5soaGDuhS/x2QKr38gsxRTATJDguBPAQYo0FN8hwcEL45qUC100FXao9dG8BbBEE2QXlbXazyJ3I5GsSSPuY6ie6QNQsDQ4AN9jwgQlaNk3o+WvcHVDKqOZLsTeulGzDmSrvlBmgnT99yb+ZXuwWP9aGj7Gq5OB7YYZabdxHIj58JExMB5NkvzCWzUuseKt9gvQiwhI7BuqNlb69JsSgsJJqSHE3BbvJiAW92JTSFKOBUjXEbl/UmGyOIMEwsiy2r0g9wa2FAChX5rn8kZoBpxg2FqBxw8JKHJbWtGdKuwuGMHRzxPkOdM8swzojWHmIKRBGtuc3PLiScCHPiKFwk2UwhBjWLMzsG7mEBNLNB2q1Gj9l2pjYwOBZrKCabBGtfqFkHoMrXp8l74XMVYVwsUu3nhEz7IOP68ZS/qeq7ysBqjxXShR96L9/svzvdfXNvDEtgVvofwDtklOLKULmoVBsOETYwjtceZaAmuEk2EUyEuu6ludeEgmrcIOIHfvnUCGiVKkRnZezXsMA36h4U8SSqtOfqqz81xpsoCDk4JDvSrAmM3XhS8GKRPc2YNSbEVlULmcN4ZQAe2Bk8WVkfPVldg7GKp19RvDwrhCGANljGr6q882UW30b6wVI8HE5Rqs63xlvaCHctAVDk1dTDzRp5d/WgsLd28JjLWOBybIvzRAHVqwvAE++Byx82I6k4HstVtNpiFi7tEFr75oajGNzTKjvI7U/LbrME0LPpDG5Ws6HahpsTSAEJVyF+6CHMargqphY8aDZNysVR+vVJaB+2fHwxh2xOQcvTXoI2QsaYos2nuTz2z6Ynd8sZ8uGbfamm+PxJeekqV4BEysG3knJeQYuL6q7JdxbyqUZoz1Y2aCy4z+11Etdnn0GRC/8At9o2cjhoT2/+BQxgiaPXrwwIAkZUYGGBGhRfQGX3Egve6FHQIMOFhz1o3W3b0eakoWsRWdXQ9IRhKXd1TIBa7owvrFL/OQFYWlLFUTgW6rb6DMt38NgZylKbh4J5LU5foXEqAzKPNsRRr2jgalzWiwLJqYFSn/CHNxHjT2ZcaOVzo8xqfStwZRPSE+PUmRC71taW+kg8Lvgyvr6Jz463/mT+cZlNy8dLxFdUTdBaN0YLmRJn6u8d5no7lsgdStymNfbjtNXpowQapmVToQjtYoYNWI+QcWXXRHj0dk7tVl42PmWAUZIPVkYApItvUHko1VfBr9HmRa8HmLrT+sKg38x4X66e+KTIf4fjNxz+tj316+JnPf4IQE1kHTVtYR1pB+JaDkvDMgYVDGAu7Rmc86aOfTD21KLPJPfd2HQuwdvj4XRpRt+br1j7cZ/M42wno3TH1Ifvb3t7e46y69Q18ns5C3addq8LHMZ6wYycQgLMMbNrvtaJnh4Lq1qoJBMr43drHtgJBHZSco0rAgwrc9N2clRzCqIjhtP4HUEsDBBQAAAAIABqXiFyhEaSguSMAAKSLAAASAAAAZ3VpL21haW5fd2luZG93LnB57T1rc9s4kt/zK1BK5UzVynSSmbnLOqO5c2LnUWvnYXtmaiuT4lEkZHFCkRqSkqN1XHWf7gdc3S/cX3LdjQcBEJTk7KPurlYzFUsk0AAa3Y3uRjeQzRdl1bC8vLrKiqt706qcs0XczPJswjLx7h38vCfevFu/b/45fN88LyuuXr9vRmyx/q25yEv49v4ym/PKLv1zll7xplYVgnsMPu+PFos8S+ImK4uRePJs2TRl8bIqlwv55EUVz7n8/upZ+fk0XpfLRj44jSc8l9/P4qz4OSvS8lo+eLesZwKefHCR/Ym/K6HFtXrQxMknnorOtc+aZf0sruTvn9w2VemhREg5rZMqXvAqvFpmYZ1dFXGuBxovFpF85C3drHPuYAWAR2lcfYqaGZ/z6Le6HunneXY1a9wXNZePxM9E/Dk+Ov9DdPH6+OTZ0Xn07KV4ePr65avLzlNR9ORd9Pzt6dtzq6T9kAqevn35tlvSfDr0DXXZZHkdXpfVp2leXqshv/zx9c/yka/StSAbgac0mtBsqrpv4pWY3nv3gHbZWFFwCFVO4SuvgkE9iyueDmCu7iV5XNespZLAoJjhIQ1lMBg850VTxTlOnCJNdk1l4E8zY0W8yq7E4zpL+SSuWFykrBaUBHxzxesQ4NwjgCmfsijKiqyJoqDm+XTE5nEBZarxm7LgwDXQvaKhH7IPNKNLQEAwDHVVUWzYFgBQoYQEA5ff7NdAFmJwl1mT82Dw9sX+hUDtYNgpeQYNzZdz5JDg0eOHD0fsX7576BSreE2vv8XXT/C1/T6iwUN3bm6dF4A0OXfytX5/n52WMaAvXgHyiIjZouJTDsNNOAuQD9hkjXiMl7mBgKZat+jCTy/FwbcIBtgAYWhGy6HNyHxhgYpEb8bdYsHQKigGl9XErlBeVETyCwY0lsGIDfDdYMjGY/nVA2HFq0lZ80hQ8aQs88AEZbwGgC9AlPBh2xH+OeGLhp3QHyDLw41dvKyWfGsPqAljCqV4CSxgbQ+yaReKrxfIUmuzUIC9GZrE8BrIPYtzIDMkBqalRbUsCqD0ZhY3bFKhUKhRdLA//+d/MTnlbIIcWKQ26WkIY1PUBJJhOhQMY10uomVmTPR9pp8yECZpUqbQOKFzldVLQNVTNs0+s+UCEUECms2hDMtqScoggExcFWVjT0s/roSgl80EfA6yQCwmY0EFRicv1kXCJG6ZlJM5ro6sKYmQUThpzrrz3KnXk6ZAcXHJPwNh/iSbA2F7yN4WrliJkhJmLVF9Ru5x+T5Z1g1qG/kSBHdNkjTnDQkCVEGSGZEBTDT0E9Cemah0OF7C0FJRsrp4HLkS0n4cplmdlDDGCHoQIbYMAugWpZ5FfAUiORiURSQkxHIB3IkD71CVXDNABtcdAXyfHU0bIm2u1hkgnKTiUD4lhCxglYLvAHsGL+dZXYMoAmwsgNhhLtdIUFkCNFnCxIYasNDCQiyc84tZ2QSPv3s4kj2ax+sJjxBgJAFGLcBIADT7+JZES5wf4kQ8P33N4gqk6XSZ52tWL3iSTdcslpyIzDpi8bIp92FVhCnICuJVZIpN3fvG7R6CIAgRTnWU5FmEzQ6NpXVjQZJXxqoKq/LrKfRmVeJKTav5/j6Id7GAL6fTLMlgSvX4oDefsgXNDPb/OvsTsL9a7WFcNFzUN9r5PsuqqqxqdgnlJ3wG815Wh+x6xgsWJ4jCA1jI4/pgWfOqAL22PkhjPgdWhcfAnuUKVAqYaWwSJABL4kKDnnCgQt0mkPecpxkQCcwADgX0UxanaSbmCWHNF019ALhIPtWhiYP+NVSyTMtTYgVFXIRxAiRWw9hADQDGjWuGfwnPXwGDsIBA6EukXuy4qFXAbFVxr38gRJ3jtofQ56bKVvyostbwu7UiRTctz7Aux01TBYJMBkBE7cq8Gcp9ds5/W4IgY5oGWFCCEkm/86xuhkRiAkMgu1tGeippSGlD9HoPJEaBEmsvNNp4PuMJKE4lkPieqFTvseA5EgPKUdlGzq9ikB+yxB7DIWWwdhhsWsXXkQQACA2soTlIkMUAEaTNMhiUt4RZ4MNHDXFotYnIwBYdCBpnPUCw6gJkgacqPd5QLY27dRRuI5yNDXVzT908+8S31VNT7h8ovnEq69ok/aY5VOFFVDdVHawcwkOBMDYblDS8wvUFYdrFW1rFmm6lDOQ00CAsMMFqxAJocARqecNrl9wNMB+gFPTK7kCHVfEzhcFlDSz5IOBW3dfdPmBh6AYiCJcM+AdW37zDew46QlBaYIkLqGOfh9TsZ2wTwX0ceqtyYOnNQEFOI1CEiXCGNpzNIsYDY+UAMObE4O9j3oBiJYXGvliBM1jUiJimWY4aRQBt58sUFwstjfdQbEMVtG+IjzZYVD2SvJxGvFjJPyjCI/HVNqF0K2DudYYcyCqhInqwTS+enx+9OzmPzk8uTs5/OjmOTl9fXA6I7geDYQhKO1rEo6+HFR2dboPXmq2bp80a3aBF0Bw0NTT56G8LDMXeipvM/sECt1S9IYpcIkXarG2KiqHLmssQymSLQIh0/UvDxDULIao+6/qGNGkl/E3cATCl1cnbKVlvSGYECq+hqt2Ovl3mAHq3e1uG3MJeemDPQHewZHSt7ecONJL/NP/dd2lscB0C1cJ7A8DcraTKe3oFrdpgTWZ+w4GSOOhwwLQttiydgAVaJxjaSoG56u/vL3OtDO4v2ZzHMKmDOM9J+c5rYTORFU2LS1sZkBwgpbTtY4P4xKFewiA+1yP26jsG3C5YB6QNwKIX7Pvg1vYQgAmrFCFSrPf3pWqtvtTUJP+MDrysAf14Edc1Tw8NKNCtsoA3ekJwUYSFhBwK+PApK3E+rjMwb/GZms/QHZls8tBlS4eKFDa7tNFdEQxuJC3CECX48S9JZiXVgIk5sOvDrJiWtgo3HXwA0+YjO2qttZSWFqBIohVlCx2qBsY3oKfD60Dx/i0IPAemnsLxTbB3dHq6hwjZg6ncQ0ZvJxhHwiQ4/XQ4vLXh/Y4FU5CqilrGNw753A4QvCtkCfbAMLQt5wNuPKzJzNIVgKu0m7Au6R0xDZty9ENAuZoeJmVV4dorVlmLHjbStVfz6VljdUdweW2tW6+3Ej+eMuFykYJ12Oe63K6XINOYKHsOBiWYBjButC8FVS/JFUHWKvKQtu9YmiGOAMXBZE3cVxuQcCODoAiZTGwAK8H1LAM8FyAMaz0ToSJrlHk52nNrMITx9bDFfNcXTMAFdxFXj/HfoLN0toyCdOnlZAecxGpgm60hbdmYXB2QmKRGu60STxstkk6yLNzHX9sRLXV6O3EfTdUc/aXkzynk2rOoynSZcGV7Bjy8ChmfLxqQoGRTkfwXXhF3UCjbTLT3GAU7KlgGJD135oJZVnPhJBYeTpAb5BLLptK9WQORNNccFgeSXyB7QcpZrDqgnUNCt9kYFhWv6oHSnHqHZU4HOhDjKg0k3GFvwThVherB0OavYppdLSvh+T5CfrrgOXARzCFurKDTCdhPzDgIReE42sQG99lJUSuAykuuNq0yIc2EyBINBCD25IYbzA/M9UGFHsGKp0Yr+Nnu1dSl5KuI9sdQrj1fVriVJTZRxY4Cjoj2jnb1zNiiyTNuId5F2/uLODMWs2BRkeNW7B9oTwq9T/JyMuEVudcaz2B0R+WwIgQdJehroaHhF1jKOrTvcxkZEDybOvj5K2ND0E1NJAUwXAbeyLxkAsCrEUsmyBJqLDZWYFQEQGAEfS03t8MQjWJYffxGdDIxEScUMYvjvg4JYCALt2oAgmHZbDRzBR9FK1jUuv4feqd8MC7KjJqZ0DmxGMmQKawETdAWGLIf2MMuChyqkuU7BCW2yXarjHsFFbSI9X+K8yUPOn1xNAGvOrljz5xtqLvNEe0AScMEZh3FEa5JV1W5LIQTvJCGDhGtfOL63nsntndHuJmRYxi3Btt9op/pVxeAN9zlkiC8A7ZW0S6kqb2//Mtcy4G1rY90ZDGafIEOBkSa2pFS5LnF8Sw8hqjLRgLnLk9uU2DFpD0jfU6sHbTdAKsHah0KJkUOPZVK89s3p38EK3Q+QWduOfWAQzio9gvXVQDW7WTNEtBOUAgjXDLD6N1Qa5VhB5CKtqnXRZKV29Vs0J3iEAgorJcTeJbRHNUhtiOUbvqGg9oOi+JKODrGQknMCEB8jZLcIHn1oW6KCUlLMSd9ArKKceu67U7o4KTPWSoxEeK+JvATKNMcnRYbHKSipfg6zhr87u+N9OwaowvP8GswF54ccuFiQ8JfPfzYHXxelgtsSHaw4NdiJzXCF54Bee0mjUWAgPEJBgT8x48WnHSK6igXYbUsomUB4iBKwK7JweYNjLno1qclKe/pCUEE5aHmPRPS09XuqoKf++yiQWEDy5cSBdIerXiNhCeYr7XYKb4BpRkuQqgZ52u/PFdb2Jb4CKF8hGwQpVmCphKiqUd9777bsHpsaU1uyVUelMnGfMLPhjYi55aAV05+3bhZAsuXlFHiz3AH81zy81gIJ/lLUHZXLggZLgr1MLNtA6mP0tCEvx5EYeshsXwwLEDGLtbdtnVNn6HbOzqnZtdPrz5iv8R13fYW1/sqrs6rGovUAO0J64coXcBtH7wlb3142eLlcHDgmJpG++SJtNxXfmBCV4Exatr50Dus+UYUkiwVUDYhRuF4DgiWOMUNjp5tADVWL8SPXQT2bn9dx4Xyq7Suu/9TGAFYOIheSKb+9TdBbhsLZuLHj27hsiH9GH1hQs4LyU9gYKmAlYvXXdUIP+j8vY6rApSqoOPxPdTVUedSGwWog4vNGb3l7p9eV89se3yB+xrSU6/tTsBTU7YxNSo8L1DbFoBZjNyVfkWfrATVWzlG3qHbQnhpKcStYs01Ri51sdCvRbQB2tLZGKkJCTHgLkAKV75ur+TdQcLYlo+vaalQuU1blOERTGb0WBNPcunJwc2MWXldjBxribQGmOoMNWyPGk0LJVXp00d78YgfWqipG8JqxDVXeqVlB3ok925Y7MckWF5mJNnDkRzFXX3eLi1LE3EsrcPAsp+GTjEV+h+CrpjVM5hEGf8YtLrHBj+EYVSGV3k5ifPXKtwBBQ7OiWhnV3P7PnstVEVh7y4AMBBGsQdm0irOcpymEUtRljTE+YEUKsiXIuiW40Z27XCTiSNBLypm1gm3u89ULL1wKuoXiXw8VrkUBlWoeHRZVb6XNdpi2LEop6wMBNPmhWwsSoDLokH33xnoJDA4pBX5f2+Vi0WcIO0+tPy1+/vslE8bX0LA/r4uh5HvU8xgwW5SKosxWP0SW3mRfaZMlGYWPPr9w55CF5gHcTHjGBYuwLEbw2myn5Q5Bhzef/Tk0ZPH3z1ltwMbUIuyNq0l0C34yvpw9mTEHj0eMfrTV0ch7Vsn6PeqZAeswYwEFhxdPH+Nqm0zZH/+j//GlYa9ujw7Zd8vKv4DLT5qs21eFmUNEMHuyYHL5txYt6VBPmvmOVne+EW/xHjmEszngncVj2qgS0Vsh89g1KkeYc0DFn2hL/hPhMDEXwFWP+xWh4rsly/sSwRfoi/0D9uL8Ne/M/zGfhFF8OGXTvUvLIiGUI5Fv0RYKMDq+F8g/sqXAO6Lt/NQKzr4En2hzh/gL/jK8PEI/oZYUT/0jZ0+B/Affn6B/9oHUEc/6EMdfr5Q14xvnQc7VI/c6tFdqiMOrermg43VATtiiAfRQc8Dt/pHhy6JZsdsgATPKMdpvCdY+P6T30++ncZPgQuKZn8az7N8fQh8WJd5XI80O8j3mJdz+N2ieQqiC1n08OHTvR8G7Hds8EsxCH8tsyKgtkJeJ/GCB7nw1uQUd9NyyBBrfH+A3GdECSOvRmKjbSwz7oK2+0NfQZUi8AJXlCZ434Ttr/A8S2b4s7fmkWJxrKh/vMjjK/EL1wZzGXSqmzJygT7K4uqQfbv4zB6CuMI/T71CEXfm5HJjALSk1wVfxFXclGai1cIn2OExiXR8fDFDjIsiIf0IX51mpuNHljb7reT4N4++efztt1s7DBD6Sig5/MTeQY1XMkmkNrqhUrVwMaFxGdmYYnXvK4z9P0Hrp85W3E3rwVK0C9SRwO3WIdhVOjlt5JQBpXWGBcBkmcHUy6y8brmEdlCxpNpL7SmYVnMsdXx+xv7A1+w5Jlt4Cy6qcprlFG08eKe+d0rNeXVFluEZfmHHzzxlZjzH9JDBK/gLEvL85Oj47MQsZrirpnLHN8rSkdzhBj7VWLS1vElTAFp1KmQgqdYs4s4VUIUsDJX7ikrq+CA78hHj4Brbd+UlxQ5IzBiiLARDIc7j+SSNWSJ2kUZskaVj2dChu7sM74YOMRnU3VTCY2sS9yWlETblFdgDksoduhV5VQJ1RppwMDil9C10aXeSmXQdray94lg6ePxkY1GDrS28DIyGQYlr5Th79Gjx+SnTogtl1hN8YsRF9bfoolq+J2SIYltliQXQwqxK+MI0wU34NbLFXAzbOWPTaQfPTqbZZkw7hf8uuDbb3IhtI6VuJ5wbgPsJ3qtWA1LrTCf8YY5k2TS0+4nV+21OZ4s0wi4gINAnpVZtPLJqYq6coxNMB6sbo7hpemw2VD2wBqtvwkePw98bMHQpnGgQxtDhZg3Cd9lwjKCw98itwnfVJ7xTpCHaGgHt1Oi0yppkt0hjrq8z4VLzrJnKItTfXXa2dC7jlweWUEHg3y6Zagj6e9t308ZtR2mYgjZ5kcsIW3EUoFWPBrTaogL9ZKtAq64ONFVK0I19PMHt067IEJ1YmUjwj29FmpJtxZ+TzE+EjSsCGQMrnX9oGvTCQYGvcdjWARIdN4aKeWrPnbDFknEgRSj/nHxexAXKotHGtx7h5B9w2xE72IzyS8XwGCzHf1pLhheRlqsyS1mSVckyjytMNa1dlIsEVZHxHzgsgednsEnsHkdAzyP0j4yNUzY8vp/2nVOxi1/5IkRv5xmva+hOMDjHMNGBmSZqLn+erNALYlUdM0i53ZQfR5RBtWoZfVJiiCHFCscrju4GGUEWmomVbtJ9J+PbKLklt74/G9wtIzI+6dwACdKDATP5vouHS7Gkqyzy4Pjk2Y8v93O+AqmnDtfAbWmQcYAHz5DtYwTaYRvPvSNzuxX6186/8qEPI5rE/nMg6l2OgPhgHc/wkURx35CpgttkcLcYNw2HokHHbPC2GHiz+GUEPKpYupK54yC5Zy64Rmw4TAeGhkezfUPt3Frc5J+zEeMF+pQPKdxxB8LykVQrSH5GbhMQUxMN+6A5XmM4EXq298TxLnsESYZM4TYZRa8i5Bk8yal0yajR0AL1dsHx1AEYVopWJQh8nJmVoeWiyScClKyp0DQXGRWi76W9+EP0fZMBYpt4vvghRDAyvK02l3r8KAxMyzwVcR5ZQ/n/OY+rfM1SMY4l7ScIcpde+mpZGJt9hC0o7EHXOfQDlBSMW8iuKHZfIoURY9c2Rp5jFIuIg674vFzJpAcTLYQSCcOfWJ5ZB0qJeCp5uJQ5cNpZUW/8h/ao4tHLH19HP52cP3t7cRJdHr1EwrdQL/szsGLqJEF2MI57NdAaDj/Q7QuatMULpm3h3MlKipo8eRxTNgsJn+wHZoOk3C/5bmyM983by4uTS/9O1yykwWGociRrKhg95XvHY5W/z47StJfezYnV6U0y6WKB6YNFJy+YihRrHegxG3WmSgU392LTs9PYu8soKQtTH5DDiLRS/xZ+T2oNhifWYK/N6dQFqE4P7gJBuJkohFC074uX2lAfhl/roEH5V/FIRL+7G5z4wddSToxlt0W+h37es7sqpRLWorhHCtdEbVG+6KmmRRhVbEKF9LAor2lLspriz2Dw4I/7D+b7D9LowavwwVn44KInUgA7mmaVOKhLDeWATQc3siO30Y1qKGzKNF6bzeypZvbcBDEHfjj/BP/KI7PqMRqGI7EiROWnsT+WWlVHrMr+YU+xc35Rb3RZ4+kWp3bgn7zpHHfdqgF7EMR1glWG9eGHBxhTtszhe/ggmC6L5E1MLx4E6I8vymH6kUENuUYPa/+4AUU8ngN4sImLQA0DY+MGuCgnJVoM48Gyme4/6Zma6cwUxRcE8JXgz0CA76u3myS1y4uNgAY31FWd9hFgCrquJps9eHX44OwQaaovukhInqlX9PTP9lTKWDWhGoniSx+FUAhjmircTGe9tCSyLVWC5U+OTgFmrZqoW8+cuIogyoeeQCxsKuWT5ZVu63m5zEW2qbDSmKvQQOPccs90orx6V8nXb168/dpFEpczI8cCKdRZ5oBeN7SEH4PesFpnfTsnpYX0FwrI3ai97DSOD4cfvev9Dkte74QhfKFeKULqoaPN4TaKZDsYtYnam79iI3VT8LIcr4DV35u2RxuhfW2oz332I2U8qrPNGv65wW6J2BKtp5Ccb5fzDv76TzOb2q7pm723xV6rRAprag+sqT2PY/NIHZxzgsc/9WW9GMaTbcpL88k43o3klmVCySQuMG5ELegQn1Mem3Q5skRk1kn3o+NQMCyr5wAEND86HChuRITYcsG6x8uNWl/QAmOBGswlFAU0sAmfogdUOJLwECvpCeepPMaIwtOAX6u12jEIOgPdaEXYcR2mKYt+JOME2VAfD+M5mtB71B7AcJyO3bNX3WQAzw6POAzPu3VENURUUDRBn4hzKqsDehGRz1OXUz5PVzaXdrn27NUNIt0/WOdA2Z1He4yerW2DdU+b7R2tc9hs/3Dds2Y98kGd0Zja57MqzzUjUL5db1+Q1VRHWfnCrG7a0d4+Zbe3Hce09M/3erY1Dnqc2jtW7CIBkSZG2prQ/4iE+kck1P/2SCj3dJJuYNRNKw9ut0dHuSeTbIiWskreOXLKre1GUXU27LvBUlZQleXGatfLjkjX7lwhoxPQWq+M8HFzS6HVQbpbBd29gKP6kz4fBTsB39ci6UNtfnR1jlg4C31bIpsOg38vd26elZ+NPHYaTyH2SWm5GXRWc+nippW3bariqCmNTbDhb0sw0UFHsOmL9C7ryeACRyYCSN7pbV2H7KeDC9A4b9oe3tJKiMNfl8tKjV8M4V9/KYCSnPrQgHnM9XWGqR1cnYJdMnN/IPy1pqwJAduFpL0TTLilZI5sWa1Dp9cmOi5ATwIEyjCg8I+wJHzZVOBNuTMss6ilh8lpGW/pyA5ZeXfa9emexoCf7l6Q37ngbtZ0i/ny8mUPtu8emcU/yCPDcQtJnBTeR++5Te8Gjj2bS/JLvy3qORXK/CinwrFJ1IJS0UjCbu31dHSPOrrX463bnJvR4/AwE5m67g4llqxD5JWzoxV/1t61I/k8tCWO9Je5QSK9RpDWET3CHKTt1UXaai3zliwwlEBtZjTt0Bk8mMELzM2O2g6rzddRMC7xyW6VMazRqovxjbtVXVZ5lBWLZWPV/7HKX+PDbTDSLCY/OsaGRuKHRgE82rW6EJoOABE9uisI6Qh2YMho0V2BUAipA4KiSXcFkFZzp/rx+dkf+JrqG/aBDLJtE+9kCAjoMLgdhKdPsXo52ZchI6pi9ywfX/SLXdzkmLHBLOrw/bGZ1+00JdhFVu0wyC4Q9Nkl2LbDFLvUd8hzbFHmLgAMvhq3LNVTcwOi3WAeA62b5set1mL0LrU8RzNtr2Sj7i41W5x1ztCHkvTCDBnvAuwEzuhaMohcCQf/PPRX17HlrXC4KwgRdd6y5V3rG8HohnS5KxQVrK6ly10ByEh2Jej7qhseT1VVuDl1ZLvw3Jq33nB9iYwZdu5kDxqhdS31SFjmIu/cPeGs86bppELNo6YUeat2NC8wmy4hqgy9YJyAmg4Q+70fBkf/cVQmZFe5YcUAg977q9JSHBfJDABUnAweHwRvseHGJaLNcPQ27GZNd5p0Cvi77yZAd6A4BfxQxHGIG7pivffDwD1yugMEb8Xo5PJqULrYRjho9cSJhxrMtz0YiYtlnEcgTeuIxE819+LFV6yHQmUW9oZRdYpE8l4Vk7c2lfO4Eo7ljSlM1eP60B1xrmeuL6iR98CICzPUfSI1cAyaBLxI63DjBRZ/0ZUw+Nl+14szAHHInbsftPUANEKjTnGxBKOBOzCr5ENUzAzx6NnT2nTAoiNTbctL+4wLnRMmggudez08fTHyhHrOAPKmEnWPtqPK/6ZuEMSIg6FFbY787UWYmzokC2yF7xWKshXx2KboN7IFJF/K6CI1j/YZkqrM6c4lDUdC2Ey5Ts/FKmtPVGtrjU1aEHeEecpjTJqugn2bxbXYJlZPxTGU0F9c+UQvBx5HAV43gFHPdF4WefjaMc/oIhhxSijLmhpdqp/wKNzu4RLdG3+8foGHmPOG6WGHbfdDt5t0VYKcma5L5e78uIE27GVbXeInF3GH9Hoi0mXpEfvu4cOHPmrEczqcZmmll62Rs9jX6K5eVT0FhustqTJK6vC30ekkb+z+OYu6YhZ5UIrFLWcYkUFdlYfBEOWg5IfV+EDeVpGYKZtMUGdZsR/PTxnZEvTI4iF5XiEdeo6nnrcL4eDWJyB3OIm2z3Lp7qbuDNKwoByUtrc56PPJfEu5xCw+tNEKqKmZLkYnKBSGXDKOg/FcWdWJ3d9lLKZ5ZlU2znyRW6J0/GhWZ/DcPSR0exD6hTqu5ibnRUAjv6UjqIN6GIbhYBdU2tqiYlv35DeLOsVBQrU+qchC4t8VY3bYmltB5nLozWexL+8/LBbPlV6s1ZUwImlAsCLmOSlGNGhFQu1xpoDCuFhHAhpJRjSa3KGqEbW9EAfH0qSIGwpwMsVDui+lvmp/tGcq4y+MXV/Ln7cGPLnvNN5wFLEsoy4pIX8BHoWuD0U3JYm440OB/Serx8P+XTcf/Q5oJpB8kSXpxCA6nRwUftBZcjBAOMNTNgUl94uY7e3QdV4XxNiaZWA26aa4XZjEtoaUCKdjl+29QOPoaClp7NvoLObY2u9TYVsRRnZkZ8PYUusVkRs+d4wNDMuW5sRU36FCfRa3LGl673K0QcKiLMEPjKbudXslbbht3XrGpvLMfdU77JKsLBmQriRER1UJa3NMR+tCvaq8rjf2lXaZ+nt6VaLe1EorvpB9xa+w3KX8c792G8vrHbOEiutEFsdH4C7MD9n3YwM++94nMpMSNEr3oLGNovU1AguMfneugtx8paXHOH1XLpYLHCappbCezidZwVN5qSaO5cWL+YJfodQQ6zN7fnzGPvE1nXQsgt5kgxYW9On711zcNUPXd+IdnYzO4RdGrYk0U5ShADOGUcsB0PiKgT/A1DleVNgIvUDUZcA7W9NW9oPcbZa6Jp2nLR7ZAbnJ9ErdwyheB+LeCnl/LSL1ZtdbtwQs8/Lo6RRnRgXtY4xr/2DsC+QAlrCbYLJjWGBKcQD0YDhieAquxwiy2+oHIIY0FC9FpZ0T4a0EvySlm0zFKmebSm3rWMjftKi6n6Vdq9CHBwuQRIJVj3Z0LRQPra4uqmwlMhLv3ldZdx+Y6m/YW4MzzwRTHGTFKs6zVLE4Tu6h4NOW/cUFKG/PQQHNCpkfDa+LffTAhy4tilO0yTw1KEafGEo3LRiUZN4b0LmxSLGuqOBe3t1CgjZ3iJrAcNl30GbQ1upazp0msXeLMKsjT6LQ9lDuzSO4ryUpKVuHDHf2yfeH8cJK2uJ72vcgSUtZDeqmlPSApm9kQKz4VVylULpWB2UrnQ7h0BXEjP1Il4uChp+k1fwA/3l8AK/TCc79Mk8NeHUjY3NEzJQIz8ErhWDRaDsorrLVK3xocQYQKiq9PXxwBwoXFGLIS2iZNFSRtRKoxgQEeLmPL/dlOJK8+xBH295/qOlSv2q7TgJEErQCLx5a5GzIKQ81a3DI4w4wyfYdaEqUbAKnKEuazFDNwx/GEOgibdmFXQ7+9oGnKxqIhVrAw5Y3qA16rRoyXn4t53THZw6QeuQwGeopnco73A2ByWMShquTeVHkeizlDmlXpvS5LHsrSFez5bOURp3QZWXUxjTjeepzWKpWw27xYHCs7vwCcJ31ebfJsTNTNPIAz/8fMHefvSiTZQ1Ct6obfd88VXkq46qY1i68EKgshrG1Soh1e7bBPpKxTQ3gbtMJSwjMJP34K00jSMGvmkYSrH9RF3Y530JHDJl6vRM4JF4dw5tjemHr5GmOK3GnUNcbbwuWsf2zGwnZlTrj7qNuNbWIjdWXbhEwtQ3pNDa+95fF5tWX/lIwZ2P1pVtKpBCPu2HCQxehIf/Mkw03y3vCGc28TTkZdNIOk5M5jbOcYiwpevF/AFBLAwQUAAAACAAal4hcE6sB5U8FAACPDgAADgAAAGd1aS9zaWduYWxzLnB5jVfdb9s2EH/3X3FQXxzMSbAP7CHAHoKk6QIkTZMuG4ZhIGiJltlQpEpScY2u//vujpTsxnISPyQidffj8T5+d1p418CH9W389eg2njmvQDet8xFub+afVBln0K4/x4+6ttJMJpPSyBDgtG3TTphmsYOTCeCvKIozZaOXBgILwLKbw8J5KL0L4bB0CG5RAvCp6awuZdTOgrYQlwre3V8eIcSEsd7Ae/moaxbgDZuWSkQnWlkr+G3LtmmI/oCU+I2VjWKdpTKtkLZcOi+8+typEFU1rpikQFew0nGJFv2Ousd3b0/Pr9/2Fn0svWyVh5XzDwvjVrwtSzJRBGXQETvoKjI6/ge3yLJsX2DlxlXKhD3KRoekTQ+kztLg2OVJX3olX61OwoD31bZO2oHvg97UFXq1rs1TiLlz5mBb1Mg52fuCsKwe0Z2qElmrdHah684/1Ug3YRsrXSYbsyq4llyV7Kx0KJ2v9uKkGDIKC4JRj8qcQHFzcVHMoLi6+Qv/YXSL9zd316dXRfJ9qEW5VOWD0LY0XaXEwis1frc+Swr2lbNmXcB/ULDCsJLGDMl7LqME42SFzk53wA2RN0SI0u/E62BXbqGtDsu9gY1ybhRrgHerAFPZtspWqtqC8qo1slSjCMNvBCrrBcBbgfqCCmgQvxuxU3mP3h31WHqF+R6wMnvv/MGnHcO5W1nCyGHuVwIrtXsxndGWZHB0g+p3OKJEL4uuRaGnYNomrNJ1lsF0VE0gIiKd3swP3tUeLedlmxciyvAgZFWN5MgMemAW0tUMjYtInbsAo2aNQ5Sd90iaIyBeNe5xX65mfVZDKWRlIwb1fV7ZHE9kbRTKbN9hcG1oFdb3KAoyo0wQ83XEBCLGDAprN5nCYIJfPR8bFswY/bmq6mNzpjAvk36ABbWxXoZ8VPZRK1EsHzPi6v4Pn4f5JB7UGv3tTNdYQSw9A6tW4lGabsjdK5cK2rha5LQeR07JSkw0e5r/3EionoxeqHJdGrUh2f11n+qp0ZFctloqm1nZY/dEaq+GkOWrE5GanoP3tD/GvL+E/Dr0yZahM0hv97WqNNbbGl8stIl4Mns+NRZuQljr1IITwZI0CYe9zL3b4jYn5E4F6qg+gn+KywZxA9H5n7pSLhT/9lZdJvqG1iFGVF8iLIysnzWtZ3yS3mtcamgbQlfgpa1fdXXKN8HSr21+J/BVWaJFrDdCFgRBpccP32DKKdz7pPgbf4fX14fn58WWiUgHlqeEbAStn70enkXVOoO04BtzlvWmYDEqj/kvGm2xGFzUC6yQgLRZbZ9hyY++s+NMxCxL5ZmiY/SDwlZMjznLkHd//Onk51+KbUyES42SCmWUIehA2zVzDMb0u7qQGQPT+pCE5qrWdmhcjB6iw2b5YoVlHONcCzrkckDPpHpFDNFb+8r6yoCkOlSVtB0y3f3dFbZESuLDy/OBC2A6X7c4dSPLpfHvh+2cwxEp3aphDNF5k4vNNy/WGh54TCflibAfuynGeTLPY+ISmdFubT/Dd1FHowa+g2lYo08awG+CNeayRAsGHsUsOL63nAzYkjoTw8kwBn4lN2DzAo71CcLL2OGgG/03iotXGWSzT9EpCLMiiki4VZ76LqTGkKXkIuAg+O14+8l1OVA1n5DDzYftI/2DjUEwl55znfV4BBKuZGod6/jjzhuGpaXKnzORnnBmJV4Z4yqW9h2ZVkn/MIML/EajldH1cphqzpgPUovgx3E/7NQCdjKfNY4+BfpsC7Dy9N6msUQ2DaZHiXPGGr8V38A74+abT0EswEjVM8EhVaS9gCdufUweTP4HUEsDBBQAAAAIABqXiFyl2vUVQQwAAG9LAAANAAAAZ3VpL3N0eWxlcy5wee1b63LbuBX+r6dAlZna3rEciror487k4iaeOpvEcrs/sjsakAQl1hSp5cWON5OZPkSfsE/SA4CkQBIgKdmyk071wyFxcDk4d4BfnNXaDyLkh63W/OVsdnY1m785v0Sn0HKyxtHy5J++4x2mL5YTeHhFDudz23HJfH50jNo4DEkUto9arZZFbDRn73Pa/ZB2ov2Ppi0Ev3a7fUmiOPAQRrYf3OLA6oQuDpeI9kaRjzCQ6HBER6LDgPweOwGxkHGHPkXo02yG4sA9PDo6ganYlAGfL8essI9jlLFwEpC1i01y2P711zaw/TzjeAHsWji4nkdLsiLz38PwsMQwkBDt02F9GCe3DvAckNB3b4BDzjZlIqR7Q45nOSaO6JPpe2HGsLkk5jWIVxRTmzWehDcL4IntCluOX+zEGsVOnLP5m5eXf5tfvTt7fza/Onv/8eLl1dkJcLDC0SGbdw5DTtnTMZ+YNbAnUQKus1hGdSJgnQQZHL7G0Xodm6bjoQscReRILZY9iuDi/O27q3vI4BmaORYxcIAMbF4vAj/2LGT6rh+EKA65/a2w481vQa3+7cn6Dh1ek3UEWkbhnWfyTYNAjlpMG7PzN2evXl7OX72FHbSfdcfdsT5otzibBSIZkgmx28nAs4/z1x8uPlwyUq/b0/v9bFyOZpqWZuFk2MWHtx8E2nhi9G2cjisQu2Q4tIEZ2PR734pd0nHJDXERV2oY4Yi05k7IPAIGXAUxSawkaeQ2ktpHqoKEmHSlKuPdaGPSdeH6BnY3XWmbsJIwnA212Nj5DXaPud3Rx5JVpn0QeFrWC9RIteZ7yIyDgHgRn7EYNbKxjr1hhLgh2czEjOM1zBBg1/mDJFYBBu0SsHb0n3/9G5nYdVOOjygbYDH0Hf5CCIjCFpP9DHb4lfNOl2lPkzfWQtmFFqqcLtFJ+3hDWmEvchMiNyOBGMaBDSFNY+TEWsrkLiP3B/3RAEvIOiMPxgNjpInkiHyJGMm0rKFdmNjIqHiILXOcYzmOiMVoQ3OkjYcizXBjvpnERsVJr+8YZdQ3R8TMc4JdRpr0iW7lJLAICPESPkgPd0XaHXFd/5YR7QnRsS0S1wSbS07DRm88EmlBwr7dGxs4vzUc33D+TQMP7dwoF98QzyIBIxt9g9g5RYZkrVAT5EHP8RZlRr/xf9rMGhUWQ2y7aw8UFpPEFpXFJDFEZTGGaWqmqbQYbBqaQaQW06U/Q2UxPbNnD5QWM7THA6nFJIFLYjFaHw/IQGox3dFEn0zkFtPXsKYbCoux7DHpWgqLIcO+ZsgsxtI1uzeRW8x43CsoI2cxI308si2ZxZTVJFqM1Rv0NW1jMd+SGGoe5iuvt5CHMaJtaRCjZQpN6vkYic5OFicw+oAK/uAIdf6CDhJvPaDR7SBRxEEWTdNgeIp4pPvMI9xv5bCa0rlB/ybG4mSSEyhFGOPHVM62ptk2q9NkVQ5NZ8DC85/QqeSH3vJ0I6X99Lz16RfHgsXQV+5Vm8TfYdKZoiQYv+A1S9LGYyFvs30v6th45bh3oIgZWfgE/f2c1pavoeLzobCF55Xv+eEanEYYE0ImmaJub/3lResb6Eu1g/dQcqBfWMmh3gbtlPSp3wpdTRgxnYKN4YCVqerBPGJx/m8dK1oC75R1+r4kVJVJQ+VeiBej5+jK911aZ6m3A/1e4Sp2eBrkyxt+AP7TMfwo8leMCwSCd6wN03zHfNLp1InICvbsEhMCToMtZ6Mbmgnnp5qRHbmgkntIwdBe1DAhjkxRP9XnGlsWa9HrFPoqhqm9UK3Jj3G45J0a2pbMxyQC5YVMbpu0kI/DKRqWtgEtqJs1rxyvk1qs3k93KHA6Xfo3pErGksVTEo+R5SnXcBgKK/XMa6/ySMsJseFWDpXFqJE97k9MKY85i9qs9GwdOCsc3M0N9nqMBNrnhHbajuAoAFFdzUwqAZEZmXd4vieGw9tEI4bvWnWscQVVMlirQ15glleysLcggVQGnNRABLxkbCqCSg5kW83zUbtTONJq2Kz245/xzTa+fOLhm4RB9cJwWvIgttCqQqX5gueOS57b1XKuS6vHDpzBFt4UucSOyum0L/Pyni7xcmEPtSJUeIw4BbtXaBTIRasQnSURBt0XsLwJdWJIUenv3FvHUYXqLhyPnFlOBIY0WzveK/8LPL3xYwgsm/fX/srwExKO0v5Xzoo9Plr8LqchaNnYRjl8syTGEqnje52akLTpKC2LUkFNbd+Mw424svec0JLWVia6TbdEgFlDKkbekAmzIntkrKQZQOBGaMozdM9swRbONjO1An/dgRLRy/MrunBSCwqJNB2OPr00QggCZnQOpc4/HFJVm4omVGMuD6RqlSu9po5s+F9IiP6MLvkFpMqtWF/uMaxnvtLJCqssfhWdg8srmQRKwvS6OD+fQEinTivwcakEz1pSKeoKp6uJchKuCkab+mt2gqnhuTBssjGY8lINwqkkdMpIUBUsIDHQLwZfs1vgb0eVHO9n9ezKOVtdtvE03ys4y2cqdfRQWfcVjQ4ViYLRqa/SkBWQ9PHCCSPhcatTM3YjEngQD2X+Wj6uKM8pi8CxXIiJ0phRGRTkHaXOmO2/cEATxFGktDLplMdshLXrga/AT2oepYnrShgd67iXZrl3BIOk+bQhF0fDI2VVei/Xddm1gEyfzU6nuUNcFtxURwbJxhoXd7K6rMqVZmbguy6C43iFP/FO9NoBmIjAid2GXpNGeK0Yz4VDw2by6RJ7lkuaLFJReQ2kxbOWBWr1erVCzp1uhXlAux3q1NlMtMjZkMPYyJPTJVLuZMwt/cD5Awyksayz5LmdsBut01Tcib4rpb1Z8P7y3sylkHh5dwmLWt2lEMQslGSIqjyThq819kixvlSFjJpLTZiVbSICDraLZ5PeZGLojfJQIW5tol4Wqsb5+yYcLEDBSTDU8ybWiaDCpke+8vFH6MDG5nsU99sks8gqf0khk+5Ml59Bc6syO5z+aYu0pqqDlTf4MM0a0fOE0phYF9qjoRUp7gsTRYHAYaheOIUmzcO6DJTyAuJxIjczbHArE0aAm3XAr2CZabLciyJ57YcOy1sIVhRuOTLr0qrPEyo5fgz8Bb2EpAmr4o4n6VV9ySw7rSlvdfqy2xuTeFAVSk70WuVZSWBvClV67F1vV6OXXEiZ3NeuEwGHFZk96ZFG56YVXXFcbShvUotcYIO4Vfc/lJ6uIa3hqq/v+IUEneTzEkossMPiNah4CVdVpilVy2cHR2iwQL9oJMC+bpHcTOxzcnESWbgXJ679gjWLcBTX+BDvs/VnGh5g5CGryHcVi28c7PoLNXsJvdl3QmWOB19G7FrwOfro0k+UrEW5KOtDu6S3isnjlmma4zu2SdOlKJT/YCt8pIXnOHDAFX8mt9XfbPUHvnVUCtn33chZVx3XoceVs97f3ax4B7tbJP1rgFdEvQNG/mzTv7MlXpPTdr/sruImVvhLp/TBWTLNoH4a8Ts2zEJxBC0pjHDfIAOO38kricNnZDb7XYMM0q3sBDLgIJf8AfgJQQYcOVV3W5EyvRvIoDS6oZlI/LY01Y5c1IMMthMMC4BPDjIQuZH5mESgHPtWfWjYG8hAsvgmd1Ds1S4gAw7X2wlkIItR6XQSHnMW9eAgg1QCIjMy73hikIGujTTb3g/IgKMMm4pg7yCDXo8Mag4p/wcZVIpQ4THbgQykUU5wFhXIQAwp3yfIwDKJRoqgmp3j98ODDEQpl8v9XFn0tCCDXPbYF8hAli04rPsJQQaiCdWYywOp+ilBBqlzPDLIIOd0ah38GCADSeiUkfYEMthh9b2DDJokikcCGYgxphJkUD6uKM8pJZBB7hBTFRTkHbPPgGbfHk6+H5BB/sD3UCCDnHNvBzIQdZSVz6Zu90d1dV0JZCBqotnpdP8gg6q67HFBBqLX7A1kUFF57RFkkDvdfg8gA1HW+wQZNBX3A4MMauX9w4AMciGj5lKzGchAFs/SJNCEiR8WZCC9yy4XMhKQQe5gshvIoOqSb/8gA4kC/4dABmk2fiyQQVma+wMZ5M5KW4EMJKb9NCCDXEW3NcigSS2yE8ggd0XzFCCDnGrvBTLg/2W9OchADPdPAjKQfKYpggxkAVM8q+wNZNDkluQRQAY2+211q1gR5R8fZHD/q6iHABnc89va9wEyEDdxD5BBcRoJyOC/UEsDBBQAAAAIABqXiFxJmIuGkwAAAMMAAAAUAAAAZ3VpL2Fzc2V0cy9jaGVjay5zdmdVjjsOwjAQRPucYrXU+JOPBCjrghoOERGTGIwdxSbO8TFFhJBmmjevmDYsA6wv6wLhGON04jylxFLF/DzwUgjBs4GwGJ3OfiUUIEAeclAVAO3UxRF6wmsNR1uxBnIvsoYGIcTZPzXhTmqpS72BfTJ9HAlLlp27sZbQefebrXH61k2Es3+7/g8/vHEb56pov9dU8QFQSwMEFAAAAAgAGpeIXEK9Z+5rAAAAdQAAABQAAABndWkvYXNzZXRzL3JhZGlvLnN2Zx2MQQqDMBBF9znFMN1nJtZCW5IsvEqYaiCtJYqjtzctfHiL9/h+2UbY3+WzBJzW9fskUlWrVzvXkTpmplYgbFl0mPeADAzu3obRAPiUayoCqZkHQjr+qAF7e0N45VICXpw46QQpGv87i+YEUEsDBBQAAAAIABqXiFx0QStVNRoAAGEaAAATAAAAZ3VpL2Fzc2V0cy9pY29uLnBuZ2V5dVQUTtguIiBdUsLSIEjssiCw1NLdIR3CLiwrXRLS0h1KLovEgggIgoBISjcKEtJLLUiKSseH9/zOd8+5d855Z97nnXljnjN/zJyJN9BTpyBlJsXDw6PQ1FAxuh1l/gkx0W3fy3tUfzvc8TFSV8J7PwbYvgUECEVdRTy8D6lkl/aEt5jEU8PCBw+Psvuf3On3eAu/dYhFmpj7muvqSMM83ID2cA8HR2CAmyfevyYrH+BpD3Nx9OVwcEQg3eX4Dlo6+DiQcDk+M3FdEV1PZUdnpEaQt6NxkJ4JLMgFJgXnk4dSkMoGSN9GcHP0tecIcHN195EOkOP6P4Glb/V/ZhAXVNYb7iRtpKL234pbJMfl7OvrKQ0C+fv7A/3FgB7eCBBYSkoKJCIKEhUVvl0h7BPo7msfIOzuw/1fABVHH5g30tMX6eHO8Q/bO3j4+cpx+fkh4dJO9k7iDnC4uLCDvRhcGAyG2wvbw8XAwnAxMbikOBgi6gR24PovvS/S6f/md/f5j4ZbQkD/ZkBgoMi/kv/p0vreSMfbKv6lhIJlQf+fTRb0/xT2n+V2r7fa/zLzj6b/ZdfR/ZZS/1vuhF7lkOHhMcE0VRRNnJX38gKTbGZCluVxqJZ2t6X8wPq07hANrTKJjAxejw8bA16tVnoLRHFYCU+DYeGEh6rhXGf6bhES7oaduq08npMM7rsQxVXdxAaLRt5nRTxWXLoJXLHKlKqUUtZOm6Ote0DENvsJBWP0Edewav452aXnQYv/5tLvNpz/2FnBwQHfd5tUyLV8RPBGdNjAKe+PsLe3XSED/ovoNtvaYpFas9mNmcSTK9eDYF24mR1/gaq0XK02xXngU0LIHT3Lqu/muZQ6a6W9JIlvAnAC9hfGE6fb1z+fGAQjpWrNlq6kvLwUTe62XOa1dqHSmGiqloKftDrVmWp8JH4vImj7ew2oJH1Y1VvPUR378UunrCwZmlA9nLOrGU873JMW23m0RnJzWd1yGm3HTmxGnWVKqWEtiuT91GUqV8GkxeBIdjc+8PVm69AGO5X+o1ev+MsNHyr+hG4RIMjHrlwzicKp8XFCSsSXX/srwnVcfLOwg5FpPgzcZNn0zsHZhqSEE06nE8VRisXpavfXme3o7r9tkFJijhqhqeG1foVWmgM4GpeOeo7ZY1LTaSwDiC/q5eo4BLzGHHySGQMC9EpcqYrESjPeKLUavXzeFDsmrYLmOKSX0I4PkeJ41mkpSkHgONenfnFH6Zzjjwu3Sy1BqYlr7MDG92fiQF/aLJ0osnfyYhacBNPMpSan6G5/kuIOhckdMTBdvc8M0Np8o5JKVnNZM5gKtW/4WsrlJ9Sj2V7QeE15QUR8cE5cly3QO+YCLT2Qqc442PXQ0jRhQyv4Jw1fzYQEVsEo6a5mihL3ILUz8xSpsUv+brtTxqhLPxNL4tn5lf6vFXTInyeErN8HHU+H1G3vbCsUGwL5jjn33hskKE/XPHDac+6Zjud0b3ESnnEFqJ2lac7Wh0V7hOG8Ir/CLrL+ulrJ96X81VVTirPOn3UiLtJQSS5JzJK/mLZFo23hnCTgLsGBIDTHuI+IqnJxpzqcCGMsgOZ97KYWSzfj+sD+pIFlVqoh3Ym31JYGcldLMePLmr5cPyx289OBQiKDssajdKNVVItzn1QpeVxI/DZQhNbl/bLsUJlTvNX7QoeLTZJ36ZhdKwfCCWZvsyoMpYfIqDlTQGrt86/gz1vU95giSGJyR7Egdqk+s/bfgHghzp5yNm9aMlNYde/w/XcTRlyw4c8kjVWs2OP557WhPHBva2oZskWGotqAIUFbfgJbpjScFKNv7gXV32b/8VSIX1DKb9w4o1wFXTuO8/XTYIdXloOwmePkVj/cc/e54q/Cum8vTLgSyx93bTxlnc7RFgMxbJPW+JjSidXc55ii96lWqnsVi2qkbz9avBv898XFdgWp0uLftMrXshPHXEWPq4QFQ6/ONd0XRPuqm1w5TTh8CxWYXxHYU2jR2T2xSvRJERrW8BvTnlQnHtLtkzzgAYv4O0V7hOxYAaDSoz09BPNlZTnmVrgU/32eNKl0A/5qw76VB7ocBBF8YNPMeXI3Mm8tOlczbt54VeaX3o2Q8k8HBOtcb8q5xspoluU8s+6FBaAQZdkaKhTYxb/hPm2EAgI4G4/P6akdHowy7wwmQrToI8bMBiaBfczBIJ44gdLmssW9+o8fVZrmN7Z+wZJSUkSll9Y9ro9Znmpf9nlcM+xIVHMT362TVSeOV+JQiaROhCzyvoJiake0XAj1CQOUVlEK5lTcwOrsiEd9AcDEt7rSBnr3P5eaX0d1cw2qKtg9MU/zs1T6dSDvz36h99F5XuABuKtlJ9TMz02tLcqu2Z3V6ifb/E+2psVPr4O676Wnz6NC5VUHcl5vsMVS6t5X5303Jf1aK9ojeM2FCXE2ZXfxpK+v7+0UC+MaQlCBVPL0uDcP6UtlR/Jug/QqNNYEobFd28XlHT+iVPX3w1RcVWGtxLv04/PdHzfKEm75DqXgqANRh8luRqk920iGO5pfO035Ti9n0LgPd30Aci2RzM/qXpVyEHJ92mGbobZZaoZFusQ8nnLNncWcAmEz+zs5OQDM0tv0P/fZrq5hGtuTgAc49QvKoqiVsgKZH+1uLKbm3vn3Y6BELxukTOnuxDDpnEwMOgSTsYeXznAS4xsQ4ciJE0cJ0EBsdiwk+JiOzylFTDHegD8FOCbWAGNhma7ubXrAO6NarFnQn/DW8x37kWTqPi4CsfnpzbAQhlJQ7hAPQ/ON78Cr+3n8yXIr2mWINcaVHUYwEeGTsun5UpeFj6nQ2SCBd7F0dMg7NSgkx8iaa0ZqTOrnX2Yc4zjFwGfFGgY4BvCnMtOczzPwVwvd68FMOjuBo8clba1K5Ysbh+n34ejVAEQ8BcwFcnNJs/TxtxPbUlM2VegfvWmdJOq0+z8oGeKByUcLrok3R00vIHXOUpOib39CKojBBVAC0gUBi7bOF/7VsJO4L41j1L1+3rDBDNTAiadECUBw6fzYhnxGUMXwgQv53LpzQcY2SqtBC+1Y5dtCsMGENx7hyWBC2cXgJcy2HPjH6+eUtMfnv6OA2abCNTGxKFuVlTONIme+R3UALwfH9J2awLssL4l2+maePqMJKU+snXBUaVR+yN0ecGDcWsUSvFdR8lGFIjn1Cdi8Y/ZI647zK//f/QcpNmNl6UT3P6iHczQR8RG2H2AJ3oooBEEROKuRsTGYWOGvTR4tflGXLZxULv2rLulFlbrvTZe9jDcJoJDryhFWmWT2zs9+90vbCDB05XpoxSC2ElgJIDd3c7crsPUrN3/sKxbHskb9D8jfQe5LIaz3R6W5u5+IpjuEJHsxPFBRsU/ar1nR4g7ejrdgmw3LQlcVF6Rm0ODXMJUbrVapkkQcuV/PLn6Y1EmmEmPQ9PUg5IG4gKdX8WBCFu4DDbza4hMkavncEITBkPI5zXTA5dLBFWfhtX5Yl93lCeh3NwKNCHSPFwMVFmc/z12oTcGq3SUYGUFxkA/rVFlo1xTW+s1LlDW6wYa/m07r6E24SpBEUiMozNXdxQ0rVEwEiqpLCqRtoYEZCkym1iMvQUCRtreDhyJ6XNGpChxeGkLkZeokT5MVteIbsvTKh4eGSNtCqdz+9IKRVZhCDI9FoSmOPDQnc54AwSqImws+Xw6JuWAPivTBXTyOlLbqmxaTsIYhkfGMoZ6oA9k/dxmyL5j4DEI1mo24U4Z1dN1grr4ZzzARuN4V/KCQRC9oOzMXpfpXi87tZoYXJ7trF8uLw037ZxLqKYWlBSQq5opP72F3pzB5T35oBEqG7e4r8Fm3PI9K5yhv8Yzh2YElqbkk16cYNZtEhSoVlzpW0dTbd0Oaxcxlr0/lL0nsOm4uCGBWFSlunPqAdCHDeKUYAYqUUZuVyyPS/LJpr70UVgDUNwlSNQF4UG7N3GUZq4BF4fNpZiT1RtM76aPgQUExyiA27CDfydHpmv7h7u+L2foTi+d7c6pSlEhECmOZvte5ElkLs4XmTULcM/E/J0RfvtIboM10oGqZg6jHurnmYhESzATw3IeDFA8NdmUOuU6gR0xuM09X8+a388Kx4jH1oL3ynxs9EQ8ZhS0rNrD9aByrfyuVetIY/XRAaTw3qUspcmhhAckAtF75vvAoBZDrFHpNzniLuqIJGRgZ04zqJg4M3R/XXgGRHepMvrnP+pg+ZLXdS12rZLZhLFalGcIfUCR4vj3keChH5ZKYYxbIJg2ytiC/rrCuzNiI2c61gP6ND9McFf9GGzzVp0k2FecJG1F6qPkkqWL66xif9heL6J5yIzYHx+b+1VXa378ROWj05vpgJiogMCvkAs2te9GDyUnH0myOj4mBoV/6dFl+NOw8hF6myzxgZf2ySaKI6TvsCdLzB4w+y71XKKfzTHur0tnBjDffhWI2MSGKBp+X7Nuwpbmm6VsqybOxwhtWCivES+IfbUVK0D9c19NE3S55KG21QCRnWdt6ur9VjuyX5y9O51Yqw0vUU8Eh8JhY9sAcTC+vk5PTQB2520WA4pBBN2I4i2J3oSGRKnjlynW+kQIHQNPl2Oa/y07LhwZKwnTUkqpZHffUl9XapMYKF+sPXr9a8e5nMFohmi8LrVHPK4MHqmU5RtnHfSAqodCIIA0JQg4th5zlu7rqfUA63O227/K4OWdeCvEZS3ERVt5hRVyyxbYkxnmTuAhLj9NMcwJ6vAb+Su6u9DJScZRyJ9zV2sjx77ighJ40y298O4D23FxOhK1RXa/Yee01WJEokShlltsQPGjb50J/5Md6jqWtx2zQAatKawQuNcNFhCTmxqSYk+2HNkTHLOqEuDVp5wokps1ll5WJFWvyaS4cHWjA1uyIH6BvqW8scsuBqdh5SiNBrjXjI/xzZGzvMf47APca3t5jxZV0Hrnpqgc4ZfZQ9sKrXUTA7q/YszX9G3X35g3TV0lepkXi682cut6etCDiX4K8cKmHNAkpcVtm07X+wI2m663EYL9x8vi31nSbwCaH7Q/ZZS7jxt93/Jj/EmE+qdCpalSQFgwyFOckKGX9TvpxjC//s5CvJZBlU1cSzEI1ybY0gmIprnym0se3y6MyVhu6CJFcCGAtCL2nHpkhlS9ZjRW0O2O/LEkNjWOVKevceGrc8zTkdaVWyV3w6R7qy4oz34MKxkxViutzLO5014wdi3L7ehILztbVy1bGXw9MATNU8GgFRtlrYCwxppU0MZztdpf19ZSJ3JwlxndC1oixsc+9L4UzAa17pu1fW7JAIwcrO9WGKaXil9bgBW3NcdQq90HbSxn5Q1sdtGECz2i6qJZTgIDyJzrEBWSecAZEF2aooeDAQWgjmjjAamhepN4ZzPaVQkLEZ3pV9cnHBwPCZhEEIn0rKGXSeNyjj2ANzrjiOBHy+DVavOaxD6YcBUoyypZH4B01iLwp9s8WvxhmD5VUA8O0FphMD+KyIR1h8h7t15bP2+1Z2kVNhtg0w3L1PNJFImUP3rhRqVvyh0/QqWMVtrjK2Fz538zqlI6V6L8m+zzUcTVys6q9fMnGatxHTeEtJu80QhSqkFfmXI1skhFqMo0rpjUK6vHKFUm6o8nUQ0zhyEL7h46XdQ0BpeG1JLOhS2j1EBHM2kZQHk6cdPSbiK/IeYRwz+jp0kYzIF4EQL8P0XxCye6sCUbUEJDGKr3hf24z9AhFlC8TJdwYY2uC4XMZ+cvNFrovBBpxEkKq2oWDae1r9ruqMvzGHJIe6hqfX7Glyh9DNDOeJim66AJU+TEak3Qu5F2kwW6nV2Hn83+cUjIAefZbSvfEfACSYonQAKaD0+FdW/ku9dC96svNggPEnkqmyEd4UPSn9fraADYXccU3RJy2314aURxJaxwtrFYpxL/Z+vYYUVQAbiG4+VvDtgk6CEx4z8SVSUNJheSdoH8uHndauHgQc+S49Ol9n1qDikdoDF9haKT+5f6BQYXJtu/ceqBeCVinY5mbmLekhHfp7H3Tt0m3Y71x75nFQkRv+KSbCbrW54pOpq8/cFicpXmvjyVn7jmrZnuS2c+0bUql2I/zIXnJ9t7Vv9qmAMkAoTDaRyGy+kUmCi2LTl72Ec3NUikg7fYzo3yE7X7Rk2i0IZMZ23ogvMhE0+fXmo2ixOn63fff7VbcjHXd3/7x1C6HBJ7z8Omj17vZmzNvncdsIOOjksuRX2hORZaEfgl6zEcbhXz8bTHhl2Xq3X5YfpPL0uSB/fw3P+D3/uLKBhOOWIvi86Dohndsrxhferx997oTQ1AIipTkkklyoM1S9pUdoqKgtvarA2bR8aBe/ilmHhYYmDtpMWDM6FA3ZCmUocfHRxxD5LDQKWMKWzHL2CiUXxd4uDG6o7VLOZ4+zs4rmYLdZKo+JkUwgg5nM/UPPa63qAZ9U7zzBtV6WD06KLa7HVzi+w7h4LIqXo8mkrtUyRx/g881aGE58oHkdapDV44LC0IsD2cM244fGnVEmtA/zuoNTawffjQOsF4ZKS6b2i4xREk3qYDEAHlQvX0zz9HkUtGueIcuWq43K03vkujgZhXvpRtWp1OX95IcP/JYsGBMXisKpIokHL4M59FlshK7066gCjViYjYcWJ8lmPpJraWhgqYJws9HOJO4Faw+EfwDILDvWSovXL2+2F87xHKPsKHVQMCvSP9Dtb63j/ksXHmDLz6U374ejQGQReyKRYAXFLtSwZuC1s5x2xDKyeEBRMxBcuNEjLBpEE5S0S7OKFbAvYmf4evPcqoC1voPTKep040YQ7TQvSchpWmlD1VZkjMNKp841whlntyfrimAD2+ObqHLaF8PRjtIDW+rJbwoDMm7KAyj7JAa0RAuqwLs5FEE81oMsjZ1nLxsvbI5sL/YtzLk5l4f6ieit5VeXP1Wggh0KOv9Rth99p3bkHfiTU8dA89Yf+W0l6LKdYL1xDv34HQ0de8PgUDACqkkJcp+QKi+5LuDcRWJjZbwEUl3mk45MWdau1DcDmrgS9bg3+Dbw9bDPOwzLt//LZMvYL/3Ks4yvnmaC9nRf7B0BoWepswbEicdQmbEojCkvJxpEriFLsDrc+ILW8iXkPH2nit1RojLO3PDXmqOqGLqy7u+8hjrmknd8173ddG3iSnSBmL35Fqkncx8LLQWjz60VPsQoEsYyAQ2woOkurZRHJSHcuw4oh22BAP+LfiWSv3CnugCAIZdoK2/V0bCcD4CbSucb1zsLGha/rLXtBTpw8yXOMunKYQYRyH2v1ukFAbk/oCpS3nt3t7ShcDLtAALE/g1RM9E8ZVBlzotRzWHAWm2y/fepbucpMjjCff3n/zjd1dOVt4f7gd1Vnzt/8Pg/JlQIotCRk0pxiRljHbIkEQ8Tr+I/w4/WarssBca3l2WfNl3b2m4q8IHBTmkbfFfUnlsWoQI8nXLRmtCli3hzZO9pbTy/F5B10KLtrF9BgMpkrul1hbj2eyQAcb2sByMc9IIgyaOq62IbGqZAWeqwEWv5un108JtXv+nxb93++Q0rXoWv0ysNcqxwHzznAL2fZU2/Si+7Sn1t3C+Lz74CCFk3uqj3vUYitabq4MvUuqSyEk/4blB0UX0F3NnYWH7o6SB+u8CT6bdlnSqbdUJ2KobOYFTp787oJ049ss7bXOWSWbAoDFkcKUhvPcbsirtj6oGEGTMFapVp7V0pL/fiE9AW6VK3Cm9CRIqcSQP1aHOpnnvyVFJMQeHkEewrz5SLV92+tA2slXWAMiVGVk4W/N94ea9VqsnApXuyxplmW30416DcfPLd4JeI12+5G6gGCmbAp+fP44d9yP+WQLvw6eMfzCLsRTkI8g99Mzes7CbSqYJf+PpG3EIPYvzcRA/qzIsPTWXzab+AeWdhF04F9gvTyTJ4c+X71pVaX4ITGehiOLwI2lZ/kzGTfsuwsG3VA8WgOIAYlW+4VVwjAI0iUCAvI3ZZvrjVs+kbZ+8xmd1q1PbiUzg2QlOoS4LumJiBlRvApfuNhB8+eJT3nsiOjhomZeO0Ax/HImfbyDKCr/BX+PtdRaHOwzAindpcsmLhCc24W0MTe2OklY18z0DGskDxhBBDWEeNc41gd+MWZCmTyOptijsV+3+gNUfL4UwCo5Jzq6CNjVKXNrRA3tA3nxsxtNG0vo88TD6S6a61Os2K9XpUa5BAzh/Nqe1l+0JuUwe/XQvm3jJL01qxSG+UBz7ff6X7PyiBLlJOR68I+idetwZkpJNZjxYEIMgaAtNINci3vjwfZ/mSQJFEw0t4p5ltk/2wzczibsbhDxd9L8c012BqzoI1jiu4U3UF8lH3I3jx+k5o/SpCburgXKhN3Y3ZBMfx5t7KdVx2bMXJUjbHOigdzFkJtO8o0+rjFhLmUeNO7pTOlaS6cVYtQTszVoHJdxu+6dZddYvILTqq7vpjEUaMeLRo/it0UlPPov7Jz+kTdf2mjpe3jthW9lS6jIyLXELFnUjdVMUqHqjAZSJp65soMm2rxX2eX9YgV+TvFuJfQdv1vjEP1drSveuMrO3YcHo1/0t1jKfTQ5lIKaQWcVHTnnnfflrqnQaPAbORCO8rxwJapYWu/qJO9HDtpbQhK6IKZ9r/TRCYNmBOH7POy0c9kH8R5KuhsMtTpMUXLR59YBbeBbYlIjfcKCsKzexhZabp5mRQTuWxSRnrjWHG8Wa1laHswPV1RxiBO1R/DysXpqa/AK9/KUihsU4cQ2tzI9HxPclqO0JcWfE28CsSQZHuWizcP9ta7p+JZxNgx0gdHUSczcQfIVL63pqE3lIMQGiI8yXke3QcQfMicbBSeu7IunMeUW0InxVq2uH0xoNyOhJo/CxjA+fpCvYNsyQyKdXsSSVdxG9f5jwZ0CAdLScycWsUqaxUqCnk+fYyGJ8A+Zn0HKZ2AXaH7xhXM2Gh9FGUZvN3gieLlMbuRt/zNWF/vvn0VTVU3mv9DTyfwBQSwMEFAAAAAgAGpeIXAAAAAACAAAAAAAAABcAAABndWkvZGlhbG9ncy9fX2luaXRfXy5weQMAUEsDBBQAAAAIABqXiFwNhFDPthcAAIlSAAAaAAAAZ3VpL2RpYWxvZ3MvYXV0aF9kaWFsb2cucHndPNty2ziy7/4KHObBVFamL7ls1lOePU5iJ67JxRM7k2wlKRVEQhLHJMEhSNvarKv2I84Xni853Q2ABC+S7ZnZl6OaiUQCaHQ3Gn1Dw3Gay6JkvyqZbcT6dyLn8zib28c84eVMFql9LgseiikPLzY2ZoVM2eny5/Jp8HP5QhaCmT4/l2P288ciafd4VcV1h8OwjGUGvV7IRBbwfSwzHPRSqItS5meiuIxDoeDNSUj9TnmclQJ7nsbXKc/boD/F0VyUyoL3Nxh8AHY6lc/l9Vg/HgMVb/hSVqV58aqQVd60v4afrfY3fCoS+zvOxFEU26a3Qik+F83gX7qDNUrjjZHhk5ypsOC5KIJ5FQcqnmc8qRHmeT4xr4Z6X2nyAlUuExFNplVZysyOPaOXz+mdXaRmeFXGiQpyXi5UEMo0hXFcMf1rQq83NmDF2YFd9wBmegM/ReF7asELEXlAwuHH89eT45OjNy/PoOsXIhHagQvemHln8A3LyV5IeREL5uP7kTcam268KheTOMKeh/CTnbw0PTtdKqfPx7oT82WOwsKTMQNBZHvHhw7sSoliAiuRlTj0IzyxQ3qqe1xvTUNs+7z1/AV7LXgkCmz8trHx/MP7T2dHHxqKvBcLYL7wxs5TXKX2+TguxExe28f3wF/eemCvPtvnI1gx+/t5wS/rh1/iS55EsUcYbERixiaRKEVYThpS/Gkhr/Ap46nYZ6osRmzrR/ze10A877xYslIyPZSVC8FwOKPh2BFWkriFLfP4UmTMwAw2CMSLhQgvFDXHmSp5AjJku7BLUdB68iwCUYHmogphd3EADK94EbGPh2aSgKB9EGVVZIqJNC+Xdvp4ZtBDUDOOcmixp28jq6qa5oWEza5abxcouRpXlxuwVu5jkMgrkNRRUAhQVKHwPYZrDSKLA6WyY6wWC9RSlSL1RxryA/aW5zXZ2FchV8W1CKuSTxNh3iEjLFMamnAXQYvBe9ZMd8C8T3EWAVRPL5ie633GzOsxC5H/rBDzGLi1ZLBSRZXRcjiTX8WwE7a2zMw1JPM8sfMDfd/rRuJwqOV438i1+yk2YVL2WyVgVu/1T2/efj17f3z+6fDD0ddXUs4T8VVvgq/P3zwXHFbfY9uXdsrN8X3gfXr/6enjR3vvZCTuD/vbeIAk3Iz3JMpu4t8zp8BNfM/53sZhIZWclV9RBfzJXLw/8C5JU9JF96SJFNgZTHsF9kA/bT3Xm+ZPJvAPztSl9tIo23vSa3T075lxZmzEfaVG/jNOEm6/mTU1OPGLqihAq//yh4Xn987h0HhDv0SihKvYwDmqrtk2S3n4/oz977//B42RVY9bCbhOf1CLeXNSH1v6TQMMdX2raUtpzdn0WKdH6oc2RPt2yxqG1dCshvBSuzO38FUbXrvtdhTrPap/DaAxNp3WAHFE3/5uAzAvb0fHEWn7e01vSV4R9qVft/WcX9/W98aaauPygH9KdtKVJ2ubwfBq3wJdnzCNwLfpyRk6uC0Ha8y+fBs14gzmeL+FaCFUlZQAu/FUAjDWfm8fwoRjcFxEkhycFxXADXkOfpGYQFSQV6V5WYrr+mecCmg7eNICNWo96bEwu0YDYoAIXgXoY+V+uyu6INR7v4faA3Z0jZFbWbMqq9IpyJQvgnkA0rC7txPsBE93/va3YPfRjjfqQTB+WSF6LSkvwwUhGCjBi3DhF57/NfrL1wD++YL/fns4AonTuA1AnmkQfazx0ywtdQrmGLT5u30w+JkWgl/ULeI6FHkJlOMXwGhPAHq9BL0lNqz7lsmaO03PgjxbFCsjhc+rOIlIAEHV5ZyCLXr8eHg3PxBaK86aJvbunO0C839A5/Dp4x/Y9dPHnlGzHWAveXEVZw4sULgTQNl1cM0rf/Rl5xu6ld7uzmT3yeSv3sAg86txngNUDBNn9S2yM+8tDyECl2rxAzuBSDwBzzlEFnxm3w2YG4u1axxqaj/v7v5gDMX1s6cTpLHFUbMjt1QuwngWh02IYdnaDgMOHMXkkParRMLMMgYqT+ISyUJudNcUaNKWcPtJsMP874TqzQ+suNz/ToBugp0RewV+utze29ndgf92rdHcrnsMEf2AaT93a8pVE1ZBGJEkZBlRXHQPpBKXjZdd7NrqZRjXETvM80R8EtOf4nL7yaO/Bo+eMq8z0P/p9fnbN2OWxBdCUzMyk29/N3y6YWd8xovYgGggjGyIOgNZnRh+gybFuBweE+HbwJT9i72Tmajj0zPSBETxRSavMss4BhoUB7JEhhw3pdK6mkCqQP0GCybaMernl6/GdeQ5ZmcZz8cUkR2DzOf8wgawjNIZDHQFiZkONj8qCN/miZyi6UAqOlOxCPAKy2TJ/BQzWIWcVgoNDM9wdysMZA3KKoizeNQOeHElcVqE3gEMEjuTVQYYo3AQd9rxLyV6cHAST616PYVHTfxCUuCKLwL8bXR9CITHES+FqrMWde9t5gWg1Wbx3MPfqZYY+m23ytgRjQfIWeb/9PKIvROYZBNlGIx6IBXwuwUDf+sEEv0MVszzgFaqj+FtaLkfgGHWvQ/nkhcEg+caPVnMLezARXU1fkZ+7oTillDFIJpgWc8+EIhvG7XrYSRmAsKFLkizaI2OMAbH6RnECr/80Qo71cz4CuW5v21wKp4t6y0G/oqWblksNxpw9eZFEVIgdSJqKxsXJ9w6vvdwuz2Tza7Zz4VYHiQ8nUac5fssB++El/4IviYp+jjtzoVAtSOMDwTkpFKhYxFCAAL7MJUR6H9Qm8B5VTqqyOGcS0SbW4mcB5GYVnN/5h3j9qsVj6Fgn313R4NduOl4O0YBg1LzOz1N1sh0wB0N+jFMuFIMk5anfC58k/gd1ZoQW4CyWKs7FhYiwkeeMBHFJQoLDKOgyZhhrVVOst8qwLw4XTJMjuKipHmpNcjLGAwbXwr0bym64picIzixTiKlHH5ckYOBqjO8CDzrwpA+n4AqKycTX4lkNobeGYwtDpCiMao9QJAeHFFUVU6Jtnqo7tawDkEFBhL5FvSr3QxjwQWkUO+m06KAqfmkiv0OxEkieTRBFtikHRFQd8dODpoJ5eBhAicjr/t0uoCvWr6ArQU0qLe8mIMR8R/vjFnz/9CIsxzdoLm/+9Qgg58HJq3cKBJ6RCToCMHvyIAjb7onQsYDEJ+OQXwwnnMJrsEJKJy9PXM4EnwS8XxRBs9lEo2GAJwWGESVS9/Dd4AkjMYt1iODR5GWUV8PdigBjVHGZSIa1Nsh2xGewTCAUrD3WbI85mAC+Sr5VkHHF/HOFwIsIcgNyCQYWwrPcHiA50/4QJCt+qp1V+ANaAGLapt0eLuKenfAJ1lEnwqe+7cwyI5xWNT0sbLwrCUKL5r9DVosMdlh/KCfN6HwBdlrD598rxmhHMmg3o00N4dXfgNnsHdLTPcc3GgTTco4H0i10EnOPvP+gQuwiU+bTJlTHa0EtbtiVz34mmntGtcHC+yluDyXMlHsR3JLrUD8aM5xVOB1EgD2XKie17zY/A9PWfXmhDeTz/CpZ/YlzMoyASsT2VMnxsMQECjVCFB5IzD9os87wCAB41kks81S+/dXcmvGUXY7u6OHj3N8ZTEytG0q9F2LrUPnROcWFoA6UzIR+yzjl/Gcw/QBwtfnYZ2J6VRsn7Yk28SHTau1Wkxnh6cnYJd+q4Qqb1uBdwLoLi5YyafwhI7I+2N3PLz8YH5pfdlanhtXlvXWmYBbAXEL6qEJZk1wXucgsmP4wQ5O0KKS7jKntZ0ESd2HlAba2gVoU1GcA3DwF7R2+95MeBMEgbcGxIsEohx98nqUYRYt6iiU3gjk1Xmc+81epHSUQ67njXpZnbqZwl69VwdSPIdRxMQSxE/O56A/uTl5A3aqhQRnYL69iFE1kofQ3t09aNYoKzUx4A7sqX3HnK4cgfTi6b2vW1J+AXxYikmM7y5jFQPDyAkc3RGYZZ53BuQgLV0qBtJWfUCwk/B0W0QYK2VgYQx+ull3Jexi8HSXfYjNeoINcDjSmmXcyGCg+5xKFZMKOC84QM7m9kV7BleRA/wP8sp3NsBfmLfvjRsU2mNdF+tLLTPf8GzfDhiyY8bWuWbFsWfm9MUEqI0TTo9D5uxER7KkRuzgh87KmJEx8L7o+Gku0BYSJ9lMakXQgIFXE3q1yll5yM4XsWIzwTEJy2L0kUlBgRoBH2NewHJRHiHlS4rFqBGPvZOE6XNiVHkdH0aTp2w4oYsdxsyYrhEB1EfEWoHrcgRslylHO5Akyz5UpziBpZiAUCVEoGwKJgaVkkAkswrHasb21K9/vLvX1sGj/iyo1YlKpY+WUQ805gb8ao6JbuN/Bey8adZIATphIimlBSFVXe+DlmnIRWuWaI3P1e7UeHJpBXFpz4lzhceR3QaIIzamLxCAEtJU93QjDJtXDLFcCLvauqG1HXH2ExQR35aRrO3tqK/2mpyJBCs4rhZxuKi5XUqbELJihqveX9A/vEI1ixxm2qDFbN591yANDuiT21+FaYkpfLdWqdYUxlfrqwgYE4Tg1F30dLXpgEyZmIlvwbEBuarjWQlxfVhHmUPS1lZTMG5N6LBSl53DG7B8YJIlrgu4XYmTJYOHIaV6RupgAX4dFtYoBV7U31thJAwbDH0bgL3ea1Tnyawb1l0IAXHDTJuuMR6SkfaYySQh12K/J5u9F7sBews+AARiIJfoMGMgiFVnFAiCyNdOp40EzdL2IO0FdBgYLng2t/7My2XG0zhkHypMbMF2I+bGWJSGGdGqsKHBKwGryZMeUPzHR7o2o3gelzwJiziNsSRvcwzveMmvFrCj8Ak8qs1rDma+2Bz14DwKGPmFLRKafSyb0HmM1FMMPOdxpnPahdjSktOD+xjZZ2xAKPMlmalLnlRGO9zFJhi/3HXKtdev+nQ8CXQCXp91HW+d6YpCCHNCtc+GtEkjV2v0fbvTbfreEexW3sLCcHYW4jWoZt7nIqP8HBjYJGcvoZ+zdeywnqZpO/GU3NzvFagGgH72sUj6h8FY/+p7i7LM1f72tpxt1QWdcTkFYQhi6bzdxu3WcV9Hq1nc4YelYW2qp9EDQ7mMvvKDeEIHELrctMljwESOrhm0q02XFcCRbToGWrlidWLIPY50h/0nVizAnfRGgpd2jKdbOgfc1MpisKbn14dfo9tXrM0KsxotOhy2FIKynUM8+UBNDi+aviuMZJ04vQWZBpCbCeSXYhCPM6plBScxTnmxPOjk2MwoSmjG1wKnKBf+7t7OQJ9hrKn5DlhbMIPibASyGWh6/TceTMRhKsqFjJpk8mBous9gm6KFJBLxmJNq0ZvA2/MwdcdLgYWxoLQhRsboG2EEzI1vWSrQqm0SwejbYTgOZuSY48FgtxHj2s3AHhISx+J/Yvi9+7R+k6e49XQlvI/NY+o0cjoEIKGJr+vr/Z0xM/+NRrizywLm1An8ZgiB1GX2fp46sHA1P4gMzMTrGJPUplPQvAsOKX8ZczwvbUaGOLn2qBEL7wF/yqPwmTfCpIbhkD4drXuEUfR09tjrzH4qMp+Add4/Lyq1GCLS0WIvC35FCwNigHFwk2daeX3hVAJNx8Md3VsMhhF0aFvjhafBB602RzFia5DKS3Eu/d0xe9ZpCatpHELT4zF7NGa7e/rryeqO2GUX+jzWXx2QQQS0EwY4qMeUvMrjZIihPVYjnKMkiXMlfMMd/xnONWZ7wRP6pwcdU5YXYqtcgNGZLygFAVEOKHYQ8Eg0dYCNKLRzWvXC17Ixe/Rsyp9182MaO8y2+I8MF+D/Ry76IKe+qzjp+I52Mwl6owiGc0DdMyYsv9c5sW6KHHMuEHmVVwLotAJOmRtKC8hStTc2ZiAOWnkbSgfqFF/rxBPzE/i2W5qGpLj9sE8gwoV8KyOszjhwsqHBkXkfnHKlwCeM2tBoLDDddvMHRr7DYpVkKO9038wfab/RHSDVab/XazN+7RKcu9JjOfFnUDSQy7w9j9knqBHH5uizL4FvoI2FumzXOUQzAQHFUzpAK9KWzPXKGzv3jfSFIQKof0ZxWFqNV7s/+HJMj3QE0gLYmwE/dIZ90AbQyc6vL9frAKFpXY+SSGmfHEzWHhjgh7gFEIncfiJ+RTa5l2GlRcUzBPQXCaa2cASd7JvndVDFmyfqoqtA+AxPIHDZbd1bM/PdVAV+jBognUN7ADVQt6zEAr37BmkNd26sUbVHpSapvhMXiBRr7ijgcg6DiSrhOrDd9cYqBtGv5hBFAdp/5h3zGO8ogVwjJFqyffZddKs3bkNsLaBm69Vu6MDWQxeYNpbdbQCq3oHrN5uRYKf6AT/3llsE087wr5JMvfR1uXBHBj9xMIR8iqFcGisqdsO8QFxQ+Q2eXmP0Z5LRHFM95L53bJAZcMC+1DcCnSt/7Rt6dO74rQXAzgzjL4gVlKGvwRrjV2/Ri9G3rrQbCH0+YUXNEr2x5r5mcAU049l4rzN+qB5msMV7a9A8Jr54w71mlJKts2I9bmLKi1QXSBymlYJfwZnyDf6jm69ZNw1TT09Cx7PlFV/+nfm0u1rnFhVsM1ojdyqMASDCGq3A1mWLLbTTcV7wDxDrf63r8E7eG+bQkMFycL1s/3VwC4LDBePGJ7qjjaNKE2Pdroq41Ju+LWC/406tO572ggkL1iUThgcFOkwL0gusDdQPytTOietYlRN5cTBw6gyaE09FQN+d6awxqZ5SguDVsLu6s2GAT6osqtJc+RSMr4ROkohKAWxNFeLliFmFR1zsJ7E0x0xaS8LEq/a3u7dv7mMpFZH2/8xQEjM7mLobARmPFeP24HmslUN9d3q4GGtojf4MY6xIL60wxi7aIQgXHn9anI8QFODcBda3xQOnPQNW+bAsUbMOnJ01R7LuJWnSCboSAk/gmjr9lgW3x1qRLrm0ktU+3DNuOLmAo97QzrVlA2n9zWX89JwHQ1YzN5L3qC1utnFWZSGEKXmv1Iu4Vd+s68AKdENfTbvX5gbHQNPAqObqWHeQaRkYYy+QdUfQ+1X950NzUMtkPjSJubfXHYGvB3rbC3nd7vR+oH9z9647wrS0x9x0jBUsnSMvdiV799Z6ugx9Aezd11/383/cvfkxU1WeU5G4xQg2qIvGTd9h6Rv1IaP8gB2DMbDl2fbahjlbNJc1cH/WyZVE1FUQHUDgPYWiy2zyj9C1oosI2/a2iC0v7RvqC2DNnIojvUhiBTXRh1VyWA0445nybro8X3kpibRO788OUBeic6CCy1SbG1dhzZ2bIZ/JGTzsF2nqvngOJO8buST1wMFxbkX9R+MBuxX1tDBNVb31K1qwwl/xDhmIpv/wocajTYPV1MD6MNB/9CIMdPhM1xzoEsWvnX2i1aEOPHohgTb3NM7U/a8P5nX/JpI3o+z7VfchwbkGA4/5xRX+RR0J3QMVO2QAm7rpDgjZvitwwprXe2NVrUGLAN4ZsYow6+xjc8UXi6W2VljslX+tpAWq4uavqpB4UKpxSFu2KXQi1W7g3GfOYJZLT42bd/3fdBm+vQpIVXwYaH85WsjaBan4MOTBZXAgrB7VZiTGGb2ud3Ad7aetS+qFbf+ZGBG1XECHO5aEgYTILV72imD9xKoQJxi3k4xutMB97zhug/au98peazWXxw0yvW6pmk/wEjHd5mvw2R9GqJM4MVxxlmiY6/UkdulXrrbzB5TYFVfuRsQcBrKjVdVi79my4aQFgfxFFPFsyeJSX+AGLX+14CUVACkhhmrJg2FofSHtp/z/GMmhrGDJUDFMBavJbpduriP1NBFcmZJNTfC9azbvSvrdCPS+Zr3K0oGa0l5hYT2eKjFW1WVhFQCGz8d4CjmXqLkdWsYrgeqj7k4h0tj8talcF5aZOwnGB0D29e4O3MHtXBU2r/N9TVXiB9q4lMykrJzJ1Fm29+fqHGYMiuafkYd8J23FJKPbGCszke+cirqm/Mzc3+hptWBN7vHuZXslbu0VZXs1OE6OPS/d+mMsz15VuboGs3eyBF+R6prXFjMj+DqQ6d7Cwc/vzoS06+M7Bqw7SNu++k8oBloiJzClP7pD5mTQQxuIP40I67zKALEz70Wt6QbqjPvCsf81A4KG18GRjs56UpLJriotOrh3VOvYXYHRxv8BUEsDBBQAAAAIABqXiFz9AM/M+gMAAHMLAAAcAAAAZ3VpL2RpYWxvZ3MvYmluYXJ5X2RpYWxvZy5web1W3W7bNhS+91MQuqIGg0OLoRcBfDGn8TYg6ZK5bS6KQaClI5mYJGok1cQIAvQh9oR7kh3+yKIUux0wYAIMGYfn9zsfz5FoOqkMqWVVibZaLEolG3J7uDNv2J25lAqI8Bp3Znr2Uy+ORxvZzk7vRVGB0YMGXRB87jaihreCY7ClF/y8lo/X/CB7EwTXfAf18F+0cFWI4egGtOYVoEUQfJwb+6DLRRrKkKXOFe9AsaoXTIuq5fUxJd51WRCd0n7wBTBtDjUU2a43RraD7dYJ1062WGA5ZDUgyNDqGv+CoonecwVFguks8pprTdai5ergEaAh3fTCJZ8kyWbTdFCRjps9yWVbiqpX3AgM+/eXv4iCruY5aGL2QHbOEekw784wtF04JwWUJMtEK0yWUQ11uURvClqzeidbCJHso3usk6bsqOzV0lEBjVmmwfRd1guaRv6PQqsT+axdKxCJqDFeZ6bC0MMlMgYD6huuEDVNX/+wJOPvlMW24zniS1+9DsnYZw+8AGVjOuLQAcPLGL4knelbd5ay1BGXJluoJJAPvyRL8urN0tOZ3YOo9oatZV2kL/LhReG7R73HKCXRlnJM6Ch2PQ7ZCY3d/LMXSA5SSkUasCBUhPeFkN9/FgVIoo0C3mjC24K8/e3GEsICxkgydbkF4xjhWGMkwfQUKUsXx7OEjRbpJEsLw71UxT2ynr5XPbw8vlUSiWIONGl6g1RekqneCzisYQSGzSobiTFedzqjmlMUbef1hpt/XsslZ+/DHvsD6j08Yh9vAwbT8hlLvurmsgau/F2+avkOL/YMjKiIqNKZp6jonZIPGrKdabGWeFTQZO2OonxGXZbXIv8DCoadbiEPATKv8K1kRjdRHqNWwDyyjdM17bdaNKpYb1ukpsn3cXP459P1bvEASdMp0WArVlNcB6szldvjcykMPQgeThEyFDHanUTmRC0ueC15MZl6HuH5zLOILklmgRt3m10Bv3bQWsk73sB0CPixjPe2xlJJmAh+MSBSif39WNfEGmtCv0tP3t7SRb544XhGbXctrCiuxJU2q8Oow9TZbCP2RtSa+aUUXsMuxDFVZF408RC0VrEC7buCG1htcOlCSnD0PT1PjMJeWwVriyRNvDCTnR3mGgF6ek7/VeVhADgnfiY4hKNxDo85dIZcuRd6n4LQ4c6OFx+y7X8A7mseSmTFYP+ghIHBwX+HHjk1R5q00uAqCP6mdY5xPs3NfsfIM+fnND8NfbE28zYa28MUv8CU6Oi043Ht1L+mCtHXHTrgptdZ478fGTS4WCYfW7axRXKeFYRrAtPyo69RlmMyIud1+OJKrpSSCplWJhuO/SrsSrIhLsgTPGOYfwBQSwMEFAAAAAgAGpeIXGeQnQ6GHwAA8YEAABwAAABndWkvZGlhbG9ncy9jb25maWdfZGlhbG9nLnB53T3tcty4kf/9FKjZH+JUZkb2VpJKlHJSlmSvdbFs2ZJ368rrmuKQGA1OHJJLkBopOlXl1z3AVZ4wT3LdDYAESHCGku1N6qaS9QwJNLobjUZ/ARLrPCtK9l8yS58I9T3JLi9FevnkybLI1uzs9n35+9n78igrONMt3pcT9v5jkbgtfqhE3eBVlpb9b4+5vCqz/JwX1yLi0m34k4gveSlN4+AJg8/7oxWPrg6zm4n+ma0XWfPzOKsWCT/PRdo8eyUSfixCoMY8yIr1m/A2q0r94Iciq/Kmw2v46rx/Ey54Yr6LlL+MhXl1yqUML3nT+TwqsiR5UfDQPHCQuQgXh2HR/FBEmt9ZlhxWZZml+sGPbUxM87GelGwpoyLMeTG7rMRMiss0TGqOhXk+14+8rcvbhNeNI1+TjZoC1TSeLwg30+OcHip8jcg03atSJHKWh+VKzqJsvYZ+oWTq25weP3kCU8KeGzGbwUhv4CsvgpFchQWPR0BlzJdsvuJJPl+U6fwXKYPxAbGi4GVVpFoq8LMcWfxjd3dskRUxLw7Ys/yGySwRMbuLgj1ZFcsw4s/2xvd/0k2mRRiLSh6wP+Y3fxpZANkijK4uQTjSeBplSQbALBBPCYT1vOQ3JT1bgtBPN1xcrsoDGCOJXajrsACCp4V6/1sYlN3fOy0sSg5W2TUvGnpsRBZJxRUd2/BUpJoRDE/X4RWvGRuEabTCbrIsxmz6ZwcB6raAibIeBmP1dCZ5eQFkB6O/jOxH0PBC5MHoXc5ThqMATwpWrgSKQLoUl0zyqBRZavc6qgqZFcH7cqa+na9AkmZnmUhLkI/XYRqr51aXF1WZfQiF5MFFUXHrxStxw+Nz8TcePPvDhD37g/WK5PZ8xXkZtCTLNIoSEV3xGOQ2TQHNIAnXizg8sBfUjHoqts0L/kvFZQk9+FqUmpkampbTxZMnT6IklJIdEf1noDQCvZy1RI9GI/WuKkJkDeOgZoBrOTRl//z7PwBUnsB8SuAjZyfpL5UoeHF2aziaw/rNyxnB+iihWWhpGFZmLCsuwxRYArwvkaOSLaBzWPLLrLidwfBPqC+Jx1ykopzPA8mT5QQkNgUkiudvs5RPAKGCpyX90KjjR1aw7IPxrO6qmo2bBgBqpiGBNOlv7uu5puU5u7tvvdG6yPeqDBcwaMxv+l5KUsq+t8CKKp9XImjhOU+yMNbYWO9sCYBZWPN5tArTS0tWVG9ol9zOqYW/s4I8r/I4LDu9rbHH1pxYQPW8zIWcx2Fx9Zykv5kLXGwg1UykipolcOdoJZIYZiSwlrHVBT9iib1mqMeCMXv+nMGqdlvQ+oAmO5ZRg3PNX8TDGi6hXQ2VSrPHqTatJqQYQJ+CKMlTUpwy+P63E9b839fjPA8jkPDg2fcaGfx8x17zMLZEbkU/EQna4QN3/Y3GrYakVwCVgKyaYHQOC4ezjycjwOL7ibJ1Zj+R2p8dgtYf+wCcFRmsk/I2GOEzwBF6N7rLoiKMY7V0A9XZIkRWi1KUCbcwR5MEBQw0l1IeZo3P2BFJKKgDsNtkeM1j1AVKumZo7s0sQg1kF1N4OhhZA8HhO6ghptavu8pgbUraWIyaspaaEvk4xgUcqM4TGA6obUttjOu+hoe4XHS6OD1aWuMTNfkMQABUT0OlQZqWLWrwozU9wqif1wRo7QZmYcnnlzzlRZjQi/GEjX5Qv6158PdbgiVbd0Kzlr3LcbLlzp5xtklJq5jex/rBzp4gAqBNQFlHzdBnzbOd/SO1duu+ei3v7hevmz7Hpzvbh/E14tNQ+EI/2Nmz4DIHHjbkfdAP2MVtbhPYlXUjc46wv4hj2HqDv4yV4aONZlhzPIxWZrOGXrO6T1ncuiKNEkedYcfq6N9aXA7YSEGbaoEaTbqNHTFpeqAoTTP92NOtlo+mi5EhX3NbIpoeluz4OhlRaDpoYfE2BhmwGsZrX6N6zpuWRi58zd2JbvoYiZiW+NzteO/8WoSFo3tKcu8CV93gbkyKY8KUaYj7spnimSj5uvZq7I+l1xpdhV5S4FFp1GFJfcDGRtOsCxA/yGGRVry7q4e0PaF/qix8b3cwxQMYY9xlJn60dztTEM4yKVC+Zh9wRzwXMff38roinhEagvlNxPOSvaR/hHFRzCcHK9tZj+Ro6HUo6xdorjRWSOPzW5PXNMFFf16Cho9WgbXYYYNMtaGGuAMg2ynW7o+11VrKpNW143M4JBkHpB0wmSGUj0XSnSyMyszQo3+TRWGCSiAA3y6w/W8UJYMBPgDDzZWp5lcfS7QebNFiMajgtOv4ePOBt/afpm2HGR6zeCtCDSjbagLbx4vJObwAwyYvBHjmt89dA8f0qp1KGAJ49ez7p542frzp9SC8DSAL66aNFs+mo2VnX2bzMjNTsBQ8ibWHgIqD1AX59hN2xW/pG/tvUhLAi5YbB27g2/BaXMLOiHtWyGTOI7EUEYIC/RUztWuESXILmi2q0M/Um5oyitCrhGHIoTRQOztcv3KrMXaFcZdyU9ZX13ojtayCC+iOnuA4pMLa0NOsJO4MgbypcTcRMsQcenuhbgbB/I6p0CH2QlYLcuCbcCIL1pks0YpvGbPGt20bq9u42ZkPhYE13Iynsiq4EswfhRQLsCMQp+tQAED8kbL3ZQcIYL8KZViCslFogEHlATXybHgNNb7Bg41LwvZNAD+0EeykeqPcOhDk4IsGGLopkV+jTU9FLXJzjoZS20nGiBA1xGWopjlESdiIcgWPsItxpMEthg3WWXO1YFizaoc5FKeBeMVmMIbE3xCVwFWAaDGEIlV+csdLIxye2zH1oO7gtnLc8qf9ePj6a9fKCBSCs+MiYNUn0EGrPHxLim5irC4Km63AI+fF8xFo+jLLklLk8N1i9oa8aR3dtygk+ThrIFC404LYtMSFqyC7c7+xQ6K6RQv+UcLDQu1HL1OchLg1C8RBIPRDtlHmH/sNGx0ALdaqcDTSJ2AAOaptJm5anJO5SHs5txbp/DpMnj/FGOANff0jfCbYPaySEl/0c1OnPtrM/IDxiECDrgG3Gv0YJhUP9DBfyuNvx70I01G97DNcehUmkm/jlMlqtVlFz0EY/v35gHm4Xj6Qj7OVfp3Gc+gHuCfkHFH3f1/ayXjuJV3OY1GQUdnDgCLbeFUrPPc7KPDC18oXKYXlqf83dhnep+h2KqLHMd/CsrF2LSoW0EDyjmV+SI9H7XbDnCU1maqHmqONmQ6fZ+NFUfUeIETOnDxcjGwslSThhjbHDFCN84E9B+pZ28YAs+C5nfBGE/DljZAYCT4WBbAqK271AKNznsADVj+32MxBXXVhT9i8Cx5dXHzyNqyzEgYyPh45koNQXLg1mXUmEdtoz+Y7NoUPRY8PK4GbraQnXUPKjqi2jCjbaKit5B77qz2FtWWh1vVoDXbJPC8yjJ7BpI9O4Tc7a367770GLnxqLXCxAssuKsU1Z7oTS4GNM/YSI4XmEZjToEAlyzYpC6tyRZEE8sTisAxZbObPieP70edliH0Idf2dnQG/8cGdcuKQ/ff7d3rw+/0ZNtq/W2cxT+Yivh9AFkJkoLLBSALTFaNfZuB9/M8ihJUuAePwks9+Ts+rHEsHpG2lSUxgN+hMWI0PfK1R2U1wLGSUFTGSd6y+sp/4YpVlV+zjhzf4eFWWuTzY39ctsVRhP8zF/kY1k/uz2WwAyQb6poFOhEueYtqEqaoI9AbRlaYMjQTa33Bw+BlwqrxFZxuQIM/KQFPZQTlzgiSWJdxdB3WG4CsvAlJMmqkUpEgyRQXyEOMn7E3zwN7ydnLuQwYeci3DbLPiBWcm1MxjhhRZuashc14QHWGppt1AfqWf9WE00oJVSV7gKoRFYOLAGAaGn2vQU6H6PkgkzMiyLKoIpo03i6JKMfGIFDHDSRCHM3cFtPAB0XcQwqVQY2SvC/i+FIUs5wkvS17Ab15GuxlHstNwjhIHr+qfd/ia8JjdgZoeogde6R6uLmjPbZfueiQgBIeCf3Ad4L+KulI/Tav1Yjt95Nxo+rAXAL5U6g73GvbG/AQLidyap7upOg1vmBqYZUsWrcICVDggvr+BJSsZVVHlGKnB8XBVizRKqpjiJYYyJPoprMM4owCRadF0c9runDkJbjXmsUiDFrQk8Qn7YD1hAybsyBATyDFiriEygi/bBLSU1xXnuWkZyqkYgDfOKi1SlI1G1P4TPtPT0+nx8ZBlpuUK+uJCQ2WLUqYkxt5T2ui/vAlBKjkIXDPehNE/U3wyYcfHs9PTGX73UqJcHku45rgS59pVq2XsoptDsj+fRmqVYnuUoNHn/rY10a/BZdizJHiPUWFVBcZ/fPBzOmUK5oF6BpTH4lrEVZhY8orNcEDTaANs4vRE+sklT9eQW1SpUls2vcpjwAqBtN4Mtu4Climk+qA6xBk084SCtRQle3eurFu1fsFqXINFBJP4gWNGAzZZVdVAMsiV30LR6+tMxIwXRQaWIxhNPwEnwNB+wIbqJM6/8qZqKyd5K0FLzpcF5/O1oG31FAT2FfxmajEHp4fjWlPtUFbYV6yrNUN4aFZcqZXJsFIN9qWYLfgyszbaAVMOpmeGufJqTWsWK+9AweifA2cZO8FCBQsIswcKGJaTlYIedLZ9cGFLHsaoaAteJ6BxjWMV1G6Vj6ElVKpzEnFlsd+wM1SzR/rJIH7ayp/42mwACJ7EFCxUUH1gxsJz2oq1jq9SklagKTBNgFjVb2yT8B07FGkI9oJOy+8ww5bLdc4vaad+hd+MIa+tLxVyGmirwyIjaGyhMEANiuoNpAh4HVaxyPZBgfAMVSwP15IFxx9OmU7Xj1ubATh6GpygTQN8arB1SMDZ2YuL1/55c4TtmhdieTsHRs0FjHFZiPIWSf2RnrMXwMAT6/l2Yi1jk08VZCqhrCHjPOKcdOQPizDRFQPlNKGd+r8qEJ2Ub+ANbSLnSbaB+V5UJRZSAgmohouiyssahjIICn4tskoiJOlOuqm0wOalVZymfs6xrBfrQOoi9aCuzUAHG5qwgMxAhruPtAyOsTWMBuYNJ9kD9fTwhZb+MGG/nTD8rxMeYWuyXj6NTtbg30mlKkB+6NuPKEPSbI2jz24sIFo4odC1Fe5Ur+2IqBuV6mLcxHCiha/6y0RnliPd725dzmg2g/H9CAM20cIb9vGzi7J3Ii+3LF7b8iGlJKkHcoM00nn9c4DZc77iILC4+YVpvK8gkclWpSxcolTYAi1pZkKll8iZgp5g/JS81wl9wB7ZLhH7httkvR1LviY5qtfCOV+H+Qr2NHz8DP73uwn7/W4+vm0s+SyNVI7YYhsq83JV4B4UPJs++x2qutficqUqmHEHhd0LOM1tXqM2WIe3bAWGS0E2jTJXdm5XNXXUwSUv56BR3uBzFvz1cF8OtwWcTWj4rNqFe195Rh1VvwAH+GqOJgj8OMQf7AX9GKrUtRZExXaVYpAMC+EzVaOwD6xTOzSp4XqOBnrDUvwNzLHwxlgO5BPjqQJ88HTAMjX2AgXyEBqtMI0FyBKfXc4mbO93T5+eHu4xWKN73/9wuDdjOGdppgTnQbhapuODcTU243Zcn51aCK5Vn92irQx3m5fKc2EgWyBp8XB57vBW7X6xOTVBNe8EsoX/bp76EG4Y+uUIawY/EGEPj3ctXV07+7WXLTm87p6LzHKejK747RT3mWntGLrv/8pv2Sm8bz3/NIriYo28xn+/xy8AKV6osHoKvmvbMzZ87Ra/mQTECtxktFMBkAohLrGAjyNvf05H3W5vs5IfMEDw+JC2SvKq1Z4A3gmV8mTFFZrEAczLy4sXYL87UKyqxV1R1CgRAHYqKDh9RD/YybHKmTzWiAeDB8zMlLOjYzDOCeZcxLOFjnyQv6z9P7QH9hRf95A/il6UPx4Vt2BLWPa9f7HYxOSFuAYpmgIgMmfUT+TkVyRIDzLH2rKcr78aSTsWk1NY/i9ZUfFtGq5FtHVVHas2/pWFWZeNsY1GsbgUZZiAyQiaBeYDn92El4mKQRXhkvJDlFET0aOWH7oKQLzU0fx3r5g+ITfF40+4forKRPX1kqT9eeZdlSdLlT7Bfgvg7ZUE3amKE6tytU8nqii6LqSEQSZY5sXkRgBcFSkQctuClwfeV9NGlnTQBPAFdxDMxRgdRD0pRAl49ug4TDFUP/YTMWUfU7JO9hN+GUa37BrrW8AsQTMdj28iPeiU6vlVcCV4zhF/mJIZJlMRuLWcJKotSUf4xi9H8pdEqIgtFTOrBBsF2x6im1Xmj4jmqVq2715Nz9W54T1JCRFwbRCNPl4qRA6AexJNv98oU7zIFuieq3L7Ak8ZEhDZAwRpOABDBx2hYgK8XvNSYMxRkhvY08tQfMDCEvMapZ24w/Foe0DzH3RSFXFmeUfjHjG8EPkBxr/BQ8tSPs2WGO5SKcMJA6Eiwfjh4wnbA1lHSomuPeNrPlA+yPjeqXO0GbIIi/b5kMYpOey+7AYCt4kCbtDAnzqyh6b7ZYEhMhwXLSPQ1xLj0mDd5+DVe9l36mU2zA94YOSqaQ+OgoDfhFsyTEWJ9jemAdrsOtcv2UX3pWc/3KZXEx6mkhya/bW6eECli3Q0V6SggLDWA0NbWp3ohLufc695kksdJQebRylQkC6QuRjLuKu0km7W4FvoooKvs2s+X4USHQRQ220OvoY3bB+0vjreiCURaZzQcURXQ3UpPM7SvRJLKFY6HBeQzpDl2Hcg6HXTLkvB5EMzLwZbEpdZf4ffMEVBgyAMQ93gC0xPgQXyueCyDeIRO6opvmemNIT0DRWD1NwhbMKkT3nutajco2IM+IHQuNw3xRoUx4gzeIGWr6KnTtlugexhxx7IVGpA2BzBwAvYeCmlBGrgXvA/hQWaDgfsmCYkpegyrHdY7ND/n3//BypKqoyOwK74FqtcpGDarWGwMJk3iZNWo5OmUR3abTd62Kqn0I9kVc6WFdk5ameg0/uhk1DRZ37RTtmjICDwHRosl16GolqIMcRdB6dlhOolOD7cpw1mPMNKFNjYdFIVM7vLKkmmYFGpwgZs/wgXaBejcV9Fd6HN2wt4btWruW97q05qr+KdWTtNuQndSsHx7hJMe8RWKB4EkdmRUSpdULaZXRD0JdK0xIsSsJQmy+chHVKb+wyyE92QvYGGLNDH2dBAa+uTh8nVTyuemmTphFlgabEiVqRXCj6loDK9BzGEtZpgSgc2hSyTZIeDNOQ9WzNsVSCY4XIJDJfs6A3YMAoSeWd7bJlQPvYhIkSRr532i5oqqp6BHrLrMGk7+yM0YG88DbCWb/QABb1eh1PJMRyMuR8cEqsoQL8hCvRbMtpXN8h3cDoLgb7tpQrK9+hULHssp7CvHzDEBzZBXS+4D2o0J7c3gEnP8PYNVUXX3MCDHVRpzPjb8XeRgBm/lcGH2MLL4R7uDuQlHqi+UXUzoAi/6tKUVyKfV2l91MnEwjuWHbQDv645EnXkbfdAdY9AKWa9r/N6q5COfTELIxZgNLaWAdBNsIGDRIGNFvd4oO5yt2FReb0qscO6C1ywys+I7QQ8XtMET0Kp6ym+hSUoZTJXCdoOq8/fsB99bz6NInD6MooclqD78d8lMvwx8QocJUITeqksKcLF3KiBO8CLsxMTy+i1ghQ+B+S41atxD9NCai07IywqsGR5DySkR8HR2XOrJ+zTasLHPZ2JCQe1a4qkOeQEaNUVTf3MN1ASPL2mitSOkfQyvabAYOfFlylcFNMZDKqMYzrkjGqCtnTtIsFWhlakf+76MqG7GbMjhuhcMfFVYogIca4y/s9bfs8Ioxg4PxS7U24ifg2LaAVbBwWc81C0b0QYoU0nVIgQ/eYET+3TL6vgPRdpqiDoQpCGN5/rb7hQCqoCaLB0M/3eNNZyRM3vCiwuBQCzKMwxUImXeI3xQX8ukDWishwd0fpT529UUBhB7pnQL12+AJ7xnVtNe18XndlFgyAn6vocdXcZ1USqktYVVh1ik301EG3tVHkIgw0MM+vzDW9QPvcZlVG3jjfYt1B1D4dSR5O01mewdVyxDgCYA8pbT2O3rv5Td/fpews0XH3BHwZSNEITnN7mCgFyGRyo3deBrxKjvvLLgh2o0neVLxjj/nZ3/8Tp+x17lWAELmUpXb1m6CfC9UF0xQunWz2YPbbLCwCrbgprjXeR5dOEX/OkrfbYlap4aZ8OsY9bmJMIn7uniHHAT1dUcaI4TmfJsQxk3EbhrSJV350nO4joF3M6gEbXAFAQrRsXCVTOuL4ABoO77bJ+t5DeqQ7fthD1p1Vu3S1RVsW/QyF1ams9FaifPZeGBE1RhUNst9yyVd/YLR301qT5x1RldM6IulzP317V70ing10i5O9l193YPTtFMq26Ej80U++h65tsgE6JRqcwolV9MGBGrbl16wKspHsPkvHawaybbG5lVu3MpB9knd+z4Hpp6MnDbcmlND2daHonXrw7BFpD6olB2TGT4aGFBr+utzzAxau79/tLrknfbxHipz09HlWp9ZurKh2ld3fvvxdJoieD82yaT8C8i8qeWyhQly7VgQHUof5G1BB19/Iz7ScEljBaepV3fdsUqrL2Rpm7NI1s22TUJcslCRv30uNaYz30EhmW/fWZtmOZEzJgeQGEDj0v8DpKVu+23d2IJkRvxeYmyvrClN5rr2DThsERI3OpiuJmu53LAnPbX32wuWdmv2P/cf7urZlXwKkQZGES9+S+Ci2Aj6taYcxPSNizbr3AAAXEj27KVF7fXJkcI6bInwF2RYm56FUwyjbz0XhMMTULcboCIcDRJ+TDjHsQx48isj4pS5c3xtU6lwhljOgg8/Dwrpdj+Ome7N0yAN4YNQgyuBv+2dA3QPTQ5L2PpYuLugoCrx7rIPO0h0p1F0tAPV9iuGJC53Do6yAGqzE94HtJNXXLvYJ3noHfoLP/aqlLlXmJ9cEl+SeW4n5O8hiyJd/ogsYolFzO+kTQSGC/1vfKHF713M+Ja1iDmENCzPJgbCqje9vjpOAiv2tKAupAjKo/ZKM0w/9myyXVON/3D+5Ohan4Vr5AbyeaGI0DJT/siNAz/M+tcm7Bun3w2N1qc3fobYvKD3EB/irJ85et0wHg+iVWX7rRIwbqii49FN4g7OgEP9r6lq4/P2dPB2G/9VKuB/NCQduuulqbWOv0BaMA8SK74QNujooTbSy39m6PxwH7t3qnOsATunbNt6k1ULde5AioK/vsgCr9IyUHvdaMOZUh6lMZYX0q47o+lVF6TmU4vPbee2Yfobjv2Xc0cZ6r0Bz4u9dcvzDozAi47tKoK+UUI+U1V+//P7FIoawIf9TlZe34Qr39dBwSWAJiChqk5E1s6eMJJgHpIsrdq8XPGI/ns9PU2626Wjakz73qtZC0wti6+PCjKIdhttWY9OgzvGjdKGwcCUV9yEgPLTd5hDptDdZbDLNty2h2CwXtS/aK3dvEY0TdvoofhbqScx0pV3/CofWXGNShQPuCnNaYlBZr3WyTXc4oUwaL/xU4xupEMu01arM4YHe8rQt24bUDVBM4tu4c9d0qmCVUIO/ESclKpCsp2vfDbwsd1wFVdGECO6pKe68T4qVNuBtYxSo0rNLLsIDFhHMRnC+Ai9RhWFk1C+IJqx16chVxSXnuUl7WsQN14QKL/TIXf9LtPrt/LaL73tzrBAP+WpHinmtHvQqzZxtRM6HCzRv9lx46gXXMnrXPMbYo+BrR4r6g8Leh3BIak79oB8GvJjVPWkzp2bysGHcnPuNBYwAKbth8M6MVELSs7S3YuHHyr4lUOwK/mUWWvT0Qw27Q/quh6LuRYjMT0thK7SltbP8hmLcTBo9F2+MbeJIRD5t3O3PxNfFyMyItXg7Aq5VC+ZqodbIzD+OYN5XzNfHrub9gmDy2bwLAj7LxG3/z0+eOZn78wft+TvlPx/vVLtkPDoXb/DRNygwsHp7GncP+Qxld+9MO1A5r1c0aQ0RD5+keKwydzF9zT0fP1mJuDpBDsLOTgo9FsZtsbF1H0Iuo9Vc++uyCnbnHX21v92dHrxxV0aJPl+8NmYgmJfrYaejNtzrp1i1a1+L6jpzsr8f0XqIc06qHiv5c8L8J/r1yc3zaR9PDEtTfhE4VDGmZa9tiKspPq72DwbxzcvNXyhXrJA11tr1XfwzIsTtJ5V9PNjyFAlc7zGBwBU3UbCrkqj63pJKynRBbgBGnfcpz7Hejn48MoNVb8/AQWnlTdiXGxz1o6KQ4m0hY7993GMZYb8TOHzKnaFobESdQ9i1weWhw+kvG0omvniXTGW7b2U16v+20IjUYctBJNxxeaDK0qv5fv6CH7Lh2uc3Q6pl/PWU9dl1dlXOgbpSyyqr1lZr//J//peqEIQqpqfEZYhoV4cYKRZl8c3dlAVAq8QbXR5pWTXoHoMxknmDkdjJSgUfT6DP+wlFoV2v5TQ9goF27VKPz8CKfVkxxSx03fh5Zy01dv7CeGz9dJ3N7XTd++hzJprjoIdKNvT4VpR2upNMuriTqqKZbNWVqmNpT9FOBh+l8lb9bqqDpRIGugd4gAF/psP0icP5+bzP6SQpmkYjpz2vRHYTTNaj8go5yrtTBfibx727pPyzMfBZRC2YZXmHqhw7ZAZLqVmie3NJxWLwXS91gQUdD6R4BPCwEm+WArJ2XJ3QLvT4GY5giarrm+NpTDk4T7Wv1uL+75IZHHpbPoavEW3L4/lR1AJNoBvsaxa6hbf03DUK93DyQmKwivNgTD8c61/A/Ok1EaZj+NJGNK3jtdP7XIEo1TiM8TuEH93Oq4P0fUEsDBBQAAAAIABqXiFwQy0neWRMAAOhEAAAZAAAAZ3VpL2RpYWxvZ3MvZHJtX2RpYWxvZy5wec08XXPcNpLv+hVYpvbMOY9oyfH6spNSbenT1tmSxhrJvpTtYnFIUMOIQzAkKGlW51Se9gdctupe7ul+mn/JdQMgCYKY0STZPUdlWzNko9Hd6E+g4WSes4KTlF1dJdnVRiK/srL+VM4qnqTNt2qaFyykZft+UW5sxAWbk/HiDX/uveH7rKBEvX3Dh+TNxaygQTQk+eIHPkmusiDtDnhRJQ38Ect49+27JLqivKwh3A0CP2+OkpQeJAGQPVQPimBO1eeXe+zudbBgFVcPXgdTmtafk4weRkn96gR4Ca4ojFAPxmmQZBf0jmtAk7BgaboLbNQPkr/SMUuTcKEevDWnlGQPNwZKOiwuwyLIaeFdVYlXCjE0TAV57qtHVmi+SGkDHNpAbqWUJGjkTyvOWVaPmIiHe+LZxgbIjOzUC+7BqNfwkRauU86CgkYOUPwV2auyCMYQmCPJUT3CgCcsG7XTPoFpn8jX5ZOomPvXdBElN9TLFxv+3uXpwevDA3+yf348voDpWOnlAZ9537Mkc+svUVJksGqu78ewnL4/GBLH8xz4V+HFj13UQN1y5Bkr5vjBNUCAI//88M3l8fnhyeHpxcS/OPwPHOc4zoeNyXeTi8MTor/f+Pz3n37dH1j7s8mIyJ93SRax25Jsbz3Z3oYX54Qc0GkSZJvToATZgiZWd8S9nFYZr8jTLW/r2eMheXVwSE4py4ZknFwHZ5PBBtF+5kF4NiFJSU7PLsAac1xfGnkAsz++VBPfffN88/kzogyVFfDyfPdEvfyGvNgj8yRL5tWcuNvP8WtBQzaf0yyiEc52kJTXoxY4LiglZR6ElLiTg1fkMaHzKg04K0C/wHTgwe74VYkjjzNOi4zyETmnP1QJaBP5/NPfCUghS1kQleTHrxEjiwlnDNQfVDROipKTogLFJORlUES3oITkJil4FaTJX4XWEfftxeYdeUJevT0ZIPMlL1h2lS50ylEG7xI+AxMkCSd8RmvljYMU5poG4TVMS0oWczGH5ALR386ScAaiXQAKHlxT8uxPn3/6+c9bKKeKo+VlJQcXhoRvb8Grp80rb2NDac4BGX938fLslIx391/tvjj8DVrUV6o8yQURwAnw/ENFS16iwM4yEAKy+qh++ojASl3jsmSUgsSB4ymtx8J6zIMMBJsuUFxxkUTBUP7aFCsyJEEWEZyFAdaCRDRH4WZhAlJwd7OoYElEQAvQy/07KMP2vw3JEY4nJS1uaAH6SxcHYKvwIUh5VQSoHAOCAq/VgEYwGOdpqQoqzuawGCGSRqYLffl0JQFxn11ejC8vyNHx6zVFDJOFaUIz7ieRN00yVGzUSvDQ9AaCgXpL4GvGkziRno5MUzZFyRfJTcApuiAvp3NjKP4Cu1BABIBwVXZjMAOwzhDtL65SAtGkCEKBFkIEuU1AwLAqLI4p2ggyy3LxmjMYXwY3FB+WgBncmVjEkGVxcuV9XwIQyq6kHEVNTlhE8b0jF9bxPmyAW9vY2AjToCyJPxFCPK+yDFy8CsWDkfApAAfPS9L1sLAqJNACvZyNw7g5GGzFc7CvFHmHVcLfnpgO8eE3H/EvwLe2wd6FwdKJxeB2yhkw3HmdZHxAyFcgJDDbENiR2CIaE9+HEdz33ZKm8VAphI8yGSFJQ0WPD4FEPFCM4Q/4RmB44DUoWj+KyDwNF5CjfeuCtRNgnGm+tCSCUgrqtKnDOXL4HjIjj97RsOLBNAV7MKeF2La5CSg3AZ8zNKf72KCj2Y2McfAhAb/nhSxfaOzA4/eO9D3HZ4en+2cHx6cvnI8Y3yoeb37j2CAvT/cuj44OwW1JyO0WiheLUSfmoCKgjBqV8MYM3ILbAVKMD3sPSx4BVzv66OPxoRWOFoUON7k4AGPvQ3Iwp52LoqL9V+CpWARpzY5i3QJRFKwod5yC5imENAvEtIpLSO92tm3ob3bgb/9FeBvtmFmNud6D7rBuXI8hmgqrAutD/j0ptlFfTIi1tTSPzhPuCjsEFwlzuYNBb/G82wCAus8FntogJRYBWlBw2ihFqmnYXUjBER+KX+ilgpLQUR+dSVbsHJ6fQ9qTBlUWzmBZlJ2NyD395DxIz/agcWMH5yfg7MYQ1lyVWbc+DN4JT7gPMwvqcox+6KYLi3dDbyZ9rQg1VR4FGOE199o6NIsLAi8L2IudU5aBSecQ1jIuvqxyPRLMcEAKExiW+tR97RfCZcNrxG68A5lwv+OaLEAQIarcrxLT8/lg4H5eUMi5U18uCIC0DFteGw4OBDQu6CZC6IFa+NJbSMHEw2m3gkhizMrAx0OOIiRcI4MXteUkJdYBvezdomnKrJIMJOABo1ivWbL+hqdGFgYnIEMhY61+kyBdCJxiHypTWMXyJCigcCrdrSFRfyzAE0jCQN/dLUWEIFwUkThZW07qayMe4mCp4OcUvBBGDhddnQ1OlLyTGRRjrix/PfHFO2Xim0lWEEUSsytRaKSB9nOoeqUoFNByytwGvIVJhewMSS6Fs8nzGYiy/WsbUQt1+7lG+ldEZnnkJfgdYOAflXT/f/5pmJlJHnbUjoXb822a05SwQg9Akq7YOXGdCb1ilFweQ0Lx9OlQ7qd472hyNePeHkujgQ3BuIB4XvCF6+AzEDGM7iqdWoRWheRgXburKU94SlviO1brvKCgB5gjN7nz668xXy5JVWJkCDJSlxd1eekRp4sD6IyqEL11J59Hl26m6RhPK8ifhTs6O9qcqL0SE+UBC69B4lBTZoy3BbUYj8IHfORKkg7i/1bgDAhuNAQpmbFSbIBxmFCViF6Lf9CTTVfW8HSZuPUB71gRvQPi3QdWpB5jsw1Vjc/R3siU3f1OraQhHIpZP0YfhtoknJnmjpqXq3yg3PIaBxlNl4w8m35PQ36KuCEZ/EEMdrqwVqfWILHB2hzb9vMh2QZblL+Xjaqd2zNt/RDCMCqns5T/Qo6zGHXR8A3NwBXuYXt7tXvQyGuVrEFsUDllouhTRPY32wY9aJMykFrJIK8Byv48sIM3lnAUpCW1w2AiIHahZLl9lAZXpfuGe5bn4tmEpqAFGGb3FiesMtFaBYBzafxbYZSGWIDqhf7GZqgTLZP64ub4i0xWZWQFu0U9aHfgu3kEgqTTVNPnw3ZrRDI/cmwjhLokdxRlzGfutp4htFN3cxw11F74i9RR0KHOA5ZsEDQp5hjLxRnYCC1EtumMcZE4MwsMz/OcB1DtpzQo5Hb8YYa6F5k5njXHZSy9gAKvG8COKsgpcysp3ofMiHYXWl6OuwgY9yLKwQJ6e3CQlscMQO0BzSpxk+ge/BQGlOjM9AMJ19kTj/vLLsE9CPYQoyMPsskMKJXzqJeqQFlPF+QQWwitM/9msM02z+TeF9RbQAUrFr9TA9Wz/pXmiO+7tqg4PBJKrtuhAl1lhGo2TepqkKHVqmp90Px0OKv5SSrJ7YwWVCaS9bYqbp9GxIXCL6hSPiI/PvFkef+kPbySG7cD01LNWdezVHOU3VIPGsWRND+cxNYM3RYJh5Sib8+vKe4UT9MgE0cbmJxi6b0G5zar7i9hj7su8Lr23MKuNmY500M69aAZq2G/PPq+C4oMa5EvbsO/PgoLcd5KPiB7AbNeVpC92z0/PT59MSJH9eHK8nM6VM55sOgdjpnVFARxWQ6VovDC5Hm2xpGePcb0WRF5MqraZEYpbi+GLGXFiNyH7iMF+Gjw6VsIXBnfvBVZ7QjKnTT61rTzPt61y6z+cE2VtIN8DyxxTv1wFmRXPYUHuHThCwibIjbFsjrH/+IK9qDiTXm2Mtio98IEeUF5ODMdvqqyqQ+gPZfSCOQVOHooEcBTzoNisWNxxjoeI2A93dpaBWz3TSzzaygrO7pe6OhWOCg12rbyryF1a07Z2O/YFVkjIJ7MoAp0emiWRHaExfU5p0GEx9grAmsNehLcYdvCXsrC631ITjmuqLmkxphe3qBKLCVjEWLBGiHME4zKluzdQLhG0WqlXbZcvBReyf16q7/DaQ+7OF7fydY8hzqS8JPSj4LiWhrD6J/mQFsaOrm3uaUujzZ9sXPTNGlhm9FZTjN8IrZcelv6Q+LIWpz0KkLsAsK/4wWElPphSdx/hRpnYAsdULuIM+I1zw3E4VyfPbkAJnuxTDt73B3iyQbIr8ny3C5Xndza6dAqUVqo7eWVSK2E1unVPJRJrTp82bFwj4rlDjx1aKjTI3ZCZS3eoUnrlfOUttRMniRlKTcynVOmtzvoR0PAQS+Ftf10ylSF4DaQO7SiJhWHezmk5pB8qhy0X/wa54vyXNNk0zh5UtXk2myfMlxRoAgYj2vP0pA5+pDdS4zmYaciRnP/l8jDIgeGhahYIbqWmqal9pTtUUkgS6tTfD1Vbg8D+8qzerG1LooOmd3mB7PJrn5A73LID6H2KFxnRcEx0MIdDJ1DKgmIS7edZCiPB312bYvrlkNPsx+jgdV9b4glnB6DeFBwf15iEySsGX7DnL/e7G91F0LBh8ws+sFXtrN+0rW5NzFGlSxqQqHbTDzQnEl76t+8bg7yvTJPE47vS9fQyV6PBv6gJ0qymLnOe+DmI/kjxiUc3lU+8zS/jygPynJ1UlUXw8ZOrJ7+Aj+8Kv25NB55ou/0pawaHq4K7PgQwddY9uYcvNvKJK1B7wAy9UUO1JsSeoldVzidYU0rQm9Q/WbJQLGOruGfcSLlNPBjr1npId3pEgpmK7B8MZWYGk5G0HxDC7F5KE+397pGN0WteRukFYhhCsYvEjl3YIipFq0SFXaE+diKMiLYJDZaTye7vgNk1aAhOztka3mctUre+ZB9/p+fxSGsprQhm0P8wV3Ttssv7cWctZZkLczOb1ov/Pk1plnTYmvV8UXzoi+9vS/baGwtRjUceOGs0mMPBc/xC9ciFovx3/UpCa4ryEkc8YrlvW9W+tPaSyH6weq1WIZYmE2D/IusRRxAghIZXOmpCZAuzK/flieMqfdUP3k5ksj7QLHIxfr53ErR23I8Z39GMZWZdapbjH8R5TB76Tlme5zmGSyqZiS6ddpqyxS6K2LmXs02rHlLwYoLkr7Ovq22INru7bqojA1fPfjNZUaNjaS5kBM2gBO3mXyozzdYks/mg4+6hBTOh9PbdVUIfReWQSXRMuGVmlZQ1WChvBvucAmtQKnFAtUtbo7rSXRfmx4T8ASOlK1iamAH+pDtC7VpCgipPlFf3VbpCDaLivNtTVai3R5YspSy3U3RSzEjkXRUspHEmB0FqRiXhxe67/8DctGVQewQsi+71o8P8KrGfaMXn2ywY9WfDtNAAqspzqc+bucdq9JI9KmnybWorKTMOi3odZtf3aLew2LrUZct6n8xmNeFCul4FgWF2vfzvgN1+M9VAKesxdWJ+XLF/rDzAPbVrqEXNKQdS3Eof7TMIpc6/I4bU52uy7160vZ3rG2VSuOl3lkNUl/JGRjGlNKstgyrwTl47+F/0Ug357CYm6r8JJ//9l9qVW2jYjVMimgTXCzCr9BVfZAS5iY6BjFMV9uV1vtgeFUCUgxLXVYht9Qc+hptz5hBRHRaXUFu0sGq4rXsdMbcIfRxKY3CFn+sMVztL3RWsonSBOdCG239mW6buO0g2qt7AVTlYP1u3t1ShmYs4tF64PMCPCa4F7Dags7ZjTpYVGUw3gYKsSURpBdVBcYpo3bWO3xnTDRyWfcLNHEHN5GfyZ4v51Y1CfrwsEUUwrhE9mtDWOxI0e3EW5xx2GLZLKNrx2i/J45+m6m5y4Ruq7neBvE9ELy6Pz79/NPPeCY2MPGsnviWFZaZ1RUpcoN3CczrU+2tKUkNopCRca2pvUCyhVtxKDzUlvtatJ88fLRUEsa9PvfHbbzrtjbXD0wNtZ1l6rcHoGBXCdTD8lwQOdXBPrbuOC8g3GS4m/nelbvMES3DgcyOmu+YJmmKorWXy+Zzud3byYvQjhTy1QFB7MWgfjbZR+2t7hEr+DMhnHuk49PAsVCmptG7zH5DanEuTVPlV2CMIhkzA6zI4WOoydktWqpmxE+0jMuwZ8t+2BqZQusr5vhVXB2tcpgSHIy4QvqXfsLxWIn1cRc5AorrjeJYjnwn1xInyxj43QzvTuAVR5WFCE76JB7LIXka4N26upVXNYwEV1BZ4qqgb4srWGtQYzEdSuCUidOhfmaDghRDMjzuwoNzvFZ6neTNAToOp2DOCy5uvYh5zIzz95v2yCtSaGatlbSa7GtqvMYOVOd6B6ieNL8+HP7I/2vAK+Yc9EYdy5gw/W2D+gemkepnGblGKG85V/sOYNvSquvrSp09JQH5j6uk9mVsJsdZs+ligZpgJE1Ef0XYZABTqswOUzfQ1k51JOlcevWsL83fnHwqRvZXsLGbpjhcth1KF4SRTs8uZqKxCdNSxduq/YFuQi5zpybJVDdFtezR3H01/jsF1ME6TfeQuvq/UcBLj2qSoejJqqdsFUMB2nHJX6h6qgaAVLpKaecaDgLs6DNptUEYzeGdQga1lUrCXQde+PJOG+5T3X/qDHnvmFm7vPGp7gt3QZtMXcA0MuwCaZm5ANNE2wDq4nHlr5aqr4joqxM+VMpgMwV3mULcDvGgi2nelQZRIwkSyvvvm/i0lF4b1seQnxKr10hT3I37P1BLAwQUAAAACAAal4hcN9qR3ZkHAAD1GQAAGwAAAGd1aS9kaWFsb2dzL21lcmdlX2RpYWxvZy5webVY627bNhT+76dgtR+VAU9oi60oXARD0yRtgCRNk2zBgAACLVE2EZl0SaqO0QXYQ+wJ9yQ7vEgiJdnOis2AAZs8d37nQtLliguFsNywjPIRtX9LPp9TNh+NCsGX6HLzWb1OPqv3XBDkKD6rcO9DRZutE846u7c0nxMla4p4hODz+YSW5IhiUDaxCx8P+cMZ3vBKuYUzPCNl/ZsycpzTeuucSInnBDjcwmWJKbshD8oj+q0r0BoyGY2da7yQmcArIpJ5RRNJ5wyXjZl4tUrd0iC12pSkIc6GSCpFS5mohSA4T9dc3BNR07/TEb81S0OcaxsxqyRPZ5VSnNW812bx0KyNRhA/dFAfWQJcZ/CTiDiSCyxIHoGvo6zEUqJzIubkEqIWu0CMpyYsURQdYYVnWBK01DRoBUTo7z//QoKsSpyBm2pB0Cn7UlFBxOWmJgPDV2AlCBgZSTkpUJpSRlWaxpKUxQQtMQNh4uCCMzIBwYIwZf445fojK/A7HicNqyUbtwQgKnGSwFn3K9xOJVHVKq1oPPaMaRY1jaeyNLAAWR5ILE2HJAEJ7wHRYI88xwKCLOOfXkxQ+x3iuF7hDI4jfvnaGaM/P6CPAATP7oX5q40wSI8jc0KoPgwZjTukWrROr9gkWRxdkzkn6NfTaIJevZrY1EtuCZ0vVHLIy3w8JOBScAi32sSRXgMrgftGVKTnB85zi5PYMnuuyGqmqCpJa3uzZRB1RbJKSPqVlBs4HSyyBcKoAIvA3YILVEki0hz8TPIZKqhOJMxyByvA2hJFoUDKFAcREswFrTmRijKsKCRF7qKVtBzjnp2h37C6zXWfAdIzv4WcjPdEp+bx4tPSbEHCNa9ERlxIWu0iS1tktvUwHg+QeBbU+HFST4zUaTTuZJA025BkK6ugrqnxDjoTOV0DFkaorrBxZBUgOBJ3uPpMm6NMkiTaI/F9CXy2gh0zPINy1gnyINcN5+UNXXWxxrmqsQUWiT70hhGX3LEOyN6VJdQWlS3gwBpcSWCvAJvw1QoWVEIVUwu0pkA9cxUzH0bf0Fn1PAvpZ4Kvpc4rv8rH0aFZjoZok6yk2T2YkHHGSOY0uM3UatpnUyNsCOZ1dWw4AyQftbnYrOZS7cNxSzKAY09mH8U6+fdjuKXahWCNDHuAbR3pozeU9TTshjzDyPXcrAG8XhBhKmDXrAZva0EVdKMB9CJG1n2cN4wZjCEKJGoNg3AdPJKOMyH1U8Ha0u4Gq9azx55W1A6otpw7a/KbAMi3WDA99QbHmK7tKogDZG5rd7fvri5OLz5M0Tm+J9BD4AhBF1rgrwTNsPYXVSu9JLyyMiOFnqj1OYOCZ4MFpG+CmS50tK8XBMJRRBkvuZiib1n83BE+Hz++BTwx9ePajAJTNANwvY12tbC+Ii823iSc6OZM0myB2bx3ikBXblJDEUTWjjV2iG2WZ4rtqxEtiTk1JQjU5m6imzxJgbQHw2uFYVo2yqHPrwRdYrE5GMjVRoSZr+gD0WFRi/jlmxdbKYdxzFlqSLb54Ie7kbUDyC13ENBPldLlD4b+0Dxu1lMFJU4HNbgTdePm0Wq3r2Ag+sTKzVAt65Ce4we6rJaHJc/u30NvVPHPL7qB6rD06q+FhKWyFQrAA3XVVqegBA9Hz1Pgz/seBN0FJKUS6qG4twc//d9yq7Uh6Lzdi4er8wf+/Vff2o4fqG4G8yO4YWWKi40zH2b8EhZQMNp50aGFEzkNStLw/KRDb6kH7NXF9/ut7WlvTffbnLN/oNbtcqTTTIfdqHOv64ONAvjQj4lGD9w7pRLQm73GA+pqek91h9q3nMEIaiWH1nvvFIlDUH2u51RKewOJLmGigDYqbbhwbbF10U8F/YEiWAnWVa7N/C9U572RZIv+UfsfMk4jxNP3pdJioAb3URE2TrhZF1Qs6yIdbBauSHiDuODL6R37ZuPzeMfu2CncC/WSttss6Ls6ZRX5pSPNNw8aA4OS4BpF8juI/mMXwQWfDAPW+v7sYI/06c4A9uplpgfMXeVal0qWN9UdCpVpdfrWYm/Q5kWpDpO+FNn4DIy2Qeurx9kTaPReD/Dbv1RYVRISzbibkCVtijll+kFoLmDLKvIa1lXFnGlApSeiuTCXKvs21pabre+NN4bwEsboVqx7UTvwH9NcHxaVKwYTl0wTFM6Wlrd+8ksKyqhcbG3nab2/VQARgott3GazZfWcSeYln+HylEFcGTQLXV3gJGMr3YXQvM7aGtf45VI5cG4axrF9UcxniQu+jaY5r/qVqWEyJDqcwbaHQwtchNeYKkcdh9HtF+Mmcs5gQEdVqm4bHkRhOIiYbNO8YTIVmJYwbksIRZVlAD39MwUnLHG/lezKo4DaSI/umAV3xperkijyrHvtsmTXtXIYFkrC4saYsTa8+YcIJBZ68Tgs5MT54mTUrhkR9Z9aQsgfVmiPfNpXAzfeQmfhdpInxaqIEDp5d3p2fATmFo9eXdEWDvTwXcKiMMg5ihkHHCkwUTrYQe75xeuJNamWGA1i0+SlA6b5nS7l/Duw+YRg3bHjq6tPVxCrRtHjv3dHn5l50q/5/L6TCapohsumyxuWY60u8v0b/QNQSwMEFAAAAAgAGpeIXOVe9Zp2BwAAvxcAACIAAABndWkvZGlhbG9ncy9taXNzaW5nX2RlcHNfZGlhbG9nLnB5xVhbk9s0FH7fX6ExDzhM6rAtA8xONp12t9sydEuXLXQYYIJiK4m6tmQkOWkGeOUH8BP5JZwjKbZ8SXp5ITM7a0tH5/Kdq8yLUipDcrlacbE6OVkqWZCXuxvzZXJjLqRihDuKG9Pee1rxeutKis7ua56tmNF7iviEwO/mklMQNA5fHlfGSPFYvvWrz+DxOd3JyviF53TBcv98zbSmK9ZQv6z02nHwC6/YW/NYya1myq/8GDAcnZyASHK+NzcBHZ/DI1NxpNdUsSwCkpM0p1qTa6410FyyUjtVY6/y6MxyjqLoFvZzRkpZViUxa2rIliqhCV2AOFI4BmS5LEq2IhNSUFHRnFxcXpM7tiMlNWudAJsTyy9jSzKfc8HNfO7wwp9m+XJcv33WPHruc8f9jCykzPu7TuQ8zYouBWgwL2TGzog2CiCJ0kwVUbMvxVyWTHj+5y+kYP1N4HtgB5h1dkrAV5hg0eNoraxK8MEoqe13xKMWDMm8bTMojSbF7dVDZxokuueane7ZPUZwAkCK96+jJJdbqy+s8jIeEak8fh0GbRCBTXvhALXTMXg7QAcCAzp4O2kTagZ5KDK5fcVNzuLIRzRJpVjyVaWo4VK4MIxGvaPXMqN5/EpVbGAP3FRUBWS5Wcdf3f+8CxyQVOW84vEoiO16EWkC5+c2O8GSIFcdTYcEJV9AqYHI0NdUQQbr+PTrMTn9Ev7w/xdDJ25LmoLV8ennowYfg4igSFteGmgU+73iUAfIkmNiIzSEC/Kbgyx5o6X4LcDKskEhWAFjWwfj6JatJCM/fBOBRg/GrjomrxlfrU3yWObZqKclzTJXMGPLMNBTV4uOqvUW/qJbWTCyZNRUium99gSKIFMCSs2CC6o40xMIXZ2QR1kGZYrVlcnZB1zlNmlCd9STbiNJquy1omU3IgKSlwoCUZldHBWVgVo6Jm3anrX7w4HBG84gtdDcoJTHo84+SvsOgv6JN/Q5F3e6o1lDiZy+gbBRNMWIv8rpSsc3JhlYTwKpwdYQV58Dz6xj4/thEjREz0yRxy4nFhXPs/kaF45FgDs7xoLDTLo+Pw3A+YQ8suqQhe15msQQlxnHJZo3PJ3Oeg5mIJBNS40HaVD4rZMWB8L4crDqnrUC0FK4jfnCCBTX9OQ4Qh+RC5s75N+//yGXcitySTMSX13ZYh3k0gC7JM15eseyBMwULDUeyaCCto93jNpHWZvpMRODdtnXCwrskI1PmYAwMYxcfn9NvoU8G7LJnz1mEJC8tzWeXWBKLQl0fx9P4BASX7uBBIvDoCc8r2Nat7rmO7T27AKtm+j3ARqcbsX9RS4182FfL++z4Lw3TMbdheTWUJFRlbmVxPIbdTklir0B+7qWutUjOeuPh80uyHbbysi9GaZ0E1Yw4RhU/edfPzDl7MGEloB+1u4G+MNxsrs2XT+YuXybTuCxv1/OpovZvgXWnY8sYaxx57AHgs3Kjw7JdLKYkVdrDs1RE8FYBh3TSFIwtXJ5UCppLJKEVhmXBMCHqpgxadlrYFAO6vEDeHnDlMYiBzp9lZwmpzhd2YHLSsVrRv8kJWvFlufR2phSn00m2+02We2oSDK2mTgUJ9YlOpq9m2Y6obNhFbvwfkwxqQmb8RLGb0cdnfVEagaAcLODWOm72+rk/Aelh1wjN3AJdB70xzSF95njPJ3YFwx1OwOgl/AWEgw6/cix7GEUrycGcAUXG5rzzMXAd1f3blOYCqBlp1QIaSD6U7UrDfK/10RB6sa2QyIqYXhOLF+vCwrdz6kss87on21XHpZr9hHwLRG/n2xwVwpvHSRE0kH4R9thf3kwk0P2+MIK5YFtuGC2wpLY8YJiCkLmgCBMZ3uvTLygUvEN9BKUlJSs8NujY65B0AOkyC0zBl0FV9Kiqe9oi2KpLAooG5iWADEs5JwuwP8H2C9pni9oeochizGzBwjjBgakDU8tRpWgG8pz5PRejjpewZaHSpgH1Qeu7hg+XNr+2Lv/rz7LKu/Tw3LOMZse5YrRbEfWdOPc99DG+wV2QjLls4F+Op3wIYaQhwwnSYugC25YstX0SEBAwRxS7kiQuMo6RjHCFoA6jI08yKpVG8B5+aAJHpNLKT41DSJkx0wHld4shJiguRXUdVBsgDdWXHMP+gsM3n7ahgMyx1Mp+MDYgwX0ESMLuLGmEJO7A5pOJ0M+PV6zMYpsQB7pslghXsi6CGqXYRpqnStvLuoDvjBMV0qQ6BcxXavJ7BcRJW8kF7HlGo4JNn5hmHtTFaUdFMbuTmm/yoxJoVf2yY4P+NGiUdKoXVtjxcocq1zwlSz5vWIaEe1nWfu7Us0UZfeXQY3+YiinM139BHfRP48RvJDjjkvallj0vEHn75BUH2VvUwaN54n9B0Z34bFM8Y4Y4L+fvLvfJHxgYLBhWYt7H15GQ9wPf6eJO19IaIpKtj6PBLeaD9PG34SOKlTPHK2Aa39LCEqa/zb0MBq/iwTT1I4T+5udoYt2yfMTZD1nhExHA9esjl19jGCg+jCA8I7y/6KDt60eMEWrn7nW8N7gIAiAzH9QSwMEFAAAAAgAGpeIXIsSpH7PCwAARzAAACQAAABndWkvZGlhbG9ncy9tb2RlbF9zZWxlY3Rvcl9kaWFsb2cucHnlGl1v2zjyPb+CUF8knKsmu3dF17cp0KbttkDTJnG6+xAEAi3Rti6yZEhy42wv//1mhpT4Idpxr1uguDN2G5MznC/ODIdjBkFwWmW8YFnOi2rOZlXNGlGItM3LOVtWmSiaJ2kteFvVDZsKgAvWpDVfIbxped02cRAEBwf5clXVLQMicwAdHMzqasnO7s7bp/F5e4LLFMZ5a8N+W+c96E1VOtA/8mwu2qbDCA8YfM5PFiK9eVltRmpYLaeVHr4iXbpBtZ4WYgLyaoTf6jx7z++qddtPVOuVhr+Frxb8PZ+Kovuel+J1lvegvFFCDibetWKpJs/WzeLlum2rUk1MVkXetqJWw98NjpEyXjUjQ4s6nq/z+FYaIm7au0JkyZSIdWaZ0KRkcHCAG3nc7UQMq97DV1GHQbPgtcgCYDD5eHGZfDy7fPfxwwRwr0iKMPjAlyIYsaDEv9FIzb7nDbAQokRQAYPHDQ56+OvNKke6ABXqaw+brKegRT6V4EaPeoyTdV2LsmVndZ4S81ROPF7RRI93BjapNNYKhy7OhSjFLXhzj1XLiSHefF3w2sSjCY13fXBwkIKuDTvFIJhQTFS1dK1QuVg0JnqBJ4godLrI6UKqKmNaMFlUtw1rFwI2iWcik9isAM8ZMV4UCG0Er9PFk1legJc8aWCXR6wW7bouG0WuW6cCEAlnYsaSJC/zNklCwJoRuUSijdiKo2GPP1SlUKLjp1mDj4VR3C+UaJFGAEJxogmBwxgD9gj0TtsxQ6dhj58rZarpv0BGh0YnuCZ0dW2jNAKCp8yq28u8LQT4D62Qm9AE0QD5FGRerpeT/E8R/nJ4OGJPDw8drFo0CD06JPA/XDAI1a5XyToPI8OI/STiGMYqKEhBcCNkJY6DgsKdQDoDSzanvIZQbMKjpyOm//etmKx4CkEbHv2khMHPQoCT1MiT8pBjFNZWbEKJwjCPXIIUMaWGlFhx3bwS7NM78PijZyOZbuM/RD5ftPHLqsiigUg8y2QuCyVFQyqI5Rb3yJILfZbxMlMuSj7eHx9Akd1yCHWQGMI3FQ24bjQgSHbAhDZZCGAcpFVR1WP2iD/lWfrsn8EOITsShpiP2CnPS5bKrRizRiVedpu3Cwo5Bnm0EDOILxlsDU7UaBQtWrfoWGfu8LyNP9Y5EOUU2W+rOv8TuPDC4v74MXsPxMcqoNnfjGAHoNYFkBKZ5IGL9MzpOi+yhCArXoKFo4FEhvIGBVeCC9RmrPRjRMvkTcr6mUvQHtxNGqaXdJi0qZDA0sUbjpk0hGD82UNxgHcEzrpry9VCS+WXFZyESyYPyaYHTNsy0QGsT3lDM42CPJQkoUE85WUqigTwgIZ57sJJRiDDPzVunBZ5eiOyGPywhMAIVWbCHLmNuVJQEzHNisurG68YE6zKZErAIu35cwh3ONeWvL47vqzXIvJRoVSRbwRybRfh0TM3TSo0rx5JVSbVzQN6GFQMRTSa2gq91trRs2oFB3QrKG6cBL5SsARhIR6VIgvdQyu+EXdNGEVmkh/El5Ps+4g4Vzq4fuicA533O8p5TgJwfvWfpaVKoFNeuwcdzsP5vJI8uxo0HByIGg/ZnhU8FQvI7KK+FJu2z9DKJHE8PFFtAicFTEjHel1yKKSz0ONC1qoWGJ0seDkfeIlMP7RLuwLapWhH9rq4YZxqqWF4A+yh+JbnEvmFjB2jNO8P1hdFEWxbsiUCNFLkk8fWzyBnKJeJ3cK9UnBHPHfZFgFNtIdEdEkaQrZwlSiET7xLghiCadQtIimEPQTSpAxRHFRPriY2abUuW8CDCsUoVQ7ZE3bYF9JuGBhr9q9Gtm63RW9n7tMU7AqmrxhsMSmMKZ5kUugunm5a0HiozQuMwpLjDf+iuj1BfRpfVBurcrjJ+mN6vcow85KCDwW1JmhoJ+80KtUOcrNZfuyfnCXIOdJ+Ni8G35i+n/nSd5feHE97I4tKw1FMxF0l+t+/skQ36drHirx2ryhrtncrYdbcyRybHyhw1wXpb+1yweWddbWQS/JMrugaKWFPaXD7ohs4eMhyWuGarlnjOqmFiFph+6QJrwJMd3BF7+72H0trNJsF10PhDKt0+6BWjOF2r3Zux6KhRLToyD34oPZfNw/rZuJ5VHsB59lnAZoVdzhU/RQ53k+5CTEg3Y720s2UiNbsrLH13polGfZKWI1ZoZ+l/onPoyTyBSIbvtShD7zJoOOYUkKWOZ0/VnPPNXqPiTFGnLHs+gU/uzAnK5HmvPidF2shi6YPFQOYV2zPVpzmpcfHvEts5l4PU1C+2VddvtlXXYnpV5dv9laXbzxu96C6fPOg11k+YGYzKPC1QjDwZjCYN5OWRBtmrX65G7EI2BXX2OSjTDtiCQNvNDuq+pDy0OviP1R5eiCiL7yxyTu98+UuzyqHoT9zIRjqvDRJsZdOSqqmOlWaqSgzKBB8JvRy0qSkK9C/P+3KKYbleyy+WhV33kvtC4Sw7izddqHt12+pOCVctXl2CNfT8VZrutLsYNuKGOdmSg1ZbJM2ZvvVqbWmRZXeTPJ5yYuHyrIUb2eOT1IXFvyR2NiOKBtPXX/HuBqjyogfWej5TK6wiZAccB5g2Qe0YClv2zokTKvDnzRtjR40YtRvZiBb8OHJi2BAjeLcQ2qWl3j4yl8DkpVq1R8SpcMBlSxvVrBFQGcWfEFl7hk7fk6yKoHG7Esn+D37t2QLc/T33hYLjCKGamsWSN+2FQS0XYNTiKsV0QAXM+8r3nJsIiImfr+oChF/akSNX6Sf+Be+Kfi8CWk0o68RqKMIIYy+vGuQFMU03tv9lAiMtYNAQfQo/lRSLIssGqYywwG7VIb0trup5dFv4B/Xpa1bhNWGN1oGKnywvWBEDw6Torql3iwOYho4QZFjRFCl4t5EYsUzGvv203cPCnO/Ld/mWSbK0BCorFrkSwg4HUadcPYvDd1V273hfEVm+O5KzqQ2qEreKFWjYYg86Fgnrlv9hc5iti3+H2zpCdK/0Jq6O/M/YEu4yCV45cFzJhxA8bPFtF5c4EocU70zETs+Zl5X91LAA2ZP9Ggfx+j1+y6uYAEcZ1B2wv1aL23THlmjPV3B3d4tXvCVtje7ki0vPN7VaW2ZxOkD0v0Iygul8z17wr4QvXuzk6jtBmWA/smbCjLXeqpwvNp5ynYqZ7sKhujHMfa1YQKr4na1V9Hr1qN2+EoT6Tq8fzrQFwVWLfsZL7JNf8Ti5xHrukVSDsP6ssGTZ5vOI+wulCo+35WZMO9+ILe19JgdeSptet6wlK9BcCvUJCzuK93uhQq9jpExqd9DiGLI56ev4oPG3c3LvFZTR8g1keoTGRayelnbDWQu/Bb7cOqNbTOPzeXbrDPg9ECva5mXSXd3cdpI5ISGPZZ840XlmwEq3rp6ws/Z4X9tuK3Xp+fHmsO1xbeX8rvw/fVYc7je3dAx3U03TrY4G2HcCLyXmU2Yq47S9dXRNXlkR/lXVkCVYOJG8kCW796M9PAZkpawJNF9Dqg3VOJzZUFTwN5iR+qLZUVJf6z+Wo/pxp3hcCqhqZG9tnta12MK/ezOeFfXg405h5L9wG68bcusJ3Y9Fk12ODZd+7Fdv6JLYT1d+7GdgUfTA9r3ur0DhsXdMI0c980kcIH+6aI+7us7nyfTZoaw4rjgy2nG2XJsOjH+BVqB7FoEo84VjtVfTV9sUrFq6TeS13Vd1fsya4CRj2Hk4WUdZEuxnArjRaH++bt/FYj+2p2MnhLEOPZpgqI6pr6RE9rO2zynnSUbWbZ0TUsPhL3C/UB3Bqqgd5dTKEBnuB/snkuvbTyXMmOT+y6fb/899ZcBt5Xd9Rj7/FQ0DZ+Ll9XGWmPMx7e8LvFB47CHSN0c/LFBPWOcdBX0aIAbnBWCN51fQbAwHOPDPaGamm1FL/zyci1ih4C9+aqatC3dDJ+lDgtyo8i8QkNd23YyWq+2PQf3VY1lETXKZ4svTzHDmA5g7alc7HpDEAQX8mpBr4zplePMeTesnug2jM/wVaB6vJzDmDiKjN4V24bzG+zgP1BLAwQUAAAACAAal4hctWkNOfYHAAAeIQAAHQAAAGd1aS9kaWFsb2dzL3Byb2ZpbGVfZGlhbG9nLnB51VrrjttEFP6fpxjMjzoiMlAQQkURarelVGqrLluokJCsWXuSDGt7wsyYNFoq8RA8IU/Cmatnxk6y25YKLFVJPOccf+f2zRlvabtlXKKGrde0W8+o+bnFctPQS/dTbHpJm9lsxVmLXuzP5VfFuTxjnCArcC7jtcc99UvfsS5ZfUXrNZHCSeQzBNf59w/Y66d4z3q5MDeedNtePqQYsNk7T/Eladx3Kqyh0Y0nkrT25jMiBF4TMG1v/JQ+xdmYW/fYSlQcbwkv1j0tBF13uPFQ8XZb2luT0nLfEC9cTYnsjO9GtC4veylZ5zQu9M0H+t5sBn6jpctMAVpP4SvheSY2mJM6A8SzqsFCoBecrWhDXoCnuXVofk+7l2WZXUQt7mCdQ27XBP3951+Ik22DK8ArNwQ96X7rKSf8xR5trQJ8tluACjZm2lhNVqgsaUdlWeaCNKuFM7p8zjqyANOcdFL/sM9Xl+jB+XxeeFUjNh8EwFTh4C2dzXi5FET227KneaJXNgzXpcUsYHWA6lWUYACo0fmHJwXVYGQSkQIsnEH5AlrxDHPIg8i//GyBhn9TGhdbXEHG8s+/smDU9TH6nuA68GqjfyoQuqpzn6dnxv1snogq06qXct1ReXZB1oygH59kC3T37sL0WfGK0PVGFg9YU8+nDMBDIBlyn2fqHqAE7Ze8JyM/cF2bQsqNcuCK6C8llYDUY/dLuuSMAwjMcFdLokCPcLXxpbXB0CXAAGzXIdzLTfGrgC7AXY1qLDGqoRIryTgFxcwbn48QxB7B3UNOhQqvGK9fQUPmJ/x2OlESz3quatc7QruaVhigxkVZGbGyUeEJcpyo30OqeFV3F0U2P2LiSO4//2J+SlPTysWGgFOrrGIN4/fQdZXfuWx6cmf+5pvg0QHBFUALLSmrDe7WpC4q1nWQlDjXDW4va4zKe+/+5GOZGNkOcjJIu777OsqYa6sGtgf0CTKEK7xAZdq7HDhh2IfysOgVBpu2UttahltOykqhpArE/UYS3mEJ+H5guzMVCZEU4KTeM6DMtm/hIXKTf/FZwDcx8DRaoZ0FEpITWW2Wd6PI3K8kha5LI3Ipu3KSIecTIiHffZ2GC9ZKIGLcN7IEFTAXbnCqimFHFeihEYFa3nLaYr5fTgQmsVVUDa2ugrL0m4STmkSbRCkxmuKvOMGSTEI/00uuuEa96xUP4LQCNks3gTqYTFFCV+B2GuUPeilFNygcQGcFboFuMJmiq0lDDsTwoV6CtNeKYfhU1gftA1CtwC2gDiYDqLH4hWmXUftzsuJEbA6EWq+NY+1VDngQjS83i7U3GQAc04Ht2sHQwAPjsWWQjw1NCSbh0aNWPIQl8xYMkE9h3W+amj71bFxTcaXnyyhoEQlWDcE84B7J94NldSVDtjqpiMLPHXqesOM1hNBhLFW9inewg4E8f/eFN4ssOSUoktEjA0/UZcxYwdhmWH4+NKMd9iV5rfbW0WBxbYy9yRIrK8aRAgKTi8cZx1NdFE5Q8QanzlS5UpyPhVfG4nJp3RnbczaPzTEnZthpU5ysOeu7Oj+XxeOGXeJG761FtcfdcV0buGsF/Q3KDfJ5NlYijXhbjybgjwscOkoHV1lLkhVOY0Ji2YuyNQfagrRUwf9OOY+uG9LlnkPe+MQG3pDXFdlK9Eh/qG0fNt7ELThpFoRzxpVdDPo1kkxPqEOloGtdUrcEedzYwCKqCSBAQI7Es8kEmTyGuUGdWZ2oJxZdhjmwHN26zoJ54gpOLxHJ2Oqe4BrTRTodg5OqvpnUWnHAgAZ73iF13PX3TSeY0pCqxOaFPWfn2VBlC3BjeIC1o1Tj06sbTiZioGankf/YnOWtVuSzxWX2nMk4jxxWKrHDweuUYod5p6Y+8x4ge87QhbYItaXcMz8Q9thWlEOEk9oxns9uSe6wRa3o2n44Uu63tRqQzM3IhtpButIGQH0MGXHOJwlRV2Qvz1pMu0B6sHnbZrDTro+LUMXMoBc0ESUgpt9wuNUb9HSYsYpTCYfVxqXskep18CVsUIXGls+4PeOpdaIo7VSMUUd2zsGoClVHLBC7UntL8HpPvdzSfDxyHmAmo7YCDhMKD59hSnXqTYEtZXii2vfgm0JQaIbI51PdPEs7JlSY6pCCdLXYUTieDdWUWLaW3GbjxW5b9+qtrKr+th1eGapWNjVablhLIiOO25SeHTEC0XyOPjWcE+qAZ6FaQV4DMYo0VmlpOTKY3CZduWlLut7cmfyOCcgdhBtIcr1H5mnBO59xRg+lK3W4aK9qyu27RqEPFwtjv2RXyVlDXac71xRiHcxY/4mWNV0ZoEq6Nj7NTXStOSVO7qhR88I8Vr7FNuLUPvBWAkcLIPk9gHUATtL+27CTDd4kOxlWWmi7S4vnPXMU2ZU34SkrdhOuGiwqvrK/PhxnqWQd4SuXyxHmYxxnnZilROf0/nWSc1F8b0QH4F2gjoD3IoYCcufv+BmnyG/S5ZUt/hpcdHkBF4GSQpdPufjB+dIEY8yT8aukCZ4076tO8+T/Y9RWZKjYMXzQbz0RyuoE00V3XCg868U8kN3n+s8/SPT2yw53aspFJsYeqNv/v/2li8ske7mhAu1o0wDOlsE5DsNX/Q4GC8EqqjdixWSQDpD0aVgcDOKFxF2NuX1hV/xMBPrjmMBzNtiK8mUC99HyhPXjxP1/HPjM/wIoeCs5IXmodHtCWdkS+s9NU6ZCHTv8A1BLAwQUAAAACAAal4hceS/W5dAsAABYeQAAFAAAAGd1aS9oZWxwL0dVSV9IRUxQLm1krX3rjhtHsuZ/PkXuGDhD0rxI9txOe47PttTSqDFqqY/UsjAjG80iK0nWdLGKrqzqbo5twL/2ARaLBQ4w+3cfYR/IT3Lii4jMyiKpyznYgadFZmXlNTLii8iI4Gfm5dPx60WVbG1l/vTm3Dyz+dZMzasnp2cXT3q9q3XmDP2XFCYrxsl2a1ZNllpTl+ZundTGJos1v7dNVnbq7KLOysKkpcUrqVmXd6jaOGuyekLNZdsTU6+tcZskz81w2P/XwXBo5k1dl4Uzhb2vUV/bceYuo1p/azZbsysbPMG7m6RerLNi5avRyKicBimDpm7G43Gv99ln5iqZ59aUS7Moi9oWtaNH5t1zu6xNkdxmqwSvf9f/jL6Mcyod4LFfjbuyulnm5R09d1I09kWDnjGoaXMagTldaDMJfxg7LkYdrvXGUWPPM1e7tgotSDXOUSZdSkOPZZTmtLKJM/9knmZ5bSvHA0jGVVnW2nGnoj7WKY4TlGm9C5tmibnabWk7aPHOyrsiL5NU39jg6bjGU61/mqYZxpfk5uWWd0CrJuHBuJQHYXrnxSJviCIuS1ebK9pAfSWT8vGWysc1lYc+bpNiYVMj63zQkTyNu6GXzhK7oY2+KFOrFVMuGW+oJAzlScH7LY/M5qCy5efRyGl1b5O8WynT0lDt9c7VdmOKss6W2YJJhmjfFoapgumwTqradZvh6ru2kbKh45Dktqo/4WWH2uHd/762lTVnmVuUVWo2tMlhCIW987SNU7rEe92mUnltjL50MZWsTN9u5jZNbTrQV5byICZJrHiO0W34Q0yEryxo6bAGF3sCRJkJHVbZal0bRwxknlSD9h3tWFsXAl9mq6aS1e4v+Ovkb64s8JZ8bWvLMZ8KRWFNwYyoXo3yeMhXZZlTz57fhCq1lGuty6pcVdY587nJy1Vba6vlMsK1Xdx4glzgC9Ni3NvbdUbMEaXKA7s17/A4HFTnaMxGFsL0/XfppSzy3aD78satdNX81Igx8nPDg+3Wrj3dg/uVixs6fUo13Xo5P/NnTrkFFnRZlRttfnMw5VQr8rqEvZZNwU7QOsaUdrDZUnNR5s0m2hP9zjUubEXNnD1iMsPncTqXJ1dV2VBtt6bGMFA6dpbb6JZz3dOmXptz5xqukdC3ccbfBiox/piYLP2XX3lp8Kuv/zhNvoYc2ZMYkCLDocqJ4fDEXCQkgrxwoFNYheM9TdtVnObZDf0z4bcxGJxkYSho5AkYDy1DeZNZN13bJOV1dHVZ0X5RByQCK0NESAtozQzj5xMxG0iLnTPDDRLPNrPo7MxIYtZYDjSb3Foib+l+hDGTWHUjQzPiz8SER+bx2cXI2Hox0S4upXMncy6wtzoecBNAAT+8NQkwZ7cJjcYaDJWIYDZJkzrxww17yo3xlxnE4jUqTdL5zEi7xI9LkxDTKFbM24k6EmeljQ5YQTsMV0Bzk+6W7gvwdmv3pb3p+5Jf/sf/HIQGOqI9vP2ZeTgwHRQgpOGPTuDNfH4S8ACmFxV9/imQ0rzJ8pThDZO/zO95dgO+9qYgyrF48VJ2x+D7tOFikyhW6ufZJquJVACgmu22rPBF4MCkO6zPzUHLZ6WZl0RR+zNukUo7689Mi2mIkpq5SmtD0ofKzwI/6L2FkPrYekByycLadESlw2HbPD1dZpZWhqCnTeg8zC02icHkWI9MWRDGq4gxkZR8SazyaUKrgSHTkd3YvhuMqN/NJhl7gkyJWCeriZkRr8BxGJnbbCt0ifeNSCWSsCWWjyQucS/qmnBkvS4JyvJyCDad4xDRSU3NLz//L96+ZUPFtCZEcpmsCg+F5ki8ySzpNK1tiq6eWxzBeZ4UN9gyXp+kfZcYph9IP7XLpMlr6m1NTKiseKhPvm8ywilYTgXGs/G4yWe0rfhAS4iOZ+bx83OzzBPmO68sFd8yO6GVA87DElEPsw2xsNnIzMqlnpUJlwx4BegAl8QeiFnltDzZqmCWZG9pc7OlsWgLc+qdLrEfOmpMSLazgxQC3A9byvDdRvzVQEZjPUVvwPQqO+alC3uT0VY0tVmV4PpYNjRxl+zo3cWNX5DO0TzOFwRXR/zgg1BcFSKWaqldEJBxND/WhHDqFgkxXj7OfTkRWK8BmOKtVlXhR7VqvJQsl+iNG4CG46ydft/YhqiK6LSadAbaQfgRD+qMFSOkTeZtY0WLhMZC4D+GB1ra2oKFOraAV2Zw0ovZOzMa+ThlHYGoVkh2OLzKNjbPCq7zuqaZJgRJAfGdSoisKGzKLaDQbPk7usJgVDqoBKxIi7uVyv5z3NQzAos5ACNLiPDNQCCShJRKr+WLDIc/RoNVFKUSRhCVTKhfq157x9iaxN3OXF5+A/DK/IGWk9sSEvXSj1aS5JqM+Mn9Ns8WRJy//PyPrX/g+dsvP/8fZrymzyidWqG6jMH8qOnhRkfNHwkb3NrQPQ9SRUAy50NzEraZzggGnRLTSohM8Jjo5Ml9stnm9oReOl8yLQE1mgUf3zmOykZXY0RsWqAcHeBqV7Mqbe8Xdlt31oxJZkuLaZptwDPU09dU6wXBrBOqQv/y4WOSFFZxm2Q5AzrAIO5BqeyE3oylEL2uYspxGw8fSDMTrbcnotrKmBiJeqXEkRGaGwUiGvlFHZnnujzS4uMAYDG9PmusXDYyHcCtmEeMG3xqaB0W0P50ouBNdFQ/ogXwCqS2pgXhIeiZGrW07EaeasMI6BP4R6A1XlRIju7CYnGmsjRdJhEp9RGLeI8hoNcDUVVlblgZYcRl+F3uVlX4NBhYRDTQ1J3jDWUKPd/4M3a5LutSDD/ZRtUZ67jSN8T/Sq7En6Inp02ayRP+pE+Ui/GSzst7GpCXgTR8BsKLpqpwHATfes2pBbizADoIyEULoKycJBuJIYPNJRleEp1WGWkoBQDwWCcYpAyBZRwS2pFiJSsoQ4gRd/cMvtEj1s4cb3llQJZHVirhWfNhxcbyOlcNQXLfOfeK7rlP4PZUe+7u/KGNJiKAQ8tO513Z2PE2ydIY5ilOhZ5SQZfLUhF9fUcgzLIeLbCL8NW2ssTrHB3AQe+0ru1mW/NK2aIhlQ1qAL9PCHXj5CWaHmlpdBR2EwHuuhnS+ETRo6jOEV9zDU5jzc1NiWlrk0SwxS8//ztAEhaL7R63iksOZyp888hc5UHvklCcC3C15bRidgln8b2DLKtVUmR/p5UhhkFHnIDrzjeBXb9LqFn+Pp6r5KDBCkCJRntgRItHfGB5k7GIlYu4ICsTsKjOy3QH9CoaWiloNBzuJC/pwLBRl17wJNpKoffMkGdApTfWbkW4U8O/xiYK6mXe14Lg9/bC5707a2+zarak7tnuLhF2MVrOnEytYv3KEhyuqPDOzknpvzFvXj0H3xKtmHnAn2xBS5wPeufL7iLBfs1ontcmL1fHemhcOIP+3NPotTca//kG0okWBWvE5MxnGnqlA0r2Cno8FP7sO3jbDtzrRPXxdclJrObxqvgmOjZKriWbF+ag0wJzDyuwoF6J1cJUTyQ4x2eG41Fb/Iay++cv34JZs6KU+TkHcMGi8S6pCjBhkqNVRbQvIo2YGvOJ3PLwXEMqWUVH/5VNGyDUdhKZ1+9fvHx1cfq8izW9cS70mDYVdobBrpzhPrMXnQxBrt6ZyI4TP/wJDZ8Ir6LdlmWAnkJq5LgmUIEuiHmZxN3wcQfaYiwEdY1epwdC7xZmErAHFU3KxVQXpk+0X7zGBLjqLP/QLuxz8q4RvMPHj1rPu6/nxEDHabPtHp1TFNNqMRZF//20NC9eXhl3k22j8q8M0FNNKheDcUwXZmbmsoPemczJtS+M8T6bXenkZIsJjAOkBIPmfROOBBnp8MTbuWkwncg8xC13xeep55uhCd5e0lUVwCeLqiQi8CBQMJPoGvgYGFTXpsHqnlURQMsUL88rLY9RcV9UXeJpJM0JizIWZNsFhjO3JJYLti4+LVnJSkT7Jyqgoe+kOoaT+kUjZYHt/aT4Aa3kCVEgAckCCoNX7g85rqjVAQeoDjlV5NOZb+KPmKWVY5sSThK3F8tOnlCKuwesv6MRs0bodyLmORaNjdN5h99woeji5uwRDX2JZQp3GsSNiXm5iM3DWCWGZ10coiRuRHY2tLQsc5iQnOjvYBlyP4KVW1Kra1qpQ2YLO2Kwx1R2oUSmnCHSXY5MTIe4d1RoAFKBNKOMjUQHMkvsvGq3UrtEmFSS0xjS3fjgJTGRBSgXTLAK/uxei33Y7vjatJW8wjMErPMg2YLrBVmCsUsVh2XxNUBPyW2Z8a7Tm7z33SWxcgBjfqNnErKo2TqRAE9BtbQfgSuwpKONIUbNVwdi2YLd5+BIkWRT7RNMD5Ufi/hhYYk5iIYVCJotdaP2oH8eFKXBRIeDI8cERydUid6PRG8E3zOUbpU9otbHL4Mdx697qLm/t9ApoW8TD/hvgy6ttZeV0dpGl5qmf9rU5fiV3YLz+nuso43IKGJqPbz27J12DHYVKaRN4drzCTxG34gFNPkeDezdgnbxppT1LrKiAZHPbX1HzAvHdJ9rxJegHfz2iZepvdeER8BQCUPe1OW2+wbMbWsrVQOw1fnTYI6Ohe9UO0P5yJVs7zJPdhgCSa8KagXh3I90bPpzS0DdLpd4g8reZgVRCZPq4Yjiq9l4YP/J+9491E96GAx8zsy4nZm3hfr2vA4v8MvDKHBcYUqwD1dmBfaddFcd0A4a33CIw0rUfjCkOxiBFnXDVBcdD7YfAFLQ3oCLJfGaLTOMlnpikUvNCS/zA4S5lRAAtUIA39aA1KQYU32/MrS2rwT8o8CBUZ61R8FsGofN8wukpj9vWOjAtBJQ747Q54AhiF+xWKPwrUUqQFYcxfbEP2DEwH4saR8ItDGmZ/WdtmS2arJrb63Q2zlIckKVjq8XFOGoKWLvfCkEiJhJuHct1VYDRX0Q26uxSUlWsC+Pv48FSGZLB99tKMJSU8qWwG0OCBLMt+2V7qT32oqaQPw3mLS9P47c0UCgMRwKJrCO6T1yKDiwvstNQa+nX8U45TXpqV4B0CISUifY5SYMAfw1y7bcNmJGDUjt9PJcpChTx2ubVDDseXvi/uUQzWbj/BVRQiCX1IN5OYemlFR5ZuWmiFAuLLl6w0DTnBIscvHXq3K1gjWdV2Le5Dcq24Vm95aBr0ii/ezcmfiblRYq8WQZt/zXr1gm5jFN7mb/hmWvk3gR965dPnLVwruiAxGMCfsabWYul2aMOHlsQaljPdH6UZc4NHW0tYypDtYudiiIbZ4f8j15XxvxxV1HWMQXejAjMvR4RUf9Dkf9RPuBlaeSQhr9tFwuvcE/qRsX1YNJnDDSrSN8uc06Vqq9EeHqrgNOn6LA39dsSjT61mupYetw/77Ik2wjRxYV9cbkaUUn96rKOsP2RwpMeg3wtkStGrWcv4egLaBDX4gN12XU7vSZbOkelNybwLaiExRP4BIF5hVsqb1u/7R6XJs0+KyYbpL7wXtbdXR0u9K8qr0127ExQ9uElk1cnG9M+i+Iv+FWQOcykrF4ez+oj87wQu7H9vhV5HTU8qsP+CnFrJdUVuIzXVeMes3GT+ALy1iiTubEyR6rjRnDvquyuhZNkGTUjchbIOMFn1siK9qq4ZAG+pStbRZuCziUq4qxTVouGshE9fFwyrKJKrMF7SyeuxPzLvYAzepHJOq+66/rmpjllCh47O+DV1k9h6krK6PSaIN0gVYi/qKDqAJR0Dq7yuhNiF47X+u14GwgLhw22Pq9N4m6kAreKEMx5KlczLQ3fnUCFxFzmRBGoOb1uzT9Vi77+ID4J1MonayZ4QYO3gwqFbZ5srBrVkeD/8ShpY76UBgnXXh1IYAG8P6OKU20nis4uR43ZYqhUd93cM1hw43ohqSFqQcundSZ3yUd9ESHMiGJNl0vphbuG1OCqtmCJjj94os/fPmHL3/3uz+Mz3FMxqRw6EzcTEb1l7L55ed/J+FVWEEpSSo+KZip3mKnXpjIYNg9B1/VGiH67XAYUJC0LPILVxRsZhgJGScetx7YxljqBPH6ntt4hluHNxt8IiJjUpfITva+cwVPJvTwB5nIlgjop+kPWuunKfsuTX9g4rnO0p9m+3SPakcMdk9BqMFKFxiU3DtHEDlC9YIRvfu0WETcVIiUbwOJiaWq/L5mo6S3IfRnqHWto5igoWtvYBD6fEXsq72GSknyLGCNkU3yyn7fqy20HE9Ovv3W36S5b7/1/jUzPRD6vnnK/mP7A6D2r8WzTHp/qtadumpIS6CpCLUI8oyMIZ3hYE9k2eHTgsnTvhBa2FIPFpeV9JWNgvJZRsbLfnxQ/KUzKipAswaXVjmLsr3ul1rjp8kP9r7+SbrAjYt5bosVc5pOF7h1yfmJ9PAM4qghbPXLz//AazD36dWJ4oNtApFomelUB/uIp9eVPtWNlG+GnzGI8oNUgX0G0957toUeSStcSdaiFs2XLWYM+qlJV0ar4jkXpBpVcAr/T6uqvCPEme43tSPBc09dJ6gwIYWyP5lMBhOpwp9ng5Fie2ryooSoGrt6xwz/xsKlbZE4S8i8cBng0sCPAGcngztNgTCErLYAiLg0KZQVAeSRwODLCMI0MPr4uYkFDdyIpbNzbAetEoaHXihDQZNx63AHyiHVBAdp1BQ3BR0MHSsrrTuj0o+0VAGxJFVqLdDBEXzeNrVyRbbHQa0gPAiGJk5BfPV+S5oHb4IexnZ/vWpyAn+tKf58+y3+DvHnX/HnVzNdquFQqdiJRQxls4uL8dnZ+C/0v1nrWuav+GFv957nM9QZc/XZYdH1s2fjzWbsXOfZ5OJiElVP0/Q6asX076y9SZOd+ZwJZtCOqTMq0t6h4+NQoiKq76w4aLejePf2u7dvqfL565cGzQ50yo9Jnyv9vsAot4UITESfGfhl+Au1dyItYcnorz64QN8nGBLK5c+F/+fC1zpLdlSHpkTl/Idmqv+kvg6MllTp2TM84D/rNf/Fn82G/+IPLSH+xq/9vSzw6l//iid/jRgOuzAcYTfX4H7XupsB7ohWQI/Hwo5A8xuSoWy4wI20rZnuSnaATZV1qEHxqmqK44KlDk+O94i7XvUsZD80qc5C67MgFCFhSUsOMkiZRwd4eT+QuMy7CXgmdSiG1AevIwUYFBDlBMnBC/bTTB3VYv+byyRLRSXgF2B9Yol/Ys7PANRRII9Y7HSe+TvzsUqNaxYbM4G1/gR/ZW7ZKUSuLPQinpnD9w2d+nrnrd4z8d4DDfz+iwdid5j9AOvb9Sc2Ds8h34E2ro2QPpwRaLoOsm0WSUK+nsP12a71qO1v6BzCz5b+iZv1gxzotGVR/OqKd9BInHvoX3GHkTHogFDt33TiaofiNr6ibopxPJskv4NJdt52qn0Ss2zCSiiU+rUzXHwSLnEz8U+o7Ypm/3e5hcRmY1ZQi/0EAsY7MW+K7PuG2HEKW2OwhBYNPIIZ23Plie53RZQiR0pWExfM8p1pA1V/zcKTYYx2R7Kt3Um/2tJizWhDZsWeHLC/qBwRSosPKXXBapEcPFgA5rDOw8lZ0PwyCy28fG3YXdx9RcKPqRBrk6S3Ygtlxx0HT/TMQUXlzpWF8HsyPrBwPz6W/7p9OCEjlXStUGb9IIIJneUO2E6bO1ws1P20Wh60e3oQT7F8560ukRsqdb876BvxCp5CFgtSpeuDLugtIRDUfz911EdbkybY+8c3wV+IHl22KmSz2nXMlrHDEa+7AvL2lBVp1lJBh95psrVcKLImSgufj2CStdUmK0QKsGnQwpKKIyhei4tqt1VLJXrUNbxm8wwTNwxENDLvhid2GxIvD0i9yHOY72zuxOlroox31VD5YRP64BOaYDvWYQNc/EkjYMvcsRGIye7DTXAbSbVyftMUPVIRm1mcnDwA8q8I2++CpKJth3GT7y3E+wmQfDIbKEiW0ckBiZgYX+6HtmmDWc2tdh9ufPbuu1mnXT4jL+d/Q8tiE2ULySKn0bNn24w/zlTT/ArLubWEmOx+H6j8sfHD8MJSFdKdyHjPTTPSOPf0Z0/T8QVpcFNl2w4xEt4wUZb6F48GsL74oxCUJb5hvIYB83qTqdp7VopvYOuAuRSTGu8WdlzuLACBQ3xWCZ8QWv1jvSAigjQyPPb6GFf1UDO4FYjRig4yW0zVSkV6kTgfgxsca36T3F8z7mB+IT08B9816g3jvfkfmH8xiAPiyJ9BwFdPN1sL9xXvJjEQpViK1TY2z0BMrVq8xEPp6oW1qXAhjrYTPfDs1cW4ZSbstjpl4Qz1Ce7W6tQS8w7A2VcWFyyWNP30pB3E7ycPJw/BktjZE5cksPgEi9bdHamMu6SYpPZ2KkOb8s0+oeTea7bE813OcIiFHAdfX3lEsxNrvQvT49UM6yxPMdnQxkdejd7YI9woYi6i3cu2VMj3ao3bi7Dl0VstrOYq8Z6Heckjr9qH2dpNsiXhwhE8x1psJ2w3LiIjdm2Vo7mAZnromFntd8WRAEKD/T8/mrrBx7pkopQ+O1R6cPIVrx1GtIi9jOPF2OAnMf9yZSqb/whOReY0xfy1mWupG8YzR5VrWruw23T8psxMAJZew0n3vS8zynZU5ZpOJEdWRSXCXGJbkSOV7bcPHlw8AmL/4k/4hyh89mCmZmDBTp1BeAOSo1NSpLyq7xmLwK8wEP9VR7G/pukmXs+zC69JBQd54g0Eh/ZOtXatxsU/2516p8yovTAQkj4a+BvpfrwMVK1ijRb/foEPVDed6zIQnRDKn/mmzx4dtpvOr5Nt1jYY35wNhy2Qg/4Bz1rxKOrTymbFEl70zG6nxN0Z6rJD2ALMq42eSFZJVrSWJCMjweUm9a/BhpXd8E15F7piD+FdRzhrnkFbGak7hDTB3gatpyP7WiFWSPf+TqN08wwETdriU7kBiVdgwQ/HGV8mqA57WWW3wMzYjCOvbOXxmAbfLpv6Q6Tc9XAoC08tEh0IdujTtgd/F7Gb/Am3CictB14RoGjmfJXwtLx/ZUm7sdO729X0LrvJps/KO9wfpM1mO6ZW0T2iB6ox2Pj49JuzA/u4d2o94sza611CCHDMYiBQvj6GY5hMlJbXMYSXiLnhsLA1KGAKxMxkMAKFsKOm96REmSzi4+fnUx/EiOBog1Bfp2R+tiPcli08qfuBthxNnh/SvInM+bBiik7ahvuJgRSe6fAK0oGaqhFfMbZfAOgnOd+it6qfGhrxetC+QaA+/qQPlYInnrAV3XtZ/+bBw+lvHnxJIrXcIurVESiUTCk+3I1DZaVlcX9mpxvGE7W/BRgOv2HTIyvPbD+T6H9k2iD6AHi8Y5nD5q6M6CTJSThuYE0gFNmnlxPHrDBdRFWijw6G39l9ssptheIqWSb4l42nGb/keYUMSP23zTLJc9xvYu2hFRXBCMuDVad58R9CrhrUdx03BW/uxCbofvlZI6YtNpPqEHBBTxTXdZtRkpBm+p5ipttAxsxguBk/KRMiFJLYe0gfC1X4oAV67gDbaKtJw1MvPqYX0tZS+PUDoQcPyEc0QVwmHqHduTzSa4irq0sjPIYk0byCexW3yhxKzpNRclUynCVZSWie/oIv0FQJ8S/GnJBCnqP4nmrwv/rcfG74H3+DANKBtU+zufg4HoLyZcoypxCvmCmdnPvd9Or5ayOJGWIS1pmITrK2+VYn/5iP/PvOLjMEPrmyBAi3w428thaUdNw85eIW/UmnwH0Pwz4olW/zmbbFi0xo1lcASbZ3AuI17hDTVULTRO+kZa7g3Y2u/aKHtkwSRVLRWS+4HrtwLpem34inPU9iL+HFKIS3VRxfESd2YKYIM15WwKnKiW8PqMzf8SBNE1r1XtfqNRi7qQePY1Ks2D17z1fe+9njHc/DYQxunLgHJnAfhb4Aq1RNnE398Hwsh7Szyss5qvvNxjY/ubeLRs3ShxsOJm19Ddn0J+oNPbO0m/2BoLEFqbjwRYhMy5jFonEkJnTb2dlccQi1WME8osEtaDctGYjoFbbwWKHtbUJKKMI+qoaNb3EnXYwVAPYjWBuOSR+tMKfnSsPsGos4xaDOBgequXp7gYOUefe26fF7iKE262wl7kOsorD+gTAQ0BvoLBOJ8eZ86ptdWrjWuLxZrTK31qmcbuF4ap6Xq2PzSPhpXqqKGcdgIcuOkecH6T4yxEUy7IF/ilruBkFG+pMyivOYwW/GygrBwRQBXT7KTO7Mi6wG7OcLlSNDdVrhGmZPlfS5hRSGKjj1LrMSWyehD4QWYTJh54bWJ6LNVoLhIluJUx98wovC4ojOPWNvCj4b0X1gdOMquMdJqgDIOUkLw8HI/6j1Ttn7MRAfpqXk6BOBS3wFJIGGQZWaOvaDBLPQhXllN+WtNc8SOvAXSLJ2bHEqrnS9pkrXnIltDwr5xAfG54FhdvV5Gy9EEojWstkqr3tBmGQWzhLqqz9Of4lD5DSb0uwp4QZUbGt4+K2vSrwGbqJDKJO8eVU13RcVFMpMooEFL/5Uozho1SpI6y1sYYSbxNDLkkIOsYztrbCEkzbWInNteNhXfFusgQGBk+kdG5uZxDnmyFrLCblmYxMbV5QBQBd3CMtfNgwAhdOy/1w3VYeCaWAXIhNuAnRCzBHnWggC7pqVJZbeODYquUmsQzgvceAoBSWrEgwt7CFgSzS3lCAoDr7DVMdxHJTr3J+Df+ADyQ54ZNFRYJkW88eRP9vsn2phyUoqcAMfS6jBVmhc1/SKapn2MvDIgqKd6zSr9py12jtIGNZqDk7WHls/ds9D2ggXSOadd06L0SVennbDe6LoLg6aJwBITAa+OyXBKnWbBYoZHBt3ptWvAe2vJZ/CdYtquhEA2GlpDzWw3xz9AXaA18XNXGIcYaCl5c6KRnnURaxlOc4d0+pNojWZPjXHO+8zD1UctmJT9c2Hg3BlOUbCC3OWT8nGMxqP50OeH8ILj3LAdP5yTArKG3xVcy15baaEk7R0jnelWMxm2n7rxswASm8sp/Zebi7ZNFtZpPqQ+H71MJelkHvjkwP38JBZyPungPd7DxV+81FDPBbF6msGeChXT/ikDr+sKbmydUPfT72jXqkHDqh6f805HjoO41Iu3sm9i2Tr2iw//iVN7iAOpQRKdjqRqVGtbc/ptc2g1/q8Hs2212YKFc82mQkdVI7iYVeYkQ9clDwhyInC+Z7YUdVby/GIE+BEZsJOjr5oxnvZ/LzflwQjCEyarr1hEwndQpIIcQKfqNAjJqkWfOur+EsAGuTORG1KQd1eKoYmxQVaLVZVG8Nlvv4aLz5CrGgbYdQJ9OOIN41q0Lhne6cBvjIwRmKKKULUaWCoodXM6Q3nSHmrBEQmDnGXWTdsf4HzlYsVIKTS2WrkjGpKREFRUJmketJw5fGHYh86eCC2KkMK1nEUBJr5+muJ6g9ehnj930ADbVowoSO+mWzz6e1TiAfBsRW+m8pRg0WHQ062gID/CDdr0P0a5gQ1/C2J8OG2KlFf85LobDPRRjwU5jw/jiG5BLqARTCgpTkRfFi0IDyc5G6imMidPKST6fWiZDXwIeDNm2MZLGfL0cRMtCJJiJXOIBR5LcxtRiSEEehi39ooIosqptltlgJscgDnyFSJBhCQkODzx0mB2kjopOZoDA1xFw9AqJ7BJd3TFUMJ6tvj1NbwCmc84cASK44Q0Ok22d3RdCIHWI4yE1DNGbbYGdon2CKRenQZ2f4W7ftB6s0QS5REaSzb2JaWmBdqICTouT3p9X4Uy8KP1CLmUwuWMT/2fiQ2yf+nKnqBxDtGr/4Y5Sbaam6iJOQmcj43EXZHrv3lTk9a6iQi4sYE0LT5DjjU/fKbtkCHAEeW9i2fn4q2PaSnmnIGFr/Q8tprhj3tez6LFrsfhzxFVLn3tQdv4NE50lQWYhPvDKZPO4orsTFTge/L+SwqZxcwTDYcO7U/Vc2g56xXBtSFEgEDYX2Pbn+bDbWT8+ijOVVDgsL9oUQZCX3wWxTZhJCrTbd1TfqgkUs+nxqWe8rroxGTQ+9vOVABJXHPvC8H+4r1WLMhmaNxfPnEaArXflOErR20WXC8lxRzsijmJ7QrY4n777Qf9dsZV7BbsGRkFtSmV+O2kqhwxKkXpGUGnJqt5+j+1d2QZrOXzHYvsSDm2ArPQiIUpDqA7shrBsIihR924gLZV0JSk2HVJIx2jz95ygXBc0QUCDIst8S2SdMBwO0FUMJ6WVaSX5LVcU5oS0d+B4CsSUSA9CJYoDmFDldI2GW0RN00vr3eOW9/8B8mdSNDdLNRBst3ZIH/w8wcGLOkeBS5xyuDeEJpnihWOJTKw2Csegw5LhNiWucNs7nEnSWGZOouDkRSawSWELGziF4Sf6SaQyRTacFpKpCoahQg4TUL3QNFURscz3BJwmhGYzOVrfP1oeTZaZNRvNFkFJxdVOLxgqiMJw+dgYQ857AFWgjCCnL42DZ9wInlSBrlXu+hj8GU0XbWl/rnJS1x0QHrkCbQqCSnviydBm/O3iW4l/hu1vtichCZ2jrGK4bGG5JlMpLwoX0V9b0v/diOQjS0wVA0RmS8SgLfZSt7v5mYJ4iRx6B9bE8GpYugRy3u0e+iBr6b8Va1ZZgT6UzvOMeMfMFV8rslAy2a72/lKCpSi/Ecgy/kXuqCnTgHEY68+NJ/SXz64YMZjiXH9LPxCjq3WyMbXawTHQ03beNMj+a9BpVK8JKGZe+1xfY5scfFbBAGRolWVsDNgctsdwyZJv9vG8bpBCYHsw62PIo4kfM6aZNmaEQEW/HQyhsXctiMN2L/q+zK3ktQxkAqwtRZw0xMdIlo2VrdMjC0btyVDnfG7nmch8AFicMDveNsumE6fOWOdJqoL3le9papTW54NLehjyaVVdh5AUBPTqJEg6MoZ+EoStB32N2nqdp7nYr+y8EgCxYGNBt07zOjjkyc+hTf2pyqIxNlNMWXOAeqPNTEoYeDdczpolEq6+u3fE+yaWqOd83kEx6KBa1qrA+J4tQI4bGSDYyw7CEWhZH5hy9K0wfkGexXEL8LN86QnmCJiNbASaP4Uc+AaJcTTh/WSTjtuVPs0ya6XMTMVcRqruVE7Xrm4clDpV2Wb3HGViGzccT0ZehArzzsfjxUCbpmBUfCoLVSjUu0aup1n1g3Y5dS4YYTtfxJ3r1OA/KG+mGFlzzGHA4PhR/M1BIkIJ17YgcACPJQXLs3CVLQJa6dFGduRosrDffXjoCSuGudqyeHqzZrF9uwg7CYimdoxivVXlW3CXGnhIxt0QKVwR4d/VlDqCDsac/GQQqpxOLbDLmnn549OqR6SJRxBbeIWOuHtsChbRJkrrZ2RiGSbegpHcrpVSlO8T5wn7P/pZ1Q9tCNhnjHcj1EfYsL1+BINxrF3u1GfCbFfeuwp71o+WPB8uBs2jDXnoCiAfHB5AVBtVvBLJf2bYYKs8P+4oSf6pXEia6Jjy9qlQLebkcUfaJh1qC187PYfbL7TWqws6MWv2QDg2SFvptKhchvzY/Hu9lHo3qjRQfsna27UTTF/88EH0fMoPqLFPuWUC1Grmf/g0hwswEXcwPJARN0kASZ2BHTz+mbiVWUy2AqlQNciV/SfsdjCSqIVuUFF/ReIRt+kdr7Yy95BjyG3e0IJmWc2XtdR6EbFbfXtdoxopuijbaTTtP7LPtS3Z31Gp2DsN99NzthtuxVNy5U2HriUWNs4uMKHXB4EsVyRA86FaU5hW7SRgCPJ0Y/wvbOyURiDQP5apjC8Llhn+kWaJ5E90BchKciM+hZqxmwFskw85gS04+MT2qB0NxuH1UDWsjfsZ/6MXClWHVS1YoH5Pmx92ZkzfZAcTpGQe85jsijwZStpsfpwVl8Ly3aY8qR5SxWIYeJz+5wZJP6cp071fvggUS11FGOdaryYno6GxydTnGgSHv4wBmNWjQRAw34Ys5xVSz+OnNOHyEEf6wTTiPFKXtjOMalaupjGMLnvccscppJ/A7nuxQbBW13/IYo9rgvUqQs164+3PBgDCJeYnsBF/SEL6dBdkl03WDU5r4yvHrH2gxB9vvgG2W9mTQFbU2yW6uqxoEC7miDnNUYAveY7O7hz5QTsnonrY73BVL0797bqmgK7Mmy33gkmnocmA/tWgFYa0Ora0mRybcuSd3p+1ivcUKCI6oCL9Fr8Q+tOYRXIzxrBf/s9CjN46PYjWfh13eOTPMYUOgJXIjC8MJ6KfIWHGAYm4pMOd46FrGDDVTI9yTO9aB5Jcv4Nyv2KKfbnIcQUXshyX67Gcca66bBlsTX+DPtpJt2rlxkrbXvcDng/zaPYpP3ZX74nalW3oefLGLDzSUYNmxluq2S3IK1EF4KSbTY/jTNsV83msBeExo645+jCS7K4g7hiZ/Hk4a7pMg6IxeOPDhoBezuCt8Q8PS9WRFC3HMUpJIWzxz7Ma1em3iUxIhP6g9vEMnzL1wB10ua2bYVlIJsRiGFiXeHckYXv03VKtm5kruEw5ORzog9R3W3OM27/iYH+zd4TSaklWXvJw1M3iRbVvno6B5R9TqLIT6+46bKx8FbsfvTUOx6uhPqh9l0CprtqYlNUilGBiZh1lQfVcvKBGSsefk61wiD+CcBeoH6WxHBPz0gwh62NS9saRbD4TP+FSRJL35COBqWRFE6/nPjOhyWKDBKWy/oYFHrX3DGbJ8JKCsQ1ys3IfbgJ5i2ulScVWArHcmlAmrBP0+uxiSaIgbmMVH/8r//n+nepENZGA5PF/ihEkGK+MWyE1Yv2JzlO46CGICxlgm7hW6mD7/48je//d3v//DPU49TEIuiS6G/KjILlfiZJpr6QKOhKdP3Xlj8gyitXixrL8eYBIlu4gCTYZdzmYG/V7UHv+p09eZcFoq2pfURMUK6ZgziNX+kP19jxBLgGRCi/MIE31C3RbD2KwyWX3bId3izyetsK5N1U2yZBn/qzzt5u7D++Inm7mYTvCTktHfYVxf2Fbftz7kkuAJxxdlnM80KEYwKEiBY60+HyM9L7R/V6Pf64kMa/ahfrxddUK7lJzv4p+fU05Imxxi48o7YuVjSnQQB02mCW7lc3p0xJ/SXUP7nmSRju0aiCZau2MIk3bTecewkQP2EnN0K7KNIE86ELLmyulnkJKmV+D/B0DeO710lOVhivrl8MeKZtE7TNH6wzTbmo2QL2JKzj8JLOd2WmdzfHW3w9Yho6gb3WVTMv2ExZ4meSmJYniIRL7tAEhJtL8/5zuv8Etm9JImjkzeoSb8OvhdxYKj2btXU+5AD9HFsqMtWM0EvoqqrB4vEsEtABPE8em5lKZ4SKS/L+4GXIMumYgTNI8fWhgx470IKvMhrmKtxbrVPT383XYmD5ZhJHPYwagQy9z8AUEsDBBQAAAAIABqXiFwAAAAAAgAAAAAAAAAVAAAAZ3VpL3BhZ2VzL19faW5pdF9fLnB5AwBQSwMEFAAAAAgAGpeIXPA0IbADDwAA7TQAABgAAABndWkvcGFnZXMvYWN0aW9uX3BhZ2UucHnlG9tu2zj23V9BqMBGxjhq2i0Gg+xksG7qtMa6TRqnLQbZQJAl2uZUFrUklcRTFNiP2C/cL9lzSEqiLnbTFnsBNpiZROLh4bnfqGGbnAtFUr5asWw1GCwF35CL7Vv1Y/BWnXJBCTMQb1Vz7WXBqqUznrVWP7BkRZUsIfwBgZ+3zwulePZS8CIfmTdnItpQ+/er5/x+Fm15oeyLWbSgafk3y+gkYeXSZZQwbtDZN/NY8DQdCxqVL9jv9IKnLN6WL/IopmKq6Ma+eN8+0FA9GgytHPhSxiLKqQhWBQskW2VRWvEU5XloX/VB3xkJBFJtU5qEC01ruXeuXxr6BwMQPjkpVRDArhn8SYXvyXUkaOIBOePTq+n5m/D01fn0dDIH6GtNse+94HdZyqOExKADmimiSYlIIanwRuSTl1gA7/NwZPfM2EcKIJKmNFYMqOJLu+NAkpxLJfXOFMCcXe+y9GH7iqy1s6LxB4JH18hHpI88B9yc6WLt3zLXgicsS9gtS4ooNeSQxZa8u5wRLsgFPJPpC41qE2UAEhYi1ShuBoPQyvdqeoHC/aTR7pftMSlP3dCERWbNiIbWO0B/kSRRlpBFwdKEqDUlJf1ERYuUBn/NfuUFiaMMFzOLgjAwU0kUr6H1AbjfbPMM7w9RJpA6LhTfRIrFUZpuiVakkRDTx+4ifAmSi9dcAl0bntBUVsc+yBo6BxslklzQW8YLaUlJHkJLdXLbmmpFoJiTls5GRqrgpNywjSfo4/oQWnt7OMq9DFUnPNw8j22obBImcxqzJYvrbbnggAnCBTnP0u1ZlBmRIzqJ+HKDT4J1eTXC16hDzROK1FEdPBL5keU5kP7Pv/+DAJdUGGQJEwAEjHGjnYzeK5JHK9pEPflbwW6jFNUFRouAV++m5MC4Gjk8BGc7AAFu4EUSmH3gep8Hg9NXk9O/9AS20zWNPxqGj0vnQcNHM1NsQ1NICI9zlmU0eRyJeM1ugXbtitrHcWMYIw4nTBicGyol0N9FaxfIH4A/5iLbyNUOXBrQ2kUHH5i8BnicF0BgJJsEwsIOpFJxwXrow/dboG7NVusU/lUOOr3m4MOgZkTbjGnfIdbjWttnVMFRstoxImbLiJR7RiTV2Vtbm1RgbhtrvRhTGm5uIkvDmqqAibET/AasMQJLvbXBj8g1v0PjL10TiAVP5DG6nlSRKlqGP3eDqg0zBpN25RiqhI/kYE7h2NLp5EEj+gLcpvLnb7GjHukZ16rwaFG5BvXVoiILwe+k4UsnCTLfkU1arHybGfewpGFLsMf/HWa+1n162LAotEYq8K833a9jAYLheDZzQmGr6PuBNGLlYPCIvLaWtmQpBmwIwAVQTTdMIXW3UJaYCnXwev4yPJvOriaX4cV4+iI8fzP7FU4wUYhDCvFckLPLyaQCWQpKuyBAKS6Cvr3BYBCnkZRkrJPJBRDk21J6aGTreZ5Zc1IOphCdawTNUyjMpZbsNIM8Iqi42JLIwkHZk6sAUAw0roQuSRiyjKkw9AHdckQgpwAycfKG60gEySxT+mFYq1YWUJj7w6DaasCGNQCgCiwm4Mz+1VwOS8WHhjgJgJIqf9gBU0UeFgwWapqrlwjjUPaInBeovKPDTSSgA4DAiS0JgeoiTwt8sYiE1AXiAmuI34zpRQrrCXpPjhxM0YLfmhJH6nbI5HkfCjCIyhAv8dEywUWoVQCxuYhVIegwqBBxTdCJ2yEZqpsQAbB0arxbvta0S/9oROw/PcDYgQEZ/pGVi5aYIfTE7eBcgeqXuNlY1CWV7Hf0Jf9KFLQP7hW47u9AVZQahM8jYdpA/60KWq/q53F6F23l+dLhsQxcJ2Vj6JBlddQUkd3QhuoT0zOQUP1v345SVk9+3C2M7olG1FGSWACzwxH3I/KKQr6sDXutH5ET3W77Za40DusNW4B4OLb7vm76EXrFKXk3hSLk6dORGQUEHyjGy+A5T5NhH4ILwcEb1db38B1wCbub6rRyqBkxm127KRaKKYisNeWnaw6tCrlbg2/AdnIXmWo04eSOqXVf6A4cBkuMTQrh7YOJLDE4ZNYwrkIdddjAKHCgQcyUQLbCiXkbrnBuguw6Y5SWW3bhkZnJfZwWEqon6zPO6c91isSmLWXQMQADh2ZwoUMzWCoIAYPNEgMCyq/qSTTBrYNLPKHFcVIRBKe0V32HEEysbET8smY00XWIpRrNig1Uf4r6zXToRFD8MfI7aUyGDLphF26PET/543DHBj2zma8pUO65p5BPkHISNJBj8lN+T57l938in70dWGrDskx6Nbv9O644T69Y7rszChwSlcLyvBbFPUYA9FmRaLQjwppbOpaswZowbEkYOTkhR8doOPuHI42NvQf0GkzDNOcUUnQEeQrSnrqj2HEbV0HPNaVZbOpwfHYsUfuIHiw2ErN2Bf16voZu3DcggX4IXuF8cSc0VGkOODwF8yL7SLO+UFC6+U/74gTNHVY1F6HWZiOYIW+vNa/E14UkdhS2gLql0JGXxePQMTYH2T4rfzLcueXbQp+DpCfAYOTYNGtVJ9T4a5YkoN8iUywlVbNNmKzCdTvEIZBB1B9rOutfHW0atfb/X7CpZwffHWtSmrVjN/QyD4xA7RDkzGJQX5ab44cGnI5dtEKOLn2WTEAuXGyxbo+KVNWGoxdO+rg2D75TygGxGr5Jm36lK0LkgSatMraWaU+r0RTi9dHN9ZObQcsxGkSx5BQnGzQJIEhngM5KAQAMVpBklK3QvfoimRLYDvtNf+aAf9MpVBYqC+uauL7JcSJwDbIDuaYNx4shgAIa95LE997g3JH88guYcC4YtErbk1YH4G7XTsfuKWpfraHmOtoFGO+SEELsot61qRJTrwytFOrdbkfYXxa12kNofOsY+g5gyQwrtbNOFMWZGMZQrOZfVGMFr87FmKgjSHOit6OpVlF075lkVY+Far81LxynIH5VAUCcti8dGeA8sN1DVmcMm2B9HdLTn8pO8lkPdJllnzknQoer6gTacCnPiutuzeK1Lf310NsMD+u7lWqaPr6YIrNAtiBxIdHmUUm+HDYmixr5jEbQdS/SKPuI7YaWCQ7CQDnQf7FF1W0Qv5RTUKMYNhjYly2Ohl3YOsRvoPVLOom6hPvARfJBRHkr3hiBOm0Wy1wlQtWx05/ThVuuVJYpj70GzEOrEDjKoQM2tiND7Sgsy02cKS+FOwOYJqiWE86Y1tCQUnEFDut7NFgFhCgqFdjRCAw8hzJLX1AcSlN5gtp0U5RB3SfdGmvXGWXybFrHRN+l8IzivcwGb9QrI6vRk/pMsDpNhuwaGm4sTeluzbUFb+hmQYXU8/s1hRoRkcIyAwNclAbeY7P10YgljiQ9xHYvkwyry+8w8l7TfkQuBD3MeV6kwKTxt9PZFM5egVdoXRweFmmpj+EI51Isz3FoJYArgdcQmtwKpRLbZmq1d+v1NXwB5aRExSBK4FOSUOrxX2NbWKT6JRgUWF6klPAtGFY+YbndB5q8UudgvHq+iCq9vtmFziZyZCQsmQi1evzrIkj5HU4kdTVaYC1T7YTKobjpNF/lcrfW2WmP2tCB7OA3zjK/ROA4Hb2Paa7IRP+CeqCJO4+k3OGffUf2RBUbNGCvG1SoKkRWJxyz8me8t2Hxhqo1T5ypaZ/0jEc2cuQl3eDos1L+gdRTeAVGXRuQ42/+wQYOPxiRg9pe9JthI2c+1Mj4MqTZrf2lLc382ayySzrK2zj3x7c7gtIIvfOz+enl+GJyGV5O5pPL95MX4Ww6v/K01UElXlrQ6NtxhePZl/B9fqCxuMx5TZmiCerfn9s2cJ1p88crPqsXMPSsco2M45C7Qn1T107omaX19VRMlwY9ZvS4EDjor2dc+D2GsQQImfokDH463mQ6GG1ytQUuMm5b1ZZFYB160u9zuOYPA22zfqMTQE5wtS0zI4U6gogIEy5EB4ujGyUQSyDzlKFrg+4wWJTQN2357olAcJJbi0Z5nm5rfhQPMTT3iPaDYIr2SxZqB157hontOKYRdAmHr0kVieMIOrhv8jPEGURxTKXkQgaCYhYCbxPR16cC+xBubLwpfyBOlgpumFkzIsORcDxI9paOUVLDoJLDCaJoAruHBUWeQBJ0MktPqO/paPkqYNmS+0vv+uW76Y1pBvSB5UiFqmPyCTa3BwKQlekehBbfG65V2UCJU2BM9fryqC/be7uTCUq5dSweeReJDEv3ko1TXkB3gw6ibbA2J8W1CQFLFBlq903dEc++zkmtBaWH3BC2cxT1vf3SWQSS/o83QU8brWdzjDiHrrD+UsEtzb80InS7jZ7hYH+70e4n2gPBzhSm91KjR0T9G/feboRG27L6qKj88ftuwyFHXeDnCo/JxcV7ou+7W4nVyBJXzPcSGNoQtvp+A51lzXBgi3fm1XuopWfm0xS/yKqPI4b2IwCsviN9+Wg6+MBrJWC/72IeqD1zz/gSwQ2CHEIbjNhJ/l4KxrMZnD2GUFBi6z81ciCOyYKrtaGh/MblMRzYOKgzyXJ0rWeBqMdPdQWhh7jJ/Yj4+quHkU6M8F+Wtwa5pRm0Z7iL9gBXNQY+Buah3WsNXTaBSEjPsuNANX+aA0Cpf/cNAzt27wxZFyOUQyuHtNxQLL6A1Uj4WhNwA4IRC3fo98JMLY6NuaBBfUlX130udrN77rmDzT0DTAe2O8TsbzEweWAVpMsbO4npK3EuEaa8baq/WLHfNZohsM0kzkDHyRz/i3PinZK2ma+bxf4tKm5VzHFKI7F7fNOlzYnxuhbojLLtN0E4cWWJo1cQ8xH5+cQukJ/NtUT9vVUrPOwWbr3l2uD6WvG2rjD6T3JHJzqgVmWRHfeasI6d296bWOJbhtsD8H1Ctlvwsrcl667X7ZJ3bIyg8oKOb1sAG8Ya/mCXmhrRsQnQ2cUg3x1Jm37i/I8aQSV6sD8oGxIa6s/bFF+tUsCJX875Ngo3+MYhfztSAKH9umvS/YiMm3Xt88nZ+eXEfKWHdbXkppauCm2ANF/DxVwIcyGFzPXY546urXW1VjcOY2vGJcVQW/ez0O4gXBlafyu3GKF9yYq7LYiLkgrBRchj3VJajJ1+xYMGxX6VhMUaRA5Zfs+DXwlHVZRGP2BZQYPmCHM4+BdQSwMEFAAAAAgAGpeIXM0S1pfVBQAAnQ8AABsAAABndWkvcGFnZXMvdXJsX2lucHV0X3BhZ2UucHmtV21v2zYQ/u5fcVA/RMJcJU5bt/WQAUtfDSSdMzfLhzQQGIm2iVCkQFJ1jCL/fXeUZEu2k27YDASRyONzx4fPHU9BEPQu/zyDQ5ho656P34NQRemgYHMOM20gZ6pk8jnZ2NSwQqg55Drjca83XeilguWCK3ALDqXlBiyXPHUWgikZc0TLxHeRIQQU6MDC7QoIC5HJIYzfB72Z0blHYKkTWnnfMcDpqmDWcuvdSWAqA2Y4q12QIVdOGC5XcS/AbYi80MaB1PM5Btm8Gt6rHExWF24YX7h32mBY1eSF6859KsV66qNWW7NXIptz3EJtEfYAfxefT/X9GVvp0vWrgTN2y2X9fM6txd2gST0wkUyor/zefchEs+CvbYTKUb8X1aHrmaeem3heitiKuWJyHQYriqQe2mvtVpKvjdN9JstqX5VpltyWziG59YqpHzz1Y70ekgsnDcUxrjrDR27CwC7wbLIAI+5lfAZJwYzlSWlk4vUUOtzyCKwzETz/DaSw7hpfbkZ+w3h600IKPCy2BLJE2TgNDFLJmfLWGDLpxqJQi0o3FhVIi39PU17gqSi+lEJxUlaq85wBsygVjIM5bdCYbMdzhaePIpRM3QGZW6+r6sk6ZhzpeyncAp7FTWz+v9N3XFncvOGxpWBDE1x/U/2bX4K+jznyZoa70ii4dsimEUUY+SSiDTUIYgabSXKutNuMxD4ISxGEwbMgukFCU4l5AJdGjonKCeoprCUSrfmbNPmKOcENbeIPJVcfGTr0fHnucLohr5XbkGEaS82ymtDpnSj+UdI19PgHf+p42MIlSYjWsz7BY1Tm5ItWvI9ZbXCpf6nDpp8tUYW47fXSyizaGCBUXCMh+/VTdzqxyHqRlCKMWsGsB8mm5VL6VEOsVuJVNlsmMSK8wyqA8dhzZlDyNnx51IfN374V04KlyH84GNbBePUIJzm59MUhbKojFsNJfToobKyFUXcF4VEdCn01wmV8rjlcjlFyg2G/qlHxFRfzhYtPtcyinYBYllVSCT1gK6SM23QT0XrYH+oHEhHoKptyKpg/URNC6GX8TQVdnGmVfxzyUjpRIAXIpRGYaz7F6pS165y1CLEDUiU4z0iyOXN2tGMB8K08Pjo+BvhYSrkOcYRzC+cKOzo81Bj/DOOP0c/h4PjFy1fD12/eHtKdpVjOn4CsrykgBEKE9eqnFhk9E7jdOopH4mi8b2CizvHQ8V9pk12hWMKvpuRPHC/Zt07X58W6/NI5d26eMHrEklyiZcoXKCduyH5LGz9hNMVqgQV3L6lv37wevnr54niwM7MXlGFlXHCT0Hk2uPuo2t3BORaTvMw/+8zATNxN1A1x3dV9uqO4Sxcng202U10ql0hKl1YmHzWSbueuWY06+9te7+sEXazTBccQZkGqpTYj+JGGB7a8pevk6CB6+LWFye8pC+CD/4d1+F85aPDnhq3aoPvJaOE8SjKF+G7B1JxnaK8UXg7V4qQsMsz4xIO0KLx1KjF6ScxtOqaWDP9LX0JXfTI93fhi6V2CDtEZDocBZuXg7RGc4nBr841VnEqR3u3sQ6uELKLtHbTYahD22kwrHYXbMvIXfB1dexM+zFe3Q7yAyQKmdbeNtb4wImdmddItAV20p66K46evij1A4p5ndfa8GD5q+Shx3uQp5rpA+wRZC6Re2r7X2wLbvttRoNSj7bSf2+rV62oYtoigI5FchYQSPZr8RJBfOQt+qAef/j8OVgfU2CHACQyAS8vhAGvCwUPQjryW1HbQVctDpKV3GIH3V4218gPR23bd9G/P+K6lNDQwVhm/D48igGde7UBN9eYbqxuZP43/l09iBJtbAunG2/ouipfMKOqXOgYN7/2d0eCLrtoP3+jiJ8cekwl+NlheWQDDT0J8db6daVqDVvMSbyFEnbeqn9/oU89joWYaz/760+X4Bs6rFnr9ecyxiK8l9EDjoY1aRaf1tRZX7TexalHNaiZMjsnEc7yeKwX+DVBLAwQUAAAACAAal4hckitzVPwpAADZsQAAHwAAAGd1aS9wYWdlcy9hcmVhX3NlbGVjdG9yX3BhZ2UucHntfWtv3DqW4Hf/CqIudqLClitx+k7jTu64e5zYuTHaSRzbucEgExRUEqtKbZVUo4cfHQTYT/sDFvsL55fseZASSVGqcuLG9gJrdN/YEnl4SB6eF885StabvKhEmi+XSbbc21sU+Vqc33+o/jj9UL3KCykSbvGhst/9VifNq9d55rz9lMRLWZW6RbAn4OfDq5WMrl/mdxP1Z76e5+2fx3k9T+XlJsnaZ6+LcC3V778VSXwW3ud11TzI603b9g38ar0/C+cyVb+/lWUZLmXb+rzIlwU8fBkW6sllVORpelTIUD24yvP0ZV1VeaYe/O6OwNOc7I3VwuWLMirCjSymyzqZlskyC9NmEcLNZqYeeVtX96lsGke+JnWVpCX+NitlVcF+Nc3TPIxn5ouJKMMbaT3qh1itYNLx7DYvrmWhQX6iv3ydbnlzYX6xnIdNh9dJWsnikh8O9sOZxrM5La3ufUkPebn31LO2O+MZ5dkiWU7jsApFWAr+c4Z/7u0BBYtDTcdTGOcMfpVFMCpXYSHjEWxRLBditpLpZjavstl/lmUwfkH7WMiqLjJFpfizGBmbL75+FfO8iGXxQhxs7kSZp0ksvkbBk7IuFmEkD56Mv/2qmuwXYZzU5QvxL5u7X0cGQDEPo+slUGwW70d5mgMwA8QzAmE8r+RdRc8WcLb2b2WyXFUvYIw0/lV8+2YBNlB9scpvYAcbhM2R5mktGdEhRHguegS9aOvwWjYrF4RZtMJuZVWMxf6fLASo2xx2wngYjPnpFCjxCuYVjP48Mh9Bw6tkE4zeb2QmcBSYdCGqVVKKUkZVkmdP8w3+Y/Z6VRdlXgQfqin/drkCQpme50mGxP4mzGJ+bnQ5qqv8IkxKGVwVtTRevE7uZHyZ/E0GB79MxMEvxisiy8uVlFXgkI5uFKVJdC1jJM4MsA3ScD2PwxfmcZ9ST162WSH/s5ZlBT3kOqnUYipoihDne3vH7z+9O3t/dDw7ujg5uoT1/EwNRsC2FkkqR8yARlfJWqZJ1vx9ngASsf7rqIhWyU379xugohQpqdRPLqu8SGTzp+KSzd/nNUAIyxbCZQWcYt28Jw6Lf33Z2zs7/cuJi+3D0BsAfv7+8mr26s3Jq7/82BANTGdAGEKBf/v++ATBfx1t8rKaRSiyRhMxWpfL9o9NmMTtXyUs4r3689ve3l6UhmUpUJBcyhRIIi/OYVEDJS0UzxmNRq/gaMsMBAO0FP9dLIh/Kq5WFyFSvNhAzyl1uFzltyW3paHm+R2IC6Bz3ZHPCIiETISihEOQSlGSTAtBroqUBBfDulpJ8eQdshihuPCmyCMp41JUuVjnsUzh6KV8+KaA6h51I14wS7Kkms0CeL+YiHWYAYbF4bs8kxPAtoAJ0R9qmvhT1sDCg/G06crNxm0DADVVkGDp1W/261lUF9hrFkY8zUN4XgUOkBmuD28Ftvj6zXlNUytnKC5hgaDFaziesr+RjIfbyKLIEWWcsdOCu3PDWQTstoJ2z5xGpYS1CIFCENvPX5y38zSPrmdxUkbAzWewRetN1YMPrEW9mdVJZ0EUW9KsqPO+kAtQg1bNKExFs7IKKwmN231vRsB+xu4CUdGuGdoRN7FbEM9mgi/fhgVI6TJ4NhHqf57Gl5swgj0Knikk8Ocncdmh68g4Re3c6D1i1Wp15tTpIY7CZ/JClsnfEJohGex2b4BP/g1GClMGCGrjOegB0X2rNOAPiCPnffv3UXob3pfvF4umRzuQnsSh1ikNZPngOiusOritfKv8/OeJ0P//xddBr/TBc2up34BOaJzCFf2JaBATDUbM3ITmYrjEpfgnpQaWo7HTkwQttA3IXMDuy1yKj6fAQZ8DCdDT6SdSdKYvQc8Z+wCA+ANeUt0HI3wGSENve8vUtMI4VgvJnY2ZlfW8SiqgnGYq1hYiWyYGLMXtKqyQIbIWSrwWmDA+USwXTk6dgkY78mypHsZGG57ujLmGYODettGb9rO1Z7wJqN1t7HOOp6Oc0QuctzadgpG1faOxv1cScydtgAUuzN5+Jn39YqDKjLpKNsSm7Q3QOs4LkNC88hXIK2KkT0qUVPhW0+NaxkkogvAGrIBiAsotsLtiPFUivoHZqAktUJTvpSA7xYS/DkGAVqq5WIBQ7ABTOoYBih4oiCBNPfh2gDSqSQsmVI+eyrtNUmiAnZ6GGtf2JSVErJpXIkADMKbnoOF1V0Srfi0IJWFhMUHE3sinhYyQxWgQHQiNttiCiAFt4Alr9YaOzPn57/oB71Z3PRs101hS/expnaEYlAxI8T3PbFiVawGkMIWSnsIxRdGGNnCnn1IIjUVQ5yEvlmEGJkEswFCShbWlKXV6GoGIXHaWplU50IpJJqyyAU3JrF7LAsWqrdwbshR/IrKetKskwN5jp8EAKz04GPtaEzgZO+Ktfa9tsPZYoglNg4OCO3JgFsAED0Uinj4Vf7CB5Sm9+G/Oc5cptDwumk8Q3AS7jrt9TH3uM/7+BeBHcx9D1Eyzw5kM9viyTq+Vxls2j+fwcNYK2daNZOtKqESFpFOYropGDB6l6cjXvmMfan1NNxj7ELEn1LRsmsZyAKNj9dLByezTg5XZZBteO7XFY1lFq2AbMMfDMCqjcF+dxP2QJZNPUKp9MmBa2/2WZMPV/Ua6MpH4EGrfuOPkZDRQbF7SOcOX5FwIuOGUPQ1vzkA89PQxnAaLkeljkRt0r7hS1rACpuFmI7M4aMANqAdGGwcNj5g3lwL0l+P8NkMDZeTOwHsODKj+9pYW+UdrD07B5EvCFDipabY2UlfLHLZ6tV6lXJameoyePvX20PT8IZ9SL4IxcG3xeXS6Zh+GGP2exDKn347qOIHfvvhBgrF2S4C/3k3pVwCF3PsO+bbV8tues3e0DBWsq9fqRCDrCqEMozUoAtbV4wmAddVM0J0aL8KQdFiMTrMorWMpvrZwviEgdtYpTQRkPbkNbFAWvZgCwMf23VX9vK5czu/C67KanhF9vIaa7uOAPZzGOnNdwaLXBRU2gb5b5Y1pmuAz37k8xw7oFDVWi9p6D2ILxdvaPYbWmiaM4oza06paRNZsrQ+jHgC7kuFAd02X5NPYqYcmRluP0wyNmAptQKPILZRejn6xOE7IrYZeLuKIqJr77TdzXR31ootYb7cuVXZAmptqkNTJXVWE2qlnLIxXZD1MWD2amBoWULZokjgfrwl6pHYlTMV7nq4xtOrmdYKYIA1vQa8Wt/LvyGoLcwgb/PZzjV8PgoZSsho7ooLZ46z1HVvnzzFnmJUC/YJBJbALeYLBqGNJBTosWCMFmivrTSFXMivB3Bl7/RDesR90dL29/efwCs0hsQoLspny1ugRqKkihKeNZSeSSq7L6X9kIxvG2/BezEGOJMssWSRRmFXpvTAmDnYXYFFyd7FOSoQ1vxdZXqyBhghbvAT0rQabLn7ygHfuSe/MvNO6S042GB9BMdR9hLoLJQHAHlpiQ9THzbURzOatfz/N3t9DD25/P0Wc17DxXasa9ss0qaO6rEAl7FjW4hZoW4Q3YULe3kfcUxP7x9xVveQP3defxDG74MWtnK/y/FrxfhHIDKceizyDc5AstK4MZ0iETeOPF2fOLmmPfr0BPVn6qMThOcDRhWpMNoJCJ8AbS2BDpTkWSlN2lIr/+p//S/wmMzjlaT8D8iLzIKLrhTCkQvR28tPqJyQ2tdwTDCZo1iMsWLmDbYClge1rL+rgkbNzXZb2sWQnZipvmqu1nBgknowiT8WNLOZ5mVT3fmeyORkCMosweoa2U4XRuFc7nuZIfKfINYPPo7P3n9ACeff+4u3R2ejLDp351h3NNb7FRwi7dfOvNvR/oYia4j2A0beew+A2LDKOZKFLtnJCsi6VeCbGnQXmaWBMQpjFIH3Q7UrxPXoHH7KqiPIJU8EDqKrKl8vUcKlYCHJUAJvAMn6x09AWAPxRvcmrOoBIUmoItmk1ftjhdOfDSmCeNVeF1Gymmn03O/YOvlMPY9kehYEruPuaYnZl4e0eOwqwrZ8anP4ovgmzCFm6o96H8Y1fQ1btlVjvqsnY0asjNxD/rgoyo+dTj1vEhnRjUA7z21lcb3aQU0fYVkDbNImINwdxLt69vxLldbIxnv8q0PtfiUKy/QfiMpO3rDX2C6oOJg8SUt7ePRZrUuIhLVuM93ECqLmi5EmirhSxxRPPC4iCLdnbBPQstMvCAqeqjDWyIUiRSvhaqnosNaoz1Uc5gwR1n6BupSKPXgwcn7U7gLOVkC5UYwF8pLivVrjyARgdZFeF0Fs8BWMizFpv5VwukwylUj/9dDF4EAH5u/sp6HVeRKiaiAWq2KuErwAR44mgaeCEwuyeJxOLJ+GiksUTutwEObneeGwvUFQAGmqZsMSirMsN3eexjdVq8eIWhXWoRbIEYtzHgfuVF8/EegVM0/ZHZUt30EchUg0WqfV7qBRMHlizWTzfSqLH1FJFZB2/BAJcIHVqExd18xLjrGPl/jKvSxVBDOjkNhoP08a7fQc1pm7zHq5IDUvLNrz8cAZMW6C3fx6WsrMIQMtF5aHlK3RKqwVC74NvkUBAR9cAZCLK3OQDzEi10OjCvtA20RMPF3mCiv1calb9GNzWWcDH0XcI5n48/xEaVmu6i9iGFeZeoE4BbeIyt1vCnli6MGHzCAUbBdltpV8bhe8i4y6IXai528tP1Bdynd9IDAWRN0lel2DxeCeORO9M3qMEHF28O3332wtB5L2RxTrMJLnIYnV2FEAUWmSoYiAIqBQRRZQOkbLDbXYh46H16Dcg3PY/bEN4EXjUQ6JBP/CsADuo+gLNgFBe8KbhUeBdq0v4D+1aw/NhE2jz0A9crUriVNdSbohc4L06U8pbNLRZiIwdjrauKwyOdiLRdLtPYA19At7mhI3Y09ZhdklWeQPV1HvDDjFdXiEcjYzmapDUZhbzc/9Nh3r7sAsPo9Oj3HsoeMPXH02jphU/8Nl4ainewlKIAFMV9i/kBu2XSyXnxmYsB4PxWnzmEH9Ho4+H2cetM8+EhdmQyacabhMbzIcVWCIUEYSwOmvgZhFI9XtWPUkC5xT5jrpunQ5chpgjP0xaOB393P7IwQ43kRUaHUeKmvMCc07AKAON/CZMfcqLFL99PGWzrsSwU9S266xCTkQqfAG8ubqVYBIWddYTg9rBup8nc6sf5sTGYI/Df5nMmK3tQmg2/9ULvC3Ay2gHjNqIcj5VL16M+hrvSkIOKsa8bXg9B0U3QtysVMmO39duj+hdhNlSBgfTZ4DSzz8/mz7b3uX3MK1l8Ied2l7WCyDnYAR2YlaT52xrl2MZJWvMRzjYATzF/F9WchP88y7oPPQ8m30H1b5ucz8HeMvL0JxPCfa3aJiWZgNwakVwsI8bMu6ef3ys1xO2/PnPYgVagf+Y91OWD+9d+g2cRN1pNEza3bPed2Cdzi75Z3mVLO69d5z3ZSXXghokrN3ydaFjGbrkaEJ8EL24Hf27f8nMumTswMC896BIJKGEmkEP5GDyb/IDGbGJ62MyYob7cEbMV6+YderdSnwBRjpopTttoQHoYTfXdr+eG2uYCmzgHHVs6rDDlongU5LFmKGHF1rjR7mnbnF9zA0ksN+5f6ppk5EGG7RVgfu3lSxkc0O6xpAWfQjQHa99igmawIjZFjWmO/b3sHw/lB2Yv7/jwG2yqbgugERKa9Zg22nLcoLuAbQuBK8YvAKdsSMX9EKW9XodortX3UaXwENBJaSqC6HFcAYsfjfiwLb3xbtc0BmkRGzcowUCJv8YTuI2VHu2Vff0rNo2RZSaPpI22h1+hwO127HohsVb1pdh6l5qK1L7Lznq1grte95j8T5/mK37/NGs3OfD9q2dMMiZf0KVeRByPZdxTEYOpVIFWd7eSnFmpYODikPWdSUO7ZISgQZ4uC1vrgtrMIXOilh3U0O7mZacoWoMp6ZirMTLvMJopiy8SZYs9LEkhr3e8HLGs2x/6yZ/qndNlYI3lCAZ/PMfvU2sPffXeVhjOJ10KABBeA0kBdvXsi/V9Jcm07TphJigHOpkqvzrv4qX8M7ARDftSVCBk4UtvPi0O6KBGCjY7fTOP/+5o21iMK4PVcyWfyFUss9b8s0K8ac/jZBtJ8iJHaq0oDXbBwhWKxjWtWI6DdU+/+GXoYY9Qu/5cDZtB45BNZacWIw+nNflyqiC4qWoprCI+SwsmcYcgL5yJrq2SpZnslNG5Y9WGRUFZIMRudmS3ooDbGLVRFGtDOSNuij+4ifX91bdkx4oMV/ZxwOAzCoq5qlDP2tniL496aV9bOHkHRBrJV/xvq5qAFoGin6QNAE6jlDZwoTZsp4Dq0pUlQgMaFugyDPFKwB8e/7+4uro3dULsUxuKGitlA1LD0ELvsNohaRStR5Q/0BHF447xdECExpenmd4LyYiDMWQaBaRQVTlm32Ohdvkm3oDA6DyPLXXg0snqFlpDmnUbepyJ3835/QdPHdPX38PdQwPduqBUXG/J2WCdQR8KqS3E7tmqAYCrhisgwTxAoY/LNe27isQboHLwexmrjsL+MMuq9Y4trZdFfT29eIGOlZxr2tn+LjsBTYQZ4qQmc32ouxC6zk3RjPCcRuUHsypxNYg6pR/shVnB87QreE+HVB1E9hGobwHC/N1CGf46Py0L9QUVHYVwxGtkMI4MQbeFeIsKaumZgwHBemLSS43MxDD4SLfy6msplvBuEvuler+Q9CnChhFBx4KVXlhh+H+vAtcl7YeCaizfNugHjzfBayWPv1KU2Mi9arCDc1TCyob49afwbGMjHezShZX9pnpG/AuUTkNxl4oQM9rTBskqndgQLv0fkYtTByNx6qs0SwpwRAtrlmpa9EdjUYfKTqUUlyiPKYKC1S4jzwaBEMduZIKJ1mUP3sEXf3/q2//eOobR61sMMbSNabtzN4HZ979JBS9YQAT1cZzyxfg2CiP9NjoZHoFCl8M6llgVOFzykyAdED6weTDYCwOD8XozyO7Bf50SaxTBa89RpiJzaVDZjUImhTkjHvc4URcSJWlqVO/dVsWcEYBy6pQ4bAYw1VgMZMsXDvHCvirMy9/6cimYGZYilm5S498MZPZjfqHuvGvVt8GM7eIDf4EqgemqIdVVQSj968vX10cnZ9czC5OLk8ufj85np2dXl6NKHF9NBrrnOrJ98OaHZ1tg/fN+qtG9VBDnVHdj6ZkKPQUI70/oNNQYTdKsv/iLAPVLfxcW9nzNdIkB5PWlLPQvs5ySorXy9dCk3eR3FTihP5JdEFJd5wvBtW5yoaH5ChQFu/csdKZCqxh1SqgeBukxoYKwxSLod4jIVLKcLHE4jkdTv6AInGD1eb61E+nUY/GZI9HdyWGpmvWb0Pb7OQGzpuScBJ/9xTpa9txC9M2bFLPlHSdcByS9iLr+g6CiseJMIqwiqF0rLptFees8W5lsx8rjGLTxf84/5XUYnyePeESuLAT97Ka8KWRUOvejg+EyCi4tQSROJEkA9/eckRiZzvHLmfftgPDE+9SLd9GPFVSi6O91EqrWK85ZdHmuo5D48bf4LnKIjnMKesCT37g1tJQ2AUNDyE+bGzM8BFlqMa4q7CcacQOQT/I0wDajPvxGkhJMu5oDLBjm53TJYU5bFesDQ/Rk1C4W2evLdfs6rFWQeYyCoHlAKqdSxjKriyN9EKw8VwrrwF4KStPHib9ruF+auFOkIoyzUbxmmnahWvPGChedhfwJ3GEOrPgGmOjkEobAiWOkPYWABeor9NpWVKFZqdSddBdYdjCJRegGul15hFmWAO4i02zK30VM1GL7++1lRC6VbOa/jh/TkRDKeogTc8xydLOlHSmasIAgRM4mZk98+1gP5CpaYzQM42hxbOF1rZxe5MXTT6wNYFRr7yN7q48aBOWrYr3E7mTFKWq21g1LN9ueii2w5OWJV0e7kC/2y+L9dy6yjbyRjWSIqQuHKAM5ks/sDSW8uTN5lRKQpOuiqjZ0klFuYBCuI/BiEKRS1hiNgUaw8BpioYHgVZRpxjgQXzCjCk3JIXi3DrLtZG7Prr06YXNo62MBkbycBY8fcvSq3Eiw1N6SJiVoMMCfv/1P/63iHNUPWDSIlyGSYvBukRaMb464JTEhfd8xYhu7yss8hk0N/vvjLt7M/BF9eHcay4mq5axWWbz2r/EEguwyWGdVn/ugjnNFlguA601gmg7EU+17zDPQUj9uwRzTI+hM+IpMHVOvsN9vWWUAkPBqdTd8UzmG6kqRZGbUSUwNKePwgzolFa5MDdu+tcSI3uBZ+B9ggN0LhsPJ8bVZjy814epZw6SNTC2ZooPph+wKHtiBnTfS+3oxY5h3Hh6aTlCcwPgUJoAueFFnsoptMV/bSQMWO/yCZEPrBjFFyHy/dDe5V1g8k5GBmk35KzwVh5aXYkfF1lNzDgunz2nAettNX9527J4+0KVuHsEQmRIIcNacT9NAVzPUJQpZQs40UxRr8+ku8A25BSh8pqlLlbOurwuhc4xNEkhEq5Cp8+D7UP4SShoTm116I0DKOK2HC7RvPX1GCUqpzcYNdt8V0L/DNXg1IPLnnJPaU/5naGqFz31Wb6rUMYunR6nSERP9FWzO3058wTTm3g9hLs/0XZwtt0cxl2ad5PEenrpiSodxTtNNwNhEIEfC+oeCoZzA2EHidEOudwB42G16cEdt9AVZ89j6T/n7K+xzJQyw5pe/0iVKDUALjI5sZiSW0BxSmUPhhnTA2pD6sVr6x3qtbM35kFF/zRQXQRUfUnIAmiHdU1ZVMARDjwbS34+7Xxjn1SZa7cRu9TQeYJ3KeImKZPq7+Ti2/0bC907LqWIK0eV9yaqKY5FAqxsvUIahu7t8WJ2P6qhfnPasViYNUOR0CutRX+JcdDNcqtVTtZMiDKlSFXtaAWolA6rSvSQI+IBvkxfjQDbYjEdmz28W7MF3WNX7t3bzzZffD6tnQXIDmg4PW2Trie/tneNyNfabI6VR4yabpu4rVJOUTO6yRO8+wwxsqiy3LxYoux7FoEVI9Nfagdu9KqByt8Mil/hxEwEGJuEOdZ4tUTw1P3Z/3WX/jCBd156LjVonmZQlxUocnR+ily8vef8VWhPMoYyijqrklSQSesa4d6Z+rzg7gYrM3zbklneOKvND35O58fuUhwVx7hhH1KFeuKmlPJrc0O9MdPp1NWJvWDscLq+GDJuZZzlY7CoqR7oCxGlaL+jVcxxd6lchpEZfqd3hcPwKvzgyRpv9w1wYBazpc8xfFS6MU9j+lRVrJLSiTyIF3yoRD7/K8idsmUIHXfa0LciP6BnWfkwJipubc/ujfVnkLjNplOY0xlOSYFzVR1F27doACN5CQZS8rJy/KGvD/5gCHiSeVzInYm1qwYMNTTWmQcgSCGmC4VqZvCiWrFTRN6B7CVlqnv9yzCT6glWMlmj0hXJAiGlXEazzrAgD30xBPZx6u2fzlMU8LdOhMCZHe3krBeQThCkOkzAvhGiqIEBEqeNIp82Dj3gx76dEp16bgKGnZn6p7M/u/pA1STbqz/9ETKUJfpO3HyBH4KjE6j+1nfi3svALbKi01BzvxHFEOrPoBF2jeI16nbvjQvd0tLhVUODemD5+GP3nsSVCOoTo4fq66LqvpVEdidWkNvqr6gi1SblyhcWZkmk3v60ur2d6a0R0NP7Gdwr+lbqeZ6nTWPj2XSZ5vMwPc2wDmUk8T4dJXnAuJgS3pyzK931B2PL+yxKcvdxG6hCVqeqE8NBKygBE4yVCkuhf+/vz32IgcPCrNHrQJ9VXVMCFj7e1jesq5X6NU4iRBnznNHSiUh9McXSWb4kXoUNSLck0cF+XZVHQhwDLLuav0as+3bYLI1BvQ8tdMkEp5cI3zkCab4Ee3SRB4vRZ6ysQNrCF3FkofNCfG2Af3PonmeGH589tGfZDotPnGEBdMoBQtcvRDCC4zJCnnNDN6tidPL2/OrfR2zkX0/gMcac6IG01f7tARORKanlFYbffeXBcSIWBLDW4Ghj+KaQYcFVhVWV31jvD8DhLAG53lT3dNuR5SBfkqxyYK1CsPKo2BxuLyqeJNS4HygNMeZ84hF0WIMa71B8HuE3I9A5QjNPMMycwo5mwIsyDDwa3e3Po5EddIRF6Zivfr7m5eOQIgVW8fV2LfFG7Xpsw4BGCkxXshT4qdhWhvhv9BejI2O5yP5r7u1h/Z9MxJPpX2HNAjXM+NtU9Fzln6cSq5vhluFEKKuT9sJYQnhblNXgpb0r+/BMOjf4SECqvK6PhjijdwEUQnOQ7jmghTFP9qsUi06qKoN0QMBivKVonVqXaGGzrIlhBypxFFsWPFNLvE7JO4s2Dp0s/rZKZ2COYKevrD0lAxYPh6rgCIiwXko6H7vnCQsDStjGv/OkedlB+CMJqzs+IPxSRcvTWk23slXGqGw+V60e8PeqdWfzob4tOWYWYxlBvnbqO3m6qeUAUzGW/thKVHYqXYGdHT78eQGVmYrqqAGNtw6zfUGg4Ee1QcpO+SOyDURebWyj47WU04szDwo5MQByEX8gc+VWam9oRY4XgfRlA3RBhk0uA2rMKsOiQcJEkelKXS0S/0HmtsyZK4EBvFx1ZktXtgNWyk6hpOoPEnZmZ+vNtDNRu22dzmDhWSfQ12necNpOqJPVtcvDHFHxRZDXwNTXyZ/Kd650dnAYlBwWYJcD+IOCmsHcsXCrlaNi3lS2o3zgZkiFyHg0zMgAq6287It4RcEGyIyRFHsOAc+xw9zcvdCxpkxnFzWzAFLNSNQRHfNnD4HRkeDTgaYUQAkI5huL+O/R/tDS8t+whESM3yekhL3bVYJ3DiGYTBLjHZl3IQjXyUbPDrWOCOr47YzGm+ELg066upPqgY5zowf+56HUBWoETQZNJa3KjkXAk1AX5JxjWIqjszM7A3GMmp8HJC0oAsyRbzDVtwvMgoWKxi/p8mY9l0WJH/nB1cT4cB9MDkXXTMtZc0y4i1SFLniTcQFmWF12KKIBU3pgUvMQTXrgLkBRcqJ271bSBlKkXXgbJhhGjPcVYhbnvJJd+9yv2oebZGqt2ZROJx0E+q3Ddbyw6HvkEiPalbFAAJThE6XlXgcEkzfZKRrnGe+E3wDHdTg0cJo6+9frXVC0SPcivIoBwBpwFfBIvKzw+wA2+N9upLr+6TDGjy0nopPPG4/JIqnMCKlvitqAkHqC+XR4urG2UzKrgzUr+GvSUMPbL90lV3YFEt4UqHBG/tmZrq8cuPuwCz/eAlLbh1Pz9Pq8Bl7NzFXMLK0GbHXU+1xODXj4HD09HIkcK+1CqcX1eWVs1NCM0Mjl8786aQvWRYnlOdBftGc3hHOBtNtFn9dJjfSjzh2hsNWj67hvGo+8D/qheLbF9dReZZCuS8Xz+SaEyoFjIUKS0aDyegChd1lZ1KAag1Wj4u8Cr59nGImu3/87HfbbHeO2b2sxUgUb1KWF+Nq3oN++1y/f7w7zERx5m3QiBv4+W5fL7yO5H9xprwOyQemBlLqFZNqZmjddfa15dUA4w+NDOsG++NMYrOJ8ycmX6pCB8AV7bS7Vbk9AEi6UeyIHi4AuL9G+a/T4vFAmXedKcNBh+pFjLxEoaCIkOkANUe6476WjzonYldjMe2D82TEC1R8M+YkV6uF41Xb+Z0biuz9e1WIWwyvXSWhXfhH2SrRekUQHsFKFq04vjmDVbdGrWdCnyVGpQ9UtKctaYvnsEpWWSac/HhsKLNWa+vE9aJdJxAV6m69fYYYT2ib/UT8/+JfnzYdd/GUaF4qcbY6t1umYXsmYI/ZBwnFbQyIzbXhDUqluQn/c6FGENpQdO0pnzgvsNzoj6ApCrxNfrw3Bxvc27JjXyg/eWsiAl3H8MPg6B7UL/A2myD4VFydHx29PHgbUgfQKNZV+CBcSLzl7w3HNTfeF4YLgbrbTJ8A7sQ+GXZz2w9Sb6ph8Rnq8qkmFcTMzCsOW6wSYGXYc7TaGsbk+zJc5he6qRjiDGbtEd5yC3tt+2DRJbGaFTPSP242deKcWAencPseYONV8bakK52zRWyS7yKO6dFIXBu6LsFKzv93AxXdLPzvsHU/T9PHzDRPiOSPPtGu3ee+tv/taHX829NG2NpH4FrRwwrHU+nefDcg9kS3riSAO9LTfDIwWS4IOI1LLz7qv39pTQ63CkpDTvQFHppom1hHWaijhyhx62u3afqgLrywUKVKF9H0VeN5jOOLPvJDhtW3Vbb38tm+yOfKjoPiMTLL7aZ88GcDFr3X8HS1bCWRNRm4Wo/uEbxUaQEy005LrLq9yLID0bGJRVPfktady+LxZHJozwaiAngrW5yuIU5TOGJtBfPof56jh/DoHjfGnNciiFSj2/2+cNprLDmeNGLJ92KjrTket6QwYuuu07aQ1faedFSZ5tU86XPl3PVPdo/CcjoKLkXkeeoJl3Uv+9pM5lPjnD8j9JzF79ebk1V9mb98fn1zaeoWG0CnsMcKwbH43akPCHdDdmbeBxIfi/P3llRr5CI7qZacxZ13gxLjWKan6bBhQPKc4wneevel2tC0c2qWepGNQGdSiPRXGd7SfCvrSlfqL7+syifd4Vm7QdlQ8gTP48/CMH/1jB9j3JJS3DXsCDfWP42XprhLm2OqoXwwk0r/3U0Gne5pc4/6P8N/+bhQJVmfDjVyyNLEbpr7j95/enb0/OvbQHqmOGtFhKGenfznxQvAR147DD5G9qunsI/w+om+lFSwovp/0Epo3gQN96EjjifGN7O7ckLi6h0y/GYrf8q8V9Oo5KTuRsfdQGB4hOq+U1OGwzIefQwxFn5sfxG1KfdDjN0kcy8x3eH0pey2KsfwHRNJdSC7kwykgfhGk7ytsYxFaWg92Jk3vpJpMfg702mGeDZgvPXNpcps6E2oyXg7F53X1oMSoLsKtfkPRvLryuUptmIgFXlRifL1OFCWUtJqtvhCQlOSMLPJrmbnr3mDLHn7+naLCtmSOWS5l+8M9W9Jg+tP8etJgdkmsa7r68DLruG+pKkAae3ttuawTFXFhpgprFb6T3j/pphU3kLcWBKC0Zk+xBUxudvN/t2QvU+VAgqRqHPScum4+p1n2wqJ8Z9t2ANjsMHGcwEZPZW/ugJ6V5+lFD8BxgucO0MxM0D5gPoLbfR09dNq7qBgVgvECOmXTl1xEA+g4KmyMX1OmcBn1NWXuO1GR8padaqLnZC02QyfZpq5UcH1TZ6nBMso39zr/kqI/4BypI1SFBbFEVd3eQvsVdDOQawIS2cFlR0o9KXWapTa/GbJ+al+JFJEOTrIn1LSolnjhaSNn+ifQtw0AwiJamX1oBdRi6BsDGMx8zGs0tnrhZ49x0XxZwti9896gBSth5m2TAmxJcUN0ADQSHNuUsTXVjEPkzOZdye22AGn1xUTflkQWshey3IByLbv4Fha+BbTbhm7RoGu09mNrNPhc7IzscfuZ06fio/rorrWJMRjRoF25e6cfW4CdfgtUeDwd+flQzyz3dMvy/j61H8t6G5Z1D5b1VixrRKiiog+ezs2r3oVHbxvGbHNFAU7nLEqq147pYPjola6bgh+bVEG/+FkYrhJmANM131OuiohsQvFklXqZhgw5qXTY1y1+xsqa0DpBnaCipTimind4qPTDmFKh7SVYh3eeHvqhrwf5XXRpIXeHzXd9y3Yms2Vl86aUHvVBdd72bidOlArTkL24bmdPD/E/vtl3e+iHuoeB+3mRmCWsAMQGn8xglLb2AwJpHyvtYOzrFd55e8HjppepIB+XNvbE3JLYw9WdVz7OTv4rb2f7TW9fxVsxpKMFYszF38a7HBTGNsMepQ9U97VveT4qiW8fcVsNMKfp1RAcBRtND1dr4Y8yoLZAjkWS1fzMDigy27nJce0bo5jLaRbLu4C/UWDEUNsYZYR+R4+CxUq4UgHVJ0Cjb1PkkeSoYy7T0Djp7GTk7/KR6t7oAizZ8sWv7GDJWQ0P3Ve7OEmtpGBtWlJLj3VtlwIwBtdmrm7ffzvLITJ5RGjEfOnQEcejdzk7mdTnaPC6qdtIhU3wmFgbC/+u6GZIf30MsZs6fYfz94ywScbAynbR8zOjqFpj3btyhi1vhCYYK9I2mBkVMWlh2lf+rnbxEadz2VOepE8yvEa3DtEOEizISISiKNpT5QIT/hYYgIWeaS4xbKacqEQLh/Z1akOp8+TyfUoftEor+L3+Vh198jPqJW6mq2rmWxJD7isjQcVOze9bUwfGQmLBnA5l9TRdmzbGlrr21PgRmdJP4jeld5grBjtC11IBfjTlThywP4mK+bcYMjYWNI6qaG60DH7H37kxv0mrUDO64Bj6dqt9PAF+Uui5N2vhu+Fq+0w9PQL9y3h3rnxAXNlemb3/A1BLAwQUAAAACAAal4hcAo3MaEUfAAAoWAAAFgAAAGd1aS9wYWdlcy9oZWxwX3BhZ2UucHmtXO9y20aS/86nmKKvzqBMgpaTzeYUS1uyZce6SLZs2U5dxTkKJIYkViCAYADJXK+r9tM9wNXVfbr7eo9wD5Qnuf51z+AfKVnZi6oSg0BPT8/0/54GolWW5oWK08UiSha9SH4ui1XsrnPdm+fpSmVBsYyjqbK3z+hnT56crV8X3/ivi6dprt3j18VQvX4brXQ+VNn6l+I8WiRB3Ib/vowq8OdpghFH2lwWaXau86topg1w6I/FUTorVzop2sN/jMKFLoxD4fUU/b1+mq6m6ZP041B+vqDLk2CdloW9cRJMdWyvT7UxwULX0GelWT4piyJN7A3M/iRPrw2tQ+687yIUMoa9wS2b8S6P7V6lczPLg0zn/qKMfMO7Ui0hyLKJvbUVuljHugKe9XrENbXveOcTFSd0qXOvb5ZBrsP+oNc7Oj5/+urN0eTFs5Ozybs3JwTfXxZFZvbG4zAyszQP/cVifP3yj+XHZ+9fvPmh3+tN3jybnBy//IFgc+3P0lUWxdrL+x9+8n761w8///xg8OHnDx5dD3A5oGkw4smrk6ONETsfdjz/wZ8GuLBwT18dPevCXRCyC0J2AZJ7oZ6rSZTEUaInRTqBMHoFMWJPmSIfqNEB/t3j3e/3+0/T5Epj85RZBXGsTDk1uqCtU4JCrYL8MkyvE1Wk6sXb0xNlgrmO1z6NZRzRXAG7iox6mSZaEOMv10WZJ8qCFUQ0SPG1mRFLPKKBqRoM1S9lWuj958Q2PWDYe4pmvjRqHuWmUCblnzLLLEjUjIQ9iBI1TeNwPEtDrYJ5oXPFmKGGbj7HCZ8W5eX3Hwdqmev5fv/Do/7Bh93H4+Dg/lAVgxY8+CDw/cdThpoe9DegwAUHBQoYkC9qWLv+wrFkqeNssgornqzC2zmSlrnCmJoDUeJ4cB0VS5ogjoJpTMtPZss0N35PVKq4bxTx8NQOG5MSpHH8Nj1kMDXVy+Aqogvs5ZS0LKENNZEpNGyINpmeRSQJa56EMerVVIehDmVuN5t6siYSklDntOdMLWgU8rTSiSlzKw0j9fbVU8tT0iw1i6PZJSi3T9sEegN1neYEyoskpkXhft/3/f4BOOZ2if+FgBpiCe2logX1+wPfZHFU8H1P2ECmhiB++pl/lPHEFMHsku9A0CKiPyEDrq80WQ2W52SSBXlAECyRsqdg4CxOjeZnCzIqS29Qi3qSJnE6C2I3uHoQzd2tGtgS5ZO5ot3z+o/H2UF/0Hr8BRpiYpbxSI6Y7D3IBYE+3EaQW3D15HpJNoPWm3ju0UAdqArXLVSWcZdMh8HP0ox2m58BmuRhIlIyiUTI1V/ZOBCV/A9t/LSczzVZWcWWusll5qogmxNT8+CaFiisrslj07SPhz7ZiDzKvP6HpG9pEBvyhGfYECArv1Z2cvLDBFQsSRf0KioKyDLdWjUQRauVDqOggNVz6tWVWOgS7fmabFYSOhUB2kJdk7Q0sAWzoiTGiDUjS8ZaRzaOdIY4TLQEQFDQvi5BCBEPy4urhIY0EC11gJ0mko7nhGCliyUrYr2gwMHQRsYxuWFMMoeVn0IHirSBrVp8oJKA1qtMRhiMzGy3jEx8AF0JyCpnuTbQHGINII5enfpNqcfu+sIY0skiyAsDdSY5ClR/wGtsgZDUOADiUX/QFsQN1dvyVJTiYUeRwskqKGgn2WMaHeSzJXkCEoifPvQ/3P9QPnq4O+P/hz/DO3fvPRhswpHPaJLemXBezdlewlbdILIctL/I0zLzdtvoyCjpTTwNvbyZEshWlJS6qRIv0jz6C7xnrPKSgqGbOKb2Kc4ZjUb934sN8y124bZlze8/ZvmD5n7aGPq5rziY2+9TDJbFwXpvStbu8jsoOIYd3B/cae9hi242eMt83DV4W/dUVMyoX//2H05vg2RdGzirPGGU61lBFsJqs1PNoq3VpHFbjQvMeUHWoHBuf13r20rEm+WIIpJ/9e592h1+83nwwTzw/J3BP/RFYgdNdq9+J9ay20AYTR5lVQlxG4Zt3f5GUOrAHw22S/A99YPWmdsoiQfI3CwfjZZfq6vIlByleMtdGKZludDt4cuJo20VEW3BR09+P1C7Q/WI4s6v/59CuvEMfyS5y0926s8Hj8Wa3iDEN0n3wf3tqPufsJOfYSEfjxuz9DfA/075/6K5mfebq3PkNEn5ssI8iQOK5iEJexQlhqoSOjNmCSNp0wG50qa0JmnRMlC/k/BuI++EAEnN9Mooz5QZkkVjw8SgiFIKmdfq0YjMzEyTFdKZqVHGG4r4wewMRrepYfyb9NBGq6Jtca1ufq7JDM40BUEFzdKnCHmwXU0thvFYPeroWkoMHvP0SthAdmpW5nkVHneVpR1DPlaVdm1K0Lag89YB+GsZ483g0/1VQajziMDa9aIb5B7cNntTYiqwNsq2TsTRwaeudYu3mDfSFQK9g44c6XlQxpSyV5LQ9hM3yLTVlC+nHLdkHG/z8kanuLHGZvRRI9w0I63Jp3CstKVfwNarF9rVhy3Lv916/66hBWOdpuEa1SDKOvw/p+RgaIpW3j93SepjLO7AkvIY3uygousxT3bQ2CvG++kTRexJMZoHqyhe76lzvUi1enc8VE8pVU/jwAzVKk1StkLfCayJ/kIGdfer7ON3JFJxmu+pTzPvPsTm/uDzd+rz58YsAaZoQE3jUjMUwEehnqU5G7s9ZJK6O3hvmV5RjkEoNsBL1APAyM6Y5aPh8qsh+e32vItc64QnXgX5IiIEu19nH9VD9Q3+38XBU07TnKbYw1O5HBVpRuNoAO0M+TXgNTrbgrWDj0tHwEgWAaqahELUKkiKWLZj20ZmQQiZkSm/xnZbOnKKU0qzJ/daM5Ux5hFihNxvAGNvTNOiSFf2XmMcSVxTOsjPNmTnMQSlFpxP+FkP/eS0bEd9+7kaXw8hXJVQQk57vRkJlaFgNs5swdZrVm8HVXWqeVfyWxePUvpaUIRrpFrHNZ6qJNUYRNmzaNtTQFB8vKUMJaUfV/caSZVJh1JCkrj37ZKCvtJoh+2woECZvPMqpZugibJUDR8mVEnInet5FYf79eJFuPR8MrMk7TeK7qhUDuoKDON/I+ifXRGtntHxfKg0rhtxSZGv2yaQDBTD+FOukEuS9brwT4FQqub+iZ4XcrnplJj4fYXZ/GrJgjFLTTd2tjNi0Hbvyniai/ZRAeCyLO5uQYc/mS+YzXRWeNtBxPzVvuAjYNUz/ifqLiwjoatuULRFYjfwN7dYNpekdPL88OTkyeHTH6Qif4qSObHwQ++eevV8dC7VfvX9u2OWZDVWb54dHp0+6/VYXLJgoYkgMutRQukEhFcjXTMkEIjs0jmLCYaHKUtWqJbpNaQIQhUVJM73KEIkLlFYfxUt2Oj1eiO1s2Pn3tnZU6coTqOEOY9pMGpYkOI45TSGAoBLpH229OPz4MOS5qUoYMYIgeNZgor2GlXVWZpeRtqw9uscUWmRQhloEn6e5ekc4dVFQFj8P5s0uRgIWnIW82hR5jXWkPLHixnfFkgUigvOrjwTXGlJMwl6CLopjiVHQ6vi62SmScyLmW+xn8m8RpacYG8tKYSM99VRtgxQkIYTpwwWVJLzv/DDoAgcpac6p+FHTwQZ/7igLc8nAPLD6YUSvFwBD5QhigkvHk5JSIQtjvvVznvuzq//9u8DgNyjKI58aQx7cMgs7z1dpoh4WRZoN9U12X62Gume8PXIss4xTOqVAQSCmS1zVE8hMtMyikOWpAJFblnhSXSpSR7fUchzqTHwTLZV4fe45NuoDRJRBnbMph6oH+SkCH6bmAdqA99RSn6IBEA4v9SzS7JVIdijvLOUchq+N1T21M79PAvIZdrrcxKstfwY7Cmx1wrlQq5/siQHakbkFCgGor5Y2POHEPYEWkTB8roSd182/VG16U/tLh1iSeof1fMoJjE3DHav/ZQ0VmP2XPNOGpL0meakxMBheKG2sRs2S/ZtYFlmBRObcnhFIiIl1WmQJCQLvBTZJJyvIlSpdHauabvJmBZ2u88iGhIys/iqEugGzGE+W9KqGcpdj8nGRHkb14tosYzpv4JF/Jx0jfaM93tZPRFIcCEStTrkHR2Tw8K+GHngNIbZyGBH7NJoaXKLl3t29t7daK75jLaR1FHofUamMJpFKEpl7j5EMWUnCAwtK3VeEGNWPOMJkWX4J9l7nILChFhBxwkxAzl+pvkiSCg6DSU6ZH5CNGMKBWYlrYqUgAeRvLxMC4piN9RFVZk4iux7yrFuaDkzrPYeUsxkDtWJQ8rSdcoy/HadiRQ5VeqByjyNkaOSyWL2FgwE0aOgJC5DMbYFXIgcKJO0GwOPQWLIiRqjtNYaxhV4YMCddSXRxN4cr4RlQ7p+H4U6tdeHZRjhmmuIJTl3aC+KiISVHChIkFgLlLEeMjF5KYcObomHFJhCEYJYvWJnaxquScHB0JIyKDx7Qs+QlSQiKSAhfuBcLl1luSZPZGgnB2DhWwgc2e+c+UbEJOVKsxlnNLZMsgrWiOAEnbXodtK4koazkgyJM5NXxAp5RPuuSYGvgiiujeU56kJlRvbdMkuO2hkNVAqH9s3njZ0voXcWXl3rKdn3S1+90b+UtHhiqruncJpPXBUfCRehvtdkIIIYgSEbW4uEKwAs9K9+VN51kCfg6FjneZqbMfYs1hI+ECsGOId8+erN6eEJHDVpIu0d7AZlOsYM/DqzF6CadVdwsKHzJ03+HeLsRoUllJVX7IUpDX+rzGWUNe5T9gbbTBrJdkeRiU30tTBpIHbCYI9NPWYEFDgzx45GM9n9N9pKOS08X8upkkexMIsI+XUoJhthdoXQ5qmmPAbbwtM8T9lUk8MAy0lQ2cxhRLW15A4KawTI69P4OZDztDwbDpdoBc6RNM2SxScLYjymtihANk9jSKs9uoKOyPkTKdd/zQnx8te//bcj5DA2yBCYGv2RMGP2elYbdUDhxL/RLZ6HJfqNXlEebDbhxcyxULaCKqu5QSFIHO+PAkKUqFOkox6FgunoDTk3gjq3+zFgtjxL2NmGAg0M7CIInuI04iaK4bke0YJNvZNwjtw4oPMriDZbIfuL/V6UlNjBqS6uKRXHdrEdF/kjQ5KkRTS3genYIEkmhVtQ9FUZVuvElZdaGwnjMmhE3LZfA36pbiUg0TKNmNsEK+2MZhYkxEkKsEKVJnUcxchsSPFVFVKcMjt653y014hEXJzC9oH0jyQSFL+NMgNb/M7YuELGTdOPjWov6fQqGLmIlWgN4lIbNmwYB/skMSSJ95iE0DR/vuXdIVtO807LmDLhZZBUhH89qLgK2Gpddi/fpmk8DdgkF0797f5y2EDZyHgZhUK78zH0m8ZUuqsLEU608QiIC1WyjESkgU5uAJUr9DqUBa3bOX3SnZrmgwMMfAJ9r4VMNtLqB4erY9ESQfGSjJCYNSFM2mJSuwZu8Sl0ZsNLWCwSwioUyqx68PLpp2kqACfVrBahcxw3MMbFI+TpxVyEVVyP9dnoNbXzHhwodkEuSODdel1qkoJ6oQiPu9md0wlhLOUm0QxM5FIHYmcdo0ekGck/pelFWEStlFSXKOYj44LNjTj6eoMAcTQTPBQYMCYaZBk2XYtdYUn1qxldyoiomSTbUXdm3RGlEWT2QSAF20QUqnoI9527ogVQjoPTNbOU/iPhWZpizkCKKlK9cnrc1FRBO+OKJUfyAeMxKMmQu0c9h2ZnnS1yHKekZZGVFZVkrt9Zo08WG6W4ckVs10Ei+ao08gVcGBD6HTjRbKGJdBTEA1v1Ubt7u0oaArjCRFNUgS97BYlgLRLy0SlCFX3Ni/KyYH1N26PDKgHWeAjA9w6oQNEiH2fyqJU4ZXkEBw937OywBJctBDKCrCW0vBrkIvmdHdCNliZLN20FEjztL/yhndyiYHl4RSHJ8wAOoYiQxwXoq6K4oFoUKisKGBfSbeImgu3mqe1acSogAaFmk0g44N3XyvnlMYpCFBTzTlGYah1Stb2kjzhh0lUiPZCs3XkPMfpebREHwgxUDpVYd7EeC/1xjCbFgtvOrP32rPKQtUTMYR8yp3d2qhqDSwDEbyLkJqokJqcLCcgrM5qR3OoK3CaA4yrPgPW2SQhd2pyNruo8j29zKlJZ0qIkS+JioCpqkH0tgYfbvejflykl7RRhDyxwLdkboCKtIpBI848Qnb+By5Hc4sjWf5R3opNFsRzI7TNwtwl3fFS7BvwmT5fj7JoI7tkeKomwRznpv23Gk6y9LjIpr1FcIg5ywYkDoUZ5rio5OVku0nLGUWa7NFVVaq01oy2kaEqM5XVOemRdq/HVM+6WCqZcagoI8k8EJk5UFOHP5SozzumgOnyFQg+3Vxpn+TvLdGa9Wuq9yh9gKhFPip/U81xrdc4Hwt7pE8mboEpREq3KFUXJ9DiMzKWSQ+NccpHQRb1B7YvQYIVgn9wZyTwXoi4eXnA9SkJ3cdZID6vCYQpXX65YSn9ELmUd4hBnh4V0cm5EqMhtcx4Wtlrg6B78vWvLg4dHb5IsNfiopJBEUWAhVYBVRHKOEukKTsmmHZxJxtZLguES7TZXBIuYoK93FdniwvPnq0wvuC+ecwioMXrmq/TuYj4HxAXFmdUPX3/UFwM1jZIgX1dZXsjoKU9FX7c6enNK5o5UexxA5ZWULcTtzLmOVegFSdNa9pWdOAh6r/NovuZQ4tiBsOGQXmOuG7v8zkvSZEQTDWQm5IAymdv4oRxVENnkW6eaWUqeDC2yLpTTOBiR3kCcO3KHXujUCsQi0wyQw5JKBQsE1OKAKyDkfcy7qQR1lfE/PDv20SRIN0kWIm6LJBjO+ZntX0EJ0iQ0FTEQRT6PkYMXSoTzMisgVZItWQGBWA/FgzdjKhoMV2P9hPh6SrQiHOyg+xDCRyYaYk67NqI9KURaXH2AFeE6WJuaPSNmD+RVL2jPY8QnHHRExlmURp4v4jS2+82xuG5UCHwE8uTAkGCUSdVITQCJtjVYtD9wpGCI/ITM0KiguHTG3s8ttFuWFQPKsaarK6OoZB2yKz3ZohIXe9o1IVcH6taH4AR3dnw59IpsACuFBBcBBhTL04ZykQZpu6tUeVESRiSVJff80bq4U5UgcgQYxBGbYkl4xrFtmosD9munQqY7yljnq8TQKWeAmeih2FkijnRyVnKMUGtKHW1LucRmj6qq+/d6uz45WY6Syc5ztVc950weBh+oqzQSHcRQcIjvtlMCv/eogYuyAJINewTiigOSiGs2EkgzbeD5VcPVcN7D9CHAYnUsM8lXBo0DB5gY0iXeJZSUKKA46vVsmigsaHBALCTBA5Ro4GHHR5jB8kHOJYQBchBh65Tcl0+ZuMXhfKfNXLhx16a8RN3Ozov0mvUNnfR75MNpe61M/ja6NskSY2S36SVLJjb8lQBKWS1DhEqwQ1Qdab+bLMvsVhncyWQi6Z4EFPyFVHbxhkI7EW/y59f//F/Vzk0RqJAK8dmk+ACcX2HtI+tO7MR76sK9w4OS3ZxMJF6mGe8++urrP3zzx2//aVza2OeChtqtsIXniwqIn9nzgFuQVqiUJxrJLl41omXZ+6o0ZJk4wGJQDbcrcKoPA0dZnpZjKuz423fHslHElovqlSd4ZHB2NCrzWD2m/x2AYi6X1OmuNJvXqs+3UIlDWZA2UWrG8RojydhEmSzWjMEye3DPHIa6w5bMxKxVp31opZdcixJ7abl3fEXeecJ3OOaACDPgxb0LOfapUw3A0zTitKUSGfYk+FyhFkBpfYnCJgk48CA0I3cXIPsgeU3ZZFnHZcRGjI+eMDKc+TX6+4WUZkgm2zmUGke1tai0MaO0tShm7A4jjcoR/quA3BcsaCeNlVoS753zAwge6jzpqp0Jts656pMwOQnw3JHPGIc11Ys94uKNrc+6LIXljExXt9/jjBB49j28us/jOBmRS7Hn52TVOFRm9Xe28/t3x37VPsFvOE0o4i0mE9sRseIz4XwfXaYcjBIH+UejS8Id+VdDBazuLOA2BYsJnbxy1X48aXdxdRtbBYZChDKblJHXwT0Bl+XdLHT4NB43Xif0IcZ6IulG6NswwYuD1TQM1GTvBlSNtpF6foA2diDmlyGJ5sarkQLTAfEJgz1RM6fcOGS8R18PVf3fthFIS2hrvN1HjXdjpCyEOfmIzOu3miUanYECCDx4wdTj10y9vutG69Okj4by8qn/o4bU+09IGwbbEJCpJFYXa69v+7lpNDLZDaKDMBRZ9GRwg25K+4uoiHVNeauZpP+6hG9YlFwgFePY7grZ29L0cUOnR91TPdiYv70eunvTkpoDfkzz8EeixPvCqt2Y1rtMhzYozdPrWj7tvf3ma7pd8UbeO5nhpV7Aubd7b4YCpaeSuBI9xdJ79M3Dm4GJ6uNCr7z+P9M92rxf//Y/aD/u32FEp4kGw+jXKKbbdxnebfbAeGueR9W9u+C5tTFBsAZS8bg7NjmTwGApg995/C21FGBr1l9+Mza45Wb9Agidlxvh9x0wSnVuXEe+cAhAxGXfOxPW2F17QHHnoW9tnobqrqlndjfugKFKOZg/+DEKp3ca+bYdZaCyrIWG9oO74ELHlzo2phQMaIoaRfLzrtK/LfPgNXHgh7BvJBpxC0Z77nOchPrj0453E5+WJhOBl6eDrvlpWq428q2gqIji5YimVeeOxqp1QRzotEhgsOovCtCW1d0N8FfdVW3B4LvWxo0ldYC/uKotyLsroDAZ7n8L4W/4yVai60E30NoOKb5IZ41vm4exLsKO7S4AgSdHBc0m4EHDCf2o7+M8n3xlLG1h8kY3xaM0/sqek0stJYqjovGCWgM/HMwrCtiefSyQGMUnwOE1Xv6/AX4rHNGEjIHfOa9eRR/e3m6Mvhlb7/lOXeIFM4oTGhi5+3Q05Vgc78raV2XTejUbrb1NcluTVczc6JS1oSMpqQseZV8naL716LZfpOd8itHt7G28ZvEbWmsbFLaaftvS1qDhRmZgb7mDQMToeRwsTHt9rwt/C5DfYErj0ZYwazMkqikYcv2WLMj+bjO67lgpm4FE4Ud+Of62tuwqZ7jBNB5RWtd9C2tuR212VjMSeX8Tr7UIGDdVy+WWtup7iptd3CvZil/kWnJSuR19g0Z+N0Xa1E0nrrxpCLKIhtHvvhH3xVk6GngHGay51BRx4RD3p/NXMOqBlFO+EBvDbSuw9/fcC/WI07W1HPZtAPeazVbu2qZ5bmmvvhAhbxh1WYpz4u3t8p2OdgsP2Nab7fe6b61Xe7khEBj70+7ez5t7v2Uu1G/2+SM4XlsxLSEwFpF5H8RR2H0xEn/djwL5OIYFMhr3d/Jx04F2s9qVwad15v3nOAmp/TYXEfC2FH8uxH5AR33qfmXnc81RvNiI96waHxvyfylR0iXPumGEh+18sBsxtB+Dxgd4getDAgdTNQ1GyRXOFl17/VRM1p86o5sEndtzIPsWx7+QK/zrbQAv0xpX6+U9u9r9L2BvM2dD6G/lOstRd8M7Zul2YdgiEO7TNjgTEFHAR21wllcPvVd/jmlMKfo447oVj+R2kWzNTZhtIDweU+LOlPqrsCEX3EWEKbzJBCW9yQSvwZqUIhFv4Esdyfy0+zPFxX2g6eOigapRuNo02GycrJHfNE/nDM/1BRs04Rwkqe2VdSoe97BRjH7/T/dF9m1f1+B2q1X5JOs1OpbLj+0XT+51X+IUK3aTc9piW26on8lFrwXKjA7TiWzWNkuzVRAbdG2bbPuAG6it9se56w6yrcB3KRE2/+5R/PLNtk+8uHNAPtC0nV/rJFjZThdyrDfgQ3jqK/VjEF/aY1L5Hptix2pspZ5Q4EhX47WJL25iV2IngsMLtrClJuR549Mv0rtVUvo9wpsc6JqI8V0XqFC+fSXVbrpgsL1DwaY3+7IhwV9tTGpSj/hTOCatXgIk24BXFm2YP7ZlUz6llhNFv4PhDw9xyH+VRvZUmzvMXJsrMesFXjkeNM6u7Ufy2ljsPCDRzcQNynKwiym4fgjOLMogD8gC4OC0iUS+4+fLO0vny7Tw/vBw2FClv9MJ3yQCm7YLtniapnHLhrE0tj4P6MSRuwr5I0bOEJEFwxGWdNda25dykfQ2K0Y76vTUCozb407wVZXA6XkFs1HOrCErmPPoL2TrwaY5Ws6l37zJMdthk9tPrWSpiaStvonUTDtk4utrUGox80+CvEMF75MllzvfO8/lawcMdVtgFmHJArUNS42JX+mnfKh4lmxFhL95HiDiIjBcbdnkatY5w95GWIVzBQoZmvKq/DkfqN6AFn+QEZSjaZxNg1/ijsfvRNgPsN1AkvvAVCJIbqYJf9zJue+EgXfwCRrTicVvkMvynZvJxN+az5Io+xnCaXvA6K8p01Yj9e3tI80UKdR7nOJ569tBbYyy8UGFat2FerCvdjeeOfkS2Ujap1K/Iem383c+Idc9pepG7hsfhskqb9sK8wY3az6+xeDz6xRmm3zxFJkPrRQSdDJLwb39flnMR9/2h0pertnvy1lv/+blw3N1vjURpws/1NNy4VH+Ib1HzgC0Pqe4pz7pz81PxlkPu+p89YfJ3XjxuHfz8vlrFhiz+cXHtsB0KivskRjyruzuIDjDi80w6TxTI/I+nuPLb0u8ixK4z2Q4nUM7IuVTQ2fZpWun6me/jcl3C+juHK39lkhtu1OVqtreF4OkW9VW/uSVn5tjnd/mtf8PUEsDBBQAAAAIABqXiFxVijPLqiAAAHCHAAAgAAAAZ3VpL3BhZ2VzL21vZGVsX3NlbGVjdG9yX3BhZ2UucHntPe2S2zaS//0UKOWHqYqGnvFmt7KTTHb9mbgutscz9qauvC4VJUEjZiiSIciZUbxzdQ9xT3hPcv0BkAAISrLjTXJ7p0o8ItjdaDQajUajAaXrsqhqkRUXF2l+cefOsirW4nTzqv5T/Kp+VFRSpAzxqp6IV0+uZI5/X85+lHP8ctbkeTLLJHw9T3/GP69XlUwWp0WR4UO6lhX8fVPBU7n5qT5PL/LEfM+K2q3v2yZtq3ss1WVdlOeyukrnUgGRpwXV/Wxe5PDnNL1ZJ6WL/0O6uJC1MjSiOwI+rx6t5PzyYXEz0Y/FelZ0j4+LBvg/L9O8K3taJWupv39bpYvvk03R1G1B0ZQd7Hfw1Xn/fTKTmfme5vLJIm1fpUrz2Ct4Vsu1LnwulUouZFfFaaNWD5u6hnZzAYr6tMjS+cYUlFla1yBqfnwN0ncQ/uYzabgY6x4vlmpeJaWs4osmjRX1UivHpCynuigIXW8y2QLPQyBNnWYqrkk1ptdFdSkrA/8DPYWQrrk3mf5iOqMGGbRzKuRG3rkD6itOjBLHgPU9fJVVNFKrpJKLETRzIZdiupJZOZ3V+fQnpaLxMcmiknVT5VpZ8LMcWQIU79+LWVEtZHUsjsoboUDsC/F+Ht1VTbVM5vLo7vj2Kw1yUCWLtFHH4s/lzVcji6CYJfPLC1CcfHEwL7ICiFkkDomEVV7Lm5rKlqDyB9cyvVjVx1BHtvhK3N46hC1Wj1fFFci1ZdiuaZY1khndxgi3xdRghLZOLmUruSjJ5ytEU3U1FgffOAwQ2gx6wiqMxlwaK1m/hnZFo7+M7CIAfJ2W0ehlKXOBtUCjK1GvUiUU2Ji0yG3wR02liip6Vcf87XwF6hKfFmleQ89/l+QLLrdQHjR1cZakSkavq0ZaL56mN3KBQyk6+nIijr60XpF2na+krCNPZwzQHEbfpVzEYIxyYDPKkvVskRzbYyUmTJbXtJI/NVLVgCHXaa2lqKlpDZzduTPPEqXE9MFVUicV20oVaWur1XU0GukXJKiEQMWiuM6zIlmIOlGXSkTrRtViJkVibDUBz6tCqQMehgL5GMdAjsh+Jp7AswKEspIHap7A6AJbuwZDBDoP/SHFOklzoZGLPNtApRIRMlRPVlJNShvnGAc1kYjGoN45aKeC/hT//Z//JZIsg95OrjYwoLEONAqgU8lGgRVYUn1vnunaYiKLzQOeTqx5JAIlnIiCxYMVr4uFzESO1ls4bbjjyfY1iClqZ69OtI+1HKFd+YJJYBMVKFcmjbCZYxBGohk8KEGLBds1kiiRo8EzTfO0nk4jJbPlhDijoTMRTZXpb1pdjr1+10zhRzVgE6Nx3FIbd6+AboxkQTD4x30BlUA5/OsWG/t+Yur2XvOgeSwzWZtR07aoanJqjMVeXW26B/xoGw31Zuks1qrvQAxO+9xbNiigcxssWvEZ/40cSLvZE9QuMILq5P3ojQJj+OACXJfRsRg9L35Osyy598f4cHTr4I+dp+u0XvnVwmMBdiqC54mowbmBGfXk6HAsEgV8qvK4x88CehTYx5cxqkrkVvKZGWNg7rQuqWQpv4KxRWOAhwiN7M9ZHaEInDIzRqwx6fUAToiv9ODzX8VI8Cl0wWPgLkIWPZClyIuaIFP1osmyaNxvGVeBMDzS+n2Bny8OJ/h/8B1Y8QeqhLF7loCdfw5jN/43KUurbBDvdZXkCkzaGqFyQj1fF0W9cl/08cdhjTEmm40M2+h2aE2wlR2ivJnLshZP6E9qpj3zKcHKgLU5f3n2evry9PWzly/OQUxvCSYavQByo4kYIdnReKJLv0/AWp9LmeMrMFP1gcKH9v2TmzJFNwbeSv21fXfezMBpSmf8WnVPLQTMiBXovjitwJFGoDkXHJRU0MKdgkIUHVSJjz7MmczldZJ1UBUX9OEumgxMpQVHBR3cu9YkY+9l52Bs5nVRnaLCave0M8sEcm8Oag4g2GPsGYCwcerAgapkUs1XZLWXaQauMDqChH4mywx8G0Xj5Vn+UwPyq043Ytn8/PNGzxhK177VeK+THKqrTl4UOahEmaAM6WGbpWYwz15rSqAX+pv7egqT45QYQxP9/hbNBJl4cLeYX57yPCxuN3jKCIuYb9/5dGl+mc6T+QqmoUU6r9/SDERrqndUl4ehVsW1RkOKT2GMyDDRbk7x3Jeu7Z+JxxIqTcALMn4ETZwBP0aRk5CCt03QNF28qu8qcZEVM9A/xAvzQRRP7HWoP1vakDjXPU9uGPgRuMV19IXN8MOkRq1i5poSTKVk1sB5RpURLGu0yROxzGChJiS4ORtx9MdDsfbm1SlMHQvQS8MA4YITIGucicHXHGCU6E5xuqmoZfhlD1hyZMlxOV8VdUR9tx/WsxwU6Qr8K2jFHhh6Imx9Ya2OBOE2WfnUoLKmnDZprzmallGryPJAOiTPD8lohYsi6ta7DOOB0EoCllYwMtXzpIJFo4rufzER3f8hjPMymUNToqP7mhlWke/Iz2gL2O1AJigQAAaabAtbOTUae4C0EAFWIgpvIPRFga4v2Mz793XQI/6BnOv4ISwAxyECYLnB7NSbaIRlwCNgd4sdqxXJYsGmNWJkqyEwc9RpncmOc2daA8ZaA8vWkuypNslKAHlxncAsUxewgijA3qq4W6iOe9W4bEPp3pwbCk4nPEc/aM5dCiNKh0N4ashSmF1hssjksp7o2UFhQdUuWYgzg3TSxVNwofmySoEouRPxd0WV/gy1JJlT+8GB+B6IH5tZ6HNtpqnmg4OuLQA05bAG1qIbNHbfB7XYwgyChzQaPC/9n8Os7shZYs86WGTV3AW1/IGpQdO8ZEgT4doGR32Nc/AKFFhWHAXQbPA0F8fxaAeBRxkUcEjhCS3aFpGrKH0sDKM8WiX5hbVOt6fKKfbPOCwFW+F8wuEeAITW5FiEHNk/bLJLkbDvwvGsboqYwbs9ugCNIvoHszpHsC422FqaB1k2GkLpxS2MGTZA4xA/rjAsclbjFnI7c4/1e489H22AQRtsF4s+SYvJuriA6TDE3mt6YzHWgQ6wpAH2YKgjZdtbJKJnxekcQ9TIkolVQ2eC5yXYk1L+2HDQ7Ciaa7JNMIOM9iIFA5dshATnz5ht8KfAVsNgkKIEZ7CpZPz3fOQSeYSNBwrGCQL7jktgtP5pJV7m2eYprLjIEw8b/D7DLI8hefqOwqAeemQt2Xoo53UlwY2LfOnP0d8DOJjsrPn6UNwTh3rYUOh4CMedwtZNTUsw1yhtYd6iZDEWtigWGceePMszsL8UH4C5U6Q5udfgTrcBQF5/SAwfwAzJJL4SsFCW1XWqpIjRw3d8dIxFKpHC8j+Hvk4wRgVqUxflQQauLbreZVPCzJqDrz6OXeloRnoy/V4z2Fn7iQhOaX0qFI3KwAtcS/SS6rh9eJolF/z0CJtY7aKyl7sRRv2hqBY/VEkZmnJc4FW6kOEZ3e9/B8/p1TNZwwpC73dE2EG5uF7BmNNehRbmMkkz36GuEDVk35im6YeeM+oieyFwN3I3sujSZkNwR6HdcLDLEsVlI49iCaIBto7Fl+WNOPpTedPbUPkCy3bshvS4szZEgjxmyRWsTmTl7HrgZ1Au4ZkAO0Sv1wcx99eLFmciEqPqJ9v13naEW8fTCzlgOTk87LWZfUffb+vgeOAB/TzBvZWz4voRik6FxoCFldZyHXa6ePk8Jbs3jH+VymsMBUfjGJxY8LQz2nR+Sh6bv5oblmJH0bb62q23gB0r5Lr0Z6xo7CuCIc1BsJYzT6uHbd68DdDuNwFUvYr+cP/Qhwu6/TaJMELI8f8y5Pgbl9ezzCxX2xTYgFtWp0dfbF+dOkx28rapu8sSjlxSRFXUm9IKMzWzKQ7eEtk2u+9t4JMRXgOCbc4IJV0wRto65oZSH9Ji0TEo3u7niIf5gV5FHiiLCRP9NB8v6n1/6+OR+7hr5JNuToYNFgVlYaitZwW5lTrnwR/tDiCKANMQVPR2hE76RLTh3pe587Rcjt5tFaHRLo1xDKLR+rgFqc8RIR35bhsYhbpRuxtnwwXa9gCWYVeSPFh81DF2ft6vdedUATXuaK/G2RwRztHO8WKprDVYOFR/TyxBIboVJD2FhgrqjTPENWBvgFgUQtAfOUiWXP2HjI4//BNHB21s7FYfCyygPd8lSjzKknSNoQjuDyx+Uejv73bIz+gQQQfGRxDJ5ys8PpaVlNO6SvcxAD5soKVPAQSc5JTMAI8VaGVXundTO5TAkBlur8+iGTieF56oeoq7Zrvb7IEGmvy3VKXQrdTP6WIh873b2O7kURPv79lEjyNC3G0anMHqGId0Lk2csy2njbeQcWDwM/TYLBNhwHsmwqITgv5IE+FsH5rPbzeBcnvWKS2jnAzBvpXQkOgqkRAx7vpn/GyDPC/lHDT6bwkskzgeCmMK3vlLMgeJoKPDHWI3qvg8zQN2JYjiVhW2Kvp1crOvSJKbfUXCkGGRJDcDImGkDxRJchMwPTtFktzsOVk7Y8P2bWE90zUCHoL+LJTbbWWwvg/bogdgP9aLpap/L4OPWrPNiuN+MS0gJmKKUS0718JNxvDoGVMf6eXHNvm1Th6mJc02IRc2gOVVOODA4vuFVPNQ3PcxlPOeaUgZglV1pFi16d/7u11LS5MsZX1Qltmm3SbjKFT7OsGXOr5kp+BGI0Yzy8kJjqp1Um1O3GhBiz8QSuH3uvKdLWipWQ2oJJiFIIdn+Eb0F7wtxgBP/H5fnlpqNk8eaBeQbju4H5lw1/59SIrREZ2nCeauoJH9Q4BiD841ZX210IjuxlUBMlyLPLlKL2grtH0HRbt2rTD6FuyRr78WD+HdqA860BVFPkWIcaB2qwWGiNUCF25oQyCHaSfI6At4IcQ33wzqtYPuBXuO/uQnUbSAg61EiB2tdCjZOwj+5kGHbSdR+AkWXi6FjiQqkVTSpN5SFg7u+j84fYb75/S1kgnv/mCa8LUU8yS3iGDwGveYLmBYKIHc4gYSIpJMj4WbHaHNTWxRwIxATgenSjC9DpftuKVFSci4HYFJQh13Oqcqto1Om5MNAGsJxjIUoGRzQhADWS9emmCv2zQYv7akLb0QJiUtT7jYEjomIMsa5YFhyQPSDmUkbZKPoVLslIRFoLfieGvgrvI35EZdUDtdCtcp6Gd4uZM4kp/9KCgRfyhG28OgJsUYv4vG4uREHxmKMT4XPy8aJXlInaI+DCDP9LkBQq9trBizLB66M5KXmYrhZ8qm6kelH9QRV1AWbSK/JRwECWS5QinMAPM6QPQqVU2SoUNxhlqAoP30Uuyv6XWIJXhBpw/GeNKlXkV93Apg0d+22I7BERIHHVsxakoA9TNBLsWsuLF2BaEr/+Pw4P6hKG8oiS2TmMVTKBi1rGr1CtyBixUM5QBByvcxRGGY4/ai3soVOWbcZtkmDuChSmJujmrWVkUJKDn2ecr6S2r9c5FLETF/YCaojKZBIcHkjfvEDTsk4PuHfeEvbZCvtUC/PrFLPzdd9Ln4ot//+NHp9SjzGJOlcRcSex2zp8+KTMaYYI5f+t2gmaC8/+BL/Phn3WIc1W+qLMJzc9FytKrrUh3fu4f2bgljG+zO+t57pHk7GofrxI8+VoITFXaD6QHs+EWR36115zn9esdDNvmstgGzTJc1n1jGU5u4aaqmi6S65Kny2LWo/7/XqD/usgadDxgRHPiCgftolWaLSuaRdaLKt3hLxKJkJ7aZo7+M+rrWl3TvYFPblzglkNnWHelPU0YpOjitDQbgM3HqzMom31mfK0gyzLbtpu7u6IIG8LOgA4s6gzvFCqa6AjtLNAzgeTkwP7ac0t4osav5O1iikwjGzbCP4XuwT3lBDtAc+FNjZ4r1Tfwcc9Z64cdt+QI9P9LNdfMFFTnp5Do3sy3QrOincUCKvUQHCrz0lIfz71s5UB9eJWmGrMUCM5UwqUCuy3pDYozdgTLeWbGbg4Iftj9dg9t0eHB9k7quouGGTsQIVQe35qZgq8BnpyR9AcPLyogHCQ4ql5eAv4753NaahugaByi/vA2gtnqHgqA1NvSeTzW+lBsccwHJDKYM4Mf2ZPVm0ppPC/ORlSVl2oDKvs/AZuiUhFvNrbXMgie5u92B5u2rMBi6YzraVWZ3BNOEQU+bmhOJyRngdJdPoDL+vDIAERpdOje+m82slI6AzUAhm/b5yw4x24ganJYLOoLSLpfIlvCZwW6CMOcbP9iGDCrJlk7ykrCYcWAtkHu7VdR7CRE//9tt1LAZtkF9Q6VPt5/og+0m4Ri7v5cjpE+MmhENE36qVqF1JSO268oBfFlVRTWITG87XOuATMyHap5huk0+xwUJfIHVHZO3h4XdjMC4eEpKrvXrKk1a7Y+qBnMK877uW049eNF41nYJS8MV+xxgPIpSLFJc6GSYgwhdWqQLnIgzyS9pTu5cKDMY/woVAsvzoqKFD64jYMik4Fs7S2J9v4Ha5PO08IvNnRhecXdJAa4FYm3Q+YYDqgT9QDoPyt+H8RmnTOoVufRrXNgrwd+mVLwLFy2p/oqnuRAdi6b4gN3UqeV0jysSDOxnAt5xzAEtNecHJ8Zm62QjmgsXcta4QuqdBSZ+CPvEaRqyMKWXSN8z1MhtnObLAma0t9++eUbC3LwTDxx+wLNuqd+Oxv1q9eFbRyRdvVji1QukMzpj/v7yWIBoZD1CM3ZFE6YYPXl++vrfR2Nq+uUEitGem4ooxgCT+u2HtERmpM2YRiLec+23dldwdzwEOyYwwgpTAYwD4AgPJFO6StLS4VAdGTjPQGnQE/EWWqQwOD8irlM6MtrA4nWa0OloeLo5mM1H7xwC61Th+XfEv+SmY7tbssapb+WAwcnLsUsDvS0m01+aVHg5Q3ecNnyOeDl6YLUUKwRFXKYXDbAAors7EXfjH4sUnB6uZnwbe0s/8xmdwoyqaIM8w4Z0LskcaIEYUrpbIa16cwR+LB/KOwaMg89zqqjzr5Mqx2Njgf7n7R/M46VGSF+JSTL2uKRDMILOby74aDkHXZN53WD4BajzqsWJ1Xq+RWjiZdePXGYyJOT99SpGevrAwD1UG4GKzewgI2yW0dkWV7gvyz6GRYUul7hKi0bpRmtXsK5RbXVUoixSpUOeJKt4pwFljhTZY+wFXUDa2CLbhbE+Af2Y7QNyvBXuVB+S0KBdqB1noBMzf4DDcD2leWuKLyzT0jeKGgO3iiwM/MfVAG3B8EUMU9q0AfWkPJiS7mYwcwwZNT0thxYV4T73u9yRFzgjqFEu38THPCtUb2ESbhAtvOy9OQ4q7cESLNwsv8N3gcyJbPanHB8E74CBrlLNHM8gLptMZ83zsMDgV7tjgCrGrqDvf+9eo2/3wHe7jr/D5eeuxWXPFm5fbQ641x+99NQ7FeQxgPEAwz/FVLiyds4Ge/6uiWDh9+laXQR1xVYQTdpRCbTiTG2pVxkMS2Votw31W38hNcxzx5F9sHkImluxkDUU+1cO4IVAuMuWgKOcoJfXHRVRGKa/S+eAeNxM8OIQvTAtxEVBLnVD1yfUmOSvdg2FdjH5hrSaqMhaH7E1Kv0R68nBZfveq00QJW5Ad5eneWcF4D0dbQe3IbKgYiyIf+A5ugf9A51yeo3Hje0m0/q/d4ZG4+whn7/n2geZe0ERnE/11SW2EMFYcN+7A0dX+JheyQVVrOoqYlg7F986FYRIyWLhnAsCx88WCb+jnY0Hc/Ru3L0NUtAgsW9JodC1QTdqTu3YRhvfu7Q9go9wqhmmcCbxGow+BXkj55EbicBivdv+0NpfbCUTMkl2EMg2YMPkjGiOBw2rzqCQ07qYlq1pJX98ZJsCz45Lc3uUGohem7lM6AMpdPK9uw6L77NixQgMciveNMuK+aW5u2P7UR8/NIXTE+2VwQzFd1u46krcnPTsPS0YEL63JUvv+wsGzInHo0RWNJggnftvpjAS+IBfG/0dvbj3oO/RU9JegBQ5QFPtAU5LfZHNIVHq7zSa47UnMCvy1pwQJ98Qr5ohdK9gFn9vuL8V/xAOdXhHf71tpv6E6dbn3PpFguMtcO9yyUhjjHuwZEO2bWuy5oUR6WgBbX3HlI8M4+AfQhOihD/88kwhKYoA03VrQUr0Go9USLrer32K3+RkJu3AF2mBp40mt8/dht+q3sErUexjas7B2DN5QJucwtyHQ/fW5Jt2v0ivyygOYNuefqJF0AGiDVRzpBnMA438MANYKR9f0TdO4O6fiGR8EfP9fRJzFgWu0WhA6jNsvLuFuSNoejrSRg2JysnATQqRMx/ZKKHWWDcsRDastnF4wO6XfjQhPiNvTsV+OuqdLXZPpmtjrHUSN4eLzN/d9u9N0sCOADX+Vp3WDgulidCtrxHfpxZa4/F0ZZjc7XCT9Q7A78cHpcL2dkxsEbkT1atGNtIO/3Y3PZlhxPPDNeWjmGQnhe6rHlcb6a7UzHSj14Htvrk9teiYXG/H3ExTTnYX34vVM7UY8UzzxjWyfLOiP2cwITPn+JXilY/9yczmgK+kouC7fVElt5JuNQylo41tI/FsvZawEKgl2gmyFtcreMKgdKrarXcWqae0QxaIwP5qrmx2Lt10Fl5O9lv/xku6NtPVCry2x9xHqoD2sblbU/WvIf1K/Ih3GvA9opRGqK8ZJddmhhd1+fluXS7BsPHV+zfmsReqKbmOk8Clptwgv5cZYcvFiV6NPSWgvnmLgntHdzjiioWJhkZ96E4xnAvDHpWVXdG/xytVfCYyxPQgEmvrcFg0dDtiqzTBO8IC1oOTy/HOWA1rZ0Mqk1JK/i8MagxAqqYsMcdQLg4qWYKa1VT3sIYE72Yb7iRXBE60L9DH5ka+LV02L8pN7xa0MGRoR9g11m/4pjpvrWwQ0HCmFMOnwzk9t549n/0TK6PUbfxH5stZZrlbsnyIoTaeJI2YoSH1IXLrhew+pbp0oyBsd/uj4Fy2cyHrPW46wJjQ/pXWf5zxRKRvLB4YBtvTlv4FFOg3VJeuX10Pq9+fZ3JdXEndlzrzLHN6kbdWYDa8RJuKYodZUfKd1f0u3MM2fYBZ4VQJMwH92uZmQE3a/iLuPrJzPvHywF7qsNNDCx03M4IXYFd8sFh3L+ao4ikGexHX7Xadw9AtqpoTAhJY0pVJRZeh6r01Xu3dxTXe0YSWevfvjv35bTQZUYZ1b5UG3KzpjliQVV2loCNxVlxjCiXfv2+wYjoOFAGdMdJrobvt3f76oqNNBFzy74iM9YL31t++u/OrmRdtyInNYbPAJ799ZQ632OCZFTTR4EWzafeuemgPPd9EyBW2vSNH/aFLiWdn3aXau+58C/MBkb1fSeLU5FTpFofuFN8VC3rkR4J+cXynk6R9b+D/BVkG4mqfUJrd9Yj/ArLEnX3O/j4R4fyUAdEGYfVho3je9Yw57NRX9SAFMpn7gQ8bHksx2vb9U1TBeeEpg5YT9lezdkV75DztqQp+9w75ER8meyuVo6iTLKBdfriY3nuXRdIG3XL0Xrf5VtwT74nerVDddZOd3DCpw7xgJy3oRFJOhdlhNPDO3k/UUAIX+IKYsGWcZ8r3cD0GnaDxdi9X7AM889+0895ZP15Ch7NhhQUPSZPVYYFi9Nz+XYAU/fPulwUo3mAIOOLDC+4ZhTx5jkH+anZvi8v8q84BnTQ4a4y9WxfH2V3wVx6404F94F9hw7U5x/ED62jzZiiKZDoROxRjjJhS1p6g7ecD7XUkafC0SrsocKLS7MG3Z664zcydamZ0+51m0xqZfC9aurgx1se9vE0HAZ7lC3njbtU4qCfiKLArS956L78IkdsIt/mtD7rkltXAXgP067n/QfWgjLfX1akB5yZZknBuehsWhI34S+TAW29DYnBr+WVS6NXU0xe6DcxXFr4izBKQfZfZsHwstC3i6fkTO+WFKyBVTzUTeGlauyufci6vk4GJH0+mDmeDIv3UnAW4suRP15nRvWS++Je1LfveFWvDHWAQP0j6vRKvzX3/z5VBOM+BhQCc9FMd0HB+2u7t2v0Bffsx7abzSEGP+hdJ5BNJBT/jYYWju+XwljgOI6VZWm981cscu+jfdDesedknMIttbaGGej2efaSB3Fkf12VJja+3Iz/KF9Y6zacm+0ebSXPbGs3QlojWyU0QNLnpgdJRB0P4G3H4W4/kw7H45qRjaWAcItdtG38fXH990rE0PCr6d6vZjkF39deA7hPEpcRAt32N2FtD6d3bI4pYtpS/FpjsbMPqCCb/ppvlsOHPXUqHk+6irjhVepniXEKEQCiYKW85v3eazRUc67/ujWvWr8YdG5Fa48OFNb8h10KaAg/O+jG5FtQq86DdX5U7HuhYF8f+jbkWg01mEN79tbkWw3ieAzj2L89ZOFTcw+kyz7EjsPvsTonbi9NAZ9rf8euiA372gHb4EaM/7wCJE/7dWLE+tscE/gXiI85ahNGglelE/3Uo9bbe8a6dJ5SaPsiKWzPmDIdqH/cq9n6mYC3XM1m1+4/datlesnE4gn/gjFdCgbjG2KNs0l/bwvY37fg0hG9k/F+6c9NnOXHWrYGCIQMs/47Ck3vsger9ThLn7yyk7q7Vh2ItGCvZFVoJrHj556A7o+7fsuasCncB2yukXbA9j34Xgu+H7WZm262vnv8xCGJNfjtF5c1ORl/6m7l2plggBlNW0uyHmuRTvSdqHqf9zdFTPLXIG6ToRXMCK0XRtN+xxuQuc5vCBayIc9FRH//SLdMW/VFCp3/bLFltpIpqyr8ziudqzA2IwAz+6GMoVOS0NHQf6bbYF378aBI4sQm6En6rTEWd7WpL0FI2wZ3dBs2Fw6K3xdv0t3i9hoUSXT6iUZjOone+8UYx2uvE83n2hrpY0RGtoR7dElQ08XZX75wASlMXRtHkTYLqhnrmU/19TAX8WifGRPvMCuQ6hLefzdGKqUmXGehZw+NvNn/o+z4DM8e3BSUT0wE2TGg3Q7V/7yH/AhZub9FVu2w9qcyLfllwftJi96ZnSu97/OZ0CqvH7yn+Jib+7m0hajoZ1uPTcZWG3CR/SIbnffvAER80LObkpC0GTnLifT18nk1fyNlz7wlKn1ozWxx4TWVCv61poufQOpMtHXsEtluDtp0DK00/hK7TY+0TR638+mlgLVpLs7Nt1v0MWgKtTPlcq8fa2D7kaQtaHzs14O1viDvId/4HUEsDBBQAAAAIABqXiFxU3qv7QBoAAKRwAAAXAAAAZ3VpL3BhZ2VzL3RhYmxlX3BhZ2UucHnlPW1vGzeT3/0reApwWaG24qS9IufA7aVJ0wbIu5OneJAGAqWlrD2vdtXlrm3Vj4H7dD/gcL/w+SU3MyR3+bYrOU7vueKEAJF2h0NyOG+cGdLZal1WNcvL09OsON3by9TvUppvspmtq3IupGRcsmn3swXY6Dcbube3qMoVe7N5W387eVs/KSvBNNTbep+9/VDl+2y9+a0+ycvahf2pyVrQp0Ke1eX6RFTnGfQEDZ+VhQf/S5aeilqaNskeg8/bn38oL1/wTdnU++rBCz4Tuf7+EgbNTwWA6Acn6zyra1Hpn+/5TGE1v8sy/6Gp67LQD/7iYzfgYz3xciHnFV+LanLaZBOZnRY8b4fI1+upfhSFrje5aIHnMZALNefJvCxkmYspLJqBf6IevShP1ZiGmqe85tOaz/J2cV6KNONP4fF7fDrUFtb+tAI6Tte8ELlp/0Y/PWlWK15tfuDVEA6ZpWLGK9P4WZbDGpyoh4PtkELpdEZLYlqf0EO1THt7SJFjw8wTaAUEORVVMpJLXol0BAuVigWbLkW+ns7qYvqblMn4iFazEnVTFZqT8LMYWSzArq7YrKxSUR2x++tLBtTOUnY1T+7Kplrwubh/d3z9SIMcVDzNGnnE/nV9+WhkIWQzPj87rcqmSA/mZV4CMgvFIaGwntfisqZnC+D/gwuRnS7rI+gjTx+x62sHsTXUo2V5LqpuwHZPs7wRaqBDA1FzMT0Yoq34mWgpl/BivsRmsq7G7OA7ZwDUbAYrYT1MxurpRIr6PcwrGX0/sh8B4PtsnYxer0XBsBf77ZOmkmWVvK0n6tvJErhj8qbMihoW+mdepOq51eRxU5fveCZF8r5qhPXiWXYp0pPsd5Hcf7jP7j+0XhEznSyFqBOPRQzQPM/mZyJFESzEvE5yvpql/MgW7gm1VOSZVuK3RsgaWohVVmuiaWya4WZ7e3vznIN+Jel7Ayoq0ZpFc+ZoNHrJs4JdlNWZXMP6sDUAAaOsZlkB82co0Ywkep8tSJyYFjKlqLTCQMHYZ0AsZsSYkRhP2DuxzgGvZPVSMFydhufsebFu6sfr9QT63yM8xAZT6LOeThMp8sU+W/ECxlIdvyoL6HwNUlbU9EOPHT+yAVFOxpO2qQIbdwCAaqIxAdfob+7rqVIJUz6vs3MBUM+A1sKDAd5JgSDTQlwY+IKfbwEGQoi6BwbeNOtpkyXeYKeaAcyiw/uOQoTQ9A+AdVUCBLaziAJEfUcd18D5qA5lzWsBvxgHzuDp5qAuDxQOEFZonBWCVsIgqKtNh21XMrVw0Fulx4g0AEZHAfixQCZKLZHZoZGS5hN8x070O/bdd6MOgbici3XNfqT/MqMgzGcNvL9lVhLcgWnKxaosqNclcHcSHaALt8uUghZmPuWaPaUXX3Imuitc7EZOc3RP/Nns0EfHa8De2SkwzrQuac0BNyoHn9tWoD+mF1mRlhfAEzQS9ctmbGVzcWzzM4ACBcTrukqstvts5ECN9hnJeosjW7hoPArYr7ReR03wvEjFZXI4ZuwOU5MgDWdNs5VDb145uWNoaTrnTMF4INQbiCL0Jl/yCvwDmRzuM/0vBn0CmhY4GYa11769ww4O2HtgDCO0BweeXjAvjln3TWtzi9T6XWuOfibTnnzzMApimaXFKG64QWXWOVn2UYBi2hGp848T/bIPOkav+w/22TdgMvE/iyg08RocLXBJtdlBUYL+bOcsGSlHT47G21pS30sxP0PJ9QR3W5NA0vsa+JbcLJ8N2EscnqZ6TXvQW+QJmxrOuv/Ap6KyHDHika3wSdeC98wGlAGB7DqPFp8/LuVURAcGDkK+YWZtwQWoMtwDHEdWocPSP14Fs+uAO4yfSfDQogUTDA3b4CTjNtKW8q+/3a0JSF9CO18YgzgtBfvwfKSkj55OfiF0kx9gOzDejrGX4i7srpQPe/BJa/lgMbK+EheKqMLnarfhVup54L3z7OB2naOL2Z9fCf7jdAHE7xEM2sg8LS+KvOSpZM8I0p+rh2TrZCPw7s4JHXiY+iI7bWDDy1LdP5P8HP3/OSfrCpsJmHCFmwVh3O1tQ+slLAGajqRusiuNvV4cW2u5YEzv+hPwlVKYZgMbv5wpZ4plklVNUTjcG3PuIqId8/H6/MItMuzCD4hbC7gFhecWbpNHp/FO6vChQ21N6Dm4FjWuJiPntJfiFzyrQ4pH3Fv0OygMl4x8Isec4QHNd+iruR2c6WGqRRAMU66GTft8mfi6YI7K0J/tE3h4xA5ZVotV4PV0LXDGbyqQg6reJCPZzJaw+wPKwoxd8zI8lQ7hjddeMZDIcT/L83xKqKLyQjDscZ4H4hK2HhABF3hnFg/78CeRil2m8VRDxSYSxdA/lQB8Z86L9fO5Towo0uhEv/uOncC7zgptcV00nqGVA4hW1e++cAqvNe4AsN2OuHstinvN1T6E8UrwIxPZYl+piJe9BdOAU6kD+yiMJsiPwcPXVQavyQROfi6r7HeA57lrc3Qc2iWM7vLYDVZbauYO+wnDLWh9DbAoyuZ0yS6ytF5iWEcuYe9tokFstsGNLW/yemIh+SDBiWZzXjAJ2jZn4JBnvwt2nnGF2sxryYs0F5PoKFGfvMyKbNWsfsG+k28OD/2FtiD5ZQf57TcWpE/MYFXNHska/zs0jkSBI706X7FZCcy4wp9dbKRCuKkK7Ec3yAoguru328Yb7LrX99vEd/xP2+Cqb3zaNMqxl0HpmUhofQyGfQyjo2U5/trp+wdFOxO/Tc6EWGMUVzJ+zrNcNQXXCH6WWco4yFV1KphYreuNiu36ZkenjlrS+4kjP9DpNrA4RjtCDx70EdS3Tw6ibsL3rQkPsFx81YMGFC0hxM/4vC6rxF3x7fD3wc+wxfqpElIlxrLTPosmh23veSYzZICLrF4ip6YVV6mn4R5BpmXy8V8ewOAePjz8NKQX/fa+gjwh1wUc+kXJeG2ELQhLaQ8HdXS79N2zqAh2rwPn95s+qM+NVLUOWCRQ1fXQA98XqnqgNssPBpq1NvUwiMSUF1NyhQO37pDBu8Cf8+Bdp27V1CIN/Dl3NH4oxsXnLPvrc1GB29BlccRqJsBJT3Ffh3ZiUZZoJcDoNFIZJaURKHnkWY02oytV8hZmGqZzQ7aIj9pHFhfzZRaS1YkTj56gA9K6LVP0pNlcwJRhSirYxtjfmDI3B+SttK91/gtfKyzoTitiyLKqu/zJODKe2yxbh8VZrLcNDiLPijMaPNkLEIdmVdxTJEjLebMybsnWXrws7IgQHiiEwJRDqsQWJGuAKoAHTLICBtJVCMmqkaBMBOMLJCYym87CoxPG5uCIAWn8nBhHTCYCPiWMTl4s9j7MijnjIcUh1bKrcLoKBEhKY8Jv6eTEMFEGPIWJbvh21x/gF4ip96jTW6O0YqMuKkcwFqO3bxq5tEoSot20WX7zDKlxbVUiKFyxsgJT41CUhQjKGb5dXz4CtyLF7Sn9YvfpkV2LoFFb47TqEeJFB2cbp97AFc6BCOktqQSaShT/O2R6cHh7MtWC5wGdImjSTFLGc4DgdpWHzZ2o77YtRRidveUyrHhz/ifi1pyfw3ZWVNvoFInU3pJQfctmqoT+jxJMD/vBdhkPIq63JFiluflPwVdrwefLbTTqCZg6lsfCuQGfqLyImZs21HN7KncD/1PQuaNJD6HvsA/rFEtx0Mky7kb7dlGCC1JTBkXb7SJ9sszytBJFYpW7jd3Kh2yBrSYoqsmYHR+z0fcjFwI/4YIEZWidN+VXIHmelBdhUPFhtaOYL3lxGgvvhTAB/3X4gI46W2tVuRmUztQ6/LE2kSWwq+laow+UzuQyGpX0QeKYtPAUsAbTqikiwVwF0GZABtEABpU6xe1+HyobaBAbKr91NMDsvI/jIF85WFVVmsimR0Peuc1QbhWDru+bq6IKn7GsCOJfVAwkMZAWRlN/0Fv7hhsLxQ/KoacYKT5ERnM8e6dXVacAcH60yuJPBaOQB9V7DUn4tN1kJ96odbO+zclclS11wSBdc2kq+HDHrUbhTIFeH7tTAc1EaQB6OTAdtXpmXAh80zl5+YZt+sIH97AF+Ytt+MIGwfjs3EKE9pTKQOb4yDHY8Ukl1gy920w3qJXGJTypNQV8HIwLNm/TDsBaAVDZRVlbjV19bQugqKqympZz4gtd6hso99GPFIPBWMZoP3z7qtTz0TGcdj44gImOZaACbSFMeISp8AiFAKh+NE0VqonXj1v+qMqPrXhBeTrBMCK4ECeqMpZd5WDUOgKMr9tREdmJ0qMeta1clJU6cxEhCXgX2Dwd6sQ2z5Z9ftPULa306gPXq+GQgdYnVPBAS9sdPEbRwJXfp29nYoOU7FvfQJ9AE8Va66ZOkgDX2BnijzBfpmhBXTsrqodXVlHKdZUU1F2MnT7ieD8efiLU+N2dyCefbK2IOdvoqFaG4WGaTTI6iIHDxp+q4Jw0NFVDGRSOmO1SY4rIqEC1t760hWhrS32JbCFuLZAIBd2MnpRNnhJudOfUjE0RjcoWjm4gSErPiXSqCHncDZiUjfvaySFSBSNblSlV4vMaWKa4WzN0lbJKr4RqjkU8yUqe3lvzLL0H3kG1Uaa6Qzel31PCNi1K6g4GczWCZuodTh3bd78Ikf55bWFS9k4XGEtr7dqpQWMfDBCi7R+PGXCpdHILU3mWrWlEqjPAOAPHJAl6+ufoNGyaPc5lyRAdu1iKQpcYT3FaWKUiVPU3+/t//Dc7zcsZiCO9AgW3xtMjrBAClFlRKq63BtjhmRokepDO4scIYbc1pHXLpIlfNacpzgjaTDJpClrHljx7suDxGuLExwF9uxfhvG4rRmC5HlPvJ3owPebNTuNLdiEqu1Jtwn4qacemtIyqzyDIm1mxOwwLC/W5CXC/j9g8F+CimWx0mzP58JxlqxWmbWsBLh0w0bqpToW8B2+ptbRwKjkEROcCNWBOBkfea5G1ecClLsF7+gNyXwrTwF1Ri6nvTEC3q8LBep7t8HmAO+AH4OBmeQnEM4oZ+QPHAbNUx1sWPMul09A5rIBGVS5V9aB2bh2ntjW0io5ALSSAUlK8qrJzYaHKsRQibSocB5UtqNXAzAHP6WyLRg4yxenM0QYPM2EvNyCV6xEP+NRf8PSGn9/6jPVyehn23PXyqnguUVJXQcJarCtxjquUlg0mgMgse3iHj/jQuaCdwuz6PIwx+ZNJmA7xzhxhwizwhjCQg+QAFVyulXYPfQxHsV/wDeY2oW274SJmTFCT/TtmqEjezMYTuRKPyC3y8mJiKzoLKQkDOa80/05gCcmsvESxbQqNks1EfSEAAhSJ7FgzCE9ofao20Oao326q3dHoQRuK8MmwVb/Kdhs6I3LTmMRY87JKQRPPlmV5xhQbSpaUBShEGI5VR/wVZpIrY07H/WKSKqQdL4QmEz8xs2ma6nEMmE6atGM+o22BYobbP7d9aILx4/4CSrmzDgN7OQhr3uM2mbYEM8VDnWXvpB1YPOmM/0+0dLxXwUUYjnotkMFHr16/e/n4heu/4ptwkD7y0etnz0a9jGagLRNOXOZgufmhNvy0CuOcF3NMSiv7obVGP++1DcDLDT0QjnHfadqAdHQbzKMe/sRPbLE6JNv4kwbk8FjQtpe/8DOOOFHGNUGDc+Oh241vPPaw8Y0Hr5whcuTzaTq78fh1+3R248F7LT935J/PNT6Cz56Bi+AmE7nuFWQjNdaBZUegzfvbO6StfKousM71LlWZYD92JgA/UZWQmjMK1t68hdGh8m631tEvk1P3rRvnc9/1G9c2QeBSKKA9WtqQj9wwgMYFjrWozjn4j0MNMtz61tli041/C7jEvFcf9C7noJdO3KaFi2YgbwJr/El93ATVAVNm0z5mHRioHZaBPLp99vXh5HCf6R/ayw35CNzICvMlnQ/qXpxAEQOsrH396sVfOzdReuXhdxQq3RYDDpfrPJtnNXhQmvgTxp4vGHSKG0Jdm7EPfjt79fo9cf6+hQ1cWF5s7PGZHRNu4hJgnQmWjuNQXrx4CbsnmQF5i3qM2Nfo3VbngxvORV/0Rqfl9ASjugkkBZpnkiIJ+DriQ+BGZiheYj5mCAuJ+tFqtVUrLugGmxZ+WAkGT0jau9bhDIhIwBPTVGVr4sNXpJyssoLgaETJeFKXJzVue5PRBj4HL18epOkoPhU9GIcOBt0gDfBDrh2CRCHi7epytynxyy86JY3uD5mSqxRwC40is10/m8/VyDDdkdLZIAZm6eFR+x2ea+rBU/3tesdx3lHKrNUrnr4oFwtSNUZ2SfzFJUi1nb3okFmaQWkD1AsxjUCHRiQZGiCMf6z6Ju64nRjSuWzjkmPdu4rSHbErNxZ53ZMYopdtEFwtkNtSq+t/MxeFablukxh+tj+axzhQK0t08U5w6yBKm2/uTiLrLUanPp8b30DZKVgvZar2dUTQb7+BxcDVpHQPNWxRXajzPAcgTHglVecYqRJbbIFHKplxCMLs95arXe7gaGmX3pZWMPuUtYnI8UJPAqMa+6pTdbgTxmCbInVZBwI3HA87aHrLe3P04nKQ7hrNooovfniuYsz6OpKOhHgjiOi/myd2hc2Ot/hEsdNoQq0eAYri62DbGgMykDLm3/Rc9BOD7LumJRrM9ifn+2aZNDUX48D1trgVGZEODFmRw7Y4tOV+fY5XF5zHHMP+mKDuTaNwI4NqPCd0jI12voo365Kd6kA/VuQj8kcUAb4LcLAVWIPOXSPrgk6zz39TUG+IWDuEPHe+rWH7jUa7Hj++w/AesgOKVXvlIlIr8E6jUwSzC7JXYoFq0Q7SkwvKV1iBnwEK0PBA1JTSwGZviEM1x5FU4pCEHk/546VedFjCOwJiVbwEuhevd3PUr18kpeuEsLLN1cG6iq5ThcHRcrIelcD8L6UKspUItd7QJoI63QFc7U+8mWXmBjJvZnbNlp4cPiqa1QwsaGyKoPtog8DNREHNQxNgZzyL5EyplVAFAt4EHqXALAgHd0PIpbGs880c72csdBbHX7FoxN2A/AFZpp1utvr/kZpxAAb0x6JNmbAEueHOVcdG1+NIGmWI0xdG1waYdsISFYAo9+tCw96KPcPrnltk6hfDkr3hSy121aP/AO3e4265vmg3uyjFyA+zVWBe0uVhRC+HWG7tVEcz7wLJ7TXzw/m9gcvuepJ7g0Ec005PTzXvKMTlmfaRdOw+VlEpz5CjgEbkHFRtXagb9b9HcWPK3Olz81ZC7h25ApK0oMl8k7cxX5ZStGh1OIiV2NlFJl1rUwm00cf2PcEToj10H9YzuwE1LRx6rN97FQujpyVetwN+UlEPzdEqfQCjrib8a+GmYEbGdYI5ZFVLi+9/LQLIvwqpTvkCnyvbkuTZGfYmCpOa/wnk2dSnLbIKmRWs8DjA9aoEVORM0r1BbT7WFCNJb8o2EUHSipRX+laKCQ7rb0MAr8oOl3W2XN2WqlfpeEsPwW2cnSPfW4tME9mn7ay6JZVWgNLSMqR4N0YE1UUmxne7516wavw6LD03a64y9mphblxGh0uGMRZ0EJKRtaEYeRV0I5VuoV9j39r1V+Hhk54IYFsJuOSSGnbpJSAzBkc0gfz+8BOYbnswkwBFJKI3bME7dE5tyxN3dSJX4OIKlXmKookdm4IfEBPrHtp/jF/lXrn9x/Th3fKg+sjL0y/ZR+SEvDIiwYH627uiebyn9h4cvJbpHju8WZ+O5Y9eehbRLbFL2fAutql9Fxtt6zYSC3ntG9mGr/v1bkpvYKdNV8NDLxPCYq7yx5Gq5057nYQ7tgE8gVOzwgPVCi2eIsdEgTD2HDTMFfiy9NyZFaqeUaA7qMKWcIZiG+1rCOfwirXozN3VW4Zgm5MLXqGBDOPGoeGnVQbj2Nbi62v+4lDeJXzSrn/0TS61OUGnoqB94BM758n+/p//hXcRCfZauw744ATRv9Dob1Y22ZKrlJM1r5cTcQnqJj3nlUzcR+hXJfqOv6Ac1YBmMs1aqC9HaEVcsEs10LkpYoWmi9H7nhsQ9RTTUqgEFgXZj34trtSL6xvRy/8bFXTc90OVJ/g3LiYomrgOOS5RRyxHgXTBzYjWeKXDhczy9uybkdvYGePgVJh6Vy/S8HwBb7W3kdGpEWNK9hWBqhVTodycu2HvNqrqbIGOPIrs6i4PLOgT6r5zJ6k7331WkLp4GIVGQUPvM9HlIlCCojKk+7BLW01BapEat1KTmCI2yJKxMXwpnzbkLqC3Iuc/bfNrQ73phUHxc4fhporPVAgQrB8FeAt07GZigX+UxV52HaYKrWgQLtfnCINNnTuZqI9nb29V54a3eje4+Nnu7TnegJq8Kj8xEXe7yvuRynag9xxkkYyP/uG5hw4VBiLES5Nk3YA8tkH0iyWqYIeYFAvBmHeGMWu6oHeAskGGw4nj9VJza3BD8XweDcpvQdATP/jM1egf/mBcoRu/J7MD09mxMuUzJhGeMejPC2KIBYs92ooRikPozZ5S1m2Ncr9vd+PMD35uHEK6WU1mTKf4JZmt4YgoiVimL0yy7cUA+jNs27JrBDgQ8w9PvJtzz/jMP87qXtqqA7PqmtcranDdXvbqdSxxPx3kUqLn4dsB5DCvFbDUOc8b4foHvyB3qVxvdwUW8pd3CxYVBvBaoeg/T62j3ItM5Gnid+zROsgV0WSCOLnn09DDyOlbaPDEi6vXZc1VbXPhX5MI/MDVsUvH89TIj1XTG2w9FyOzbP4ONKg/2xHPPXZFg1AYWWLOuYztuCjdaYazMLkznJualrPKL9BtVREL+gs/bamaSc2vszX9XRiWVOYP+JjSkbGz2to97zryfTk/7wxapsAykrlIukYfDz/tg/Gb1zFZtlapm581s2203dL+4/2jTzuceDcANzyKjJQ2R5H7ec5Id9vYWlPokM6vb1/VxwRJlkCdobJzvgmd6C3mlaAr4XIGy3xAgq5PJtxmXSNpunbMsZX60lTeSl4l+gGR/wdQSwMEFAAAAAgAGpeIXAAAAAACAAAAAAAAABUAAABndWkvdXRpbHMvX19pbml0X18ucHkDAFBLAwQUAAAACAAal4hcs+hC+A0DAAD5BgAAGQAAAGd1aS91dGlscy9ndWlfc2V0dGluZ3MucHmNVU1v2zAMvftXELrUGVLnssMQLL0UbVEgGIo1RQ/zYCg27WixJUOSmwZd//so2XHieOiWi/VBPpLvUQxj7AG1EcaitHD3dH9pakxFLlIwaK2QhQFjlcYMhISiEcnhOPpllIyCYLVByEWJUIoXNCDx1YJVYOlY5SbVvEYNqZK5KCDEqIgCgGchM7Uzc7iex/GToQTi+GtD36s4jlrbOO6943gUlzCWQjavcwCYbVSFs9Z91nnPeufZ2HcScEnlGMqqqku0WO6p2JprbqkUrSqffMWp4FEFRoGwVOQL6kBIizpHTVXvhN14r878woDaSdptsOKzShSELZSEUhUiJdKuG62JcBe4JXeLezOnqhiBVMgALq+AZVxvGfwGVopiY+kwzDDnTWnnhzuRA18bQpoEjLEgEFWttAVfZremkAXVHvjCam43pVhDd/dA2yAgC1gc7KIC7ZKWqENmNpxyY5MgSB5vVqv7b3ePye398oas2YhWih5QetCfJi5YOHGVuDiuOgCr9+3C/bosepKjxorSRM7PkJBVRYxxLxOtPJzpfTXaRsvBnUs9aXVKXE9Q7BkMM/fu+JpibeHGf0iV+TmoSzfqEVjXU8yt+1zZGLutv1Q8S07ZaSnIRGrbQCTUkmzGjwlcW3YpuF6isO5VGscB9wCRB/juTehMAla13fsr1wr28BQzhUZeWKqUHjYo6l7utmukBtAGs8g1i4OqScpzwfwFodWRd6f8jwQN5HM/3/iqRhnWU2CaTQFlqjKCW7DG5pdf2MSlnw+9Trj2U8RxFuaT3uZcIQeBQwhq12jHtaRIYc5+0OT6CdeqKTOQyhI4Efw21Od9Dm/4ztooXfS39041w19wqNphMff0eg3XSpW9hs9a0Lj4dDD71KpAk288JI+SrXRDY5EGQ5OmaMy/dRgQXtPTcGMjqraZ0GG7MQsHOm21TtTWb49UDgXa/adAPu2sqeqehinkU/oLyCji4vMR3smQ4bo5ivBITI65d/S91Qf2TxRw2f71VZ5p/rHeTr4P9T6JeMtLg8EfUEsDBBQAAAAIABqXiFyH4Y6OSwIAAIYGAAAcAAAAZ3VpL3V0aWxzL3Byb2dyZXNzX2JyaWRnZS5weZ2U24rbMBCG7/0UQ65sMHqAQi+XtrAtlLJXpRjFmjjalSUjyUlDKfQh+oR9ko4O3sSxk0J9ER+k+f9vZpSR/WCsB2W6TuqukOnVyx6LYmdND2bnWssHtKwbJXOy01w5yPv4MDT5U1GQBrydlFiH/pEe0ZYbt+cWxaYqisZz99I4z61vgoejgB8/i6IQuAMuRCPMUSvDRdxYxt1S1OCN56p6UwBdm83mo7TWWEKDcRDcE9siFv78+g3YS+/gs4fEyCg0Siwwvmanb8QTPrDwU1Zx80WObLCms+hcEiBTFCyYlM7bibaacHNaCfFWZlwcuG7xXm5StxZ71P5uTrcxk84q6OSeUcnGHG6g3iO8jns22/9oAhvMcMX3yWj8VxeS+Up6Vw2gTZYr1UzRZWv6QSFVZnG+nmIE5AiYIqA1o/ZuteTX6vOqL6zmaPFbsz15dOXF8wIorkFcg6nYZLHGcyEzR7nUn1O0SPzUDz+60ppj84KnmlJWY68bzXus4cDViAsqDiESpAa/J0a+VQglso7Vr5BNS12GpF2t8kbzBHLuZKaorjDCUkKZMqChQ0VsaEKVCg+oaqDz5Hh3AfsFtSDUMKTyGpUzEr97+kD62hmFq2hBPIcktCsLYmgVp+NBQjTy3nMtFI29aRDm9zPJY1qAfVogBu5hZ+yRW+HoP9iacF/CwVEKmqqRMWqFzFOtUO3qHJl9wuXt6fwSrt6FCR12M/LruS9zzGzX3dxTAIslSN0g0XM8fm9x8PAQb9LouX90Tmk/hBnyav8XUEsDBBQAAAAIABqXiFzNrpAe0wIAAHoKAAAaAAAAZ3VpL3V0aWxzL3RocmVhZF93b3JrZXIucHndVUtv1DAQvudXWMslqbZRuXBAqkQFiEsF3VKJY+RNJllTrx3sCcv+e8aPbB67tBSEVOFD4mS+eXnm84htqw0ybveqFDoR4VPqphGq6T/R8BLWvLxPktroLbvZr/BVvsK32gCLmNWn9VcocclWt51SfC2BtncbA7xasnb/DT+LRnEZ91JjkpAXdtn7yhvAa9qCSRd2ww1UiyxJklJya9kXbe7BBAs2ja6y1wmjtVgsooDBViBCxdb7qMHQB2BzAnmwRW4c4nIUUpp5US2UsJu5TAdXjL1gBmwn0WPBGG2mQIvGo4JoC9byBjy4NbohXTvFCxWstmBKUMguzl9eXMwSTg9nOeT6ARQYUbJdSLAmZ4ZAdIKs7lSJQivLhOrP/kZr6bP3+hXUrCgoUSyK1IKsl6xWS3bGTWPpdXa/c7vozJ9XR/GlWX5QygYRqee1oqxqNf3pbNBv95oKgnkShc1UaGMRL2fVnnm0gFcd6ncgASG9Mx1kIbc3fWNFDZcrnYxPc5zRyFce2yF3jTNyhGY/KLgVSk+hxaTTs0Oi7thGyWUTvYmzvsGCt2BygMOPElpk7/2LikiUZDCNgpiSV7DumvRAyJzqv+VYkHaaPeDbd2VwTI2aQjZw68pR/9f99uW4z/xlwUptdIdCwZPazWkVf9dz0QRVI+7+9+6TWrcuo3BH5wp2BXynO6NwgnRa9R5EgY5B7jEFHnlx69DnDp9T/EWnUMii1NvWZ3ykMa/K7zLDreM/T+CLW4TgUp7Iw4dfSm0hfQYMu9aquQ3c6XkW2DKwLP44X3NLE2h0t0vSPe+Jp4kYPNzwuOHIFEDlLeAGhGF6p9w4scKimyhh9rEU8iZfsoqkUtM3jaOSppGz57tioGvsxyKk9NCMPAmJo3IYkCdRbk5OxuJJlJuOz39kFQe+fNQKkseJPzngR3k/8/Ens2dWsNifI7v/mh7jRpiy4ydQSwMEFAAAAAgAGpeIXJk19DODYwAAysYBABUAAABndWkvdXRpbHMvd29ya2Zsb3cucHntvWtz20iWKPjdvwJLRa3JKYqSy709G6pm3ZEtucrRfo3kGt8OlwMFkqCIFgmwAFCyRqWI/XR/wI39hfNL9jzyjUwQlOXqmb0X0dUWgcyT75PnfXq93qMff34ZXRfl5XxZXEflJs/TMvqP/+f/jSZlNrtIq2hTwYsqXabTOivyKpqXxSqqF2mEFdcJFHlUF/Qi/ZxVdZZfRNW0TNZQa5JML9N8Fq2zdbrM8nT06NH7RVZFq2K2WaYAtK6i569eRkl5UUXrsrgok9UqqbNpslzeRP2kirI5QaY+LJJZVN+s0xm+Wg0eJTn9lUdZflVcQk+xZJWsUtn+6ySH7pUjHlR/AAWSmkq9h64DzGr06BiHsV+t02k2z6aq59VmMl0mVRWlqww6uUpnWRLNkjqJxFjrZAIjgB6myXTxiPqX0RimaVWls9GjHkxttloXZR0ti4sLmBb5s16UaTIzX5TJNMW5ki+mOMzq0SOa6mIuOjW62GSjKrvIkyVMDJdM1utYvHr0CNqJxrK10UVav4I/YeC9apGU6aw3ePRoL3qWVvV+Op9TO0k+TZfLBBc2mi+Tiwhe07rClMHk7EUf0mhaFNA4lLlKYVGSCQ8hVYvKG2Jepr9t0rxe3uzj6sEiLYriEmDE0OuYG4rTKygBXVQzMDrFN33o2KNZOo/iMsmqNM7ymEv0+Z84mx3BItdD2GHTGOdm/Nf0ZlIk5exlXqdluVnXg2j/h2hSFMujRxE8MPvGQI8iAhwlOUJI1zTepLrJp4uyyItNBQPL4E1ewMDK6N1NvYAC3DjsWQRI+xb+B0UimI45nAaoVCXzdBhNNnWU1fgV52VVVHVUwtTQDrlObnDLVHWxhpWBNUdgtKB4UNaLpKKNC/tyVuSPcUmWy6jY8CrQkYD9xHNJi5NE14tsCSdJjJL+rcsbHjY+cGSwk3rq1Bd8yrTelHn0AjZM+ki/rGBVeNeN1jR66N/o3c17AnJeJ3Uan6f1MU7Z6edp3wIp6k1jHJ9essFQQ4yLyd9hxvpy/QYKwMDsN/VjHB126LIo/UP0xC68F/2czwr8DCuSzHGdYC+uNss6W8NycO+qqF8tis1yhjO+gDOU5gPfkLpMRXj0b4o8HXSZfHr5vtzwO96h0ancqEduSa6OZ3n/4R6AdpZNF9ErOObRQfQcMH2BKLreTCqFFQBvpw/cLGPZ+M1mucSm1el9U+zDiSnT9RJw4wrRBnZCd3GWVfCJjq3smTqp6gLQOAqRvVEbYQHiWGWAOPUpK+GuSktESwTopQYdXaeyL7ivrrN6AVsJDjzOT1QVcOI0vAxxUkK3JcEpptNNadybiOkvymID15fsp0Q15qHOqriqkxK379jYMtxJwi1j2mICAyR5lTF2pbJ4EvR4k7ouM0BT8NeUL6hockNIKV7C9xj6kaY5zx8iYmq4D5f+fAgNAm6vFmPcoAO9GfHjyOoj7WADRLEmCK11xF6WlTZruGNT0fA/IVkA//zT5TX+ZcBZw57RlUQH3cbsQnGc4rLEsVtMHCp8a5X+nNWisOhJAzSchPPkCoZRlNlFRrcy7ivoS12UdKc+ivETTbFcLH4Dd7PnrVoP5zUtThWqJL4GKk/5IMe/bbK0tj/NLjOeFM9rGL18K67mLIdVWy7pOuc9g6ihP1An9kycj+YZRUJtndTwmkkVQLn5bJmWNmJRxxfGg4crB5oQyBZRWFxjT0YG/P/4H/9TY46ovy6Jvqj0SZyVyTVes3T0JhfimDFO/k5AkpgOgfEk0YHvV5v1GrFCilQdHGm4lOv1pubKT0fRSQpDS2cNQoQAcUP7SB4AJBq0oNyiImdiY5VkueqQpApwJeHWAVoAmv31V4f+29TZshrh5NP/SRpQ7ouhPtC//soQC0Rcqw0QJLA7C7EIiINyIJOriHqQ1JIeBzpFzKGG1OcBU0+myzRB9Ej0iZ54XF7ZByCyqWiZwmASYgYS+AHjxqI2grtYFhP4oM/IMLJPh/ytOtOs5p6NYRQ4Fc2q1smQ9dSZsF7AaeAlymHM8pCpCeiL9duLniSwqRrHgG6LnO4zmvA0Igg86YzqeSHDKw18Bp05UYcqWbjF+DpSw23gGrOUfG2UNFGIWVRPIhV224LSal4aBczWk9VklsitkY4J9x+11LX6Q5WPBEoS0z0ZRe/UluZJBHQM90EKt+SUN7g+VaIWPn1xtkajUespiiZZPpP86v4SzsaSj85g67qJdnHp5GZsrp4HtduFvcvkwfhOLWfFAjC7rkkIeGBZALO+Ti5TG70yakVOSOBVjaUZsbZNqDiqOJfy1JpzKT+Pna80UOZ95WkX6Mx/N4rfI/ptQh7JEprE2YuOEaOKYcH2Y9ZRdgU23hRYO2D5rmMeH7KHQIXOmCSkwt7+0ienu/TO24mn8gQEryMidemaIW61No6BdTEB5gYuna+nSRoJJl4RrcZ19b2GUBu0NooMiIs2CVzRskWlty90nX6uR0R/oHAFqbDmsTEpF6PIKDQJI0X9uUCYzukKg2hCg0rECWXILlVJcisp5ADyH/BRLYUaA5YUyK84s+qTl/N1Bs1tNboBnRPkquSy+a+rZCleTf6ADnbpxSPB5+6ycHjh6uneCQCtmq5PlznTtJu8A1WL1HyqaHx9rw8lbhsSBeSQtiPFxu14t9//XrkXAv2Swwh7yCBChHAMbwK9STy0gq5iA1G30lZAxv1lV7UB6ntqK0TzSvPRnBqme2F7QYfvWz8Ufxtb+t9yK7fRwKoZ+/bzNtHhOlW3kgeo3Z5G2t62dkcHNlRPY5+zwLh2xhwOK/DgojchcRaie2Ih8b6Ux5ZVMQ/cqjj1JRxmRn/FRSywl2b9hXgOOvOquPiJv/alhkH81sjylei/BEPMJRAg1zCxlTFIpDcLfCWUKcZYCdRVlpiajRF2DYjuKrlIR1F0XpfZWkjzVkl5uVkTkYPcaS5lDoR+BZ3ymggks3idXCDSBRr146RYzj4No48H8g/8N7pJl0C54U/Y7J+GAhDK+d+8fc96ICBpJiXqt2oJ6n22ImHj8DV3tfoEt0b0cVZc58simQEgpj7OXj7/KX5//GN8dgoTXaaAaFfrDA6Tlkn1fvl48N96xu/+fzvCjv2ewW2VTX/foAwQ2/q9gsm4TH+fZavfkXUvq/T3CXy4/N2sDYP4/QKRAXzbpL/z6H5fQR/zOvl9epPkv18vshqrwoisqrD1LhZ1/Mv1t7/P0hSW5PImRiC/zP7JLofThqW4h/jnwPz+yyf+ZdAtqFpTMkbcDwZxYWk08FlVqNsiASIs9iqp+6KOI/2nzdFY7BAocy1G1WbS7/WG+N2GKjQq8H6E0712qSAaIVFC1mtmF8dicCP6icyj0+PXyTqabgBJr6L3Z8fPT58dP/9rLCr3T06f/fzjt08AypMnAzwup2dnb89ov8ud7oB7v0hR01WmLHbR+i6lZQQaINnAoqIIWN35jys8mCNVKAbU7k6CNZACNTUSE1A3o29dZYw5Cz3qec/p7c9rmNE0MaRcLKrHvgAeLlBri4NdwC7cv8qqbJItsxoFaLwLYGDJ0oEp+K0+ngYcOKxdNk2rYSRPIvCgK9gcGb5L6+loQPpuXOJkWm9w0rDlyp3ZE6h+UcJBBpxVVCQu+3B89ublmx9R0AZ47Ebo8FChlJSIIcp0ZkMBBNE2jzRHLXMo2rNnMYQp6XxRVWdPhzVM+AjhdlPoq+8Hgz4+rusEzlqicT6j9MeCUCDW9TENENXqRYTqdLFCPE/INLIOw74Jomu89GohFv5ASgxs6u2bV3/DVpwW+rh+4t1jOirJVZHNotlmDfgoqVPrhgHEh+s/MvYddBFoXNg0N5GYQQQyAfCi90BwZ6hITPKUVMY8B/uqUTF/eHkj/tkX+Eduw/5GqF3wo7g6LUXUwIYnB4bw4KBn+T5S4xqcieOSJXJnqNEB9LROBVbktcELWQ7kGpWe0TxDhmZT6jW7hgOCau1I37J2LwiebGWWIjUJ88FXLnZrKJRgyWyW8aGUXeMuYSeQFEvTWTrzi4GdPcZ3ZZMwcWiRgbibX9EReYKY0sCiEn/yCZ8iIZBWGidWvLIzJDgEHBcJorpdCBgtBEW6+KVAFagbBFpKaQ7dbo+qtKYO9hsIcxCs8IIQHPL7mmURtfWn3jf9pJrWQHkMqujjN311yQyA+vimL5ZzUMG1hpq1+aoe97756eib10ffnPcG4kaWoGl+g+YjvBN6ZvERLLdcCHcIgwCT7cUiZ+mquEoVBkASUa64kkCJJrtsG2QD3J0Du89mAowb+36DL6nT4fEHNrCgrB+ahTinfqLmtk6VXs02IPk6qnto50RcrGQdoRb1fUnEBhyZfbKP0tev6qMyI5P9ZE5HU++sjM1ypYx1tcl1AVsrZvuscXRof1wWQJ/PYiqDX/GAf0CLsR+iw2GESwMbOJb9iuukugQUiVc4LGwJXcErQMG3YQMmAQSBpPsyZV02gT+eTjdwScAAUdQiP06LTY7URVlUykgsnmXTuiJBa2WDjtcFnBYyGTJU/M5nIVkdG6J3pbmnErCPBXVNvR+S9HUZZ7MhmdMRktCTCTN+jlVxubICuhadPIsEGCY3zdXbVEJVr+Vc/t43Lb3ahqJLs7WNbWcE3YNzOTYqLotiPbRpofKiGvfDA7ZLzxI4wjlZNtgfsOy4Bxtkf7bcx6Z6+nvLEEZsNzGwrSCs1XCnHGaJjOnkrIuy1rQCOnNm1qbYnI94efQHgdrc0WB9MY6/F1nex1sFKLXx/zVoL93Yg3pxdtuA76Aabjsmwp5CS0CyzSoSryIxG6GxYswbL5KGkLg38/R6eaMgaYYbiM10ZW/RvejZJgMaCOYIaL+IMYSw73x5UgmV+UwhgesSYOASZaXY+cZtTNiF6sKoKmIqzZnHrqWsDKJCDkeb4czBjkbjnH6KcuReNuv57MZgCbG0IcuiOcEfdv1pkl9l6TUAcax1Qn3GG7wPsMWWxUdQebExje7AyASRmne3Hhr3YFG75QY3T7NjGzfMJiNhZwp0WTziFREyqn6jMj4ojlQDMbo7bJQ2RicfXRw7zAvhheZvW27lcXNPj+Ufnm64b/ait6hvo83d2NCNjdyoDsVUT3H7OYPa96xlcxmKMpLjxp1qwWyuGj64HY0a7p7yV8LH5FSNs8ycarAWPsBF9GUDA9joekCw13tvDo57werNWX/47mxyngTszCv+a8f+pKh3/8MnDrHEP3bmFPE1hZsTu2TKS3fpmhdt2QfClsQ4QhDScPkQ5sVolk42F/1578QhgRDtMQN4FN2md73gPUmo8TqBuXmKbBExBUwEj5v0c5/M9M9treN8kwv3C76gUFVfCtUkekMI2z1eBoeitaz7mgSv9Zl5mm0AUN7t+ZTl05JsdUMFBPTGV4+0SXIEMXEuBqv4usgv05t9NmVTpXjgpTFPKABCCw3CrchjyP2qrYRRILRZkeiHbbPksA9yZLCXB6QHPZDF0DBPU+tu0yPf3PcHUTLHfp3+2+nZ3wSZgbic5QTPbqJruP1IOsK6EtH9Ia4x3EjEPGF5zSEJuluaksHICBQamQGxhhdTNr8hu7scuov7Q1HuU2V+0UU5Lac0qRpj9dcFdmcFZEk1ki/YBroSQJlhr1gHvQK6OxZvHln8fHAfN0s19nKziG8/+wGpTdn87NnXwZbsEntoRK5FjE9HT/40eorrJkT0qxRWDa5uQD/vxBwLp6WIPSZ4r7Ue7sZGlAXkjkQyFo+V6lUYE4RhYekAoADOCMMSFVr6ZWKIBhz82NYfPxryg2mfIg++8oPxjUixQ145Qz9s3S6lV6bTVICwZremhu7aINWl7INbQcFWv0fv4K49HDTapFvJlpv8peGQswdYG/EjUcFHSPgKlziYIa6jOLYEvfOyOoN3hwdvpMWZBc1o1xbm0C97uGm1WWpjg+2Tup0LMSkZuXzOGs+YrDkcBrpqt9KuXMGHFCyqeIPu24ueo2hJTK45JeRgmO7DPvgekDqpommSsWtvBtEiBYwySafJpnJ1jHS5sPAfBiYsFicJe2jiVXkYCc9IkmAgZ8xMuLp/8OIbPdBiCKsxBmCfE+8l+gcdlTCWDQ+lsafkefNvFZerD525H9wj19wY9h3KEkbUyfD6kvNTQ84IxKMHqqm5VNLLUfRzxUoimAgJPUIKTTkqmY8xEFcw+u04etIob8pNw3Xtg+XlkExAfs7DnqjRelHURUwD8hb/1q1wlc3SnSokm1m2U4XqkpR23QoDvz5FdiZQx0ZG3bGbmschb+EwHN7OkxsgQm0Qjb5kOcE1e29W1syZ3dhuimr8S2IPHyXyx2KPTj0IYw9zntU6IQwBWMy04pp7u8/VTuQiysUCWHkLMJc+E5D8JPtOpKKA5KXsBdH9Cu2xHOfp/kT7gw+OompTztFNB8m3g02+tGpo3mqkyXgm3odUA1nBDbuGBYjTA35xEKJ1FU0ZrxJUlNzeYTNs10XsGw11/wcaK5XLZk5FiZShci/vHUWHd02aU5X+z0Bv2oJtsZYeon+HAyMEqOy9EiXE6CNdc41aPkWULoDnTKI5UqJCo9ewbeJ+N5TEauBMsqjlk09jNT7CUnxq3nk4vyTvn/ewytFts+Lj/PGnu14AOmySj/jHJ7H7s1lHvAETK7EG1xsSWmYcvxP28E2Ftd88fJdcyWR2hZtr/OSPwsMd+iL+7UbV8V7FUh8PP2GHKWQJkiS2gtZaa2v56Cjgj4Zqh8u3syb2olrXrrmsYky7LazvCtWzRl3+I+5Mp8nwYgTmd12sqWZAgbb7LFtXLld/gOvWK70wbkdbgNRZaiHxQkBU1VlsYd+uGojXmCcopG14zYQFtZ0cZdpkkY/ktgwLybxOALsSQlskk6oHTbnajs17NkebvFM17JXD7di2f0dskaVaQ9fCsm5Nh85DSDKrGvOJ+XZosm2RQ6fInep7Ndxhis1j99B2Yq9JlFQW19EEDSHgAD1sC4Qm2Dg7Xqb5Rb2IhaV6/ypZKqMEOPVsxRjNNqz0xwusiE5Ojn766ej166Pzc2XFZvp0iGUgUEin93HKh9Hjx/Dfm4Pjx83IHvT6UeMmYU5UmpiM6fqcw76uRTcZ1W8NxoP6TK7A12hyU0nRpQJ+cBD933/+0yEbpy0KDAYzjvp2mW+4yAALP/2zKLvK8k2dektjGSr8Zy6qB+KWFAVEf+e9W+zj0eF3s7ujW+qM+Fs0Jn6J+vSrJ7E/7Rih6IcdVElDK8ecB9bpeZHD/q6ZafosNp1QafBC4w5kyZRpCEhh1QwVnajPNdnqIqKrpYpWm+kCBZUiPtx8s1QBR1ZpnZCTDkXxYurMYK3WRVUflMm10MetkxtSj8E2XLDTEimDk+U1TNQ+kBUkEJsB9BI6QcB4PCqqToXhQMpMWLCSm8IS1YvLzUoHzEOXgTKbLsgMflNieAIhjtPx5Mp0vqQpuiaBLfaCPBIw1Bjdio7tNC4CLPlH9iwiLyjkJobS7CjNUXGJSmWWVLc42OCkNOyR8KXXIglmL3Zq4E+oEos6t3cDdH+6vWvUk/J9uyl+bVW0aiqLE6/NVK9HlRR4ZjzhE73u9RpDZUhNmVVz/HHAKAsfgO0Mv72wnDbdPV8pp7uO9RJ5AbR1XfRkNomrBHUv/45iZai0wyi2FbfHQaU7lINf74NF7YkXHejdZ4LWJXozdJghKhgcJtwytMONq71RhhhAe5AMNCTRxMerh5Kd5iuIf8FID+2qHZRLAs7h6NCeFUCZayC3U3TJ77DzzeLbdoJx4mS191ity5bYsTzi0o57omXweGlbr6i+u43w7Lu4Suwciau8nKZRMShPsoDbQ2TYhLcEXpePf+MoSCxJQr44zftGAwRo533UBHvoQ8hiRu3NQ5/MnePZKfTZ94H+fK++OutqtaqNyYxVlD6agWrxsrgmoal+NaJXTg2+o+NNuRQN2UOE98Frh6v6P5VTOSyng9nK2p3OnIiv/gmDj+Z8DbzjkU6s1nQ1p2WMxoyXOfB4veamQDGKvdDrmbnEPdKV9cjgWY6nKI2plD0bpUBboslSv98bMRD890/875+u+N/iqjfw2DA3tkHv37DZqmktSN6WPdLH7d6pp6IzCf17nXCniouLjp06xmaDncrQ+3rXTv19fUGd+Ps65T/WOf97kc25l+lk3bF7L7ED3u6FDFHt+nKX2EhBMXPbbxgiTbNpLKvscMuoKl0K85yetFZpWhD7LoMZW2xuG9hceOfNCKljpS6Ul1t3Wz2H6oC/0tlxJzKMlSXBwu3ElWVei/GWHbxo2RdTNLGB3YpwUfDXdvwX7JrSyNpf1TDBFlAGA0RYi6TSpR7LUo8HTLuJog79mPp6qIjGVHSRR+ejE/10oV1v0NxfxTrNm8MT7fJHOTNdW7VrOWsprgQ5Jx7jCvQlE8bO47Bl+2wpRTxYymuMv7GK+AAFzDvsHljG4dh/YzvS6HsfPUbjVv/wdqX5NcwP/MQ/UdI/oGlUPrMoSImbSf7UEz62PaJ7OPAH3MTSP8dYWD9WtWfmndgl3AHehzywl/l0uZn5pj+MscOw+xI4xWaVIxWHAqeI9ovDQRTX1YiCZXucYm69Hehl+Sz93DsSYgl/GbgIJmkJhbBdJjbRMTpQ2nYYODJ3SKCGlE71jpSgagtsmOUjY9eE4EqMc2RMdKAsR/XDzVDFeJsLaccRUOaBGi4BDmXdV4Gamvo+Mu7stmborjnSl1ygLItzcWrEZRooZ/GOR9bRCfWCmOajqPeiTNOePn0YDF7s/9uj0Xfzu56M/kLfQ3tEim2OpKinbaa4oPwzUJLkEUcc6qBRwhZxhXWEHhcT073klEIJkIyVDUBIIlhcm84l0nQSjqItlJ1NWCKL/3JwJS2WHYppyOfFmOiJhpj25JmQhcrATH0d+BHfV9ybgSO6VVJHKb7lDBkkw9UpE/DjybN9SgYCaPq3TXaVLDHIcDEnAL/+2hAs//qriLvALoEpWchTcDNLkiwExb/+qsYHFTN0GIWKIgwFdhTFxFLoh+E0btWGo6wScnUB//BSMsloRL+kg3sg0fsBSqCzVExK5XWpSGAxr5VuUvWvKRHQn8ZK5rkXvXv3bzIWR0XOPhiML6Homqvss+G5ivhbEUZM9QoQL+dQmMY5Y1KhqrPlkm1h8hvL83UYYRAeNgBWwKCX5Kzh3Dx7UT8bpaOhEnNLz5M1zBkAZ1+WNJpvoDEchhCvi3BCBgo0/QYtF1NLzkEh1ck5R+1s+whhQB1NBMck83U9ZUUBhbH56j6UtJhf/OHpJrnLuq1t0xRtGzIfbEuSb81ARWGN5eCxGr2w72Dj3FvvL9ObsQjy+/mIdyV1vzHizyYjESc1SxM+WyyDen1oY7wRSS1jdBiHm3jl+OSLuGSOm/22WWuMeplVtYHexLwZOg/4YOs8bBBtyo8mVwOVBK+paYIAPxKjKonCfLm7zN6nVexyMCYEIuktkA3SXqUIUTvL5lRUDySv4RL8e9GroriMNmtxvVIGJVQnWIhO4jlCczeM5OxmSXeiW5MHwSnEOE3hNyq8Rkul2zunqJBZr1UxJZo/9Gw3oQAxSmttgWBgnVGfpBxjKSVqUbpv0qDh5iPTc6eGsVgcExsQZZLzXUZxUXNivSbpAijciHSI12hg3+c6XtGbAfNerBYJjvR23I1Zugev9akxj0Jjr3CEGYeuwc5yCWefGDhEvTeRi0+WTp+a3fVKw2XjUlajEZ6CNJAkZO9v8Oy/fr1/chL99NPRanVUVR6RyHZZudtoJbh2bq7DzJuV3d1rSNQ0TlLCLC28CiwVHS3fElk0dkCPZHKPRJl3GYtb0Uu4N06oRsAH0c8STfr67TubSNMZp1LUFodTHM2dT+RXlGo0BBIhVwh8knUWW3orsQnk+3axP0/Za5OUnKSSLETyjGN5MG2YfoadSKHaBMl3IG8Yg7K0Ib/ERFuPK01qyth5Ijuf9HmuIoSDV8kwWiaTdImkpaQsD4RowgOfIgZSPhT0T1ri9cW2+kxtQl11qcJomj1sCHLUdIaFN19PUNPozZpDaARIxC4d+d9yIS79v7Bc6LCDIEjjDS0SEphDanIGoykcDgzf++9pv1W08nXlRW0orksPBWtvXURbBUUNapbIye1yI2dat1T8B4iRgMDtKkn6bZOWN7Ei2PvTjRHbm8NmJbYcheZ4SOO5i1YikgXR1bSlh0qGIXIk2HITKTKxRSCI9bsKa7QAioZIKJ1athA6/C1a7rUxgTDcUfo5nW7qtInH5r3z01enz98riWJkjD16cfb2dXRLnbhrs0MhYUZxTelhoLV5WsMltlx6A0pj+JpsWvehfPNKFyxYGwOGD943nsBh+I7on1zPfQtZi58/Qh10PvLjc3zUMpUmC8f8m/84UC2xnKVpSsan3V/pLnguXM+w97QnVnDJ4VgpOTGOuECjZzgWdjgt7bEhDoYauTwddLmQBWoV4xaPZ5M+p0VO5XsOsgrMe36RjtkwWUXFEr/xRqpizLIzNmVPcBT+FU+fEJaq8LK2VBbd8jEEsmxWGMTKaAssOlqkKzOuvpTGnmF6Hjvlbd9N8iM8LwhOM4kPR7KxU/9meVYt0mogJLF6+EeOBPa2l+bYE8SZKKxAXTdNIl8lBi8WWHdrzxS+encU5Jc8/0RbQ0pnpOVr12SEa7CvGM2HBJjC45O6TpFZcD5xhq10z4a9rjI1FjGFWwx2WaSs1v2Iu0jSMHJfp7ScpGLkjZeW+9LQOakrJV+lHmUigzAK2mOZkVRGjuMI0xQ/juNzkEhexYe7pgARJEWn2YBhEiwV1pmHJITKnCCXjs5EJT+dyYU+o74i2Y+rC/eKpKCOEF+ji30Fq/NmKEyC5I+EbWLwx7ZFBqprGVuQ4LcFDH5reHdScs+Zq8pKhMhiYTxmYEX22gpi6hfcr5N6scwm5qvqt2VWp08fme+MsEcYBheTBeMELRi7oJ+S/qmE+mW6v05K2ILE60/wcKFmY8rBcNP5PJtSDlfcAnhN4O5IyqwSiWTjWUmYJzKiwuK7ujDfoJBIHUNaSv2Tkaw8iW2XoanGwOHErNCwiswbkPWR9txoRvdjLZfRID4a1T8NraPdkAu5DUuMEGiWZijQqKzqNjmaptmy35slN/fwsme0z3g6hv1Dgh3eZ4KOUApHTVFg3o6hcDMoypshoFcgoUmBVwHFO1S869Bog1NsCbaNYSDiM8JhRlrANlQSZgbx/Pj8NPrw0+mb6PS/vzx/fx71Re+eMEmzLpOLFbSB+4VpwsesD3w8wGpnpxQpFwb3WMbBfKzn6j3Cle+j01fQ1JufX72KTt+cRMfnOhrsA/dEoXe3KxrvN/qiPj10ZxZJtXD7ge+aXcC3D9265LvcHiiZYqMX8guVp9YY9PcKVTLFDkwrrx/fUZJuN68Bxt2oJ0ScDZuXcPUwUmh9iOk37wwinm+9LI8cskofMrWbxvznyPCDl02rb1YM1mmR55ETTbupBoJbdZJUaYyXAKoY+C4YvYN/myyBgeFHsuY7/a4/0G+h/k/pcm3G8jefZhDZRrE2hwLk/q6TMscY0/PeRyAfX8HJ/8ThggQPSCPCSVZLdAdrZA3YDWAphKRWmRGR0ZWPYQn14k1BBC1KGe32MeSU0wOi4Ci0DUDx8DMo5M1ymf5SPntAjiSzfUpdSTysQarK0HuSUhWpXqIX0B8U2FopKTTA8399hbEiOGo/Jc0TORIxqw5c2jmckqt0efM9U4ccKRsmuYSByQCJGtq0oHQZqHafABs6jziqtBBZ40GkezHL9+dLTLdEMX+y2slAI7awoEYwPV8Op6S5o6wpBexPMZUq6JiI182Mx1D2evz0sGVvYSsjuDbjeUKXktGBM4cegBmKxlwBE94Xrija5K/d+3HQOIeoDFf8b5hx/uRuBUrLSt+9Ss6QgtPhBg2JhFcs0hjYdAmsRd+RjIaOxAtiq27RTwOHOrhz+DwYpeAB9Wlx3VP2cAvXnHCnWqfTDIhHI4458RjrskDsO6NNn+bVBv0mr1NO8goE/rUDkdIoY6RpETAO+QWXn+HgOBnwkjCJFKqUEic5Cpa9CIqgzAWocTUsHV1spnMhAN0C3KiAXjXisrRElY4n6RyDDLDDC02k9yzgTioNOxLK3qaMRpTcbqDitGNzn1rxmxeLmyusvBXntEhH0SWSjeaKAy9/K0Zwp2bIWXLPLeDu9vUaA4UjO8H0PrdHEUqmiKJo6S/TdM2LzmywYngdaLQIeGFcZzkQkCKtleubqtHqTOQtaKxaX9H6MCAmwAeSFfFoNYKq3A5ciJp9GjjZVnxsLh4+ImRaNHbsCRQE7KvaIuFg3DFTi4gaSq9mW74OKratIfItK4CGW8UHA2/yYhe52DO0vkJdh5oy04m5Qvahxv1RYnzjuqkds4G/SzKZCqEq4B5Dc55oyUlc5Ai/V9cznPAZfL9KllCLdECt4OX6SE1RXIbnBB911YcKBDeNfOJZbXN9Yo7b28UYD3Lz4o5FKH9Rr9pbxEfuMm/YQ/fZOkijRxjQWvTnB/HiH9GbXdaxm+nErpC3ImICZiDjE0o31EDEsr3BHXD+LYDkHN6KP+4wf91+Md9njNsVd+PjH5C4pGR/GmV8CqB4HtDthmgOYxKieZIthaTQYgcAaIPOYGGLBx3uRc+F8FJLLBl5kF6SJ+QkqwhLccbFmwaQmEIIGCLDQ1NkeGiKDMNKBEtSeOhICg8dSeHhXQMMI36mLsOof49txSj2hPSeGyrfw6Fy+EOxulRSwgW5BI566V/3eEWO/LHET03VbItRBwGYLaXtnwYSNliUDyKUVc3aMvZDHAqHxKDxA7VW1R/lQnlC3LktzJZb0DOC0yvXApHsJlSP2cdUbxP4S7g/wj/bByBqPeAAtkO0B8D+qHprb+uxKPaAPW6H6Ah3PkoMgeo/eNXMpSNIGEPF4e2FMHF2HRbgwHldFYJ7F6uFx7lHgYtt/Ugh1WoiZrX4wBw5acDD0KQiaMK6OVKfSKGC1IOx/BVZeSCLVMLRFoLIDDpndpVjzWGPwpcqInjiQ9sv094rNqejq44g3gneTtq9drmw8NnZEsHL8vKVA0QM6V/gPd16jSuokUZFsAAqJyddfvWkU6PvZSW82+qJMEGMYRj9gdnOHGPUudsWdhrKMnbgVlj0IQQB7seOZqQNNbR9GKUyGveJjsTGZk7htHdDaB0mUIiMcTM4fkAN3bNhEK9lCm152IRe0G3HUAOj/T5yvajW1sGf2NEIk29hcQwcFnPEW3Q3UpJhQyiB+vxFcoWR7tNcc31Kh61UfL9t0k0a9ZV208kPti4LkknyvUcp50m1LV5Pk+kiFemhR1F0imp3IhEqFqihCOMiwWCIio/miTp59j3m8kAg+2RnyLpWkkrh0GXEfbMxTGjDEc2oWVsvaXvDdE+aFkpopvH3PXOg7ZT7TB8ElqXO7pMprzX0kz9dnspPForA4mV2jD6Sq4+VrSrkx97qwm53rLLTU5lZ1JxUVT5JvADtI8XZ9lgZQaNQgCP6TxfEpDipC+Wzex6veyRi85k0f2mzXRKufY12G+nKujXuN8V94NnHj1k4rL5/SmBrWXX819L98r09QK43gxndi14y+XIflO+gewMoYVzKAA44CRU4tY38oxzd10Suejyov9KQfo2SSXGVjgxInJ2DDLSMq6F5LbTcCAa0wN0Ao7sCwqmMNdUU3woLgruB7g6sa+MutmbYS8UEYvDyrcTtI/mFfYvpp73Lt5I4Rk1XGYuPoeVp7zw+xq1AfhGC/30s32NE0MfERj9+7N33OhwSAHGyYBoXQZDW88vKdHBBq1fidXunfGHKJADzmwXFson2XA3vygxFL0dqI0Z9HdNyghZs5aW49ZN27LHD9dXsxgvY6rTTcZHNk3AU2uqhNbO74QbnQH+mxwL+Y5aYGpuOrF95KQIaB2eMJFxpUQUo0LRK817L6QSMB7R7AgyoMP3sKCJsRb7ajGjbZfBVcL+neT9297v7OgykacauGUZiOZz045JTfPj4yJQqUvD3K87F9zUiJK+Sy5QTH3FbsWjLCKL+XCa1EEVkZsBqMyGbQ+aHcHYqcbY5/IKy/VUG9g7X0EjUKMcr7R2t9ghC4GKgHB/JFNNMFWU1YjPhimwkYvzWqXWZJlIFIVdrLVpV+2jXxJMUb5vcxaBTFFSbvzBRwZMI83RujbdvD99OUd55KeiOd82wFSShuWZrCBIaycyj3FuRw5TYIqQnEJuMeqZr6L8A5oGO1Ebac9hW5SYXQ3STzYv+n19mnHBeWAij6B6BiybZTIhsB2YFJRGFN5kwreGxWxBRk4zWNJLvSGDlK2W+BXzzB2G8jBYDQ+xeToGT2PC6XpTF5mIB02QBXZdIh6Uqdyq3G2NHYrL5ELFB0ICBtdEZ5pYQ+u73MNnYDQsk9wht6gH/T5B14IrCsh290Tg7zPLGyhbfsvXhtsGVoxAZsc1ZxdP5BclK8U6IZcFmPEbJOGJ59FHR49TRxdw876KsQrY4VMkEB9PWEKxHng8oG3Qgi70HMD9+GgzQ+89IDY/+AxELoNiQJ8bNY245Cj3NUtxpscRZhy9OzzrNqPhhVWTZrowukpb6ZEm1dWr5pKPkV4tjD9AavKpdkDjDzEwe4NTzyS3TFUZbETFOhsJLVtvSs7+syHzpAJRHi9PvpYItsYXBMgKIPU8jLYBBQZiAgFJNJ4KwIov9IJqiNAcA4UKaDD8AdkisC8pE4NTdWg0bRoMrRVm4ZlGGpSZsFrLTJH5lKeJc6NiSjSmzYtxyTHMl7uHKtm1HWFg+732E3fMJSVExybYg2mhOmmexFLLJqM575O5fjW9l5N1KBegTSYIOvTpmTgYVG5X1b4JgrJMAM2hzLzNJNRh5LOzcAmx67+WbF2893jbz3s5zAhedSkk3dDroF82JdfTGHthtGDSUD8dnb16++THgOzTvvdEdNNDFnOzwHKtUlJ35hRFA3cOh5xGjGHqSRk1RA3JlSkQBV5+nSw0rrlOZo1x5alaSRMArky5iRsvuZBqYgKTzS1/uMsYTuqiPEQgr1VrtbK6L8nK+LEwxKN8CPXbDMaMDOwVk1WCQU/kIDVx8lWmV3thzp3XutBiy6rvrHmnet7IQZihA3R/jVtGlXjiAlPt8icZPPrIvo2ZPYEIa0YF8j38uO1VVqFRizlPRtKlh1N5lV4Ifkc20mMDtZibUth2CFYXowFO3vbHGsuEhh/MYC3vyWdf1C+y37RvnCxf9vqvmjjOwfB00wm5vAgw+oz4yv5G8vVlzDx1YifRjg2TFI/Ut1kmk8nSuRVF0rMlKhzIf+dCr4WyCZIqTchG5moapaWO2z2z0Hd2KP+6a1t0mHHL/nYqsSLKyNx67KIVx29UNHJBsGRLP8ArtfvfKZ8sdrIZGPOjaZHobVgDAUfIFHaYrzCd88mCRpDWhmwLBfPaic6bnWaWtbmEhbEphl6Wji5GrM4a7ogWkIA32DdIgCygwiEEYhM1F/Or+j5866vr1n+EpaLX9xPnBwGls7Z1NyaEISH+K9kChvJLlPpoLm3GceDL9pjVGym9KOB8LaGETBn/PW6/5L9jKAcrYfGAfY8+tfYw2/ZoxUfY21u4ejUb32srJdZKZorD2ETBLwUE4WgtSV8c87e0FG1r/1uINi4CveHy/9kLLTa2SzbvIe9ex3ePWTDGqi7pWVI/odQcrKvP5guk6PTt7e9Z9vkJ2xveYMnw6bAevJZf5ICor1gp7kU9Kwcmhk6WMDFldp+k6jI7RU6KqyJDJYNhQnSsxOx/8vn1fhIccviwGrCcGagUviqyUPZQZgMNXholhi7VCsOHZ/XKbsrZ7hkxgDWIFqbQAofKfA6kbgvjmBu4kqolEJKL7IHtjlLwQOwx03nuVXco8h77r5wuxVXhxrDzh5mOc3DCW0/qZkZB8svixnRtcpmOUOHe4DfUK/Re9ErefKuZ+/lOfK+7if9WT9TP2/v8fZ4sX4n+fLv9boSCDybXMsRva4q9ggfBByomKEkNLwSVbFw9tg6B037IxZXXwVjWamq6+pRZfzTDTbY6mQ2QrkQoNUKUV1KQhjFGhGsdC3LtqaNPx/Ui8RmMiw9pAfY5VJBAtw7Eth51iHDDEFsy4kEhH3VZCxc30FhPOtrEIQ27LoQUkrckNlJixX1y8TK9SCg709sWLnlMmmV0l+ZTEfEYWXVl/Fq835UVTEs7fYTY3yRITyTlj2GNHQMtZnH1dYVpiqSeHrl80uqyDSlkdAoo6T9bVAj2AZBwCtP1Agph0GsXFBcbQYHtk2EnQN3ZLni6LyQTaf/7qJanwc8NDmdvEMBboYEPGJK7FoDnXpYht4ZbB4aYruGhwY0QNpbIcGRaJRVis0IpxITI1uEpwzZ4ejg6xBZE4218+L+psfuNKaq0iFWmhWksgyzIW1gowgNEpOhs1TsGquog52odYWNhXZDWB5hs97Kr583eMwJem+hfwM+4W9ImcfZMjYpHIm9Xo2V70Gl1EpR9oQm5iZb1Zk54N8QubWpYoFUeMkQnHSSUcA9jz7MIASCwVm4AoZ5Akyot8Hw5RRCcKc8BtSH+Jxrs3kRBNfivjkRrQZpsSy7H/qpB6D6Pjdy8pkFzFVsAoiJzg/slr/FOMxjT+/YCOwPu8hdAPnyxmyJBG5CcvMbr2MptmuPNpDipl2uVu+xVaVkgUIeZHKtEJt7rz7Rj7mEQOI06F3FTYGG6pkPZCqsDAC0XEvQxDcQr4oRDqbeuK9T3QE4WcY94Zm9LbH18xP0QTobfCDBT0QzWtlhgFeiAahfxQ5CZo61azTAAWI5NWUG6RwNhQoiDKlulvm7TyLqdRLLAfxA0n56Gta7JsaGzyctoyPk8xP8QptraUPWsZpVUw0DtpNxSTpN/XMadEYO8rBC+3ImHw4Pbylw/A1hQDz0258oL0FTNRUxOjCApQUHAuBegj8VxtnKNWUxTyp+hY1IGb/Ugr13pOh7ydFt3Cl40+2eQTZR6ictu7ftvTdXt3HUbwmopHP5+9ojtIsMDU2h2+7VeDntuuQRaMpss0KZsEMWlVZDyfvjsfNrKWJDq9Da+Poq35jy5j4xq8OKQY4SbuBIieSSew+wx+gItxUxf7NAYUjVcFi8hFBzA8r1pFJCMMIHmhvXhY5hCdi0noAb2ZQQt4lLPSlJ1mczbzDyzq/ykm4vlPp8//Gr9+e3J67hh8bF+VritjXAjSnJKp0uayWDyGKOUss/f4C7hMIsbkb9Hc/01K0izvkJJDk5IcUuAKoiWtzjRvKdERItgonnujGy6XxP+iSIj/wGgKyDihH97bD+SA+Pbs9fGrnkhYwVwVAf0XFPZk01VaL4qZ7pif0rJMvs9Z9q5IWNjuimZFd3bqypPDw6ifzufplOMCRtDywDIlDkXYBXAXpImoonh5YZVwDOfZShbKVyrmsOiHohMk0KZUR/T+J9FxbO3kJ9dUz2ocg6IscI6hW2gu8Qo6CpPTqxZwAGe9gWrca5eQVegAh1djP14MsbGAkVS8QMPfVziLfZhFv2xmAoThpfrSNQivuo8E6SA2HO/AtuDHDf6bAhFyPdzeZgKz9s74OHn7WPgokh07anHmX9hVl8t3OuuQhzaOGkaSO6aggMD3DiNibpsH2+W4Jf7yFjN4bvnnFmab/2hnt+nf5iVmHwL3RmNpwpHs7/hW/NEw7533ZFfHt/Kvu1WWy5kZ3/K/d2KKxrf0jxGGw70ZNDHtsnvN68eWkamx+UcTkXhBUbgu8WTRt27TmBgEau0D6gO8cyShEMI0MgiohAE1xmdHeNHx+fG7dgRJKkzROkVXcYbVAQ0EYW+bsh1gi5CjWY4paYGl/2t6MymScvYSV73crGtOmmuKUoWsCmpdp0IuVqbLGwNkQcE7L8q0qqJFUVyiPTDeEiJjQ1+lokVBxRoTYancXssivzBsiRpDr5u2uo4QLRRUoSZ1uayLuViyKk5QRtTDpF6YZPRIGMT6AgTXVgQHqj6DVQ3a/2KLITfN4pLCLyZZhSGwRb/7MNH9mnzNG4sQjCZUXLYbXngPzktabFiIwGLbC71b/Pjgwm1TXfWe01khuwYhVxqNHDuQVjWftuCLBCyNFVDcj1Kse8TCV+SoTyQjeQ/1rYX/MMXy+kcXPoSNCakqMyO6eoNZDEh5REfFV05i0uiroxsQPzv0UGRx40TNWBv6KGo3OmhLySR3jS9beGuh9KB/u/DVwpGPuGr82zQo+mJ+aS+yx4CyXylgBr4JyGcl/cWC2n2vL7wiiBN0QCpFFMbreTk3uUXppUFeRcKWk0SyxBFCo8wqOgA140jhHPDuKtP9cpMPhizABWqb9xG6DUbRW4y8eg0YKSJTPZMxZYAe1ju6RrtTYGXZrQ2Acz4QH6vbiLLr5c+b2Kwbd2psGpdDNYuwHtRk2xEWBVLTsZwNemIHycWelTG+LjPkNyi8NU22mXiou7TD+dQkX5C9I+0S+QEmm3y6sO5qyrneSIa0K+XijnWHe6CrJiZA48AZJu1ZS+OBMG7S5FAb6itsKGfHZ2poXjEEIi6mFDx/Jq8pAUWkoMAiImBBOvBuNmOHoBOAsTLNJFXQS0pZhB6d0vlaT5HUEWpN2numHGwKCeYrrcc8f+hSbZNHNtfMO9pJbo4PGSP0YCfsi+qGvUpDXOcqMfkPp+NsKy23t4lfOYYqxpkgqQ1lv5MiHPxBshr1i8Lei58mh4dbRUsvedfI2+WiGnLWgpj/Vs4TzdOE6lw6UZTTQ4s3D+h22395ouKMW6eIYgkIV37UXHJN5zv0SwpkG5LagV1UmkVFH7VnxCdfkSpURo8XuYNjnA78MWg5+Mq/hA00fc7fOxz9VqZUC47xur6ojiIxeWOekyGLXJvTpMTKXlYTNwGL/h5k/RMOl0fxgSMVq85aeG6NCoyjXYiK0bpY9wehDaTBqhLSNIhWfMWOx7RJRdKZ5m2qNwOGg9QdVZkmfQfOoXaMjas60CzAwK0e6sab8cMCdVoa4B58DI0IzQeNAQVbI4LMOoI2kemsB0zvNMWwDa6BAx/AOQuXD//XOrqk6nBP7a1eDI80CRe2Gitbw+pOkPzjW8lQ87l8rFfpMYVwCEiUFFnQpIjeoeAhgU7VmL0DrRWEBFwdbDTLmaGMwmMApnbXF0SM2VZ/tanRJq4acR4dqK/XexsApmHImRMr8k8UeybbarbHp5Cxc26qR9ZOxTStcnAw3BqN546ZHjPomte+a5LOJWVESmsHuXOKRgzmQgYumM/jgrCEebpDSkpXSxkiG11aoO0W2EK3aeXekUlFClUd7DEjASZxgA/HbOrxGNfaFwzljPNuSNM05tf6wKJV5MO/L8wjkU8UEj7OREmh4yPSn3F6HgMmniMOlFtFZP5MSbFp9/UGxAUKHT9syjkePIzeVmIb1ai54rbVnDcCqtcW3G9zF8jgTqi7dxTZ6Ee8FiK9UGL3gkOmiVSwfQeE+iy961vgYEbELbB0kW3wLHVjc2j25yFrFz2w7AQD2y287zXtlE146/Rypq9Os9dW1J0YVrp6Bm5saeKrpY/209GTP42eKs6NDmJlXeTfc5Ii8/pHyowyoNYhyt5LhAgzkxC50FrH7T9JwYShYpVGq01Vsx1gHT07ffH27NQSFZDBoLgPmRiypBsUhj7hwMxW/Kb+AJA+vmUzfX4zz4ipTVca1a9LmA0zKxzZ7FJc7W4EmWFD7Ru/iUk0URX0QKeJtQYirLNVtyyRIbt8GdDIUEB4rLQ3oual2YCzYrQcdnZsTR7DAlD63VlcbSawaBlj3HjBqRnNtSKnb5p9TscKNxTqs1N28sXIY3jhYmsYb0yka5ZSSl6nkb0D78N7+AZnmH3Ml8mF3YhtFNIwFHEBrgy5OO5yjGdlkXQ4ZWjMCjRGSdmetEGuMAgxbWCPc2XjSua4KczCDcd9r5PLlLK9TdNZihcmgjSJLwrIwCCthaDJEYT5+gYVX+VFOhtZugCmCfWbIgx54LkuPQoGzx60WvQdNkOFYQUtdiX7zQ6YWgNPy0KZQNyTAVjao1ynE9QQSn/7I8JOtuUMSdOthTWX7b0m7aP9fWlJskrWFNeJT7kFrk8Z/4z3A2uvX+EOR3FeMhAiAOSWlcrxhsgEKGbGBgJGRTNv02WG1FglDXNwifMbm5MioLe9/dkUb2LV7d4dQktYUlZheMK+/jjuGR3CHnjkcTLUutMFH+ZzjJM8Jkvmch1LGxA8tRrVwpVRXMezDe8rg9KVNiOc1EcX06aiZnofSS0KTjsIxyxn1udL0tMIzr3uojmgF8jZUyA+QEoJ+QNNbpAHJmsmNOBj7h444WwKdDoRGtYdY3bGM8FN4YD6JEkcXwQcWUARN26hpjAFiXomzxVVL+j0vvYzkEn24Kjsq8SatJhOcD4faW0NqO+j+NhWR6y2SUT7YRkzQIu9FWaTqg4CNmeuM3APmb0jHaw1xnpdOL8loq5mjsu+vpbUstHMHbCWsMOydMwvOSv1+db2UTQBTZBzKM6zImyDQgmeVLZ7tNoSVdS7QPwGkazeqCHT1wcNHBTIFudfc3caCRNVVUCxf4Nn//Xr/ZOTcFOiL23RF+QpkkE81YhmSTM7nNU/le3V6KCo7HRvNE2zZb8HEENRq7zpGPytNYLUtwPYUnnXU7BVjokEBqXgpMBFC+3jJtIFVIWmn+yYV9E6QyZsI+IBp9cGTEGKD/k8DUUwQukLxbmBo78jN3RdFnXqBvo1mR7LW3akAxQLyUrFyCLqs7sWjaBOlqlyE6NhmOMlSZEMJIx8EUfisCMoo7Nqiw3UHyjsZTGvFnrNjuTsjm9N1tQj8/ULeC2O6/GQ/WGbOSyVyNjmPnzN4Bo3mqG3j8Ud5KnFW6JRjV+reqbwWf7VPdSAL7TAXOiP/dMYnkUi2TtNZfe5tDS6pmw9n7EtKgYe1pGR66zGWMJivK7iDLZ1guLjGpjOugSCw4TA+Ulo0qI+a4P3q2RuBg17r2Pj/es5gXkPUF7CxqPTEC0oSECF0kNKS4ImLeSf28GgwTI9A+bXGh0vnDO44DEKGBvIqIBvzEGLAXMYISssIM0zhnhmc16fFgPjPyfIquMFv0xRNk+GAv2JNlgdAt7CTNdVN1t9YPptq2F85MvRszRdown74TB66hqyyyx22cq+D/DFqFpizcPRk0Eb4O8agHcywBOWN2ia5JmtD2ixhLwR5dNhs2BtzE0mJ2R+ilF78dRIblNvvzOBzpHUJlpgIeygZNCsmaALie9FC6Fr0vtIvzqP7siaLfFuldQLfT3WBdwVcN5gkxOrggagftPxf4r+bMwcB63DI4CjgoNAFF3fAjfE1LH7T9zY5fPIaoAsmTI06Kp9Nq/BAOyrLGfVkOzEwQH00CoC/bCLfOOW8Hh35mi1CNcjH0o4Tyg84EuYOGZs9+jwu9nd0S3Cpz8dKsnYk09MDpNGoqUQtKvwPtd6S8/GQoMdYQPA+qy+VjJHB5FSmqPaSxmpwA/DRmUw0gv+nESsv/5KH0ZkZkXZ+IAW+PVX4RQ+ByoFOE3y4WY1n8hbqC/sX381Q9NiTUxkQBZ4lCEUZ5tSmkcq1Bob44m8QKx/UeBk8kAA6/hxAmiBxGxfcLwikERDI0KM8zUy58zd855MFzxNSaU1+HqOHsyeYou98bwno5uaqmvb5rjd3pivdzM60NTQE5pQDZAN5KyKWfuhcRQ1tKbmArchc5VjvwNcm6dUxzFqFag1MoUfW8zoOgUqMhtQgQpZe4xrL2LSZbwJOW4dHgx2inxM9Ifa649DUeZ3NB00ukSvfPaC+vZXOV6tRK27TLaIT2jPtk0+hID5TRUJCrqxttopNvz+mxGiHRtuF08ICrFEQRuFX0blhoVI2XNPxxoVN2dlBMrQhla0vAbafIvRKBLMt6rQEI0zr1WY4cpC098D/IvNMpHZVzTqZAwoohEiJaBFhRIN6iClymA3gN9Y2Ppl+n3HIlnAtGaytUK9uz0oH181cBs5II8w7lvtDwc724zyYmpZr892tLYNQp0LWdXdvrdEvoeOm4tvre1m0VRXZwipVDonToKGjopfeNNt9YiRCI1cYqRakCHytdv9svIxpk6qDBFR3ZjlO3PeVDoUj+klPjF5zC6XZD2O7evIL/4iaBJe1ZtJFSohXchiciGzLY7elem+NOwiuldqtNGUP5nNYpSuIqA6qS6lalulLWbPtElSGhA5H9N/P3hjqkqhHItWUJf05OBJRJbbyOP2ZSA6TgRNLZhiHrcLTKJhT8dPdGYsYN+yq2yGXC9BhX2psZjpBkekPd+BnD3GXik9gTpwKmcFinl2xiYIX2n+LBP7bCnMm1mxRpaWI8R9dkh4xoZqF8tikizZTm1qu5TD79F6UdSFSqRz2PiOmo2278lmlrV9R5nc2hmT/EbmoLO4rQjP3OQGuEs7FaMu+lBedHJ/qXMiw+rSiQf2z1jF8I1vdtgGsDur7u0y5dgirDs2kWdfulyy6X/VO4owJHyPtqD8gVwM/X1nD0CkWqUTQAxw+L709kk+IgEkzNBQJNakP3WUYCOLgibUY7KBweZIxQCNq+Pol9irKfgo4X36KEb9SUa/VM3vAILnSoHQo/HDuEzRu1zkZVXWBf2eTIOJuuieR7MWbJ+WRzXfB/j6ot4Fjpzv3ifDCLxRfYe4400qXhMHxbVNzTc2lo4WLbeX6vSIDpNPVGJkBdMTq8ZFE9t9WxpbTcU7xS5Mknq6CMc8bW5bHoLaKPKn2HryJy+jF6wnaO+DrAKNZOf4792ZLW8k9fDl6ODxTd5Kh7SU9VI1vnIWgdSdJDQYQ825eHjwTly9D1qk0/aZcG0S3Xb4CsjNTNtCFUEhQHirui/nUn7LjiqVjs6xLIp1pUVdWiWlRL0W/U6sROOWb+rStpOtzWLBRe5GvuJjG5UXOZCzGIMUXWhR6pEXch5w2K4M98tYTnxcbpDkn81D59qP48PJJJH784bOaXqPhuXL1ARGQWhGIvB1Rq3ot+PoSTNbFtnBAE+Ay7NPSQ3QvkUQ2rXw3aKkmjyz7A4tQ7tm+SItM1/ub1yTvSePhXKAQ0ih7CnLp0UpzCvJwvXkmcyowJLZFUooLFt5DdQUYmADsFtmGzSwgpXXCa3Y2ZttG5IIDlO18CTa2eZjG5wpVKApdoimNi2rA8KQPG3YM8E2CWrTzz5pwLMirXA6MecDHBHY4awaV+7VCJLQLo6OQu6Slw6PkYICe0YYvCm/gLnAkkUeizf+5Gt2mVbeI1CljR0JVGnjUAJVQhxJoPgWPiZQqwNrI59ugeG9QeGDSx1kVv+Y5nfivAKBwHblu+4xHs+RfAuXC6W34pDbfR3cV+kvBzJhJzsCwRn1oXbjSgUE7O+EdNi9maQc4jtmyDIC08DXwzcc+QpwsoOayVaXjK1kv7yBdnTHfgj1y6NsJEpGqG5EIkQJJ2gj1ozFFbbE4rKGmr8bVI6stQ1s00ojWAGf3tsX++cNR37fM+/JuFqsdt27VbNyF6np2pIGrPHpXokr5j0ZxIQbhhMyGkV9uo+NXg38aSvceZXh2ji2ogdyE4zHyHT35L4tCUYM1WGDUm4OM5igY8tIQ034F9GzeEGcKOkIPKFkuIZs2WVaCluMrJIEBOulWSAfgKQIBIkCNGkGg2Eqv5DGfkgw+7NHdScIsMMjzuaCwSvRSWdV+FMiqq+jGEim+NXLv57G78+On//19MyIM+g+jWwbaP25SgAS3WSChxKZIwLIQenjdKqJBtiOVUdGtmPcLu1baVe/W/P52tl4pOLeiM7Bs3m0NWjEzrnu2m1t/6CBypNLkhI9QsfjSgYmhnEeBXKAa9C3j4fR49Hfiyzvd3LnGtwv6d3XniERQRsXvsUz0pu+3gGEdpYhMOSI2D4BAax2fpNPrfi7QrwA3CR73gicJllBywHHj+HY5cnIOzGF7iG7Z2SnENSciCCElqGVDdo/lD3hMSfE9ORBRd6yUV8FCh4Q7yt9SQXlGgHvHEDIrXm7fFGE+e9tVbyBhcWf1FUBS7gy7QitPViC+zxkpGPz8UU9tl7d50TyhADhS748re1Le+NQ3mmPV7nf58d80G3WShe0a9fxFlULS6GdKfqyHlcYgBkVmrfZjqGhzccXJtpanYDAyxqRET6aB9A+efjY0aTNZ8d0bF+PAAgTYTL+RxXJ+3m6CqehNsrIDA/KDOE+9/Ve9IKdr1ikQTabks8BVEeMse1/XYVzlO6Z3szoBNgfKMdr2cABaVoOsMQBCs+AaVvDlduUMmqgbAUq3UuOX71Ctn26oJg1mOaarZ7KouKPli94W2ef3cBw6+mChXGsVKKeozIWHWKWQMjLDyTcwCj+A/bhaYG7AiRBejIyaqB8RXQhYbzLTZ5cFdkMuZFBNNmIvEInbz+8efX2+KQFqByotOkWASWVASp7Chir1ZJKtiizi7g54oBvlHz0OTCc0imWQbewlebTegWqBt0zQ2pE2j+WYzzdSGs/F9UVHnlzI6C3L7ajqOD8YTdGjQ/bAaq5U64ogI2vibfxhw1xHyZYR1SpP9hCuG6F2HSCdB9UO14nJZLi7RemfOa9jycvj3/8FL0Ln7g5aaCJ3AzOiOmBFHq2Xxj3p8Hl04UW12NnHEujtvGrg1ph+B1DSbSR3noethbZi54n65pDN9lZYSiRtvaNpdgty6KCotu3M2FVT54Zb5QF5qW6Am2mRnDdeAem8EcVJsFPSCxhPkmF/AnpdWX27+ZRD2nu3MfUvrY9b+GyWmV4n5l6sjmHHrGbDqN182G3CqRN5b3FqVwBN3B4K9RALVNyqRAi7wHeJU0ht+8RnYKL/e2bV3/zxGjh6COkTJFOoH8+/JYTjHdtAbMCKjTPP6H3bLdIHqu+m7nYLDHSxWWA83KfruvjvzmSdTZSFxCTPOvsnvAmIxVLk1ms2SQu1ttRtRea5LGKOd9u3EH8K552QP/bexhz9BQmWslUqmtfHcZQCOL4/tWmxbL5d/D2uX6Lzb17vv0M42PeUPLueZGKu4e0trhyPD3si6kOBO6xZqT90NOJlJEPu0QJUm4cJeRQp/bOyHdgO8H2mSDFLWS/+0gHPWlDRPXrSef65myrq96Lfs6OX56fnsBFF6d3v+S30IhlrxSyc/I9PlOMLh3s3ED7SLh5QHkkfzRXdnAHbE1dZnAEt0jZ7NYM23NiCwiw/zaFJmyU20eX105tdSAL8Ck29XpT26mBW7uPkgSiWPw97r4Z4xVZl8arURZmhBuVNsLWMGYCqnPFPftQXqY3FYWHmaBpVo3CmapumnUEu8Folti/bcIk9zH7QdaSOBHdjwM+SDG4UNC6lSB9OSh0xyVQrqhnhYaVKGhiQmu3jncvKXyBjEnuvqvw8aKpNwXfBSaHfcvb6S7qZ7PxLQ7nbmDRNDugKXwQdpZvuu9Kb09lr44kZlDTAOjAuM/mqFvfoYc7XWH4iHuLaZQRWXhxdngWvPelse2YN4bk4cbc/92mLl5P8VS/e953wGib3vHuB4XROc3WOPq4U1XulKSmRkij9D8PIx6q7FqZVmsglFKMHzfuvYO12XHH4IM78TNjVLXSOwHxWzCHHpjpEXrp8AWnZ0ileh33TPmeCii528DsvUPKXzL05100XSC7Vu2GOGXnRW/bd99OkO81NEURj8imm38DrkzLjsIF86FFgZXY5BmwaQyrm9jBfOwp2bm6e/J2BqCN48YtcWlDz45HmyzdeabwdOMMIgHHywJnKtYG3R3JawWackhJtCEB8+FEwPR5izw+9DC99REX6JOUbfyXW2eairExTffYqrRuY2sVv+Z2uRdnIJ/g1Wz2Hq0QiF1mb8W6UMehO3OAz27j2oveo+mREDbORBdenmivT4xKL0SRJ88i7M+ODbCDKLEqHE+ZB8jhRIHFXmQY9QOTDsB9iGrAymPI3PaY0wi7OhxGu+1ROtvVFaUoVGFKmWO5ogvWXK+dWriL9qNbhNeNS5KPoGQXSeXJ28j3qxp1KN5g29PQ1FiTaOfG/EJ4IuRa312sXbfr6Sqr2cZfWIBQMCvyHjDysgmzeNiwfKPuumULI1zGulhvMPBLJa1D+rAjZhsU1A+0M9FuW3ZnWpr79S6pqkgvUVWoYxX96VCdYZodDFuDJy/fHbfuRfJofnf4Z8/xlNFETp7tNmh8Ygq8JtLhcaDJSR+uM/apE3L48e3dUA9z/GVbBh8vn/QKvUWE3wnOmPT+MDm7HalWv4AN4MZpWe6+4OFukzMmngQV5UQ1s0uf/f39breeBqSC3305z03BV0zHOuP+hG4KyeB3DdFgN1lfml/UCxEVgMmqbhPn7erfsnQ5k+EgAK42KTRvcmVC3HGNOBfCJq+Hwn0KTl6ab1YoYU9Fp0ccs7g/2AH/32BvLchDMR/b586vvUZCN6wJ20lTLKe02QZJDFEtu8zgnFYbyieE4WRDEV/l493nLH/sdDDvvcW9e+U56Z8Qx/KAGgPF7a16F9zl29reYsDRYkXyusgv05t97p1xm49Mp2qVovOAwvrBVbsuKAtxm+EP36sn2glqWiw3KxVXkEISpHDTkNsNO0yaUrcW0JmOY4PHsL/KEHlg5KMEmO30czrdwPVC3uAi9hF63NEJy3FilzLkUQvxac8oTcI9rGH+eJsXzgKxDah3dKq6tfY7KchxWxhIAev34/UmFngH/2Tc0xGBYQWDbReAjIgMVY9SoHUHxooEB5LgkTtiaqytdAs2JBXMoBskdAVWI9xBHaK9/Dj5rTiNfQ1sKEc71N39CtpLETJSiLkamyqw9t3uQ190grbnnpOJjzWhxVrN546yICLLVMRhduHauiadLmEPSh57T9sX3b4EV4z9oS/gTbfbd6dLFPtL9+emKzEcxuoPiNbv5cdnPj1llmCrodBSAs0ROF1VxlpJzLsDPSRvW4w5u8GYvSEvOPm0z9SXGcN1NYQjHYhySqK8iekVuSyZ1rLImlr2uzpgHUxFF206Z7tEb3zKxI6BeDCdeR0dfvNNBFRxtuQYNhRUVsXzqEbRu2WaiFTv7b6c+LQc5L3oA4zRtYQmXiFLLvIC20DfEBoUajuAwAkC24qed6QX2ulaPi/VOhHkwXcjZxSttTkqNYwxbliB74YJJCJoGpOfvz8+e38aSlhhPp3vNfbDxAHLwXe8B7r1+MXLNy/Pfzo9EaToVnSqu0VXLfduaw0vEoahdBdOBPigP92fb27OhTb9EV0TDNCf7mUBRFFSdjsbDcdX6UVI0yW9TwMer/IxC7rnA7eR7wQEAXoX7hrqbl+5LXfntQcJ4dRL4Num2cQFrYyQOydbr1jfwTmeUK6Rgmzvmn66Mj1IS5+3Hvgg0N0Wh2ttX57AgXq6dU1l4gQxMyozij49ugviAD3d6QC1H5xOhLjuZ6Ob6ecMRa19ASeaYFyxtoWjyZoHZRpA9+B2bma89T2dsf5Du5bgExaf+Ye2M1bvNjRvDBfz0cnRwpzAbqtF9f9TLBT96Caf1sUbnFZjcP/4pXIvGkTj6y0d6yZwmhuo3lhDcgCx8PpOC4zPtptSNrsTf7m96bAn5170Gvgl5Xje1CoqLCZSBEuf8gA0THgiI4sg9yKU6WYMmsryDa+yJSZL9RMYe6aPulDIU8JOdBiMYJ5WIyspULUBaqa8CbEPe5iToo6OX7w/PfMq5wzmxwtAxIxA4ar0afbEZzSf+3GSKvbiuRvwRYdTtgQSXkhfFJbT2RgcWkmItCki54G+x81wboiHUsrqHPL1b51EXwUzQqicEA4KyhFgrAA4DxMZ1HzuuYQ6T4PsM6svw53uuIhf0KeT02c//wh98g8/0H7j9YPGb2wU34tecYRRjvSD7rtC1W+JgXz6+D3/ocbgoezRcv6vr4AUQ2sc9PFOXwEdFuVpiroZQG8eeKIC70/KcKfCMRLQHDDaFSDLAeChl7V0yPYAgvXf5xTabHRE614JP+5rclhWfszyzAls1hwnWoqiXK3yuyL4fM45bW1a+bVDMKCshGEM4YR7wOlQk2hokaOozTIgUAtDWYlmKkkG+7f7ZgPpE+nmPoo+iLTzhN7F6vL1A0wRIXw07gCQKCminEUemD9XIgOC445Nple9d9I9ntOwU6wWuFymycYXCmAP/ts3Z5HyWETRf/yP/+mZW7zzkEnDXQQFrNic+EJeXLzTOjTGOcS+9faaIOJuIspMziG91a3KxTFbf/P2fagHuBdmIoJjOLG6WwtOPEtwCBkorX/IxaMtYIQy/vNbjAU96reUbgQ7DZYnFwp3FlpL7xpdNwjMjpdI0VHt8IbJ8jq5wTRyfDwwoSzGkBWHQqVBIu1NoxVvJET/ym0PiXgfAkY6vHrD3hoKacp/LPcQb7vvo8s0pcp6ZwvZNweNC0r5/bMN6LxGATiibuwPo1CppreRrjDkFLF7Bbr20zMmNvZafAVnybunw1J2y2bMH3uCXI0a/t8ij3UYMnU/RvM6T8Ke8KQCSToPHbXwsfLs+n/A1hO439ha16iBSJa4O26s6+0e2y0cYcYvo0xY0OAlX8hEr2sMBNuy0N0IIcL4C2f6lbBDsQg0lEpgzvIdD+kfdpoAG2A4bkoqLbKtz4WDn7SOUTwv6hzlzpCGXy2AATc3wvF8z0ZDFd0TtXSnpJjZwPOjZJAj4sAF0gKZeksUjWyAXg2GHLFcDQVXY1ZiKHxKnB0gmuTz9RDLXvTCmdMhnDi05awNc15th3+dGlF7mOxvgQ1jvk5F+E+6DNmM9/Dbe9rxaitcaSDfboQurebDM4bfu2JTfLzYIcDUCFdrOiwoA5cHx2sUukeBAww2hM8YrIK8+HKisDnt+SK5woUAXsdHU+xJ7kUpoiUztb/GVOnkgQ27ne7ZZFJceQQBOiCJGRsu+j/GHPfNjzt3jRI4gx8t2+dZmaVz2GhAaLHISs0FpX1XqD/IhzlNd4s2GNZ8/ZERAn+6X1TAKw6sZ0TU86xip9B6uDYPHFfvp51j6V19USQ9fOBcwZFCeY4iXs3DYQfHj/qUKo6zJsgM1DLnRIsp5u4mDztlT6PVa1dmIrlGeQ1kBmpZzcx2sEV7ijAo0UEDhpH+oAMMynzQgGHkQ+iuvmyfVXvUdv/tnvgzIygYGIt6bIH71gL3rQmuZav9CxnJEE0L+18IAFjWDjcqEdzptaLCUCwxb6RytzonQoETxLEng7f5hOKHk1JEjvKH6PABLH4dRAhMqty3aKUoo64qhA+Xo/WB0GxLJNbA8Imjx4r9Aduyis8St1GMA5HgfUvgiHtqaIIdRdE/eeX3aAv0PpEM1uw+URsfw87tDEImYev9kv+S7+/vRyyaRpUaRfKFVy1qaR3O5B7hDWNAkd0ikQAVQ0YjgpzhsB+bfIiUZntFfVYrDs7R4ze9YK4NVVUfbFmV33SoqrCAqspvOlSdLT19Vi+7AWj2XL3sBqDZf/WyAwCZHM3AbBqrbcFosgcKhp6Pb82xfWv0c4ty+BzZgLW4khEj6QRoybIA7JBhdt/NCp0ckfMnSRq03u7ch9LlNPrlI9LLaTXFIzOhJAYsPzrLpovHaIxaXm7WcJTLbfrxvagPtAt2RdBmL0gNA6TAQCnTqroE9vSjNKj/hGgtgbc3mJk6uWjvsH3ctyPc3i+/fER/s7tPbEyDyPyO5k8KP7abmc570cdb41q7i/jfYaeqt8YVeBfxv7vU5H1zF/G/nzrV/B25JrH97g5uxR8iVTCguZNn9zUiDpO3yszrl7zHkfV5rQI3yo7Rmr0D3Wa+tJtWW3glY7KLg01OqTHYxlvo1Q0nU9QWCdcnodXx6apY/sriJxWxfprk2PEZywdkgFTpCs0eVDtkAKPcHDMZQ6ItUwdLNMJAggk+ghaBeFVT891SRHDoDKpgp3zidw+b98my1JfWgDDvWbWQzfoVwCiC8pGD2yW53oyVKtGOJ0ul+QDTvsmWQHSakgwhsZeKQ6IagishyYrwYsQCoEF1GaTSuWgNSaUwufVlpJKPAGLCqQMRpC5TDw2EN6mHvjFf70C7hIkWE6BNjThfOrdmrckO91oEKJ6njvyoZ4Dejax0B5GN9DvdGv1bOYLHamyPh4eDXe87AwhPHQPhv+8BhOeSgfDfgZxX8rlnQhYl9tc3mLU6D2tGY1lCkTGmNIWSaGoX7QILczy30InOJ3tEDi90hGXOWIoDLBSy7Ti0e9ayM8cGSKG+UfQB2if3egvDys4cjQ7nd+jo9A/KRnaiUm+F+u9fkXnvTfqZ85gCXvSP7U45cHVLOua7iXD1QnZIqAIu1iQaUWkNRXgTWvX73V4yFx6AXqchJ9ov3P/GBpUNRZMbEgLd13BMJihkaPK299UKHpuzdB8Fmkl5USnzpVyuMvA4QMdVqYqhVZEBCsz8vEwrjxdskHyTl2gdY0ueTt4z3/gLtsirMffcvsoVTSPRCebaLAqdiRHdaNi52T3ZgRoiC7tlY0+14+cPx2dvXr750cKabKPUhNZh4oLml76J2c3E0hwHgYyLKRnYzcyZgPYoOEqP4qn2XeFb+2SEzDDdzm/LBd/iFv2HZ4IPbqZWCp6cEcM5V5v52U9SMixiKhst8vLZAZ4MTT9hBHoVKUq2PqRkqxK7WunWDa3fjDthz7cIX20U19g9mV3h/p11qWEYZ8lqTHLCurCKFia25waRcYNnz2j8qGwdhyGKQhxBYTbpGZtTfOJJ2g5CSapMGGJAfd0XXAED8JYx7KHd3+lR9DInCyu6PhBJK22VsAAlS7Om9T+t0ciA9h41xKs0QTdkbP4A9gXy6hO0rpE55srsYlFjTIQbebfKvaFBNXB9QImKCH+UkKl7UVYj1ilXpFumy8C+lZRVIcVzk1p8VXhETtZX6XEpMpNxeQ6hgTPrRtKA6dfGiWSDKVIJPgSVpfC0//M7SsSsDtIR+pFVNRs0HfCmIn9umHreEKTDDyUx7GFmJd/KoyWKXDrpZ0EWWum+KsqtGdvDT57Jv9olErYkQiz7xdR9s07qxTKbuK+r35ZZnT51X2MMHfedISyWlRe4qRqNu3sOm65GrLs1ksDT63BdqaQnG7NFsZyxrt34qRsui6JuRh1snAkqhgGI+2I2Ru/g377ZH862l8A1sixEjufBAPZ5VSyvUvO+7bAo8gcZmdW43Q0xQS9bwX6mvwTX7qAeL/V2vxHwPsM40avaP5rtI1KjMvAxXIBVMk9jlFvml/31UWT2qst4WrIcf8hyODDVEV9/yWwf7ZuGlHqF8qORXJT8aELCqfWIjnjVFh2ggI25ADTeXw+jw+LPf/7zFwkEGy9HYmpWGQWhi4tLsghtNiK88fHjjosiarK22bM45aou0/Q+i0MwilwQq5t8OiQQQ+wUsJjzIjCvrUppPeEE6rD453/+5xYdKbRKJb9UnE+8FbvNKANBdnpiqze8dMuUUBAStG1JqNi7ufGZkeFITvcwEjM3llMYXHSyP1R79eGWP6vgZAKejBFrNDZAtP8D0VAdNsIaUOtao43Gd0RwJcVfQ/TkXwQ8xVhkDdcBevxUlP4BzZVb3NxDp6Ix8IeYs+4kR4DU6B1LmpoIPQo9I4j9Ay9pjwZMghwxs2Qbghm6OggGTF04uZmgteyRyihksHiScqNXVohiq4YULHhqUBAyXx1YV9VQVrFjL7kh1ApccwFUsgrry2xCNxhuNvNya25HTQKMpFn0O/2uP9Bvof5P6RLICZUwQkfrt8dh/9qD7bNmy0uRlzmSt6mdH/NxxcF+Zhk6NhSuWeMeOmORYS4ax5Pyl9x4ATEzlYkAr9JSefN+T90j4UI03QCXvMr+PXVAqnhGdN8PBQYjly/0SrrYYGyiSXpTANlJsG9kirRqAaTVaPuBT8XgJR+WhfMWt9MhIq0avQk5hB5EPVowP6F9QEIKuXpNCIMAXtqOBbyDbKgdvfPDRtVWRbF5BXa7d6e2Qn7kbAYhVWhIEdjDuE/Jcdm/iTZwypumcYYt5poyM4pWwyRU8JqH0420OHMWQPfnOcxzXwD07wEoNCqL63ie0CEyqp8V1/4aG5wbrAd/AS8bELXCx5Fw0WyRCp+fvjp9/l4f4iFNIqHCF2dvX4uMAdGHn07PTs1ME/0ng+j4zYmuGL08pzP45udXr+iLgmN82EXATCr6MQ2D3EHJRTI4Usyf6bug6TtOVct38i2YptHzdzf1AlaQpLgcsQxRBw5EmBNYnGsA1ttcEvBDuZTa7ZdorVUCV1qxTnMRM+3H5yQ18XPvMkUzujET8SDo6gGrqcl5P51ZEhHzwQsU5meIk+AtcDEdidyAXyYN/zLn9jAZbInWk5l73Ik0YM8mebsJJ/hdvCXEXvv4qUncSomIzzbXoP6uA8RfK0eAUMuPPXWG2uwAuKg8VC0lhaBvJmmRebuNwNbsWfO1S5bMBnA3zbd1wCHC5+stRvVbOwJw55pZEDFUDCZ8awtyKb8dR09aC+5Fz4A03U/nsMA1kLRwOtMoXa1rTGpOTvuwZHAS1+Q8m5DfXxEwFZFPJ3tlAX2MAxWX3rYqMtwzVaQ5cZgf+tIxSLDQaibopyp0WDMhYgJMuALa+yrtmON0Dp256csBweZlr7hSc0s7RF5vd52wR/A2J0+cVQHLAr2gZdu9yyN0p4BV3ilAfPduSlppRU3sUIXOItXtsD8e0Hq8Oyg/h4PPve0H0FZAnN1bcYjvJLFnYX6fFUPj1V70cg6E4f6EvCoVL4KCKkVDCnoeo4nm5G+JpCNnB6mTpccTb8+6mJbJBZe+LgvUYwm+SRNLrMmMOCPbzOP3uBfBLBUCZVFlmFckAKCrGJ8IkY4CdxT9hcSeeKx+OPiLnI4fDnzhLd5zuFsMsCHivDPfxUwBj5iZbOSdhE7JHJ1wC+k1gfOpm8VwjAQF7/cEUfcm8fVtyKAVawI1NcvIVxVYNOuGKvGGUtxui/xGT8s53CQ1zKQMJ0UoVE68iQqVP3r6G0aKQroE3u54G6quk7LIGIhz1ZZG57/8+lTt2Leofg2dJIS01WXOErDqwWxHMM0t4hVxuc+XxVHGp2ssZXw0ulGKK+vo2rSmGn6I5jSfLe4+QW9/83mAyWjXGLqPSYQ7+CA4MVFfeKZjjEpAcQ8zUfe4htwPPpYfT6i7M0kUIIn/ccgd7Z5sz/b5n/feFA3ZxoGc7SwVYSZEr53Jbwvm3aMLADnRBVm/4oQIbe0iwTCEdLnMxJV3k9by9rI0a7Du8zk6EAf5LL+0xrHc14sxm3QUvvg5bINJ58GheQ3qTcn6QHD/vuvwLIU7RpDyT0n7i9rweoEuMgtUikD/MDZ8EUE3aR7enpvigVUTKIxBc43hGxDddIA4JXoYyYD+0wD+zBxto5QntTCWZg9aEWyYZEVyWPTwL1FLciucslG1TNN1/3D0NIzfLEGD91SqTn+NKC4ap8NG30Y14hOSFf0byZWj/kSziIMRAhX4TluvYPq7Em0r6fQI5f7uZA5PzZZT8eUTJZ8d7gaY02d88iqKh8Tda78IEJuoKcJbQYxt253wVbyawvftHyDOmkmM2CQp5Jy0ofE+Tbw9txhmhnAdcrJRgbEzI7IiTFZVxLZP5PPNRCwivuQiyfJBNySOz150jHyJ4K8/HL86OP/pNVlsJzkZTKH1AQYn8LCmPiQ2QlwbV5v5PPus3vFPjFu3f50sex7tyX1AVYsVgnLuJeAFXfvEHqrzpJ5xKNijizTHvCDLG8koGYowB6RQ/YhcGGy/A+tNuAGNnOuiiPqnn9fLooQvvRMk/MWB6EVpPR24mrQznm2KmEoBFkVXkUwhFRsxbVmt2DpiNoX2bk3uoM7J2Iv+InoJTCL28+AvUtEEL0Z2B8xLegdlCFQLn5SmCipYFLeqqxzy2wxsraV4KaToOnahBdm6jJDb3tfF0x0ZGn3xiU1jKW2buMcdxO6I+Z5mQ35kDOTemoUeWqznimIFsy7PXWNDd9+zSsjmqB59ZRHTsSjO4qYpC+xuckTbXIkFtl8yq+qLYyMticH/D1BLAwQUAAAACAAal4hcAAAAAAIAAAAAAAAAFwAAAGd1aS9zY3JpcHRzL19faW5pdF9fLnB5AwBQSwMEFAAAAAgAGpeIXCTIrb0KRgAAMAsBABoAAABndWkvc2NyaXB0cy9kcm1fa2V5ZGl2ZS5wed19W3MbSZbeu35FDrSzBEYEQPAqsYezZovUSNO6hcju3l1KRheAAllNAIWpKvDSXE3Mw66fHN6wdyLWsV7H+Ml+scMPflk/+5/MH/D8BJ/vZGZVZlZWAZK6Z3dc0U0BqMyTt5Mnzz3v/6i7SJPuIJp1w9mVmN9mF/Fs616j0bj3dTQKr6JZKJ5vieObLAmGWRTPxOPnz8RpHE9EW3w5i67CJA0m4tWJOB5FeH/vyzRMxeFslMTRSJwcfSHC6WISZHEiRlESDrPJrWjOYnEUDy/DRCThLxf086jVuXeymM/jJEvF82i2uFkX02D46mRdBLOR+DqajeLrtMP9uhdNUU7MCeo4TqbrIl0M5kk8DNOUPt/Sn5j+z6JpuM7wwzSj75PvpgG9vlhk0QS/E+TkfB4kKX36LpqPowl9yIJEfbhIwmAUzc51azfTSSfMkjDsHE/CaTjLTumzCFJxfHrv3slfnJwev+g/e3H482NxIBrUiSyctqNpcB6mnwVyMtqbjz47j+PzSdgP5lH62c3D3f7uduPe4VdH/ZeHL44FHqp8rea9H1yNaLT3hpMgTYVejRcBgU4OF1k8xaTu30OtUTgW/X40i7J+v5mGkzFNwSLr04TTiC+jeV+vQUuWx4NinTjtZ7fzUP10kM9pR46g2bKLX8TTEFB18TjtzIPsohPezGmQizRMmo1fNZxKqid5G+q7XcjqJRWyvt/Ly94Xh5MJY9UDcR0nlwKrlYoJ4aG4CJPQATq6lC0XPf02jmZNayzrxYy3qYLbe7TCQFaFgQoExOjyq5N2Og+H0TgaCtpoQXIrwpssnKW0XdK8HP2E1ae5DBsiGtvrc0Bv1CZoiHCShoI2gq45CGRN+vcDa2a0j9M+9ck7OjV9NLjhdDTB2Lh8g36gZaFdhU9U2RytrjgNZoT75anPW1wX40ZR7o76/t6desL/lcAU5bxgNBatME5dtAGw+ssdrUy5b6OByJ96oHpP5bNHPR4NNFQDT74Ib4+AyFdEie3W8EslEmoMpaZQzuhpHS4UhMBuRZ4A/jHpblBLJ8MkmmeMC7IG422rAuhleDvCyFYHqmo4UIG/n9hx4Gve6U/tsAKmSpf2ASFmfxZMQ4UkmtA7hQaRiUkNdSwUv92nk/BWDEJB6zY7T4JROKKNywUbgrZ+spjhrHO2INPvPp9ABNU8oOyCdOKdh1nR/CQeBpOLOM32d+hpyBHdF7/7za/pP/E0nMzpxFdf/xj/u5cfmDRvfSJs6rykT/TnIhxeHpwmC+IAhsE8WyThwZNgAhaBFv3gZTwLjRN0nkSzrDlu/P63v/lrcbcm1iSSEKQWtl6URrM0C2bDsMnAJ1GatSQJpu8mRUnCdDEBDS8YmQ71TlZT/ejTsTlfZAfqK3EoREBUV9E3+t/a+DwUZp4k9E4SUr3ZMB6F4kcHYsPeRnoov/vP/1Y8jqdT1BsHdLaO9sWd01vdgOyIDaeApVpNs1GYJGf7Oxsb75zNdpvS7o6yZs+cCPRR9dheKSKZaqUIYdPapcJuoNlylytLbu3OqtacSS+N50wTfNrpbRAnY9+8Iz6E+1OqtcKy6X6qf20YBtG7GYbzzOzmqaxwfDMH67xsULSe80mYhaPX8oemnMACHw56NKZshK40GvyRlow+KnL2rwiJs2g4DYlijgp2Mx0mi0Ff0Zlvg6ugSSi4Lr6V554x78SzvwmnMVHTYHYrFGv8C6oAvBVXxIETt010bBgvJiNB5ZKEeCn6LRTgvIPBJBS/OPqiUxBXGgj9OEW9KCV8C4kkZ2nRYlv84vCrw/7TV8RUd8Uv3hzLj3PanRmx9CCagH6dxPSFQAtIMZBdCgCPnx+enLw+PH1KC5kkt6iFYyAV4ySeikANgyvzLp/QIW9D6HMfXr0+ffbq5Qm6ga+nr149N387+sIulhIpHtwa0I21Ve2A/Dap+0RGgoS43ngWE2KNBCZBXF/Qn2LwNDtqPkfhrGV0jkdGk5ZExD0vZrTgNP3TKZ2fvDCqKUztOLqhIs3H+2/f0rTT8TMVT8Bzv32LkibOeoocDyfRnDp6OIrnWbQgUY2lzUk06H57Rd/CbNhpydUP5vMwSAxwg5CYppCkhaRAA3BwpujQMHjZ+6LXEQrRCKkiVFCYNQmDyxzxaMWG8WwcndMo6RgdXkSEdWqvhAU7To0DDBUSzYZGIRz2OWY0ypue+2StKGqUVp5/dJa+CppVpmXvddo/nXk8b1I/1wVTO5Od3OyIp0EyagOnrFks8KOpd1tq7E0a9mQRGvRndnXWyOs03tE5pTa52dpWR5wQOs3F5YzYFGubM7LlqISjhb7MQ/rXXdziaFU/+nj2b3POWsoeuo5Bivp5awfCJuj3tS5B4zv4ncwSxPAkDcJmG5kxFGeRPKVcjF9e40U0TOI0HkOaMrqZ/yxe0VTZlMAL5y8Xk8Xy1j4PJ5MTbqyy5FGQBW9fJcFwEvKg32JGMf1OnftSUdNlPU39dDbMbe+AUe/AdlaWeB4NEhKbu+gO//kqSrJFMHkR0PadhalRwZTT5gXq0Jdia0eTLATJPEAZiVQ2N8S7f469jy1G53yzIXc8UZxWJ51PiG2hqiWeaM7YPYszbKfmnLifIMnS6yi7aEqMbEnI/BngfThrQ+XtAo7N2hLGIgRXULSNFtSpIaRyz0zwDuYBYPNagB7wND3I58RlxSCKGmc+bT36hRkxgxbhHOeZpg8RHaqdYTy/bTrtH748evPq2VH/hAjfm1evTrkvpqjsL65oDp5VikPGyslUrcKmo9RyWFRo2loGMTucXAe3KR2fMRQdJVZEpLHBAoDEDYMZVp1OlDAZ0zx2cmCKWi3REXxrKZ4Ik3ThKKUCzTJTJRGcYCzjw2oXlDC7fxWF1/1hiJ4rBluytn1wqv046UejOib6vvgSAo3iwMHYEjYpjlbO08WCmKdFFGiVJeHqdE7CbJjO1ojboZ1/KdmxixinwGJEjXfKA9VCwFkjvSAihmUzgOIr4OLf7ogomKIo2XTeXUSdm+mk8c5/wvJj9r9gzLd37L1IUPqArTHR0yXagrVdsFpqdSTb7ZIRoFLeFk1YA3WFRLD8RVnwUisMRsAm7nEM4fL4tAPmNaVTenbe1GDsEYI6zSAiUkOo1omAFg385DIfjA1QWmJjokAnyAj0QJJLvFHkckGcXdJsebqbEm75KtMb4gyGYVvuzka5Lk1SCUt1Q+g7d4zGUirEA+OGy6PBM1tMwTTQDh4Tn0A8cDNpvB09oG6UejmIiXFOZQfLPVS9nISzJmC2oHzb9rdprF2zCdkZFc5IXqadlH/dfNdqiW5XbNZgsXoKGD0bxpaGURIuj/kfOrcdtUCQpi4BYfSytUJacUmc5mL+x6QbKighd12r/dzzTWo0Gm9nv//tf/ov//ef/laIr8IkGrNUqMeuOBJxLI9AWIg6nY6BukTRp8FlSDQ5dfW24U2UEn5KdYZ1DGDPF0YWKpXaOsiWT43T+P1v/+6/isdJGLC0q06xkXgtNaRXqqdhVU/x5PQNGrIzqasJhws+AqEHmTa0unndVlG/W73/arZrxvBMyqEsfUezGY1BT3dzq7PR2WhJGQ7Qlg7BURTng5hHfGgokddQ5x4ccBuNd3X6Z9Xb3/3j3+RdI6E7mMB6eJuL7Ex2cMZxT7ViJd8/zEI0tSmUFQCFBYVWjEVxZUUgSvL9Yz8xdSmUVcw+OMhPMvYxv5Xd7O3xAK+CaAJc6GheCdxryKoch1caEJWcGIwlzQnUO4r36RKfAjYB1bTVNJ801q6kYhaSlCoWKf3SZG63oElKcdOeRimxAcMLKp4uSOwDy21OYlcURqJWx1QbfFtnI6xi0JhfXyqaLqfUDQBa2eKHwrbF6FDhGSwDk5gtA7whIFfDSEp9+TMfV6m2oh6Gl6+Euf+K6EafBtUscZN45IFwzyWTvHMZV7D7xzglxe9+/Zu8k7ybTQwhlGpqeVmchtMFwWktIZ75ylTQTppG2sZY1bvGUZBc03LsiwaJqtjgLLfi+4Q/rBtWMRhy5cf3fMpXLKG5VOsaTtF6kBAqCmnOgYk//30e9RfJpKSVGDcusmye7ne7VKITqLnozMKse7XVpUM4zNKutLl2e3vdizhL53HWcGD8WZwe3MmBv/9TdOHgDn/f/ylbgbivB8Bjj4QYzcaxkD3WHhM8fNXhgiXu7bQ636bxrNkiBuWsIc3ZDfo0D4aX1ErjXQ5zNOGxAibAn2GWLo33MN2zdUy/xxd6b81ilREuX38NpRgL731rFLIn0GzTdpk6TH5vk46RIBWJo0fvJEGUhn2iuX0owBepw8JmMVGpdcLqmRxB1kw6F7QbiSJJ/nAYk0w1y9rUv3MoT8RGq0V/LCDc13hOTKIaLDwJBg3u0LjMLYI9H5I8dclsLDPnfdVMk3/vp9F34UFvY3Nb/ETgHw/TzoA61wnVlpX8zCsP7MEBc7A1xcCJYyaqWVttW3oLF5C7Ka0gg0b/NsCNqomkb633P27AmjViO8R4skgvnG0tYRk0kISrJZQb9KtPxUxNITsBdZIp/Hma9G5dROezmA7AMEniJC3RkoL4UGGLwdHo16FeS0VPo/MdcRTOvPM6Ky+jzl9Gcyjj9JLzYn/nWe3vxkSo2e8KcojVcpkR4RaU+1LHxCgGn3nAZy74daUFOmhAMLRPmtOLMN+PwLiATmmBZcziOWH4VTgh5JzAjtAMO+cdHKvt3h7xTzcPbo2JXwwwi7RiZyNGZmaMaH5hG4WiA4Msqz9s1w90dNRqFYQkTYYl/xAUUq2dmZbH+9KtLNfP8gF0EUAtLXg2xGO5n9Lu05ho0yS4DRNzwUuHtD5drPmlRvrQNZVwMxnChKCawMmDVsrGVXv8GppnM8ux6wIVGJ6zJXVYrqrAfiK7WTrzS9vG2iIJm15yrHO5AnDI6rDPGbyO61VTwXQUfKr1XmqrvAbH1zD1MVM5XCQJzbW28BAHSeyIY/RpaYugyZYU3Btr2AZsOHQMmI6dSVowM6IVYIeH4SicDUOL26xS2RW6U2PebSHBdKn8oxC0jWWDDkb5kPWl6xadx66gQZtqGsyZY7PZMWyTZTzce5fzO1Dw+Cxewq6VPQNcPqi073KGbTTpSKfOzjCedpVOuZuE8ziNsji5NT5utrdYC2jwHjY34LDXPrVd0lHnvV2WxjZeTCY8eWqeNB+7LqdMzlycMrs7cSbvTE7aOwvmfSKFtEuHGcuflguglruUNS9SGtyL6PyCpoym7iqy7Ol4BvSmT2+oj+1e+Y1ki0u6SzaXXJ47+kjQmix8rVhOD1lUqgeqKXkxab6S1pvCJmP7NX7mA4QHM07zFJZe0mj6IbqNdqAvpMO/29Wj706Db+PEo7yUkyCdZACgA/UkH3sKIGRe6j0mQ4p+G74BAsxPD/J5/cC+Y2L1gU6TixHIuVU/Vk0GXMP6MY5wVbAYOF6149QzYtVjXdccHxBI/c7zgDNVYXM1S0nIIie+1IehcnbpUpGKjqjOKBhGX6rbw2PgL/1dXtQn5/me1SlJYymsB2pUPJO1pUsch+5zpVlBF/gY1fF98YRoyID2675DSHqbnQ3RHCxwHvd6G3u7exsPW6wuYD+CNs0IPNhgnyp56WideYUo/YHzOW4MpeMbeseda2thuq171pcyOHP4hhRt8ieYDLaTTiLqNDEX7jGnf1/BKqiLVihCTEiVihBdCEeDNd6GDkug9tqqFB0JnqPu7ezho62tQTDq7faC8XZv7+Gg13u4M+oFW3vjAf0QBjubu4+GcBf1VB7t7I53eg/3tvcebe9Q2cF4ozce7D0Mxruj8XDQ2+oFu9sPe6G38ub21tbW+GGwuzXYfbi5EwZoprc9frg13Hy4+WiwsbE96o1Dp3JrvXqoQTJtjwaZMWQMcOfReKu3t/tod7y7F463RnvjrY1gh/7b2d0I9x5ubQ+2tx5tbLmeCSZg+KFF4bUDePvhVm/waHvj0e72bvCo9zDc2tjZo8kcbA8fDR/1trZ3Rw+DwagKsMTg7MqAKidmd6O38XCHIA9He3vjjcHO9nj8cHd7Y/fRzt7Go0fhINx7NNwe7bqAJcD2ubXo5ozTSu8GmwPq7sbeuNcb7GFqNjfC8aPReLwdhDvD7b3Roz3XF6YB2/ekrfvNspQ9FVRpZ7y309t99DDY2xvs7m6Oe5s726PRIAxHNLm98NEeYYoJuODq2DAZIKJH8T84tDRu4+Sapk3XkEDbyt1g9pax9UZ4/CYLfPYch4XyBgWgualU3PAQtM5FM3A52ZDGJzV1IB7LDVAnYcbGHRIDDMHAVppKYcNU7Vsifa8jjpRK1iHKNAvTKE0R/VQ/MU60R40l58hQ/pqSjNVw2YYjD1E5EL8Q0fI0OYb3/Jdvnu+LOyri+i5/sC4ZD1H8vg+h6gJlpCLongWnrJys1kzuehWTeJYqJ/GwXk1+XFk/WQJiWBYOPGxosQX0BNUrMPF8b0pMBrZckekMY7lKE89ytSae+RASmlRp5g34FJv1UCwFKcFcqgYtajnodV9HajJfzc540n1JKeeUmkLp7xD1WezejgPpFbFktKqpUFpCBJ0wXneJcobXpXcW7ndtaCuoaYeTzFHTqnVwaA70Th49WLVuCo9X/2qgbNL4EC2sM1FPSPiQBszFwJxnVivyJKvQV2I6S5ZJaQ61IOLtedJXthEjSm7lCL+iis0XpclQsZ1eQRsO4bcejWx5UoaEXtEIyOVTvDIcr9OOrdfMobQYXZ2F9u4Zq7G8fh6KZUxduf0KMlJMSg7PW25AJPrSRU5dmcRIvwhpR9ZAP8hWUaBMCQv0bgp543VyVTSdY86KuGcaj8MIqLFejqCT+bgAz+qTU0OjL5jtJhpp1R6h5a3MdZbtZS50z/Nea6rlECqLVZGEQmWt6UCpu9Y2+1Fl8CQebJ+xs3WsCUf/tMt6BSJS+eHFNB5VVqTDABbEeG9nx3cWsI7d4eR8qvZaL5ZK5ix3aiE5J4XPUMONNnidhG0pAOeceUm9XxaPW04UwTMde2KFza7naQTWteMtW7WLBm7TaHruE6ptpLDx3grUZ0/gPFYf34xwfe3nFAwiQ/LXnxS7DMNWoUSt4ZmD0cBBAgWhgzgY6LKcqOGVvKrMSOcl4PNI56WA83mth1iKOjXWtZAn/FGHrq8X4148nRNBldRvbV0HVyo4JQKoMJg+NU8RFIaQWTbEpHAeIj6YmLQFkTS4U42JfnHYbMsBUhWHWdqtZ47gg5juNpQAfSipD+5MLHvfQJCg6nfZJSiaITywcft21iDOcXOjXKKIGPQcw1aQob8QokOV3Um577eqQg3x3C88umBDMz3RuBV4ayE0lNpNOQIN2u7BpMxNgHRw+FQRCgqf8AfCCg1V4RQoXJLgi4Vlie6s6Ms7cYcanrDUVaJdC7h8LBtDlDGvdPJy9Owt/KjYp38WMts8CzkHiiul4vGFs9YSWhvJyy6DDn2VHqcCeQfgfzeEC+ckJ8YiGGeSjchDETtG5VczHfaEfCpZdBUli1QguugaKzhmgXSG1Cy/XAQJSsywuKMBfNOI0E7pzCeGYHJrwFQtZuhOIf3AwX3BpDAQKXwjMo0skieOZ9RIukjGwRB5OwioIXd8EMGcZytoUCupqIIgmzCASMZUwvarFt7OgDNYh8K9jQYW3sxD5twAhkiW7rUHRfN2y1h5XxzlkoLq24D2TL4SaX7SQEUeTKYxUbJhmECeo4k9/MpYwDLKZ1rOViPWjIpvuOaQ8dGaSC1O+rsYDDR/UAPwiYQwLFhco3tn+72Ndz4eVwu9/t8Bl6k/u+A6cwO8lM61nh2QzxpNbWWzAO/ZE2on6D0gmjrC8CgchwitXRcvggmaGdzSCaSiXqunp675p/E1RO1xdLNfP729DscNShJWDJhOtUzSMEHzxGjWNVAGYlg9XMGnJFUMu0Ro4usaTHdqEoP4iroyot1SoM9wsoBJB+eFhpQfm8v6kSHWeRTC2qfyHLTpsJaI5AFQJsZ4zA2nQ5I4kppRm3eZLaYxbyqPCUXgDKro6ah/41wH0uw4hJM+J1nwd9pefaMn4G8ugqtQd4WQIkdASPJKLWO3/sPhnEK5+mOTVwkahuCctuQS+iDRhYYrz7l8cFo+cec1iaf13aMntwzCXy2e09Gj2H22EKbZYhTF3YQwKiDBpFt7dji9FTJQs9CGVa6oV0q/L7Y7MmAjRJYYg2HGYiKXSMYowyameJHShMBkmkkrvhhFYwQd0ll7+Pmz4jhF+hmvE9rKkZCAQDSx5ByvIYPvvbNS3bzvUHkHwnB8/kEQ0AfoJDhKX8HLAUozK5UlQczlFznTRCB1cTQTsBvHyaiIvuA9zRaIr47WUlE0YPlo4Sl5BOExnHXlqJZpuTUHXFEED0LEqJTllUIj67CzdpUPhn6UAVwC4KDkxgHNXK911nvXgcPQ3NnY9SZ7PJbZ3mijiPqScOREYhFoZYv18Ch5FA6pzDeW3nEWhjSPEu05DrDE++WV48Ru9EcHhThu8Y8FSHtw9M4CILerH2K1FMKSKnYo0CsPOmnemZDei9/9m/+gj0X62kKulaGOxqLKZTOX/2yyGn1sABBrzpZZK4NcXZb1K0XtBGyIlmqTID2I05D3Js+wJhgVqSvas1xpojpaVfBSFzQVCFWF20i0Nwxl7NZNOKlsvk17EOVKrz2RwEoMn8VvfXE7f2AR/IPFWKlefpKzAsP8KNl/O7vzpGJapj/2NgHtoA/5NBezio6xDowWgeXeL4fJHev0kP/srq3fh08s/QloWVgnWvKFXT1zn6LPZw1WvXL8IoLiOWXC/SL3Knw0U/H109d/3n16+OcvuqePfy5U8Hw0BIdlrJyvceVuu6zpy6sptVw+BBrgubp4q86Bcn9rUMfT0MXVWIcK8Wwi9yiiFvpzOkc5EW1/OvCEMr6RoAKhK4i8goDZWTRffK4yEo2jTIYz5sGOxGillyKdB45XN3CYwIAB+2hWy7StFPAqDSolBmWchCENGQRf2j3QV5oWIqQGvFYH5WCcbpr2deNgr2MQ1DrAmclgXbW4m+NaOGPCC+PnRZCMxObG9p548TnJ4hGrd2mq2/mstzHrpq7KTCqTypTA8HIhqra3tbdJcIrC0+BGDplbWG4XBQCjpTch4QCJUDs9gGWOjdqEj0QSx9OiGcYLaeanFpt6ptuouI4/rXXVFTs0SJX7Kc9xBTH8B+nO8woaijtV4z33BusE8TOfVoh8xNQtzs8JE5kXvUPPuLTG5tVIMH08IuzY97VIrEt5a+wXTVlpC2WqOXpj7MRJsJgNL/LcvX0wHzpzH3av5fH/oSHxtpljEp8vy4iqy3aorNF1+taHLwCqg6EvwZXeXBUq1PPxjXTY6RLHPs7SC3jVEJ8qrfyE9LPzVIwQxnouQGibWs9kApStge4MQtZNQcgD+5qKC0Lf5CpKadH1DiD0R3pnmnNO1oYRwpHHgIc0LI32+Xwh4jEtMSta47zT3A8CIrMFsbM+9dLRERtbj/gx39DQbgrrtcJAPkaIk+Yo7XBkhHnf5/3EkpiS2I/evKCz57nApiP+Db1hqYex3Og529mLhNeAYSbUidJ+rrajHa6OBIhZ/Im7w5/O+C+Jd6PwpqnLIR9G7x3TBjSWQ0XrB6LJP2LzNs1mALKStJQYKeWC4Zk+o+xwCocqm/cu2fAcD8u2FIxFHU/daANdUKqxs7Oz7TpptmdxWwaG4ATCtwBKD/1lEMdZO5hFU/1DOgvm6UXspgvj1eKu0L+lDliknRNKysxCnYpTumUww5xQEytVHK74RlRlwA7/DTpDpQKBaQmWSi67nPUZiZfFohr07hCFwiRQ1MwA+l6In7/+kn6jobz3ULdCfHrNpIKTsvoYep1DU9OWPJOm/sF0FOf0pX0VoyN5QNU7H9OymIlv8nNAYnKbIXwj0X0AEsEbUibpZ2YFyspkwd9TaVrJYeJYvpa2O84FEn0nKZGd2UGeSkOZi6EgJRbr40mq+kE2VAvd9W6WY/MlbPJJW76Uqj476gcKYcraebDUfjmJr638RivxUCCQwwDaZpoclawXdHASykjEWZxMg4mQh6kIMpKK5yqIkYisQWVPFkPM8b7w4odqLhUbMjUoAhhzZIsTe8ENqEe5RnGU8B0PAnEThGS5qnFyu8/ihEhhK27wwUB7/fD46RFLGPjdANgosnoAY4kvpRYbhGO0bqkcspoZFnbZRP+ZGEPZjrARHBaX4S21MjIOvZ+/enXEVFu33lBw1432bA+HslxNtHwD6iVk7GOXVLXwOL74O1pp+RbRXIYn0si5TwunBmfOs3tOvwbKnCBnGCvupe5oEaUXovH49Ze5IUIf/l+dtm8arOI2ZxQlU31nBrEGsMJ9/uzVSZcmb8q7Gw6IEdaMOzRqFN0Yzhd9etu/4szfB4IzJ+dvBxEddCFTkVH5bWnL9+dU+ibMHbXh3NafY4icFq1ZUm5A0acqeXyb4dnM2SpfxtkTmFePEa7cbBiTllteXYtuugrhUU2D3LyMXycxaDMfeCrztU+h1Gj+PMzaj6PpM5XTG9Rwa7OvcioTrvyV8MRnNU5CRFC2Xw2+BfvUfsKuJz1v0a8sWvxELeKxXIb1r168iGeIW3pBSHucXx/Rqmj3cTyjbZudxu1fpPHsU0hpb6NWVSVvR0FKECjD+/hgF0BmkQP5ogMLTtqcp4qW2qAsnDwQxItMmqgtvdUrxk/rxtjpuK5bGFyGVTfTHogrRLo5PIfyEnhafc5yktBcsRDPZC5rqf80pTjTsl3w0rkqTCWNSplGiOYzBOGwtvzwxVH7K9Gkf1qgMThlzCO8nFIjX7CxuRI6n6k5oV6XFvoEzd5fwPYHynTy5evXr96cnjhDX2cyJb1Gjp6dHH7+/PgIRJYJ15fHT565emyffdJnmxRNngE4oyhyp8G2XLugZbJ8E0ohhI2Wrx9LuwBsl0WXhGgeEYfZFU828ae3AX8PsMqu/1gBeLMjvcLXeEGEjXDiNBxezGJiC2/h2IZ+07+0ZmsnX70QwO+1SsBCKGmEJ5GGfvyS57CyAvIyw078p4S+VAPyvRYJryOcrogyl9wGMXt4DVSRyMjXcUhr7QetyimzGpM0FjL4SKzpJp8Wku1rZV5dw5ppzKochop3SrmHJ9IBFB9f8YYkTmkcBhm7pOHXF8gcrtvUbypho4bklur7ye19wf+8CTFvlrJFnWvF3qncJkQY8m2Co57r6bO+ijWX6N2V+7rkPbKESqj0tIoI8OLqdj5sv8npTqvXqS3eOOiDg8GwUNMWY+1qzrlgXF0eVQ3Qx/H8lplEzZzxtU8yFz+N7II9IjgXNPhcmj3azsRJzLBJUskhI6L8tlY9dl88Zo58FNL2nwIWOPJzRMifh7MwiYaWTLWUJP1LpjsSn1o21ZHHxQ9Fe9Ylrcm1aOy/8+nE5lDSGT5Ga/fvHy9xcSfA0Gv4pT65S/bfQs68W+p/Kx0FrCuuXCcVjlIFvuZ63SqLlXVxm5cEEmv0t/9DBrFS2TmUpPkouI2OeB7Hl/gdMhhhyMws8ymmbuMmF2lETo2UzBWccA3za/p4WJO8xKeZ5qpwwJeBzCoTBvSP+JJney7ePCcp0fq5IprJuNTpwHQNQcI+bw3jGqO/F4dZRnRUWpFzd5l8OZVXgwTvsyHL5WDh2LPy9OllXFpQKcl9JpRBFK+oceceKnfFfZknxxwg/Q+/FifAIjPSOG+qCesOHR2pyi9ZQt8Vr0qr09+5t4D1h5MwmC3miNSdhMUGMrabjbcmmvKGaLOdKlmOq6WmLStMLqBXmmg6jlXakIGKAJ5Jf6ySefRxf8yopCC4r9JuKwYzFIv5iBMQA6dUm21op4k3IEH68OhzPnKHrMawG8wRuWFVdK8l+xwHCx2RSTQK6F+difef3dxfbf1PL+LrvmlwynPvRxMEfhv5QtjIRbOA3OOqVMOs2dB3vxi4jEqekEr62R+j/3bWbrcLfhHVm5MgzZiApC1Bb50tWDjDAWiFIxzXpt6PO/DsUPSwkoTy+7M2pmD/XZWrCwrp4GjvmcsDwdDlLNDXt/kNlRVXWZUUVj6XAXCfhgqqSIctZAwxDYQTGiG10KxQqprK8rFkxVXkLN8sVLTKaYDh05T/UptAmG9sURTqreRZtjb1D0U/3171OhtvnVYcHJAxDLnjwPVFNLwwY3NBNz3qo3wcY9EswieCQbokrrd46/MJxFNSGHIPKzMT8VvXblM4LEp7i58Gl20tX4BmcZ4/lDQcaHSyQOVrzvdMwY+J769geaRjX0fFkA6fPy9oXhLKROwFLBkqY6BVoaMxINGUZXTgFC4WHVZf6m+72215aaT8+Zf0e1sFNpq/c9jBRxx4Uqm6mmZ37olpWcaV4fE7IcrWP0hPqxcS2lqlmxV/Jb6GTKiVsHfVebSIQ/mTfuclAu/b0rVzTU/ymmgTFrhvMddrNfDeU+MnSJGq+9J+AtcY0Wad9qF0iz9RYQSPVa62inFV3F+ykgPiaqEQPg07y8CWHSYL0stL4HYzyFO/cwxagbtlxnCstpCkeiYeY0X9KLssgXrDuwGqnKZXQUM8Zw09QL7I5Qn/ffaC/kH1mktkVloIPHU6CJcVbMx1T9ockdweN8x7iv0coeEmFk2J/5+E4bz5sCWwxqzOeHXCb1gxLMMdmILBJwTccRHCJP1RJvEM2X3ulYgbcW6SNYWRFBQxdclmEp4T0ZeccWpRn9Wi/GpYY0xMPWdcN9E5D4tIPufsw/3M5bA9s8ZSKndmlv7Azvo7jMdQKyjHMTsOkcOVtFBtNunFCDsC5Y33SDMKFB5QMpjC9EuD+1LA+bRGYrogeUQ02cDBUFq50h86YQMip+4pVJFtkAEOx+AO4JydQiDU1+iqn1OJqyA5xAtOUjvgZaUEADUemVUBKTkQrxoGs0bw4Fki+2AKx6W8J6qMg+r+2Exd1iqKieAs2uMi8UReHdoFnipWLYzBvo3N9OT8qmXrApyh8Nrj5l8F0xX1uVHOTxPNZGc8GTF86bLUaNZl7fIx4Y27wVNk6xiXU3V4RiGxeaTIEboIb0deTo/aQhn4Xp3wsQwUq9CuGC0UyVwUM6jAUztWG7VumApvii1sY5AhL9LikciexX066Txs6wm/lxpxeRaCuNMnK1sG7Ur20pPOIIXm3ZRY7OtRNJvIgT7ydnK/FzgiwpX/PvEBVMzZJibRehlXmjmYgvFYlB4IQ2hubbYHUdayxlLKdOe5SN1JvO1cim5n//isSP3xmZH34zMGYxAtnZ8ENLA0v8oI5KRKMfWqP3SSEnvYH53do+IWpjJC5Yk2iNaH1zrNRuuTtbSrJtfwBA5Vh/eoLBuuSwOemhCfHzp6xwne0UHG7lyvmnXCBPyPf+PB0YoME0cylNoKlFSkBGRKir0qsoi1P+Ym//RYU53hkyUEf1hp1dm8QuLPIt7Um/TTSf/gz/dpJ5SSWp+6GxUYdyZlVrcC/Apnn//os0+vioPL46SiIgvfWMGJnrgsvdgKDa2dvdKuLkv3nxheuFJo4cphhSuFFFaEEzq0pjqMsIK+LBUaa4nPEtfGMtHxhwvm23r1gEEf4Vke4acbGrk41fCJItDCDaU1agzNvhJmhLx0CnmIFCnr82skgNBpAlKGzWnFLQITT0b9ccokpjZsZJw2WpWS/pKafUk0S2neyoRA9sZDCoodr4oYnCCtb3Lbx/zlAQr+GEKtzDRvQcmFNknNpQsCr4W0HyMCQzRPH/+8m4esFOLVszHDglYdEQ182zT8Xat4OeXisa4YOtYdSaYpB+nl7FSCLrCC6vxBmIkRy5I7zWDeufswbIOd7ZijNxCTjV+ODcW2f/msKFxP3lcfDzvzGBpPf6ZHLiC9RmhW3JvCfISda1wHtIO0o6WT009RdYOunsqCxzdzXBNZARJSf9PhjKstkNbxDxMcQiicdWxIr498DXnXjhWXT6uTw0Ccg87OTdx1w3qhDuUPt2PJmn5jVt9zlFqGKVmgyjpl9VfaqIypwyz0ZS6j0kUOjgspEn9Ih1Tt2qlwPxxJ+37RkgUGdztfVUByK5biDDSA3AU034emObqyfSe4zYr9UtvORxhaZgwYtijhC5IhKPyQ8mVV7rGc/Gztdm7EIIkvQ3OLc+Idp9F10PnrUEwXaWZAtTTSlozIKjwGRywsFcodzQz3VxPFzGXOA70McRekvD4CzOcfYMvrpl3++7P1a5C5rPabv6ajk6gNWDmZZziPYDMwQjSL2XXkNMNP49Xp8b440fWLYMWIL/+h05fQUSUhwycZodvb0QKgJw/96q4IZqA3AvLeubAq3BAsd50V/AcK42/ePs1+FPiO0pNhMGNtq3IcUidobhqWFWF1BtsSz2Cn7sKPy/JdMk+lJPREK3yUi5ItRBkeScvdkRCIlzqOQi7XMuEbDqhcS/zsQPR45IUNp80Uht+fbbxjilT47ljvPIzOfSHT18OcDE+RRsGIa08oRPXMggWd8Un0HegpI93sNmMN0ZQONg5yQRpSwtRRqQm1RroT95zfbTsxDmTOqo+V0y4ZeTp+0y1jigTqB/olIup3N5x9RJzw3/4v8TWB1L5sOf2jvcLOkE25b3ArZvp+6uxG6XCX6WY6+GOszki5VEDZlRd9oHv0ccyPARy3Qk+CeRqOXJxRM4chGv0S7bwXLhziZQNOrVcBCVH1G+sMMB9U2xxzy4WIrGdNOq/T2E10a6dpvJNlStKLpNElHxxvpFI1yfGoCLhsNYvu0eCw/GChnUa4R4Rwgm/qYLLKGMRklw43R8ngMxZVZBpTLlOvL2D16+0zypeQU+4mDqo2SN6qbk72WnDqVtXcO2s7wH6I+DfJeZoOnv5rD3JuUD0fxk7Cnwkv+HoJrr1RfjdEWHxYseNOTg+fP++fHD8+0e1v7/CcjsLhhAPuFjQy5X5FA4Yz+XlCIqmKhY+kKbVYDeJVJqHZlPhpvq1droKPF8sRwz20Stgrf6/A0vxolKUqdJPYSALZOmFetPxAUclnS/Gmya+SpKqvXpNbfNw4dhxwoJuEAqHJGo47hleoPN636BQZw0G78CpEJJA3G6nrRSqEIQcFcjGLIWNN2fBoJD1Ns5g2yogX2bwtR436I6QXPCSs91XOEV2JVgq/FLXKGu5xUe9HBzay+1WC5f2gAdQXr90i+mG9p306uAB+Zu4nvpVV9/9nPl05nhJSYFGcReC9dleAfp/aaVQQ+0Ir60MIPD6ksC5oKUjZXXFAUiPq87r41Z154L1H6LT6RrVXuNjFsNAbKoEyjZeT0WBEj6Ql0qGkLAQg96E8UMoWGTeK2TobNo2zAWcJzqa+vl9x9IM415YYqGK+N98V7ql6X3es08TuX/UpsjrR/cMSLpUwBsNYlVp5RYhSTVOmaOcXGUj6D7FT+pqKBn0lOPOGNDk66/0RIcRWeZ+NLBdPZAQKC9U9z+UaBk/3j38jnb11v0TT2oWtjngjZa6yARJPjbTlmRnYG1fy1sFzX3wDXgl1vtGqVekpwzs0CKcxou+UqWFd6SkGxEeOJ9KEmnpgor6sIZRA1BGM9WIxy6IJnWxrqZI2ZeyUPv8kukRmjh97OrG3zO2jWkH2QNjxWLeiAXOCa75/t3JX6Qeg+ix+gsg3tzYq3PEMKrdZQYlXQG39LFlI+tuGoBn6sFg/H4LN+vH3HNjtw20l3FYndS3zTnj87D2esmvFkVxFfSBw0GPdgvLZqC4JVjecXwe3q9If38FIhPrzfAv+Ac7I3oYh3qgzkUkEyoyEc+6Zo4AkaVmQll+7eIx4Zt4xpkGKzgMV1FQyjmqOnd7DE7B5VpDbeTSK2ZvThGWQG4WBHGl0IFMSmHrLMv2svGpCxsVExSUTurdLGAJ14W7tZej5dbvBPOqcE7+xGHA2bb5nt8tDU3/zxNrqbqlCE91BcohmC56352wqNLJB+q5RLu74NRr0NqXtgd07NZb3pVt/zdlv58Xyi0yLPL6dm+98jjXjtPpiyMIuOIZhsIC19NodBdVZ05vvdFu61QeiYfULT2EBUeXr72TUVyi6t1K2/FfNM/TJd9Og4zSRqCZuvqtLna06vsI1kapbN98pw4wb3FZsqTkRCRCLHHQXSca6rIbsZtN5195hrSo4+dbka7jwYW9np/Eh8NxkYdbIVuXD6lvzoKBBDbcsp8FhEoYzIidKP8L5zg4a8ueGo99GoHYg5DukfJO+hJanrzLgstUVPmySbRgszs+ZmNSnBZvGfFtgaXSjwbnqaGc+O7cxmUuVcseXttadTOTG9T2KPs8C5zPDPvX4Kzv4roLeepGOQcl667KrddUNkeb3v/27fxInxUynNPfw/GQYlu/oiolneLVxP64cF0vR1clvm9fRCNvkIozOL7IWbBZeH4FRlM4nYAZqF7bmhLvmPIKcBdA51uypuY+r48a4YYowPMFFiKjjpP+aX9ymSFUsShoK2+gBCk7sRuKzfXh40Smfbp00DJLhRTNpNN+OHrRu+C91HvW8upapn2gZqvFp5zyJF/Cyb61bP2x+WGYhB3Rv4+HGuug92tzgiUuDcagjp83k0lGKCyT6wSyhz8EkPi/dQ0+rehrMxRpkgDXO0jG7FYcv33SHSZBeCFlL5uqAj+eAOEi4UbNbLuxdcsu64Y0m6+/M9n1xmtyKL58dyrTTkIxxgrGzh33CQBs+yGYas4DYuFm9P+QEGc0GulyOz9DVau8Q03wyDVQPMdcSghXOAhk8wSIWDf1OQ31fIVBWoD47guFDBhpTyfArIFnS1O3ATrZu/9J716ojLHjsE8B9q/j70FmOzwm7R23qIC+onFWoNTNCBmLeZFLsJrsd0Nktrb/S2Clnbt2B96udRz8WwTCJ05Q4/N3ej/nWFjpU9jY3/s/f9zYfbrThqnAV8LVgRFloe9JQaU9rNzS1ux2GgyiVdQm4SeTsooObdVzwJK+7vhY/ERudrZ7afhf8dXfTJT2c5BKTgMDdKMiRc7SYzsVFxHezwTPAQJmVCaABD18B0nfAL6LOzXRSJ5vKZbTkAm0l2nb8hghSTY+GQfYJPbD70NIpRWDzbbjbsRGx/YPElHk8w73vbAtG71Bcxk24r7SPy0dv4eYAON3ybuXm3eDm/frd4Pa9xzsdz2p7mffm4EZt0sHtJ+xNv2DPSgAB1IRrTTFIGeZc0HjqZZ/72IeSQqfYTs5Nh8Ka9Ky+wXL2XYJgjaju5FaHUtPJMcMIgVTLDTjcPzBTqNIBr17nmWdWPA1VWw3TeSMCyz+8DM7Dfu7WrmZC/87OwaicRGF6sIWbgon0HDy0j0J5cxWyCeuKkJdzmBLArYpJkWGS0harSreLK8JGJMI57DBf06RyuObno+pS6ZScT+XBSO2PgxSi8mf4DQFhujW+4W4q1XyTiJMQLDgvOGTdEm8kc5VgXdnxtawfbsyZUUOrDXviPARBl0Z/ZC3ZpfqaPidXnWBXGdhtdC467eW/xrrd/Tuz1feNIoNrLYdWyuyDpVcr9FONLaIteh4//WI/Myq5yiWVDaVAUuhjwfohdl721eXFGD/0+pzxOZHecjRPkaxb5ZoBJ22VQMbnqyi7NT5HcBpyZrx+tsvzbDLVsu6SpEZcWDsSee6eUpPcmD6WcsaTeLhIi+xHoAlT/i0cHc7n9ossnr8hCjKlV3q01vuql34UcFj+teZZ0P7usP2XG+1H/beddw+61vc/efegtVYlCahBVUgDBk4U0oDyslrrrrWWuiP1c8cQjeQFLnnJXJ60ddPUu+dONZbN1uMrtLppbHxe+CKU0bscO30OBbjZ18psHqWd6bcUVOw1rfDrXwYTKhD0g/mlR/I50tcJgpv9QhbVuvNnyFh7+PoLUHqtZQCT1CFQMvJVOQHp48G+C2Z+uYo+sKEAVoUJw9OgqWFVa3Z119Fdz/3sVdObv1j9Bo68yn2Rn5U6z5JuubgGWNq90KnZrUzISDtSwza9gzUIqECkHx/u5Zt21PLpf6XlhDP4YhWaMElH02gSJC2Ofb42XI7LWXZsQli3KkubdsNCaqEthVAdIaIwoMiVU8sSK/ec/HpDTDzJrnnt9+sq04zfEUYFtg3j+W3R4nqOylW2IHur3peZGFN4cuo5kAfb7FbIvQPiohc8v8B0Eo4zMQhJ0rJDdfL4ciMY3prg8uRxFS1DmCHvPO0yjZ5aExkbb5b3uEklw2WqR38Ue+3K5HHoq68JdWTV1chfmgG8mtqhtQpi56TDg0Yumsooq0UyDPd1PVibSab/eZQ9XQx08pBUJsuXJZSBuw1811aUHO4imaRwisctsAfirDj+PIIKg+6r/OHVBig89UYo1bFuTQdLxilPgLA+WncczlZZr0rcU5ByptSZNRSZgJxfgXs78zlFM+IfyPqyPNvE1iE0eaNA8MCMBGx2sd7PmRjr0IGvJ7ET3NxZY5AQkxkmxUFKRU0ThyujeZIleGR1jXUKbw5fPyNRJb5czNX9xTppgoGAT9Qpuy8uZ0A5ZZmjs+XLN89V7t8CKfX6eTHtgXvTjs9++BFYUpgXVUfkpnqmKf36D9uo/3j5gRslbGmrl05z7+5Z9BuGW0J+Yx1sLKmIistR55TFbUIMguDzM01cqkDlWCcTBlNHRba7sS7DVPpJKG9i8oVq41GeGwhJ6OvbQTY3KrwRjfuAFW1ebtXUszO8WMz4dpGkE2W03ZSptcm/s2rzwLygrxoYA1SmUq5clxqlxDMWHFu9P2SZK8ezzDGF1/Hp6elrcWfNaulq9uU0xQH6xE819CgV1SlStOTXh5uDh5JQsSNrqbxQmzZBMSdJkcA0tSeoQvjQziSG7JFHDJTsL6YwBLtoLev5PckXpqPBKjJGfkGhOW1FuinwmLo+sTNKfwIuQ89hWdGq0sz6xLQfsqt8II8GJdlt3xiBX2AyFhnPcDpKSze3LbHsq7bY1syGgDaiE3S7jqbsA2DxDW1M8KBD/z6gF85J04av467dQGPZO+8xQFzkIlUWPpkBcJpnN9ELkRf2+3QYlLW6bb+2WqnjbblwyteCYBH9SGQHUQKHdIevooCQZU2syf1GIFpljPEnw+Ar41YN4cNT3D32/SjW1Z6q0ovKwcu3K+SyOfDmsrFd8nj1C/dxQ1MutKacL0mY4dIrrTP3HceSXnj1/CYFrTghK449FwnlHRHhisegSaY+rntLNDgy+sowP6ykyzGSCdWOVXLcKxxnHGQEt8y+1jF7dI62Xo0vn4Du58Xhs5dCV5PUN0cA2kmgBGxgbcpo8jzyG0j+/PDLl4+fHr8RyDBxHie3dkqyek22Nk8oW6tlkjAOmJkcWBrKFKxuCvMP0n7zbptzBHKl9huab8VbdyIZzy+vauxgpmScrIbjuTCg1F0vP+a180djt/pSJ5jx2h19C1MiWaGNxu+7zbN//Tbdlzpx3eGP8JAp9OHeTa8Ad6QXvZRnvdNXJeDantR+5bq8nChnQXjvfU9cmhU6+rHUweZniCgYMT64R5GduLU+bZ6E80AG+H8m1PEFhsfd/mmZJbM7W8vDembbzybl6qd/+LV4zjH+VconGldJ+fSCE7QjOnUazy7DWylq5XRBEQ2kmMkIK3DHOKf6SU2S5rNz26xQwe3IVnJfQNum0mgPjaR7Gv00beroXqFMz/WgqDSj+3I4Vd04mh/63tO+OKPVHbgWFqo3Kt2P7+pL1oq+jEVhO1RXK+q7RnxcQxF4IBdXTNWKiaZaMT0treqz1UpO7GKkxMY6+5ff8uUNOPGct9hObOHn46oAWx364By3OZZu7otgKoxUSvnZB/epWVw+z/StfQbhNC7wknt3Ys3rpmjmbRjgW75kbJurYn0g3TMBlFE/8KC5cUh5t8cn4vtmge2bDrrnyLtZjdebEntl3jsTYTcNjN+s513/KLFQ/1abXFbjZ6Fjxcxo9uRsv7cp87qVUXrLQOm2SskT3hADNISFLufqoIJVjNyqiLwlmmVABkPoYHRexAp8t3lS6yQ1cUSXqJwgaZzJi+FacPnRmy/Cu53w1GypmcxZabmodI1mfEGVlbJsXUDl/5dY7KZZTuPJVUm0MJDQz0VsW1wEKIxMLKhoMTHNSFAfzbJVcXg7P+Q0wEJQsRO4fDrvsRpH4aCHNzLkobU3vjeU+AR0qJViy8yvjmkkPh2ZrnOwihEGk2tfl54ul3GxODT7I+Kga4L/fvPviyvFFL9tL/R9lS/rawiMODf52sAJPCLwhtaJOvfN9ZS9m7/BCYcvIyR6y26/EXCQcFKmIX9ZM8/BaOTfIoSjw3Aob0BJ8xyOJ4tkHAzDJ8jSHHJ6RwMeEfxz/lVdbtj+8hk7lrJz/0Amk+dAH+p4krv2CzkcqhCYwH65QPoveWE7/LW5MA9MZkmDOzcvxjCOkxHnQ0yh6+EbUzpmHh/IAL5c2K4qW4XNej1lVLhcAcyVza2cvUUxf+bevOrlCKlWZcfoQ5QQD8SmeINjy7z9LtJ2z9Xdju0sjifmBZES+Fnj9eHp08Y7gjLHrYwKVBrO6YssIo2/XIyNvyUIh0efEwB9OBKVsdx0JHEQiq2SafTgnaGyRDROjItRsWdkqtWLOL5smC3pfG0rxLZdUa/0fvIrmCWTibAijnW1Sdv16MBee+s1MuHKgdu/y/EdmP179vq4VIYW2ixzcnr06svTlXL0DhZjaZAzKWz+EfPVz2fvgHYGFAnwAD6+CvnaTgPlEZTHCntXkjYVTmrOFT/sT+ykgpuk3c/vm2gU4zDqCn/MGiyod6O0Bt5JQ2uoxSyc8qemxIADNfx1lRAhjyMgGmanI/1a645l8DK8rqk9kFcZhPh1hM08C3V6DYd+ynyyqWRdv/jqRddOjskgcKioNA3QvoXECYxcOBYdLshwK3dwyy2LD3JVC994PCbKfIE0yAY8bL4wSCOV70H0dh7ofImc5pLv5gFjLO8bjhdpnrrFRjedde5APNqQcWBF5kWZ7WYWL84vlN51GBMHhYEY6mDnmBu72SDkrPOUIx0Yr3Kerc7qA2e+ez/FqJEe1D4YtfNonyG57qcmnLyK9EHFQW8jWJT2GcdKXl92MSul7q6PgfUmqNJ7bpUML6aiXWnfVG4XlXtDdgZTib7VcMG20hmPypCgQpjsBEpNezbb1vy1XN5K51M48KXX0xDsHHvlQTJenHAe1WsDO3hYyO6gumundsjbNvM6lHWO5uB+dmCjSrXx35z1cZ7BXCEoj0olPfJhqS87qX40BlRlcS4tm0dceIr2c1QURzIKU+XVMGJ5ZPbQVPOUxI6pODHoWqwN5CS60D8rK7onytNbdXPDuPxLpxA04rrzu8CGiMBVDDW6qxCahQ70VAd7WDawQnns1ahXCAyGmUoJDFJ9oxTkggOQJcc/CDmDCVjrhAW/sGPPmb7gXhtA3PVdtrb+dUUieilympzuiCaLEzSnrNxTTH0RusyhZ2CsOY6W6LG6UJw6rElksYzXRPdXCW40d2PBcCMP3/X7m7v0wlHjHDrsN59dN3AMB22Bd1IiFXspJ6wtAjQFx2GHuJZXxmcaQANp2psZEZs+KaBjEH+SM4fN5GZdkGhcmUM0uRE/oZkQXXRDBWuShPETzExXoFe2X+Dh5/tiEGe09u0EAew00mSGENWx175wMg+ps0fInkh4lgMaB4M+dYz/vWUWetjc3UZode/hjinZvWZeVcjY42JBJrdcHf/q6lvwMyMYZm1uvY3NKU6PT07F0ZsXIEJRm4ZReKmn+yKFgekGa0NvYFqjnUb9XsyJ8RhZKKkX6FZcBZMFrtyjXUlFf7W3KeYEAZlugWr5ohYLkkz7RZvwYtGDpvWRl63fssN8b2Nnb108erhDf3pb6+LhzoZxYZjy9IZnJSde4BBiHTBMuyKdYFmIyWHXbloWHms8WUxnraq+PJCd4Sms7UzLdDOktRtOIp4oflwzLlwXrRJugUXUZwpKkDSEjdJL6mr5pRRh+jT0NH8p5N3X9AvRfN5CaVYsu9JKWDOgQ84sCDIzWBHCUOxkkuDWaCvHxe3qUvo3Hjsto8NVedL1ip/SFnM9HPNMgDLUg7PD3mSgGTSPUHzxBXE/+P3aJQkJGaukdN1fV32QAQLXweSyWgmAB6IOYQLt4n406gwimRhfwgBle+uVcfC4OTgtmb/okQO9RUyN2KlyHTUvrP93/xMMDfIDyhsDiKprqD6/V9UlO2yHKLU3asdXOb8x0Ais0A3WOJqaAQkVUzBuKXFfdcff/iqMljlHHMLwhBeKE6XQwcMJaIt2qqbJq2DE870x/IsZrRqb4yc1SdNcxgLPfc0d5qyhYhrgCUtyVrNgGyA2aj0fIuazYEY8bTq51QxF2VZRwRr6DQO+AD7kkF3i7FA9T2Xdbc7dGXrbz4qYaqm39UflfzCDaU9EkQNJh/70CZysWYE2lqhhel+EfPtQOAxcZlSSyTtLefW+W2oPCYqkP5xil5CSsMrjTIqpfrJ8koVzeEfw0cbH6w9Nij+GYquVM05pT/IxelmX6iUadamIHy1U3XoK+/vf/uY/5vP1GN0AwmHKmhAhMnGnwFRlhchR6VOzvDCgLGmq9opEL/oH5HmpINkGo1Ph+4XHkPi2y4CqvfVNLogYsZ63EKdHKcqRxL5TfVisMPucqYMTr/AKIDUH8+J164DnA7J0MFxjkm+r5hfPinOcd8GkLCww9/2Iqh9/WmfzqV4gp/5Wq44ubGq6kHOe/yKoAWcEBz0wmXKPGzHe1lEEParqo0KDqEg8u7QBKlDdQD3wAu+Jq9OrkeP9mu77Wk58NLg/GPXRDRbkJ/+lmv5YclTN5rCEIlNasoDVboTlVAri2CpUCuXqqdSQJPghfEtsYfTMlMx+zNff2AWcy7OtGfAhgLHuBdVr3g1B84ZE8PLQGXFnNv1A9CqyjunnA2jhUBPCYS0VXHWleayrrDYea1BVK8et/6Fo5NY+r8FVNApjNQ6l4fkBiaVDDn0DMdDnv+c9PVWJrOx+Nu9YB0UoxDooYBGGdP/OXJZqFPoA1OF2WsVnLwJZrfrWGMn0jTIHB77cOnKlcsu1ZJOlOlpGEak5wEhNg/Zgwfeu4LBToobyefBcCJWP3nOCo41+0U3PvNkoWnp9H7dkTiHSFT1VVshZrBwS11lvmp/OGMskugxJngPdMm/PK6C+CdswujPrxIpY5YNB8mdmKohyIlUG4iwAkcZd/wJQQXPHUkEPCaxRFLhzi5ow1dQQMkPChu7amhtDSxjeXASLlG9+aCw578YNv1CmO/NBshgef272ovOsnH8ZQz2WKpQ1t+J7CyFgJKgbwbiRyAXX7LJac3zlJc9nqFj7T2AgqM+IwOHP2413Lc4OaQbnmc/yzP2rWKc+qH8fwdLXy0JFLws8HTcAUN7dZZ7DVdql75l78HAOUkHyA/EP3y/vsNIR/xHsYV6kTmvo0c/lyf9zH02lwMYOwhZd7huoLs2t8Qv8b/+beHsqBJiLuT3VptoqvYzm+W1d7r1e1ipQId6PEZIxOnkl844hpNTplGyGhjHP3RlbvpfKux93iZcuCV4Sky2h8A1/xgXC1lv7GjvnpX3TgvFS+h+ZQQsVQ9ALUp5kCcKZWfP6u3tUss+urP0+X8XRl07kfaXFnAdJGsIRMUjO+XPnMDlfTIkkvuY3zVFIhCLi7AQHDZXBmBAs90J6viWOJYLFicICCbMTjEZIY8jACp+5RrtNSNmmI4nWGzfKHtD+WteZnA8av+oi+/44Ou/GY2o5mIdJV9+NmQOhLTs/aLxGNoAsZuU48wSwP/CB0ZmHU2niUJVW6xjQta3XGDHYQznsNIPDZEYiQakPJ1Sl8CfgS96pSlfecRmkyM6HeK3QcwlFy+obZ0E80F3kfzgJpFp0Pd8vkBgzyTNJF91XFoGDwj90TjOxwBICTG6ZKAZgbc4DLmT9pHrHgdyte/8PUEsDBBQAAAAIABqXiFwAAAAAAgAAAAAAAAAXAAAAZ3VpL3dpZGdldHMvX19pbml0X18ucHkDAFBLAwQUAAAACAAal4hc+J4dsM8CAADDBgAAGgAAAGd1aS93aWRnZXRzL2NvbnNvbGVfbG9nLnB5fVRNb9swDL37VwjeoQqWCu1lhwIF1nhpESAfTdq1lwGGajOOMFnyJDltMOy/j5Jdx0mKGkFgi498pPjItdElud8t3Te2dIk2QERZaePI0g1JtfvjHqR20bqPuqtFB0q01GZIlo/w5pINN7falBw9l7daHbk9i7wAZzvXe8mF8n7jXHiPp5F+m/Kdrv1HA46aCHptM8MrMKyoBbOiUFx2cXhVpe3Rh2i3k9CBsyiKMsmtJYlWVkuY6qKhoi3l4Coi+MRxjCayFfAKhrwGE3Eb7kgubCX5znpiKTLuhFZE6sIiym1I5i/kPNM55ETCFqRlGCsKQXNYkzQVSrg0pRbkGm+YG1Dueq4VtMz+sTWmTwesAzewwR6Aziy14OoqrQU9NmRaKcjc+72gfc/fOXloj1OGqyfX/UY0mCMIwwh4ew4TsjNuCqEsvRiS9tdSdbk4bHAK2GEf+aDlx1l3SE+wAp4vlNzRR1PDZ8AZfxNlXY6kzn4nulaOXl7g85mLlyYNAqVxIwNu4yG5vBx85jUVCp5RVzNsLT2shPVtrNER/rvNydXxPG/ldkjQb9Bx84761NM7Q9mlJVjLC2CtWxM4RRSoPEVAG/r7+yxT63Bg8W+wp9yjW1kG5Q5JG7uvEm9IS15hO/92p2FifoxHP+/iK5LRM1u/+NLOBsNDyGR+u2gQhQFQJ/bnm9V8Mm+D7EBK/XqCGa9Wi1WDMJCfmJPV5HGS3Ew/RPzr3sKYYg1dPcw3JXyxugrTN/QBmjL2fcxqY4PjkUD8WxJsPVmvy6D6w914aG/0aKAwqN2cNvuUhuxOWFmpt3CvrfArh7ZnMzxbYL5hD7Gxyk+8cD7BOJ8EbftJvpL4l0LJYwK9ef1Cbmqnz3F7aimJ0+RFO6fL/UwEwwv/oPwtMuAulA8BMuL9W+jcfK1PXNZA90dlM7500JuATAI3nRj7a/GQNOCQ6D9QSwMEFAAAAAgAGpeIXAXDO7ltEgAAr0wAABkAAABndWkvd2lkZ2V0cy9kYXRhX3RhYmxlLnB53RzbbtvI9V1fMVUeQqEK47RAURjVol4n2Q3qZJPY2TwYBkGRI5swRaq82NEuAvQj+oX9kp5z5sKZ4ZCivbttUQHrSJwzZy7nfuFm211ZNSwvr6+z4nqWiZ9/b3nL1Y+Kz2abqtyy9/sPzZ/CD81pWXEmBz80S7bb/705z66LOLfhvmszDXaSNFlZLNmH0zIvK/j3dVk0NvjnLL3mTa2mBDMGnw8n67qp4qR50/Dtjxm/X4rH3/M45ZXx4C0vWvn1Il7nXGDrP0E8y9lCHqnc1EkV73gVXrdZWNMh9A7i3S6Sj7zQzT7nGjiZzeAS2UpdZQhrncFXXgXz+iaueDqHRZ8wOH+7LVjKN1mR4Z3UbBs3yQ1MYc0NZxef3jyt2ccfPkfvTt6+Op+d/nD26e27c0B8SWeZv2u3a17NxcnmL8v7Ii/jNDqNq0Y9/FTz6l285S4Q7EFBwO/ktvtdwtJVtCvrpo7us+Ym2vI0i9XoGS+umxv16y0ONfudRv8epkUv48Z+QGDRadkWel8feb2DA3NrcpUl+sdZZuyJsLx5aS1r/L7gXxDx1Wx2evLxIjq/OLl4Rdc0v7yaL9n8Mk7hwOJrKi8ALtl+oAA2cZbjd8A2A9KwKIHrjBLk1eCW7xfHYs35/DsOpIax53UTN23NCIRt4D8kXtJWFS8a/L7lIYDTtOjtyXvY2M/0g/DADo/ZfNs2+rTisdwyjF1XnBfWmHUGgNjzPC/vvSASxzpvuTWuTgljlb3ymeAGGKjbahMn/A/m6PuK34Gk0fDt3hx5UyR5m4qZDY9zOfaV/hbAgnBuPD5KA10kDVS8aauCJQFCLFi2EaA8r+EKA0AElAVhmSV5XNeMCA/sFZMUB6Ywd3QxnxI50qze5fEexYp4maWAgf3rH/+E1WEgAcklcYO12jhnGn84I5Tn7Q7FumY1/AUkS6Yul8jPGhDtnJ5X2fVN8yzJs+SWbbK84dWz9f5ZAtQRdxEXMKXcbtsiS0BGaobyRWtrjKRu2R1sUqqbUB1LbAaRRQJ3VHGAroFx4GY7xRuAklwy+LNg7AkyJeiYCC91KSbfxcALApdgbJDKKLmJi2sXUVY0hKMgNQMqj0muZBlozlpsiEQkQgUWRUHN8w0YgRg5f/WuLLikCn7qFrRlsAg1sABbdAAwOYyq+D4i+oD4XuHqeVY3uHaaJUCDoIRLzmB3rCrviZAuAkltG4m4MThg3a5B6ThTpKzKe4VJuHWcBsYmu+PsNT0/BzHnLKCxFatvYP04z3v7L+8jQcSVIGb4Af8GLhwyUySoA5BHvtGySmk3H5rwHH7/gD/DkzrhBUo+/Zy580CcdlGb9ZZLyqLgSQN3DydB4i4M8ulZCGuSDKfCoDBUpL+DnBeBNESLRQ/yeyDPT2DO41xY5bN4DaIcaDj8XCahlLtgHqHKZfMFyWnCsoJJ3Fd6Sn+Rk5zOgLL4sbwnL6IOLqqW90HPec7J3fiW38R3Gahways9lyLsTZBPYKF6ZEt62tsy5ZPXQODwHI6Rc/1sZJFXadZcAPuDI1EHfbTGcPiuNIE9+xWq7FWBei4NXoOi4STrnzkDVZDmXGk7cEkK0Ir53sMVBapn9Lbel6Dz9gEwau9heNrWTbk1nju7ueOwTqIYBhQEoP4xqzNU8GJfHZM/YQIKlONP6KOq5zfi6UpgvHGY0BAGAUg30IDpSW7O4hqIRzfvsJABKsbBZcl+4kRgw+cMu8fhGxQuoTM8eAjJKRoHnoZSHgMhnWURCbAoEePWmc/Bjm1BaW7brdTnYDjS5qZjSJSebImDKEJwx1vYR8O1oB5bHAlGFiFXK+k52aM2iXG1z7hYAPj/eHS0sGB5LnHBqoHrgGr/dDF5gRf9BWo+ffYfjkyt1lN5Pu2GJnGQJmQvNUXseS5Xf1TG2INGQIEjbTK/EVLQLqJ2ByaL96fDVNp/ZED50QinPUfPWcJ5duMB8mMjz1V5BhpPHm/XacyiY2Xv+LrN8jRqyCNbGAQgVkArLN0CgqAHBhHAsTlDvwfMvgAQzllgWX3wC4umJEeJYJbScUP1xL8AJH7BedrP1nQy/YluA+Mug3gIV5HvHdcgMM7grmPfQ3cNSc7jKgIN6vIf7PUUx9CLMM+OXmLFgb2Z4lxWk+uBUh6zgt8zEXuyqi3GT3x5NX5SGDf0jNxNsReOS9p5peDU1Izi3pjtKrCKuDQL1sDwz/gG9tUsQo2oqfa2yN7fQKzBULsOiHLnNGFwEBXlfZw1htbmXxK+a9gr+geUqI1mB5GB4wfB5ZFngA7LkSu5eEptbnuOkhCJqPONTVoCT4DzZTI1UAN3X9t0PSE4IhVdHTCvxacsII1dJBWIGBoqBr7xsxZidSbWr437fMnTdpfLiGG9FzFMlKWIdQfhGEaZGgKUf1NlGFrc8ILJILGzE0jCdSmDjhx9W5nGYLtsB9ocXFtkPxx9+S3bAGeu4+TWYjLSrUiwLIW1smYfVMckpgv27BsGjmTOL1UI0v25smn2RIRy7M3LmkEYwN79cMEgKgIeAJ+7KiHUIzXFArihuAH/DoKVAqUenooLMC5IIPwEEWOM4RXAQHzC1PbAkSFCEMLnW17X8TXcDxADxA4JGiMl6MjffXpjY5XRadBn26YKKopk50i1gjIsQPnFYjkGq0g3BRb3OxG0spIpHnjDndB8uGI/O2QUXjjdhq1JvhrEB06jOPGy6qCVEKBn0cNZlA05JXLdTiNhrA9jEuWx5+I70WxQHLMi5V8wrQYhiL3BToilJ4TBoeUJyVUcVwTALueEdn6Fit9Y5vcsG9CrIRrkItUoR1SsAh2xKArLZHviRyO0UV8TfRQcXBb5nlhcqKObuCG16Y9/g1LYJCKQDJ0Xlg6AEe/MrKbQ2UdLiuMD2uCsG6nbvLHtFDGVoB4C91U9yO6KjIk1QvGjcESl09u3NTAe5eU9BQrwPaTvwaIHJ3xaCUqebSETrWyuTCIZCJ9nKxYC7i+cHeLnDjT9Cs9FcqsXWZqPhPz6NoXS4rv2ENBmaDVMjPBsYHf6Eim68oKsQeveujGDmNfHKagYCtuIFDYJTKQXEJYZBQ62OFemtMjR6dlSybuSyYQzJLwkkpHOMRQJNZ3sGXAJe+kec/FHu4ZDGumAOJOnZ+Jw5RcdQbD0Kt80+VAoiOOHIYl85LadkUHXlqi0K3dtjkTrCEWeiK0re2ca8+KGchgzV5GALfpC8iVObRmF/q04IkMAGVjWCncSSHQLn+YR6+AXSmBPCMPx46gkmjtNL2H0LtWSX8wpz0tGrVIbB6P2oo/WH2ObKNTtebSW/VykmUl/9RA+Ya/LaguGR9436xLRziGzGq68iYuEBwSzJE4d0GYKmzgougY0x6NBKVnRx70uyyFNaeMWeB9wfd7p/QM3fItJXqcwGcjZHjaAUeR/LJsGVDwN5qfg/pV5XIOJevHCf/vnWKO0iw1UvhAZpcPMZls+/4m7rVX8ugLBTQNR5Q3MKpo6mYdGk84nS8bhZ471lvDbMk/HjtyVwp63stb5fIelRnn0evrZsbrl3/Omozam1cA9GYAcv6YkkOW+ocshJjaXevf85LEr6fre8GJDrH0QNxW5h4TQvlxFlGlXezYG+2sc2VlPFzwfueDtfvpaXQn1cYtR2XXyar8lk/4n+IZk+DDT/A5AX8N25+SMmE+PHnv6HY+Tm6nbpEzrRN4eAT24qQfqjU/F2MZ+wRV4V3tN7QaPXUwxhUfFAxMXlPfKS+yagXj7sDanpgLiBnQXlDVi37A/H42btQtwFS6y3bBptoBhFQV5efznoyvwvuZhGM4951AuLRl+7bRqrxJRLtxS72iisl9RknFWXl5jsU0kOWyPHf1pzC/KCarUJOtXTvhv4cFb7VW13YTfBbZJiLIio8p239O2y979rJtVCH/J7Uq4h+x9pOPFdBcFdaFMnWCkq3vqz1fyt27w0F1MagHQwcdK5UAurUWuepEFZo+rmrPV4atyr9vKB9O8W76n6N8+ej/lIYIE9cS/U08SpOe8D7ruKmv7Aufg+kTHo+VBfANhhsIng4tFH1F38yN2qVcXcfEfhUfEtSJYWChqEdINWTA6yAY80ca3EfzIUknwI0Ybr6oKGywv9jvxdSDMMdY/cLTBgPPg2bLit9myg8+7DwU8eHEP3YFC6FJqaSjp3k482WEUG2yFWyn5WSqJXMl/ezUwva1pyHtbx9VkCbc6Jlbz368rrQ+TVfx0t+K5P+uQbq3CPtRwCsqp0Hc5cDKdtnH7XjS1ILwwcDU1ADbCKFkRsWvqMK38O61SQzq02+zg1hVE+aLDImJ8kU6SNl5s0lyIKiUwOo5LNZauhKeBzkxgodEAQ9GSU1wRPqsxCVtSrQlY3xF6XPeljsxWnauDKIZmU6p9sB93MRGha3t9tND+mcSy6I2OZzDUtIXVp/OJPDJqZbCaDOCIWNH4i1G4OpRztAAuYfbVpZOAwXqV3IbjaJ3kdSnLyHilOrdra/b0i7b6vbVEVVHUxUig+hnPKu2XCfuKEk+emtjImMHaA1o9nXpK9RGFiod6xmZDjupZLd3CmdHLK+EZwmMuXubY0VdGfUKZPVtrOPJ+0gS4wCOEXYQAStiF82iIu8flk1O6iprK4prqQg/SkVbinQmRxddDsioSU58EwogXN4LN09f6/POfCfvX+dMlG5kdNqIT0egjso4tLNJx15LVa3EO+TYzDZKTjF1YBwpBBanNmttwoPgXngh53Ma7i/K7vFzHORHK4RdfB1ZnbYThthqtJcu2fNgIyT4PUQhRC4Aj3VbYjx7w8Do0G83L7S7ndIauQ0GuLV4agUnxdYz+bNcgEuwqvuGgXNMFo34TEMGwo/2bousbea56K8oU9o8tzhrLFmL4rk9i2+ZNBnuh6my3F6n7sECl32GhWjP1ocAuIaA0e1dqo50LuH6D7Ti1wdbquLLaB1xTg3MOViLfh+aVWpJgVFIULXohT88v60TsMtEud68dWZp9vUrPMet8x3GJFsRKhe9EZViwNsb+pPJa7wVERJV7VavtpKsrblGlHHv0BCtXqmK26Hd9qhnfrKaZIvz0S8G6ljZkP2z1Q4cmstPRjYqULh25fTFoJCRz20egGxlGoyzWKA6hes0dYSZIdKlo9L5Knazp94JIY1MKk4G9j2mAwtTSYCP3eI1WZqgf0PYMisLjejy+StZvWPLpVp2WNJ1ScNE4p2SzxctZK9YlSr2gtBUb8XiBxcDb1RYGUI8lxQ084v1A76GHk6T499cqt9jnP1hwecgV9LAfLq+Y6LGYMhXzhGKKgVqUTqbi/rWY7T/AEV7VfalZwnCwnWK8Y6jQpwrGVW5fHT1UNTru/BP2N853DFtQ0Z/oOpsx9NgXCYvBvwBnqvMIlF3UUCMBiky1jZgQdHcccw34AzyGV4njGR9i3HyppQMUchITE5X1xLjI82qAcnOpg6uWjb4+p9YzV77CqBrHcQwr8PAPk2FB58oK/NhA+LNsfKWc4eKYibdrI7jXr+hMVtx4gvDoq5YbjekpFdEgHHkqK1zwFYj2VFSgnobKVRXvfBKwqnQg82BGqnMYxOuiGLxTyyS9vA1+dufiyr26KSPkEHVlY6kXcV30Mo6bXxK1QCvSKyuQm531+jDRQJYNDXVjZ9S6Wh/rKncOiCrQaXXTjXfdv3DjkaIU7AJZ/RYodEc3dwtBGfmiAoA8ljpYfPVkSDpBVqJdN6DAXCk+JMC7LO3cQF/TtCvuOAFxdsfwCuClrNmKlmANewnTr3ynsdrqVPv8nXiFTUY4GPLVPS31S1rTrMMb2uaX34B8nd1zds9dCWVlXRjO9vqgfl9Wy4DXIfV7tAqj9mrFqn4bqQ2pkiC6qLEZQre6kZxv8QN2lxRrX+16uiXxOfEO5jmIgQbeurZUjfKw++rDSU8baqSl3PGRjxknh5LDgYnckDcyofMZWaiRdHG31d+v2As7v9d/bV0lh1rzdXLzVTbLNupX48xZmlz4AhJBCf3l68jV7exIHC1+OhcksgeYCfk1CTfSK/+/Rzoj1zAx662P+fDkgjkV02FjmQHVweuXe7uT3UNZ/7Qn7G1c3aIzavyPOQ7rLOf/4zHZwR9USp64213Dv8iUd+C6O/K29Nf0Qh2+5kjTPHJzkqYkFMowqjhUSAem1XvFt4dLyX9bIrzCYBNdCs1YX+9YJqVD4H9J5JFyNyJsvppMvw44IcRI+WEu+ci35Z3IIwu+oODh/4AzhnWlzR6/hDP+60wxnR/+uqvKHa+aveYO/Q6wyxVS4zhvCs/+DVBLAwQUAAAACAAal4hc23Voi1AGAABtGwAAHQAAAGd1aS93aWRnZXRzL3Byb2dyZXNzX3BhbmVsLnB57Vltb9s2EP7uX0E4GCqtjuoEQRE4c7GmQ1eg7Zo0QfahKARaohwilKiSVBLX8H/fkaJk6sWOG6xYgdUIDIu8e3i891MSwVN0tjhXz4Nz9YoLgmiac6HQuRqhfPFFXTCuBolL9TeN50TJitAbIPicvznl9+/wghdqVC68wzPC7O8zweeCSHmKhV25iARn7KUg2C5ctfnLY0YDf1AezxMZCZwTEcwLGkg6zzCrhcB5HtqlXmq1YKQmjgaDQUwSFOZWrHCGRfhFSk/gmBZyeuRPjAyCqEJk9ob6kwzdq6DlEs24iImYoIP8HknOaIyWkfdEFiLBETl44q9OLMl+iT1By/LHKr8/GTrAaIajm7ngRRbvR5xxwHSQxgbJru8lxwlOohOkyL3axwzuPUERyRQRJyjHcUyz+QSN4QC0WjXOcKWfTKLrIrsxl+gcvXcQH5H4eJvwNTYYaBAxLCWq0C+KNMViAYd41oxWocPh8BVPcxwpxG+JwIyhygYghEAJF4ikM2KugGiGMJIKq0I+SziH6yEMDhMAysDAGSOGNKMqDD1JWAIuCxSZmv7FM2LP1B9ZgCd4flATl2T+mgCYg1CCvfOwoF57I+JZRiJVuRjsr8+vmTSpe6bhzAm+CWcLBd43ReN6kxlPhyUnbkqAFkkA8K84mDZT8j0Wc5pJbzxC9q+P+gLUC9rzjq2QtSxW4yHTgamPNhHqDf/gdxnjOAbzjtEzNB76W/j0CWBmUKdaeMO0UCQejtClKEhHFnDE0vheF2aTbLU3TBu+2jZIm1xL9RFnc6J1czAe70B+hVkB5DtQXkKUXVFJZ4x4zYtuZHlN70n8htD5tfIOjtcMe+gtITn6xUQuYmSuQRG5JRm6u4YvdU3KOKCMycBhu4SNG7JAVEJIxFjcQCyU4WsCFj1FM6FPM8DBwwJe6IR4cU3AON0seOTvasuKdQRhCskyup4etC1rfL/jc5dcYab97bTtbQ79433NAWnL07LO4aEby+04b4W0U2U6KgiLPMYgYWAxSkHsamip/V4opZVRJontKIbEyvt7VZw9mkGpplU2M/donmpTYwSZlxEAHyFzYjtXdeJcO76XuPlhWWOsIFMsDczKsSBNSmj0Ao3X6DvEIYjveTU4YJcSol9NNK8PIEySbwIe96mrqymjWasnxxzb03mK7732cpN9q2tb9dpQWIZQ/FKsHFFcXF+ruRY7YgRitTLtrkXnkbmwKfCD5aLvls14b7cLZziDnNDpFMwyiqnMIch1PxDbkxs9AyTELDZdApWKRvL7dQcKyxut0OVKZ2T9FEK7t/8CeY3+1ua4/663SDHNwnWDcbWpwXDo+rqM4xGyf04K3UMfbN+mNS7XAumnsLer2eZV/04XIovZNcG6ZeyUB1eub2pIvnPZ2iZXo3htYrgo663Xb04gqEzu8PXa0Y2l/01Pdni0A8PWHum5v1Hz2xqlhgnKGdjMNGbyAY/Zh86PNPPbWtCSfOoOz64RzKIWvBTgI5H0K+5RUE33hgv6FaIesxIQjHoGI2y0WA+8+nOugtb++vklu8ML+SFJao6WYk3S1DlOgZKgaZ1Wg33bfUrCjWmrDbSFW1/tpR6KU0hnHkhfP7xmeF4+XfL8AYRqjDrarOEHBNvgFgbkkU1n7Yam+gBop1OENbPZ32k2+bf2mruCCJKCk7dBytUtID9O+wyTS7t9rpRYNYRlqe+2zbrdtW0Azdwuodmilq+R1pEv+F1vHMB6fwDARh/VhncDh+bdwOEmjsqxD51c1Kpz9lJ+c3+XuuYctXb5doHVE+7GWgKbjcqhm2yjdygifoesUzHsemMAf97Z3lw+LMHO83HvhYGw3U800suasmFZx4E+WRN8BkVpuBEylA+7rhO9be/F8S3OItLvvxlXu/iwo6YRCkG4Ppn7jZTSTN8kuDVPPnpaCTQydGBnmhap5/t913Ru6KSW5g3/lYuFIxueDkOQ87wbE12zlpL1WRYegpjo2fYdWEd4P2f4nzP842Z43Sc6NYfB0Ou5rnpDFjBC+j36bQROvzf/EO8GjEkbesyKtGFKrYMCJnWtgE/DUyhCw7fm+735/tN8X54OPzcSAp65SOg38MrDo2Dclw1QMlzWpJPgIFmhpT7Q+WdKvY2eTS3SYCvA2elw8A9QSwMEFAAAAAgAGpeIXHElPqGwEwAAZFsAABYAAABndWkvd2lkZ2V0cy9zaWRlYmFyLnB5tTztctw2kv/1FCjqD6duRH3a68xF2XIkOXad7diWnFxVNjWFITEaXDgklwQ9Uryu2oe4J7wnuW6AHwAIfkiOJyl5hmh0NxrdjQa6Cb7N0lyQnO3tcfWV5nm621vn6Za8u38vngbvxUWaM1I1vxdzkt3/U1zz24TGJtxPJW/AXqSJMFt/5dEtE0UN4e8R+Ly/2LDwjx/Tu7n6eUkFu4q4qH+m5Spm1xlPWpAXOd2y+nuab1/T+7SsO/yU88h6kJZZ2/klfDXaX9MVi+vvPNGJX4d5GsfPc0brBwYfN3yrQ9+kafxjKUSaVA9+sUkpAdS4+J/sXRrz8H6+N9tTkkrXRZjTjOXBbcmDQkq4kRfNsmX1aG9vL2JrstzSP9hyw+JsuRKJT5Nwk+YLUoh8Rg5+0DlaSJorcq4/9GfqaVAwccPuhO/93dMfAeANz3zv54wlBKmQdZoTseEFKVgoeJro4BdlXqS5/14E6tv1BgYSvEt5Inhy+5ImkXqudXleivQD5QXzb/KSaQ0v+B2LUED+8bM5OX6mNV2Le9CHDWNC6Q9+PM9rvmvjI5+bp7J7mkcMxHOc3ZECBB+R/bMnZ397Qv/TAXaQ04iXxYJ8l91Z7TT84xZ0KokOwjRGee+fHp+enJ2ZYHVbGEVP11bbGkzjYMf47UYsgF4ctc1fXANZbNJPLHcOp+Hh2Xers7U9lC6r9oi/dIRYyzoE1fyDRUGYJgnMth/T7SqiC10NA6l6Su2WOftnyQoBPdiWi0oZZwpbzkSZJ2QFehvGtCjICx4Lll8LMHalmkD9DU3oLStAwRgJyzxniSBrCUc+0Rhwk//79/8CqiymYQV28/EVQSQlaCQoWcxAWAEOROKUJrLkCRfLpV+weD1bNKPFn0HOQKHAChpo9cAFKsA+lgWjebgBI9L0TbauyzhegtkBD2CTQsK8AAExE2zLIk7Ffcag+W2aMEL21b/nhMbxnIB1AX3wAggOMmcRQeiiw3WWJgD4tYiidJfEKY2gdQzNCnTR6l1CX1SQx/Td8iSCqa+6Wm30rr+NJ8uYJbdio1GVfhjpOXE9DB7wZzkPezkbasXJXfLI2ZilhRhsU71DsFXhBEpB3fMlghbLHRcb1cEJWhYsT2CFrBsb7QYr4ihaqeBzgjBzZVqatoP1yBWZ8DWhBCIBBUEyMFu3capFgZFb/gnWiTVncRToHrniBf8J4nTH8tri8ANUVDsYFdqYtzA8WOU45LiW0gabQSjGG2gW66gaSxvCB/q5NGTSGmgtlx70ugk+jILec4RIa55DJNC6LBptxxEKtQk/EH/dbQS71GvsNYQe2yfOqTLkIWQKYiI6aclD2CTAQ/QNDHwIH7ujoVPhoN8UUT4ce9VtCnLN/zyKitZ/hJzbkw1OKwcCEnVL2YDGz4CXrBgyuvSaROU8B61aLfSWUVQdO6OvumKEq4Ulpi9TDtl2xchXKjrxh5Mzib5+JvJ7E4ive+KURUeOdagGZt8VsgKQaGR33+ZtjpuPylTmCPrqp7c/f7i6eH59NetgM58wCJcex44i/Vfxwu5CluGGOGCwEc779UAjVa9rhCcaUXO1k9PeWRDm1SqKLU4NaJsJ7LtwQR+f/5rLDifI3+ei+YUrd4HPWiJfNGa7rv9bcqvCDIMZjRdznei1FyO6rDggsPU0Q8vJrHUMSbBqTcMwF89JAtjQ10JexylsgL2I3nszp/nVjNkM9ap9Qy7gxXLFxI6xxG0GLTM6JdB7u0FRhIYV7guLc++3371Ry7QGMM4v+eG8j6U+1FNFQb7voq4GZdvwlfyH18cfFkaXElpe2g4oRvWu3m24VM9qe6Qbb2waTcX33h4+9+bEe/uPfzz3Zl3hSakBvKGu3tEC/sNum8V2UXhT/LATke5fG1x9ml8P3yGS4UkHCqPqbxGZ2xQere5TOUSFt/r0K/pkpN+f233+chW3otxxDVc7YKeCG02P0G+lX0emnjerFYZn65wxT6ooAW9LhR2V9zKLgVTDsBStBdQ7GeY5jkFAH3KHwA8W0EQC1bz6v+DArjACmZMb2CzKr7PHzrIjbm/Wcng6tJbjWP6CyANmD5+2SF3hkSvS/2a8dtSvPn0BS2t87Brw8aQQNAmrLeCcIJczpYQ8capgRQ5btQGjDCSNr55sLaB07EVGpYW62oI8aFYd89cX9JpHvTxiK5r7VQ5k1pz6XqRxTLOCr2JWHygVCtZx3AsRdwlTXAPgFg9PG5uTKDx7KtoD4IrZcEOTW3lQ2eatgG2yT/CkGg9HdxuWgOHeG+fNRPUreg6T5ySjeAx2jto2B1QrFkUsOpfmrB8flxnKI2g6q26twkg3UQgVVGoH474FsqxJAFj91YKAmLnMliW39xzqoXWunZYonFgmqDAx1KarFKQTUGZ60kTACIo3NL8F2/CP5qT6X1v998l/MZaBbmSAPYQeeRoX5BMvYALje5g1mAYYCg3zFJQk4us1k4eKO5UkDDREfpOXO6wzcIdNnvCQiZBs6CdGihgTKoC7RZZQwaFlI1MtBZHHAztesMCWvjuvVKmo8bvNEbbpQDtNqWUxtSwheX+RblcpAFiZHPzAOnSwqTJCJ8/snNOXXpY0iVeOPoMFCFyCv1sQ09i07i/SHFatHNW7FjgRKU5TUW6ZtLUCT0ToJ8pjiqYJUGIT2MLouFD87KQ4m+ymr2U6g+qfq5rLOXG0yuyfFZMNRjv4wfNplyPbWQISZcKWcuTL25xHPv5Z6GnjrrTAGmHrkkeY0yu34Oz4n8A6KVLyIk+3hzfpnLzhyeEbCjP/TsYD1U+l5QS8VSJ4iHo/TYLIk8vQns3J0znBv18tnZrEyzTnfwIZGl9nNES9OT6aOSF/YbkcRA33zATbJxdSOsUCArhY5tTJsfLIc3JSPzmtn5wRlqBizckTmVp2klQYQZh8W25/RQ1EX3P2VPruNQel9XAGFh45JB6ALbypaE6AlTMNzU1aIaF305GczcnfjjQkV3JEk7s/AbmcaN39v8+G+l4L0Ohw4x+DXN0zZMKdSjjnYWKzkpiKUshyB1wK2sIHf+YAQWLKtXxgYAw4ai2D34XVlEw++5HmlW/oKOp7EVgw7e/n8Y7eFz+v10YvkyiuNBQ8dI7DUDxaQ3AueE03/VzY3gfvk6t6Bd6mEVuAQGuZ7XKawTI/b7zpbQrLUM5CXI8gPlJEezk1kngGk/ra205m/1r8TPoH/H/mgNZstw2DuYgx8lCFML6nIhD9VEBCyLIMIObLwh7fu2a3KSMfX3mgZmAI8mnwq1zBgh/TOJp16NMoqiZEIjRihYMDGdyRKsN+cNASx1NWLGLIkMe6mMf3JPi1BNdZRWjnDLd4WmjMCmsFQZqibJDb2pKsx9UgrOIbT4WOxQESOigqxpycIZKK4sYKRCSUipnO21DDjgRbKJyVdxggb0DkLFdVPEoqkqLUMtCPIAi8QSQXMXRS1SbKjUWWRVv8V0KwMFkkME9QbVBCmVM+b8u9QNGglahmIrMJ7nm0qdlIh/RMm3NT2d7I7LmsoNB0TSWxHMqmwHFnpvGooJ3KpiH6xtomKR3IPPTMzdqAtlVJO5RiAcx9bsNMzAxsBXqu3zxaRjwt8LiQb7FAB799gpgGnv1ubaBXxgxvRRDSjIPbx0qumeWoVdEYwnZ0zTWESg7hylpk7HH8thW/Axfhql8tjNkx9eJDlZ7vqAbm7V2a0XSwlEPCO3WjxfSNVaMuNehoh8bbgHJIqD7dyCvdgA0P7OJQI9DlwF5Lfhew5YnBd+H3QsDir5RmA4uD3KMVqgHCi+2YDuVfo0PWQIdUSBvtb/moBulzaCrQZVtTdUg+1iVSmiIVslzNpUqqkE130wrUvUPX0HxjPSoqvnoYM1VIk8ZHsAoqg1PcKsnCIZTvCva/aiNVVPujhFEIk4KuiGTBlLY18zssDGxjnvYCD+xkLEgzoj4yIu9B0OPpoCdmnB7FS7lX0iKyVqcWmnbUgDIEyFOIPsW9720hXkQbNI1BZ6Cd8BpDfXwDTJ9qnKhaongpAJW5ciNyO5yoAPsNsoZa4/mYFQngIwdCCTqOEcJwA93blPjvKI9mDpRJOoDPKSV9dFJGR1N7SPZllx5d6HZJUgl/ok1D2VWI2q/o6lB+tTqUjTqc9KpDOVUdyknqUE5Xh3KaOpQoQ7HMqPIdLdLXqtKtH/xRelHWenE6VS/KRi9Op+qFxqTspWtHnyvW0A0EyOYqYq1keCCtjgi15UvWYTgWr3dpIVSXD9hF91PYo13DNG/e4mqhO+dzWncLp3wj4dx+CaJZthDmIHcxg7ADLzj0D6XJGFYVIM0xr71Bq2GkTtGY4fHhuzQrM5fK6sDXGQs5jWU+SG3mwJkBQB8T2Kc6VLpsiwrrxq3WMnPOiKYLzf5fnqjN6gP94U7aebNBWnU/trmmd+Oiq2CmiU4DdouO3rlV0TFwPANUfJ88eNgVH6r7qb3sIA513Gk5perEcIxcB4skczbWrVF2Cf5kwA+4LHGf4Os5B4qipFBnx2S2DOM5rHkkGccdApUQPUqKfy5UEs56nYQsF10ZdTxx36x/PV7L5ZU5xfNzCN1fq2IVzfNVtUAO39d081UvPe6oejn9n45xwAMaKDqYx7xgxVuXpREvODSoZnZxoyffKatyXC4/iDBI55IXGYwBX9ijYJwvXy6220VR9KGd6A0N4TiMWmYFOs6sr5fLnSEz/e5sVAIVzEMkoHWZ4NRGJYApjY5fmyyBihm3Z6uwTPNtfSQdmGz/1tdVU+VRH2dam2n4KmvXCXZUbZQr2pHwdnigwJ2mrmEasHQdgY12xM7V2wyuTkORjnMYqqhf9gf9l2u1nt22NbyBREISF26Uv8PPEOTUSMfodAl9thA9+yduqU92AD2dbO1viLsdQNVM76YKid5NFZKCnGD+3U6PEZLTRzxMSPSu4yN6ELS6OWq0ht2YNvu23DJoJa8uC91meeQ8XHt1SbqJLYR1nq41SL7x0RqP9GO1lp2RMzXtrXc8WlMVUFj6hNtBfFNctCUc/02ytOC4kgcGIbD/LQ6pReXPOgCoTlJFnuNB3ZZh+k8EzY8XMb1Vv16ztSD/Iu7GXy7gp55a1dEj/THsN2nm7jxcvaBD2md+x0f20Ub9KtZ4+s2EdKbgrrDespPV6uk9mntrBgJq8SHd1fmoV5cLb+5Cag+teg9sfGQG4EMH1un88HHJrbc2LAOlc1Tae2ft8PqcsLPDuEfu7dZ1z8+Te29sfGryLhCVOdAODXvE+uttY4PtwI6O09njwUP8GbHIM5SC7A7VYJthdkjoBSou71ejn3VqH1rnqjlrc4X4WL8IrS0PuGV1rQ81rH6iWvSVR7ZIvvH60LyNOHOyNZC9q3uO27wJ6TR6tXKS1T2pgR31BF08o/ZvDcU48zSwDUQI+ly0ujRe7NQi6k6NHJNV6eQqEcKPURyrDUJ218pwQ/jJQrGUhb52Ka7neR8YjeRKriqI6isveCJU7kwrDCbp6n8AlVFLiDnatpBYNwScwhbMusjCrgTBr/4swPqKTFcU5w0XznKMgBf1GYthj23Fha428m6K5i4Dsyx2K6oyhDkmhXnSzfUHXLBt4csy/XBlUK6RfNHGoF+/YdEGBFj1bz6dke/Jqarzby9SUKMx6gS6A8L8cGc8uahS58Z4tMTzA4dj3QNiErcHhA9xPE/d43Gnrf0tVuLKl2/Jf9SlOkoxjTxkTUVyYcSRazM5qA3JtEYNCRqRI5dvQ9hZJ42UyhNNpqUK9oeJ2SkpjVqSTicF2zcNCVj7EiBC1bc2KIes2resXKMzWk1uNG0xLnvR56zylRYzDi0pJ0x0OTbR5ehE2xB9E12OTrSNyTHRHWJ9E60nCicT7CYdUcplZ8odUmsn1TVOo9XFlzbx2j09pXvay8Fp35e5sK7m6wfrvRIptKt+ujkBWGlEei3diu/dw+fgzZuDSJdXhaO5Eqh7/j+Oo1vIW/RdQGSTsyXx2nwHs5aFeXjZLw15nKxLQh7z4h8r+JCnrvpw+wCBA4kn2KQlvor1AznCm43UM/hbooDMpwWDSCZST7svChTmHUvtu74dSPysvc86+S+Lzybl5kFN9Ev71nEHoTky92vIFnudyUN5oLhsechnHXnIp6Py0O+QmiAPjTwO36DcPPgL5WFfcTWm9wPSc2HTtF8eF++ZyOr7sKyzWhkkqEimpwXnoPU2JgcupPSuD6nWYiLVWH91Weg02qu6XEcyZhDcvSlMu83LcfAxrbd535epTUOnDtVIbaWf0AWF09Eokzd92ei9cMzBa/fkYIjNXuhJHJqHoXKPqC927d1nrk1pz9w0COoXXa0bAZewSjq3bHjPifb+qfYqHfSlZSwKc5Nm7bZC3CDb+/HOhkrLWlsRDG4n+rZGKky3V6ChilkLm74xeTgyI5SdVhM4pdBvvPrrAVVn00vJhoW2k1dxGOHN3IxULMHtghXGZOpN5MIRA8tXKGXZzq6viMeBx9KOwfoHF6wVxoxAG4k5eT7oH7lBVFrKDWK5XqdFmP61H8R5Rusm6zzrdINaLsRJXh66dK8TLTMpfpmbad7Mh+/L3qsXr9GhkAIPXdc8NN5rr15K91lwGwAevC44x2L6A3lRK0kTImSlTsjieGa4nZYmuMX2R/Omfg0n71FoQd03Mto+rL47uL0BQI+8uyh7LljrOUJ8EOqeS/h6si4PQu2+gM+d9ugg3vt/UEsDBBQAAAAIABqXiFxO5vWRHAEAAJ8CAAAcAAAAZ3VpL3dpZGdldHMvc3R5bGVkX2J1dHRvbi5weZVQwWqEMBC9+xVDTgqLxz0UvLTQ46JsoUcZzaihGmUybuvfN+pqu7S0bC7JZN578+ZV3HeQTpkc40xeja5JHJhu6FkgS0fXPI4ivQ2CoGzROTjL1JJeP8NvgOghAH+UUmdBq5E1uAUKxdKHDqVsjK1BGgIchvnuKPaEYGFqqiDPjTWS56GjtjqA0IckSh1gQCYryam35As2HfKUPGPrfKnR1sRrdTUxHzcOxGEU75Kz2KYU7TBTbXpf1IXuDcSOJOXe68gUqivMu3nhkW4UVgv/Cayonb8FesLLX2n6tqlRjE/QGU0F8hbou5EGyobKNyxa8mmj3B/n/Yltiz1tk8PbPH4uvuzpxyqLl3w1r37RG9n1vFiNy/UdRcEnUEsDBBQAAAAIABqXiFyYQ5WDAQIAAHoEAAAlAAAAdXRpbHMvYXJncy9wYXJzZS9hcmd1bWVudHMvcHJvZ3JhbS5weYVTTYvbMBC961cM6iEJ2O694FNhYaG0C23PZiKPbTWyZCQ52VD63zuKlG0Wsl0fbM34zcebedLz4nwET0LofFTGrQtg4INWByEG72ZwQ1AeF/JN1x3JB+1s10GJuHEJcT26JfIH2pymee3eCuDnJq4CWR9letfFx8aC6oAjdRZnauW3h/p77kGKnRDK2UGPnXEK4516t3VkrUZZlWOdA4s9kVla+XlCOxJcczFbyCgYnOnJfxy0oRLxAeJ5oTZXecI4belZhxjaBzSBKui179wBz+0Pv7LpCXvcG7qYu5yipwFXE9uvzlKVuIjFu1Ti/yT8Pw4F/4qElKLwOE1aTVAwcHYrnNBGiA7WQOJxAOsiBGLPRDa9rh29xOiQoH0Fe+QPuIzKM2l+BbYTTDxleAD0BGhOeA5w0nHS9/G8UE/cCI+IVHT+LLjpeyNJHoXG7FkArcF53yOo+JwU4XGu4IhmpU+QB5OeQf721IR1v910hcOm2mwKcvfn6pSgh+wD4m1BKndJskt7IHvs3l9DzbD6Qrv0/oYe8v5f5FDkcU8PeX8pNu2Iqa4h8p3jOto7O6eRHdHrFBbyILcN/9w1bw5vZlMvpcpFYuOq36HFiJJPh24wOJbg2wqZxE3TX3C1rLWR7yWLDk2SjQdtI/kBFQvJhsiM041i16wtQ34+ytTSX1BLAwQUAAAACAAal4hcV5Z7ju4AAABTAgAAIgAAAHV0aWxzL2FyZ3MvcGFyc2UvZ3JvdXBzL3Byb2dyYW0ucHmVUUFOxDAMvPcV1nKgoFV/sKd9APygClk3tUjjyHHL90magsS2SJBL4vHEnrFpiiwK1vMcwaT8IPveNIPwBDwkKyaidLOST50Rl7poJGF5zhMGzbGwEzMB1UJtA/lYDgO53rM1Shx6juU6r7n8YSCPP7AFJd3zMCz9juhm+o6fmmZrvkGpv2GycIHT6ybqpeKnHXFEHwvxykGFPeiIYGLM5lfBjwnecDQLscAH6VjyCSGhKgV3UE/n6DEXbH+189+R/MH+A1wFjeKqvsLgJC/yXl4Wtu61q3G/ktqv1rsJ1l7Phx5rrozvcjTTIusTUEsDBBQAAAAIABqXiFw0cb9SOgcAAIsZAAATAAAAbWFuYWdlcnMvbWFuYWdlci5web1Y3W/bNhB/919BuA+1AEdp1mEPAVJsWJsuQPqZdn2oC5WWaJsoJWokldSd97/vjh/6VtIGw/RgU+R98Xe84514XkpliOE5m22UzInZl7zYEu7m3xdcFrOZf5MbnSpaMhXnlBdxKqRmMfvKDaGa4H+S04JumRoyVIYLHaey0FIwJPfDKUoht+4HafF/ilDvtWG5/0NiN3KbaRtsDdNxLjMmwvZe4MsLb/Osz5PKHNgyHWfrwJCth3bUZDkzNKOG1gM0J4xv4QsT/h+5aGoA+JFNN8poUVFhNdjRLaTpjqVfLOY4mASSGQOet4CHMWDygJxLdUNVRjKWCqqoNYxspMKjwsiOF0hKjCSlYtesMCTlKq2A1IOmZ8CnNbky1GgP9umMwFPCNKhwy6+V3HDBpgmumNag+w/Yk+gReCZyRl7KgsFExjZEG6rqE7mIHMNWyDXAFnyOU3xDCmkI17wAliJlC7+6JHjM/Yvnx6fR1lpfRP312BoA82EDLWonDK1MEl5A4CQLzcQmIkdP7BYaZTgdJxqxC3s5dWH5EQmXHVg/BQS63KWDdpy/i/uEBO2w72nuOGSC08bbuOZ29NXcNTAOPYtKg8bE2aUKsgVNUzBIQowrRjM8xvif4FrNjy+gqV4AUqP4NfsNxi0PwpHYQtwaoxZItSTzbcXnS3JOhWYtc/B5QF4V5AMvMnkDhBADR0KC+lJUW16Qp5eXmixYvI0hQlS6O05PHsWZEBFZM4gh1hP1ev/G/AJH0W+UZTFxc/Eb8zuQP4Q42ZudLCDdGlYg/ATPD6eCf/PnuZG2uLp4HRHwAN9wpsE2iQghsoYRs6OGrAGJL9qZBrKfCvAHWH2zYyDX9MSpCgJfAK8Cqy5hkzbud8xtcsOVhovgWvJMIx7PlIIccXJy8nPckWPUvgtgy6+Qu9FvCfwPSTZ2Pi7BAkAuJ2dnZH7Di8c/zYfy8Ollc+cQHW6CoNJNhwNqtZf5qDyYj8G96N0EDEhunM8TOBqto4MP+5qy0pBn9g/DZiDP5q07UentABTFtCyD5YJWRbpD9WPKIbgqwV5Kcy6rInPOwFt6qCXXWwgJDWedRQSoFCtxOOaAuT2LczhyyDUOe6ngRliMLuEzf/b27au3p+T5+wvQ9FfF4LbOyLoyzdm32RhzsRAQAKtiVcynxV04Qjit5Iab3emtxGCdi56jnJS8DFqc6jsUvcOYgOiGKLhLSe0ycnQE7pmiHkKMD2SkShWDJUW5ZmOOvrCn4b9w8C2em/Yaxj/OprISmXXdmjXZa2rrm/lTyK+Quk/J32DeP9PYz9+pPaj0nsKMk7GSFRkrUshpS9Qf3EI+94D/PKp/uPERyJvgclfQ7BZ6e9FhFr6UnVsEi+pYC8bKxeOoS22hTgqas0V/hadfWnPtqjrWu8pAyimwpsDFXyGjw2bNvr40ezd9U1SMVVcW3nkD0CX9xsW+dZ9AMi4yv1ttPd0VQ0LFFI/Kg4QxWn9gjHeLHHymCnbPHLJe14JZR8S4trMeTwtdt7VxvimIfSnUQDtWl94D2q6Y74XWW/NjkOqeKods14AxZIOysx7tFKKefhLJdlHbwnPQJ9wHzZaQESzf7bgO/YoeNCwEKiNbflblXfC3tzDuhAc+Q+NqLq8hbYI5PGPWzIDJEgARdG87b0MqaKlEKKhsVft9bkVjam+2ABj1Zcfysw79pD/bPFNe7RT8jVfbxf69vdoWMuLV9xovpX19J0FP6uCzgpxJZMMM9MGZs/MY1qE+gsYe+/bbfd3Z2LivxwjPOlZPQdvhaZogexv0e6BN3Z/H0KUk4WURhZYf67OPHcPmpdQmsf3/fNldget3fKGkPBtf0dAv7AdLn7pY2GX37aGzbSa+YwNY24cvJ73yvv7K4tsZYBcshWIDGjpG9b002S8ofT120n9nSfDaxcr/PuKzdU90tu6I0b1T5D/+2I9s4ap3l3tdNPSOhP+Y5ozYAQ7gODcFpriyTsGZJpYhcU9r4J/hwo8MrOyFfYcayw0SsvKy6/fBIBrwREMaK/yAUkhEDm5AVsdeeP3eH0SHPk90GNJ44Qf3C9MeE7cv++4Gh1odTkSONIk8Tz3ToekLJ8hAvMzIiwYjGuFOdXTwsDieJMxEbZqB5WT4WPMay1eWqA9LjWGLJmAethh1xB6vks7ej1dIsSIw7UgXLZ4hjTst/uxEh+OObLIKC4Hi2FKswgCGh5pnSDPZm/2fj4tbiLpWBNdNwjClCwYlpfuWjVGcVSVL6jt+EUXkCXnUS7B3B/0AiPnHtYQ2bc+EkDefPlBVYMlBoW3bwVX16vzoyvdP4XIlN9BTZszYDNthxpat3141Wc1+v7dGXGEh9ScV0DNO9y1ppRSUYsm9i4fnzIyUCPYrNUx68VBdYG69ZqFPam78iw2hJO+w2QrR9R6ZZLp4aLAb02aJJVoKd42BCgVKgPGyoX279zqLeHS3s38BUEsDBBQAAAAIABqXiFx9JW+rRRgAAB9kAAARAAAAbWFuYWdlcnMvbW9kZWwucHntPF1v20iS7/4VffKDJUBmMLO3Lzr4sL7EmTGQSbxxBncLr0HQVMvmhiK1JBVHkwtwP+J+4f2Sq4/+7qZkZ2b2Xk4IYonsrq6ur66qru5qvWm7QdTt/X3V3B+tunYtht0GvouKX72qymEu3lQ9/P9uM1RtU9RzcS3h588N/JpfDrIr7mp5dHSkurSrvuyKjeyyZTEU2bpdyrrPtkMF/3dy6KpPshNFL/T3uN+qqgFqr7sCGIkd8G9+sPWqLu57bE5fDjZvhwdGh74cbL7pqpKQoS8Hm/f4Flrj38ONt3dAfIKuvsZdNsCizdDrv4wJfY3bMsnLtunbmqCqr8znRLtBfh6ybtvkRb9rSi0C8CDsUdZF30sg3krhrtv+hL/GMOnlMIBoEdL6exqXorsHqmyHYmiBPNseOKSRkdDzZ3jwmmkX9l8XTXGPNFVDDig7qu81/viJG8zFxXk5VJ+qYTcXPQhic58PbV6oZ2NTaFe5bD6pPyQ19G2seQ3ynW03KLidYtU9zKDP1bO9/eCRlE3v98PXR0egsOJMq212L4c38FV200n/UHRyOZmBNhKPmCFqzosjAZ/JZEJ/+SGoiRzKBwAzFyyO9LVolqIs6DkgJ4gDBEq0d3+TJQggwXgla3kPEwEk6xqxLAFJ7MN0H1pReFQXVQNvmlJmBhX6spQrkedVUw15Pu1lvZozhFyxc+FDORNv20bOxOm/0heelzs3/FwCtKqoq18AO1BtjxLZkWl2DqJmAeDHG1lM3ZFnC3HemEkgZRCyhxuTfdV2YuiK8iMSI6RLlsQXp83yuhATF+QE5uvjBMDdBtOZDyQHZuRgQfp8CdZ7QTb8BmR8LiZEhMktQPzyNegEeA85CYNcLoytv0HTf6P73SrSM/n+BBMDmQVt0TzUAxMPiT9ed49R7+Ww7VC8RQ1tkJYoQ8qclNuuk81Q78SDrJdAcSK0mn/mkq0jMARjmph99qmot7KfzmaHcM5Bsp+C93ldFcxg3VP8z3/9N6rIUtztCM8ffr5E2acFTn6SjDtpD6KZQp8w1/AOYooTs6jG7PXwvdre1VUpihJlELAm0QSEKjD3HXBYYUbEGsPMp6nCz6czGnQwaOO4znH9LtJKe17X7aNLOoAmlCxq/KAzINmB8al3HqLVSlS91skptpvTbGaBWscTAWnG5qaZrFOwkGdPgvVlnTXFGtR3TUReo9gS2gB1/fUopo32gJ4idq+RGqQi2LXsKlJQEETy2YBy51eXYhpKoZK6tliC8coic8P6biYyBbRLCWjR47MP3VbOvklSm+06Z022UwN5S+o/ojq0Awgi9LpD67bSVgB1P6nsspl6eMwscWEx5KGV0OHSxVwBFSFEjGlL0vkHiV6VIhwvdpbG93V7B4jiyiiRzBr4ExUHV+qp7pPCuQ+Q7hfoaqNy3z5F1RXuOBTOsNsZWuplm+2WuAepa0jJ1OJOg6Vm8cWTe0XIeGY3+ObWa4sj4VPUAjOE1wLUQjdIWRndTGnOn9APxS/snJIiLZeabp5cewQklUIKglejvLsFxy43vgvI6Fs1xEdp14J0Ufas3DRP+WiHJOcJUCPRXqM147WrRyeQFgAD6EdoWkOPTV2U8qGtQUu17IN09R+rDcVi2H/F+o9+WScL9J2R09v1eqd4m/YqjtFjBi9amskL9isRrxIIDiOSc2F6PFbDQ+BwZh8k+qkgUB+K/iO5HlOPk6FfmxWGsDeTdVE1E5DYFiwdDIhfkVYTKy6BdUW5aAfXEBvaJq0xfiz1z8SN+eFL5LH4LhOgIx65N2Dtqs9E2Io9RgMLFcSfpu2Xq35nKgJA1S6GAVzwVxdvLj5cvMp/egff8qs35y8vfnz35tXF+8nsKIVxjmp4hmPZac6OAsS/z8RV0Q0V6rUzV7CprTiBuIWk44RmceJg2Z/46isfc9M5193U4LPRqbq05ZYHFR0nFTPpWFyDSCN/ixqEeLnDLu22c5Uj6rTfSsSD4Adj2arZygQGLx9k+ZFwjqVgLu62YBIbcDsrdu0Vl6s+kgWFWkIkkAm0KIDwdkOP+jSNmyVkeJTuGViTKa8ZYXswFTINKc1sB1QgYn/I2K6BwSiMH+55F8gJKZdyGWlrcqgYLQhYs6pZtdMkwqvJObiQ6w3ZNpBrFk40rY4HCIxbiC/k7adHnX2dRNBjsmGCgaWZshCovTk+m8ZN266CKLuoPTWgBIV9ANJ0c5scJHN77UM76m1wY5vK6OF/cVPlKau1ENF7LKrBJNgyx7+IOwP//P5pcWLd07gYh9HrmaazR4KYmt868WPxz5l4iWuh1Ctuah1F9Wu3g0lzhLKbVLjni+5LvSgnUGCZPZmLk+xvbdVMk0M+TW7drobbN0mcyEGcfpnoESYLskqw+lZL9f1rPADNxjHoSVyjXrHsp8UlRj8yQ3/MxJ+3citVqENR62pbg0kGButosDdRrEnY+VA+PIDJprxC1ZT1dgmyd9eCX6NjShSYmFN+jOeMnfPYKVITocaWwKe6uEzDUDRjDFJL6tu2W1Oay/HwKJ/5QkJARTP9OxEUyTXOQtP5TGFKJlE9nOovKTOl01a4tKA9o9Gm1gOMpxEwXQdMUTsbIcGauSk6oCmnSS1ivt8fePDJIMl8v2KYvZ56BQutuMSQXa7By0KRmAswozrpQO4yOgI1/FTia53ud7h98Fj13Afo3HOGhYBLtB9VST5326yqbo1LBlAYfHhc4Bgm+HZjTvzp6am4HuRGfLdwGH7ZbMCywTun5evL/1iIi8+buiorRLrYbCR6hWvwT3EFPUHJegRh6Ugq9WOargFTlJxcONN5NWeZ1D+ms0w3o+XPigaK7kiPsl2vUSLPzsREDz3xpVoBzRjxqW3my56HK3MPhU/lWlNSDC2mCrgFtaLFyNAfVfzWk6ksx+yJ1dtqlbMT5LrBDoO+x5AdobEB7sW/FZiTAdD422NWSCd2QDKWv0Vg0V6dX/z07q3AqAIzuo5I+hKJMoaChdoOmkMxDcqfF3fix6xok1dW4JmaEhZWAEwJ6xRsN5fpcyUmJ9PQA6O12HFGKPOmQ6gEUWDVut9WEDq+LsDhnYXEwVQXU4Y3KSwCVW9iDQwKuhYiXi9D9qkqAmCBz4LJXYzEbdJUqTR8W+N01QackBBzdLLeZQG86WXz9y286a52L7gpCGpbfwQzgZKEGRtyuT98+Mu/4CComD1EwA0paIFYBhCVkINpbRmLts+Gsmfyia6o0PpcvH//9p34IxuJF+ACoa2QXdd22WxEEHTGcAEE2hS8Y2FmSbw7tZTlqfx2AhDGMfIzyBduy9F6siTvg7ydz5lZcz+bhZXsDEFVQxmndDoLswCv5KrY1gOn6JE1nEzxDLHYNjXaEb1oir7YIVOyYOUizvY5OvXupDF1Gi7nyQnFK7oSkfKhrUp5RrstYZPHh6qWlCPxGqcd9wgmoKd3kWk31fh1OT9OxAjOLAJQYMfftpPxkfdSiZR5tCvZBH844PaXybWGgJkk8yO/BqenHCZf9+NibIvZSGYIeyY9OnGLyP4xedxnpttjaowF+vqjdvdZFWgfOFePYFHZgJAP06QI7p+5LTjA/J5E+4frrM6wBHQDOqW5nfJcfyD/ZwVtHxzFMykHRC6LullrdUWYoe5yUttmCqw7NUkEy99oocaZcCzey1PAlrDWJGane0mz6PdMYySeJIgIxoeH+fovuP2R5uRXFchkT4klY0LYTVQnY5AeKdxXZToYL+gPC6AJBkDo7P3ZhB/XlsvAsnPwXa43sqxWFRDq3Hhpro9E2JS1LDpt3gkNN5GRJuVq8pqWLTs/FNmiAneVCBjM3pKO0DVSBSg64YElq+NBYrNyoLU65YqGvso1kJZ5ib6JwLk14rHY8XKkabZpN9uaaiiAbNTclyEn7Oo1QPRu5+KG5mHXSFYJwC6Y8a3DORWBBS3MaxOGWbHIUU31gkF7fHaevDyhOUvsmgK2XGcyDR0HfOgmsVTAvNlAOKgqpYI+WFXl9YDfVHKlkXyQNSpxADsyWR6cWL+TW2H6Y6md3hiz7+MkCc3bZZGHSNT86xNskbsIhNY/Of7k5q6tlzDH5e1f2q14KMCz1fSy3g+lUkBAf5Fdm928MF1SdmZ0uw6/pPfrbDAHtMP9Is0LcQeesvYUnPB+vOxH782lEtioWJyS6oMSiNTmHOWQIPp8aJfKIT913X8EtmxlT34YWn+TQWELtbfGyJknCQ1ghdhOcbqzhbhckfrMBXkItkbLVMkUKCxOHYA2XiPpAz9exKnr2pROrLYN20fa+ONNj/ZThfkurqDUYJ6RZR6bK748C35b5jsG6UBS+vnJaLNIrCbXIIYPXdtUvxRqXVhvagmGVPxMAJdqgfCh2aV1X9BivZPxUd621lXBROa2WSLQI2aVjl50StKzvTTVILw5VDvilSOEBtyEuVNnQdEjOQs+t5kFNQsBKmNZuWfuu+/P2qkaB7dmbNtUgGpcOqY8sKLs2h779OxrlGadBgQMXPRvZfdJb7e33ZJLUVZVByMZUcOsVNHZEsYQveemUZHO/v6qx4aIBTEE9qPV5NEodfK05G0RnIi23LLptx0/omVezXBdkLk00BQnVUVT6Avi7q+H8SyqD7pxIHBViJcd9+frpMedbre+lG2KavkPknoa6rDYp/MMvw9KrtebQupYl01pdDxUsRBrP/32lWXZgixfxZiP4goAnweL3r5qrVFmhgRGrA8R+VfgfU2gn4v5WHYpgfteM+0hnhoo1TtJod/G+uqSXmOEPQSfa8+SlBtD1HS3qx/KPZf5rsGImzmvi+5jXvQ6ppLLVHXfwanOPIn5CWDSsgA2v1Z+Ltfa8xBerZyGnP0aY1/ZYjuTuGRNV1Htje5zezNhjXcNiGap6hPTRAO3hAjEJiTfIXqhOOgCxFFtc8oIe4j9Wo4h7rDG7HekpWtNHQNuJjhCgW3zj6EBbq/1QwXWRnkhWFmEkcJODpYsvwMF3AkGNDgWLzGRIl7pmmckCqeAySybjjmC2zo2Kwq3KLnT62hB8Zh7mbyJtzzoUr4+LkJm3Pfh4fCQmylb/BsjHKwLT0R5DJcI6SS2T5M/fzrPFZSYyiEmCWXhlrgWPZXK0TDJzs4QnNbj1NX/AS3c4RME4NfWI9wnXaRXLF0nrO+6FlNP/4Qc8W9VjhiXCFE/O/pbovpctUhnawN0TXz5BGkKenjQRnfnR8Cq2uKDlaRP3q+xmASNRzJcHoxUfgs/pD9jL78tR0bFBvGpFSpWBYJ4aJmnjIdHGF51fDZ5Z8dcf1INnACTwoUOpT0tixwQmw+sTg9kmuK8b3zwLcpnplNNcc94fyWgFH6elZ11MrNvWzy/1W6bQSWMxHJLu9aIgejLohnNyUaTttvGfBx7R0FljkCmiaLku04WH0dTumk+KGO+T07HND4UpfEc40FmO5pJ+ewcpFrtWOQg7naf46n7F/+/RfHMLYpvFfdfvRExiy2Gu+9kJcNn3aEMjs93cwgufs2n9/FA/wf4Ow15ahrSJQJ8pwA6BK87Kflc+48sFaMdKTNPlwC0T+tA5otuUlAH58eb0kUIfC/CWFslbmGKOifWanUzZX+Berluw3u1DcGZS+re201XLQC2asMuD7Q7Y/YuKtyX4W2drt3ewwqGCV2qfwPp0cliBQ2rpCqIx6Sz91DisZBeHfvYsfQVtOeDRkrQbrc+hqyxmTtI2z2BAtdPD3uq4sIaNLwnA7VpXYye1vpBle6ZuxLUEcQWz5vjefpPbYUSv5G0U0ElqdaChkcabOWlu0t/7mXPDTUE52TLtoP1etM2S3UOg1PGNJOWD51aZ0YZVkPQqET6WFzRjRnvi+ZeCn1pg9tiQlKckxLkazwqtud18Tl83cn7bY3O8Vj/oEEMQW0YjEMIGqRwaORjUe/DwWsQQTjGmHyEPLQg9lI2+Z0E2ZEhbPu+WEHv8LX8vKlwXUl31m+TXdUG491ob6dBCsCxuIbFIjxzMcEVJIS0lH0Z9cbqLDLFAUVwIUAJDoHc1UX5MfHimKKtF2hdxUsu30pS2uPzXhbulbE9Ahwh9hrs+OkdVQjvZ34IdAWTyUHrijo5XPhQheLxC2ChisxHJuw8dk4o8Bo++WuDFT/nbO14ApgrY8sFryaB3cFli4rg6RAengNsdsqI9OIRK18JsHPCjLxdDuilWlhM4aAD+k3bboztZxPsmTU3/KJXXBATWK+wVAcE0BQlz9zCal4O1PUfdiRTbBBYbw8s9z2z1c5zgjDnO03C4zBcUVXQHTHico1b8yArb+g0gVsnhZ+qz/H4HOZC0MnngfRhGPhHVCMK4FBzWHnm4uZ2nijDRM4gkbDKkVQz9jidweL+x1zXhUflzXFLrbUvjJouxID7lM5uLh29ZLB8hoVuv6EHSfyoHtRRe8c2fOUjvfYMMZFj9PzwMYoit5n5zgCXYwOatcRgC70BdAtcLLVjEBfZM+hLXmnBSVn3lBn2pjinoWeGQ1TW/cg5ZUNlED4MSGLoKqKz2KeLRB12UW1ywK53SHjSPX3yVXk8XN6Cznu1JE88yQw+rs0jxOMvq35TF7uc9j3OiHMQedLxq+kkR66JySwbqqEOy0nxw6ZmNfnigvm6EF8Iw6+pCs+kzfCnTUxpWt/4cJe5IkQhwB3qi3svlcG5kgi+P2llHSlqdxxBOkTs1o+odqd7Pn9tJm68Ehxn8bKm8GAWJbrsu1Qaxz3sMnaOxmlS4VGCnJT1zGkf3MBiX8yFvh1uRrUy4sa+u/VMMqoGapEdIboSwBkBW1NGOCHsyWnow0TxRV8EaxZW+aaGm5pkdOZnRJ2rxDI3rTt7LnaEShhjJXukJWIXZNF9aYg5tEvRUO8qxZSKk+khoSzcX00sf/Y7Z8KpVNxc6ByTF7mL/0zcmJJOi//slAV6t7yoKMm7jKjfc/+QKmp74g1E6oxzFGCHlNVQE6sXqo+snRqasRymn/SBLpzyAVWWtXQInC6EP5QbcSnCZd62BhPzR1SxyLD8s4Zux+CmieQRwvgIK6w86szmeC9u4Nr/H7ZFtxQv6wJrN79bCPcUHJVCOgVj2j8JivmJR3psKi717oCZnL95M+G1sXFvpBEegwq8+8ot7YkvA0koBiftgtScm5WiS6dsJTiXvvgD3Y6S4/sUORp7FsEW1fNOARU0orB2W3V600qyPj4QnbjYV1QzTuIEPL1bMXJ8370hLu7teNxj+d1D6WMvyOErfcB49GRNwG9UHghYlh7rbvttPdhrCQpVjedWFquTdS4NWJQ8MRqdYzCN9EkNigke1PVD7uDM8Acs07Dyb6pW+Eh9b0qEPSSVF5jSh6j6+VtEPrJrNMGE++cdekgTI+VHH1AXr4unO68v356/ES/Pry8W4t+BhNteb7Gouhd7IMkEYx1GqbCgIKkXDiy8o+iySbAEdRA07fTUMKPo7rdYJZW53b8Pz7ALSo/2qpC12zZPA6WI7u28+Go63S9t81Fdo7MAJh0fZIeVhtkT6Ok9Dc4iLcxOFoxerXY57azws/lIP87NJ7ryi/29OYcS9dUpnj09mZdxVxVGHBgVc0eJUeFxv78rxcJRT3wa9bN7N/u3XtNJfl+jopOmS7AkSx0t9TnI2jboMnQ7WBpFSjGdM5ckZTnPKjlj3q8Mn+rDhmW72Zm8jZL5XnB2k5JRRKCqLPw8t/6Y22uecX8QHoMcbY74uIUEPs5gCl5JPoDNldu4zDpo65sF9O7YSa9ItYeIVROo2PjtUQprv/kNw7md6hapO6l8nnE1kGL9CNuc8cIrnhM0TY+wRyo0+EznhzCw5Zvp0nuepoPJLlEPiCl0GR3HCub1U3Asi7Gjwk8sN5kzccYlBq0/Z1WZXeJeNrQztvRlZ66r4GgS5QPuzsTirq72KqLjS3ZATJFyZV1LR1wwu0XlQxBbFiuJF/iik4FOI22k0dpzQheGnCRBUjEC2SfGaql8A0/1LBv56hHxT9woCdFjp98x2T59HpoYfRgxKy7PxSzoOYLaCBvO60e8n4CjycC6BbuWI/KXuHNrXMN5UJQ09ggVRejqG33+G8+hmHNr+tjZSNkAflRxtE9iIEVM+PFj8M8+/ag/k5udRH/vlrab7HzcObgnCs+vLrMsu3mhesXHIPVn/HD9N6n8GLBwYdKsOyh2z1qV5OdSgk97QX8o8urFM8+gria2N10/1GwX4kuUxj0gj376a/wcTfoi2ANpjCtweFGLuDLH3kRIbe1FuigGhZcZUDeUOifJ6IxVmCw6HKo62n/4PNa3n8U6eA7rfwFQSwMEFAAAAAgAGpeIXBqpkHNxFAAATlQAABoAAABtYW5hZ2Vycy9wb3N0Y29sbGVjdGlvbi5wee1cbY/bOJL+nl/Bc3CwveeoM5vBYGHAi+vbTHaCS2aCmewsDo2GR23Rbk5kyStK7fQ1+r9vVfGdomzlZe/TGQnaNovFYrGqSD5V8rap96y9P4hqx8T+UDcte93yJr8p+RP9uax3O2g2H+ut3DT5gTfZVpRAKrM9L0RuPrFcslteQrvs9+haUcpM8rYFhkRq3j/ZoiCOclPmUnKZ1dvsUMtWGuHewYcTtCSKoX2LH548eQITYCszjWzH2zfwljezibzNG15M5kBT8C1bb+tmn7frkle79nZdCHko8/vZXV52fL58wuA1mUxeEREruiZvRV0xUbU1e/ly+cMPy7dvl7/8woAL++vfXjPdP4M+1FdsGbGCHmz2Y13xBZtO4f+PF5dTzR5fDW+7plJf05dtc+9a27rNy7Xkm7oqJMwKRp9tyzpvtZhzouQfN/zQsu/pDwjZ4y7bRnegliK/R2Yh84sL9qfvvn3+nChu665BkllI8++KZI7EL77TtHtRdS1PUiMNEX+nSN1EYkpNoOXdTh5QxuXzPxaPywcSRr/Xg+lPuj99msCykmmQ0fylLku+ccowq/I2r/IdCJuzjaUA26I+rL75Hb6RZkkvWvQLdtOJskCHyauCFfWxAv0XMntC/F6T7eVVu2THW16RJUzysqyPYDKHUmxykHbChGS8Qm7Fgh05OzRc8uaOw3wPHCgK4oWWDyssgd2GKylIggttWuzQNUADTbLGnuQoKNQhF8VFWW8+8II19VFqVe5zML07IQXOor3l7Ag86rLgymBpXiDXR+RZIME+s7pSdoJeshaVaNfrmeTldsH2dcHLtShWyqI7mEaV77n+iK2ridHRxDNzo3/SGTAUeSn+F9ehYnx/aO/95cCJ0+S0jvF12eyk40ZmpyVhM3CKBavJ8vNyvmTvYarUOpXs9cuMveTbvCtBV+C5KGcW8DFTYDPwkkE+huocN6RPc6ohduUY/DTN1KhpymC+0z1v8yJv8+k8HMKRZUll4rJkdg4rK2hIYJW1snrrE+hG2/AUvOWAzrHJq7oCUy7VsrCbe3qD/HCtjIQXpfgAti0OvBQVBOhwhDX1Xe+B5Yo9PHqj/NSASaLp5kdWCvAB7R7kc2XJ8qKA1oR3OB+FWcfDATc1JAx3dW0bYV/IRLWtZ9uJs8MiihnE/cGo8hG3DOz7n4cGV7G9t95BA5BrzNmzP5P0V8jqOrD8nymqYdCh6YFG0Ru7SvwDtocg8oDDYpNzhsxfax0dkcks0mlG4V3O5oOiWn2MFlfvxLjngSZUpMSlWvgL5KLchQ5JZ0S2cgxKCmu+pp09lDQdTPSiSfb9r9///D9Mnwhavmd0bFDfalVrE4pVbHm9v4U4Df+o3do8rVmHIRLsXnVtMITXYIYSVWAsPu2gWgNXSjIT21AM0odSMn6tRa+oPbNKuD61oGNUZTWkJUC1oFupVdWeJT9jUYem5Dzv9LTsTOCMtsZ9C09k610n1uTUkZ0WYhPZ6X/hBkZbmQoCyAKOYQ1MtrxX88SQguNeKCkO+b2/eds1z+9qAVthw8t7nD4Y+iFvMDaU988qPACqIEEnzOCUoAY2Rz+PKffkwgFu6q5lfzjewlHymGPfrir+sGBVDb5flcqutgJ2CxtNGVhsN2RTONMgrIG5FgL2D+5iHq3JicURKnxlQq7NmGvLJhkwX6HU7AEOzLNovPmjVTXYWd7gSQSmaediyW3gxjnYo1VmIiy+fJGjYcITgJkKTBYsKG/hkIsf4YxNX8Nh++Fxjpurt9uYfmQPa3LtlWWEl4XZlJqm1NFTsLJ7eajBa+AChZslnqqjgX0KPOwrNiF/Q/MeaagdyIJxzObam5cogCkeOhJsoU0zC3i1/GNCQcXNWua4/YFZr5HE5xvRxs3hsNSammV+fG+bIpkOjdjwvlD0NYz0nPqoa07IVFFQ8/NIZQ2/E/wITG/quoyXRbcC71d5KVPTiClC7hB5K14MMFeN0PN9AxcsdKshAqVCCAfo9viBcRgrXkf5U8AwYRroEH31qessBHRqH14xfMeLy+SqbRq6jlwOrBsOrjxnA6EA7QpjQehPnicbb7YE6NIhdejR+FJtZP2W9KSF4wvihL/8UUdo/VUtbkKj+DJxyq1xxMERDFiIk9wLDhGT1jp81EBv3w+2ij13Xadd9aECaaanxl/D/RNueSvvq4y+mvV7Sbhdb/i6a0otdY8CX5FMqlNCBnz1pyCbzWjarSi5VLFbf9GVpf8ZJP18Zs7Px/FL2FqfFly+p3tEfaaH27qtcR8Q+3zHfdjHfwV2M32NpLI/LBwxh4a5EwWHYUax/xVpP4193hViLPtLpB1i70zNWGPGq0IeRXs7m02z3w871BX85erNoVJ/d2JLf4/85jCdf7kWz8ixP3xLw+2/vVN/a/33UKi/L7o/jRTjpLbPivFCi5Gr2edKjHq3Gzn68GJIPqa/CTVP+gHTwKG9IG1akqFMzfhlQKKQz5RP4S6pA3ta2g0c0tcSNsEOD7zTN4SA9adLApcG4EVKC7bGry4gG2I4rL9Ioiu3b1xPcUreRkNb//TqeoS8GJVpV3LdE9uP1po6XP2ZPSdo0D+QGitTXr2H2ysGpQUzbyUsCPahSwmdQdKT7CvqnY6qanx1ElPze11tyq4YWpVhRZ4eY2YGIfTTTHiux8RNPmFReGnK8gNMrJg9JAediqrgH6dLdaoB8vkiTVd1+xveACGujCVm/8G+Gerh3bCaFjp6hjLQw6BPOIqP8Z0ZAFS99KxniHml4GKg7c7R1nA3bTTShLFJOTT0vLoe6BGfE4E2/mqgJ1HQYWfpxaJTw9BZd+nOxQO0KskDhANZHxO2htYvuNgtA7cako7uKks2fdVwPnWeuVqBaypDfVhmf9w+TjMl0ozahwTQd0IzVVGc0qAiNG8HKOnmtqQLYp/i0TvGewiAggYRI3mwZq+u/hEMQ+hLCnmZuMClYSTKWJyAAhV4Nx4RfJ9/4JJdvnnjA14h5EdxA0JBKSgVJA98I7Zis2Dytm5aD0iGgStYs9pF7mcNL/GKxEw61OlJ46ZhQCM52aVFfjUUGUBJaZDHqn3yioYycLiaFXqiFdwBLUoqK3mWBdDKU/bfnB9IGfmm7Ty06UJ3NFimh3+irjZlDQbb1hDwIG54/F5k33ybvWA3/Da/E3WTsZ/z4zMCZW6hX0l5ZgTWKN1VWPBnADfTLl+vtTQrFfosaOjP5BKWT+Fm/CNMJp45u687GBc+SJNfw5eigjuy0uLKJK+zojtw1agMLRJlPsIbQt7gFwhDg31tSS6zVFuzmAlXCDmEAKkS6OaeIqI06TgTL+VSoaSwIV3jqQr+nnGTVyaBb02qh4wj4I0oBaK4iHkrMhrudGrOSsVmPanQGeAvam3Gs10G5487dUqm46DLkSgiOXg8iF+a25W6bOGtbwoXBzm9nqPhavO4uR/rsFtwcysLKilEf1uEciFqb25JaTtxxytSzUzO0/4MO4CQJoE1czpaKLUMaXClcXb6dO17wN/AJXMsqSC34luwLsErrOCoP3SHhT7LafQadUDnv00O3QiVqW86qeeABR+GcZs3aG9m9IfWnhsJ8UYzcQI9OoGsl/bc1girnBVUSlkTHetRMBjP2aE/RbVCMMuK69zgpq7aXFQKpocAoAbQKTUzF2WjJ/IV1uCdjOb6m9nJ+edlXynXzjHzoqCTkXZHdPgFhlZwnsAjV0wlyOs73hwbIFspECntmpdFQdsSzATTB5jMmr0jkI9scIF+gumQuT7iq3QdKgACbVeSer204hhzVJKbWqB5DLQLWD1bXjKbkEh7tB68K9ygGQrsSmG9H9Z0rlJlzNYg89rqLdCYgtx9Ldl3877Opad0reyvp3vj+CqEk/ZlrH5JgWUomRjpGhUV6RsYEmAaKluNCF5Pb1wCwuhoFWorcD+tYoIxvSa0eFoyzOWStoIRn7K/oPPhRJTJPSNizaxuehiwcfARS+qpPbyx6uyTj4b3b4LBnMzdDbtFp9OC33Q72JCv3pXdTlQ/QAC8dnbCnFponw64wjbtcpUPwU3r35pHz5bFNhQnlDao2rJ6DwvXDiSczPZUg9SYujX19Vp/22MSNmd4ZsIot+aw4bRpsHZSV/q+pg2TF5NFKP0iKhyByXv2al7hkg2XmVlZcylTp5YTed20F5oSBBexe6dG1lHy3aVnL9yRVe0jhpnZsmVNXEAn3R54f8CjMFy5bpmpvVmw462AEWCDAn9w+XAvnpFaL1x+XFV92XNm2v1HJ2c/KTGL2Nr/ddo3MeZnpH5pHT8v55v0M5oPLNchb7hncUaE2eebsV49ZVb2dBOF1lGCR1wyuHVjMAtzeBMHk4DDXl3rJHQQhDQq6jMLRxot0nix7CkplMrfe+rjGq9QMk6SmopfBIDX5sNsvtBVktTJrpSc9LNrKu4a9vHOpWpArD8+84tYdJwgPAJuMmAf8BFbokDBIDhbG474qyBDt9yPDK4pVQuXOLw2zX5TCtNozG8L9ptyq+K3eVgSCFe2D/w+LHoz62TPoSdXFF+KRTre+4UIe3VEsXjRgqVaqGE6nc8H4KYUR9tnfJd+OUSicx/JVhrDwvFCVULO4CNZnjkDqBt2iPHWqoww5aVG3cYtEmEsHVVUHjpR6BFo1lQZBIrt8dPpHiNeorNGVq2PRSTWC6eeF/YPHXHC3R83DbabzaE/W8sosCj9biAHccpSo9HSlkTKGhDijBGe6hoZ49nKnaEx0rOmq6cKf8p6MeEFfwfzNLrDcPojsGdr+KrX1fPrNOPTGZUkS6ujkKOx06CPpeiPcw5QiyKc57xxT15ylSTQ2Nsski6mp7o5ve/DdaWN6YcROwPUuapROQBR9i+1gxBdW7uTx4ij7l95K13538JigPYK6s7AL3/6+49vfrp8SWXa6aOmRqXNIzcrNrD/OpRDBnoyNymLUmrYCy66D9PFNPu9FgboNMzmj5P5CRRojQPrw1lhTmdwMUqcPkGuRNZhQkgviqIKJL3CeapaN08igYhqYFScAr5TQg3Zp6U53Y0yj3XnHZ61kQbOYHt6j0iEWTz3JEVQoG+5nJai5yIjpe+5itdvhL846ke9GLHnGK0kHCZC8fs3RHMN+8pe8/b795cvL99fnvCacUbrizjKUO0zHV9kqP9vcSctzij5cyzOFfErm3O2huU5A5FzU+/3iLuuVmxiBp9EgKmHew7YuBO2v5Wmu/v7yjyckQJ7gACfwDn7fMd4J1KXerDXG86QdZGpenmYxW1dKOzuaNnhuM80Po8gAOhIqPIPPUqnUBVwqtxmYd1Gc/oxiqfsG3wwCsM1pid1ChO5ULXSbIryTXWFJL2fK/zNLqOzNmhd684KHPaXfYLNEwWcpA3AYMzBmoVMsQTFW2Bkq6T6UsZ0Oz5hOk/Z6y2ruMCaDaMgWCadfUTcD1v4lFBXlSqpIWiHN1Z3EOidJCe/fBAHenyYHvZyq3fDN3mHRQ29dVDQd2UQ4SyEGecpy7/y8lw0fw9EGg+ehT3PQVvROBYXRskbnktcxh09SokjA3X83IKaH54aU8+d+eJGQ4UrGIBZdE/CuEGO7ZnCynufBNZRAZ5ESJ7A1yORQ4i9bw7biQrKUTerKxDZ4zmkKLUlBDHL2zBwk8A0N6qmP9JIJu5wh+FvliAeywn2mYNeBrXvfQEv16q2wiSrEZtiqp/ZHvshO1Vm0Ouf2k/Q7rA6aOA6c2pnMcUFGKbtM4/4JIrnyDrv6558CnYdy+p4S6Un2Fne1l1Z4Mxctdtgws09hmwC0CeFXReJPJ7IaIgLSniOBWnzs2JZ2DMRy0Ksyw9s0aBnAhsp2p3ivdOhfRtax5DrxsOe7x45bUg3on/PVT+ZA3Umwb+IQ8V3X8Zln0u53svdZzOII03M4FPsJ+rr50sDY9GFTsqXvSqnxAVDe0bI2YWg7kC4LMmlcvzmEkMVtzajb64w/rfhGd72C6Z39pl5hOcM737P1MP0VnaYfuEey1UFs6IwpQqFJx49A4qPUAnaoWihy3x/U+Ts45J9zARdMYRJ1bqbUD+eIycnQiv2XK5N9eeaWlMCmGez6fDzqTLMoynr4cAHT82VuAyoCDr4C0AbHXabY213MrJS89Vzrx4nrlI+o/qx4oRPsbezfX4I1GTgbMU4UM4nwV8jgI93jbjDx/+Up5tNNJFtXbCmqzC1pcoxrUM6UNsVD6nr1G7X8B3VtoYgyg3fYvVf7NhJ8f41qe6xzyCPSEJ/Xtr5fIY5CYJcJRDyE2MmnpfvXf0tx1A75nx+6Raxh5/4yMnAmo7CUM6CY59uxluV7aLKNYvXeYs2AAkQGNFJjS/YElsjCNZw7r6CaRp+X9M0rYyhaX4ty0wBlf8Ky/TH+kqm6YN63s9sjLTNZEna6epMr0ZtScULA6WB73Tx1LjazAUWoIEZtbpI0NmhLRZc9Oo3YQr4c0viLvhdmMz/ZRKPT4M/Ltbi2aVETYtN2k/UqbY2qrH5W3uOIgjMc6ufuazLOwWy0QxhBgKMgEYkuWhtUPjXL/09u1dQSjqZ9y3WEwd/1Qxos6D4giCzHjetaFLvKKYngDLPby2kRXPFos/qLi9BP4gsLtkDVXVj29yvB/TsMNSf0+7slIiZB7331ddbs3cBJGPm1GOKWeeJKDw5vQCgb7BawAF99ECiWEEG6RPtFMKYUL+Bk1eUmwdtRRI9joD7Yvt7m+N2pMrWc98RTHGD94tEbZNvPgTHEVFt6j18Y34b5OQqfIUlsJfVgDi4KUTVlvqH0iyJv1jmXfRjSQaZCyYXPNnzjjf4HJn7hSKKCPTwQoG/sXJBtypCfIOfNyIt4S9I+WZibNgiJ+EPeMEquJDZvyA5yivN6Jp+u9AT3UluHggwyzXEwZ/rL3DkVaiFKEV7T/u89OV3IH4S3AnG7EPFMYAfokmjmfZPtCnGePX9BKYhrJJiaHNS45n2DzgxY+2pQc8n/wRQSwMEFAAAAAgAGpeIXKkMkUIGAgAAQgUAABgAAABkYXRhL2FwaS9jb21tb24vYWZ0ZXIucHmFU7tu3DAQ7PUVG7m5Ay7K1QZcpElgIEiV1MIeuZKIo0hhSV4Kw/+eJXVPn2Wz4mtmhzNLM06eI1jf98b1VWXmte+CYpyImxSNDU2gGOU8AAY4zauO/Xh1U2PEBifTKD+O3jUK1UANE2o4suZ52yVrW+wicRsUulYuqX1ViQJ4Ouloeoq/ZEq8qsOATLpeV1WlqQM5OaInphkcVqPXZFujNyD1148VyDDdWWmma0+L1bopeDABnI/w2zuaEXmIgEbTLvWrrn4RstdHSEFgMLE/GE0aDmgTQecZCo0IO2E/rfjlCbaXUnkwxcTuY1jTWY+xjWakEHGczgRkA71Lt63mYxGUX7jEbpxiGslFtK32/5yU0eFDK64QcEJkH7UJuLNizuzV9sqUe0nLXfBujgtSMgFkKAzSkzsiB5FNbpml4g/zdVTReFd2cohHP+RpyykUxJUzl6Az7KW2Zk/1Burkyuz1NpQHeHbw8+8z5NdtIOzNBHEoLaTEsstDogc8eKNhTDaar4NPIi8mtQdOLjRvSP8IRWFFhz2FQlloGF1PsmSf+gFMDCBJgfIusrdvaBa+O7K4gEpRCJ7D/IfF5ZJcPrvlKJ8SY+TV+YJAJI0DfefsoFjTJyMO/UBp2fWtPQv53ho2Za/vDMv5Zce/HY1f3xHvRNG++qSU9oX9hnbO/AP2c2v9B1BLAwQUAAAACAAal4hcrEDP8O4JAABuJwAAEAAAAGRhdGEvYXBpL3BhaWQucHntWt1v2zgSf/dfQXgfKqKu6t69HLJ1cbnU7QVIWl+cxW2QBAIj0Y42sqQjpXwgyf++M0Pqg5LtNG339nCoH2J+zAyHw+FvhhOr4XA4YIH5sKZhP/2JZzQGHjUZ46YRsDMrtu73GrzHw/s0gweUwDh7MA129toKrvvdBn/o8vCHPg0IfiApOGfNYPZEfdN4qJfCAW5IA2556hGHpi2YITGz8rgVC4s3gs2y/MGawvAE1Qhv0zgas/6H1Go0PiOirilqu1U0g9aeuCPv9VngbPb1GVKcMRg2pF6Lp08z8Kxv8IfXjlx2Vk1UFK+J4qxqQPOh5unTDNCPB/Eqz1TBhL5Lwzirukm2XMbpsuoWSoTyQoRXNX220KESuVR+JArhizz2w2y1ylIfWLWvCwXsGsQyMxzgcJ95JVKxlEpXDWSwzT5xWcSJ9kMRXkrzl8RjYxNttghkem2/kNq0NpEn8bX0yxx2ZDTJVbZUUuuApgcLla22bBz0CK+YFW2kBDTWZbT7yNJC3ha+KtOArF+xwsBTS5GN8Q9rHxDaOFDiZmS7tfowPhjkIo4CWjQtgiTWRZCKlWQTNsTOcABE0LEH7y9lcQBNqbyhvhRKRkM+2J3tI/msVOGl0DA0GAz+jtoa9SO5YMAW0EJ5pgvtlVoqXGXEVlkkkyCORiycfMpSyXcG6JWF0FcahJ6eU/cntqck2I0VcLhhpjIwVSp/ZnHBbuIkYUoWpUqZSNkuLvlRplKJIlPs5lLC8I2ICxk1gsFkuUwjz5iRFPPCEau04pxI0bigAnHjkYdoMuL36K+hah+ohyztPeGORgzsY2itmkgFJmqs4wpfVtpra4wc3B5OqEwLUGfcDCE5jLjeSO4goijIrkFKkhCVN6iwYTGcwW7ZnjlvNgM5ms2shB1236z1OByx61jHF4mcHKtSkohqHzrPUi13lRJ3zSlpCcaewFfhGbr/lLJET7Ig4v8L+zBnz/QYDhOWjspQqh32QcpI0wEbNnJ17Nb2IDbHasSKBrOWohNWd02n4ViAN1yIIrxkcYoiXRqio4Omxf28LDyi5jWZvA1lXrApfcVZikAwdaXAJfFrSAy8Kd82Wzd9UG0ligAW8HjDsohTOL7uXjo60pWp7DkvBF55MFllGm3RCrDCeD5R3mTqCufg4KqTCel6GV9p7Mo5mW1pTWa90hy2CAtAxaCRlcjUsz2r0c1lnMgu4Ts2brZkDmTibGtZuw9+4kV1appuU8ccruxXE/bGmUdYi1Pw3Xq0dZdetqnXXCJ7s9ffo1oWDo+c4UgCrsTkI5NnXbdaSn/77rZTeWOAFI+w58c40xvEc8QJPEqS2KOApZCA7D+MAddZmhE5XWuRRtTHDsKL59K6nn7e8/tIXpRLr6/V8L6VBvizo88fj6bzebD/fm5vhfcCDfiCP7J7DEfeSuReIlYXkWC3O7enL2DufFTbg/PHobOIq1c//HmgAcDzo7kdgHiNKIfTQTwfwjOGjxatAeW+Dym5Av9xfah2G7OEE6Jrfej2gz7OwiMzbByGQNmIaCzctuaH/U+7B8He518+HQezz/PjyqLkkiAaL6wjnnMnTDlzTrzaEDdHkJksAP0nYwvH9CCCDwVl1kRlsIZGBM0cUT7RnsQygThAPioxMWPG0+PVSkYxXMjkjhUZ0+JashVYV92Rb+ZKXuMNo6CdZBo4Uway9aXvqBKWSmGiYzSF+2MabcBCuzb3rVQJUVHCCP4uigJyn7zKdarMaTob8srA7hqtvKKJUSZyI6Btjlvbw/tv2cUaSDKXyhiVoVHt/tird+ze1eux1osmq04bh6pPOw0Yde7XmlB7ExeXLATfB0CHozNZrAeG5BiOVD/yAvQgtnh/GY/Z2wlT8EwQRanZW/bX8Zj36V2ftxiLWehUKXAvUVS77m4ZELcS/jjka+VeQCS8GvSmnGRQ+b9puGVeX4LdCdgrhWXSUNqUMIrD4smNrJ3Gz2KImzPXUkasTOVtLkNIaZnxuC07Hq4V+qytb0HNOI3i6zgqBabg5rQBWHDLvC+H7i+9MChdQDRfxAk8qRpAbxvudkQ03Mjzr0UC8j3O+7pXWURrgdPxOZ5Fe0mZaImZ6qYzWxNnnzDMT+xkf3rwnv1j93jvn2z/8HD6fn/3eHpw0qO8Q1CzcXeNmOmv+8fs4PPH/b1NypEJKNoC6hxmSg43eNNGVee7H6bHJzuQfBig1EUJr1LrNUmW5T0eDG81THZw8yVFj06G3Na54X3bZX6W4j28biQ3xF+YmsfpIgPX/SAA5SO2BiR7l2drAv9t6X2z56q3NuEHWyLK9222OdmoI4PJMda+xTEZab3HrTO14NsWW/xD+61hKbCsL5A7W9huA1larmxa0g2V872j3dk0mO3uvw/m08P5kJsQQsEgbL3b7JPfQGzrQaIDJ99oTLj5gV7vr/1Sx49Nbaz02goIz56FrZaltijhJjimOgFPLYFpnkzqJxam3cQYp0sGU8bdbM5gMpMjUgleagR3mPDUBQ7NPLz8xjJ3suCY+VxIkHgpoxKc2M1tVnFaPwv+Nl5XRwENSIGJKY8ZRGlyGZhG+JYLUSbF5PTcgjj4IN52y8zhCVev1ByfzpO4oFSR1otp6zG+H5RIl9Ibjxwho0YGb54L63laojl7xd7wfp7ULenU5x+OKDLFSkaTesU6UW1JPo3PuZugbZO5hv/Vm/PWWvQwN/Iw8Ox8oWQ3AzdP9o2VooavVzIC/8nLojn471tCOp0b7MS86/wra0hba0M/ijwbijw/Sjffu3TTKdc8w7W/uFxjLmNVNViTNG3JsDFm4NNM1xUKy//dKw7NSlXtwei9qehgIggWe+u9dENJPdEv3bDbpnhUrcT5qHURc8DRXjJxNJ3PPn+aT4Ppr7P9o5M6l2ijphG2rmCxBsHHXczeXrn4N7krO4B82dyvJLsQ66L6U/UG8pZCrnQAWqsYcvKIkPlb6xC7BwebChH/7fIDrAxmNbZBD6xM3suy18SI/tXCz59SXtjyKv9oTv/ryg/f/jD/42oSz68ENOjxoxDwtYWALh68nLRf2X9K3QDEVPCIYRxFImpQybWr7rtJTfuVtYlDiFosz+IU/88OGHYjVPQ/UZbojv4BVQmbd9RvxIWpUmyp7P1/FCda72z3Od7+XYJ1WgQYmgSL3z/SEAZhCcES0tw2QytuIg89eYHMXAX8z/IvMAwIdf/IW//wMrLMgCiLy6xH4opFVTADsi9mT0NItusBWsH7uXrngVTDeur8XACgbMSu5F37hwK0IxqDWdxWsxJdOM8+l22yU89aU2J5pqnKNjWetT+5wAlQ1RjLRpMnf6lhNmJYgR4uq2fl1BNbYB2oW5kfZ5OJFWWjhZPJkSyL4EYuYTflLb8DUEsDBBQAAAAIABqXiFx5WFnotAYAADsaAAAlAAAAY29tbWFuZHMvc2NyYXBlci9hY3Rpb25zL2xpa2UvbGlrZS5wedVYbW/bNhD+rl9BaF+kTpWb7JsHD8uatDCapkHaAAPsQKAl2tYiUR5JuQnq7rfvjqTeLMdu06zbBAOiyLvnXnjHO1q4rus4JDIPaQb26S98xcDx9JAQ3wwiMrWw9Xdv4Pd4/D6Ns0EE4pONGZDpwALX39sDf7PN42/6NAC80Si4Zt1gbNLfZrCpReGEb0gj3/LUMx2aNjBBYmLxfAsLwhtgI9bfWFcYnqia8ds0HY1J/9FqNRpPNdG2K2q/VTROyya/gzeYRh1jB1OkmBKYNqRei6dP43g2NvzNoINLptVCRTHQFNNqAMNNzdOncRwdyWm+KoQi85LHqigyWU1kxWKR8kX1KShPirz6UmnOatZiLmNBV0yEOeV0wYSsBoRKYod94lKlmQyLecT42r6Q3oweIo8LrtidCtldqpAa3w/RZumahTDFGJdIuxLFQjApI728l6tcJVQZ/RsuM+fMRZG3uOKMSsnQkHBVSCWJxb2ED8cBL5JR5ctwwdQ5DJnwXLmkgiWu73ykgsNaJJUASnfKJzB/87IUgnFFztNbBr5XjMSUE0bB9UtRlIslvBn56+jFixckQ5oszcEjKYc5sixKMeVjDqZTCdia1oAUZZaQjNGEqIKAOgqXUT2WkKJUkwEKdx2ErDS6ZGJeiBwJtTYnsUoLTuD3idOcfXbJj6RlhFPyB7iv9cJBfucH8p4p1I+SJI0Vmd1rA15fj8mMARiDBUQaGElElBypY7pSJSzCpjzHnSCwa2WmZAiAb9g9hAAu4sL4VP5M1jQrmZl00a7EDYhrVMRhIYj7iqYZfIROBLKj8/Gbs+jD1cnLN2dXYNlFwSEFnF8xAnU4Rh8hIEC4k7A5Rk2MQYNwno6LETIEJC8SlkVpYj9LyQR6wX4+e3YLrlhIf+hg0n5M1XIrbEPJVLmKMEo9F9FdS4vPdqyGFHy9TtW9DehIUXnrOe1DJGEQyOkKt2RU7VuIO0aVpxWrNPQDsk5lOsvY6IMoWQ3i16M9UR7aDfb2i2hhod8qXzVuCvQGSv+w401s/G9c3yTNP+j8Q0IaNOu9vRuA3gZpkZ6IALDtc+sZAR4TnMzTDFyiaeZ0XYhUscSQ7cQ5jFLy3Th7SOQQggooyfNf9MBAw5m3KhUe0TDlGXYvo/ksoeRuSHihyF1YA1XWgzjr8zBhs3Lhzd3JrMiSm4syn0HZKObWg4lmmAz0IvmUMe4Zif5n12/bZmb7VjyBDY/T//Ha748cY8EEq+NNd3uj/YwBwcivNvpQgFpHfZ2AVzSTtYQD1EZAoK2NqC5pQzKDBsrKbNXAJuvdS90hKEhQKCxEdxK2iEEBw3cYhlPu1gzpvC2gnmag506wCsqAtsCqHUcwbPVArchwajsjwf6EaojdS0eikVRR2vOjon3UOanpbU8YvrVv6J8kSMPDy6hjJ7rnpWR5BA0MV6OjoLMA+ytSJke2lwQUqhQcgCeXtmpfXL+Fyj0+e+/6DaeP3V087CDhIS3BN5Ob3jTM9s547WSaJFGxZoJm2Y5DXm97vGRxlU7S7EoA26RoNsKkskdqm8XvyT/+cgWq2KtkYIGzAVA9k56S2vQQCylPvPo2EK6oUCnNvDpyAhKbFGgKqu/30ODsMr0WdKTavA5F17s5vYuSEvpTDLgR2d7Ftye/R+/Pz84uo9Prq5MP43cXelPdrlDoMPeCjC8eAOmgoNpRoC9DqDnjZc6wcfa0d/xhz85CH7xI7/WdIDPGVm2tzCUqLHmK9ddr6xx03NDHgrzUskbkqK8FPrtjwzYfnfDQ0RQQmqwpj9noqC/s67D2QuFNMdSO8Lru6JLulihYDtL6Er+F97g+4Hedf54N7qG+v7VC3Dj9m0L10SGqjQR14Fotbo2+wMLylfJs/H5rpLU6hDTB2tB2SuWTEMtg7RDHRmXNSlKpL0WtnrjWGUcaM/FkGWODPrLFthXf/VsWIGIH1kXFp0c6SaFDGdVXtprYlv6f9ATL2vo2iO0+aHw6JJ/S5DOJl5TjrdgW5qR13uy068lNMZfSbUuOrCWSHdAfMkLBXXmnAV+QlL0I6G/+v+2K461E3mpPDqRyL2W28/H03fVv56DKu9ev4fXYzPwumWUvG/+d3EJ0rcSXJ5m14eE0q4x8cruqP32eJNWMlt8j1767P47bN6MH1R06zb0gDutkrMG206yKmbNL16/+lugANh17ztSySEYumu8GbfV2tv/aNizJV2ed5l83/qJxhhL3Xc9Ye0X4hyx45PkTN5WvrJruTdBZSNymmWV3MVupnVj638K/AVBLAwQUAAAACAAal4hcZpCprx0EAABQDQAAEgAAAHV0aWxzL2F1dGgvZmlsZS5wea1WTW/kNgy9+1cQziE2MHAuPaXIYbHbFCmK3aIfhwIDeBWbnlFjS64kbxp0+t9LSrLHHmeCpFsfEkp+pMTHR3pMmqYJfM2TQBkeOBrxWb94i5Fk3gbIg1HCNsad1isjX/nka0xy4AiQwyEYsL2Kgaf1qZEfTn3ywxpDgQ8+Cr+LPIRc/DoYh+ko3sgDtMyjz7SzwMwDA4MhxstjWDr8GDgcmx8iFcGnHHfyOWZx42eK6691vPHWg06pmHibYZJZWvki5NW2XOR7tWXEFmg7QLOZzxqTZFEf+eFqERe244sRceUR29Eg8zD5rDFf1wVnn4QbLJFdr42DP6xWo93q3U6qXZI0RndgZLUvKq2sbhEi4n1YTt66sZURPZpicLK1hRjcvujEA4KwwP9fBNpqj51gKC/LsHzRI5hojDaTm1+9wquWlZuceHHOpxdubynzrtOKHYJV+u1kJORm5CLLkySpsQGDoi45eJZf+8qNc+xnekHHqhq+iFbWwqEFt0d/EWhkixvY09uWqAefjAWpHBpROfkF26ciRnGDUTNPTkFqJczT4rTHPUWEX82A15N+nHm6XojpAt45h13vwGnYoZtFFU4soLoNWVHGE3MFuZTTihiYO8zBoaTFzM7GeETb8kY/oWm06UDRH9GyGGUF5FM92AVSNuvYD/hUdtJaovB4wPWqf+LVHo10GEoVbvKa8Gpo2+xM3Au4U/D9b3fQ6RrBPsh+XkHoqZ16Z7/1LDMs1k9QjqH0pAjpVmHPadrs6E9VobWklYJ1xzIN+qN36zgNkeq4zsI5k01AcnWGLviO7CzfQLobZLqBW9FafCbLkcFNSRxyc/tOP8fjSXXviNa2jfWEXli7gXu6yYMnpdW69x1ivMpfkKP3OUoH/6qQVJzdkug/anerB1V/xz208ZOt+OGXTx8/YEVl8bs5E4XL1AzaoXWjYn0DFqEo5XHHZriSyeh4k/45SJeuCYvzlLvlRzLRZKndC4N1mhdSNTpLByXuqVupCUMVx4mQ5qtgfEbstEgSo+PswVq6Z2fPpx7nM4NxPGY6VMObp47Cx9PJAzyH/YDk4llSE0XLLvmulxu47IRUl3nx9vl0dtKcE1iQxf+oigv4gC3uaFgHdiay/pN2NlJV7VBjyYyUzP4NM3BOUlLB30FU1JTskv6zVldUQXBJJkaqwRhU7nUzm0rq9zZTIid9PY+2gZeySAJr77nBORVWzGDReOGC/0XBW6xALz8aeBbbJnlD5suMQ7bhI1z0pDyXpb/rwcBn/9HnQn/2zUSls3CPqPzhWBfpoo1GDmIrnX4crscbSvq6WCdUhVlgg3mcjclIuBdYPXS9zUbSamLw5ptw6KMklKauzOY/K47F4Qv7WfyYelk2xwOawt9tNmtng+C5Ggfgv1BLAwQUAAAACAAal4hcNq1eIn0FAAAGEQAAGQAAAHV0aWxzL2F1dGgvdXRpbHMvZXJyb3IucHnFVkuP2zYQvutXDNTDSoCrvfTkwgXSNNtuEWyAPA5FXCi0RFvsSqRLUus14vz3zpDUy/KmCQK0wmI9oubxzZs6juMIvuWJIPcPDER45h++hogSRwOknshhHfT27zMincmkc57oRBoghZMnYH0dFPfv50R6OpdJT3MeVHxyWuhbiIP3xb174tSbooPUs+ZpkOlPJjxjxUDMEPSlQS0aHxR7s+kphMLL5N1JOuaZIL6QXAdrQLx2TOeh6OM24olGbqUTldfrfOLv9Zo41oDHnjUZycx5oiTUR3q6nuiFdfeh47h2HOuOQPLUy8x5vq0LnnwiarBINHulLfxllOzoWu12Qu6iaKtVA1oUVVYoaVTNIXA896+9tNqaQrM919keRfbWdL/ADARyzttaUZuMtbbKGnbPiZd+P8voyVIUltjpKKeXp2T2zFYG0TeNkiTgqdwdR1Hn1apzKEkjdB7fQwiyHbcvkeQ6iU3FNC/jNIqikm8hFybftSJvVIli8P1PsFGqXrpcWX1c9kl7yhu9w39FwY1R2mSas5IA0m9O33p5zW2rJSASZq1OegYUsVo88GdIJ+kCYkQTL+CG1YanTpo/Fnxv4YX7EUouz3U63uBPxWRZ89xFlGuNmBK+HGQXQhZ1W/K8YULmDZftkvxdeXPkvrEam+JOSe7tdOP7N6fY5wq2AsPt1cPmGEoDAw224tAajE7khMipAS6HpAeSLuEt8vLuHQrW7ioLyQ2qvlP2RrWyfEEWAP9+f/Pq7hdeYI7cUZoNaTn3B5Kf0SFUz8rSwRm+WAVFpQTmCsUczIDcg33tojnCOwoFxH+3wsaEJSaFMYht7yxpVQa1ogH+KOwCLrY6ypKuieRWPJIcvgpjWuwd6UErrDDm4mIq1dYlbDi4QuFlNkkLKhNGSGOZLHjCsXDO45cODoVGwa4W0ibxH6qFUskrC4bzhtBX7IEwwAfXpDRMPrhcZ/AcC9ZlmDzYoitH1WZx2qv+Dm4l/PruFqiRFmDuxR6DbNGLwmJ1d9PjR+cd8bk6KgWjRq1CbQk75PW8NZeTmKJUdmBaIqIk7swundk9oRybdpYKhx/jSdgbDDZx9V6OHBn1FWVr5CANNddYcBB1DQit5EPBw60NcubzxbJhxb0B1dqhiPOF5qatLU4sMpL1lpJZea9mJ+k4ZkEPlVEgsdI/ejyLgObT8pKznt13Aq9nZUVRys7b8KnK2sbvN6omCOWfjnP5/ro/ACw7DVd97K/8NKloD4A5Ssse/WgBhjtMYLl95Bn9SvVpgYbqtpF0hBSefE0Nar5nQv/vpRhguEJkNf40vPyqUjxUFLC3uuVTJJN9NQTlbSW67T2aJrgsMKYl1ceREtJtekTf1nymxi2UoGTVMePuMtzmo29fVLAA8wGJQZ6YWFGxypbV8dwl79ZLboem8rz1kQaqO3U1hVVpubQXFZC1NzjgV8Ptg64J3hmc/JTO9KLkQWAScUDLZHwNGYTJtNvkhzilu8D2sgf0bLODFpYnXTy9G5OABpzpHIvr0vOguYw8GbNXD1w7i94JBpuayfsFPLBalG7L/lceu3lSts3eJNP4c/TkSMqELDF3qx8ueE7P2S4bbywaJRvO3UzjNou/IHT/OiW7J/TjSDa60HLPttYvd6winFkVL+67HeAKExtSqsMo7IgXBwGHDa6p++4iVSu1v9yI02qlN7y7zli/JER0ASkvhcghmZye30Mp05Ifcj6P1Pk6eCbDSFdF0WrcAmGG4cRyzqpJ3y7ho9P76QIs7HuMiutsIVt/59rRaHVjgEmFSuhCRnvrEiwn5T5EXt3rYcCSLiN2ktUIhfnp4mEf0FW/Gcr+ilbgvCHw21YW45saXdOO0ahWSPU/UEsDBBQAAAAIABqXiFwQJNYmmQgAAM8eAAARAAAAdXRpbHMvc2V0dGluZ3MucHmtWF9v47gRf/enILzAVQK8Tnbbp0Xz4Euc7BbeZJHkWhSXg8BItM1GlgSKXset+907w38iJdqbHs4PCTWc+c1wOJwZUozH49GIZPpHuoH5DSf+j8EoUUNCUj3IyJOBdd+DQTqQSYc8owMikJQc9IA8nRlg990fpIe+THoY8gDwQaHgnHGDXpP61oODU4WEVLNmqZFxlIDHBybITAxeamBBeQes1aYH4wotk1lK6vMEFpPhT5nVWfykmPqucH6zPCNvTWmAd/aUBYs9e0KOJwJkzZp4MkOeUWJiIz2cBbjkyU5YjjPF8WQHMDw4mSHPaKQimW+aWkgi14LRglcrSxBstBT1huR1syeGVjDW4LfloULUO81W8PYlp/maWd4rIEzI3x7ubnHk9NTLNhe0YWK6lbxsp/UyY9V384/QlujRMfa8rpZ8NS2opMisPzP1Sd6Rv75/T758/XZ3//jl9oY8fp6T+/lsQa5mj7Ppt38ew6RFi1jw7yiHWMGfPGdtW4t2ip5CCfyf4dxJuc1WUoliO8ElQzk10ILKd6fFti0T1qnJCPdSsJbJX4B8zUvJRKttCWkzwJiE3A+sZLkMmDUJeCejNG6L2Z+yhiUbI3CMxGzJS9aORu/ITVk/0xIm8hdCq4IAuoRQgv3BiBhlvOIyU7MXXaBNF0BI0pFjviD/+S+iXfxRP8B6mD9iLDyQr7Pb2c386/z2kfxEPs8X3+b3D3+ortGoYEuyYlJtbILH5OKali1LP6ltQCos0cUMRJEU/DvDjQIv6J2SW1G5U5YgW0r4Up9BBlgKxajaNhD2Oow0p9az0nthvapoXcBNgT5zEnqSyzXptkij4M/bGBhum8wSwNzAhI5+woTfrwV9+hYV4Kiqlo7WqTiq+6TUWwz0ds2Zoo3us2rcd+TDlHy7n79/uJzdfiI3DBMvIyVvMXmQKeZAdaqIyb2Y3sgzW9aCkaIGKDhfe7nGAcaDAf0Hg5NWlgpL0J2Vw1iD3FFwAYe83JO2JjuEqf4EagVfrWCSkuUWJDdMrBjZM6kQ3eGGNXspdoo74eZwf7T6j1OyuJtdfSJfwMWclvzfTJkCrFzU1YZVEnWbVAIgVEpBdrV4wQwutHUKK0wtiRtpT3cAGaw205a1CTgnZ8XFo9gyZ9Kfp+Tr/P5m/onc1jswhmLxWtJtKSFbgi9RESsmZt3sOxPGq7yStTJ+ySsIsPr5X2CdAlWsBXhED4I41Uovdf2TJjrNmmKh6sWURvMjyVB0HPXz+skzNjzmsbKQpGnfiCMnr1cnfq9uV2Xernng4zcnUbdNYRq1e/QeWgS9T4t6xXP8VjOqUmWbumAgmrgk0I/+js2oMylkTVsM6sTjn5BxKDHuJFQuD89DMr6cXX6eX82vZ78sHg2vv6SpQioy6LToc6mWqFxQ1VoHqYUj0IZr4kD+pLjvhAsytqxjH8VBB5Z0HvuxTRFNOBdqCzbsZ9rCVl3qrHYHh1XwApKT3Ttj2Qvb2w1UOt036uvto50LgmZa7Cu64Xkmtjr3KZiQGMEyDD2oelepbPZMRQdliIoWQWrX9S6zTI2oV3CE2h4ubyFlFlkJOat0uAExZqJmCKHKehXCdASA6EenCcxscXeTLeZ/ny/GAZgU24rn0A0AmGp78FQo1BoqjcqlKuj7lqEciPG6SoItnxXkZyzWmJN/IrbRtTtesZWLX7bCGgHTaPWvv9lWQE0+I0SGDX7EKW7SZheDDCHesKpIYEbXmkKFC9SrwuVOs2pP+QWK+itYQFHvLMaklmGdX7MSuuuk3kpPq2lCgBj2H6YimFUZTt7yqpW0yhmiTEgrRRqKARnsgb/Ttim5TMaTcXoKAe1K45oBPHlNp/CPN0lKoNaSVyiSSgUghdOdmZ3hvrvwKqN6nYvAF2qr3FwsfHXpzixPbxeeS5q/RHDDnNRxndDgmJJ0mIYgChkE45U5oOTBlrFeIpLsFQJ737hM1BEiqnHyEebCw9k2NGeZYA0YpKJLl9aQGkshyGEZQkhlRcmqFXTDvmGGdMQ0PdszDjq8bENfnVn2O4Kh+jczH0OBWApQMLZOofDqSKJt2WaQaIEW3W1PhjZraK57Wbbdt5JtsqVgoYU9csz/HQvaG8KCC7KmbqEpqLeVtKhI1YQIXijSg2MFpxhWbt0eJe5E2Q8KKKZ8uVf9NLS+bAVt3D7S9cfYQqDlctOorDzQqiZsdi9KOKEbLvs7Zahg9fHmK+R9awMWSvWbsPNhn9UzCVp0iFxr94R8OP/4F3Urd0tRQPYrSHj68Jij0stH3pwtVz6pVRXhtq5YvHBiYARnM40pVrF7RDHM9RUj6YeKedVX7PfWghVw34NbYAup8iGHuiAHCbKBnh0fDqCs2jjwSZHQ9abDsMtLDuoy7vrZjhCBcZMhCATPOhK5SA4Z1Uls1aKc4R4pZng3HULRJZzFjObY+nSQva2KMUWURNhiQYFtarXq2R8SI+ABQy9NvvDGS6ZHFhHliqXOCF9sGXq1P1QbZzvqvWOKvdh+ULmdXJd0WPNFLTE+oYWOPZp4s70o2Moa6nm73YT3zrCFxtuTxxg9lg0VukxCkDNaxRzHq1wwfI2hpVtuG1d75MoZ1RyFjSYlWH7GXhsuWCa5WnEfy2PphVpbmiIUkeombZnxA3Rb0e+Ul7gCfDOSrAqjJRqHEaG3Fpxj8v3So5w9jLK592p2rR7hbKjhc5hu7VVUdK90J6um92B32m7HOE61gebaEeyD/zTY6fz1tbsZCGZuHWI8OZDxxJqttL8OrwrhfcQw61tN6K/k6GXECP2GWNZJZgWxErX4cvwRAVtevzt2LxiqVa4r86jnt9RIDBpqxRXcQ6EomoPR3bJs34Svl9hYAQQ+YfbnVXZS8KLe4YYm44/n5+deMNlbkH4ltpxVvUvAVWu+lElB9+3FB+OE8JXxf1BLAwQUAAAACAAal4hcNRYPw1oBAAD8AgAAEQAAAHV0aWxzL2NoZWNrZXJzLnB5fZLPTsMwDMbveYoQLq00+gBDO3ABTUKIy86V17ht1D+pEhdeHztdBwWNHNrY+vL5ZydumHwg3fumcWOjlFtiX8cqwIShsEBQwOQKNzrSELX8/8pmcn0sYKa2qF2PIpSglOBf9QBdUsv/ljAiEdNF0a17pZhZH1byokF65S2GzMQWAlqTK6Us1rpqsepKKZble6V5RQKaIx9+8yOmDLtwg7XPTFKzYcK/KNlKRJ+tdHY5fHfQ5vRuFsONqQxIcJZEll8Vrr55eMvwJKWfgatZk2809/o46pfTUQ/eMkrnJi5HGKAi94F6Cn6YKD5qajHJUhPWgcyqhdH2GHXAB0lvfBmNiYEoZOuApYUSQsMd7LRpZmd2zNRHzLfYK7rF89xkZoXbJ7pJJvmTMAEtmNqPS1hzp3PAX63KCkhzGDdpeSfp0Sw3Kp/D9aUVAcFervrbDRl6y3xmXae+AFBLAwQUAAAACAAal4hcjevyQXcMAADEWAAAFAAAAHV0aWxzL2NvbmZpZy9kYXRhLnB51Vxbb9s4Fn73ryA0D7WBXGb3cYAC6zpKx1vHNmynO9mmIFiZdriRJa0k5zKT+e/Li+6kLEpiFpgArWSJ5/adw8O7QsuyBgMAxR/Ib5I/+UWLm8GQ3wIwEjcQ3Cdss9/SzUiiGcllBm+MAxiBN3ED7i8Txtnv6s3orUozepPLUMZvnAt7l8AgbOK/xc1bJoo9GImicJTQZE9KZYqMASsMEn6jhC0VnjMWYkdvCRSCBqZPRsUyJY2B/MfVyjW+54WqUGS4pWUGBZtGJX6X97Bk7OU9K3EP6GNRdFigkcsMhklsjN4uS3zBffoiLXHJS9ynN/T2LaORywwGPJJ3oX8AWxI9Osh5wIAcAj+MwRV9cAb+uV7M2Z0o9HA8IG8XEuxt3de0YIDCCMOI/I4Hg+SRv4ucEAU4vDjGxI0u/B3E3lNyASgC4q6uuON7O7K/2BEXs8LiJ2Q/GyjEj2f6hr5ipMntCbIoTkRE8WAw+EdCkDCEIUZbSr7FO7DHMTwg4sEg9JkqQ1Hk49z38OiXAUOY7BJdAYnANXIjLJ6zvxDHx9BLDL+gzFAch0NruVpcT2c2vLKvx7ezjTXiBE/IPWLwMeHGSg+rhEyVpdDEGgmqRIQg9kMNWY0GM/bMs9TyFzMGcw3W03/b8Gb8W8XsOHzN6ZlYCsEwe8D+CoBYTDeYKpdwSP+o9cWiW//Zc320hX4QE+pq6wz88efondi45EDi04zofYw9Dm+MwzZa5Xc74iEXKlHiD6lvxDUCnh8D5jWAqYdaeaQskrJkrCJKlUsfXdDfJBiOfinpkLj/52o85NliWOEj5OAXBwcxsPmFoiIF1M9topZ4xqN2OjcVtcQzErVNbFoFW4nZ+wabBORfM9goZNDF3j5+MBNqDJeZPf+8+bWmUcjhL3pZqFBxYIuA0qFvjiSJi6JlopgkN03BooRCo5F+MesQmhV7OKSUvjs45BS9vkMyLv0cooKi0SHRaxTjA9yFmGdlM15Z36039g28Xtm2Xkou4lbQSMRqC8eUEo/E6T1z50mTyzLb5b/hV+Z+Owz98AxsXgNxO+qSDbck3PnhAcVmvHw1XcHrxepmvKmYm5RXVz2qBBRa1Fcd3uYpKkwdrbZmmr1qkyjxRrU9TByCrjjVEusrp4FUjF9ik7l8Y/+2UebyUsYQEis5I1dFThc1IJVTRYFBbZbIJJdpk8fU4PSuKVfUGqrME8SLh0UFOmUHLRWaEwiKDbUQV+NNdVx9OmtQyR3yhUSloYcGDlP60CMxnvl+YAaP6fx6Op9SXWaLxVLuylTCnSTyoUsVgMhhhsODv8VS9GdyLbR9Qp6Dy62mMLiRaaVbknRKmgO9zqpGgInnhPhAe0806tPmPjKF9GRl39jzzXgGrxb/ms8W46u1EnF1JCpVqw9NJewj46ywh37QOoCOsQ/RjvY3a3qULVx3GqbmXIF36OjG8Bjh0CWRqT6HUADeru0VnE3XGxHx377X1JSiFpCpIbcPJ2DNa4/MRw2vKsXUqqyN4Q8XOY/mQfw0G0++tEGR62ECxgKj1jgqtG4E0vX3EcQvAQlr2i9WGcQLRcdaDUqBJ4zJQc69epBIbGRAWA+Ayh/VVl6Nvn8UufAJh2T32hoAaaiznsGv49mUtp3TRXGowwl/An+7AGu0w+4rcB6w8whoRxTEDxg84lcwRE8+2RJvDz744QcQ+eAZg63vfYgBchyy5cmQUkaPJAAIuLQ9CqnFPK7rWsPctCTp5TAxG3N7ZNJTKbXENjHt7xdghvfIeQU3ZB8iPi0FJr5Hy8V8OQb88H0XIy8Cw014xJdCcRD7HAEPP4OkCqSKkoh4UcyUYC4+4/Ry981yjlHsH6xB13Re77OmwOGtSdodiJyQBIay0Ph6QxPieMIVWk9W02V1DHKqGVao1a3lbMVIvG/HpnMTfBqgRscFfhQbddhysd60d1RBjW4O0mIg3nel0xPb2ZFq4Bod6KEDTZRGXTgf30znn9s7saRKNzdqslA4shWlrujOzqyDsLkFpk1a1s036tX1l+ky66S3d65KsW4+bsdJ4eouDFoq0tnxDShrNqTvEgCipegeAUrV+jSnfWKgE4e2qvRslHuEAeUm1sAVrv8JbB6oBgfa2aO6sV0kwIpoV9piHUjec6ZdauI8Yu8cedtzvN8DNlkT6cZNaYCnDoVMva7zEI3kCpdrU+mIVI0ldcaIB+riLYqRoYVJezOmne2xepKzaFkql9rUzERn4iUNeL7XxdCMQRrvs+nNtJpZytPzTGh1+qCkUf0cJfuzqGF85YJGmDxVyf2rZlqdrE/0qMzV86dsql7cNNX2k3bnwVZATrmqx6W927LebncI8N7QatX1zdL+3DgBLUTKMx4/qLnhq3JJKqHomnclxTRWOyPHD7em1jrXk8XqqhGYRGh3O6uCzoCluReQNnbGVix5G1cyNdnFcKrpEEW6bahoom3eTFHikOrMKp94UdK6YAzFp/hLY4uUjE0261SYzCnKPmMbpeSq/e3lwkEBiZHLskW2e4rPl70A2vYXeVxEgUuzuXVmjUQjjt1TAtnUaqNEtaTvxdBtajhDHAXUETimGcxM9K3s9XIxX9twc7dUbL2t1LeifLnSKWaR69g3r3aTA4Xcw7DB5GR+j+qpKfqblbK2vuuCVpxEPFUlM861FYtNc9S/LcFbqGzNfOsoC/JU7koN05vd+iu54jTQRgDt7sBerkAhHZQ80fGAeXekrPu4ozR0SflJPZc6oHKKPhBFsR8SHL0DQglnUwCl7LTxyQj6wPNA9g8u/Re/B0I5c1MgFThq41Sk6ZX3EHmPisbYmoKH89IGRpTuA8kBRxHa09oVhP6einmPIEpkmIIoZaeNUkbQK3bEkaT3CJ/ksJOpCErPTmkHUUrQCx7iee/SignGxsAR3PSxScr3a7/og8P7tF+cs7n2S7Br0X4lBL3gCZCDQxy47GJoTWc5nthwZS9n9FodcJ5czWG6wFSZ9nsmjdCfV+h1Rma1FmvkNfKEYgwfcfvNLaxg3cxswvec8pUDytkelMvGRZpm1R2XsGkNUjNN1VFxwfVc1QzXqF2gaFaa2sY3hpqJ9C/2XfMJW4vKPGcyz5NKqWtZJl3mIM0UpXLbnryRLZD2MhcEXLj+M80SpcN0RfnI26qKs2kaleDFku0PWRcqqqaOOlOor2zp3DE0hXrHls4ncHWrc6TaSmSfdnru3cbtzWp+Brx/wq7/UxikGiShAMezWVM4nFBaJ+GiUByUofkLI0PHeGkX4famecaPb3GmrflRteNS52hYiUN5/rYyBSypTN/zRy7fAwhVQ58wZrhwWPLdiIXyp9iXi3HUBm0A018ajPABBQ9+qFyF7rM+uLZvTh73w4e6tUH6StFtq1sNVJ3hKbPK3kmH/bgO7H92uI9dtFcBZesKmOTndCjTTmt9jIOebJ3tRg/+c+bwdGRs7LsYn2nwqU9NqJz7A4UK3+rtGC+yUPcltbfhyWo398/YV1dOdXay9/ABu0He+xeXEfj4EVjRf9k+ZkvClX+7JU3R0tvs6y4Drk2tpH6+nIwnv9plP5a4lBNV8jz1Mm8DLvwAe1A8SJoztp2hEgpc/XPlGSW9QCgwkDpuiTx+odqLa1M4qC0vMKQt7R+p786A9Z/I99h1SyJ21mZr/SmBmxPXu7VBjcaIDP0Y8UNae0O1ebXYyIfgVD2yguSOPixyUNblVh0vSfHmnIg8EpPf8dUnQ4P08Xy6Yd/LuPrUmAtT2fzYbEf8yjz6ZUO17lqHfjfGFnvZMdSahV4p/JhkyKZvYO0QsOmor4KHsUFgnSmnxgB1fX+eeVwcsw0NNOM8sx0l+QaoVuI1XLrBh+CKGGpPNvbNEl4vZlc1k1Zljx4C9lGCVrWhQNU19NU6Nod+ePQcfubHEFSr2/mkeh6nBqlMdJ/gl5n0SyFKA7Q+AcNX7x3/6Bnan8i+fTJZ3M5Pbk3k8qoLMSVlenxrpMKodvSRKlH9CBV7yg3nNzrfelHZW5YoDUw4905DEx0Fmpd5UWToUxG/jte006SxO+jgP2Eul4Zd7Ci+DqHXb5H49Ks4kvqN0P1wfecRGjsE/2m2mHyhGtQdfS8ilIlWTLk27crLIcy59INOrbne4Zujh54QcflJ+UR1gwdwbufjr+PpbPxJNb1Z7QzWqNNngrOeZ+cuYr1ZjYCLk7MQuS6k+QfvQxLXLM60BfurvZpe37FJTjidb+zPq+nmrhZolRodpw2VrPoFc40p/wNQSwMEFAAAAAgAGpeIXAQjCPN3AgAAZwkAABYAAAB1dGlscy9jb25maWcvY29uZmlnLnB5pVRNj5wwDL3nV1iciLTL3EfaU69VT72VKsoOgYnKkFGATqtl/3vz4QQC87GrcrKd52f7xUFnWUbgfz4CzH8wG/htDz5jkNzZANQbDErkjf7GoJscusWQyTIAhckbUO6QOPprg07rHDptMYZ4ciz2DHXwszjfG1MsZQPUQxnFnBhJMEtisGBAPoq0pvhM7MvSCaXwOSxE6BKTdHzlcl1bc8elA62liLotMGQxFk0odyVL5t2VFlGCCXtovsjZYkiO+0GnXcILZTgIiJ1DlMEw5hRztpiPvwJi3wyRp7PSA7SqaWTXRF/V/UHzs9DFOMi2Lw6qq2VT1LIVwHvwLrPug4z+cBQnbnO89QAenUH8GRaVMHInu1exNWsyQkLwJcaKRgysP3ItKoaxnBIzu8GgAhby1ZhC55lHZpT4Jgzom+oEIaQSNWjRG7LQHjfD5XTv1De6fmkF1zAcBcju+SROSv/FScBBoVfutLNTasErJMqp8Z5toIdaqxNUsv9VhJ9b06pX3iKRi1xvbKYbzxUfxMt3PQpsbssha/T2cXe0GEbdLUGXo715yzOjLnI4ru6nSN2gSPhiu4v9KdRZdHH8BG468wMA7yrcn1ChknWde3tV5GYhPg6KecJQDwnWVXEZzSrkmbezx0V+BOjPBJlq6a8obaKWoq320A/6CX7z9s5VfVC/hxPc7zw8Rddk/obtuc7efYFOXFjkwHuxT+swai26+Cr8SSLysvGLlrMIM6UHmudYVOJ1NPJk5iysKLx54z3zMFR3zr6mMKvHtsU22BOehTfy+F18UEW2kjFub6h0iydFGb40cPd2VrN8RrqbV7HkSrf3H1BLAwQUAAAACAAal4hcWNnc0tAdAAD0hwAAEQAAAGNvbW1hbmRzL2NoZWNrLnB57T3bctvIle/6CiycqiHXNGbG+8YKU6vI8owrskcry5ukVBoYIpsiYhBgcLGseFW1H7FfuF+y59JXoAGCsmczlQqrbOHSffr0uffpRne63RVlHSTVfb5Mi6OUb9O82ollrW6z4vY2zW/VbSnUVb0pRbKyXtXp1rwsk6W4SZYfjtZlsQ2Wxe4+kK9WQuzwnt+sm3xZF0VWqde7pKzTJDtSFbMMkEmLvDL110mT1asUcKQyxbpalslOlFFTp1kVJeVtFS2TLMP26bbZirzWAJpKlHkCuFLtMl1uolp8qtXrS7g+OlIdScqyuNN3pqlVUidRsksB/HKTfhRAxUBergZKb9LbTQb/ABuoYO4GqmTJjcioOF8NFN2KqkpuBRVW1/FA+V2SrrAs/h0sl+a54JJ0NVS0LNZpRuSQlwOFqxpEaEvoysuBwiheWZoTaHXdLb7MkqoSVVSso11RMZnpwtM/VbZObjIBbeyIibudB4mbqIC/CQsilDJ33cIshZWoa1AO7py87iubNPUmKsVfG1HVhAPcx/K+t9ISGi+Y0vLS00UuWqxjkX+Ufwh9uuornoEQR/BICO4sMPK2BHGK6fVgrWYH/BKlW4uf9RLqvqrFNspFfVeUH7CmvGxrt5aEZbHdFnm03Ijlh0DbpWQV05MZkpsv90HQIiWB3ELFNF+lH9NVk2Sxeh2jALVhIYgkX1WqF3VJ3JaQqPkYHnZQcCRJlt4mHwRgnOSor3URAz9rsFgxCWY1CCIGpV+liYI0OQrgd5PUy01ML8Cai7Ke0WPsHj2kDsXpqopXxV2eFclKrGZHU785pa6IstU1FNGe8oj8pzoqmzwm16JZ1OTtGvA33dWgAGsQEI1MnJDFj/mtqj5UpitbwBuwfmWlLsgk8mUvJ9UDBl1Fqi19oX1UWSxRstEHddijW0YiG/+l6p7D0xP9tFs5BcHOikpE6zRPMv5f1aUb2fOjI/DMwUL55wiYewaXopyE1SYpxSqcHikTsdAWAovF/D6WzyZT8HbHZ2fx69MXr46h7OeHo4uf/viWr+hh/IfTP8PtVZiuwlkQYsf4SrnS8PqIxQIfEFmguOWoJ/jf9CjeVresmTF4BrQTC4CGzqfIs/swCJ44t/8VhGswQuYOfHoIyAJgwwIlD2AsG+jLnCQ9DEP6+xN4ZLChoCtFyaEGcqLeJJqH4CzrjQhA29JSBJrRBA1CIVYlKHRbFs0OfODNPcUPkdPM3QZd3mXZCG4ef+kaXUkE0QOjFontrr5XCKofmpioyiAkmnw/dd6gGqV5I/RDIu0SoqMWabNke7NK5sFn4ksVzoOra2ANKbq6ASz4xYNphJHOi3oUnuW9+wB/H8T9LMCKaFcBKxcOSNpk2qnD9icFiz8L2ArRpRKkWbAtViID2wTwYhRWhB2jlsQAeqJaA5ltQ34SHO92IocwJcvAhSBzk/I+INzWwP6MHJNkO4atbQCawFcKh+srSdNrjA4A9kSj3O2ZtzpzQVc3vR9Znxinq08cik9HwjBKCjRVN0ivt6AVwjwp8qVwySo+LQUY4FP6g5oDRlR05QBMULQSN83tZB2eQrxsUxmxDcjIkVSAmIqHsIs4gtBjhniiLyPg3DapY8BkMrWY/iR4HgXnFz+dnL59Ow/OimKH45Giud0EIlluqFPfVKy9ARh3hREqe1oGyIFKA0PpUPSascCA5mtaRlS6rRGabAuqYZP5qN2zNF8XQJtzQxVtaBhDxADrA3kUmDaVvBr4JDhPuFOqx9KQMdi6oFcWN5QN7ECKlUGlblP1SaeQ3e9Zi2Ra1tWt1Bx1y5LcAelV5IsmZ3f/TLpiIlC9SStqvlNjKDSYGISH0PRYKvbj0Wv5d9mUJQZl3G31dpuUEAxVinxitY9qiNzHtL5fhArf0EOUfchUdQJDGvWUI+wY5BzwSAFHer0PE4NAizT7mHSAWSDJ9+KxDo/zQJC1KJZE25V0SZa4ovQaDTG6EY2hWcumCMd8/FsUvHz15vgsODk7PX7z7nwevAFDRZEB+g/l9iFQ0pECCPoyE0lJWJE1MxbECswspzdOhAiojF8MT/qhuLzn2kqqJOd9YDQ7whfK+FiUhiB4l4laRMEfk7QmUwEUz8Ud28ooisKpDL38bnkeUIznxl+XMLABIpITwNdAHvTJaJBLUTclajaMETczygphmigVODpFEhOAZQEUq3ZFviKriaa5uPkLxM4VGrddKT4CPQPsNERrVQUD5uAGRo8wcoX+FrvKjdMsmw0YdUy29M4YeoASTaiIeoYW4mg8T5PVip9Uk0HVZ/ZwXegYtDwOPg3l8IkGz5Ag6sSITgM0WlkmaSWMzoI7OimabEXFQXxXXEd7IgTZ8kZHrDkvsTCqQFGmtyj3oBbgckF9eSTK/GHu0XMec+IgxB0iXGksI4pTzFgJIh5EKTbhkoqcVk43bfhDPX1TSNxkMNhAD8jpK4Z/VlcPHKv4+n1SCpQyj7yCJFLq4i6tN5EsfYnOSuRVA8UBVymiBDwhuU2LpiIZBbmFjpRlChQsPqqhBTWjKadyphO7x1OrIHqxvnI0ENXduATOlZhnYi0LOP0CuGPUDGoKPcfnle4pYZ5h7MTdJTisvTaWMwuTbjzPTFYGpC/WMIIHYzYTYMxRHWeSW1la1fMA/5cDCPsBhsbm/qhljc71kA9NvMyboHUjYUgCNISZcGJH136kXtyjJQgUDWYXwXdzj709FyWGsWRU07Kqn5UQ35y8eM0KwaZV1ZKSLVNgnHyJl6ttO/w00DUgFnwY/0i/GrEQ8jvJ3xrMIzBvh6K8stsFSyX2t7DDhOlqNOAhYj1dBN+zTJpkFmdi4zRP63hJ6jZRMrAw0aaSkoVr+pwA+etZVPyhCjRVTLMEiyA8RjsuQuSVkW4y7oLoGISnn3YppmAMeekBek10PqYWP1/FnD4EkxqE7/IPoId58ALKho403SVlDqXAoF0ZA3UdvG1uONQFEoLJtpB9aLn/HgCELXGAGsUxmkFXwdgT9NljQONYKBoNKgtBSctWPGcPC/FNigOwEvOhk0zkE6P5U0sNYDDMjpzeXKXXV99d2yHeiz+/OX796iR4eXp58uM8+KFMbsjiJTdVkTXACIhu0BDabostNJYy3ijSMDtjMDZ5VpKvz8l1HJwDRpn5NrgeLyi7CwZ1GmgvJh86cKVXMF7AkkeXm3MvPnshawOM77uWD2L8usZ8EsXyhR71zqXDjXB+iASgJQ+hFauTbWYwRiqej8lPPQn+WCY7rJSQPwATBcDEBsNPwOa2SQBYLdBurQWYhCVm/GpxW0KM1gFWJ6XOn2MulC66Q6WPSYZB6MLNEU98o2Yb4iy4Qlpee4bDYGUkULC5b4ocAy/55OrZ99fodb7v9h1/7UDIBP7rBAiPyQf0FyC2DrIYHjRZHXpwcQQCOml3AbWvXd6Wj25xFkkP2942S0rWLAG/qp8gV8+eD3XfEkPd8epDutsJjwB6clL4w5Qm/pMj7KXIMhpiCU7FhVcS4DVmw28KMHs3JU7oxvdQsrjzQO062iF8wQCk1eZrImxmfAzOtzjV5+P3DTjhD1+cE5RGIPis1Php8P2DkkFS/Fbf+rKEmFOXINxYy99yeCHIouqhoxx3lvc4YeKEXfaPhrZgEiCw0eGHv6SbvfcWeRJciGdrQdm4jYypta8pOJdAKKme+RvymTf1+0pOyP4d5pAcR9QLs98ZtX/DiSPd7VCaiXWTZfdExFR8RIkiGr+7OPPKVjdzpH5+Hg97SqeDEBx/qbr360SftO5VeIZplJ2nBo+OngSvIM5Okyz9G0Y7HJXT7JgwU2VyMD846gm+A2j/jrO7PN2LQzyvDs3VIEqth+DZSHkzmaqZWFTuUE8VhtbIHnn8kdqUy4QmcpmLnFVUBWZIwqVYLXBOTsav2ciGaQJyRMu7plxuwEF9xaaruijvx7SNBWEo/jV7jZ56TK91ueFmbannZAHdsoTYSSY7IuI0KjWRlGVyT/GebMUeACd3SWpm4ak8aYs3zGoDVWnMBB207Mqq2Qk9w4Prx6DHDtXwmUzs0vIy6nGMaYQFzfvSG11D5eOxEv6nmmRIItFNyTRKL4N4qQXUkADkWgxV3SzFULh1+6Qwi3mShN8hdSaeYfOXCAv+zAtE0koufIHS48/R8seB9qo14ezo8eOA+xWXKG9rqgbuC6JO3cG0NXNxOu170zdPqjWPRwBSevxSMF7oqS7Z+1HS7goDN2ObjybPNUHAY5V1vBHZjh51/Imn3txjUOIxFsVjwmzjglnc1pI3XMzX7GJc4TYJk10atkaf7aVukcr0K9rUSfWhG82shE6LLPSCMcnJ4cm7hdVZM6twqZaz8ZxmB8J01h2uplV6kwky3e5bN9oYtLh7qe6DNbzmrdv9NkzTXl9qkNDa2yfMH90mEPSUvr7sEUUlPtIBvkzA70nZsFdCfX6gR8CbD6hkOCCeNGWm5V1PavTZGoJvZI6bs10Po0ei25kuxBk+CN0ThFms5a0hcCW2McVyC7lMFMrBWKSchMfnr+KL0/+IT348PflD/Pr4T6GUoCktOnXwAVtJ66Woj652IEXjLc3iLsDjAUK4UNrD4RAXeq2THNcQbr+dfG7h8827t6cXb45fnwJSP5z+6Zvpw9PfTCGshZYHuGxaf+40vw5/HtMAw3dBajkBgJiQcV2VWb/UeacXlMoFU1etpSK0vrvnJa+87nmpVp73vJaLq623zmucc9BU6g5W7O6achGtiGuvWqNumIHNDyzCwUsYogXaPOlcX9yXybCIKFeRk0akK6OjPYufUOPQXMsVchNjGz4/TK9CdUtrodTNoyB1VlWxuXFzJZlD2udjaftcEve7fyTK2GCALAYSLhTU9pZyNLqTeKMhdKlHsTQ0YsXV3TJk5QfnmEa72o7H6bpYX85KO+aQctGIqD8lAMNzvSR9YS1ptyis3kdgnP0JAWjQhpNWNBNDiWMkJ833k//oz2S07ZQFz58j6U1y+KAxR3RHkHnOSvuehUvq53p7yZnlYnlgXgd/+kOBiYOjk6R36O3l7rE0viO4qz4W6mGuMuP7mKvAPIa3bVdhwD2CtW1gzFrdDdZLWeTvxVoHR5u1LrW9rD0npzuCsfILqR6+8tt9XJUwHsNUNzjQsB7BUReSDPsZfeSmfM28NB0EHo1hhQXcZoRNHi8bzigwGsEG+a1cDxv47T42SBiPYYMbwGlYj2CDhIRr3zQbJPrIBr4cy4COC6SxF8Hg4ZYahw1rp4VTdyBp/7oDs8HiHk87WJ6Ej8da/QX7qdGKsvc2NViAPywAgDT2MQTaW4lmQ1QdCoHkSuQZhOf9yPdP2Rgtszpoa5kt/V4te8ujhBFqpr7b7NEz+Xqfoikoj9G01ojGQHuErilYjrKpPtBAXBb4f/ZgrUHblwuqJnju9Hm0rFo0+XrSanfTFldHiPZH9WTSKDUzwqIlGWeSqoXlkbwln7ohTk8ZS+N6SjjxZU8ZhxLeMiMN6xiD6hkoSaL05BDwZ+V5/OJoO3g/5Z1gzFvENl/eAm6s7i0yTMprvy0Aq4SdWyzcFub+iX3qjU0y9ZHWoDrp4QR//+gOfIar4o8yh3tL4W+b7MYVJLD0CWHwaS4/lY/wI9XJp5nPnHmSyH2/EYxq//ptybgS/W97ZveHhzcH8xfJfhg1u+lFF+u9etovE4My8JV4vs+A4m+MEeVy+wwpl9pvTLncfoPaJbyH4PepyFb+6SWHF7rik8BsIsAJcf3KyZS3+cY2ocsyw6qB7DkBcDPonfz2m3evf396YbLb3RLeDLi3rU8en9J9RL3vm1iajponWIcHTQW0sv/NdizINnG88Jx8LkerqoUvT5w/Krcrt3LAJhQmB6XmW6I6Ijkv4+ShzTLkd9KeZXPSaNk2hwaUXrNziCpeIeRrOfUMIOU3ampm9wl9u5cHzY6nuvFjZ/kFA8LgL/1wNHOPS4OzpMmXG6q4Z2IclyTi3Lj+dEXj7DxuQ7Dm9lSRyp4x2ju57k6Yc6u3WXEDbMTNG44kozQV6IHnqxJ6zls5xQRTlNUEIaiGOksvuK3W48Nm8/sqP3pK378K7Fc4qz88gf9a7tkU/nOm3oPH/pn6HgkbnKf/VU3K+ybWcZ1t38y617t1GRKO83bYkssFXNXrTJmPAPQbCalvGv6Rs/AMsuOM+72v5U1HeEbbVyvny5vyxPLWzFH27vXQmu89MCJ47GxvmyZjZ089wYAyQN+e485wUtFHhASPnWQ93DDgz7tnxLNnzzT6eNOlpXrpWZiBvyJbWUW8iU29p54/tWl/8/Cm2d7geuq1aRd0mD7LDT7jN212c0Dfq+vpg+8LDE6VGhgH5kqtHllgOkX7h8EWAOkNNA34Ux6+m/QlPv1DW5P+UwBsp9Qicx8nOYUng4B94+ADB+UKBd8Asf3En4vUnRiRj/R06DFOk9Hr0Q3S6BOp0T79wFnDJO2fw8T1s365l9VIq3oEmIocKrwSrqx+gNDKijIUIsRp8hKv2lOXh4krgnCmLg1VvGT5JWUU4Y9KYHQi5kUXt6c+ITxk/NVuRC0C7qyulguBW88PXA7cV/vxi4L9X3P8CocQXvEZHlecy86t/rky+BddGdwjQ+NWBzubvrIP2YAhxvH4P8L6YIp6033fuuhkSHeztT3RORnF3sjcHgwQIhynR2kFYwNRpksYetHWDeMSb54vK9Vax86SRp4i9cjXF+174Yv9H+fBe733Iz33gNem8ZHFy0XQFqkXp2enl6cv4tc/wVV8fnZ8cvrjT2cvTi/allW15Ow42nb4lJ43Tr/rLCvcKIpSc56XsiM9M519E+72hLmLIEkFGHIzkOyfPU/5OwPacfWayE2qA9gq8uMNbjM1MeW6oNrDU1/A9DWDpVGBUpuMrfDosZGQC3ggUrEDHJVMbX2kNZdRiPP4sBClr/KjIxT/N5//GAHKW+5bb3jyz/hjTPzRIyEjw4+/e4RgHMMvGCYYszEmVvilooEus79GMGBDlbKgDbs5akIuaWNRocm6gWWkplrcB0rfHgjMPxbuXbNwiEuYBaFpyzeZ0sJm3/KoPtL2d+FAbCVIQFVBH0JgwLcp3J7a3ZNezp7cYL0pmtos9IKbSHyqcYlL7zADt2flZOXYKtCoXUN+8O6S6BOdnrCbQO8BojuRM/Ijf8unO9/Ge1TT/nJJk9XeFmXW2qPfnbTr+RKIu8f/P3orFvNg3j4nwH1N+4tycObkDHH/yLsyrYW1F4PefdOqDXFxk6cw1IzNni2s3HxexAClra0nFTMJhM20kUDmVrudIysMb3iDLHPbvwiyyyj9ymx7ZK8c9zhRHfumK2/kq1TnoLFWZ4y1Z2w1cpzvGWq5Mf4XOHWydIc4dl2z7dstTL94kDE+E6vE/rD40ORUVX2y8XJllm2ylkn+McXtkSvKsiiZdjTDM575FBn5V0ssfMsvYilnuF4D14lSEdxCTZ26FV3S1YT3VFv4z8PAjb3FFoJ0Yw4cgBG16YxoKPqQKDhrTewXcuocd69dqPPDolzcxbQfc4wv1MYR8iUyznqJ/3EBedQIweUavKHRhMMgXL2ysNej4L6W0ovhpURFbs1Jf3ATzdB+Kk80o62y81Wx5Ip2CZyQbm4mYUBTzSH86y3yc/B0X5HfXv38u+t//V1fMaNj+EDfgEnAeUEqHvy2kxm5PP792Wn89vKipW2UtVqHn7He1bw9l+7U+mZ6/YDbnlmuSgpqzWeeUZQA4gMD1pUKFXAJnLNZDTxQwi+raJmr73eiW4/XVUfbnZUskrBCENsaWKO2SqUEERaGsKFbOMfxZRYeOc++TdSRMDhelY3jpWmdd11dBCHa2LAL97wsbkDY7oMXArdAXzktYGV79x3c8L+PNOHVNe0K66Oh3Bn2DVj3d/J16DjN1nCvNdrzr/AyXk1msXTfBs96OmBX3S+MaNRG3SawMdRv7075pghaRybpffKaXG+VPjKacUJbZ6VDTgOt/DZ49yq4RBvD/vGz3mh2+qD3vOeNjrfJfVAnH8A9Az/wKEG1F5uzd1JVgPU2m53z7UTu7vlB3C9sJ4BSNQtw+/qysoO1/t3mngQv5ZGGwV8aTi/i9pi0XRtCk2cVFEUJgsyZmNr6AvQA7OjIQxq0Mp7TNqLM2cqc5jSwutG/uxNBwDE/RRcztSRaUDIeR7w2ulbKChpVuoUjbI+a2UUd7cC35Hvxr1qeio2aUiau0lFCnFGCGGUD65EyRea1c6TE8W4HpJfTqHIxd3C3AQCY+0OJ0wSwjb5DSCRV95Ssf1nw2Vc6PnQ6N2In3F2ZLjEpYvUBn3TK4Qbn3TO63EO6EAebD3y6DsHv3ZPzSfBjuqLdL0WAjoPUTi8t+d///h8QQbGj6Ovb8/P/JJgM3guuczaW+pH/8PfAOknMYPy7PQhrhDSuE2Ao2miJHgYbatqvZ5NQL7L7d5Wk3SRbctLHczyliDd9BB67W7xacYK0xRbvhqCcSRdl6rcnD1qtQltm3KE+sIvRtsZ4ck/ssdxWEXUAg1RTQ8oCqc3A0KDveIKFvlHtbQRnT1BpLFW3trzBrIXvW57PHR6Eab4Sn8I5mynctrabKQpzWum1p5AOkZBoWFbTzlNY5yXnQXcg2wEJTJq7wuEDqUKOuc3/IUQxloPSvbGdp67FKoupAMR64almWVsiYThvGWBPHXonUaTgUt1DaLpLa9rUdOLDUX2tQ30zASPC0E6TMGXP19PyGBTh6W29kfjJWeZ41XCW11Oez7kB12l6ZT/a2zE0aFAvfAmGLlRBt2XsyTzr4ULr5Tx6vn7wfOkTSvWRCMm7PrKYgt4yOMqwAEWrm7hKcA/avwHN8aVb58FkFI7aQ0XOKeqnKgsp04d0yAiPFgA2nlBUxcDd+LZJ8VSfypwL8kYVkmdx7O4ZPG0Xr/Zn/gEiRfpuhQ8KZmQu5Qt6huc70KFE79+zOXj/Hj8jucGQUR7tgE7n/XsyKPolcDYyyUpsHPO3wgGDxwHnuC89uUlwJhCJ1QHoE1Tn490YgxL6DzGaDNfLEtCBaATVEEPhumiWG0bjXp38ohvFTe9LPGYU4uR06R55wnvBm1CaVqTTQStuwIZklYle4yU0CzAAo8MqodjU8/pKWVGcOMEpchWBquezIEXLak3y4o4FbJ7V9LgB11olbzXDNbCV1BoGYheVSzClnREyF1L7uDapnis2W2nOKL7jkGNhRUxG2kBenuFBW2ACSGhy3Pd7V6RyjbX1OZIUsosm59P9ALmyAE1FZ4uiKLcU50nlGRYBZmzTurLPrgCyE1s+yjHR+/cAJq7SW+B1FcktmndZshQgZ2le1ZhiAuHgr5/U+Wt4Hjp+HXb57lVkwCC5sBYeHl7T6U8kjXh8GkgYnviBK5mgY+/fd3emnkJNPKCdpXUCCoIH19IBcCLXpxmCeuSrSnugako9bPWCoHIL79/zwMR0hHd6R2XjEqCN0AtQitUtah4VPy5vrVlEw03wWnjUwtrZ7XZmD2JmzqayM3cXWA3RyMScQsESz7q/26TAPXNcO4heUtKHTHokANruSLEdgk/k/MV07guZAyw0CzYpftZGIbd33bcVEc/dYg4A3YCcBndh4KhkLo9TUgu580IOftQhq8qWyOxFJz6nl76zgQ3t2Pa4ZyWDFkZSDPQZ0UYyWBZGHfke16DPeO471cEzNdV2/SgtWKhSEmRJsdQ39AF2k9RCEMPjE+zMCZQ/XiU75L8mHeXZOlpRiWw940N1OTJEPS7KBWatxhx30qMWEeJJ644A9HTWjkVpp40JNdhaQnPoGIW8bnxTFFkcU2daSEtLSmsSmeWS7sSHhZdmE31u2QV+zKhEyD5NDcyNPk9NnoPV5O1s2aydtZoF+shrO7aQiyFahfmQRZnRbh2VTR3Ztz0+seewvbm7CabObt8k4WvLZo3dnNtdyUS8zrqARm7GPQ7Y6O23x4EbveG2D5zvpDM6MW2yDi3XDqMveRSXcczBN58NJg/ftD6FsjWQLA5YwFgd4cJ6OPWohDfz5zlfy4Mjn/TWPi/lwF3CO9bE7gfAUt+ycA/C04uLny7AbqzDE0MXLx7DFsQ5L+Mg0kmysZIDMSjKWfSG/Dx9pAgjE8EOoxE+5YQpC6xATh90/BTY0ZIv+9sXWTHqGuIXsHquTgeBcIYCIQRoU3wUCf8PUEsDBBQAAAAIABqXiFwSfEmfDwAAAA0AAAATAAAAcGx1Z2lucy9fX2luaXRfXy5weVNWcM0tKKlUyMzLLOECAFBLAwQUAAAACAAal4hcb7LiwHsCAADQBQAADwAAAHBsdWdpbnMvYmFzZS5weY1UwW7bMAy99yuIXJIAmXfbocAu29BhwIB1KHo2GIu2icqSIdHNsmH/PkqykwUI2voShyL5Hp8ezcPog4D1Xceuu7lpLMYInzDSvZ00dHsD+qxWq/yb4lBSWh8ArYUfd+8emoAjBRhzRaxy6hd6Jus1HCH2frIG2PUUWKANfgDpOc6d0OnZMFoayIkeEBiKHMhA7/3T3C4xyC+GWqhrdix1vYlk2x0MJGhQ8BYMN7KbedSGwy1ECdsyQ3pSfrWkw8dT5WXCuV5Tzn8uk1QxPZ11qzqS7/pKYdOufBuLIHWprf4sMClts3Y40HoH68k9OX9w6+3f1fY8m3e19WjyaP8x1/k/q9yUpBrIMArZI2ArqnuSrECBiqo3IOgkZZhqubj0jCr2Bc7EdSSZxkVG1DkP7Iw/XAU+9OQy1v3xp3yAr4/fwOLRT1JQWSEt/34NtGhTK8cgM3DjXcudEvCGbLyKvSf1G2X0RBNmhVV/P+phth08FJ8FnSkUpqUjWI4Cm9HHyHtVTaPcMpntBdO5rJRcUGahoVZVXLoYMjPrEtVb3UHLluoRpX/jhSHkSG6RxIv4rHni1b/x6WX5dAiJdeO1cyMnLjk6C1hPkULy2FUyC4E9StODb0vp+4FixI5iYoPGFDZJwRmJvSsbXzCqU+c7XdTyMdB9D8d0l5LWGAMtIBvhgSw7SptaYJQxstkBSVNtVfkOg7F6dmqrxNRuSkAh3TELHFNPOF9DBY+RyndEucYGXZ4FhH7JmyzY+PTREZo1VEfKdfNl42PxnC677r8aKQmipo+9Els62eMrC+deXu3ThuE4Wm4wy95Yr4Dgw387rj7Bvb22av8AUEsDBBQAAAAIABqXiFzUvbEN7h8AAKCHAAASAAAAcGx1Z2lucy9tYW5hZ2VyLnB55T3tcty4kf/9FAhVLnG8I0qO71I5XbRXXsveVUVey7acTUp2uJwhRsMVh2QIUh/RqSoPcc9wD5Ynue4GQAL8HtuXu7pjleWZIdBoNPoLjQYQbbI0L1gqHkXy0y8iTfTnOL28jJJL/VX+F0cLryyi+NEqTzcsC4o1/KLesTP4qosXebDki2B5pX8Qa6qnv91VbWZxUKzSfFO9KhdZni65qEoU0YY/ki2mK7HMg4znhIXwEAPhLdPNJk00Gpe88Jdpsoou/czAqFk1DAouWCAYffA3QRJc8ryvtASIlQKso+Dj10ePHoV8xXwRJFER/ZX7WVwC4Xygn58EG+7in0MminzG9r7F/w8fMXhUQzmnb1iIHTEqzNKcOWVylaQ3iTPzoEaUuTMvTm947s7M4jn3gFxu7lz8Odj768Hev3j+3qdvnDlzfPiDhWTxnBdlntAPCpwDJZ2Z1ZLuiIE/0s81aHlIY8z+nf2YJnzOVEm7g0YJ1dEVS9KCmWDodwMxLEy/LQLBqeUwyqF/Rh0Y6pwnBdtnjuJMh2oAr6yimNeFcUw85IFNALip14psBBmGG0pbo47lT9PLY/jNJaLcP1D5MLiDoroWlnId+A0JrKi2h1/VmKQ3rcLwm1k4LxNVWAQr7qtR7Gcdg8AzTctmN/O0gOawjnBnNWVrIlo03Wcr514R5cG/B+wfHKSpbEk4zfre5gr+upL44ug8L2Hc+W0kCj+9oq+z5mCaTUmwe/dVd6FNoMQDMLMav148bZS2RGciKth9icqjZRwIwc6o0GvJFZKYPuBQBMkSR4r4VHIGSoqf8Bvfd5exMAiPQwQKo64WCUMY9GMXOQKtB7rGtZqfY6GZZ7bSDwI/AQ8FMbBRCPBeBbHgzZGxapj9wLrQhODxyu4J/mKBtnsh4T6qfqPiatwAiYtP9hsY3SDkoWbzKBSgNnhxAarjE9IAJGbWqFFLBFBEKL1e5oDISE2oIaURVYWSbwDhOpVm9zWDzeoOGAoHajcsidFELYe2PmsSYVCPtWSOw5iNwqp5sKaSPfYoBsboVjSziUmjXelwzRVztuFFgMrlkIXRsjDYwXGc50URLNcsAMDwEtROyEj5roMkjHnOwI6zAAxxEkbXUVgGsQLvQd0KjqHUAFndnNKX8KM0S/bvUdg0Vhqa7IyGtmoNr3dvtPfgmCNoVo2SUYYb5HxZvpPjjGZmjfIeMO4pv+axq6sdv/zuw/etYqCws+BSGi4p2VWJIr+zMdN2Gw1L05S3GNqy4bZ6UWZb17UbMUhg/oTjr3khSjT26hdxcfipDQWaiYTmPlcVnVdkfAXs9YP8cdau3EkA8yHTAHCAGOiXaPge2hoE3e52XXPJs4K9pP+iNJnURuXHdPSyLnY0QFT9jDCjF4RhN2M1n4Z8G3oRnN2+Sk3uxgcF3deDe9Q1QK7uFpjkZJmG8PrIKYvV3m+dWS+oURGgCjA/CIrCblj/5ra6sdoUR85jNxBLnDrMBLt47MbYBpFKfMLv+uNjdwNTDbC3M+HMW5DQk5PQ/rT3eLP3OGSPfzh8/Prw8ftG4eEO1rhWPZk1hRYlBUZV09IEYZedPKJfxEPaiHpRskrdlSNdE2xGqvycB+HdIbvXY/5gjHFTdnDG1GXYEPxNkCcwnNDCqwDghqxIWYWj6qvWrqheLHUO7fMHbb/R2IWRWKbX0CEgHHkbTZ8GDNErME8w8Ytjdg0mM2TaX4F2ijWvvoK15csize/AooUMYQl8v7FsmVKSLTMNiHb9roy/R7rActctmoR8UV66zgsig4EIglylZRLOmbiKsgy1SUWhIPQaYtaU4h5ke7Dp1KutultMD/o46wWwEnoSHYQv2H2zxYdGJyfw2ji/EQZtBDR7NYE1CYt8Cf0HjLUbYZIoAmlHIjXoiyYB63gRFWu+rpAmNlZS7FINg9+tl5ZDByDlbL3lwfEN0At6jVXBlQPjexlXklb13WJzmkqraXYNH31YfONld0ZR8Nt6imqPDqNMTostqzZ6+LFJ9B32fRnk0IPLAFUhC9NyEfM97BXKxc2aJx3qYIbTsSUIP4z8Js25Aa4AbctSnI65MHv35EeKOiFq+2nGk30Ss0yqBPu9fwNqJb2BlzPP7FpNA892NNtzoSFlUCng+wbAB9BkpIuZBFirhjF1sMNerPnyirhXAQV/aIGUWcXBJWKqRrff2byJwNFEyrjV8M3Zbr5reAC75AHszlAwV20eB11f4HwIfHcP++G2xc2OlJkPmNLlWsXBeJAv126++2e7Lx/FkyP4514cPP00A7xUe3Os8/rD6fnJ6cmPLzvaXCngONL0ybvM0zJzn87Qgds92O323ZrK7b3W08CKkrYSvcP2QHYoGmPY9NfPs60v0jIOScyQxuy+Gq0H0n/EB3rwwa0oSmGZVqK1El8gt4qOaTppid/GkBiMo6tvyTgNnFCpeCTiqy8zEDzP09wyD2DdBGeW+mJdkthLsovdKNz9ZClEqjEwizPi5ObPO+wk+QUUtIIE2g50GViCTOwDSoArVKCgOBOI9/IKHFv0bGBMSeVdR0ED3t5eEeQwL1RKD/p1nC6vwNkCBQoOGHpE1zy5RrWJ7BMwmFoLGGaU2es0Lpt+4w4DX0B6KaAhGXjdYBZR6IDjACogkheeVcNH9FVww7YY+MKxybKqiw8YTllGFAgS/rpVnU5Br0tjD1FBKyL2iLh6CyIueF64B/MaQhv+DnuTsJ/INog5O7s7T0FNsePTUxqWKORq9DYl2DCY2qdsgc71JZIYnPQOeFJ0BLrvfhjHfmWywbj9/W//AW0Ua6D8M++33zAHo53YGpP60emAF6ZcjW1ZpKDqIjSPd6oCLsfoBiIOPVgGJXoMHXAuoJcvUXjY06dP/+mTtMAFdnc/jhb7y6cHHqCrPOmoENhxnoQg7wDY6wB48vrszbvz5z+eH/Z1V+pGcOalWr9FL4Jip/+KjNvV18q3BH7O+Qacg1DacGR01WWSH4n9GlzQdEESBxW+f7EbtueIOyhrN1yO4BXnGaCT8xWMHjoIMMW45igJqGDI1tIkQ65wsThacZyjtrtProNcGfOA48Brc8nyOIqXnG7m9IngPq7KHRmSBcJELyjWDy/bfKDarOsPiFe7MVPWqh/7gxI77KnHnoekXc+en/+AFFT8sStYeoP6Fdg/Ad12CuxyGi3yIL8bAAcPcq1gbhqHe6K4i/VozuBFAlNWUEciWsRoilH42gTvJAL2Sy+8ae0AvAgKMcrB3lBsEjuAizxOtUTXTzF86voXsi5ahgYpv8FStLgJ7PTNQJMDNPm1x94pPdKvM4gjpcbYFcMEbqgS5hqKZuax3yPnI28rURwGpoRKSsd0qTAGaR2IoAB+S0EpOa1+OSODMBg11A+BXBa3MD6dCsgetP6xMLBGHtKYy/maYwEFVTiGun7kNKJR2V512aqqF2Soj13d6+H+TI+P6icLxBCHPfPYsrjLuNjLck5zU+k7IMdFhiFBXaF04DCLaeOAnFUFX2VEjblJyo7j+DU4JVAO12WHJAkeMgdaTgAc+D8iqnIOQMJAV+PfOkw0DO98DfZkE6G5FEx12Ac5UNNI4V+WEagcnH1EotOYWeBAyDNprYJlUZL9BqDXGJRp2uUBoZI+pxwFdJN9+XGswmWcLqg4fugtjEKOrEUOFtIMOA0rePjHVerO+yWNkoZcgYg8QcvgzGZfRahlp7wXwFjE65P4/M17IuFELm94xMd34O0rt4o4u44zmtEu9GOUz46GUZSZmvcCb6GalOS2h0OV71//8tvzTBs9WvvtDNjodWErvkNVVsoWqpo9Ez8Lulek5RKXUO2pasaX0K6dXOThrz56ZVTTx0kOqhjX7OycnI0K/GyOnuomDUuoIA1UVU8c4TqxW3du9qm11EWIoLThB5pH8o7B1gjIdtqIq/YJdQTk4p+OCCjMIGRRcWH2iaaIVhPtqjV6QHUgkyzn2tUaVJZc+GN6w8IuTsRgAFNdUnMSYlAJsiPoUq/eYjKJ0YEHD1+2nUuqst1YV63Iga4CFrOeWI1uQMZr1LfegSSkpg5iBa5bU5ijWWGNQ9kzhBZBusaydwzlOJ6m6VXlMu3KsOAuo/yVPq9eexwS8ryqNaBPG6tMVXc8WdXVsY0j/cGMPB815K1fxUpPpC9FoTc5YQSgCr9rj6YBZgybVmSWVsoaanQEiBECPCVwddzPymzYRVi782ZkaGbFkZrPDnsFVgMmlYTqSG8o3wklvk1NR0HomUa001E6u6kDZr0BavJ0BEYNOljWCDO3VxBfE8v9mBavMJ4knZiBeGc7dEc6LutB7JC9Vmhpq7t7z+Wr3Vbs/C/dNhJelDAWG/S0vOK2aBlKXXPARq4jin8rp1wHRe58Fbbz8b2LEqVhzSxZM+RsfNmrczgd8kYVmVSPyMnNAytIw9zHAmZ6jwXMPSWh5oR8C2gbkV7XjIIvZ3dvi994b4ufohCEQmjH8u1ruTT/XXo7Z2+fZ1kcSevQp+fMMl6VVDKu5fpzkdqSOQZrIBNoNDupH/ioazusSNHldR3/nG8yKX3QMcz+ucdkWufQxv1hhq/GVe12U8DB6d9o9ywEK252tADXUgMfC3CoQfzDMm8skB+arPsP6VcYY26Gwccdy1tGWcwVOYExdI0aHv7g/SR7PFpbzozPowL8CK2RNZGODVEeYDUF6Rzkv1td6GcFeqOax+xanAzKvVpxWnC1NAmfMHoMTmZh2oTuWGTdCNmMSjFrXe31VxsncSLTcGBSRb10TqSmteZlpt5L0pt/G6fYMUgMGp5xysHI8EBwvTDTioazxR3LywRH/PBj8rHDo7ZJdI9a+OFzKKJtzKJIMCkeOgK+zndlUQATDndB08ziqnZ03HxMrpZtvEvBMv6JC/y/v24/+ktU8N3Ym429B0MQBrl65b2gWhPGcxWUcaHg1U0NeGZYE135ATEHM4WllmCnrrhGlkL7xlgMqxzLZr5Ic14ZzP6oa6tew9YOjzY+b4+jAPQvWOI/AE1Pg7u0LODLabDg8fC4U+2zGLw8FI2XYYT1zvL0EtwM8V2QD9cejs/oPUJrXNjuWpjqKPyXkpecIlb0qX848ZnmQpmPFg3D+ljCjXO33cdil9FKmjRK43GlWruOF0Z18CVEnRRIs00yTXbGek4dZrhdC+RRWWPE9b8l1DxYaod9V0Yx5j/hCsQesHJWFpU+DonT+yOl+GhpVSZeCseA3DfqtIy1QTpltyfa6w7Ar6Mk2pQbEPFi7f7m1wefgRVMvYI4Ku7ct4Vn/+IZTjb9Ngzdj0lTII1qveEabU6qjopdaixXahxwpg2KteTrd4tvLYfkd/uLb//+t/90BkIR1NpyE/rxIkZsZTPj7KnrEO3SPPwJHHy3O/VxuGMa0Eg9qOQvUlyUsnXqCO/peojmO9CVb5L4bgqaRrVX0S0Pf+DR5bpwfz3GVWbF0yjhSBZgF+7aWHvmO+/HFD9uTTjV1Ei9bBHkRLXa8ozRDKsQwYLkkmOmx8EMdQfIA8wy8k2UYN7oPluUon91ugdnBL2FXK7TmxFkrcmvWkp9SUtAzah78ykOgCy04Ip/pvAR2c1DZT+9t2RPj6yvY1BgAMC3kpuMZErZYHlKdg1THRMZW2PHZwkMNWdS9cjZMbjUXfEVZY98tATj1h0fsq8GJUYrja8NK4JcOIg2pQTgh+nVpAWjivBxmJg+kqTymLxz+uTKPLAjg8pzFgZ8kyY9idw2SI9Su0aG/WaNQTQoHAmf1v6nDOQOO85xiUJm0khLDVqfEtuKlCZtlPuDymacYLLmpGXySW5Q3S2k0rTyNSLVonvFS7SpFyacAWr0cb5RzpGq+3KTFRNxHoxb6AeTYQjPaTArnS97VSl613HUyi4Bm3m52oUOU9sJfcRHUEKThn/Nc8pTe7/M0zgeV+Q1FNTmfwhiUFDweRPcop80hc6D2nWsMulWEXOeuQfewT+PihLRariUFoogucNENviIfpCUjmEpmCoBk7h/W87/Clz/WRw/yu1bcPpncvkgXFT2yOBSncsANFmCOXs6TA6lEBt1lTkYzhGjfhtOxjJOxZjh5nGQCdpmbDgMbA98iOEO0o5p7OMROxgn8faTbnx0wNOIBusZHdj4LOYYFob3j72nq3oaPmHybXR8WuGtZusT9MdUQ9Q1J9+GKBgdl/2cpk9hVCWnTbd7XSget3DD3X4loCihf0woVKC0mxKr6cZxi8gBYTjFMtp53TI7Tac4UyZwHfZGL2UCPDMD8ruXr968eyljdfvvT85YvcNfMFfwccdwpy+rbOYx9j7CJX3MDmY3mOX/CyA8AWK9j+BJsIL5zxPC+fsPJywOymS5xt1HMrZfpFN6jDlztMFCJfxh3hylmcZ3cjcmrkpKiow7djtM7W1DO2jti5sx2spwQysSwO+D6XQ1OJUfQphhvmCRZnu0i1iOtgomzmDyNxXiKgLWxR04mASnE8RxaV7hBgZdcKbT9SYAxIQ+D5MJuczOXUW3kvosEDJHBFPRyTFnYsqI9GciYhY1zJ9UH5KhBN8a3HASr378hPNQ+BrRo5HEd0rxmWYQOraTTEyFN59ZlQo/yV+2ejNN45hrFZFenBpbgTEfOo9pcmnnnSL1O7nWH040gfisHDMsaagEUS5RUFFry6zyxoqgN76QZeGolsg0V7x5tfdeLp3X6eLSsBW4ZQZMGcfcV5gibtuQ27tBR+txkIq9aglzlaptUaj3tmiGuiE8ZqyZ3kQk+vkVWOIc00CBcqRYda9xdj6bODgTrOFgPo/5/KP5sSPgzU40Z/3DmLM5MnigV2XFva82DPhgNmayp7hOnhYgrcqhVOTA08omAjKgDpcT1Cg+7R3jQ9lB5jONOWQ0zVVzDjyQpz6gbmJl+Hux99uDg4PDT3QID08Q3Ix9y/BHwoMiWJO6Wmd9fekE4dXzk9OXx8zFScrRYzGrV+mkRJJ7LP3QSU1R9PHrzxXw2Womgou0X2EGYmqEreZk0zWBOQvQyQUyk28iyasVIb3CyFYyEZB2P/HbqJBT0Hv8+0AiLxMn6BMQ6mFCQ21STZtkWJOKbTZxb53U2D6zonGWQHU2pyc1uw/ouDPzVIneJETasaTTEOnMx/aBE+rwR3Uckn3oJT7mwRLv5MF0ARNrbowbZUTSdhbaes/lJp5S8Bw338idcJhy6dUxhzO92Rm3H9eKnyLEv6tR/HZfbre9joJ667OgIHK9gqO2OIM/kacwGVMboutNzMo6w0zMcENWaRziDiDwQCiptd5ovUnLBCfZcrv0XMXM9tOs2Ket1XoDrnFwhEkjI/fUSgI1T3KQi9mITdUpOsMhS4EAOCEKCsNlMraNGwd+GODk7qTgigtZSBNEHZEjswxVfzSV2uTpOQdDbyVvH4pobAS3E8gr793ma9lTn3qKexHqzn907jWwh4/O0Al7NgzHMalqbEC+krsbIzw4KLpMtFL5OUP+9Ou0zmcezMie4ZzJy+5+NrZUVrPnvQ0v1mmo8hRR+N0sytg1UDnKbvH/8nqm3EQ6gYJOZxC4Aw1onxsAcSieVE3rxLgnSF/aRkHsT9s5AoK9X16bwjPHUTDAYRBAt8J+Lq9/RkCAHm42NYZS6QPVizptGXvj229pGlkhaK5C4qlvDUBA/PK6satZnVu5gjfYg8pY7+U4wloSYITvjWG0D/nraAZp0Whoh30QRCZTPoBSuJcORVTOevFMhY6slqBxMgkMtUhjeTqi3lpOe2xogOsBsxSZCWCiuOCjymVyK64eDZ4IIwcYlcygH1i3J+F0WzA9GLvOvVX6AeRu0xweY3Tswdltbo47WQHd1ymQV3WCBIvAAWmvwerhsSRznISteC6tAoYfGiSzTpnuelMfK22+xYYN6lF1DxT0cu068udnDaWD22nqSm1S9cZqofmFPOpVY+Ll5cCc6sJoZs6cvQ1G84Eu+N/e3jWq5DRxPvW7LMsgK5ANpLcuD+fqLYwrqGNFog0HWEdPD7rLdHuRyFzYc0/yz4RFAIPRDBJsy2ZNqFu4adYbaFGfp6kO1AMpJpnCT26LOXT5vgMzpQCpQtCpzxCaChApFGAipEqtV7ajT7eOxP61dCStdJlqcV/5Rofom1VnxagjHBApzIUtCxRgb5ioX0JP56NB0I/O1laCGuo+b8dsAvf51f3Bhtr8+GVWqc/6bdOIYdA/yLNyZUgB9OsK6pPb/6jdgtSAW3aonjAMZ9aoeUOV96mPii/KLOYXlEuDBzn3TBFK6XR2r1/RdAH/qa64OM3zZeoPvF5E6KpJBdjjXrf0NSrnCWpaNd5WhTSV6VGlk1Ryjyq2JUNFYhBFTxRhWoVj2Df1rzB3VL92MRaVqrXy3Aq7TJiiKjBP5Q5dPpvMDzLTqs0UhIFc15/b64RH1VRyK57pYhSoxYMN43iQtZFMJGeKVfvmcglC+nBCKyBhJLI4uJOpSJnKI/TUNFZY3IexRv9LOe+Mjkj7OrwnueTIhH5y9rKzHPCNWe79+fGbD+eTGRWfRbkS0V/50dMhHkaW6ElGweibGhZm8HjbCNQZJEBoF6u03ZCqHZ130l2sdoPVHr5Bz5sIMLQu37HQje2OLF9PX7JuLVMTnWQGzSRx1+kqFXm2OsF3Iy7VPJ23NJMxIljsG0YpMD3KA0oYmgPNC3lY63QjdUT3rSKEJbggR+3DkU7O/uj/8Ob1S6NFOmz1uiFt+lBweNP2OgaOv9L0rF4gqgqYR2gbDQtcRx1d07R8A6rSuC4CpD2SN9aAqLQwIgT21cy2LYz69fMsOw6KgFY+T3GK60yo5MVDJWupbYdWJiJtNCDWMJf+mkihGlmiDqlxaZ3Cuxwf6mXTY2pcBILHi0muNTb4Xl2OsG/F5pUXbDO/xb6oiKpXnXbYOnye/Gl1pmLVzL706+UieIVp6zRrXbeHLl3N6TDtEShtUbgVBDrbx3nyZF9EBd/TB1LuV23v+/KaHjpjZmZ1WIHsbFu9uzj4pE7UHhkfpGt57RdpSidefZZa+fAH//zNm1P/+OTd/yHFAgZRHaDa7O/zs7Pj5+fPHenddamQd2mwwXuYGpZsROyJMqrZGYIprwlaqMHiKHWtsvVV7Co/pJZuw8uO7v7x+Hsf+ysth93ploYa7DHhCY20cfyf0UvA+NtopVLrjVolmaLTUkqy/FYaSTXx/0wJGdHYSgl1HNeuB+awCc5eDvFofYPCND1tyDn9UDN40mRz+I1hsu6PqNDuCiTbAlCBADRhAi6tNCEDcmW+fL8ER7gQRgEMsDTFRMMeExf9auCkFUVJlO2q+Gxk2Dpi6VuSVHatEURsD1QXYdFg1LU72dB4b6yvdIbD+0PhRvjryzhhUjwdYxJ2NK1/TtwIw3QGxUkKpMrWyM0+zeXCmbqToivwUs9f+yc+41pH89SUYa25asp6WaWnreXzHXYmV0LkatI1fCqvq6M1BJos6QkItg6uOZ64HXP2cwX2ZwOSeXBomYQSFNkqWqVerlViaoprgjeYnLqJRMzVuXG4Sm+t8Uoa9DnD3Rpc+u89UFqmqwcGWFmjV8dEW3SMuqPV8kBzl87xBlJGt+xXR8SPdAOh/GnWJRomkkOVu5GUurpmNN4SkNoa2g7mbcODgR98OmpYT8BvuX09qFGZPBCgQ10Hg2DKIbFe9KpLi7waLA3bxPr2EPeddV8vYODa9l3GD1l0meAdHc3GwSeRR//qGniKLmlAH+89pVjhIDZOU95PCIWOIz6tIEtFj+rGVPyV5LlavzCFtmUJHMdRGS+UjGEtkJhHL8pEVoN356gyEZZ9+1CbNRVPHhkM+tlTBsuq20HIC+u8VtnOvDbocqGSjPms4chPqejMPjWHXOJuSwFmCvYgsqATriSsrsXKsVrPTBRqmaKrUkb8EA06EnTxbDZlntfjMFoLjYOM9b8ulGAs8HW6g6YMGot8g3f/yKQgVXLWaupZf1vPOht7Nr21Z+3mlCz1+rOK/7saxqrT28bSI05q37aNimdaauhMpbTrhBbKd0+rRHid504bkDAOrs65Ds2MO+MAol2hr52oj8ZW+2dca/sS5ZHP8F20iript8jHUxts8Aoa8vcDdhPcyZwP8m+EvdMKmtWneBtbrDDrU2aRWCdfe4zpXuujKIs61/+J7PET2S1DZ1ZdZ8F1GsnTvSkDLsaTC7TfhT8SHEw/1Dcy5Rw1ujEx1FfMqV1edKi47kDT01pwfU8VHS1uEF5m56m9CaqMfTs60IVS8MqMuepGDLGv77rO7mpuUvvMdhuXq2P6WpBl2sDI3V3IUbvKLSzyiK4TtDY+ySQpxTJUs3vdq/Nqi1/1Xm3RuABp2yv3huIHTUvaOO988Hxz49osytLa6uY3UsF15m5/oAezKqOkccKEecfH9lucVPNTLvoYbt249KPnzo+d5iUfICIDF3z8pC7xMG/rEE3cv/rdHJ33cXyN6zig93ifT77dJRyUPptHdIRlfduGPQJdy45DF1WM3FPxZfdSbHEPxfC9E607J8bXQltroDuVjqcbPtU9S2bySJrjPNcN4mwdLDidIsGyshB4AU21vYvotcxKGx8cJkSeHJvxawy2uMWgdyHZvKxAN927BWHwkoI6s01dlCpTl+mSCDXk9Jk2oqh0jCdBfingvydXN/jJvkryWIHAG7+pJu07VTc81fd5enYuOx5R0OCOWpM2tWhTZ4vKvW2eam0i38a7qUMQ0uDivsJTs2Zuro0rD0wVMfz1GiczQEgn6WJwpxs1i6Tv5d5nOSms85EVBFIgmOgDVlqstQ9DmcWBcThJw9Rqqe7AZspFfVWet550d8Hpm+HIMu7gcEy8n08d0ayOTR44Q92bdB5249Dy3Xt9bC2SVh6IcG/0sHNbjQVweGtNgy7Se1eIKr8M1/noh9fyO8zZ/gtQSwMEFAAAAAgAGpeIXAi0or0oAwAAVAgAABEAAABtYWluL29wZW4vbG9hZC5weY1VzW7UMBC+71OMlgOJ1LoUEAekXmgXVGmhLRVwjLzJJLHw2sF2ul0egAfgEXkSxrGzcdmuSg7x38x4vs/zI9adNg6kbhqhmpkIS23HWSe5q7VZj2tneIkrXn6f7WRrWxreoWFrLhTTHSpmegXcAg37Ur0T0rJSq1o0cfCyYVYckq+4Q+vlhskhKYIx/Bo0XjbMnhK2UfSg1Y671hI6xRv0ssO6COtDOnZrHa7j4JXC7KA4Okf8D66M89lsVmENntUsfzsD+pzZhon/gsVbdFk+7UXdQmpeoXl44qlLdgzy6nxg/aHYcmAt2Vvz71jUWgaDu+1ncKmEE1yKn0hx0lMAWaBYgZYMS7T2JGAEvMeSYGq1U62NXiccROVIsYFd7PntSLRJ7r1S8E2oSm/sEXQGjz3YKA0Xy6WFDFnDwGlTtifl6QtWSZnDu8X7q8+LxEwlbKnv0BRcVQNhWX4Em1aUbfTAjkY/fLmEta56QgUZF4XjnqKTphes2yYW//z6DdfbG/cmZ0BelhhW7Mada4PPLdxeXoPkW49xxx2BGDyl4+hrYvFCyo8UAFBzChPYCNd66AtjiOfT09PXdM91ZIDeHVyLgYFaGOs8OXeonE0MulZYWGHJe4sjixQKrjf0el4d74X1MQQt0SIRtALbryz+6MlSYmhJVy7FynCzhZLL6J3uHVk7psxX3kZ0n+304tNS7PpQL2icjuphzcaSA2dnMN8I9erlfAr6vSwYv4fBwgi554TC1hSbgLKg50qi2n94X2LnYDEMFKCPmOV28vCfOx6Jnyk7iAEWUnf22E0e/WK6rjNCuWyR/7Oxq7bME8JdQWayfJLaYyLWcdbs0nhuW26wmueswlXfPGny/6wknj6B7FF0TyMMtW+vnAW747Z3sBgXWaIUKl0QHhoGMxgq2wWtvn4MD5hqjEUv6ITGEcwPwAuZFsWhcwyvb6piw40P9XiU9gZWSuSq77xy4t5UtiOa2CrQfeLrsUBPm8WQwlLrLh5RnowpEvtLlg+5ErM5yRY9NqJsXmqpzXx0Iq39QTz2X+ZPinJsC2MLShrA232cybnH+RdQSwMEFAAAAAgAGpeIXCKG43OqDQAAukMAADsAAABjb21tYW5kcy9zY3JhcGVyL2FjdGlvbnMvZG93bmxvYWQvbWFuYWdlcnMvbWFpbl9kb3dubG9hZC5wed0b227cuPXdX8GdPkRCJ9qkV8DALLBIsu0Cm02wXvQlCASNxPForZG0ImWva/gb+t6nfka/pz/QX+g5h5REUpRG49htUD3YI4k8PDeeG4/yQ101kiXitkzz6ixXt3Ui90W+7W5lk6R8m6RXZ7umOrBdW6ayqgrB+uGNzJPirBuf5NUuL7jowYlW5oWavG8PSblrcl5mxW0HYFc1h0TGIv8rN2Dspax7mNVOpE1S8yZKi0QILqK6AKz2VZHxBvBnxq1nTnWAZTMRdQ+SVOZVKSJETESXvORNUiAYHFmVp0Moqm0CHOkhxPrJyZCQ9yYcuj8ZSlFdGjDgzgNCjcwSyWk9+jE1StwKyQ/6H45Wv6aGp0m65+ovoYE/JkFzKfPyknDofitdmUBit6ubass75bnmTb67jQ88y5M4LyW/bHJ564eg8ILpqJ8dAFg01o9ihak7eZLZWXVTFlWSRfA6ueTN8EQ/6NYIzhhcr/XLt+rl+iw8fSVFSMMl7CFhg+/GxPj2dk3PLoE46znM+oR1031bXtmr4gr0mPbv2nkm8wOvWnnKkp6VBJgLDfAgLsfy0Sah2kWkBt20t3jjDs62UQX/E1osticckuZKa1Iier7x7OzsjNZgb5O8dKQYOPfh+RnxgGwqy/gOoOZlDywQvNitWbpmvODnCsU1awVvyuTA1+xQZbyI8wzAMH0lN0kuHbsC2+YAHPu5zRsehP1QkPswDy9nFliCKOPb9jKwRuG1W90Z5iJCERIn4C4AVMP7Xn1hh7KbXO5ZiXa76PWONysLavhkmHQrsrYpzhkbDYfHcT96Dql8p/GKchFvYYvATJwVwf/wfITZchqW0fFN1aTIzZ6eLU8T0AV2VcITtlUUrkbQw9ETpSOoW1EM7jTlg8LBUl4FG8EA89A2Jeql2hXytobxL87O7EGiLSTbWCtaGj7smyZQam4vhfCTLCNzEShwH158DM9cwfSv2GbDXoyFAUMsVMG617lMCgQbsi82bIXs5bDQVV7XPFuNQTwl5yx0PGykGebie7CG4IIU2cRSzR3ioR+RHuYuL5OimN/8aDIaAJUINBmOkZqWoWmwjD2hkO7GiRrCL9MQ8UOtorF32596bTGCtAhHfAM+9/3wLHD1ZI17CLmKzhlpv4/pNs/0j7oSEhhxH2EMOuyTMMrLXAYGfxxWJBKXlxh8BC+MYYofoAYsZnnpeNTAsQhkA+OxVo2M8AIkJl5dEn7s1+zlWOnw6u2Xd2bIvmIv/ajgpcP86D38DyyBkXCQ5zgkjNqyyMur4JALAdYqrq42PzYt92MEYWTiWAeKQeBxMDIFPccq2Cgw6/uq5N4BhuIofZocKWQiWwEjvgFu+IcA0xCdacYQOmtn0fUA2m/uu8skHTfwgRP1en83amfPQsALp+iNb4lmdqKfu9NvOLBomg2WZQRK9h46xghOKmpZSc3CGc5PbZ3u8thN23BhqNjwn48zOF0fHYLEHR1kEX98uK1UG0fHjq+GqrlRCvpAVeC/pLyW7A39gyAYE683R7ie5BCUvHmADml5zYtjATnT5ml+3lL+OuEHXppP7y7eNE3VzHDptKgQr93qw5HQ8CP7oC15H916Lfz9l3e+FC9ACN+3hy2koNWOvat5ydDZCvb8K3bHwJkGqioTvW+qlAuYgFlRGVPhJgjdqHlgk+/plHqcoGkeHvZlp3iOkcdC7E9n412PSKQLVUBXcBqHPmfy3jxI1vPh48gKm0Gk4zBcR7tB377Wlq7380bs9aRJ7qcztE/mcDwFWaBCk+ZrNj31eDsqhQBr47ws3YiZeLGIxW5oY7iVCXSOWkPXCCzY/FO6NEXjkyqRDtUwK4UQb4hcjefBTKCz55gsCd9U9SowAGnEbAiTQfDnpd5mFUgVzygPapuC3enKyaxOWzdK6AQghdz055YLKWJ6OqYOIG/0CmNHLmTDkwMlJuOXWjgb/X88gHjfFSu17tiXJ+cHxnQzRgVPSPltHqD6N55cUQs9L2XQRBq/D6u0KiUv5XNw1Jdyv/o4tsU6z7rzGul+PoFfnc9FWMPY25rD0B4LUgX7bTgGcT8OnB67SkakUhVXawi7w0cetzVm02PjouRlI2McXwWIGDHumSWCZ2HYpZ3etxRFs2egQFj4e7aINNsrDCn2mpbxsYKWjFGSoDmzco5EXeTw9MtV+OH5y4/HYFm34B10TZVKsYqk2BziLwToFNG24/5ocVQOGJeXjLKSmA6wiF0mav5IqCsnjdkwKAs681hWFEHjEzwacN3sFN2mKNM9h5hwN5QudY5NDmOiFIpXZ0le+MM2nYfp0sZMOuUwd4wvLwBjtdoXG9Nt+vGyCiFpwZPS6wvncPJHoibTek+FU6rtTzyV8U2TS1+E1LNkSRyhsTshQDbRUm4l3SflJYYBRQ34eDy/tZOBJUoHcOyMmAyt8MWMnyLpBaHbMSpfOEhNRHpL5KaivpOlZcR6y5zAfyN4QtqGwElWLMvFlVG3HgrRi5Q7VlGPq+UP0uzwM2TXDuyu2PPsON+WK1bcqHD8EfVLJuLqpVP0xhOuHomfqm2MgzwHHGZBz158c0oK57KCJNST3uPWteZQsWfWvKySLYQBcZyAZwSmxXOHzAr2sFxEnA7U4yaiSDkIT7IvbjbpPd/yVotHyKRFJbjjvF0MxmDqRIili3Uu7lBdc4/QST18B6HLkDhBtcfmQCs3F/836t39srTbyplHkjq6EcZp2ZGdYed2/m2Cl8oJUTaMQqWIxERPeRbYrTPmDsHLurnZY8cSZrennDdSD01H8oAL4lvyX+QI3e6a2NAEwT/D7tAxQtajp0N6F1zIqv4alfxbqZtz/DRtQcOvxtm4xbBfsVeJTPesBDjXvOslZKKCoEpS4s50mj5scY1GoFshox/VAKp2rTsQ0QVvrnljvgs9xsvjQPNyVz2gXvOvv//j3//8G3v1+nt2AxrGBJ6DA5ZISmwSEkbsVVWWnHqo8JitKHi2xpNsajCh8+svZkuNyuB2tihYvSLlGYqZsE7GYKVVyFymzRnyKV7sVl+XjFMtsUrTtmkAetY2VjcMnsNjTen+nKrU/pCy56XPQ0CmMmjxCTtnkRNZyIEZTqiwardSNVVcA+mn5sRZ2qd4MEnTo/qpCRpPLbUoogkbS+qAD7kclwULSiJTaYantaZ3jLMNNoYTHIyZ66uUaQc4/WCzFgBv7eGRbNoyTxPJlQvHwWeG7XoJWxnzPyb3iYQ/XCkEFaYPaNe4oKdfv/8W1sW+Rdg61Dvtk/Yon7Qzx0cP+u/U4qppB3Zk3LfuGBSAfBuYC3IlNO7ZtWBJKtukgEejtpQwSraiKlrwQGGEHQT0jyi7H+UAioe/idhf8oxX7NuuIVjzNHhHKow1PNCuCwmKkTRZX9QWg06B6RjFM0Z3V1HdAEND7BK6W13jWmKFsUGb5fDr3o6Py6xvbSaedTdAiG5fBtNlNC/3NJ07G7EGWwRqA4aSXCToFmLV3bqmD8tp/vboThNcgMt6Hm+SpgT0pzb2D92WTqumaWuA/yWqPGk8uibFcuLZuToaW7S5PXqxtDFp5NwuLCzYLgElJf+j2NrzidHOWT3BPmlwUyCT5vX9ng7sTXsypfK/jdhbsOtkGkjoOVBElgPSZdqKxEHHSHThDmLIr7EKWlRVDXoJAgN1ifkvPG1l5RQYHCbIPYYi9tmA/iika2yjzxgidDx/pgJRb0kNypTrWfvI8y6vYEIm8ifC43XuFlypbTDLm1HPr/6SAIkGPJHqumuDcLY8qI272ndVumwxSzy/i9gFBJ/YhMFe06cWBj5dKyN+g2HvwJLf4GjY6PR9RpRWJQgXpZTqA6vAnOyrKz5MxAvFPClqPJFA9FwRa4Lc4zGTVb8HTU6aKwwzOrsMqgyGFiYm28To6tOsyzNfPWKqmX9Mp7fPq3PNGwv/0bAuVNh0P8ZDurhi0wcYoyEDdlMnmInY47HOxvwYgESKbwITR88hHbpKJ6OOhq81usvsg9URhPNlTKDPSzxqYVR3dH93x0B3n3jCH0v8f4jYD23J3oNKP+/kzy7SJq+NdM2qRewwqR56T2iozRIT/h8j9joXNcUhddFegmLRtpipH9hfkKhJInK+8VGPY/3UPhaN0VVT15U1qAMVOoNBRzBsNB2DkI1NUhjhsIfmnR/e08r6m5WPDKZBhn8wtgkL7uLyXlMViDAkT0S4zZ7vOxRmmtXK9ASr8UIrHZGOKZzNM/nRPHMyTFlEvooJIEAZk9vf+r+YUEU0Nwfpu6BV5mE301td00/vk+kzOADf99f3DfWdibrXXStiZTlkh3BE29O94xKqT6T/t+SKZeRqXE8leqo/2uCBXQf7HE+niAi7/KIOXDyNPSZbHtw49XjB9HAIze6Mu3GwbMhssjlfCW2qA/+zFF1LlSPVKQNig3hQ5FsINXthErFkPH0yfCxCXvetOrTp3D6dx1/wR+pDIN0bln3ilhwrG7T6YHpgC9tpzO4vz1xq3nLQdN8qNK3zj0/YkL6pTuuGXYQ9qY/Dz8GnNgGq/kLI9QUnn0qe2lQ06h3yfHVGNSfneOoT+338fT4P6EQaBfIw1D29UuhjSmKE9337z2am/ecxm1bVIeLGVE76ptMsGy/49PhxmXPs0zt/p9boWNnLYx1pTHyHRlP+A1BLAwQUAAAACAAal4hcFcJgeZMRAADZUgAAOgAAAGNvbW1hbmRzL3NjcmFwZXIvYWN0aW9ucy9kb3dubG9hZC9tYW5hZ2Vycy9hbHRfZG93bmxvYWQucHnNPFtu5Ehy/zpFLseASE+J22P4xwJqDbmlnhlgNN0YtQ0b2gbBIrOqOGKRXJKlxxZ0Bv/7a4+x5/EFfAVHRCbJfJFVJalnl0B3iWRmvDIyIjIyktmmKuuWxc1TkWTlSSZuq7hd59miu61591dbxwlfxMndybIuN2y5LZK2LPOG9R3rNovzk659nJXLLOdNf1/X5UOPpdm2WS4grbebuFjWGS/S/KmDtizrTdxGTfZnrgBct23VIyiXTVLHFa/DJI+bhjdhlQOJ6zJPeQ1sMeXW0afcANq0CbsHcdJmZdGESFgTrnjB6zhHMNiyLI6HkJeLGMTTQ4jkk6Mh4ZCocOj+aCh5uVJgwF0jxH8UAInUP2FwrXgbbXgKg16uZvQEKYvaMsKBRxQrXosXLd9U+tPgSOygXvGmVzZEHedtJJ7ashB94m27Dmv+py1vUM8Z3kfyfrRTEidrLv4neeEfY23TuOU0MvTHWKtyGfHiXv5ga/HXWPPmqQFxyR9sLv4y5aU33i6qukx400uIpnVUb4vJfssldFvwrtM9r7PlkxjUKCtavqqz9mmM0Dy75+G2Qt7FfKvLVQ0kRPLZycFDnJYPRV7GaQivY1CP4Yl8oCvepXx5LV4eo0w9JsFCzVswPI0OvmsT4dunWa/r2nPo9Qq8yXpb3NmziR6T0ZsZz9psw8tte/y80TA1YGMlwE2zOsKEGOTf8ac1z6EBKf9wt0fXNhVfqTNYPLHVRJrzchmSJnZdrvHGbJwuwhJ+Y6Iz0jts4vpOKnPc9MPH05OTE8LBLvLW0CXfuA/OT2gkaDqxlC8Zmp0OlN/wfDljyYzxnJ8LAmds2/C6iDd8xjZlyvMoSwEKk9c37CL50zarOQzGJq7WJfwVg3cFawOz74kt+CoriqxYAY/0VM7rHkD8EGet4VJCgAVjRXD9oG8K2jsgxsvoBbY4TPliu/K1VngtvZ3iKULV1PvAa/DcT0Ik9SFr10hoy5OWp0wMQi/v2tPAByfabbOOa55+Gnz1x8WvbC7ZVFx4qDRpkIYZ8zbVP3tBmBVZq3D91ox2fLBtnZ8zZjWHx1HfepLVeJtmZc8btA83VRrRU63dfZZyux091do53K3vEiepp0HLN+xjAeFW3KJrBv0rBz4x0rtrQPlAL8EAbOMcGvLHrGk1CNlSMHRuyVTnE+dIGKnTZpiKtU9tuykUmAiIZxuBLqBpBNR2QGAI4SZecuAuifNkm4PTAkG0EPZR3GmxRJYZ0eLNrUdNvS+9IABBw9k7eyi7fnSj9ROMOPrhoMdpSj19Bfm3CkSDmapsWnBNzTZvDdFIfw4jHVEjaVJQZPaEkAMixUbzzDZohpYbo6ZQYo8dOM9tXahtjEniJhycjCAYBtIi0ZCERKFCWoNbg0kiELoZH505JsKDxbHMCpw7kzYYLXcNSOIGLbfha0aVWvgdFEyv2QMWwXHXuqmAIcU8VvstLZqED2BTFFn4pnbO0HIiAbenKIvTL88YoreD/bPsMjX20GaB7s8NOggn2jF8b3Tp5suc/VwWfBjqqDNec8UEyGcRWGYfuwdWcxB5679TVEbIG1acLGJZYYR/fqAPH7m6yFZry9e+kEpXV6K4v1kR+WAJvnP3ypZMaxuwP7Dv3LThJRf84Sf49ScGJQi3RZ4Vd/bEUa9N1jQQEUTl3fxzveWjbd2kw7IhNmwXBd7wWHj8cVk1bdxuG+j8AWaVGy8IBiGNi0LMpx6SSgYajg0nSqQtqd1WxGSnm6VEvi7eCeE4X6GbeBHxS6B+fSTtL6HaCWfJirKVdI1TPzp9VHqmPD4ubWBpP83UwFhyHG/j/OHFHxMOE/yKfmAdgouiq2l26jgDn3/lbCPdFxJqvZeoPt5c1XVZTyA6PALuLrDnjuj3tjNfO92oPP9+51oTw4sv7OftZgFrdljAfKx4wdCVNOzsD2zHcl74IvcXfhJBiB/g+q2gGBZuzAi6u9zCfwmT7K24NHjLIT72YUXn5/Fmkcbs8dx/pNTd7DFcpsFsmu3j+B7TniMU0SG6PsMb/RZKsuvRhTLZC9T7rx7/35iJqxeN22SY11kyO8YzzZUSmlj28wVhxwJiUFzNQpeaY0rR927fnf1LfPbnL//4R1yC/oMHa25v1q1IZ9jsx+9//vjL1fuLmysdmIADku6gPstosayzlYwYddEdtWZ3jN+FYA7zEepqViQjbOQiktshZeai/S2peolWDStxaE8BGttNRGaT9DvWQpQFBA2LsqKAyL7TLaFphob1sPY6HtMmHWCLxqaDQaCaZBshU5kItH6XS4X+Ic4OQywUz8mF+RBqKs/9MVHgtea4DmtcfcUrX4E00xcyOqRvkBbeCsK1N05W8BrVSbcKCkokyWwnSX/2dDrkBsvc2FvxrbTM39hMDJLfee/L8i7j3jkCQGzrvJHif95pmz2UqEuodRM1bY1+5vkrzfMJc7t/6qtZVWG5yEyhmNhOCnRyvotpRJ2Sbu+rieipzQqAncO/mZ0LaWseb2gJZ7+UIzCXv3YDoTlz8WO/Jr3udjTmqN12G0Cf9k2sbRA/0HsEaFxyO9Ax8wdZ0fp5KOmmwfCSsmh50Z5BZLpq115gO+5uGmrA7BWaXLvunI6/RyO6nwugNtt626cKdXuEYHob2CCebdKOC5Pd+k3s0d5Lt6G6w0eO8MeW4FvgF6OgE6AUCfhIDAnoVBP1aRB0637nW5F7PQXdKmDmnR7Eju5LzfTEjJA5lvDmHrjhXxwJcLwwuazgS9YcQltgPOEQKd5llUBM3ARsPmfv3OG+ORPeOVu5Vd3VcnKNmgPRAtTv5qqndZOmstfbRJRTufiVJ230UAOWejyaF1OJ5c4QeeYmES93iK5SIwxVso6LFbp13OL0haTHU9bIpxgla4S1oE1SK8HtE+0BwdQ+wt8ZWEZir4kREHHYAeJWwrHDpv5XdalI/eBOcWmQNXdKnnrIAx+kiJHwjSCPYQBJHGPh4t+BCJZZkTVrnu6XxeHqENVc2YpQZQEzfipAj5u778xMXjrsbkS/losIGzm2HAjBXKLRMcxHMnnqbkzHQY+9q1GjXMz0bPXihReEURSD8wDmo6ltdgF8wBeSxHzxGKQTUnTjB9bq6pDF0sCOY3PJmUa1yEnysuHGjvmBqSNX5mkCaZc835T33DHCpAsOx3ckMUcobT95e2AH6S+1fpESq4DHLISmmfbCVWV5rxLbwfg+rdYjabeK4yUicJQirfyakARKT3nq6+VLqNta54c14GS4njhi60zULnV8DviRxoI/thaJ3TUyAQnCyPaRVhl10Kh1l1TWm7asLlAHf2xlOZKbqQUo4B0u+68egca8LCsQDi9YUbINFgMREc0gvW/Y+7hN1qwAmPe8q4JlTQkRRkvrJCZXRY1pTnxZ2xt+Fg0odTPrQIQ3vL7ntfoucEw0h/vKimX5gkqa//2fv/zfX/+bvb/8mT2AirEGxgd+fGQlUhkJQva+LApOxWe4dZTnPJ3hDm2Czov2ZX83mfQShqEzH773njRpyKsBnpQBJu8oEzwmiqV3UTBOebEySbZ1DcDTbY209ihxexkX8M/nlDR2B2O9KF22HYLqQaOPmEUHmf8DJTAhiS4DJfKDiAP5R7TTvI/JYJSn38KzHLtiFUwTNdqoAz3kK0wRHLDKHHNuE5UswpW9to5FdXPgLBRAryoWoeUvpbAymHq1UtxG2k6+Gql5DrGqb4jfzDISgkM58blJn7uIpO/QFTAYNQqBamsvn4CGLKGSt8U2y1P24QOVrcrSWMp+Av2gOPdxlscLUG9RLzdMXqpqjZJNChTeDnWufjAspd2lbUPPELwbeCT/1jvLPNzVl3VsXf1MoCSR3XV4k7BkAdsAy0F8102DemupqXeWeHYSykvK6sn1/AxmyDKPV43rJSgkuIw2pkqF1t0Iye9H1JH+8s5MvIPUtZEmX83qbdGNMOVMseL27IkhiYMCDaFWV1Tvj8hax4zqPPfEW4OonN/zfC5PBoCOwKKu9r0PH64/XX0f3fz7v3365eP7q5ub6Ker/7j6SU3zaTx8AD3FvU7pfCjtgPrQtDAbapbh8YWq3aI/Qt39uG2rbYuP5RRQdagNZS9s2d2A1UvANvgBTtLU9wQEjzJNZ9/t9Y79rsSeEltZGr6EGcVTwz+8ZSmvxLOz2Hu7LcBjKIAAZJwCNQDMeVywbSX2Aw1z4zYlmrUYNXwKDIcJ0azEfuPJHysq/44g9KH4F6YNmvfuVsWGJUHuwybD5J7ZEIO9GvcQ11g87xqay1+u2TWvV1zqGetxyonT+WhwUOime0ImlWO/d1FbW4EpEZQypE3kZNy0eYqcD80nXYtYBCHVBLvlci954AxTQDtXwBC2YOXAD6L0HfvMmnp+XlPwzh95sm1BhihHzCuxH3//kWF8xvoTGkaurVuf4EQBg1i0Ea6HwNoAclCJqAPpTw17S+h18yoPI9pqoB6hC5G2Hyg76tik6tXQdkEHysvuiaGQrktOw+5kV5Acp+n3xPdl5q71DxF7mtVWUbY8hYOiBumgrKuuFMkI10BDTZw/lckxKBVeADNOKSz3xkNh+gQu+MMlquVcHKALk7IAq4BakMgdQl/t/PXM8sVwDAL34i/FSQC2o0OrlF+VpAayWMk//S+4zq6vzy4v2Q8/nG82p9NO5DUK7+DWpfR4jSq+AkOMKu5coYTdm5Av13FlXO2X5r6tpSdZ6kqljh3kstm0ZhheHbHzl3PVrZDm3R92k245Ne/XVVaTgfKxrfW4WWP0O1dPeZG24Bvn7HPEwJiBc/M6HC0chkARHR056YTgnusOaaml9Go+dIn5waGsLamzqn0JUDsJqh8BrPLtKiua0DgrKh5H8qmejoxozYnVOweS4+gdUfUPhO1aBb14J3adJRaItzHewcSusK7iuQ4SoyWqjtWo7ngLjMagXXiEwkYcNUFIb3v0QCYh9f51b7ndWF7v9hNRIY9EfoHVrziTM6gznopk/i4qnqXY/QZEgGWxROukZTQ4hsihwoSnsI++ZyPzZDaj53gyh8dfEzMewLkPrAcybIOo0eZ1mBx0jKvbYz/wEJk47tV1OvAEmdxCpnohivyeKj7TQH2rUmPlmMZOO4gE055jDW+++2tAObiMcksZSFG4AiEpRBFNhvmaPjtHbJKiuLaDj6yyu+wLZOiTAbI65m22gT/3hxIVDF+5/kXJuHVVITAde0BGRZOBxnwr0GhbW2ZFil7/+Jr6TFdf+SzBlbSZoNQqNZ2bPu7E4gvWZOPlmaJAhu2Uu2cmcjFIEa5HaRjci7BXVglNVwcpBSkzpp3qUip95hOVPq+trRTb/nN1XJGpSk21712jH1V5heulfQUXI9VWVawc1j9YfFOFUhoAcbzNNNgjJ7zUIwR/z5aayNf3ygiHyxq9xjK8qHDaNTM9lR736PQHO1T1GQZEkT0ogZyAWNL5BfXKI1/tOfXALeRJaOTrj4H2T5aG9ecwlXoJgw/t9OZXT+2I7/QAePskcrfNJP/o1mPPsja80fPphkCQC8eJBDf3stjzbyuD5kUykKQfJIleAyj4JYvlVmVlMvSJ43jRlPm2xU0EPAVKP+LDXqaUp75TINAd9HEChZ6vH3Kr885X0X2rwnE63aUeoIdJXGXQlspn0CF4HwYHXsGyZ3ornLz98GWaMdm4bICxTlCYIkuMh+JvVcl/sRjZqItcm04tuBhMtqJNm+DNkcpthgxWAaB3RcJ9nK5Z0gZ2W0UYdrHwaHlvr+NSFdUjPhO63X/Koj/YZH/QQlHhr/p1AoRLR6v3iNsQrOgyJX2tg3p2e/haVAhWkBdJ/VSJuMr9FRi83uxc65W79mS6k/ug6pEnPJ3FgWbtoTgMY1a24kNlnCl929Zd8mniiw3DCk6WK5pfaBu+64X0uQtvwbH4EuXtubFhffrp4vMP0c3nX6Lri/88Db6A0TsN4Tql1SCls0RP/AbFdF9hT2Xz5z8Wxn65Wvk77rGIz5P/B1BLAQIUABQAAAAIABqXiFwAAAAAAgAAAAAAAAAPAAAAAAAAAAAAAACAAQAAAABndWkvX19pbml0X18ucHlQSwECFAAUAAAACAAal4hcUOQjtEkOAACqKAAACgAAAAAAAAAAAAAAgAEvAAAAZ3VpL2FwcC5weVBLAQIUABQAAAAIABqXiFyhEaSguSMAAKSLAAASAAAAAAAAAAAAAACAAaAOAABndWkvbWFpbl93aW5kb3cucHlQSwECFAAUAAAACAAal4hcE6sB5U8FAACPDgAADgAAAAAAAAAAAAAAgAGJMgAAZ3VpL3NpZ25hbHMucHlQSwECFAAUAAAACAAal4hcpdr1FUEMAABvSwAADQAAAAAAAAAAAAAAgAEEOAAAZ3VpL3N0eWxlcy5weVBLAQIUABQAAAAIABqXiFxJmIuGkwAAAMMAAAAUAAAAAAAAAAAAAACAAXBEAABndWkvYXNzZXRzL2NoZWNrLnN2Z1BLAQIUABQAAAAIABqXiFxCvWfuawAAAHUAAAAUAAAAAAAAAAAAAACAATVFAABndWkvYXNzZXRzL3JhZGlvLnN2Z1BLAQIUABQAAAAIABqXiFx0QStVNRoAAGEaAAATAAAAAAAAAAAAAACAAdJFAABndWkvYXNzZXRzL2ljb24ucG5nUEsBAhQAFAAAAAgAGpeIXAAAAAACAAAAAAAAABcAAAAAAAAAAAAAAIABOGAAAGd1aS9kaWFsb2dzL19faW5pdF9fLnB5UEsBAhQAFAAAAAgAGpeIXA2EUM+2FwAAiVIAABoAAAAAAAAAAAAAAIABb2AAAGd1aS9kaWFsb2dzL2F1dGhfZGlhbG9nLnB5UEsBAhQAFAAAAAgAGpeIXP0Az8z6AwAAcwsAABwAAAAAAAAAAAAAAIABXXgAAGd1aS9kaWFsb2dzL2JpbmFyeV9kaWFsb2cucHlQSwECFAAUAAAACAAal4hcZ5CdDoYfAADxgQAAHAAAAAAAAAAAAAAAgAGRfAAAZ3VpL2RpYWxvZ3MvY29uZmlnX2RpYWxvZy5weVBLAQIUABQAAAAIABqXiFwQy0neWRMAAOhEAAAZAAAAAAAAAAAAAACAAVGcAABndWkvZGlhbG9ncy9kcm1fZGlhbG9nLnB5UEsBAhQAFAAAAAgAGpeIXDfakd2ZBwAA9RkAABsAAAAAAAAAAAAAAIAB4a8AAGd1aS9kaWFsb2dzL21lcmdlX2RpYWxvZy5weVBLAQIUABQAAAAIABqXiFzlXvWadgcAAL8XAAAiAAAAAAAAAAAAAACAAbO3AABndWkvZGlhbG9ncy9taXNzaW5nX2RlcHNfZGlhbG9nLnB5UEsBAhQAFAAAAAgAGpeIXIsSpH7PCwAARzAAACQAAAAAAAAAAAAAAIABab8AAGd1aS9kaWFsb2dzL21vZGVsX3NlbGVjdG9yX2RpYWxvZy5weVBLAQIUABQAAAAIABqXiFy1aQ059gcAAB4hAAAdAAAAAAAAAAAAAACAAXrLAABndWkvZGlhbG9ncy9wcm9maWxlX2RpYWxvZy5weVBLAQIUABQAAAAIABqXiFx5L9bl0CwAAFh5AAAUAAAAAAAAAAAAAACAAavTAABndWkvaGVscC9HVUlfSEVMUC5tZFBLAQIUABQAAAAIABqXiFwAAAAAAgAAAAAAAAAVAAAAAAAAAAAAAACAAa0AAQBndWkvcGFnZXMvX19pbml0X18ucHlQSwECFAAUAAAACAAal4hc8DQhsAMPAADtNAAAGAAAAAAAAAAAAAAAgAHiAAEAZ3VpL3BhZ2VzL2FjdGlvbl9wYWdlLnB5UEsBAhQAFAAAAAgAGpeIXM0S1pfVBQAAnQ8AABsAAAAAAAAAAAAAAIABGxABAGd1aS9wYWdlcy91cmxfaW5wdXRfcGFnZS5weVBLAQIUABQAAAAIABqXiFySK3NU/CkAANmxAAAfAAAAAAAAAAAAAACAASkWAQBndWkvcGFnZXMvYXJlYV9zZWxlY3Rvcl9wYWdlLnB5UEsBAhQAFAAAAAgAGpeIXAKNzGhFHwAAKFgAABYAAAAAAAAAAAAAAIABYkABAGd1aS9wYWdlcy9oZWxwX3BhZ2UucHlQSwECFAAUAAAACAAal4hcVYozy6ogAABwhwAAIAAAAAAAAAAAAAAAgAHbXwEAZ3VpL3BhZ2VzL21vZGVsX3NlbGVjdG9yX3BhZ2UucHlQSwECFAAUAAAACAAal4hcVN6r+0AaAACkcAAAFwAAAAAAAAAAAAAAgAHDgAEAZ3VpL3BhZ2VzL3RhYmxlX3BhZ2UucHlQSwECFAAUAAAACAAal4hcAAAAAAIAAAAAAAAAFQAAAAAAAAAAAAAAgAE4mwEAZ3VpL3V0aWxzL19faW5pdF9fLnB5UEsBAhQAFAAAAAgAGpeIXLPoQvgNAwAA+QYAABkAAAAAAAAAAAAAAIABbZsBAGd1aS91dGlscy9ndWlfc2V0dGluZ3MucHlQSwECFAAUAAAACAAal4hch+GOjksCAACGBgAAHAAAAAAAAAAAAAAAgAGxngEAZ3VpL3V0aWxzL3Byb2dyZXNzX2JyaWRnZS5weVBLAQIUABQAAAAIABqXiFzNrpAe0wIAAHoKAAAaAAAAAAAAAAAAAACAATahAQBndWkvdXRpbHMvdGhyZWFkX3dvcmtlci5weVBLAQIUABQAAAAIABqXiFyZNfQzg2MAAMrGAQAVAAAAAAAAAAAAAACAAUGkAQBndWkvdXRpbHMvd29ya2Zsb3cucHlQSwECFAAUAAAACAAal4hcAAAAAAIAAAAAAAAAFwAAAAAAAAAAAAAAgAH3BwIAZ3VpL3NjcmlwdHMvX19pbml0X18ucHlQSwECFAAUAAAACAAal4hcJMitvQpGAAAwCwEAGgAAAAAAAAAAAAAAgAEuCAIAZ3VpL3NjcmlwdHMvZHJtX2tleWRpdmUucHlQSwECFAAUAAAACAAal4hcAAAAAAIAAAAAAAAAFwAAAAAAAAAAAAAAgAFwTgIAZ3VpL3dpZGdldHMvX19pbml0X18ucHlQSwECFAAUAAAACAAal4hc+J4dsM8CAADDBgAAGgAAAAAAAAAAAAAAgAGnTgIAZ3VpL3dpZGdldHMvY29uc29sZV9sb2cucHlQSwECFAAUAAAACAAal4hcBcM7uW0SAACvTAAAGQAAAAAAAAAAAAAAgAGuUQIAZ3VpL3dpZGdldHMvZGF0YV90YWJsZS5weVBLAQIUABQAAAAIABqXiFzbdWiLUAYAAG0bAAAdAAAAAAAAAAAAAACAAVJkAgBndWkvd2lkZ2V0cy9wcm9ncmVzc19wYW5lbC5weVBLAQIUABQAAAAIABqXiFxxJT6hsBMAAGRbAAAWAAAAAAAAAAAAAACAAd1qAgBndWkvd2lkZ2V0cy9zaWRlYmFyLnB5UEsBAhQAFAAAAAgAGpeIXE7m9ZEcAQAAnwIAABwAAAAAAAAAAAAAAIABwX4CAGd1aS93aWRnZXRzL3N0eWxlZF9idXR0b24ucHlQSwECFAAUAAAACAAal4hcmEOVgwECAAB6BAAAJQAAAAAAAAAAAAAAgAEXgAIAdXRpbHMvYXJncy9wYXJzZS9hcmd1bWVudHMvcHJvZ3JhbS5weVBLAQIUABQAAAAIABqXiFxXlnuO7gAAAFMCAAAiAAAAAAAAAAAAAACAAVuCAgB1dGlscy9hcmdzL3BhcnNlL2dyb3Vwcy9wcm9ncmFtLnB5UEsBAhQAFAAAAAgAGpeIXDRxv1I6BwAAixkAABMAAAAAAAAAAAAAAIABiYMCAG1hbmFnZXJzL21hbmFnZXIucHlQSwECFAAUAAAACAAal4hcfSVvq0UYAAAfZAAAEQAAAAAAAAAAAAAAgAH0igIAbWFuYWdlcnMvbW9kZWwucHlQSwECFAAUAAAACAAal4hcGqmQc3EUAABOVAAAGgAAAAAAAAAAAAAAgAFoowIAbWFuYWdlcnMvcG9zdGNvbGxlY3Rpb24ucHlQSwECFAAUAAAACAAal4hcqQyRQgYCAABCBQAAGAAAAAAAAAAAAAAAgAERuAIAZGF0YS9hcGkvY29tbW9uL2FmdGVyLnB5UEsBAhQAFAAAAAgAGpeIXKxAz/DuCQAAbicAABAAAAAAAAAAAAAAAIABTboCAGRhdGEvYXBpL3BhaWQucHlQSwECFAAUAAAACAAal4hceVhZ6LQGAAA7GgAAJQAAAAAAAAAAAAAAgAFpxAIAY29tbWFuZHMvc2NyYXBlci9hY3Rpb25zL2xpa2UvbGlrZS5weVBLAQIUABQAAAAIABqXiFxmkKmvHQQAAFANAAASAAAAAAAAAAAAAACAAWDLAgB1dGlscy9hdXRoL2ZpbGUucHlQSwECFAAUAAAACAAal4hcNq1eIn0FAAAGEQAAGQAAAAAAAAAAAAAAgAGtzwIAdXRpbHMvYXV0aC91dGlscy9lcnJvci5weVBLAQIUABQAAAAIABqXiFwQJNYmmQgAAM8eAAARAAAAAAAAAAAAAACAAWHVAgB1dGlscy9zZXR0aW5ncy5weVBLAQIUABQAAAAIABqXiFw1Fg/DWgEAAPwCAAARAAAAAAAAAAAAAACAASneAgB1dGlscy9jaGVja2Vycy5weVBLAQIUABQAAAAIABqXiFyN6/JBdwwAAMRYAAAUAAAAAAAAAAAAAACAAbLfAgB1dGlscy9jb25maWcvZGF0YS5weVBLAQIUABQAAAAIABqXiFwEIwjzdwIAAGcJAAAWAAAAAAAAAAAAAACAAVvsAgB1dGlscy9jb25maWcvY29uZmlnLnB5UEsBAhQAFAAAAAgAGpeIXFjZ3NLQHQAA9IcAABEAAAAAAAAAAAAAAIABBu8CAGNvbW1hbmRzL2NoZWNrLnB5UEsBAhQAFAAAAAgAGpeIXBJ8SZ8PAAAADQAAABMAAAAAAAAAAAAAAIABBQ0DAHBsdWdpbnMvX19pbml0X18ucHlQSwECFAAUAAAACAAal4hcb7LiwHsCAADQBQAADwAAAAAAAAAAAAAAgAFFDQMAcGx1Z2lucy9iYXNlLnB5UEsBAhQAFAAAAAgAGpeIXNS9sQ3uHwAAoIcAABIAAAAAAAAAAAAAAIAB7Q8DAHBsdWdpbnMvbWFuYWdlci5weVBLAQIUABQAAAAIABqXiFwItKK9KAMAAFQIAAARAAAAAAAAAAAAAACAAQswAwBtYWluL29wZW4vbG9hZC5weVBLAQIUABQAAAAIABqXiFwihuNzqg0AALpDAAA7AAAAAAAAAAAAAACAAWIzAwBjb21tYW5kcy9zY3JhcGVyL2FjdGlvbnMvZG93bmxvYWQvbWFuYWdlcnMvbWFpbl9kb3dubG9hZC5weVBLAQIUABQAAAAIABqXiFwVwmB5kxEAANlSAAA6AAAAAAAAAAAAAACAAWVBAwBjb21tYW5kcy9zY3JhcGVyL2FjdGlvbnMvZG93bmxvYWQvbWFuYWdlcnMvYWx0X2Rvd25sb2FkLnB5UEsFBgAAAAA7ADsAOhAAAFBTAwAAAA=='
 
 def _get_pipx_home() -> Path | None: